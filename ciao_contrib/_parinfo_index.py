@@ -0,0 +1,218 @@
+#
+#  Copyright (C) 2026
+#                Smithsonian Astrophysical Observatory
+#
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Read and write the binary index of the parameter information used by
+ciao_contrib.runtool.
+
+The index is created by mk_runtool.py, and installed with runtool,
+and is memory mapped by runtool, so that the parameter information for
+a tool is only decoded when the tool is used. This module does not
+depend on CIAO, so that it can be used by mk_runtool.py.
+
+Each parameter is stored as a record, which is a tuple of the
+name of the parameter type - 'ParValue', 'ParSet', or 'ParRange' -
+followed by the fields of that type, e.g.
+
+  ('ParRange', 'verbose', 'i', 'Debug level', 0, 0, 5)
+
+The file format is
+
+  header   - the magic string, format version, marshal version,
+             the hash of the parameter information, the number
+             of tools, and the size of the tool table
+  table    - a marshalled tuple of (toolname, istool, offset, size)
+             entries
+  data     - the marshalled (req, opt) records of each tool, with
+             offset and size taken from the table and the offset
+             being relative to the start of the data
+
+The index is only used if the format version, marshal version, and
+hash all match the expected values; otherwise it is treated as
+missing and runtool uses the parameter information in its source
+code instead (the index can be re-created with
+"python mk_runtool.py --index").
+"""
+
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+
+
+__all__ = ("FORMAT_VERSION", "hash_text", "text_to_records",
+           "write_index", "read_index", "ParIndex")
+
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"CIAOPAR\0"
+
+# magic, format version, marshal version, hash, ntools, table size
+_HEADER = struct.Struct("<8sII64sII")
+
+
+def hash_text(text):
+    """Return the hash used to identify the parameter information."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _make_record(name):
+    def record(*args):
+        return (name,) + args
+
+    return record
+
+
+_record_types = {name: _make_record(name)
+                 for name in ["ParValue", "ParSet", "ParRange"]}
+
+
+def text_to_records(text):
+    """Convert the text version of a parameter list into records.
+
+    The text is the format used by the auto-generated code of the
+    runtool module, e.g.
+
+      '[ParValue("infile","f","Input file",None)]'
+    """
+
+    return tuple(eval(text, {"__builtins__": {}}, _record_types))
+
+
+def write_index(filename, hashval, tools):
+    """Write the index file.
+
+    Parameters
+    ----------
+    filename : str
+        The output file, which is over-written. The file is written
+        to a temporary file and then renamed, so that readers never
+        see a partially-written file.
+    hashval : str
+        The hash of the parameter information (from hash_text).
+    tools : iterable of (toolname, istool, req, opt)
+        The req and opt values are sequences of records.
+    """
+
+    table = []
+    blobs = []
+    offset = 0
+    for (toolname, istool, req, opt) in tools:
+        blob = marshal.dumps((tuple(req), tuple(opt)))
+        table.append((toolname, bool(istool), offset, len(blob)))
+        blobs.append(blob)
+        offset += len(blob)
+
+    tblob = marshal.dumps(tuple(table))
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, marshal.version,
+                          hashval.encode("ascii"), len(table),
+                          len(tblob))
+
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, tmpname = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as ofh:
+            ofh.write(header)
+            ofh.write(tblob)
+            for blob in blobs:
+                ofh.write(blob)
+
+        os.chmod(tmpname, 0o644)
+        os.replace(tmpname, filename)
+
+    except BaseException:
+        os.unlink(tmpname)
+        raise
+
+
+class ParIndex:
+    """Access the parameter information stored in an index file.
+
+    Use read_index to create this object.
+    """
+
+    def __init__(self, buffer, table, start):
+        self._buffer = buffer
+        self._start = start
+        self._table = {toolname: (istool, offset, size)
+                       for (toolname, istool, offset, size) in table}
+
+    def __contains__(self, toolname):
+        return toolname in self._table
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self):
+        return len(self._table)
+
+    def istool(self, toolname):
+        """Does the parameter file have an associated executable?"""
+
+        return self._table[toolname][0]
+
+    def records(self, toolname):
+        """Return the (req, opt) records for the tool."""
+
+        (_, offset, size) = self._table[toolname]
+        start = self._start + offset
+        return marshal.loads(self._buffer[start:start + size])
+
+
+def read_index(filename, hashval):
+    """Memory map the index file.
+
+    Returns None if the file does not exist or does not match the
+    format version, marshal version, and hashval.
+    """
+
+    try:
+        with open(filename, "rb") as fh:
+            buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (OSError, ValueError):
+        # ValueError is raised for an empty file
+        return None
+
+    try:
+        (magic, fmt, mversion, fhash, _, tsize) = \
+            _HEADER.unpack_from(buffer)
+    except struct.error:
+        buffer.close()
+        return None
+
+    if magic != _MAGIC or fmt != FORMAT_VERSION or \
+       mversion != marshal.version or \
+       fhash != hashval.encode("ascii"):
+        buffer.close()
+        return None
+
+    start = _HEADER.size + tsize
+    try:
+        table = marshal.loads(buffer[_HEADER.size:start])
+    except (EOFError, ValueError, TypeError):
+        buffer.close()
+        return None
+
+    return ParIndex(buffer, table, start)
@@ -1,5 +1,5 @@
 #
-#  Copyright (C) 2010-2016, 2019, 2020, 2023
+#  Copyright (C) 2010-2016, 2019, 2020, 2023, 2026
 #            Smithsonian Astrophysical Observatory
 #
 #
@@ -50,6 +50,7 @@ __all__ = (
     "get_chips",
     "get_obsid",
     "get_image_units",
+    "get_image_npix",
     "get_keys_from_file",
     "get_keys_cols_from_file",
     "get_column_unique",
@@ -67,7 +68,11 @@ __all__ = (
     "fov_limits",
     "get_sky_range",
     "find_output_grid",
-    "get_tangent_point")
+    "get_tangent_point",
+
+    "memmap_image",
+    "create_image",
+    "ImageStrips")
 
 lgr = lw.initialize_module_logger('_tools.fileio')
 v1 = lgr.verbose1
@@ -220,6 +225,24 @@ def get_image_units(fname):
     return unit
 
 
+def get_image_npix(fname):
+    """Returns the number of pixels in the image, without reading
+    in the data. An IOError is raised if the input is not an image."""
+
+    bl = cxcdm.dmBlockOpen(fname)
+    try:
+        if cxcdm.dmBlockGetType(bl) != cxcdm.dmIMAGE:
+            raise IOError("The file {} is not an image.".format(fname))
+
+        dd = cxcdm.dmImageGetDataDescriptor(bl)
+        dims = cxcdm.dmGetArrayDimensions(dd)
+
+    finally:
+        cxcdm.dmBlockClose(bl)
+
+    return int(np.prod(dims))
+
+
 def _get_key_values(blockinfo):
     """Return a dictionary of key=keyname value=keyval
     given the block info dictionary returned by
@@ -1062,4 +1085,492 @@ def sort_mjd(filenames):
     vals.sort()
     return [v[1] for v in vals]
 
+
+# The FITS data types that can be memory mapped, indexed by BITPIX.
+#
+_FITS_DTYPES = {8: np.dtype('u1'),
+                16: np.dtype('>i2'),
+                32: np.dtype('>i4'),
+                64: np.dtype('>i8'),
+                -32: np.dtype('>f4'),
+                -64: np.dtype('>f8')}
+
+# The BZERO values used for unsigned integers.
+#
+_FITS_UNSIGNED = {16: (32768, np.dtype('>u2')),
+                  32: (2147483648, np.dtype('>u4')),
+                  64: (9223372036854775808, np.dtype('>u8'))}
+
+_FITS_BLOCK = 2880
+
+
+def _parse_fits_string(val):
+    """Return the string value of a FITS card.
+
+    The input starts with the opening quote, and a quote within
+    the string is written as two quotes. Trailing spaces are
+    not significant. A missing closing quote is allowed.
+    """
+
+    out = []
+    start = 1
+    while True:
+        end = val.find("'", start)
+        if end == -1:
+            out.append(val[start:])
+            break
+
+        out.append(val[start:end])
+        if val[end + 1:end + 2] != "'":
+            break
+
+        out.append("'")
+        start = end + 2
+
+    return "".join(out).rstrip()
+
+
+def _read_fits_header(fh):
+    """Read the next FITS header from fh.
+
+    Returns a dictionary of the keyword values (only numeric and
+    string values are converted), or None at the end of the file.
+    """
+
+    hdr = {}
+    while True:
+        block = fh.read(_FITS_BLOCK)
+        if len(block) == 0 and len(hdr) == 0:
+            return None
+
+        if len(block) != _FITS_BLOCK:
+            raise IOError("Truncated FITS header")
+
+        for i in range(0, _FITS_BLOCK, 80):
+            card = block[i:i + 80].decode('ascii')
+            key = card[:8].strip()
+            if key == 'END':
+                return hdr
+
+            if card[8:10] != '= ':
+                continue
+
+            val = card[10:].strip()
+            if val.startswith("'"):
+                hdr[key] = _parse_fits_string(val)
+                continue
+
+            val = val.split('/')[0].strip()
+            try:
+                hdr[key] = int(val)
+            except ValueError:
+                try:
+                    hdr[key] = float(val)
+                except ValueError:
+                    hdr[key] = val
+
+
+def _get_fits_blockname(infile):
+    """Return the block name of infile, or None.
+
+    The return value is False if the filter is not just a block
+    name.
+    """
+
+    filt = get_filter(infile)
+    if filt == "":
+        return None
+
+    if filt.count("[") == 1 and filt[1:-1].replace("_", "").isalnum() \
+            and not filt[1:-1].isdigit():
+        return filt[1:-1].upper()
+
+    return False
+
+
+def _find_fits_image(infile):
+    """Return the location of a 2D FITS image, or None.
+
+    The return value is (fname, offset, start, hdr, naxes), where
+    offset is the start of the header, start is the start of the
+    data, and hdr the keyword values (see _read_fits_header). None
+    is returned, rather than an error, when the image can not be
+    accessed directly: the file is compressed, the name contains a
+    DM filter (other than a block name), the image is tile
+    compressed or has a BLANK value, or it is not a 2D image.
+    """
+
+    fname = get_file(infile)
+    blockname = _get_fits_blockname(infile)
+    if blockname is False:
+        return None
+
+    try:
+        fh = open(fname, "rb")
+    except OSError:
+        return None
+
+    try:
+        with fh:
+            if fh.read(6) != b'SIMPLE':
+                return None
+
+            fh.seek(0)
+            while True:
+                offset = fh.tell()
+                hdr = _read_fits_header(fh)
+                if hdr is None:
+                    return None
+
+                start = fh.tell()
+                bitpix = hdr['BITPIX']
+                naxes = [hdr[f'NAXIS{i}'] for i in range(1, hdr['NAXIS'] + 1)]
+                npix = int(np.prod(naxes)) if naxes else 0
+                nbytes = abs(bitpix) // 8 * hdr.get('GCOUNT', 1) * \
+                    (hdr.get('PCOUNT', 0) + npix)
+                nblocks = (nbytes + _FITS_BLOCK - 1) // _FITS_BLOCK
+
+                if blockname is None:
+                    # The DM would skip an empty primary block.
+                    if offset != 0:
+                        return None
+
+                    found = True
+                else:
+                    found = str(hdr.get('EXTNAME', '')).upper() == blockname
+
+                if found:
+                    break
+
+                fh.seek(start + nblocks * _FITS_BLOCK)
+
+    except (OSError, KeyError, ValueError, UnicodeDecodeError):
+        return None
+
+    if offset != 0 and hdr.get('XTENSION') != 'IMAGE':
+        return None
+
+    if len(naxes) != 2 or npix == 0 or 'ZIMAGE' in hdr or 'BLANK' in hdr:
+        return None
+
+    return (fname, offset, start, hdr, naxes)
+
+
+def _open_fits_image_memmap(infile, mode='r'):
+    """Return a memory map of a 2D FITS image, or None.
+
+    None is returned, rather than an error, when the image can not
+    be accessed directly (see _find_fits_image) or the image is
+    scaled. The image can only be changed (mode='r+') if the header
+    contains no checksums.
+    """
+
+    found = _find_fits_image(infile)
+    if found is None:
+        return None
+
+    (fname, _, start, hdr, naxes) = found
+    bitpix = hdr['BITPIX']
+
+    # Changing the data would invalidate the checksums.
+    if mode != 'r' and ('CHECKSUM' in hdr or 'DATASUM' in hdr):
+        return None
+
+    try:
+        dtype = _FITS_DTYPES[bitpix]
+    except KeyError:
+        return None
+
+    bscale = hdr.get('BSCALE', 1)
+    bzero = hdr.get('BZERO', 0)
+    if bscale != 1:
+        return None
+
+    if bzero != 0:
+        try:
+            zero, dtype = _FITS_UNSIGNED[bitpix]
+        except KeyError:
+            return None
+
+        if bzero != zero:
+            return None
+
+        # Flipping the sign bit converts the stored value to unsigned.
+        signed = np.memmap(fname, dtype=_FITS_DTYPES[bitpix], mode=mode,
+                           offset=start, shape=(naxes[1], naxes[0]))
+        return (signed, dtype)
+
+    mmap = np.memmap(fname, dtype=dtype, mode=mode, offset=start,
+                     shape=(naxes[1], naxes[0]))
+    return (mmap, None)
+
+
+def memmap_image(infile, mode='r'):
+    """Return a memory map of the image, or None.
+
+    Parameters
+    ----------
+    infile : str
+        The image, which can include a block name but no other
+        DM filter.
+    mode : {'r', 'r+'}, optional
+        Use 'r+' to allow the pixel values to be changed.
+
+    Returns
+    -------
+    mmap : numpy.memmap or None
+        The 2D image, in FITS byte order. None is returned if the
+        image can not be memory mapped, such as when the file is
+        compressed or the pixel values are scaled.
+    """
+
+    mmap = _open_fits_image_memmap(infile, mode=mode)
+    if mmap is None or mmap[1] is not None:
+        return None
+
+    return mmap[0]
+
+
+# The keywords which describe the structure of the image, and so are
+# not copied by create_image.
+#
+_FITS_STRUCTURE_KEYS = {'SIMPLE', 'XTENSION', 'BITPIX', 'NAXIS', 'EXTEND',
+                        'PCOUNT', 'GCOUNT', 'BSCALE', 'BZERO', 'BLANK',
+                        'CHECKSUM', 'DATASUM', 'EXTNAME', 'HDUNAME', 'END'}
+
+
+def _is_fits_structure_key(key):
+    return key in _FITS_STRUCTURE_KEYS or \
+        (key.startswith('NAXIS') and key[5:].isdigit())
+
+
+def _format_fits_card(key, value):
+    """Return the 80-character FITS card for the keyword.
+
+    A ValueError is raised if the value can not be written as a
+    single card.
+    """
+
+    if len(key) > 8 or not key.replace('-', '').replace('_', '').isalnum() \
+            or key != key.upper():
+        raise ValueError(f"Unsupported keyword name: {key}")
+
+    if isinstance(value, (bool, np.bool_)):
+        val = f"{'T' if value else 'F':>20s}"
+    elif isinstance(value, (int, np.integer)):
+        val = f"{int(value):>20d}"
+    elif isinstance(value, (float, np.floating)):
+        if not np.isfinite(value):
+            raise ValueError(f"Unsupported value for {key}: {value}")
+
+        val = f"{repr(float(value)).upper():>20s}"
+    elif isinstance(value, str):
+        val = "'" + value.replace("'", "''").ljust(8) + "'"
+    else:
+        raise ValueError(f"Unsupported value for {key}: {value}")
+
+    card = f"{key:8s}= {val}"
+    if len(card) > 80 or not card.isascii():
+        raise ValueError(f"Unsupported value for {key}: {value}")
+
+    return card.ljust(80)
+
+
+def create_image(infile, outfile, keys=None, clobber=False,
+                 dtype=np.float32):
+    """Create an image, set to 0, with the header of infile.
+
+    Parameters
+    ----------
+    infile : str
+        The image whose header is copied. The name can include a
+        block name but no other DM filter. The pixel values are not
+        read in.
+    outfile : str
+        The file to create, which can include the block name to use.
+    keys : dict or None, optional
+        The keywords to change, or add, to the header. A value of
+        None removes the keyword.
+    clobber : bool, optional
+        Is the output file over-written if it already exists?
+    dtype : numpy dtype, optional
+        The pixel type of the output, which must be one of the
+        types that FITS stores without scaling: unsigned 8-bit
+        integers, signed 16, 32, or 64-bit integers, or 32 or 64-bit
+        floats.
+
+    Returns
+    -------
+    flag : bool
+        False, and no file is created, when the image can not be
+        accessed directly (see memmap_image), the pixel type is not
+        supported, or a keyword can not be written.
+
+    Notes
+    -----
+    The output is written as the primary block and contains no
+    checksums, so that it can be changed with memmap_image. The
+    structural keywords (e.g. BITPIX, BSCALE, and CHECKSUM) of
+    infile are not copied, and can not be set with keys.
+    """
+
+    dtype = np.dtype(dtype).newbyteorder('=')
+    bitpixes = [bitpix for (bitpix, ftype) in _FITS_DTYPES.items()
+                if ftype.newbyteorder('=') == dtype]
+    if len(bitpixes) == 0:
+        v3(f"Unable to create an image of type {dtype}")
+        return False
+
+    blockname = _get_fits_blockname(outfile)
+    if blockname is False:
+        return False
+
+    found = _find_fits_image(infile)
+    if found is None:
+        return False
+
+    (fname, offset, start, _, naxes) = found
+    with open(fname, "rb") as fh:
+        fh.seek(offset)
+        header = fh.read(start - offset).decode('ascii')
+
+    cards = []
+    for i in range(0, len(header), 80):
+        card = header[i:i + 80]
+        key = card[:8].strip()
+        if key == 'END':
+            break
+
+        # Long string values are continued over several cards.
+        if key == 'CONTINUE' and cards:
+            cards[-1] = (cards[-1][0], cards[-1][1] + card)
+            continue
+
+        cards.append((key, card))
+
+    cards = [c for c in cards if not _is_fits_structure_key(c[0])]
+
+    try:
+        for (key, value) in (keys or {}).items():
+            if _is_fits_structure_key(key):
+                continue
+
+            idx = [i for (i, (k, _)) in enumerate(cards) if k == key]
+            if value is None:
+                cards = [c for (i, c) in enumerate(cards) if i not in idx]
+            elif idx:
+                cards[idx[0]] = (key, _format_fits_card(key, value))
+            else:
+                cards.append((key, _format_fits_card(key, value)))
+
+        out = [_format_fits_card('SIMPLE', True),
+               _format_fits_card('BITPIX', bitpixes[0]),
+               _format_fits_card('NAXIS', 2),
+               _format_fits_card('NAXIS1', naxes[0]),
+               _format_fits_card('NAXIS2', naxes[1])]
+        if blockname is not None:
+            out.append(_format_fits_card('EXTNAME', blockname))
+
+    except ValueError as exc:
+        v3(f"Unable to create an image from {infile}: {exc}")
+        return False
+
+    out.extend(card for (_, card) in cards)
+    out.append('END'.ljust(80))
+    hdr = ''.join(out).encode('ascii')
+    hdr += b' ' * (-len(hdr) % _FITS_BLOCK)
+
+    ofile = get_file(outfile)
+    if os.path.exists(ofile) and not clobber:
+        raise IOError(f"The output file {ofile} exists and clobber=no.")
+
+    nbytes = naxes[0] * naxes[1] * dtype.itemsize
+    nbytes += -nbytes % _FITS_BLOCK
+    with open(ofile, "wb") as fh:
+        fh.write(hdr)
+        fh.truncate(len(hdr) + nbytes)
+
+    return True
+
+
+class ImageStrips:
+    """Read an image a number of rows at a time.
+
+    If the image is stored in an uncompressed FITS file then the
+    data is memory mapped, so only the rows that are requested are
+    read in. Otherwise the image is read in with Crates (so that
+    DM filters and compressed files are supported).
+
+    Parameters
+    ----------
+    infile : str
+        The image, which can include a DM filter.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        The number of rows and columns.
+    dtype : numpy.dtype
+        The data type of the pixel values (in native byte order).
+    memmapped : bool
+        Is the data memory mapped?
+    """
+
+    def __init__(self, infile):
+        self.infile = infile
+        self._unsigned = None
+        mmap = _open_fits_image_memmap(infile)
+        self.memmapped = mmap is not None
+        if mmap is None:
+            v4(f"Reading image {infile} with Crates")
+            cr = pycrates.read_file(infile)
+            if not isinstance(cr, pycrates.IMAGECrate):
+                raise ValueError(f"Not an image: {infile}")
+
+            self._data = cr.get_image().values
+            if self._data.ndim != 2:
+                raise ValueError(f"Expected a 2D image: {infile}")
+
+            dtype = self._data.dtype
+        else:
+            v4(f"Memory mapping image {infile}")
+            self._data, self._unsigned = mmap
+            dtype = self._data.dtype if self._unsigned is None else self._unsigned
+
+        self.shape = self._data.shape
+        self.dtype = dtype.newbyteorder('=')
+
+    def strips(self, nrows):
+        """Yield (start, values) for each block of nrows rows.
+
+        start is the first row (0 based) of the block.
+        """
+
+        if nrows < 1:
+            raise ValueError(f"nrows must be positive, not {nrows}")
+
+        for start in range(0, self.shape[0], nrows):
+            yield (start, self.read_rows(start, nrows))
+
+    def read_rows(self, start, nrows):
+        """Return nrows rows of the image, starting at start (0 based).
+
+        Fewer rows are returned at the end of the image.
+        """
+
+        vals = np.asarray(self._data[start:start + nrows],
+                          dtype=self._data.dtype.newbyteorder('='))
+        if self._unsigned is not None:
+            vals = vals.view(vals.dtype.str.replace('i', 'u')) ^ \
+                (1 << (vals.dtype.itemsize * 8 - 1))
+            vals = vals.astype(self.dtype)
+
+        return vals
+
+    def close(self):
+        """Release the image data."""
+
+        self._data = None
+
+
 # End
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2010-2012, 2013, 2014, 2015, 2016, 2018, 2019, 2021
+# Copyright (C) 2010-2012, 2013, 2014, 2015, 2016, 2018, 2019, 2021, 2026
 # Smithsonian Astrophysical Observatory
 #
 #
@@ -48,12 +48,12 @@ section is going to get run first. For now I think it is worth it.
 #
 
 import os
+import math
 import tempfile
 import shutil
 import subprocess as sbp
 
-from itertools import islice
-from psutil import virtual_memory, cpu_count
+from psutil import virtual_memory
 
 import numpy as np
 
@@ -66,6 +66,8 @@ from ciao_contrib.runtool import new_pfiles_environment
 from ciao_contrib.runtool import add_tool_history
 
 from ciao_contrib._tools import fileio
+from ciao_contrib._tools import memprofile
+from ciao_contrib._tools.taskrunner import get_nproc
 from ciao_contrib._tools.obsinfo import ObsInfo
 from ciao_contrib._tools import utils
 
@@ -90,6 +92,84 @@ v3 = lgr.verbose3
 v4 = lgr.verbose4
 
 #################################################################################
+# buffer of 26 Mb in bytes
+FILE_BUFFER = 27_262_976
+
+# The memory estimates can be calibrated by setting the
+# CIAO_MEMORY_PROFILE environment variable (see memprofile); the
+# _default_xxx routines are used until there are enough observations.
+#
+
+
+def _default_expmap_memory(filesize:int, nchips:int) -> int:
+    expmap_limit = 6
+    if nchips > 1:
+        expmap_limit += nchips
+
+    return (expmap_limit * filesize) + FILE_BUFFER
+
+
+def _default_psfmap_memory(filesize:int, nchips:int) -> int:
+    # regardless of number of CCDs, memory used to generate an
+    # observation's PSF map is a little less than 7*filesize
+    psfmap_limit = 7.285 + (0.03 * nchips)
+
+    return int(psfmap_limit * filesize)
+
+
+def _default_stack_counts_memory(filesize:int, nstk:int) -> int:
+    # add_images sums the images a strip at a time into a 64-bit
+    # image, which is converted back to 32 bits when written out,
+    # so the number of images does not matter
+    counts_map_limit = 4
+
+    return (counts_map_limit * filesize) + FILE_BUFFER
+
+
+def _default_stack_psfmap_memory(filesize:int, nstk:int) -> int:
+    return int((1.69863 + 1.37718 * nstk**0.990286) * filesize)
+
+
+def expmap_memory(filesize:int, nchips:int) -> int:
+    """
+    estimate the memory, in bytes, needed to create an exposure map
+    of filesize bytes, or to mosaic nchips per-CCD exposure maps
+    """
+
+    step = "mkexpmap" if nchips == 1 else "combine_expmaps"
+    return memprofile.get_model(step, _default_expmap_memory)(filesize, nchips)
+
+
+def psfmap_memory(filesize:int, nchips:int) -> int:
+    """
+    estimate the memory, in bytes, needed to create the PSF map, of
+    filesize bytes, for an observation with nchips CCDs
+    """
+
+    return memprofile.get_model("mkpsfmap", _default_psfmap_memory)(filesize, nchips)
+
+
+def grid_filesize(grid:str) -> int|None:
+    """
+    return the size, in bytes, of a float32 image created with the
+    given grid (e.g. 'x=3000:5000:4,y=...'), or None if the number
+    of pixels in the grid can not be determined
+    """
+
+    axes = grid.split(",")
+    if len(axes) != 2:
+        return None
+
+    try:
+        nbins = [utils.parse_range(axis.split("=")[-1])[3]
+                 for axis in axes]
+    except (ValueError, IndexError):
+        return None
+
+    _pix_datasize = 4 # float32/int4: 4-bytes
+    return int(math.ceil(nbins[0])) * int(math.ceil(nbins[1])) * _pix_datasize
+
+
 class Project_Memory_Use:
     """
     Estimate memory usage to generate exposure maps and PSF maps and when
@@ -98,18 +178,32 @@ class Project_Memory_Use:
     memory.  Return a chunk size for stacking purposes that hopefully avoids
     using too much memory or error message with a suggestion on limiting the
     number of logical cores used for parallel proceses to avoid memory exhaustion.
+
+    The estimates are fitted to the memory profile, when set (see
+    memprofile), otherwise default scalings of the image size are used.
     """
 
-    def __init__(self, evtfiles:list|tuple, filesize:int, ncore:int|str|None):
+    def __init__(self, evtfiles:list|tuple, filesize:int, ncore:int|str|None,
+                 profile:memprofile.MemoryProfile|None=None):
         #self.evts = evtfiles
         self.filesize = filesize
         self._nchips_arr = sorted( ( len(fileio.get_ccds(e)) for e in evtfiles ), reverse=True )
         self.nstk = len(self._nchips_arr)
 
-        if ncore is None:
-            self.ncore = cpu_count(logical=True)
-        else:
-            self.ncore = int(ncore)
+        # as used by the task runner, so negative values are supported
+        self.ncore = get_nproc(ncore)
+
+        if profile is None:
+            profile = memprofile.get_profile()
+
+        self.profile = profile
+        defaults = {"mkexpmap": _default_expmap_memory,
+                    "combine_expmaps": _default_expmap_memory,
+                    "mkpsfmap": _default_psfmap_memory,
+                    "stack_counts": _default_stack_counts_memory,
+                    "stack_psfmap": _default_stack_psfmap_memory}
+        self.models = {step: memprofile.get_model(step, default, profile)
+                       for (step, default) in defaults.items()}
 
 
     def __enter__(self):
@@ -134,152 +228,167 @@ class Project_Memory_Use:
 
 
     def _expmap_memory(self, nchips:int) -> int:
-        file_buffer = 27_262_976 # buffer of 26 Mb in bytes
-
         ## mosaicking an observation's per-CCD exposure maps (parallelized) ##
-        expmap_limit = 6
-        if nchips > 1:
-            expmap_limit += nchips
+        step = "mkexpmap" if nchips == 1 else "combine_expmaps"
+        return self.models[step](self.filesize, nchips)
 
-        img_mem_use = (expmap_limit * self.filesize) + file_buffer
 
-        return img_mem_use
+    def _psfmap_memory(self, nchips:int) -> int:
+        return self.models["mkpsfmap"](self.filesize, nchips)
 
 
-    def _psfmap_memory(self, nchips:int) -> int:
+    def _parallel_limit(self, mem_available:int) -> int:
         """
-        regardless of number of CCDs, memory used to generate an observation's
-        PSF map is a little less than 7*filesize
+        the number of exposure and PSF map processes, up to ncore,
+        that fit in the available memory (0 if none do)
         """
 
-        psfmap_limit = 7.285 + (0.03 * nchips)
-
-        psfmap_mem = psfmap_limit * self.filesize
-
-        return psfmap_mem
-
-
-    def project_parallel_memory(self):
-        _, mem_available = self._get_system_memory()
-
-        nchips_arr = self._nchips_arr
-
-        if self.nstk > self.ncore:
-            def _sublists(lst:list|tuple, step:int) -> list[list]:
-                sublists = []
-
-                match lst:
-                    case list():
-                        len_lst = len(lst)
-                    case tuple():
-                        len_lst = lst.__len__()
-
-                for i in range(0, len_lst, step):
-                    sublists.append(list(islice(lst, i, i+step)))
-
-                return sublists
-
-            _nchips_grp = _sublists(nchips_arr, self.ncore)[0]
-
-        else:
-            _nchips_grp = nchips_arr
+        _nchips_grp = self._nchips_arr[:self.ncore]
 
         expmap_mem = [self._expmap_memory(n) for n in _nchips_grp]
-        expmap_mem_limit = sum(expmap_mem)
-
         psfmap_mem = [self._psfmap_memory(n) for n in _nchips_grp]
-        psfmap_mem_limit = sum(psfmap_mem)
 
-        if psfmap_mem_limit > expmap_mem_limit:
-            mem_limit = psfmap_mem_limit
+        if sum(psfmap_mem) > sum(expmap_mem):
             mem = psfmap_mem
         else:
-            mem_limit = expmap_mem_limit
             mem = expmap_mem
 
-        if mem_limit > mem_available:
-            while sum(mem) > mem_available:
-                _ = mem.pop()
+        while sum(mem) > mem_available:
+            _ = mem.pop()
 
-            ncore_mem_lim = len(mem)
+        return len(mem)
 
-            if ncore_mem_lim == 0:
-                raise MemoryError("There is insufficient system memory available to run processes to completion on a single core.")
 
-            if ncore_mem_lim == 1:
-                ncore_str = f"{ncore_mem_lim}"
-            else:
-                ncore_str = f"{ncore_mem_lim} or less"
+    def project_parallel_memory(self) -> int:
+        """
+        return the number of exposure and PSF map processes that can
+        be run at the same time
+        """
 
-            raise MemoryError(f"There is insufficient system memory available to run processes in parallel, consider reducing the number of cores used to {ncore_str}.")
+        _, mem_available = self._get_system_memory()
 
+        ncore_mem_lim = self._parallel_limit(mem_available)
+        if ncore_mem_lim == 0:
+            raise MemoryError("There is insufficient system memory available to run processes to completion on a single core.")
 
-    def check_stk_counts_memory(self):
-        file_buffer = 27_262_976 # buffer of 26 Mb in bytes
-        _, mem_available = self._get_system_memory()
-        chunk = self.nstk
-        _chunk_floor = 10
+        if ncore_mem_lim < min(self.nstk, self.ncore):
+            # The task runner only starts the memory-intensive tasks
+            # when they fit in the available memory, so the other
+            # tasks can still use all the cores.
+            v2(f"The exposure and PSF map creation will be limited to {ncore_mem_lim} processes at a time to fit in the available memory.")
 
-        ## stacking counts maps (serialized) ##
-        counts_map_limit = 12
-        if self.nstk > 1:
-            counts_map_limit += (2 * self.nstk)
+        return ncore_mem_lim
 
-        expected_size = (counts_map_limit * self.filesize) + file_buffer
-        # available_chunks = (mem_available - file_buffer)/self.filesize
-        # memchunks = expected_size/mem_available
 
-        if expected_size < mem_available:
-            return
+    def _stack_chunk(self, step:str, mem_available:int) -> int|None:
+        """
+        return None if all the images can be stacked at once, 0 if
+        two images can not be stacked, otherwise the number of images
+        to stack at once (None is also returned if there is no chunk
+        size larger than 10 that fits)
+        """
 
-        ## size needed to stack two images ##
-        if (16 * self.filesize) + file_buffer > mem_available:
-            raise MemoryError("There is insufficient system memory available to co-add counts images!")
+        model = self.models[step]
+        chunk = self.nstk
+        _chunk_floor = 10
 
-        while chunk > 1:
-            _countslim = (12 + 2*chunk) * self.filesize + file_buffer
+        if model(self.filesize, self.nstk) < mem_available:
+            return None
 
-            if _countslim < mem_available and chunk > _chunk_floor:
-                chunk = 10 * (chunk//10)
+        ## size needed to stack two images ##
+        if model(self.filesize, 2) > mem_available:
+            return 0
 
-                return chunk
+        while chunk > 1:
+            if model(self.filesize, chunk) < mem_available and chunk > _chunk_floor:
+                return 10 * (chunk//10)
 
             chunk -= 1
 
-        v0("There may be insufficient system memory availble to co-add counts images!")
+        return None
 
 
     def check_stk_psfmap_memory(self):
         _, mem_available = self._get_system_memory()
-        chunk = self.nstk
-        _chunk_floor = 10
 
-        def _memuse_fit(nstk:int):
-            return 1.69863 + 1.37718 * nstk**0.990286
+        chunk = self._stack_chunk("stack_psfmap", mem_available)
+        if chunk == 0:
+            raise MemoryError("There is insufficient system memory available to co-add PSF maps!")
 
-        ## stacking counts maps (serialized) ##
-        psfmap_limit = _memuse_fit(self.nstk)
+        if chunk is None and self.models["stack_psfmap"](self.filesize, self.nstk) >= mem_available:
+            v0("There may be insufficient system memory availble to co-add PSF maps!")
 
-        expected_size = psfmap_limit * self.filesize
+        return chunk
 
-        if expected_size < mem_available:
-            return
 
-        ## size needed to stack two images ##
-        if _memuse_fit(nstk=2) > mem_available:
-            raise MemoryError("There is insufficient system memory available to co-add PSF maps!")
+    def report(self, stacking:bool=True) -> list[str]:
+        """
+        return the memory estimates, and the choices made from them,
+        as a list of lines (no checks are made, so no error is raised);
+        the stacking steps are only included if stacking is set
+        """
 
-        while chunk > 1:
-            _countslim = _memuse_fit(nstk=chunk) * self.filesize
+        _, mem_available = self._get_system_memory()
 
-            if _countslim < mem_available and chunk > _chunk_floor:
-                chunk = 10 * (chunk//10)
+        def _gb(nbytes):
+            return f"{nbytes / 1024**3:.2f} GB"
 
-                return chunk
+        nchips = self._nchips_arr[0] if self.nstk > 0 else 1
+        estimates = [("mkexpmap", 1),
+                     ("combine_expmaps", nchips),
+                     ("mkpsfmap", nchips)]
+        if stacking:
+            estimates.extend([("stack_counts", self.nstk),
+                              ("stack_psfmap", self.nstk)])
 
-            chunk -= 1
+        if self.profile is None:
+            source = "the default estimates (CIAO_MEMORY_PROFILE is not set)"
+        else:
+            source = f"the memory profile {self.profile.filename}"
+
+        out = [f"Memory estimates for {self.nstk} observations with images of {_gb(self.filesize)},",
+               f"using {source}:"]
+        for (step, nimg) in estimates:
+            model = self.models[step]
+            label = "default" if model.uses_default(nimg) else "fitted"
+            out.append(f"  {step:16s} nimages={nimg:<4d} {_gb(model(self.filesize, nimg)):>10s}  [{label}]")
+
+        for (step, _) in estimates:
+            out.append(f"  {self.models[step].describe()}")
+
+        out.append(f"Available memory: {_gb(mem_available)}")
+
+        if not stacking:
+            # the per-chip exposure maps, and the per-band PSF maps,
+            # of an observation are created in parallel
+            mem = max(self._expmap_memory(1), self._psfmap_memory(nchips))
+            nproc = min(self.ncore, mem_available // mem)
+            if nproc == 0:
+                out.append("There is insufficient memory to create the exposure and PSF maps.")
+            else:
+                out.append(f"Exposure and PSF maps: up to {nproc} of {self.ncore} processes at a time.")
+
+            return out
 
-        v0("There may be insufficient system memory availble to co-add PSF maps!")
+        nproc = self._parallel_limit(mem_available)
+        if nproc == 0:
+            out.append("There is insufficient memory to create the exposure and PSF maps.")
+        else:
+            out.append(f"Exposure and PSF maps: up to {nproc} of {self.ncore} processes at a time.")
+
+        out.append("The counts images and exposure maps are co-added a strip of rows at a time.")
+
+        chunk = self._stack_chunk("stack_psfmap", mem_available)
+        if chunk == 0:
+            out.append("There is insufficient memory to co-add the PSF maps.")
+        elif chunk is None and self.models["stack_psfmap"](self.filesize, self.nstk) >= mem_available:
+            out.append("There may be insufficient memory to co-add the PSF maps.")
+        elif chunk is None:
+            out.append("The PSF maps are co-added at once.")
+        else:
+            out.append(f"The PSF maps are co-added {chunk} at a time.")
+
+        return out
 
 #################################################################################
 
@@ -800,6 +909,7 @@ def make_asphist(taskrunner, labelconv,
                             filt,
                             dtffile,
                             nbins, res_xy,
+                            outputs=[name_asphist(outpath, chip)],
                             message=smsg,
                             tmpdir=tmpdir,
                             verbose=verbose,
@@ -1622,6 +1732,7 @@ def make_instrument_maps(taskrunner, labelconv, preconditions,
                             outfile, mfile, obsfile, detsubsys, obs.grating,
                             monoenergy, wgtfile,
                             pixelgrid, mirror, dafile, units,
+                            outputs=[outfile],
                             message=smsg,
                             tmpdir=tmpdir,
                             ardlib=ardlib, verbose=verbose,
@@ -1638,8 +1749,13 @@ def run_mkexpmap(outfile, instmap, asphist, matchfile, normalize,
                  hackunits=True,
                  verbose=0,
                  tmpdir="/tmp",
-                 clobber=False):
-    "Create the given exposure map using a separate PFILES environment."
+                 clobber=False,
+                 filesize=None):
+    """Create the given exposure map using a separate PFILES environment.
+
+    If filesize is not None then the memory used by mkexpmap is
+    added to the memory profile (if set).
+    """
 
     if message is not None:
         v1(message)
@@ -1689,7 +1805,8 @@ def run_mkexpmap(outfile, instmap, asphist, matchfile, normalize,
                 "mode=h"
                 ]
         add_defargs(args, clobber, verbose)
-        run.run("mkexpmap", args)
+        with memprofile.measure("mkexpmap", filesize, 1):
+            run.run("mkexpmap", args)
 
         # copy over a few keywords. In CIAO 4.4 mkexpmap does not copy over the
         # GRATING keyword, instead just setting it to NONE. I believe this
@@ -1711,15 +1828,21 @@ def make_expmap_indiv(taskrunner, labelconv, preconditions,
                       verbose="0",
                       tmpdir="/tmp",
                       clobber=False,
-                      cleanup=True):
+                      cleanup=True,
+                      filesize=None):
     """Create the per-chip, per obsid exposure maps.
 
     The energy bands are assumed to have unique monochromatic energies.
 
     If cleanup=True then the aspect histograms and instrument maps will be deleted
     once the exposure map has been created.
+
+    If filesize is not None it is the size of the exposure map, in
+    bytes, and is used to estimate the memory needed by each task.
     """
 
+    memory = 0 if filesize is None else expmap_memory(filesize, 1)
+
     nruns = len(enbands) * len(chips)
     if nruns == 1:
         smsg = f"Creating exposure map for obsid {obsid}"
@@ -1741,11 +1864,16 @@ def make_expmap_indiv(taskrunner, labelconv, preconditions,
                                 run_mkexpmap,
                                 outfile, instmap, asphist, matchfile,
                                 normalize,
+                                memory=memory,
+                                inputs=[instmap,
+                                        name_asphist(outhead, j)],
+                                outputs=[outfile],
                                 tmpdir=tmpdir,
                                 message=smsg,
                                 hackunits=hackunits,
                                 verbose=verbose,
-                                clobber=clobber
+                                clobber=clobber,
+                                filesize=filesize
                                 )
 
             smsg = None
@@ -1791,19 +1919,25 @@ def combine_emaps(infiles, match, outfile, lookup_table, detnam,
                   message=None,
                   tmpdir="/tmp/",
                   verbose=0,
-                  clobber=False):
-    "Combine exposure maps, fix DETNAM and image units"
+                  clobber=False,
+                  filesize=None):
+    """Combine exposure maps, fix DETNAM and image units
+
+    If filesize is not None then the memory used to combine the
+    maps is added to the memory profile (if set).
+    """
 
     if message is not None:
         v1(message)
 
     with new_pfiles_environment(ardlib=False, copyuser=False, tmpdir=tmpdir):
-        dmimgcalc_add(infiles,
-                      outfile + "[EXPMAP]",
-                      lookupTab=lookup_table,
-                      clobber=clobber,
-                      verbose=verbose,
-                      tmpdir=tmpdir)
+        with memprofile.measure("combine_expmaps", filesize, len(infiles)):
+            dmimgcalc_add(infiles,
+                          outfile + "[EXPMAP]",
+                          lookupTab=lookup_table,
+                          clobber=clobber,
+                          verbose=verbose,
+                          tmpdir=tmpdir)
 
         # We could use dmhedit's filelist argument to just call the
         # tool once, with both DETNAM and BUNIT edits, but it is
@@ -1862,10 +1996,14 @@ def combine_expmap_chips(taskrunner, labelconv, preconditions,
                          parallel=True,
                          verbose=0,
                          clobber=False,
-                         cleanup=True):
+                         cleanup=True,
+                         filesize=None):
     """Combine per-chip exposure maps for each energy.
 
     The energy bands are assumed to have unique monochromatic energies.
+
+    If filesize is not None it is the size of the exposure map, in
+    bytes, and is used to estimate the memory needed by each task.
     """
 
     # setup arguments to reproject images
@@ -1876,6 +2014,8 @@ def combine_expmap_chips(taskrunner, labelconv, preconditions,
         fouthead += "/"
 
     nchips = len(chips)
+    memory = 0 if filesize is None else expmap_memory(filesize, nchips)
+
     nruns = len(enbands)
     if nruns == 1:
         smsg = f"Combining {nchips} exposure maps for obsid {obsid}"
@@ -1894,8 +2034,12 @@ def combine_expmap_chips(taskrunner, labelconv, preconditions,
                             combine_emaps,
                             expmaps, matchfile, name_expmap(outhead, enband),
                             lookup_table, detnam,
+                            memory=memory,
+                            inputs=expmaps,
+                            outputs=[name_expmap(outhead, enband)],
                             message=smsg,
-                            verbose=verbose, clobber=clobber, tmpdir=tmpdir)
+                            verbose=verbose, clobber=clobber, tmpdir=tmpdir,
+                            filesize=filesize)
 
         smsg = None
 
@@ -1924,7 +2068,8 @@ def make_exposure_maps(taskrunner, labelconv, preconditions,
                        parallel=True,
                        verbose="0",
                        clobber=False,
-                       cleanup=True
+                       cleanup=True,
+                       filesize=None
                        ):
     """Create exposure maps per chip and per band, and then for
     each band create a single exposure map (a copy if only one chip
@@ -1939,6 +2084,9 @@ def make_exposure_maps(taskrunner, labelconv, preconditions,
     If cleanup=True then the aspect solution, instrument maps,
     and per-chip exposure maps are deleted once they are finished
     with.
+
+    If filesize is not None it is the size of the exposure map, in
+    bytes, and is used to estimate the memory needed by each task.
     """
 
     if hackunits and normalize == "yes":
@@ -1958,7 +2106,8 @@ def make_exposure_maps(taskrunner, labelconv, preconditions,
                               tmpdir=tmpdir,
                               verbose=verbose,
                               clobber=clobber,
-                              cleanup=cleanup)
+                              cleanup=cleanup,
+                              filesize=filesize)
 
     if len(chips) == 1:
         return single_expmap_chips(taskrunner, labelconv, [etask],
@@ -1981,7 +2130,8 @@ def make_exposure_maps(taskrunner, labelconv, preconditions,
                                 parallel=parallel,
                                 verbose=verbose,
                                 clobber=clobber,
-                                cleanup=cleanup)
+                                cleanup=cleanup,
+                                filesize=filesize)
 
 
 def run_mkpsfmap(outfile, matchfile, energy, wgtfile, ecf,
@@ -1989,7 +2139,9 @@ def run_mkpsfmap(outfile, matchfile, energy, wgtfile, ecf,
                  message=None,
                  verbose=0,
                  tmpdir="/tmp",
-                 clobber=False):
+                 clobber=False,
+                 filesize=None,
+                 nchips=1):
     """Create the given PSF map using a separate PFILES environment.
 
     energy is used when wgtfile == NONE, otherwise wgtfile is used.
@@ -2006,6 +2158,10 @@ def run_mkpsfmap(outfile, matchfile, energy, wgtfile, ecf,
     still be encoded in the output file. The reason for removing the
     explicit subspace filter is to make it easier to combine the maps
     when merging observations.
+
+    If filesize is not None then the memory used by mkpsfmap, for
+    an observation with nchips CCDs, is added to the memory profile
+    (if set).
     """
 
     if message is not None:
@@ -2039,7 +2195,8 @@ def run_mkpsfmap(outfile, matchfile, energy, wgtfile, ecf,
         # mkpsfmap has no verbose argument, so drop it
         args = args[:-1]
 
-        run.run("mkpsfmap", args)
+        with memprofile.measure("mkpsfmap", filesize, nchips):
+            run.run("mkpsfmap", args)
 
         # Remove any spatial filters
         #
@@ -2058,11 +2215,16 @@ def make_psf_maps(taskrunner, labelconv, preconditions,
                   tmpdir="/tmp",
                   parallel=True,
                   verbose="0",
-                  clobber=False):
+                  clobber=False,
+                  filesize=None):
     """Create per-band PSF maps, filtered by the FOV.
 
+    If filesize is not None it is the size of the PSF map, in
+    bytes, and is used to estimate the memory needed by each task.
     """
 
+    memory = 0 if filesize is None else psfmap_memory(filesize, len(chips))
+
     # Create a PSF map per band
     #
     nruns = len(enbands)
@@ -2098,11 +2260,16 @@ def make_psf_maps(taskrunner, labelconv, preconditions,
         taskrunner.add_task(task, preconditions,
                             run_mkpsfmap,
                             outfile, matchfile, enmono, wgtfile, ecf,
+                            memory=memory,
+                            inputs=[matchfile, emapfile],
+                            outputs=[outfile],
                             maskfile=emapfile,
                             tmpdir=tmpdir,
                             message=smsg,
                             verbose=verbose,
-                            clobber=clobber)
+                            clobber=clobber,
+                            filesize=filesize,
+                            nchips=len(chips))
 
         tasks.append(task)
         smsg = None
@@ -2930,6 +3097,9 @@ def run_fluximage_tasks(taskrunner, labelconv,
 
     pixscale = utils.sky_to_arcsec(obs.instrument, binsize)
 
+    # used to estimate the memory needed by the tasks
+    filesize = grid_filesize(grid)
+
     asptask = make_asphist(taskrunner, labelconv,
                            obs,
                            asolobj,
@@ -2998,7 +3168,8 @@ def run_fluximage_tasks(taskrunner, labelconv,
                                   parallel=parallel,
                                   verbose=verbose,
                                   clobber=clobber,
-                                  cleanup=cleanup
+                                  cleanup=cleanup,
+                                  filesize=filesize
                                   )
 
     fluxtask = make_fluxed_images(taskrunner, labelconv,
@@ -3029,7 +3200,8 @@ def run_fluximage_tasks(taskrunner, labelconv,
                              tmpdir=tmpdir,
                              parallel=parallel,
                              verbose=verbose,
-                             clobber=clobber)
+                             clobber=clobber,
+                             filesize=filesize)
 
     return pmaptask
 
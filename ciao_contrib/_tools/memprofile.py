@@ -0,0 +1,550 @@
+#
+# Copyright (C) 2026
+#           Smithsonian Astrophysical Observatory
+#
+#
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Record, and model, the memory used by the fluximage and flux_obs steps.
+
+The memory needed to create the exposure and PSF maps, and to stack
+the per-observation images, decides how many of these steps can be
+run at the same time, and how many PSF maps are stacked at once. The
+default estimates are scalings of the image size that were measured
+on one machine. If the CIAO_MEMORY_PROFILE environment variable is
+set to a file name then the peak memory use of each step is added to
+this file - the profile - and, once there are enough observations
+of a step, its estimate is fitted to them instead.
+
+The profile contains one JSON object per line, with the fields
+
+  step     - the step name (see STEPS)
+  filesize - the size of the image, in bytes, for 32-bit pixels
+  nimages  - the number of chips or images used by the step
+  maxrss   - the peak resident set size, in bytes
+  time     - when the observation was made (seconds since the epoch)
+
+and the model for each step is
+
+  memory = c0 + filesize * (c1 + c2 * nimages)
+
+where c2 is only fitted when the profile contains more than one
+value of nimages for the step (otherwise the default estimate is
+used for other values of nimages). The steps in NIMAGES_INDEPENDENT,
+such as stack_counts - where the images are summed a strip of rows
+at a time - are fitted without the c2 term and the model is used
+for any number of images. The prediction is increased so that it is
+not less than any of the observations it was fitted to.
+
+The memory use of the steps which run a tool (mkexpmap,
+combine_expmaps, and mkpsfmap) is taken from the child processes
+(see measure). The peak memory use is only known for the lifetime of
+a process (or the largest child process it has waited for), so these
+steps are only recorded when they increase this value, which biases
+the profile towards the larger runs of a step (the safe direction
+for an estimate of the memory needed). The stacking steps are run in
+a forked process (see run_measured), so that each run has its own
+peak, and every run is recorded (see STEP_PROCESS).
+
+The profile, and the models fitted to it, are cached so that the
+file is only re-read, and the models re-fitted, when it changes.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+
+import ciao_contrib.logger_wrapper as lw
+
+from ciao_contrib._tools.taskrunner import get_peak_rss
+
+
+__all__ = ("STEPS", "STEP_PROCESS", "NIMAGES_INDEPENDENT", "Observation",
+           "MemoryProfile", "MemoryModel", "get_profile", "get_model",
+           "measure", "run_measured")
+
+lgr = lw.initialize_module_logger('_tools.memprofile')
+v1 = lgr.verbose1
+v3 = lgr.verbose3
+v4 = lgr.verbose4
+
+PROFILE_ENV = "CIAO_MEMORY_PROFILE"
+
+STEPS = ("mkexpmap", "combine_expmaps", "mkpsfmap",
+         "stack_counts", "stack_psfmap")
+
+# Is the memory used by a step that of the tool it runs, as a child
+# process (measured with measure), or is the step run in a forked
+# process (measured with run_measured)?
+#
+STEP_PROCESS = {"mkexpmap": "children",
+                "combine_expmaps": "children",
+                "mkpsfmap": "children",
+                "stack_counts": "fork",
+                "stack_psfmap": "fork"}
+
+# The steps whose memory use does not depend on the number of images.
+#
+NIMAGES_INDEPENDENT = ("stack_counts", )
+
+# The minimum number of observations of a step before the model
+# is fitted, and the maximum number (the most recent are used) so
+# that changes to the hardware or the tools are picked up.
+#
+MIN_OBSERVATIONS = 3
+MAX_OBSERVATIONS = 200
+
+
+Observation = namedtuple("Observation",
+                         ["step", "filesize", "nimages", "maxrss"])
+Observation.__doc__ = """The peak memory use, in bytes, of a step."""
+
+
+class MemoryProfile:
+    """The observed memory use of the steps, stored in a file.
+
+    Parameters
+    ----------
+    filename : str
+        The profile, which does not need to exist.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._cache = (None, [])
+        self._models = {}
+
+    def read(self):
+        """Return the observations, in the order they were recorded.
+
+        Lines that can not be parsed - such as a partial line from
+        an interrupted run - are skipped.
+        """
+
+        try:
+            st = os.stat(self.filename)
+        except FileNotFoundError:
+            return []
+
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache[0] == key:
+            return list(self._cache[1])
+
+        out = []
+        with open(self.filename, 'r') as fh:
+            for line in fh:
+                try:
+                    vals = json.loads(line)
+                    obs = Observation(*[vals[f] for f in Observation._fields])
+                except (ValueError, TypeError, KeyError):
+                    v4(f"Skipping line in {self.filename}: {line.strip()}")
+                    continue
+
+                if obs.step in STEPS:
+                    out.append(obs)
+
+        self._cache = (key, out)
+        return list(out)
+
+    def record(self, step, filesize, nimages, maxrss):
+        """Add an observation to the profile.
+
+        Each observation is added with a single write, so the profile
+        can be updated by several processes at the same time.
+        """
+
+        if step not in STEPS:
+            raise ValueError(f"Unknown step '{step}'")
+
+        obs = {"step": step, "filesize": int(filesize),
+               "nimages": int(nimages), "maxrss": int(maxrss),
+               "time": int(time.time())}
+        line = (json.dumps(obs) + "\n").encode()
+        fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                     0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+        v3(f"Recorded memory use of {maxrss / 1024**2:.1f} MB for {step} " +
+           f"(filesize={filesize} nimages={nimages})")
+
+    def observations(self, step):
+        """Return the most recent observations of the step."""
+
+        obs = [o for o in self.read() if o.step == step]
+        return obs[-MAX_OBSERVATIONS:]
+
+    def model(self, step, default):
+        """Return the model for the step (see MemoryModel).
+
+        The model is only re-fitted when the profile has changed.
+        """
+
+        obs = self.observations(step)
+        key = (step, default)
+        try:
+            (version, model) = self._models[key]
+            if version == self._cache[0]:
+                return model
+
+        except KeyError:
+            pass
+
+        model = MemoryModel(step, default, obs)
+        self._models[key] = (self._cache[0], model)
+        return model
+
+
+def _fit(filesize, nimages, maxrss, use_nimages):
+    """Fit the model, returning the coefficients or None."""
+
+    cols = [np.ones_like(filesize), filesize]
+    if use_nimages:
+        cols.append(filesize * nimages)
+
+    # Scale the columns so that the fit is well conditioned.
+    amat = np.column_stack(cols)
+    scale = np.abs(amat).max(axis=0)
+    coeffs, _, rank, _ = np.linalg.lstsq(amat / scale, maxrss, rcond=None)
+    if rank < len(cols):
+        return None
+
+    # Terms that do not contribute - other than from rounding - are
+    # set to zero, but otherwise the memory can not decrease with
+    # size.
+    tiny = np.abs(coeffs) < 1e-6 * np.abs(maxrss).max()
+    coeffs[tiny] = 0
+    coeffs = coeffs / scale
+    if np.any(coeffs[1:] < 0):
+        return None
+
+    if not use_nimages:
+        coeffs = np.append(coeffs, 0)
+
+    return coeffs
+
+
+class MemoryModel:
+    """Predict the peak memory use of a step.
+
+    Parameters
+    ----------
+    step : str
+        The step name.
+    default : callable
+        The default estimate, called with the filesize and number of
+        images, which is used when the model can not be fitted or
+        the number of images is outside the fitted values.
+    observations : sequence of Observation, optional
+        The observations to fit.
+
+    Attributes
+    ----------
+    nobs : int
+        The number of observations.
+    coeffs : None or (c0, c1, c2)
+        The fitted coefficients, or None.
+    nimages : None or set of int
+        The number of images in the observations, if the model
+        does not depend on the number of images and so is only
+        used for these values. It is None for the steps in
+        NIMAGES_INDEPENDENT.
+    """
+
+    def __init__(self, step, default, observations=()):
+        self.step = step
+        self.default = default
+        self.nobs = len(observations)
+        self.coeffs = None
+        self.nimages = None
+        self._margin = 0
+
+        if self.nobs < MIN_OBSERVATIONS:
+            return
+
+        filesize = np.asarray([o.filesize for o in observations], dtype=float)
+        nimages = np.asarray([o.nimages for o in observations], dtype=float)
+        maxrss = np.asarray([o.maxrss for o in observations], dtype=float)
+
+        if len(np.unique(filesize)) < 2:
+            return
+
+        per_image = step not in NIMAGES_INDEPENDENT
+        use_nimages = per_image and len(np.unique(nimages)) > 1
+        coeffs = _fit(filesize, nimages, maxrss, use_nimages)
+        if coeffs is None and use_nimages:
+            use_nimages = False
+            coeffs = _fit(filesize, nimages, maxrss, use_nimages)
+
+        if coeffs is None:
+            v3(f"Unable to fit the memory use of {step}")
+            return
+
+        self.coeffs = coeffs
+        if per_image and not use_nimages:
+            self.nimages = set(int(n) for n in nimages)
+
+        resid = maxrss - self._fitted(filesize, nimages)
+        self._margin = max(resid.max(), 0)
+
+    @property
+    def fitted(self):
+        """Is the model fitted to the observations?"""
+        return self.coeffs is not None
+
+    def _fitted(self, filesize, nimages):
+        c0, c1, c2 = self.coeffs
+        return c0 + filesize * (c1 + c2 * nimages)
+
+    def uses_default(self, nimages):
+        """Is the default estimate used for this number of images?"""
+
+        if self.coeffs is None:
+            return True
+
+        return self.nimages is not None and nimages not in self.nimages
+
+    def __call__(self, filesize, nimages):
+        """Return the estimated memory use, in bytes."""
+
+        if self.uses_default(nimages):
+            return int(self.default(filesize, nimages))
+
+        pred = self._fitted(filesize, nimages) + self._margin
+        return int(max(pred, 0))
+
+    def describe(self):
+        """A one-line summary of the model."""
+
+        if self.coeffs is None:
+            return f"{self.step}: default estimate ({self.nobs} observations)"
+
+        c0, c1, c2 = self.coeffs
+        base = (c0 + self._margin) / 1024**2
+        txt = f"{base:.1f} MB + filesize * ({c1:.3f}"
+        if self.nimages is None and self.step not in NIMAGES_INDEPENDENT:
+            txt += f" + {c2:.3f} * nimages)"
+        else:
+            txt += ")"
+
+        return f"{self.step}: fitted to {self.nobs} observations, {txt}"
+
+
+_profiles = {}
+
+
+def get_profile():
+    """Return the profile set by the CIAO_MEMORY_PROFILE environment
+    variable, or None.
+
+    The same object is returned for a given file name, so that the
+    file is not re-read, and the models re-fitted, on each call.
+    """
+
+    filename = os.environ.get(PROFILE_ENV, "").strip()
+    if filename == "":
+        return None
+
+    try:
+        return _profiles[filename]
+    except KeyError:
+        pass
+
+    profile = MemoryProfile(filename)
+    _profiles[filename] = profile
+    return profile
+
+
+def get_model(step, default, profile=None):
+    """Return the model for the step.
+
+    Parameters
+    ----------
+    step : str
+        The step name.
+    default : callable
+        The default estimate (see MemoryModel).
+    profile : MemoryProfile or None, optional
+        The profile to use. If None then the profile set by the
+        CIAO_MEMORY_PROFILE environment variable is used, and if this
+        is not set then the default estimate is used.
+
+    Returns
+    -------
+    model : MemoryModel
+    """
+
+    if step not in STEPS:
+        raise ValueError(f"Unknown step '{step}'")
+
+    if profile is None:
+        profile = get_profile()
+
+    if profile is None:
+        return MemoryModel(step, default)
+
+    return profile.model(step, default)
+
+
+@contextmanager
+def measure(step, filesize, nimages, profile=None):
+    """Record the peak memory use of the code in the context.
+
+    The peak memory use is taken from the child processes, so this is
+    for the steps which run a tool (see STEP_PROCESS). Nothing is
+    recorded if there is no profile (see get_model), if filesize is
+    None, if the code raises an error, or if the peak memory use did
+    not increase.
+    """
+
+    if step not in STEPS:
+        raise ValueError(f"Unknown step '{step}'")
+
+    if STEP_PROCESS[step] != "children":
+        raise ValueError(f"The step '{step}' must be measured with run_measured")
+
+    if profile is None:
+        profile = get_profile()
+
+    if profile is None or filesize is None:
+        yield
+        return
+
+    before = get_peak_rss()[1]
+    yield
+    after = get_peak_rss()[1]
+
+    if after <= before:
+        v4(f"The peak memory use did not change during {step}")
+        return
+
+    _record(profile, step, filesize, nimages, after)
+
+
+def _record(profile, step, filesize, nimages, maxrss):
+    """Add the observation, warning if the profile can not be changed."""
+
+    try:
+        profile.record(step, filesize, nimages, maxrss)
+    except OSError as exc:
+        v1(f"WARNING: unable to update the memory profile {profile.filename}: {exc}")
+
+
+def _run_child(wfd, func, args, kwargs):
+    """Run func in the forked process and send back the result.
+
+    This does not return.
+    """
+
+    status = 1
+    try:
+        try:
+            out = (True, func(*args, **kwargs))
+        except BaseException as exc:
+            out = (False, exc)
+
+        try:
+            msg = pickle.dumps(out)
+        except Exception:
+            if out[0]:
+                raise
+
+            # The exception can not be sent as is.
+            exc = out[1]
+            msg = pickle.dumps((False, RuntimeError(f"{type(exc).__name__}: {exc}")))
+
+        with os.fdopen(wfd, "wb") as fh:
+            fh.write(msg)
+
+        status = 0
+
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+def run_measured(step, filesize, nimages, func, *args, profile=None,
+                 **kwargs):
+    """Run func(*args, **kwargs), recording its peak memory use.
+
+    When there is a profile (see get_model) and filesize is not None,
+    func is run in a forked process, so that the peak memory use -
+    which includes any tool it runs - is that of this run alone, and
+    it is recorded whatever its value. The return value of func, or
+    the error it raised, is passed back to the caller, so the return
+    value must be picklable. Any other changes func makes, other than
+    to files, are lost. Nothing is recorded if func raises an error.
+
+    Otherwise func is just called.
+    """
+
+    if step not in STEPS:
+        raise ValueError(f"Unknown step '{step}'")
+
+    if STEP_PROCESS[step] != "fork":
+        raise ValueError(f"The step '{step}' must be measured with measure")
+
+    if profile is None:
+        profile = get_profile()
+
+    if profile is None or filesize is None:
+        return func(*args, **kwargs)
+
+    # Avoid repeating any buffered output in the child.
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    rfd, wfd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(rfd)
+        _run_child(wfd, func, args, kwargs)
+
+    os.close(wfd)
+    try:
+        with os.fdopen(rfd, "rb") as fh:
+            msg = fh.read()
+
+    finally:
+        _, status, usage = os.wait4(pid, 0)
+
+    if status != 0 or msg == b"":
+        code = os.waitstatus_to_exitcode(status)
+        raise RuntimeError(f"The {step} step failed with status {code}")
+
+    ok, out = pickle.loads(msg)
+    if not ok:
+        raise out
+
+    # Linux reports the value in kilobytes and macOS in bytes.
+    maxrss = usage.ru_maxrss
+    if sys.platform != "darwin":
+        maxrss *= 1024
+
+    v3(f"The {step} step used {maxrss / 1024**2:.1f} MB")
+    _record(profile, step, filesize, nimages, maxrss)
+    return out
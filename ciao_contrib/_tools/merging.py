@@ -44,8 +44,10 @@ import coords.format
 import coords.utils
 
 from ciao_contrib._tools import fileio
+from ciao_contrib._tools import memprofile
 from ciao_contrib._tools import fluximage as fi
 from ciao_contrib._tools.obsinfo import ObsInfo
+from ciao_contrib._tools.taskrunner import TaskRunner, get_nproc
 from ciao_contrib._tools import run
 from ciao_contrib._tools import utils
 
@@ -65,6 +67,18 @@ v2 = lgr.verbose2
 v3 = lgr.verbose3
 v4 = lgr.verbose4
 
+# The number of image rows to read in at a time when adding images.
+ADD_IMAGES_NROWS = 256
+
+# The default memory, in bytes, to use for the tiles when weighting
+# images (exposure_weight and expmap_weight). This is the total for
+# all the tiles, however many are processed at once.
+WEIGHT_TILE_MEMORY = 256 * 1024 * 1024
+
+# An estimate of the number of bytes needed per pixel of a tile: the
+# float64 numerator and denominator plus temporary arrays.
+_WEIGHT_BYTES_PER_PIXEL = 48
+
 
 def match_obsid(obsinfos, infiles, label):
     """Return the infiles array so that each infile
@@ -2467,28 +2481,34 @@ def which_obsids_overlap(obsinfos,
     return (keep, chipslist)
 
 
+def run_stacking(step, infiles, func, *args, **kwargs):
+    """Run func(*args, **kwargs), recording the memory used to stack
+    the images.
+
+    When the memory profile is set, func is run in a separate process
+    so that its peak memory use can be added to the profile (see
+    memprofile.run_measured).
+    """
+
+    if memprofile.get_profile() is None:
+        filesize = None
+    else:
+        filesize = 4 * fileio.get_image_npix(infiles[0])
+
+    return memprofile.run_measured(step, filesize, len(infiles),
+                                   func, *args, **kwargs)
+
+
 def merge_files(imgfiles, expmap_files, imgfile, expmap, fluxmap,
                 lookupTable, toolname, pars, toolversion,
-                verbose=1, clobber=False, tmpdir="/tmp/", nchunk=100):
+                verbose=1, clobber=False, tmpdir="/tmp/"):
     """Combine the images"""
 
-    run.dmimgcalc_add(imgfiles,
-                      imgfile + '[EVENTS_IMAGE]',
-                      verbose=verbose,
-                      clobber=clobber,
-                      lookupTab=lookupTable,
-                      tmpdir=tmpdir,
-                      nchunk=nchunk,
-                      bigN_smallNchunk_bypass=True)
-
-    run.dmimgcalc_add(expmap_files,
-                      expmap + '[EXPMAP]',
-                      verbose=verbose,
-                      clobber=clobber,
-                      lookupTab=lookupTable,
-                      tmpdir=tmpdir,
-                      nchunk=nchunk,
-                      bigN_smallNchunk_bypass=True)
+    add_images(imgfiles, imgfile + '[EVENTS_IMAGE]', lookupTable,
+               clobber=clobber)
+
+    add_images(expmap_files, expmap + '[EXPMAP]', lookupTable,
+               clobber=clobber)
 
     run.fix_bunit(expmap_files[0], expmap, verbose=verbose)
 
@@ -2501,6 +2521,40 @@ def merge_files(imgfiles, expmap_files, imgfile, expmap, fluxmap,
                             toolversion=toolversion)
 
 
+def stack_counts_task(imgfiles, expmap_files, imgfile, expmap, fluxmap,
+                      toolname, toolversion, lookupTable=None,
+                      history=None, verbose=1, clobber=False,
+                      tmpdir="/tmp/"):
+    """Run merge_files, recording the memory use.
+
+    This is a separate routine so that the lookup table and
+    script parameters (history) are keyword arguments, and so
+    are not used to identify the task in a TaskRunner journal.
+    """
+
+    run_stacking("stack_counts", imgfiles, merge_files,
+                 imgfiles, expmap_files, imgfile, expmap, fluxmap,
+                 lookupTable, toolname, history, toolversion,
+                 verbose=verbose, clobber=clobber, tmpdir=tmpdir)
+
+
+def stack_psfmap_task(mergetype, outfile, psfmap_files, expmap_files,
+                      toolname, toolversion, lookupTable=None,
+                      history=None, verbose=1, clobber=False,
+                      tmpdir="/tmp/", nchunk=None, memory=None,
+                      nproc=1):
+    """Run merge_psfmaps, recording the memory use.
+
+    See stack_counts_task.
+    """
+
+    run_stacking("stack_psfmap", psfmap_files, merge_psfmaps,
+                 mergetype, outfile, psfmap_files, expmap_files,
+                 lookupTable, toolname, history, toolversion,
+                 verbose=verbose, clobber=clobber, tmpdir=tmpdir,
+                 nchunk=nchunk, memory=memory, nproc=nproc)
+
+
 def shape_to_string(shape):
     """Convert a NumPy shape tuple into a CIAO-friendly string.
 
@@ -2548,15 +2602,7 @@ def adjust_headers(rules, cr, keys, headers):
 
     """
 
-    for key in keys:
-        def getkey(d):
-            try:
-                return d[key]
-            except KeyError:
-                return None
-
-        vals = [getkey(d) for d in headers]
-        newval = rules.apply(key, vals)
+    for (key, newval) in merge_header_values(rules, keys, headers).items():
         has_key = cr.key_exists(key)
         if newval is None:
             if has_key:
@@ -2567,11 +2613,335 @@ def adjust_headers(rules, cr, keys, headers):
             pycrates.set_key(cr, key, newval)
 
 
-# NOTE: exposure_weight and expmap_weight have very-similar structure,
-#       so there is currently a lot of repeated code.
-#
+def merge_header_values(rules, keys, headers):
+    """Return the merged value of each key.
+
+    The arguments are as for adjust_headers, and the return value
+    is a dict, where a value of None means the key should be
+    removed.
+    """
+
+    out = {}
+    for key in keys:
+        vals = [d.get(key) for d in headers]
+        out[key] = rules.apply(key, vals)
+
+    return out
+
+
+def get_image_header(infile):
+    """Return the header keywords of the image.
+
+    The data is not read in. A ValueError is raised if infile is
+    not an image.
+    """
+
+    hdr = fileio.get_keys_from_file(infile)
+    if hdr.get('__SHAPE') is None:
+        raise ValueError(f"Not an image: {infile}")
+
+    return {k: v for k, v in hdr.items() if not k.startswith('__')}
+
+
+def sum_dtype(dtype):
+    """The type used to sum images of the given type."""
+
+    if np.issubdtype(dtype, np.unsignedinteger) and \
+       np.dtype(dtype).itemsize == 8:
+        return np.dtype(np.uint64)
+
+    if np.issubdtype(dtype, np.integer):
+        return np.dtype(np.int64)
+
+    return np.dtype(np.float64)
+
+
+def add_images(infiles, outfile, lookupTable=None, clobber=False,
+               nrows=ADD_IMAGES_NROWS):
+    """Sum up the input images to create an output file.
+
+    Parameters
+    ----------
+    infiles : list of str
+        The files to add. They are assumed to be on the same grid
+        (and be the same size).
+    outfile : str
+        The file to create. This is assumed to include any rename of
+        the output block if required.
+    lookupTable : str or None, optional
+        The name of the lookup table used to merge headers. If None
+        then the header of the first file is used.
+    clobber : bool, optional
+        Is the output file over-written if it already exists?
+    nrows : int, optional
+        The number of rows of each image to read in at a time.
+
+    Notes
+    -----
+    Each input is read once, nrows at a time (the data is memory
+    mapped if possible, see fileio.ImageStrips), and added to a
+    single output image, so no temporary files are created and the
+    memory use does not depend on the number of files. The output
+    is created from the header of the first file (see
+    fileio.create_image) and memory mapped, so the sum is converted
+    to the output type nrows at a time; Crates is used, with a copy
+    of the sum, when this is not possible. Integer
+    images are summed as 64-bit integers - unsigned if all the
+    inputs are 64-bit unsigned integers - and floating-point images
+    as 64-bit floats, before being converted to the input type.
+    Images which contain both signed and 64-bit unsigned integers
+    are summed as 64-bit floats.
+
+    The output header is close to what the DataModel merging rules
+    would give, but it is not exact. No history items are added for
+    this step.
+
+    Only the first block is copied over.
+
+    As with dmimgcalc, a pixel is NaN if it is NaN in any input.
+    """
+
+    if len(infiles) == 0:
+        raise ValueError("Input files is empty")
+
+    v3(f"Summing up {len(infiles)} files: {outfile}")
+
+    total = None
+    dtypes = []
+    headers = []
+    keys = set()
+
+    for infile in infiles:
+        v4(f" - adding {infile}")
+        img = fileio.ImageStrips(infile)
+        try:
+            if total is None:
+                total = np.zeros(img.shape, dtype=sum_dtype(img.dtype))
+
+            elif total.shape != img.shape:
+                shape = shape_to_string(total.shape)
+                got = shape_to_string(img.shape)
+                raise ValueError(f"Expected {shape} but found {got} in {infile}")
+
+            # Switch to 64-bit floats when the sum can not be stored
+            # as integers, e.g. when adding signed and unsigned 64-bit
+            # integers.
+            #
+            dtype = np.result_type(total.dtype, sum_dtype(img.dtype))
+            if dtype != total.dtype:
+                total = total.astype(dtype)
+
+            for (start, vals) in img.strips(nrows):
+                total[start:start + vals.shape[0]] += vals
+
+            dtypes.append(img.dtype)
+
+        finally:
+            img.close()
+
+        if lookupTable is not None:
+            hdr = get_image_header(infile)
+            headers.append(hdr)
+            keys.update(set(hdr.keys()))
+
+    dtype = np.result_type(*dtypes)
+    rules = None if lookupTable is None else HeaderMerge(lookupTable)
+
+    newkeys = {} if rules is None else merge_header_values(rules, keys, headers)
+    created = fileio.create_image(infiles[0], outfile, newkeys,
+                                  clobber=clobber, dtype=dtype)
+    out = fileio.memmap_image(outfile, mode='r+') if created else None
+    if out is None:
+        v3(f"Unable to memory map {outfile} so using Crates")
+        basecr = pycrates.read_file(infiles[0])
+        basecr.get_image().values = total.astype(dtype)
+        if rules is not None:
+            adjust_headers(rules, basecr, keys, headers)
+
+        basecr.write(outfile, clobber=clobber or created)
+        return
+
+    # Convert to the output type a strip at a time.
+    #
+    try:
+        for start in range(0, total.shape[0], nrows):
+            out[start:start + nrows] = total[start:start + nrows]
+
+        out.flush()
+        out = None
+
+    except BaseException:
+        out = None
+        filename = fileio.get_file(outfile)
+        if os.path.exists(filename):
+            os.unlink(filename)
+
+        raise
+
+
+def open_tiled_images(infiles, tmpdir, tmpfiles):
+    """Open the images so that they can be read a tile at a time.
+
+    Images that can not be memory mapped (e.g. compressed files)
+    are copied, one at a time, to an uncompressed file in tmpdir,
+    so that the memory use does not depend on the number of files.
+    The temporary files are appended to tmpfiles.
+
+    Returns a list of fileio.ImageStrips objects, which the caller
+    should close.
+    """
+
+    out = []
+    for infile in infiles:
+        img = fileio.ImageStrips(infile)
+        if not img.memmapped:
+            img.close()
+            v3(f"Copying {infile} to an uncompressed image")
+            tmpfile = tempfile.NamedTemporaryFile(dir=tmpdir, suffix='.img')
+            tmpfiles.append(tmpfile)
+            cr = pycrates.read_file(infile)
+            cr.write(tmpfile.name, clobber=True)
+            cr = None
+            img = fileio.ImageStrips(tmpfile.name)
+
+        out.append(img)
+
+    return out
+
+
+def tiled_weighted_mean(accumulate, shape, basefile, outfile, rules,
+                        keys, headers, clobber=True,
+                        memory=WEIGHT_TILE_MEMORY, nproc=1):
+    """Create an image of numerator / denominator one tile at a time.
+
+    Parameters
+    ----------
+    accumulate : callable
+        Called with (start, nrows, numerator, denominator), it adds
+        the values for the nrows rows starting at row start (0
+        based) to the numerator and denominator arrays, which are
+        64-bit floats and contain nrows rows.
+    shape : (int, int)
+        The number of rows and columns in the image.
+    basefile : str
+        The output is based on this file.
+    outfile : str
+        The file to create. This is assumed to include any rename of
+        the output block if required.
+    rules : HeaderMerge instance
+    keys, headers
+        The header keys and values, as used by adjust_headers.
+    clobber : bool, optional
+        Is the output file over-written if it already exists?
+    memory : int, optional
+        The memory, in bytes, to use for the tiles. This sets the
+        number of rows in each tile, and is shared between the nproc
+        tiles processed at once.
+    nproc : int, optional
+        The number of tiles to process at once (using threads).
+
+    Notes
+    -----
+    The output is created from the header of basefile, without
+    reading its pixel values or writing checksums (see
+    fileio.create_image), and is then memory mapped so that each
+    tile is written out once it is calculated. If this is not
+    possible, such as when basefile is compressed, then the output
+    is created with Crates, in memory, and written out at the end.
+    The output is removed if there is an error.
+
+    Pixels with no exposure (a denominator of 0) are set to NaN.
+
+    The output is forced to 32 bit rather than 64 bit as there is
+    no need for the extra precision (and mkpsfmap creates Real4
+    images so no point in going more accurate than that).
+    """
+
+    nproc = max(int(nproc), 1)
+    ntotal, ncols = shape
+    nrows = int(memory // (nproc * ncols * _WEIGHT_BYTES_PER_PIXEL))
+    nrows = min(max(nrows, 1), ntotal)
+    starts = list(range(0, ntotal, nrows))
+    v3(f"Weighting a {shape_to_string(shape)} image using " +
+       f"{len(starts)} tiles of {nrows} rows")
+
+    # Adjust the header for each key we have seen.
+    #
+    newkeys = merge_header_values(rules, keys, headers)
+    if fileio.create_image(basefile, outfile, newkeys, clobber=clobber):
+        basecr = None
+    else:
+        v3(f"Unable to copy the header of {basefile} so using Crates")
+        basecr = pycrates.read_file(basefile)
+        basecr.get_image().values = np.zeros(shape, dtype=np.float32)
+        adjust_headers(rules, basecr, keys, headers)
+        basecr.write(outfile, clobber=clobber)
+
+    try:
+        out = fileio.memmap_image(outfile, mode='r+')
+        if out is not None:
+            basecr = None
+        else:
+            v3(f"Unable to memory map {outfile} so creating it in memory")
+            if basecr is None:
+                basecr = pycrates.read_file(outfile)
+
+            out = basecr.get_image().values
+
+        def store(start):
+            n = min(nrows, ntotal - start)
+            numerator = np.zeros((n, ncols))
+            denominator = np.zeros((n, ncols))
+            accumulate(start, n, numerator, denominator)
+
+            # Pixels with no exposure have a value of 0 so will end up
+            # as NaN in the output.
+            #
+            with np.errstate(invalid='ignore', divide='ignore'):
+                out[start:start + n] = numerator / denominator
+
+        if nproc > 1 and len(starts) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=nproc) as pool:
+                for _ in pool.map(store, starts):
+                    pass
+
+        else:
+            for start in starts:
+                store(start)
+
+        if basecr is None:
+            out.flush()
+            out = None
+        else:
+            basecr.get_image().values = out
+            basecr.write(outfile, clobber=True)
+
+    except BaseException:
+        out = None
+        filename = fileio.get_file(outfile)
+        if os.path.exists(filename):
+            os.unlink(filename)
+
+        raise
+
+
+def check_tiled_shapes(images):
+    """Check that the images all have the same shape, and return it."""
+
+    shape = images[0].shape
+    for img in images[1:]:
+        if img.shape != shape:
+            expected = shape_to_string(shape)
+            got = shape_to_string(img.shape)
+            raise ValueError(f"Expected {expected} but found {got} in {img.infile}")
+
+    return shape
+
+
 def exposure_weight(infiles, outfile, lookupTable,
-                    clobber=True):
+                    clobber=True, tmpdir="/tmp/",
+                    memory=WEIGHT_TILE_MEMORY, nproc=1):
     """Exposure weight the inputs to create an output file.
 
     Parameters
@@ -2588,15 +2958,23 @@ def exposure_weight(infiles, outfile, lookupTable,
         The name of the lookup table used to merge headers.
     clobber : bool, optional
         Is the output file over-written if it already exists?
+    tmpdir : str, optional
+        The directory used for uncompressed copies of the inputs,
+        when needed.
+    memory : int, optional
+        The memory, in bytes, used for the image tiles.
+    nproc : int, optional
+        The number of tiles to process at once.
 
     Notes
     -----
-    This is performed using Crates - so all the data is read in
-    at once rather than done on a pixel-by-pixel basis. This means
-    that it is not ideal for "large" files.
+    The output is calculated a tile (a set of rows) at a time, by
+    reading the tile from each input in turn, so the memory use
+    depends on the memory argument and not on the number, or size,
+    of the inputs (see tiled_weighted_mean).
 
-    The reason for using Crates over dmimgcalc is the easier
-    handling of NaN values.
+    The reason for not using dmimgcalc is the easier handling of NaN
+    values.
 
     The output header is close to what the DataModel merging rules would
     give, but it is not exact. No history items are added for this
@@ -2625,93 +3003,65 @@ def exposure_weight(infiles, outfile, lookupTable,
 
     mergerules = HeaderMerge(lookupTable)
 
-    # Calculate
-    #     numerator   = sum_i exp_i * pix_i
-    #     denominator = sum_i exp_i * mask_i
-    #
-    # where pix_i has NaN replaced by 0 and mask_i is 1 when origpix_i
-    # was finite, otherwise is 0.
-    #
-    # For now I am not specifying a behavior for pixels set to
-    # +infinity / -infinty.
-    #
-    basecr = None
-    numerator = None
-    denominator = None
-
     # Store a dictionary of the header keyword values from each file,
     # and a set of all known keys.
     #
     headers = []
     keys = set()
+    exposures = []
 
     for infile in infiles:
-        cr = pycrates.read_file(infile)
-        if not isinstance(cr, pycrates.IMAGECrate):
-            raise ValueError(f"Not an image: {infile}")
-
-        exp = cr.get_key_value('EXPOSURE')
+        hdr = get_image_header(infile)
+        exp = hdr.get('EXPOSURE')
         if exp is None:
             raise ValueError(f"No EXPOSURE keyword in {infile}")
 
         if exp <= 0.0:
             raise ValueError(f"EXPOSURE keyword = {exp} in {infile}")
 
-        # NOTE: using NaN as an indicator that the pixel is outside the
-        #       filtered data; really should also check the subspace
-        #       but this is currently a requirement on the input (that
-        #       the subspace and NaN pixels match).
-        #
-        ivals = cr.get_image().values
-        pixvals = exp * np.nan_to_num(ivals)
-        expvals = exp * np.isfinite(ivals)
-
-        if numerator is None:
-            numerator = pixvals
-            denominator = expvals
-        else:
-            if numerator.shape != pixvals.shape:
-                shape = shape_to_string(numerator.shape)
-                got = shape_to_string(pixvals.shape)
-                raise ValueError(f"Expected {shape} but found {got} in {infile}")
-
-            numerator += pixvals
-            denominator += expvals
+        exposures.append(exp)
+        headers.append(hdr)
+        keys.update(set(hdr.keys()))
 
-        # store the header names and values
-        #
-        names = cr.get_keynames()
-        headers.append({k: cr.get_key_value(k) for k in names})
-        keys.update(set(names))
-
-        if basecr is None:
-            basecr = cr
-
-    # Pixels with no exposure have a value of 0 so will end up as NaN
-    # in the output.
+    # Calculate
+    #     numerator   = sum_i exp_i * pix_i
+    #     denominator = sum_i exp_i * mask_i
     #
-    # Note that we force the output to 32 bit rather than 64 bit as
-    # there is no need for the extra precision (and mkspfmap creates
-    # Real4 images so no point in going more accurate than that).
+    # where pix_i has NaN replaced by 0 and mask_i is 1 when origpix_i
+    # was finite, otherwise is 0.
+    #
+    # NOTE: using NaN as an indicator that the pixel is outside the
+    #       filtered data; really should also check the subspace
+    #       but this is currently a requirement on the input (that
+    #       the subspace and NaN pixels match).
     #
-    res = np.seterr(invalid='ignore')
+    tmpfiles = []
+    images = []
     try:
-        newvals = numerator / denominator
-        newvals = newvals.astype(np.float32)
-    finally:
-        np.seterr(**res)
+        images = open_tiled_images(infiles, tmpdir, tmpfiles)
+        shape = check_tiled_shapes(images)
 
-    basecr.get_image().values = newvals
+        def accumulate(start, nrows, numerator, denominator):
+            for img, exp in zip(images, exposures):
+                ivals = img.read_rows(start, nrows)
+                numerator += exp * np.nan_to_num(ivals)
+                denominator += exp * np.isfinite(ivals)
 
-    # Adjust the header for each key we have seen.
-    #
-    adjust_headers(mergerules, basecr, keys, headers)
+        tiled_weighted_mean(accumulate, shape, infiles[0], outfile,
+                            mergerules, keys, headers, clobber=clobber,
+                            memory=memory, nproc=nproc)
 
-    basecr.write(outfile, clobber=clobber)
+    finally:
+        for img in images:
+            img.close()
+
+        for tmpfile in tmpfiles:
+            tmpfile.close()
 
 
 def expmap_weight(infiles, expmaps, outfile, lookupTable,
-                  clobber=True):
+                  clobber=True, tmpdir="/tmp/",
+                  memory=WEIGHT_TILE_MEMORY, nproc=1):
     """Weight the inputs by the exposure maps to create an output file.
 
     Parameters
@@ -2729,15 +3079,23 @@ def expmap_weight(infiles, expmaps, outfile, lookupTable,
         The name of the lookup table used to merge headers.
     clobber : bool, optional
         Is the output file over-written if it already exists?
+    tmpdir : str, optional
+        The directory used for uncompressed copies of the inputs,
+        when needed.
+    memory : int, optional
+        The memory, in bytes, used for the image tiles.
+    nproc : int, optional
+        The number of tiles to process at once.
 
     Notes
     -----
-    This is performed using Crates - so all the data is read in
-    at once rather than done on a pixel-by-pixel basis. This means
-    that it is not ideal for "large" files.
+    The output is calculated a tile (a set of rows) at a time, by
+    reading the tile from each input in turn, so the memory use
+    depends on the memory argument and not on the number, or size,
+    of the inputs (see tiled_weighted_mean).
 
-    The reason for using Crates over dmimgcalc is the easier
-    handling of NaN values.
+    The reason for not using dmimgcalc is the easier handling of NaN
+    values.
 
     The output header is close to what the DataModel merging rules would
     give, but it is not exact. No history items are added for this
@@ -2762,19 +3120,6 @@ def expmap_weight(infiles, expmaps, outfile, lookupTable,
 
     mergerules = HeaderMerge(lookupTable)
 
-    # Calculate
-    #     numerator   = sum_i expmap_i * pix_i
-    #     denominator = sum_i expmap_i
-    #
-    # where pix_i and expmap_i have NaN replaced by 0.
-    #
-    # For now I am not specifying a behavior for pixels set to
-    # +infinity / -infinty.
-    #
-    basecr = None
-    numerator = None
-    denominator = None
-
     # Store a dictionary of the header keyword values from each file,
     # and a set of all known keys. This only uses the infiles, and
     # ignores expfiles.
@@ -2782,85 +3127,68 @@ def expmap_weight(infiles, expmaps, outfile, lookupTable,
     headers = []
     keys = set()
 
-    for infile, expmap in zip(infiles, expmaps):
-        cr = pycrates.read_file(infile)
-        if not isinstance(cr, pycrates.IMAGECrate):
-            raise ValueError(f"Not an image: {infile}")
-
-        ecr = pycrates.read_file(expmap)
-        if not isinstance(cr, pycrates.IMAGECrate):
-            raise ValueError(f"Not an image: {expmap}")
-
-        # NOTE: using NaN as an indicator that the pixel is outside the
-        #       filtered data; really should also check the subspace
-        #       but this is currently a requirement on the input (that
-        #       the subspace and NaN pixels match).
-        #
-        evals = ecr.get_image().values
-        ivals = cr.get_image().values
-
-        if ivals.shape != evals.shape:
-            raise ValueError(f"Shapes do not match: {infile} and {expmap}")
-
-        expvals = np.nan_to_num(evals)
-        pixvals = expvals * np.nan_to_num(ivals)
-
-        if numerator is None:
-            numerator = pixvals
-            denominator = expvals
-        else:
-            if numerator.shape != pixvals.shape:
-                shape = shape_to_string(numerator.shape)
-                got = shape_to_string(pixvals.shape)
-                raise ValueError(f"Expected {shape} but found {got} in {infile}")
-
-            numerator += pixvals
-            denominator += expvals
-
-        # store the header names and values
-        #
-        names = cr.get_keynames()
-        headers.append({k: cr.get_key_value(k) for k in names})
-        keys.update(set(names))
-
-        if basecr is None:
-            basecr = cr
+    for infile in infiles:
+        hdr = get_image_header(infile)
+        headers.append(hdr)
+        keys.update(set(hdr.keys()))
 
-    # Pixels with no exposure have a value of 0 so will end up as NaN
-    # in the output.
+    # Calculate
+    #     numerator   = sum_i expmap_i * pix_i
+    #     denominator = sum_i expmap_i
     #
-    # Note that we force the output to 32 bit rather than 64 bit as
-    # there is no need for the extra precision (and mkspfmap creates
-    # Real4 images so no point in going more accurate than that).
-    # It should not be needed here (only in the exptime weight) but
-    # left in just to make sure.
+    # where pix_i and expmap_i have NaN replaced by 0.
     #
-    res = np.seterr(invalid='ignore', divide='ignore')
+    tmpfiles = []
+    images = []
+    emaps = []
     try:
-        newvals = numerator / denominator
-        newvals = newvals.astype(np.float32)
-    finally:
-        np.seterr(**res)
+        images = open_tiled_images(infiles, tmpdir, tmpfiles)
+        emaps = open_tiled_images(expmaps, tmpdir, tmpfiles)
+        for img, emap in zip(images, emaps):
+            if img.shape != emap.shape:
+                raise ValueError(f"Shapes do not match: {img.infile} and {emap.infile}")
 
-    basecr.get_image().values = newvals
+        shape = check_tiled_shapes(images)
 
-    # Adjust the header for each key we have seen.
-    #
-    adjust_headers(mergerules, basecr, keys, headers)
+        def accumulate(start, nrows, numerator, denominator):
+            for img, emap in zip(images, emaps):
+                expvals = np.nan_to_num(emap.read_rows(start, nrows))
+                numerator += expvals * np.nan_to_num(img.read_rows(start, nrows))
+                denominator += expvals
 
-    basecr.write(outfile, clobber=clobber)
+        tiled_weighted_mean(accumulate, shape, infiles[0], outfile,
+                            mergerules, keys, headers, clobber=clobber,
+                            memory=memory, nproc=nproc)
+
+    finally:
+        for img in images + emaps:
+            img.close()
+
+        for tmpfile in tmpfiles:
+            tmpfile.close()
 
 
 def merge_psfmaps(mergetype, psfmap, psfmap_files, expmap_files,
                   lookupTable, toolname, pars, toolversion,
-                  verbose=1, clobber=False, tmpdir="/tmp", nchunk=None):
+                  verbose=1, clobber=False, tmpdir="/tmp", nchunk=None,
+                  memory=None, nproc=1):
     """Combine the PSF maps.
 
     It is assumed that the PSF maps have no spatial subspace filters
     (e.g. they were created by fluximage.run_mkpsfmap which explicitly
     removes any spatial filter).
+
+    The memory and nproc arguments are used when mergetype is
+    'exptime' or 'expmap' (see tiled_weighted_mean); nproc follows
+    the nproc parameter of the scripts, so None means all the cores.
+    The memory, in bytes, is the total used for the tiles, whatever
+    the value of nproc, and defaults to WEIGHT_TILE_MEMORY.
     """
 
+    nproc = get_nproc(nproc)
+    if memory is None:
+        memory = WEIGHT_TILE_MEMORY
+
     dmfilttypes = ['min', 'max', 'mean', 'median', 'mid']
     clstr = "yes" if clobber else "no"
 
@@ -2889,10 +3217,12 @@ def merge_psfmaps(mergetype, psfmap, psfmap_files, expmap_files,
             dmfilt_stk(pmap_files, out, mergetype)
 
         elif mergetype == 'exptime':
-            exposure_weight(pmap_files, out, lut)
+            exposure_weight(pmap_files, out, lut, tmpdir=tmpdir,
+                            memory=memory, nproc=nproc)
 
         elif mergetype == 'expmap':
-            expmap_weight(pmap_files, emap_files, out, lut)
+            expmap_weight(pmap_files, emap_files, out, lut, tmpdir=tmpdir,
+                          memory=memory, nproc=nproc)
 
         else:
             raise ValueError(f"Unexpected mergetype={mergetype} for combining PSF maps")
@@ -2959,8 +3289,9 @@ def merge(process,
           clobber=False,
           pathfrom=None,
           tmpdir="/tmp/",
-          counts_nchunk : int|None=100,
-          psfmap_nchunk : int|None=None):
+          psfmap_nchunk : int|None=None,
+          psfmap_memory : int|None=None,
+          nproc : int|None=1):
     """Combine the fluximage outputs into single images.
     outfiles is the output of setup_output_names().
 
@@ -2974,6 +3305,13 @@ def merge(process,
     pathfrom : str or None, optional
         The location of the script (i.e. it's __file__ value) as this
         is used to find the lookup table,
+    psfmap_memory : int or None, optional
+        The memory, in bytes, to use when the PSF maps are weighted
+        by exposure (psfmerge is 'exptime' or 'expmap'). It is not
+        scaled by nproc. None means use WEIGHT_TILE_MEMORY.
+    nproc : int or None, optional
+        The number of processes used to exposure weight the PSF maps,
+        as given by the nproc parameter of the script.
 
     """
 
@@ -3033,24 +3371,43 @@ def merge(process,
         obsid_images = outfiles['out_images']
         obsid_expmaps = outfiles['out_expmaps']
 
+    # The images are combined one at a time, but a TaskRunner is used
+    # so that the steps are recorded in the journal, if set, and so
+    # can be skipped when a failed run is re-started.
+    #
+    taskrunner = TaskRunner()
     for (eband, imgfile, expmap, fluxmap) in \
             zip(ebands, obsid_images, obsid_expmaps,
                 outfiles['out_fluxmaps']):
 
-        merge_files(images[eband], expmaps[eband],
-                    imgfile, expmap, fluxmap,
-                    ltable, toolname, pars, toolversion,
-                    verbose=verbose, clobber=clobber,
-                    tmpdir=tmpdir, nchunk=counts_nchunk)
+        taskrunner.add_task(f"stack-counts-{eband}", [],
+                            stack_counts_task,
+                            images[eband], expmaps[eband],
+                            imgfile, expmap, fluxmap,
+                            toolname, toolversion,
+                            inputs=images[eband] + expmaps[eband],
+                            outputs=[imgfile, expmap, fluxmap],
+                            lookupTable=ltable, history=pars,
+                            verbose=verbose, clobber=clobber,
+                            tmpdir=tmpdir)
 
     if psfmerge is not None:
         psfmaps = outfiles['psfmaps']
         for (eband, psfmap) in zip(ebands, outfiles['out_psfmaps']):
 
-            merge_psfmaps(psfmerge, psfmap, psfmaps[eband], expmaps[eband],
-                          ltable, toolname, pars, toolversion,
-                          verbose=verbose, clobber=clobber,
-                          tmpdir=tmpdir, nchunk=psfmap_nchunk)
+            taskrunner.add_task(f"stack-psfmap-{eband}", [],
+                                stack_psfmap_task,
+                                psfmerge, psfmap, psfmaps[eband],
+                                expmaps[eband],
+                                toolname, toolversion,
+                                inputs=psfmaps[eband] + expmaps[eband],
+                                outputs=[psfmap],
+                                lookupTable=ltable, history=pars,
+                                verbose=verbose, clobber=clobber,
+                                tmpdir=tmpdir, nchunk=psfmap_nchunk,
+                                memory=psfmap_memory, nproc=nproc)
+
+    taskrunner.run_tasks(processes=1, label=False)
 
     try:
         rt.add_tool_history(outfiles['mergedevtfile'], toolname, pars,
@@ -79,11 +79,24 @@ v4 = lgr.verbose4
 def run(tname, targs):
     """Run the tool (tname) with arguments (targs). Raises an
     IOError on failure. Logs the command and arguments at the DEBUG level.
+
+    If the runtool result cache is in use (e.g. the CIAO_RUNTOOL_CACHE
+    environment variable is set) and it can be used for the tool and
+    arguments then the tool is run, or its results restored, by the
+    cache, and the screen output is displayed once it has finished.
     """
 
     v2(f">> Running {tname}")
     v2(f">>   args: {targs}")
 
+    cache = rt.get_result_cache()
+    if cache is not None and cache.can_run_command(tname, targs):
+        out = cache.run_command(tname, targs)
+        if out is not None:
+            print(out)
+
+        return
+
     args = [tname]
     args.extend(targs)
     rval = sbp.call(args)
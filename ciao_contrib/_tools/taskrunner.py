@@ -24,6 +24,37 @@ An attempt at a simple task runner, supporting a pool-style
 system where tasks wait for preconditions to be passed
 before being run.
 
+When run in parallel, the ready tasks are run in order of the
+length of the longest chain of tasks which depend on them (the
+critical path), using the cost of each task - which defaults to
+1 but can be set when the task is added - so that the long
+chains are started first.
+
+Tasks can also be given the amount of memory and number of threads
+they need, in which case a task is only started when it fits within
+the memory budget (by default the available memory when the tasks
+are run) and number of processes; the other ready tasks are run in
+the meantime.
+
+The start and end time, worker, status, and the running peak memory
+use of the worker of each task are recorded, and can be written out
+as a Chrome trace-event (JSON) or CSV file with write_trace, or by
+setting the tracefile argument of run_tasks or the
+CIAO_TASKRUNNER_TRACE environment variable. A summary of the run is
+displayed at verbose=2.
+
+A journal of the completed tasks, and the output files they declared,
+can be kept with the journal argument of run_tasks (or the
+CIAO_TASKRUNNER_JOURNAL environment variable). When the same tasks
+are run again with the same journal, those that have already been
+completed - and which declared outputs that still exist and are newer
+than their inputs - are skipped, so that a failed or interrupted run
+can be restarted. A task is identified by its name, function,
+arguments - other than those which only control how it is run, such
+as clobber and verbose - and files, so one journal can be used for
+several runners, and changing one task does not mean the other tasks
+have to be re-run.
+
 Changes in multiprocessing in Python 3.8 means that on macOS the
 spawn method is used by default. This gives subtly-different results
 (e.g. screen output is different) so we attempt to force the fork
@@ -32,7 +63,15 @@ style approach, but this (is dangerous*.
 """
 
 import time
+import os
+import sys
+import csv
+import json
+import hashlib
+import resource
 import multiprocessing
+import heapq
+from collections import defaultdict, namedtuple
 from queue import Empty
 
 import pickle
@@ -49,7 +88,7 @@ TODO:
 
 """
 
-__all__ = ("TaskRunner", )
+__all__ = ("TaskRunner", "TaskRecord")
 
 lgr = initialize_module_logger('taskrunner')
 v1 = lgr.verbose1
@@ -58,6 +97,141 @@ v3 = lgr.verbose3
 v4 = lgr.verbose4
 
 
+TaskRecord = namedtuple("TaskRecord",
+                        ["name", "worker", "start", "end", "status",
+                         "peakrss"])
+TaskRecord.__doc__ = """The execution record of a task.
+
+The start and end times are in seconds since the epoch, worker is
+the number of the worker that ran the task (0 when run in serial),
+status is "ok" or "failed", and peakrss is the peak resident set
+size, in bytes, of the process that ran the task - or of any process
+it has waited for - when the task finished. This is a running peak
+over every task the process has run (the worker process when run in
+parallel, or the main process when run in serial), and not the
+memory used by this task alone.
+"""
+
+
+def get_peak_rss():
+    """Return the peak RSS, in bytes, of this process and of its children.
+
+    The children value is that of the largest child process which
+    has been waited for.
+    """
+
+    vals = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+    # Linux reports the value in kilobytes and macOS in bytes.
+    if sys.platform == "darwin":
+        return vals
+
+    return tuple(v * 1024 for v in vals)
+
+
+def get_maxrss():
+    """Return the peak RSS, in bytes, of this process and its children."""
+
+    return max(get_peak_rss())
+
+
+def make_record(name, worker, start, status):
+    """Create the TaskRecord for a task which has just finished."""
+
+    return TaskRecord(name, worker, start, time.time(), status,
+                      get_maxrss())
+
+
+# The keyword arguments which do not change the results of a task,
+# and so are not used to identify the task in the journal. This
+# means that a run can be restarted with clobber set, which is
+# needed when the outputs of the failed run are checked before
+# the tasks are run. The history argument is the script parameters
+# written to the HISTORY block of the outputs, and lookupTable is a
+# temporary copy of the merging rules that is created from the headers
+# of the input files, so its name changes with each run.
+#
+RUN_CONTROL_ARGS = ("clobber", "verbose", "tmpdir", "message",
+                    "history", "lookupTable")
+
+
+def task_signature(name, taskinfo, files):
+    """Return a string which identifies the task.
+
+    This is created from the task name, the function and its
+    arguments - other than the keyword arguments listed in
+    RUN_CONTROL_ARGS - and the input and output files. Arguments
+    which can not be converted to JSON use their repr, so an argument
+    whose repr changes between runs means the task is never matched.
+    """
+
+    if len(taskinfo) == 5:
+        (_, _, func, args, kwargs) = taskinfo
+        fname = getattr(func, "__qualname__", repr(func))
+        fname = "{}.{}".format(getattr(func, "__module__", ""), fname)
+        kwargs = {k: v for (k, v) in kwargs.items()
+                  if k not in RUN_CONTROL_ARGS}
+    else:
+        fname = None
+        args = [taskinfo[2]]
+        kwargs = {}
+
+    return json.dumps([str(name), fname, args, kwargs, files],
+                      sort_keys=True, default=repr)
+
+
+def hash_text(txt):
+    """Return the SHA-256 hash of the text."""
+
+    return hashlib.sha256(txt.encode("utf-8")).hexdigest()
+
+
+class TaskJournal:
+    """The record of the tasks completed by a TaskRunner.
+
+    The file contains one JSON object per line, with the key, name
+    (converted to a string), and outputs of each completed task. The
+    key is the hash of the task signature (see task_signature). The
+    file is flushed to disk after each task, so that it is complete
+    even if the process is killed.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def read(self):
+        """Return the keys of the completed tasks.
+
+        A missing file is treated as an empty journal, and a partly
+        written last line is ignored.
+        """
+
+        keys = set()
+        try:
+            with open(self.filename, "r") as fh:
+                for line in fh:
+                    try:
+                        keys.add(json.loads(line)["key"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+        except FileNotFoundError:
+            pass
+
+        return keys
+
+    def add(self, key, name, outputs):
+        """Record that the task has completed."""
+
+        entry = json.dumps({"key": key, "name": str(name),
+                            "outputs": list(outputs)})
+        with open(self.filename, "a") as fh:
+            fh.write(entry + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
 class TaskRunner:
     """Given a set of tasks with pre-conditions,
     run them in order. The tasks can be added to
@@ -74,12 +248,20 @@ class TaskRunner:
         """Set up the task runner."""
 
         self._clean()
+        self._trace = []
+        self._journal = None
+        self._keys = {}
 
     def _clean(self):
         "Prepare for a new set of tasks"
 
         self._torun = {}
         self._names = set()
+        self._dependents = defaultdict(list)
+        self._costs = {}
+        self._resources = {}
+        self._files = {}
+        self._skip = set()
 
     def _seen(self, name):
         """Returns True if the runner has already been
@@ -87,8 +269,25 @@ class TaskRunner:
 
         return name in self._names
 
+    def _add(self, name, preconditions, taskinfo, cost,
+             resources=(0, 0), files=((), ())):
+        """Store the task and index its preconditions.
+
+        The resources argument is the (memory, threads) needed by
+        the task and files is the (inputs, outputs) of the task.
+        """
+
+        self._torun[name] = taskinfo
+        self._names.add(name)
+        self._costs[name] = cost
+        self._resources[name] = resources
+        self._files[name] = files
+        for pname in set(preconditions):
+            self._dependents[pname].append(name)
+
     def add_task(self, name, preconditions, func,
-                 *args, **kwargs):
+                 *args, cost=1, memory=0, threads=1,
+                 inputs=None, outputs=None, **kwargs):
         """Add a task to be run.
 
         The name of the task must not have been used
@@ -100,6 +299,18 @@ class TaskRunner:
         the runner by addtask otherwise an error is
         raised (this is a simple method to try and avoid
         cyclical dependencies).
+
+        The cost argument is a hint for how long the task
+        takes to run, relative to the other tasks, and is
+        used to decide which tasks to run first when run
+        in parallel. The memory argument is an estimate of
+        the peak memory use of the task, in bytes, and
+        threads is the number of processors it uses; these
+        are used to limit the tasks which are run at the same
+        time. The inputs and outputs arguments are the names of
+        the files read and created by the task, and are used to
+        decide if the task needs to be re-run when a journal is
+        used. These arguments are not sent to func.
         """
 
         v3("TaskRunner: adding task {}".format(name))
@@ -107,6 +318,15 @@ class TaskRunner:
         if not hasattr(func, "__call__"):
             raise ValueError("The function for task {} is not callable".format(name))
 
+        if cost < 0:
+            raise ValueError("The cost for task {} must be >= 0, not {}".format(name, cost))
+
+        if memory < 0:
+            raise ValueError("The memory for task {} must be >= 0, not {}".format(name, memory))
+
+        if threads < 1:
+            raise ValueError("The threads for task {} must be >= 1, not {}".format(name, threads))
+
         if self._seen(name):
             raise ValueError("Task {} has already been added to this runner".format(name))
 
@@ -124,8 +344,10 @@ class TaskRunner:
         except pickle.PicklingError:
             raise ValueError("Internal error: unable to serialize arguments for task={}".format(name))
 
-        self._torun[name] = (name, preconditions, func, args, kwargs)
-        self._names.add(name)
+        files = (tuple(inputs or ()), tuple(outputs or ()))
+        self._add(name, preconditions,
+                  (name, preconditions, func, args, kwargs), cost,
+                  resources=(memory, threads), files=files)
         v3("TaskRunner: task {} has been added to the queue.".format(name))
 
     def add_barrier(self, name, preconditions, msg=None):
@@ -158,10 +380,10 @@ class TaskRunner:
         except pickle.PicklingError:
             raise ValueError("Internal error: unable to serialize arguments for task={}".format(name))
 
-        self._torun[name] = (name, preconditions, msg)
-        self._names.add(name)
+        self._add(name, preconditions, (name, preconditions, msg), 0)
 
-    def run_tasks(self, processes=None, label=True, context='fork'):
+    def run_tasks(self, processes=None, label=True, context='fork',
+                  memory=None, tracefile=None, journal=None):
         """Run the tasks, waiting until all the tasks have finished.
 
         The processes argument
@@ -178,6 +400,30 @@ class TaskRunner:
 
         The context argument decides how, when multiprocessing is
         in use, the multiprocessing is run.
+
+        The memory argument is the number of bytes that can be used
+        by the tasks running at the same time, as given by the memory
+        argument of add_task. If None then the memory available when
+        the tasks are started is used. A task which needs more than
+        this amount is only run when no other task is running.
+
+        The execution record of each task is available from the
+        get_trace method once the tasks have finished (or failed).
+        If tracefile is set, or the CIAO_TASKRUNNER_TRACE environment
+        variable is set, the records are written to that file - see
+        write_trace - when the run ends.
+
+        If journal is set, or the CIAO_TASKRUNNER_JOURNAL environment
+        variable is set, then each completed task, and its outputs, are
+        added to this file. Tasks that were completed in a previous run
+        using the journal are skipped, unless one of the tasks they
+        depend on has to be run or their outputs are missing or older
+        than their inputs (tasks whose outputs are missing are also run
+        when a task that depends on them has to be run). Tasks which
+        did not declare any outputs are always run. A task is identified
+        by its name, function, arguments, and declared files (see
+        task_signature), so that tasks with the same name from different
+        runners sharing the journal are not confused.
         """
 
         if len(self._torun) == 0:
@@ -188,25 +434,184 @@ class TaskRunner:
         else:
             f = v2
 
+        if tracefile is None:
+            tracefile = os.environ.get("CIAO_TASKRUNNER_TRACE")
+
+        if journal is None:
+            journal = os.environ.get("CIAO_TASKRUNNER_JOURNAL")
+
         processes = get_nproc(processes)
-        if processes == 1:
-            f("Running tasks in serial.")
-            self._run_serial()
+        self._trace = []
+        if journal:
+            self._journal = TaskJournal(journal)
+            self._keys = self._get_task_keys()
+            self._skip = self._find_completed_tasks(self._journal.read())
+            if len(self._skip) > 0:
+                f("Skipping {} of {} tasks completed in a previous run.".format(len(self._skip), len(self._torun)))
         else:
-            f("Running tasks in parallel with {} processors.".format(processes))
-            self._run_parallel(processes, context=context)
+            self._journal = None
+            self._keys = {}
+            self._skip = set()
+
+        try:
+            if processes == 1:
+                f("Running tasks in serial.")
+                self._run_serial()
+            else:
+                f("Running tasks in parallel with {} processors.".format(processes))
+                if memory is None and \
+                   any(r[0] > 0 for r in self._resources.values()):
+                    memory = get_available_memory()
+
+                if memory is not None:
+                    v2("Limiting the memory use of the tasks to {:.1f} GB.".format(memory / 1024**3))
+
+                self._run_parallel(processes, context=context, memory=memory)
+
+        finally:
+            for line in summarize_trace(self._trace, processes):
+                v2(line)
+
+            if tracefile:
+                self.write_trace(tracefile)
 
         self._clean()
 
-    def _run_parallel(self, processes, context='fork'):
-        "Run the tasks in parallel"
+    def get_trace(self):
+        """Return the TaskRecord of each task in the last run.
+
+        The records are in the order the tasks finished; barriers
+        are not included.
+        """
+
+        return list(self._trace)
+
+    def _get_task_keys(self):
+        """Return the journal key of each task."""
+
+        return {name: hash_text(task_signature(name, info, self._files[name]))
+                for (name, info) in self._torun.items()}
+
+    def _find_completed_tasks(self, completed):
+        """Return the names of the tasks which do not need to be run.
+
+        The completed argument is the set of task keys from the journal.
+        """
+
+        order = list(self._torun)
+
+        def outputs_ok(name):
+            (inputs, outputs) = self._files[name]
+            try:
+                otimes = [os.stat(o).st_mtime for o in outputs]
+            except OSError:
+                return False
+
+            if len(otimes) == 0:
+                return True
+
+            itimes = []
+            for i in inputs:
+                try:
+                    itimes.append(os.stat(i).st_mtime)
+                except OSError:
+                    pass
+
+            return len(itimes) == 0 or min(otimes) >= max(itimes)
+
+        def outputs_exist(name):
+            return all(os.path.exists(o) for o in self._files[name][1])
+
+        torun = set()
+        for name in order:
+            if self._keys[name] not in completed:
+                torun.add(name)
+                continue
+
+            # Are the outputs stale (rather than missing)?
+            if outputs_exist(name) and not outputs_ok(name):
+                torun.add(name)
+
+        def needed(name):
+            """Does a task which is being run need the outputs of name?"""
+
+            if any(d in torun for d in self._dependents.get(name, [])):
+                return True
+
+            outputs = set(os.path.abspath(o) for o in self._files[name][1])
+            return any(os.path.abspath(i) in outputs
+                       for d in torun for i in self._files[d][0])
+
+        # Running a task means that the tasks that depend on it have to
+        # be run, and tasks with missing outputs have to be run if a task
+        # that depends on them, or uses their outputs, is run. Iterate
+        # until nothing changes.
+        #
+        changed = True
+        while changed:
+            changed = False
+            for name in order:
+                if name in torun:
+                    continue
+
+                if any(p in torun for p in self._torun[name][1]):
+                    torun.add(name)
+                    changed = True
+
+            for name in reversed(order):
+                # this is True for tasks with no outputs
+                if name in torun or outputs_exist(name):
+                    continue
+
+                if needed(name):
+                    torun.add(name)
+                    changed = True
+
+        # Tasks with no outputs can not be checked, so they are always
+        # run, but this does not mean the tasks which depend on them
+        # have to be run.
+        #
+        return set(name for name in order
+                   if name not in torun and len(self._files[name][1]) > 0)
+
+    def _completed(self, name):
+        """Record that the task has completed."""
+
+        if self._journal is not None:
+            self._journal.add(self._keys[name], name, self._files[name][1])
+
+    def write_trace(self, filename, format=None):
+        """Write the task records of the last run to a file.
+
+        The format is either "chrome", which writes the Chrome
+        trace-event JSON format (which can be viewed with
+        chrome://tracing or https://ui.perfetto.dev/), or "csv".
+        If format is None then "csv" is used if filename ends in
+        ".csv", otherwise "chrome".
+        """
+
+        if format is None:
+            format = "csv" if filename.lower().endswith(".csv") else "chrome"
+
+        if format == "chrome":
+            write_chrome_trace(filename, self._trace)
+        elif format == "csv":
+            write_csv_trace(filename, self._trace)
+        else:
+            raise ValueError("Unknown trace format: {}".format(format))
+
+        v3("TaskRunner: written trace to {}".format(filename))
+
+    def _run_parallel(self, processes, context='fork', memory=None):
+        """Run the tasks in parallel.
+
+        The processors and memory (if not None) arguments limit the
+        resources used by the tasks running at the same time.
+        """
 
         stime = time.localtime()
         v4("TaskRunner (parallel, processes={}): started {}".format(processes, time.asctime(stime)))
 
-        ntasks = len(self._torun)
-        finished = set()
-
         ctx = multiprocessing.get_context(context)
 
         class TaskHandler(ctx.Process):
@@ -217,10 +622,11 @@ class TaskRunner:
             Does this need to be derived from ctx.Process>
             """
 
-            def __init__(self, task_queue, result_queue):
+            def __init__(self, task_queue, result_queue, worker):
                 ctx.Process.__init__(self)
                 self.task_queue = task_queue
                 self.result_queue = result_queue
+                self.worker = worker
 
             def run(self):
                 """Remove a task from the task queue, call
@@ -242,32 +648,31 @@ class TaskRunner:
                         elif len(taskinfo) == 4:
                             v3("TaskHandler {} running taskinfo={}".format(name, taskinfo))
                             (taskname, func, args, kwargs) = taskinfo
+                            stime = time.time()
                             try:
                                 v3("TaskHandler {} starting task {}".format(name, taskname))
                                 func(*args, **kwargs)
                                 v3("TaskHandler {} finshed task {}".format(name, taskname))
                             except BaseException as be:
                                 v3("TaskHandler {} task {} - caught exception {}/{}".format(name, taskname, type(be), be))
+                                record = make_record(taskname, self.worker,
+                                                     stime, "failed")
                                 self.task_queue.task_done()
-                                self.result_queue.put((True, be))
+                                self.result_queue.put((True, be, record))
                                 break
 
-                        elif len(taskinfo) == 2:
-                            v3("TaskHandler {} sent barrier: {}".format(name, taskinfo))
-                            (taskname, taskmsg) = taskinfo
-                            if taskmsg is not None:
-                                v1(taskmsg)
-
                         else:
                             v3("TaskHandler {} sent invalid taskinfo={}".format(name, taskinfo))
                             self.task_queue.task_done()
                             self.result_queue.put((True,
-                                                   ValueError("Task queue argument: {}".format(taskinfo))))
+                                                   ValueError("Task queue argument: {}".format(taskinfo)),
+                                                   None))
                             break
 
                         v3("TaskHandler {} reporting that task={} is finished.".format(name, taskname))
+                        record = make_record(taskname, self.worker, stime, "ok")
                         self.task_queue.task_done()
-                        self.result_queue.put((False, taskname))
+                        self.result_queue.put((False, taskname, record))
 
                 except BaseException as be:
                     # This was added whilst tracking down an error with send/receive
@@ -278,39 +683,26 @@ class TaskRunner:
                     # as I no idea what the state is here.
                     #
                     v3("TaskHandler {} - caught exception {}/{}".format(name, type(be), be))
-                    self.result_queue.put((True, be))  # possibly excessive
+                    self.result_queue.put((True, be, None))  # possibly excessive
 
                 v3("TaskHandler {} exiting.".format(name))
 
         queue = ctx.Queue()
         task_queue = ctx.JoinableQueue()
 
-        # what tasks can be run now?
-        deltasks = []
-        for v in self._torun.values():
-            name = v[0]
-            preconditions = v[1]
-            if len(preconditions) > 0:
-                continue
-
-            deltasks.append(name)
-            if len(v) == 3:
-                v3("TaskRunner: selected barrier {}".format(name))
-                taskarg = (name, v[2])
-            elif len(v) == 5:
-                v3("TaskRunner: selected task {}".format(name))
-                taskarg = (name, v[2], v[3], v[4])
-            else:
-                raise ValueError("Internal error: task info = {}".format(v))
-
-            task_queue.put(taskarg)
-
-        if len(deltasks) == 0:
+        # Tasks are only sent to the workers when they fit within
+        # the resource limits - which means at most processes tasks
+        # at a time - so that the task with the highest priority is
+        # chosen when a worker becomes free.
+        #
+        scheduler = TaskScheduler(self._torun, self._dependents,
+                                  self._costs,
+                                  resources=self._resources,
+                                  memory=memory, threads=processes)
+        nrunning = self._send_tasks(scheduler, task_queue)
+        if nrunning == 0 and not scheduler.finished:
             raise ValueError("Unable to start since all the tasks have at least one precondition")
 
-        for deltask in deltasks:
-            del self._torun[deltask]
-
         # If this process is starved of time then it may not
         # add a task to a queue, even if a process is idle.
         #
@@ -320,7 +712,7 @@ class TaskRunner:
         # a good idea anyway.
         #
         v4("TaskRunner (parallel, processes={}): starting workers".format(processes))
-        workers = [TaskHandler(task_queue, queue)
+        workers = [TaskHandler(task_queue, queue, i + 1)
                    for i in range(processes)]
 
         for w in workers:
@@ -331,8 +723,14 @@ class TaskRunner:
         # the jobs have ended close down the workers.
         #
         v4("TaskRunner (parallel, processes={}): waiting for jobs".format(processes))
-        while True:
-            (errflag, taskout) = queue.get()
+        while not scheduler.finished:
+            if nrunning == 0:
+                raise ValueError("Unable to find any task to run from {}".format(self._torun))
+
+            (errflag, taskout, record) = queue.get()
+            nrunning -= 1
+            if record is not None:
+                self._trace.append(record)
 
             if errflag:
                 # Should we try to kill the other tasks?
@@ -358,45 +756,15 @@ class TaskRunner:
                 raise taskout
 
             v4("TaskRunner: received result from task {}".format(taskout))
-
-            # Can we stop the workers?
-            finished.add(taskout)
-            if len(finished) == ntasks:
-                v4("TaskRunner: all tasks completed; stopping.")
-                for i in range(processes):
-                    task_queue.put(None)
-
-                break
+            scheduler.done(taskout)
+            self._completed(taskout)
 
             # Can we run any new tasks?
-            deltasks = []
-            for v in self._torun.values():
-                name = v[0]
-                preconditions = v[1]
-                flag = True
-                for pname in preconditions:
-                    if pname not in finished:
-                        flag = False
-                        break
-
-                if not flag:
-                    continue
-
-                deltasks.append(name)
+            nrunning += self._send_tasks(scheduler, task_queue)
 
-                if len(v) == 3:
-                    v3("TaskRunner: selected barrier {}".format(name))
-                    taskarg = (name, v[2])
-                elif len(v) == 5:
-                    v3("TaskRunner: selected task {}".format(name))
-                    taskarg = (name, v[2], v[3], v[4])
-                else:
-                    raise ValueError("Internal error: task info = {}".format(v))
-
-                task_queue.put(taskarg)
-
-            for deltask in deltasks:
-                del self._torun[deltask]
+        v4("TaskRunner: all tasks completed; stopping.")
+        for i in range(processes):
+            task_queue.put(None)
 
         # Wait for everything to finish.
         #
@@ -410,53 +778,301 @@ class TaskRunner:
         etime = time.localtime()
         v4("TaskRunner (parallel, processes={}): stopped {}".format(processes, time.asctime(etime)))
 
+    def _send_tasks(self, scheduler, task_queue):
+        """Send the ready tasks that fit within the resource limits
+        to the task queue.
+
+        Barriers are handled here, rather than being sent to the
+        workers. Returns the number of tasks that were sent.
+        """
+
+        nsent = 0
+        while True:
+            name = scheduler.pop()
+            if name is None:
+                break
+
+            if name in self._skip:
+                v3("TaskRunner: skipping completed task {}".format(name))
+                scheduler.done(name)
+                continue
+
+            v = self._torun[name]
+            if len(v) == 3:
+                v3("TaskRunner: running barrier {}".format(name))
+                if v[2] is not None:
+                    v1(v[2])
+
+                scheduler.done(name)
+                self._completed(name)
+                continue
+
+            if len(v) != 5:
+                raise ValueError("Internal error: task info = {}".format(v))
+
+            v3("TaskRunner: selected task {}".format(name))
+            task_queue.put((name, v[2], v[3], v[4]))
+            nsent += 1
+
+        return nsent
+
     def _run_serial(self):
         "Run the tasks in serial"
 
         stime = time.localtime()
         v4("TaskRunner (serial): started {}".format(time.asctime(stime)))
 
-        ntasks = len(self._torun)
-        finished = set()
+        # The tasks are run in the order they were added, as long as
+        # their preconditions have been met.
+        #
+        scheduler = TaskScheduler(self._torun, self._dependents,
+                                  self._costs, priority=False)
+        while not scheduler.finished:
+            name = scheduler.pop()
+            if name is None:
+                raise ValueError("Unable to find any task to run from {}".format(self._torun))
 
-        while len(finished) < ntasks:
+            if name in self._skip:
+                v3("TaskRunner (serial): skipping completed task {}".format(name))
+                scheduler.done(name)
+                continue
 
-            deltask = None
-            for v in self._torun.values():
-                name = v[0]
-                preconditions = v[1]
-                flag = True
-                for pname in preconditions:
-                    if pname not in finished:
-                        flag = False
-                        break
+            v = self._torun[name]
+            if len(v) == 3:
+                v3("TaskRunner (serial): running barrier {}".format(name))
+                if v[2] is not None:
+                    v1(v[2])
 
-                if not flag:
-                    continue
+            elif len(v) == 5:
+                v3("TaskRunner (serial): running task {}".format(name))
+                stime = time.time()
+                try:
+                    v[2](*v[3], **v[4])
+                except BaseException:
+                    self._trace.append(make_record(name, 0, stime, "failed"))
+                    raise
 
-                if len(v) == 3:
-                    v3("TaskRunner (serial): running barrier {}".format(name))
-                    if v[2] is not None:
-                        v1(v[2])
+                self._trace.append(make_record(name, 0, stime, "ok"))
 
-                elif len(v) == 5:
-                    v3("TaskRunner (serial): running task {}".format(name))
-                    v[2](*v[3], **v[4])
+            else:
+                raise ValueError("Internal error: task info={}".format(v))
+
+            scheduler.done(name)
+            self._completed(name)
+
+        etime = time.localtime()
+        v4("TaskRunner (serial): stopped {}".format(time.asctime(etime)))
+
+
+class TaskScheduler:
+    """Track which tasks can be run.
+
+    The tasks argument is the dictionary of tasks of a TaskRunner,
+    keyed by name, where the second element of each value is the
+    list of preconditions. Since the preconditions of a task must
+    be added to the runner before the task, the order of the
+    dictionary is a valid order to run the tasks. The dependents
+    argument gives the names of the tasks that list each task as a
+    precondition, and costs gives the cost of each task.
+
+    If priority is True then the ready task with the largest cost
+    to finish - that is, its cost plus the largest cost of the
+    tasks which depend on it - is returned first, and ties are
+    broken by the order the tasks were added. When priority is
+    False the tasks are returned in the order they were added.
+
+    The resources argument gives the (memory, threads) used by each
+    task, and a task is only returned when the total for the running
+    tasks - those returned by pop which have not been marked as done
+    - would not exceed the memory and threads limits (when not None).
+    A ready task which does not fit is skipped over in favor of one
+    that does, but a task is always returned if no task is running.
+    """
+
+    def __init__(self, tasks, dependents, costs, priority=True,
+                 resources=None, memory=None, threads=None):
+
+        self._names = list(tasks)
+        self._dependents = dependents
+        self._order = {name: idx for idx, name in enumerate(self._names)}
+        self._waiting = {name: len(set(v[1])) for name, v in tasks.items()}
+
+        # Process the tasks so that a task is only seen once all its
+        # dependents have been.
+        #
+        self._priority = {}
+        if priority:
+            for name in reversed(self._names):
+                rest = [self._priority[d] for d in dependents.get(name, [])]
+                self._priority[name] = costs.get(name, 1) + max(rest, default=0)
+
+        self._ready = []
+        for name in self._names:
+            if self._waiting[name] == 0:
+                self._push(name)
+
+        self._ndone = 0
+
+        self._resources = {} if resources is None else resources
+        self._limits = (memory, threads)
+        self._running = {}
+        self._used = [0, 0]
+
+    def _push(self, name):
+        idx = self._order[name]
+        heapq.heappush(self._ready, (-self._priority.get(name, 0), idx))
+
+    @property
+    def finished(self):
+        """Have all the tasks been run?"""
+        return self._ndone == len(self._names)
+
+    def priority(self, name):
+        """The cost of the longest chain of tasks starting at name.
+
+        This is 0 when the scheduler was created with priority=False.
+        """
+        return self._priority.get(name, 0)
+
+    def _fits(self, name):
+        """Can the task be run with the current resource use?"""
+
+        if len(self._running) == 0:
+            return True
+
+        needed = self._resources.get(name, (0, 1))
+        for (limit, used, need) in zip(self._limits, self._used, needed):
+            if limit is not None and used + need > limit:
+                return False
+
+        return True
 
-                else:
-                    raise ValueError("Internal error: task info={}".format(v))
+    def pop(self):
+        """Return the next task to run, or None if no task is ready
+        or no ready task fits within the resource limits."""
 
-                deltask = name
+        skipped = []
+        name = None
+        while len(self._ready) > 0:
+            item = heapq.heappop(self._ready)
+            candidate = self._names[item[1]]
+            if self._fits(candidate):
+                name = candidate
                 break
 
-            if deltask is None:
-                raise ValueError("Unable to find any task to run from {}".format(self._torun))
+            skipped.append(item)
 
-            finished.add(deltask)
-            del self._torun[deltask]
+        for item in skipped:
+            heapq.heappush(self._ready, item)
 
-        etime = time.localtime()
-        v4("TaskRunner (serial): stopped {}".format(time.asctime(etime)))
+        if name is None:
+            return None
+
+        needed = self._resources.get(name, (0, 1))
+        self._running[name] = needed
+        self._used = [used + need for (used, need) in zip(self._used, needed)]
+        return name
+
+    def done(self, name):
+        """The task has finished, so its dependents may now be ready."""
+
+        needed = self._running.pop(name)
+        self._used = [used - need for (used, need) in zip(self._used, needed)]
+
+        self._ndone += 1
+        for dname in self._dependents.get(name, []):
+            self._waiting[dname] -= 1
+            if self._waiting[dname] == 0:
+                self._push(dname)
+
+
+def summarize_trace(records, processes, ntop=5):
+    """Return a summary of the task records as a list of lines.
+
+    The parallel efficiency is the time spent running tasks divided
+    by the elapsed time multiplied by the number of processes.
+    """
+
+    if len(records) == 0:
+        return []
+
+    stime = min(r.start for r in records)
+    etime = max(r.end for r in records)
+    elapsed = etime - stime
+    busy = sum(r.end - r.start for r in records)
+    if elapsed > 0:
+        efficiency = 100 * busy / (elapsed * processes)
+    else:
+        efficiency = 100
+
+    out = ["TaskRunner: ran {} tasks in {:.1f} s".format(len(records), elapsed),
+           "TaskRunner: total busy time {:.1f} s, parallel efficiency {:.0f}% with {} processes".format(busy, efficiency, processes)]
+
+    slowest = sorted(records, key=lambda r: r.start - r.end)[:ntop]
+    out.append("TaskRunner: slowest tasks")
+    for r in slowest:
+        out.append("  {:8.1f} s  {}  [{}]".format(r.end - r.start, r.name, r.status))
+
+    return out
+
+
+def write_chrome_trace(filename, records):
+    """Write the task records in the Chrome trace-event format.
+
+    Each task is a complete event, with the worker as the thread,
+    and the times are relative to the start of the first task.
+    """
+
+    if len(records) == 0:
+        t0 = 0
+    else:
+        t0 = min(r.start for r in records)
+
+    events = []
+    for r in records:
+        events.append({"name": str(r.name),
+                       "cat": "task",
+                       "ph": "X",
+                       "ts": int((r.start - t0) * 1e6),
+                       "dur": int((r.end - r.start) * 1e6),
+                       "pid": 1,
+                       "tid": r.worker,
+                       "args": {"status": r.status,
+                                "peakrss": r.peakrss}})
+
+    with open(filename, "w") as fh:
+        json.dump({"traceEvents": events,
+                   "displayTimeUnit": "ms"}, fh)
+
+
+def write_csv_trace(filename, records):
+    """Write the task records as a CSV file."""
+
+    with open(filename, "w", newline="") as fh:
+        out = csv.writer(fh)
+        out.writerow(["name", "worker", "start", "end", "duration",
+                      "status", "peakrss"])
+        for r in records:
+            out.writerow([r.name, r.worker, "{:.6f}".format(r.start),
+                          "{:.6f}".format(r.end),
+                          "{:.6f}".format(r.end - r.start),
+                          r.status, r.peakrss])
+
+
+def get_available_memory():
+    """Return the memory available for new processes, in bytes.
+
+    This uses psutil if available, otherwise the number of free
+    pages reported by the system, which under-estimates the value
+    since it excludes memory used for caches.
+    """
+
+    try:
+        from psutil import virtual_memory
+    except ImportError:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+
+    return virtual_memory().available
 
 
 def get_nproc(nproc=None):
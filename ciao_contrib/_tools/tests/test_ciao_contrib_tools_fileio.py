@@ -0,0 +1,287 @@
+"""Check ciao_contrib._tools.fileio"""
+
+import numpy as np
+
+import pytest
+
+from ciao_contrib._tools import fileio
+
+
+def card(key, value):
+    if isinstance(value, str):
+        value = f"'{value:8s}'"
+    elif isinstance(value, bool):
+        value = 'T' if value else 'F'
+
+    return f"{key:8s}= {value:>20}".ljust(80)
+
+
+def make_hdu(vals, primary=True, extname=None, keys=None):
+    """Create a FITS HDU for the 2D array."""
+
+    bitpix = {np.dtype('>i2'): 16,
+              np.dtype('>i4'): 32,
+              np.dtype('>i8'): 64,
+              np.dtype('>f4'): -32,
+              np.dtype('>f8'): -64}[vals.dtype]
+
+    if primary:
+        cards = [card('SIMPLE', True)]
+    else:
+        cards = [card('XTENSION', 'IMAGE')]
+
+    cards += [card('BITPIX', bitpix),
+              card('NAXIS', 2),
+              card('NAXIS1', vals.shape[1]),
+              card('NAXIS2', vals.shape[0])]
+    if not primary:
+        cards += [card('PCOUNT', 0), card('GCOUNT', 1)]
+
+    if extname is not None:
+        cards.append(card('EXTNAME', extname))
+
+    for k, v in (keys or {}).items():
+        cards.append(card(k, v))
+
+    cards.append('END'.ljust(80))
+    hdr = ''.join(cards).encode('ascii')
+    hdr += b' ' * (-len(hdr) % 2880)
+
+    data = vals.tobytes()
+    data += b'\0' * (-len(data) % 2880)
+    return hdr + data
+
+
+def empty_primary():
+    cards = [card('SIMPLE', True), card('BITPIX', 8), card('NAXIS', 0),
+             'END'.ljust(80)]
+    hdr = ''.join(cards).encode('ascii')
+    return hdr + b' ' * (-len(hdr) % 2880)
+
+
+@pytest.mark.parametrize("dtype", ['>i2', '>i4', '>f4', '>f8'])
+@pytest.mark.parametrize("nrows", [1, 3, 10])
+def test_image_strips_memmap(dtype, nrows, tmp_path):
+
+    vals = (np.arange(7 * 5).reshape(7, 5) - 10).astype(dtype)
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(vals))
+
+    img = fileio.ImageStrips(str(infile))
+    assert img.shape == (7, 5)
+    assert img.dtype == np.dtype(dtype).newbyteorder('=')
+
+    starts = []
+    got = []
+    for start, strip in img.strips(nrows):
+        starts.append(start)
+        got.append(strip)
+
+    assert starts == list(range(0, 7, nrows))
+    assert np.array_equal(np.concatenate(got), vals)
+    img.close()
+
+
+def test_image_strips_block_name(tmp_path):
+
+    vals1 = np.ones((2, 3), dtype='>f4')
+    vals2 = np.arange(6, dtype='>f4').reshape(3, 2)
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(empty_primary() +
+                       make_hdu(vals1, primary=False, extname='OTHER') +
+                       make_hdu(vals2, primary=False, extname='EXPMAP'))
+
+    img = fileio.ImageStrips(f"{infile}[expmap]")
+    assert img.shape == (3, 2)
+    assert np.array_equal(next(img.strips(10))[1], vals2)
+
+
+def test_image_strips_unsigned(tmp_path):
+
+    expected = np.asarray([[0, 1], [40000, 65535]], dtype=np.uint16)
+    stored = (expected.astype(np.int32) - 32768).astype('>i2')
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(stored, keys={'BSCALE': 1, 'BZERO': 32768}))
+
+    img = fileio.ImageStrips(str(infile))
+    assert img.dtype == np.dtype(np.uint16)
+    assert np.array_equal(next(img.strips(10))[1], expected)
+
+
+def test_image_strips_unsigned_64(tmp_path):
+    """BITPIX=64 images with BZERO=2^63 are read as unsigned"""
+
+    expected = np.asarray([[0, 1], [2**63, 2**64 - 1]], dtype=np.uint64)
+    stored = (expected ^ np.uint64(2**63)).view(np.int64).astype('>i8')
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(stored, keys={'BSCALE': 1,
+                                              'BZERO': 9223372036854775808}))
+
+    img = fileio.ImageStrips(str(infile))
+    assert img.dtype == np.dtype(np.uint64)
+    assert np.array_equal(next(img.strips(10))[1], expected)
+
+
+@pytest.mark.parametrize("suffix,keys",
+                         [("[sky=circle(1,1,1)]", None),
+                          ("", {'BSCALE': 2.0}),
+                          ("", {'BLANK': -1})])
+def test_image_strips_not_memmapped(suffix, keys, tmp_path):
+    """These cases are left to the DataModel"""
+
+    vals = np.ones((2, 3), dtype='>i4')
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(vals, keys=keys))
+
+    assert fileio._open_fits_image_memmap(f"{infile}{suffix}") is None
+
+
+def test_memmap_image_update(tmp_path):
+
+    vals = np.zeros((4, 3), dtype='>f4')
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(empty_primary() +
+                       make_hdu(vals, primary=False, extname='PSFMAP'))
+
+    mmap = fileio.memmap_image(f"{infile}[PSFMAP]", mode='r+')
+    mmap[1:3] = [[1, 2, 3], [4, 5, 6]]
+    mmap.flush()
+    del mmap
+
+    img = fileio.ImageStrips(f"{infile}[PSFMAP]")
+    assert img.read_rows(1, 2).tolist() == [[1, 2, 3], [4, 5, 6]]
+    assert img.read_rows(3, 10).tolist() == [[0, 0, 0]]
+
+
+def test_memmap_image_checksum(tmp_path):
+    """Do not change an image with a checksum"""
+
+    vals = np.zeros((4, 3), dtype='>f4')
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(vals, keys={'DATASUM': '0'}))
+
+    assert fileio.memmap_image(str(infile)) is not None
+    assert fileio.memmap_image(str(infile), mode='r+') is None
+
+
+def test_create_image(tmp_path):
+    """The header is copied but the checksums and scaling are not"""
+
+    vals = np.arange(12, dtype='>i2').reshape(4, 3)
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(empty_primary() +
+                       make_hdu(vals, primary=False, extname='EXPMAP',
+                                keys={'BZERO': 0, 'CHECKSUM': 'abc',
+                                      'DATASUM': '0', 'EXPOSURE': 20.5,
+                                      'OBJECT': 'M31', 'DELETEME': 2}))
+
+    outfile = tmp_path / 'out.fits'
+    keys = {'EXPOSURE': 100.0, 'DELETEME': None, 'NEWKEY': 'new'}
+    assert fileio.create_image(f"{infile}[expmap]", f"{outfile}[PSFMAP]",
+                               keys=keys)
+
+    with open(outfile, 'rb') as fh:
+        hdr = fileio._read_fits_header(fh)
+
+    assert hdr == {'SIMPLE': 'T', 'BITPIX': -32, 'NAXIS': 2,
+                   'NAXIS1': 3, 'NAXIS2': 4, 'EXTNAME': 'PSFMAP',
+                   'EXPOSURE': 100.0, 'OBJECT': 'M31', 'NEWKEY': 'new'}
+
+    mmap = fileio.memmap_image(f"{outfile}[PSFMAP]", mode='r+')
+    assert mmap.dtype == np.dtype('>f4')
+    assert mmap.shape == (4, 3)
+    assert (mmap == 0).all()
+    assert outfile.stat().st_size % 2880 == 0
+
+
+@pytest.mark.parametrize("val,expected",
+                         [("'M31     '", "M31"),
+                          ("'M31' / the object", "M31"),
+                          ("'O''Brien '", "O'Brien"),
+                          ("'''' / a quote", "'"),
+                          ("'a''b''c' / x'y", "a'b'c"),
+                          ("''", ""),
+                          ("'no end", "no end")])
+def test_parse_fits_string(val, expected):
+    assert fileio._parse_fits_string(val) == expected
+
+
+def test_read_fits_header_quoted_extname(tmp_path):
+    """An escaped quote in EXTNAME does not stop the block matching"""
+
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(empty_primary() +
+                       make_hdu(np.ones((2, 2), dtype='>f4'),
+                                primary=False, extname="A''B",
+                                keys={'OBJECT': "Barnard''s star"}) +
+                       make_hdu(np.ones((3, 2), dtype='>f4'),
+                                primary=False, extname='EXPMAP'))
+
+    with open(infile, 'rb') as fh:
+        fileio._read_fits_header(fh)
+        hdr = fileio._read_fits_header(fh)
+
+    assert hdr['EXTNAME'] == "A'B"
+    assert hdr['OBJECT'] == "Barnard's star"
+    assert fileio.memmap_image(f"{infile}[expmap]").shape == (3, 2)
+
+
+@pytest.mark.parametrize("dtype,bitpix",
+                         [(np.int16, 16), (np.int32, 32), (np.int64, 64),
+                          ('>f4', -32), (np.float64, -64)])
+def test_create_image_dtype(dtype, bitpix, tmp_path):
+
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(np.ones((3, 2), dtype='>f4')))
+
+    outfile = tmp_path / 'out.fits'
+    assert fileio.create_image(str(infile), str(outfile), dtype=dtype)
+
+    with open(outfile, 'rb') as fh:
+        assert fileio._read_fits_header(fh)['BITPIX'] == bitpix
+
+    mmap = fileio.memmap_image(str(outfile))
+    assert mmap.dtype == np.dtype(dtype).newbyteorder('>')
+    assert mmap.shape == (3, 2)
+    assert (mmap == 0).all()
+
+
+def test_create_image_unsupported_dtype(tmp_path):
+    """Types which FITS stores with BZERO are not supported"""
+
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(np.ones((3, 2), dtype='>f4')))
+
+    outfile = tmp_path / 'out.fits'
+    assert not fileio.create_image(str(infile), str(outfile),
+                                   dtype=np.uint16)
+    assert not outfile.exists()
+
+
+def test_create_image_clobber(tmp_path):
+
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(np.ones((2, 2), dtype='>f4')))
+
+    outfile = tmp_path / 'out.fits'
+    outfile.write_text('x')
+    with pytest.raises(IOError):
+        fileio.create_image(str(infile), str(outfile))
+
+    assert outfile.read_text() == 'x'
+    assert fileio.create_image(str(infile), str(outfile), clobber=True)
+    assert fileio.memmap_image(str(outfile)).shape == (2, 2)
+
+
+@pytest.mark.parametrize("keys", [{'LONGKEYNAME': 1},
+                                  {'OBJECT': 'x' * 80},
+                                  {'EXPOSURE': np.nan}])
+def test_create_image_unsupported_key(keys, tmp_path):
+    """No file is created if a key can not be written"""
+
+    infile = tmp_path / 'img.fits'
+    infile.write_bytes(make_hdu(np.ones((2, 2), dtype='>f4')))
+
+    outfile = tmp_path / 'out.fits'
+    assert not fileio.create_image(str(infile), str(outfile), keys=keys)
+    assert not outfile.exists()
@@ -0,0 +1,256 @@
+"""Check ciao_contrib._tools.memprofile"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+import pytest
+
+from ciao_contrib._tools import memprofile
+
+
+def default_memory(filesize, nimages):
+    return 100 * filesize
+
+
+def add_observations(profile, step, vals):
+    for (filesize, nimages, maxrss) in vals:
+        profile.record(step, filesize, nimages, maxrss)
+
+
+def test_profile_read_write(tmp_path):
+
+    filename = tmp_path / 'profile'
+    profile = memprofile.MemoryProfile(str(filename))
+    assert profile.read() == []
+
+    profile.record('mkexpmap', 4000, 1, 2e6)
+    profile.record('mkpsfmap', 8000, 4, 3e6)
+
+    # partial lines and unknown steps are skipped
+    with open(filename, 'a') as fh:
+        fh.write('{"step": "unknown", "filesize": 1, "nimages": 1, "maxrss": 1}\n')
+        fh.write('{"step": "mkexpmap", "files')
+
+    assert profile.observations('mkexpmap') == [('mkexpmap', 4000, 1, 2000000)]
+    assert profile.observations('mkpsfmap') == [('mkpsfmap', 8000, 4, 3000000)]
+    assert profile.observations('stack_counts') == []
+
+
+def test_profile_record_unknown_step(tmp_path):
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    with pytest.raises(ValueError) as ve:
+        profile.record('mkinstmap', 4000, 1, 2e6)
+
+    assert str(ve.value) == "Unknown step 'mkinstmap'"
+
+
+def test_model_needs_observations(tmp_path):
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    add_observations(profile, 'mkexpmap', [(1000, 1, 5e6), (2000, 1, 6e6)])
+    model = memprofile.get_model('mkexpmap', default_memory, profile)
+    assert not model.fitted
+    assert model(1000, 1) == 100000
+
+
+def test_model_fit(tmp_path):
+    """The model is fitted, and uses the number of images"""
+
+    def memory(filesize, nimages):
+        return 2e7 + filesize * (3 + 0.5 * nimages)
+
+    vals = [(f, n, memory(f, n)) for f in [1e6, 4e6, 9e6] for n in [1, 4]]
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    add_observations(profile, 'stack_psfmap', vals)
+
+    model = memprofile.get_model('stack_psfmap', default_memory, profile)
+    assert model.fitted
+    assert model.nobs == 6
+    assert model.coeffs == pytest.approx([2e7, 3, 0.5])
+    assert model.nimages is None
+    assert not model.uses_default(100)
+    assert model(2e7, 100) == pytest.approx(memory(2e7, 100), rel=1e-6)
+
+
+def test_model_covers_observations(tmp_path):
+
+    vals = [(1e6, 2, 1e7), (2e6, 2, 2.6e7), (3e6, 2, 2.9e7), (4e6, 2, 4e7)]
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    add_observations(profile, 'mkpsfmap', vals)
+
+    model = memprofile.get_model('mkpsfmap', default_memory, profile)
+    assert model.fitted
+    assert model.nimages == {2}
+    for (filesize, nimages, maxrss) in vals:
+        assert model(filesize, nimages) >= maxrss
+
+    # the fit does not include the number of images
+    assert model.uses_default(3)
+    assert model(1e6, 3) == 1e8
+
+
+def test_model_ignores_nimages(tmp_path):
+    """Summing the counts images does not depend on the number of images"""
+
+    vals = [(f, n, 1e7 + 3 * f) for f in [1e6, 4e6, 9e6] for n in [2, 40]]
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    add_observations(profile, 'stack_counts', vals)
+
+    model = memprofile.get_model('stack_counts', default_memory, profile)
+    assert model.fitted
+    assert model.coeffs == pytest.approx([1e7, 3, 0])
+    assert model.nimages is None
+    assert not model.uses_default(500)
+    assert model(2e7, 500) == pytest.approx(1e7 + 6e7, rel=1e-6)
+    assert 'nimages' not in model.describe()
+
+
+def test_model_uses_recent_observations(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(memprofile, 'MAX_OBSERVATIONS', 3)
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    add_observations(profile, 'mkexpmap',
+                     [(1e6, 1, 1e9), (1e6, 1, 1e7), (2e6, 1, 2e7), (3e6, 1, 3e7)])
+
+    model = memprofile.get_model('mkexpmap', default_memory, profile)
+    assert model.nobs == 3
+    assert model(4e6, 1) == pytest.approx(4e7)
+
+
+def test_get_model_from_environment(tmp_path, monkeypatch):
+
+    filename = str(tmp_path / 'profile')
+    add_observations(memprofile.MemoryProfile(filename), 'stack_counts',
+                     [(1e6, 10, 2e7), (2e6, 10, 3e7), (3e6, 10, 4e7)])
+
+    monkeypatch.delenv('CIAO_MEMORY_PROFILE', raising=False)
+    assert memprofile.get_profile() is None
+    assert not memprofile.get_model('stack_counts', default_memory).fitted
+
+    monkeypatch.setenv('CIAO_MEMORY_PROFILE', filename)
+    assert memprofile.get_model('stack_counts', default_memory).fitted
+
+
+def test_profile_and_model_are_cached(tmp_path, monkeypatch):
+
+    filename = str(tmp_path / 'profile')
+    monkeypatch.setenv('CIAO_MEMORY_PROFILE', filename)
+    profile = memprofile.get_profile()
+    assert memprofile.get_profile() is profile
+
+    add_observations(profile, 'mkpsfmap',
+                     [(1e6, 2, 2e7), (2e6, 2, 3e7), (3e6, 2, 4e7)])
+    model = memprofile.get_model('mkpsfmap', default_memory)
+    assert model.nobs == 3
+    assert memprofile.get_model('mkpsfmap', default_memory) is model
+
+    # the model is re-fitted when the profile changes
+    profile.record('mkpsfmap', 4e6, 2, 5e7)
+    model = memprofile.get_model('mkpsfmap', default_memory)
+    assert model.nobs == 4
+
+
+def allocate(nbytes):
+    vals = np.ones(nbytes // 8)
+    return vals.sum()
+
+
+def test_run_measured_records_every_run(tmp_path):
+    """Each run is measured in its own process"""
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    nbytes = 256 * 1024**2
+
+    # Make sure this process has a large peak.
+    allocate(2 * nbytes)
+
+    for n in [nbytes, nbytes, 2 * nbytes]:
+        got = memprofile.run_measured('stack_counts', 4000, 3, allocate, n,
+                                      profile=profile)
+        assert got == n // 8
+
+    obs = profile.observations('stack_counts')
+    assert len(obs) == 3
+    assert all(o[:3] == ('stack_counts', 4000, 3) for o in obs)
+    assert all(o.maxrss > nbytes for o in obs)
+    assert obs[2].maxrss > obs[0].maxrss + nbytes // 2
+
+
+def test_run_measured_error(tmp_path):
+    """The error is passed back and nothing is recorded"""
+
+    def fail(nbytes):
+        allocate(nbytes)
+        raise ValueError("the step failed")
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    with pytest.raises(ValueError) as ve:
+        memprofile.run_measured('stack_psfmap', 4000, 3, fail, 1024,
+                                profile=profile)
+
+    assert str(ve.value) == "the step failed"
+    assert profile.read() == []
+
+
+def test_run_measured_without_profile(tmp_path):
+    """There is no need to fork without a profile"""
+
+    def step():
+        return os.getpid()
+
+    assert memprofile.run_measured('stack_counts', 4000, 3, step,
+                                   profile=None) == os.getpid()
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    assert memprofile.run_measured('stack_counts', None, 3, step,
+                                   profile=profile) == os.getpid()
+    assert memprofile.run_measured('stack_counts', 4000, 3, step,
+                                   profile=profile) != os.getpid()
+
+
+@pytest.mark.parametrize("step,func", [("stack_counts", "measure"),
+                                       ("mkexpmap", "run_measured")])
+def test_measure_wrong_step(step, func, tmp_path):
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    with pytest.raises(ValueError):
+        if func == "measure":
+            with memprofile.measure(step, 4000, 1, profile=profile):
+                pass
+        else:
+            memprofile.run_measured(step, 4000, 1, allocate, 8,
+                                    profile=profile)
+
+
+def test_measure_without_filesize(tmp_path):
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    with memprofile.measure('mkexpmap', None, 1, profile=profile):
+        allocate(64 * 1024**2)
+
+    assert profile.read() == []
+
+
+def test_measure_tool_uses_child_process(tmp_path):
+    """The memory use of a tool step is that of the child process"""
+
+    profile = memprofile.MemoryProfile(str(tmp_path / 'profile'))
+    nbytes = 320 * 1024**2
+
+    # Memory used by this process is not included
+    with memprofile.measure('mkexpmap', 4000, 1, profile=profile):
+        allocate(nbytes)
+
+    assert profile.read() == []
+
+    code = f"import numpy as np; np.ones({nbytes // 8}).sum()"
+    with memprofile.measure('mkexpmap', 4000, 1, profile=profile):
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    obs = profile.observations('mkexpmap')
+    assert len(obs) == 1
+    assert obs[0].maxrss > nbytes
@@ -0,0 +1,96 @@
+"""Check ciao_contrib._tools.merging"""
+
+import numpy as np
+
+import pycrates
+import pytest
+
+from ciao_contrib._tools import fileio, merging
+
+
+def write_image(outfile, vals, bzero=0):
+    """Write the 2D array as the primary block of a FITS file."""
+
+    bitpix = {2: 16, 8: 64}[vals.dtype.itemsize]
+    cards = [('SIMPLE', 'T'), ('BITPIX', bitpix), ('NAXIS', 2),
+             ('NAXIS1', vals.shape[1]), ('NAXIS2', vals.shape[0])]
+    if bzero != 0:
+        cards += [('BSCALE', 1), ('BZERO', bzero)]
+
+    hdr = ''.join(f"{k:8s}= {v:>20}".ljust(80) for k, v in cards)
+    hdr = (hdr + 'END'.ljust(80)).encode('ascii')
+    hdr += b' ' * (-len(hdr) % 2880)
+
+    data = vals.tobytes()
+    data += b'\0' * (-len(data) % 2880)
+    outfile.write_bytes(hdr + data)
+
+
+def write_uint64(outfile, vals):
+    """Write the unsigned 64-bit values using BZERO=2^63."""
+
+    stored = (vals ^ np.uint64(2**63)).view(np.int64).astype('>i8')
+    write_image(outfile, stored, bzero=9223372036854775808)
+
+
+@pytest.mark.parametrize("dtype,expected",
+                         [(np.uint8, np.int64),
+                          (np.int16, np.int64),
+                          (np.uint32, np.int64),
+                          (np.int64, np.int64),
+                          (np.uint64, np.uint64),
+                          ('>u8', np.uint64),
+                          (np.float32, np.float64)])
+def test_sum_dtype(dtype, expected):
+    assert merging.sum_dtype(np.dtype(dtype)) == np.dtype(expected)
+
+
+def test_add_images_unsigned_64(tmp_path):
+    """64-bit unsigned images are summed as unsigned integers"""
+
+    vals1 = np.asarray([[0, 1], [2**63, 2**63 + 2]], dtype=np.uint64)
+    vals2 = np.asarray([[4, 5], [6, 7]], dtype=np.uint64)
+    infiles = [tmp_path / 'img1.fits', tmp_path / 'img2.fits']
+    write_uint64(infiles[0], vals1)
+    write_uint64(infiles[1], vals2)
+
+    outfile = tmp_path / 'out.fits'
+    merging.add_images([str(f) for f in infiles], str(outfile))
+
+    got = pycrates.read_file(str(outfile)).get_image().values
+    assert np.array_equal(got, vals1 + vals2)
+
+
+def test_add_images_signed_and_unsigned_64(tmp_path):
+    """Signed and 64-bit unsigned images are summed as floats"""
+
+    vals1 = np.asarray([[-2, 1], [3, 4]], dtype='>i2')
+    vals2 = np.asarray([[4, 5], [6, 2**40]], dtype=np.uint64)
+    infiles = [tmp_path / 'img1.fits', tmp_path / 'img2.fits']
+    write_image(infiles[0], vals1)
+    write_uint64(infiles[1], vals2)
+
+    outfile = tmp_path / 'out.fits'
+    merging.add_images([str(f) for f in infiles], str(outfile))
+
+    got = pycrates.read_file(str(outfile)).get_image().values
+    assert got.dtype == np.float64
+    assert np.array_equal(got, vals1.astype(np.float64) + vals2)
+
+
+def test_add_images_memmap_output(tmp_path):
+    """The output is written directly, with the input type"""
+
+    vals1 = np.arange(12, dtype='>i2').reshape(4, 3)
+    vals2 = 2 * vals1
+    infiles = [tmp_path / 'img1.fits', tmp_path / 'img2.fits']
+    write_image(infiles[0], vals1)
+    write_image(infiles[1], vals2)
+
+    outfile = tmp_path / 'out.fits'
+    merging.add_images([str(f) for f in infiles],
+                       f"{outfile}[EVENTS_IMAGE]", nrows=3)
+
+    got = fileio.memmap_image(f"{outfile}[EVENTS_IMAGE]")
+    assert got.dtype == np.dtype('>i2')
+    assert np.array_equal(got, vals1 + vals2)
@@ -0,0 +1,448 @@
+"""Check ciao_contrib._tools.taskrunner"""
+
+import json
+import os
+
+import pytest
+
+from ciao_contrib._tools import taskrunner
+
+
+def append_line(filename, txt):
+    with open(filename, 'a') as fh:
+        fh.write(txt + '\n')
+
+
+def fail_task():
+    raise OSError("this task failed")
+
+
+def read_lines(filename):
+    with open(filename, 'r') as fh:
+        return fh.read().split()
+
+
+def test_serial_uses_insertion_order(tmp_path):
+    """The serial runner does not re-order the tasks"""
+
+    outfile = str(tmp_path / 'order.txt')
+    runner = taskrunner.TaskRunner()
+    runner.add_task('a', [], append_line, outfile, 'a')
+    runner.add_task('b', [], append_line, outfile, 'b', cost=100)
+    runner.add_task('c', ['a'], append_line, outfile, 'c')
+    runner.add_barrier('d', ['b', 'c'])
+    runner.add_task('e', ['d'], append_line, outfile, 'e')
+    runner.run_tasks(processes=1)
+
+    assert read_lines(outfile) == ['a', 'b', 'c', 'e']
+
+
+def test_scheduler_uses_critical_path():
+    """The task at the start of the longest chain is run first"""
+
+    runner = taskrunner.TaskRunner()
+    runner.add_task('short', [], print)
+    runner.add_task('long', [], print)
+    runner.add_task('long2', ['long'], print, cost=5)
+    runner.add_task('expensive', [], print, cost=3)
+    runner.add_barrier('end', ['short', 'long2', 'expensive'])
+
+    sched = taskrunner.TaskScheduler(runner._torun, runner._dependents,
+                                     runner._costs)
+    assert sched.priority('long') == 6
+    assert sched.priority('expensive') == 3
+    assert sched.priority('short') == 1
+    assert sched.priority('end') == 0
+
+    assert sched.pop() == 'long'
+    assert sched.pop() == 'expensive'
+    assert sched.pop() == 'short'
+    assert sched.pop() is None
+
+    sched.done('long')
+    assert sched.pop() == 'long2'
+    for name in ['short', 'long2']:
+        sched.done(name)
+
+    assert sched.pop() is None
+    sched.done('expensive')
+    assert sched.pop() == 'end'
+    assert not sched.finished
+    sched.done('end')
+    assert sched.finished
+
+
+def test_scheduler_repeated_precondition():
+
+    runner = taskrunner.TaskRunner()
+    runner.add_task('a', [], print)
+    runner.add_task('b', ['a', 'a'], print)
+
+    sched = taskrunner.TaskScheduler(runner._torun, runner._dependents,
+                                     runner._costs)
+    assert sched.pop() == 'a'
+    sched.done('a')
+    assert sched.pop() == 'b'
+
+
+def test_parallel_runs_all_tasks(tmp_path):
+
+    outfile = str(tmp_path / 'tasks.txt')
+    runner = taskrunner.TaskRunner()
+    names = []
+    for i in range(6):
+        name = f'task{i}'
+        runner.add_task(name, [], append_line, outfile, name)
+        names.append(name)
+
+    runner.add_barrier('mid', names, msg=None)
+    runner.add_task('last', ['mid'], append_line, outfile, 'last')
+
+    # run_tasks would use the serial code on a single-core machine
+    runner._run_parallel(2)
+
+    lines = read_lines(outfile)
+    assert sorted(lines[:6]) == names
+    assert lines[6:] == ['last']
+
+
+def test_parallel_error_is_raised():
+
+    runner = taskrunner.TaskRunner()
+    runner.add_task('a', [], fail_task)
+    with pytest.raises(OSError) as oe:
+        runner._run_parallel(2)
+
+    assert str(oe.value) == "this task failed"
+
+
+def test_add_task_invalid_cost():
+
+    runner = taskrunner.TaskRunner()
+    with pytest.raises(ValueError) as ve:
+        runner.add_task('a', [], print, cost=-1)
+
+    assert str(ve.value) == "The cost for task a must be >= 0, not -1"
+
+
+def test_scheduler_memory_limit():
+    """Tasks which do not fit are skipped until memory is freed"""
+
+    runner = taskrunner.TaskRunner()
+    runner.add_task('big1', [], print, memory=60, cost=10)
+    runner.add_task('big2', [], print, memory=60, cost=10)
+    runner.add_task('small1', [], print, memory=10)
+    runner.add_task('small2', [], print, memory=10)
+    runner.add_task('huge', [], print, memory=200)
+
+    sched = taskrunner.TaskScheduler(runner._torun, runner._dependents,
+                                     runner._costs,
+                                     resources=runner._resources,
+                                     memory=100, threads=4)
+    assert sched.pop() == 'big1'
+    assert sched.pop() == 'small1'
+    assert sched.pop() == 'small2'
+    assert sched.pop() is None
+
+    # big2 still does not fit
+    sched.done('small1')
+    assert sched.pop() is None
+
+    sched.done('big1')
+    assert sched.pop() == 'big2'
+    sched.done('big2')
+    sched.done('small2')
+
+    # A task larger than the limit is run on its own
+    assert sched.pop() == 'huge'
+    sched.done('huge')
+    assert sched.finished
+
+
+def test_scheduler_thread_limit():
+
+    runner = taskrunner.TaskRunner()
+    runner.add_task('a', [], print, threads=2)
+    runner.add_task('b', [], print, threads=2)
+    runner.add_task('c', [], print)
+
+    sched = taskrunner.TaskScheduler(runner._torun, runner._dependents,
+                                     runner._costs,
+                                     resources=runner._resources,
+                                     threads=3)
+    assert sched.pop() == 'a'
+    assert sched.pop() == 'c'
+    assert sched.pop() is None
+    sched.done('a')
+    assert sched.pop() == 'b'
+
+
+@pytest.mark.parametrize("kwargs,msg",
+                         [({'memory': -1}, "The memory for task a must be >= 0, not -1"),
+                          ({'threads': 0}, "The threads for task a must be >= 1, not 0")])
+def test_add_task_invalid_resources(kwargs, msg):
+
+    runner = taskrunner.TaskRunner()
+    with pytest.raises(ValueError) as ve:
+        runner.add_task('a', [], print, **kwargs)
+
+    assert str(ve.value) == msg
+
+
+def test_parallel_with_memory_limit(tmp_path):
+
+    outfile = str(tmp_path / 'tasks.txt')
+    runner = taskrunner.TaskRunner()
+    for i in range(4):
+        runner.add_task(f'task{i}', [], append_line, outfile, f'task{i}',
+                        memory=100)
+
+    runner._run_parallel(2, memory=150)
+    assert sorted(read_lines(outfile)) == [f'task{i}' for i in range(4)]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_trace_is_recorded(parallel, tmp_path):
+
+    outfile = str(tmp_path / 'tasks.txt')
+    runner = taskrunner.TaskRunner()
+    runner.add_task('a', [], append_line, outfile, 'a')
+    runner.add_task('b', ['a'], append_line, outfile, 'b')
+    runner.add_barrier('c', ['b'])
+    if parallel:
+        runner._run_parallel(2)
+    else:
+        runner._run_serial()
+
+    trace = runner.get_trace()
+    assert [r.name for r in trace] == ['a', 'b']
+    for r in trace:
+        assert isinstance(r, taskrunner.TaskRecord)
+        assert r.status == 'ok'
+        assert r.end >= r.start
+        assert r.peakrss > 0
+        if parallel:
+            assert r.worker in [1, 2]
+        else:
+            assert r.worker == 0
+
+    assert trace[1].start >= trace[0].end
+
+
+def test_trace_records_failure(tmp_path):
+
+    tracefile = tmp_path / 'trace.csv'
+    runner = taskrunner.TaskRunner()
+    runner.add_task('a', [], fail_task)
+    with pytest.raises(OSError):
+        runner.run_tasks(processes=1, tracefile=str(tracefile))
+
+    lines = tracefile.read_text().split('\n')
+    assert lines[0] == 'name,worker,start,end,duration,status,peakrss'
+    assert lines[1].startswith('a,0,')
+    assert ',failed,' in lines[1]
+
+
+def test_write_chrome_trace(tmp_path):
+
+    records = [taskrunner.TaskRecord('a', 1, 100.0, 102.5, 'ok', 2048),
+               taskrunner.TaskRecord('b', 2, 101.0, 101.5, 'failed', 1024)]
+    runner = taskrunner.TaskRunner()
+    runner._trace = records
+
+    tracefile = tmp_path / 'trace.json'
+    runner.write_trace(str(tracefile))
+    events = json.loads(tracefile.read_text())['traceEvents']
+    assert events == [{'name': 'a', 'cat': 'task', 'ph': 'X', 'ts': 0,
+                       'dur': 2500000, 'pid': 1, 'tid': 1,
+                       'args': {'status': 'ok', 'peakrss': 2048}},
+                      {'name': 'b', 'cat': 'task', 'ph': 'X', 'ts': 1000000,
+                       'dur': 500000, 'pid': 1, 'tid': 2,
+                       'args': {'status': 'failed', 'peakrss': 1024}}]
+
+
+def test_summarize_trace():
+
+    records = [taskrunner.TaskRecord('a', 1, 100.0, 104.0, 'ok', 0),
+               taskrunner.TaskRecord('b', 2, 100.0, 102.0, 'ok', 0)]
+    lines = taskrunner.summarize_trace(records, 2, ntop=1)
+    assert lines == ['TaskRunner: ran 2 tasks in 4.0 s',
+                     'TaskRunner: total busy time 6.0 s, parallel efficiency 75% with 2 processes',
+                     'TaskRunner: slowest tasks',
+                     '       4.0 s  a  [ok]']
+
+
+def write_file(logfile, filename, txt, clobber=False):
+    if not clobber and os.path.exists(filename):
+        raise OSError(f"{filename} exists and clobber is not set")
+
+    append_line(logfile, txt)
+    with open(filename, 'w') as fh:
+        fh.write(txt)
+
+
+def fail_if_exists(filename):
+    if filename is not None and os.path.exists(filename):
+        raise OSError("the run has failed")
+
+
+def make_pipeline(tmp_path, logfile, stopfile=None, clobber=True,
+                  clabel='c'):
+    """a -> b -> stop -> c, where a, b, and c create a file and c
+    reads the file created by b."""
+
+    runner = taskrunner.TaskRunner()
+    afile = str(tmp_path / 'a.txt')
+    bfile = str(tmp_path / 'out.txt')
+    cfile = str(tmp_path / 'c.txt')
+    runner.add_task('a', [], write_file, logfile, afile, 'a',
+                    outputs=[afile], clobber=clobber)
+    runner.add_task('b', ['a'], write_file, logfile, bfile, 'b',
+                    outputs=[bfile], clobber=clobber)
+    runner.add_task('stop', ['b'], fail_if_exists, stopfile)
+    runner.add_task('c', ['stop'], write_file, logfile, cfile, clabel,
+                    inputs=[bfile], outputs=[cfile], clobber=clobber)
+    return runner
+
+
+def test_journal_restarts_run(tmp_path):
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    stopfile = tmp_path / 'stop'
+    stopfile.write_text('')
+
+    runner = make_pipeline(tmp_path, logfile, str(stopfile))
+    with pytest.raises(OSError):
+        runner.run_tasks(processes=1, journal=journal)
+
+    assert read_lines(logfile) == ['a', 'b']
+
+    # Only the failed task, and the tasks after it, are re-run.
+    stopfile.unlink()
+    runner = make_pipeline(tmp_path, logfile, str(stopfile))
+    runner.run_tasks(processes=1, journal=journal)
+    assert read_lines(logfile) == ['a', 'b', 'c']
+
+    # Only the task with no outputs is re-run.
+    runner = make_pipeline(tmp_path, logfile, str(stopfile))
+    runner.run_tasks(processes=1, journal=journal)
+    assert read_lines(logfile) == ['a', 'b', 'c']
+    assert [r.name for r in runner.get_trace()] == ['stop']
+
+
+def test_journal_restarts_run_with_clobber(tmp_path):
+    """Changing clobber does not change the tasks"""
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    stopfile = tmp_path / 'stop'
+    stopfile.write_text('')
+
+    runner = make_pipeline(tmp_path, logfile, str(stopfile), clobber=False)
+    with pytest.raises(OSError):
+        runner.run_tasks(processes=1, journal=journal)
+
+    stopfile.unlink()
+    runner = make_pipeline(tmp_path, logfile, str(stopfile), clobber=True)
+    runner.run_tasks(processes=1, journal=journal)
+    assert read_lines(logfile) == ['a', 'b', 'c']
+    assert [r.name for r in runner.get_trace()] == ['stop', 'c']
+
+
+def test_journal_only_reruns_changed_task(tmp_path):
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    runner = make_pipeline(tmp_path, logfile)
+    runner.run_tasks(processes=1, journal=journal)
+
+    runner = make_pipeline(tmp_path, logfile, clabel='newc')
+    runner.run_tasks(processes=1, journal=journal)
+    assert read_lines(logfile) == ['a', 'b', 'c', 'newc']
+    assert [r.name for r in runner.get_trace()] == ['stop', 'c']
+
+
+def test_journal_reruns_missing_outputs(tmp_path):
+    """If an output is needed but missing the task is re-run."""
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    runner = make_pipeline(tmp_path, logfile)
+    runner.run_tasks(processes=1, journal=journal)
+
+    # Make c re-run by removing it from the journal. As b's output is
+    # missing it is also re-run, but not a.
+    #
+    (tmp_path / 'out.txt').unlink()
+    lines = [line for line in open(journal)
+             if json.loads(line)['name'] != 'c']
+    with open(journal, 'w') as fh:
+        fh.writelines(lines)
+
+    runner = make_pipeline(tmp_path, logfile)
+    runner.run_tasks(processes=1, journal=journal)
+    assert read_lines(logfile) == ['a', 'b', 'c', 'b', 'c']
+    assert [r.name for r in runner.get_trace()] == ['b', 'stop', 'c']
+
+
+def test_journal_missing_output_not_needed(tmp_path):
+    """A missing output is not recreated if nothing needs it."""
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    runner = make_pipeline(tmp_path, logfile)
+    runner.run_tasks(processes=1, journal=journal)
+
+    (tmp_path / 'out.txt').unlink()
+    runner = make_pipeline(tmp_path, logfile)
+    runner.run_tasks(processes=1, journal=journal)
+    assert [r.name for r in runner.get_trace()] == ['stop']
+
+
+def test_journal_separates_runners(tmp_path):
+    """Tasks with the same name in different runners are not confused."""
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    for band in ['soft', 'hard', 'soft']:
+        outfile = str(tmp_path / f'{band}.txt')
+        runner = taskrunner.TaskRunner()
+        runner.add_task('task', [], write_file, logfile, outfile, band,
+                        outputs=[outfile])
+        runner.run_tasks(processes=1, journal=journal)
+
+    assert read_lines(logfile) == ['soft', 'hard']
+
+
+def write_merged_file(logfile, filename, txt, lookupTable=None,
+                      history=None):
+    with open(lookupTable) as fh:
+        txt += fh.read()
+
+    write_file(logfile, filename, txt, clobber=True)
+
+
+def test_journal_ignores_temporary_arguments(tmp_path):
+    """The lookup table and history arguments do not change the task."""
+
+    logfile = str(tmp_path / 'log.txt')
+    journal = str(tmp_path / 'journal')
+    outfile = str(tmp_path / 'merged.txt')
+    for run in ['run1', 'run2']:
+        ltable = tmp_path / f'lookup-{run}'
+        ltable.write_text('-rules')
+        runner = taskrunner.TaskRunner()
+        runner.add_task('merge', [], write_merged_file, logfile, outfile,
+                        'merged', outputs=[outfile],
+                        lookupTable=str(ltable), history={'run': run})
+        runner.run_tasks(processes=1, journal=journal)
+
+    assert read_lines(logfile) == ['merged-rules']
+
+
+def test_journal_ignores_partial_line(tmp_path):
+
+    journal = tmp_path / 'journal'
+    journal.write_text('{"key": "k1", "name": "a", "outputs": []}\n{"key": "k2", "na')
+    assert taskrunner.TaskJournal(str(journal)).read() == {'k1'}
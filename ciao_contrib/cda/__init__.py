@@ -21,6 +21,7 @@ Routines that wrap up access to the Chandra Data Archive.
 
 The available modules are
 
+  ciao_contrib.cda.archive_index
   ciao_contrib.cda.data
   ciao_contrib.cda.search
   
@@ -0,0 +1,395 @@
+#
+#  Copyright (C) 2026
+#  Smithsonian Astrophysical Observatory
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+A local index of the Chandra archive, for searches without a network.
+
+The index is created from the tables returned by the Chandra
+Footprint Service - as read by
+ciao_contrib.cda.search.read_chandra_siap_table - and can then be
+used by search_chandra_archive (and the find_chandra_obsid script)
+instead of the service, which is useful when a large number of
+positions are to be searched.
+
+The index is stored as a NumPy .npz file, with one array per column
+of the table. The rows are sorted into declination zones, and by
+RA within each zone, so that the rows near a position can be found
+with a binary search of each zone that overlaps the search circle.
+
+The footprint of each observation is approximated by a circle,
+centered on the aim point, whose radius depends on the instrument
+(see FOOTPRINT_RADIUS). A search therefore returns all observations
+returned by the service, but may return extra observations whose
+field of view lies just outside the search circle.
+
+Example
+-------
+
+>>> from ciao_contrib.cda import search, archive_index
+>>> tbl = search.read_chandra_siap_table('footprints.xml')
+>>> archive_index.build_index([tbl], 'chandra.npz')
+>>> sr = search.search_chandra_archive(8.815, -43.566, size=0.3,
+...                                    index='chandra.npz')
+
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+import ciao_contrib.logger_wrapper as lw
+
+
+__all__ = ("FOOTPRINT_RADIUS", "build_index", "ArchiveIndex")
+
+logger = lw.initialize_module_logger("cda.archive_index")
+
+v3 = logger.verbose3
+v4 = logger.verbose4
+
+FORMAT_VERSION = 1
+
+# The height of each declination zone, in degrees.
+#
+ZONE_HEIGHT = 0.5
+
+# The maximum distance, in degrees, of any part of the field of view
+# from the aim point for each instrument. These are conservative
+# values, since the roll and the chips that were used are not
+# known.
+#
+FOOTPRINT_RADIUS = {
+    "ACIS-I": 0.45,
+    "ACIS-S": 0.6,
+    "HRC-I": 0.4,
+    "HRC-S": 0.9
+}
+
+_DEFAULT_RADIUS = max(FOOTPRINT_RADIUS.values())
+
+_REQUIRED = ["ObsId", "Instrument", "RA", "Dec"]
+
+
+def _footprint_radius(instruments):
+    """The footprint radius, in degrees, of each row."""
+
+    out = np.full(len(instruments), _DEFAULT_RADIUS)
+    for (inst, radius) in FOOTPRINT_RADIUS.items():
+        out[np.char.strip(instruments) == inst] = radius
+
+    return out
+
+
+def _separation(ra1, dec1, ra2, dec2):
+    """The separation, in degrees, of the points (in degrees)."""
+
+    ra1 = np.radians(ra1)
+    dec1 = np.radians(dec1)
+    ra2 = np.radians(ra2)
+    dec2 = np.radians(dec2)
+
+    sdec = np.sin((dec2 - dec1) / 2)
+    sra = np.sin((ra2 - ra1) / 2)
+    term = sdec * sdec + np.cos(dec1) * np.cos(dec2) * sra * sra
+    return np.degrees(2 * np.arcsin(np.sqrt(np.clip(term, 0, 1))))
+
+
+def build_index(tables, outfile, zone_height=ZONE_HEIGHT):
+    """Create the index from the footprint-service tables.
+
+    Parameters
+    ----------
+    tables : sequence of NumPy structured arrays
+        The tables, as returned by read_chandra_siap_table or
+        search_chandra_archive, which must have the same columns.
+        Rows that appear in more than one table (e.g. from
+        overlapping searches) are only included once.
+    outfile : str
+        The name of the index, which is over-written if it exists.
+    zone_height : float, optional
+        The height of the declination zones, in degrees.
+
+    Returns
+    -------
+    nrows : int
+        The number of rows in the index.
+
+    """
+
+    if zone_height <= 0:
+        raise ValueError(f"zone_height must be positive, not {zone_height}")
+
+    tables = [tbl for tbl in tables if tbl is not None]
+    if len(tables) == 0:
+        raise ValueError("No tables to index")
+
+    names = tables[0].dtype.names
+    for name in _REQUIRED:
+        if name not in names:
+            raise ValueError(f"The tables must contain the {name} column")
+
+    for tbl in tables[1:]:
+        if tbl.dtype.names != names:
+            raise ValueError("The tables must have the same columns")
+
+    data = np.concatenate(tables)
+    v3(f"Indexing {len(data)} rows")
+
+    # Remove repeated rows, retaining the original order.
+    #
+    try:
+        _, idx = np.unique(data, return_index=True)
+    except TypeError:
+        v3("Unable to check for repeated rows")
+    else:
+        data = data[np.sort(idx)]
+        v3(f"After removing repeated rows there are {len(data)} rows")
+
+    ra = np.mod(data['RA'].astype(np.float64), 360)
+    dec = data['Dec'].astype(np.float64)
+
+    nzones = int(np.ceil(180 / zone_height))
+    zone = np.clip(np.floor((dec + 90) / zone_height).astype(np.int64),
+                   0, nzones - 1)
+    order = np.lexsort((ra, zone))
+    offsets = np.searchsorted(zone[order], np.arange(nzones + 1))
+
+    store = {f"col_{i}": data[name][order] for i, name in enumerate(names)}
+    store['_names'] = np.asarray(names)
+    store['_version'] = np.asarray(FORMAT_VERSION)
+    store['_zone_height'] = np.asarray(zone_height)
+    store['_offsets'] = offsets
+    store['_ra'] = ra[order]
+    store['_dec'] = dec[order]
+    store['_radius'] = _footprint_radius(data['Instrument'][order])
+    store['_row'] = order
+
+    # Write to a temporary file so that a failed write does not
+    # replace a valid index.
+    #
+    dirname = os.path.dirname(os.path.abspath(outfile))
+    fd, tmpname = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as ofh:
+            np.savez(ofh, **store)
+
+        os.chmod(tmpname, 0o644)
+        os.replace(tmpname, outfile)
+
+    except BaseException:
+        os.unlink(tmpname)
+        raise
+
+    v3(f"Created index {outfile}")
+    return len(data)
+
+
+class ArchiveIndex:
+    """Search a local index of the Chandra archive.
+
+    Parameters
+    ----------
+    filename : str
+        The index, as created by build_index.
+
+    Notes
+    -----
+    The position, and footprint, columns are read in when the index
+    is opened, but the remaining columns are only read when needed.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        try:
+            self._store = np.load(filename, allow_pickle=False)
+        except (OSError, ValueError) as exc:
+            raise OSError(f"Unable to read the archive index {filename}\n{exc}")
+
+        try:
+            version = int(self._store['_version'])
+        except KeyError:
+            version = None
+
+        if version != FORMAT_VERSION:
+            raise OSError(f"The archive index {filename} is not supported " +
+                          "(it needs to be re-created)")
+
+        self.names = [str(n) for n in self._store['_names']]
+        self.zone_height = float(self._store['_zone_height'])
+        self._offsets = self._store['_offsets']
+        self._ra = self._store['_ra']
+        self._dec = self._store['_dec']
+        self._radius = self._store['_radius']
+        self._row = self._store['_row']
+        self._columns = {}
+
+        if len(self._radius) > 0:
+            self.maxradius = self._radius.max()
+        else:
+            self.maxradius = 0
+
+        v3(f"Read archive index {filename} with {len(self)} rows")
+
+    def __len__(self):
+        return len(self._ra)
+
+    def column(self, name):
+        """Return the column values (in index order)."""
+
+        try:
+            return self._columns[name]
+        except KeyError:
+            pass
+
+        try:
+            idx = self.names.index(name)
+        except ValueError:
+            raise KeyError(name)
+
+        vals = self._store[f"col_{idx}"]
+        self._columns[name] = vals
+        return vals
+
+    def _candidates(self, ra, dec, radius):
+        """The rows whose aim point may lie within radius of ra, dec.
+
+        This uses the zones algorithm of Gray et al. (2006,
+        Microsoft Research MSR-TR-2006-52).
+        """
+
+        nzones = len(self._offsets) - 1
+        zlo = int(np.floor((dec - radius + 90) / self.zone_height))
+        zhi = int(np.floor((dec + radius + 90) / self.zone_height))
+        zlo = max(zlo, 0)
+        zhi = min(zhi, nzones - 1)
+
+        if abs(dec) + radius >= 90:
+            dra = 180.0
+        else:
+            rrad = np.radians(radius)
+            denom = np.sqrt(abs(np.cos(np.radians(dec - radius)) *
+                                np.cos(np.radians(dec + radius))))
+            dra = np.degrees(np.arctan(np.sin(rrad) / denom))
+
+        ra = ra % 360
+        if dra >= 180:
+            ranges = [(0, 360)]
+        elif ra - dra < 0:
+            ranges = [(0, ra + dra), (ra - dra + 360, 360)]
+        elif ra + dra >= 360:
+            ranges = [(ra - dra, 360), (0, ra + dra - 360)]
+        else:
+            ranges = [(ra - dra, ra + dra)]
+
+        out = []
+        for zone in range(zlo, zhi + 1):
+            start = self._offsets[zone]
+            end = self._offsets[zone + 1]
+            if start == end:
+                continue
+
+            zra = self._ra[start:end]
+            for (lo, hi) in ranges:
+                i0 = np.searchsorted(zra, lo, side='left')
+                i1 = np.searchsorted(zra, hi, side='right')
+                if i1 > i0:
+                    out.append(np.arange(start + i0, start + i1))
+
+        if len(out) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        return np.concatenate(out)
+
+    def _make_table(self, idx):
+        """Return the rows as a structured array."""
+
+        def mkdtype(k, v):
+            if v.ndim == 1:
+                return (k, v.dtype)
+
+            return (k, v.dtype, v.shape[1:])
+
+        cols = [(name, self.column(name)[idx]) for name in self.names]
+        out = np.zeros(len(idx), dtype=[mkdtype(k, v) for (k, v) in cols])
+        for (name, vals) in cols:
+            out[name] = vals
+
+        return out
+
+    def search(self, ra, dec, size, instruments=None):
+        """Find the observations which overlap the search circle.
+
+        Parameters
+        ----------
+        ra, dec : float
+            The location to query, in decimal degrees.
+        size : float
+            The search radius, in degrees.
+        instruments : sequence of str or None, optional
+            If set, the Instrument values to select (e.g. "ACIS-I").
+
+        Returns
+        -------
+        ans : None or NumPy structured array
+            The matching rows, in the order they were added to the
+            index, or None if there is no match.
+        """
+
+        if size < 0:
+            raise ValueError(f"size can not be negative: {size}")
+
+        idx = self._candidates(ra, dec, size + self.maxradius)
+        v4(f"Found {len(idx)} candidate rows")
+
+        sep = _separation(ra, dec, self._ra[idx], self._dec[idx])
+        idx = idx[sep <= size + self._radius[idx]]
+
+        if instruments is not None and len(idx) > 0:
+            insts = np.char.strip(self.column('Instrument')[idx])
+            idx = idx[np.isin(insts, list(instruments))]
+
+        if len(idx) == 0:
+            return None
+
+        idx = idx[np.argsort(self._row[idx])]
+        return self._make_table(idx)
+
+    def find_obsid(self, obsid):
+        """Return the aim point of the ObsId.
+
+        Parameters
+        ----------
+        obsid : int
+
+        Returns
+        -------
+        pos : (float, float) or None
+            The RA and Dec, in decimal degrees, or None if the ObsId
+            is not in the index.
+        """
+
+        idx, = np.where(self.column('ObsId') == int(obsid))
+        if len(idx) == 0:
+            return None
+
+        i = idx[0]
+        return (float(self._ra[i]), float(self._dec[i]))
+
+# End
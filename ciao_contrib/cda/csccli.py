@@ -26,6 +26,7 @@ retrieve interface.
 """
 
 import os
+import threading
 
 import ciao_contrib.logger_wrapper as lw
 
@@ -44,6 +45,7 @@ __all__ = (
     'check_filetypes',
     'check_bandtypes',
     'search_src_by_ra_dec',
+    'search_src_by_positions',
     'search_src_by_obsid',
     'save_results',
     'parse_csc_result',
@@ -350,10 +352,17 @@ a.match_type
 
 __all_retieved_files__ = {}
 
+# The amount of data, in bytes, read at a time when retrieving files.
+DOWNLOAD_CHUNKSIZE = 256 * 1024
+
 __filename_cache__ = []
 
 __filename_version_db__ = {}
 
+# The version information is loaded on first use, which may be
+# from several threads at once.
+__filename_version_lock__ = threading.Lock()
+
 
 def get_radec_lim( ra_deg, dec_deg, radius_arcmin ):
     """
@@ -390,14 +399,20 @@ def get_radec_lim( ra_deg, dec_deg, radius_arcmin ):
     return ra_condition, dec_condition
 
 
-def make_URL_request( resource, vals ):
+def make_URL_request( resource, vals, pool=None ):
     """
     Query and retrieve results from resourse using dictionary of
     vals values.
+
+    If pool, a ciao_contrib.downloadutils.ConnectionPool, is given
+    then the connection is taken from (and returned to) the pool.
     """
     from urllib.parse import urlencode
     from urllib.request import Request, urlopen
 
+    if pool is not None:
+        return make_pooled_request( resource, vals, pool )
+
     verb5( "Querying resource " + resource )
     verb5( "with parameters" + str( vals ) )
 
@@ -425,6 +440,40 @@ def make_URL_request( resource, vals ):
     return page
 
 
+def make_pooled_request( resource, vals, pool ):
+    """
+    Query and retrieve results from resource using dictionary of
+    vals values, re-using a connection from pool (a
+    ciao_contrib.downloadutils.ConnectionPool). This can be called
+    from multiple threads.
+
+    As with make_URL_request, curl is used if the response is not
+    200 (e.g. a redirect).
+    """
+    from urllib.parse import urlencode
+
+    verb5( "Querying resource " + resource )
+    verb5( "with parameters" + str( vals ) )
+
+    params = urlencode( vals )
+    headers = {'User-Agent': 'ciao_contrib.cda.csccli/1.1',
+               'Content-Type': 'application/x-www-form-urlencoded'}
+
+    with pool.open( "POST", resource, headers=headers,
+                    body=params.encode("ascii") ) as response:
+        page = response.read()
+        code = response.status
+
+    verb5( "URL Code: {0}".format( code ))
+    if code != 200:
+        page = make_CURL_request( resource, vals )
+
+    if len(page) == 0:
+        raise Exception("Problem accessing resource {0}".format(resource))
+
+    return page
+
+
 def make_CURL_request( resource, vals ):
     """
     Query and retrieve results from resourse using dictionary of
@@ -453,7 +502,7 @@ def make_CURL_request( resource, vals ):
     return page
 
 
-def cone_query_cli_cscview( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns):
+def cone_query_cli_cscview( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns, pool=None):
     """
     Perform the cone search query on the CSC using the getProperties API.
 
@@ -489,7 +538,7 @@ def cone_query_cli_cscview( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_co
         'version' : __csc_version["csc1"]
         }
 
-    page = make_URL_request( resource, vals )
+    page = make_URL_request( resource, vals, pool=pool )
     page = page.decode("ascii")
 
     if "Error executing query:" in page:
@@ -501,7 +550,7 @@ def cone_query_cli_cscview( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_co
     return page,cols
 
 
-def cone_query_cli_cscview_ver2( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns, cat_ver):
+def cone_query_cli_cscview_ver2( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns, cat_ver, pool=None):
     """
     Perform the cone search query on the CSC using the getProperties API.
 
@@ -539,7 +588,7 @@ def cone_query_cli_cscview_ver2( ra_deg, dec_deg, radius_arcmin, ra_condition, d
     if __csc_version[cat_ver] is not None:
         vals['version'] = __csc_version[cat_ver]
 
-    page = make_URL_request( resource, vals )
+    page = make_URL_request( resource, vals, pool=pool )
     page = page.decode("ascii")
 
     if "Error executing query:" in page:
@@ -844,7 +893,7 @@ def fix_dm_no_g_type( page ):
       same (atof or strtod) so we can just change the "(Gnumber)"
       to be "(Fnumber)"
     """
-    import re as re
+    import re
 
     fixed = re.sub(r'\(G[0-9\.]*\)',
                    lambda x: x.group(0).replace("G", "F"),
@@ -863,7 +912,7 @@ def save_results( page_and_cols, outfile, clobber ):
     page = page_and_cols[0]
     cols = page_and_cols[1]
 
-    import re as re
+    import re
     from ciao_contrib._tools.fileio import outfile_clobber_checks
 
     if not outfile:
@@ -876,24 +925,245 @@ def save_results( page_and_cols, outfile, clobber ):
         fp.write( p2 )
 
 
-def search_src_by_ra_dec( ra, dec, radius_arcmin, columns, cat_ver ):
+def search_src_by_ra_dec( ra, dec, radius_arcmin, columns, cat_ver, pool=None ):
     """
     Perform a cone search on CSC CLI.
+
+    The optional pool argument is a ciao_contrib.downloadutils.ConnectionPool
+    used to make the query.
     """
     from coords.format import sex2deg
     ra_deg,dec_deg = sex2deg(ra, dec )
     ra_condition, dec_condition = get_radec_lim( ra_deg, dec_deg, radius_arcmin )
 
     if "csc1" == cat_ver:
-        page = cone_query_cli_cscview( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns)
+        page = cone_query_cli_cscview( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns, pool=pool)
     elif cat_ver in ["csc2", "csc2.1", "current", "latest"]:
-        page = cone_query_cli_cscview_ver2( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns, cat_ver)
+        page = cone_query_cli_cscview_ver2( ra_deg, dec_deg, radius_arcmin, ra_condition, dec_condition, columns, cat_ver, pool=pool)
     else:
         raise ValueError("Unknown catalog version")
 
     return page
 
 
+def __separation_arcsec( ra1, dec1, ra2, dec2 ):
+    """
+    Angular separation, in arcsec, of two positions in decimal degrees.
+    """
+    from math import radians, degrees, sin, cos, asin, sqrt
+
+    ra1, dec1, ra2, dec2 = map(radians, (ra1, dec1, ra2, dec2))
+    term = sin((dec2 - dec1) / 2)**2 + \
+        cos(dec1) * cos(dec2) * sin((ra2 - ra1) / 2)**2
+    return 3600.0 * degrees(2 * asin(sqrt(min(max(term, 0.0), 1.0))))
+
+
+def __group_center( positions ):
+    """
+    The center (decimal degrees) of the positions, calculated
+    using the mean of the unit vectors.
+    """
+    from math import radians, degrees, sin, cos, atan2, sqrt
+
+    xx = yy = zz = 0.0
+    for (ra, dec) in positions:
+        ra, dec = radians(ra), radians(dec)
+        xx += cos(dec) * cos(ra)
+        yy += cos(dec) * sin(ra)
+        zz += sin(dec)
+
+    ra = degrees(atan2(yy, xx)) % 360.0
+    dec = degrees(atan2(zz, sqrt(xx * xx + yy * yy)))
+    return ra, dec
+
+
+def group_positions( positions, radius_arcmin, merge_arcmin ):
+    """
+    Group nearby positions so that they can be searched with a
+    single cone.
+
+    positions is a list of (ra, dec) pairs in decimal degrees. The
+    positions are binned into cells of merge_arcmin on a side, and the
+    positions in each cell form a group. The return value is a list of
+    (ra, dec, radius_arcmin, members) for each cone, where members
+    is the list of indexes into positions. The cone covers the search
+    radius of every member.
+    """
+    from math import cos, radians, floor
+
+    cell = merge_arcmin / 60.0
+    if cell <= 0:
+        cells = {(i,): [i] for i in range(len(positions))}
+    else:
+        cells = {}
+        for idx, (ra, dec) in enumerate(positions):
+            zone = int(floor((dec + 90.0) / cell))
+            # The RA width of the cell increases towards the poles
+            # so that the cells have a similar size on the sky.
+            zdec = min(abs(-90.0 + (zone + 0.5) * cell), 89.0)
+            width = cell / cos(radians(zdec))
+            key = (zone, int(floor((ra % 360.0) / width)))
+            cells.setdefault(key, []).append(idx)
+
+    out = []
+    for members in cells.values():
+        if len(members) == 1:
+            ra, dec = positions[members[0]]
+            out.append((ra, dec, radius_arcmin, members))
+            continue
+
+        ra, dec = __group_center([positions[i] for i in members])
+        extent = max(__separation_arcsec(ra, dec, *positions[i])
+                     for i in members) / 60.0
+
+        # Round up the radius so the cone still covers every search
+        # radius once printed in the query.
+        out.append((ra, dec, radius_arcmin + extent + 1e-6, members))
+
+    return out
+
+
+def __split_page( page, ncols ):
+    """
+    Split the TSV page from cscview into the column-definition
+    lines, the column-name line, and the data lines.
+    """
+    rows = page.split("\n")
+    if len(rows) <= ncols:
+        raise IOError("ERROR: Problem accessing CSC site.  Server responded with the following message: {0}".format(page))
+
+    return rows[:ncols], rows[ncols], [rr for rr in rows[ncols+1:] if len(rr.split("\t")) > 1]
+
+
+def __extra_column_definition( template, name ):
+    """
+    Create the column-definition line for a new column from that
+    of the sepn column.
+    """
+    import re
+
+    if "sepn" not in template:
+        return "#Column\t{0}".format(name)
+
+    line = template.replace("sepn", name)
+    if name == "pos_id":
+        line = re.sub(r'\([EFG][0-9\.]*\)', "(I8)", line)
+
+    return line
+
+
+def search_src_by_positions( positions, radius_arcmin, columns, cat_ver,
+                             merge_arcmin=10.0, workers=4, pool=None ):
+    """
+    Perform a cone search on CSC CLI for many positions.
+
+    Nearby positions - those in the same merge_arcmin cell - are
+    combined into a single query, and the queries are run
+    concurrently using workers threads, re-using the connections
+    from pool (a ciao_contrib.downloadutils.ConnectionPool; one is
+    created if not given).
+
+    The positions are a list of (ra, dec) values, in any format
+    accepted by coords.format.sex2deg. The return value is the
+    same as search_src_by_ra_dec, that is the tab-separated
+    table and the column list, where each row is a match to a
+    single position, so a source can appear multiple times.
+    The rows are ordered by position and the sepn column gives
+    the separation from the position. The extra columns
+
+      pos_id   the position number (starting at 1)
+      ra_in    the RA of the position, in decimal degrees
+      dec_in   the Dec of the position, in decimal degrees
+
+    are added to the end of each row.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from coords.format import sex2deg
+    from ciao_contrib.downloadutils import ConnectionPool
+
+    if workers < 1:
+        raise ValueError("workers must be >= 1, not {0}".format(workers))
+
+    if len(positions) == 0:
+        raise ValueError("No positions to search")
+
+    positions = [tuple(float(v) for v in sex2deg(ra, dec))
+                 for (ra, dec) in positions]
+    groups = group_positions( positions, radius_arcmin, merge_arcmin )
+    verb2("Searching {0} positions using {1} queries".format(len(positions), len(groups)))
+
+    if pool is None:
+        conns = ConnectionPool()
+    else:
+        conns = pool
+
+    def query( group ):
+        (ra, dec, radius, _) = group
+        verb3("Querying ra={0:.6f} dec={1:.6f} radius={2:.4f} arcmin".format(ra, dec, radius))
+        return search_src_by_ra_dec( ra, dec, radius, columns, cat_ver,
+                                     pool=conns )
+
+    try:
+        if workers == 1:
+            pages = [query(group) for group in groups]
+        else:
+            with ThreadPoolExecutor( max_workers=workers ) as executor:
+                pages = list( executor.map( query, groups ))
+    finally:
+        if pool is None:
+            conns.close()
+
+    # Use the first response for the column definitions.
+    cols = pages[0][1]
+    ncols = len(cols)
+    coldefs, colnames, _ = __split_page( pages[0][0], ncols )
+
+    names = colnames.split("\t")
+    try:
+        idx_sepn = names.index("sepn")
+        idx_ra = names.index("ra")
+        idx_dec = names.index("dec")
+    except ValueError:
+        raise IOError("Expected the sepn, ra, and dec columns in the response from cscview")
+
+    matches = [[] for _ in positions]
+    maxsep = radius_arcmin * 60.0
+    for (group, page) in zip(groups, pages):
+        _, _, rows = __split_page( page[0], ncols )
+        for row in rows:
+            vals = row.split("\t")
+            # The source position can be returned in sexagesimal format
+            sra, sdec = sex2deg(vals[idx_ra].strip(), vals[idx_dec].strip())
+            for idx in group[3]:
+                (ra, dec) = positions[idx]
+                sep = __separation_arcsec(ra, dec, sra, sdec)
+                if sep > maxsep:
+                    continue
+
+                out = vals[:]
+                out[idx_sepn] = "{0:.6e}".format(sep)
+                out.extend(["{0}".format(idx + 1),
+                            "{0:.8f}".format(ra),
+                            "{0:.8f}".format(dec)])
+                matches[idx].append("\t".join(out))
+
+    extras = ["pos_id", "ra_in", "dec_in"]
+    lines = list(coldefs)
+    lines.extend([__extra_column_definition(coldefs[idx_sepn], name)
+                  for name in extras])
+    lines.append("\t".join(names + extras))
+    for rows in matches:
+        lines.extend(rows)
+
+    lines.append("")
+
+    outcols = list(cols)
+    outcols.extend(extras)
+    nmatch = sum(len(rows) for rows in matches)
+    verb2("Found {0} matches to {1} positions".format(nmatch, len(positions)))
+    return "\n".join(lines), outcols
+
+
 def search_src_by_obsid( obsid, columns, cat_ver ):
     """
     Perform a obsid search on CSC CLI.
@@ -951,16 +1221,18 @@ def discover_filename_by_force( filetype, obsid, obi, region, band, instrume):
 
     """
     global __filename_version_db__
-    if 0 == len(__filename_version_db__):
-        tab = make_URL_request( "https://cxc.harvard.edu/ciao/threads/csccli/cscrel1_version_info.txt", {} )
-        tab = tab.decode("ascii")
-        __filename_version_db__ = {}
-        for row in tab.split("\n"):
-            vals = row.split()
-            if len(vals) == 5:
-                __filename_version_db__[vals[0]] = { 'calver' : vals[3], 'detver' : vals[1], 'srcver' : vals[2], 'inst' : vals[4] }
-            else:
-                pass
+    with __filename_version_lock__:
+        if 0 == len(__filename_version_db__):
+            tab = make_URL_request( "https://cxc.harvard.edu/ciao/threads/csccli/cscrel1_version_info.txt", {} )
+            tab = tab.decode("ascii")
+            db = {}
+            for row in tab.split("\n"):
+                vals = row.split()
+                if len(vals) == 5:
+                    db[vals[0]] = { 'calver' : vals[3], 'detver' : vals[1], 'srcver' : vals[2], 'inst' : vals[4] }
+                else:
+                    pass
+            __filename_version_db__ = db
     obistr = "{0:05d}_{1:03d}".format( int(obsid), int(obi) )
     filename = "{0}f{1}N".format( instrume.lower(),obistr)
 
@@ -1026,7 +1298,7 @@ def discover_filename_by_force( filetype, obsid, obi, region, band, instrume):
     #~ return filename
 
 
-def discover_filename_via_archive(myfile, obsid, obi, region, band, instrume, catalog):
+def discover_filename_via_archive(myfile, obsid, obi, region, band, instrume, catalog, pool=None):
     """
     Use the csccli browse interface for release 2 file names.
 
@@ -1045,7 +1317,7 @@ def discover_filename_via_archive(myfile, obsid, obi, region, band, instrume, ca
         vals["version"] = __csc_version[catalog]
 
     try:
-        qry = make_URL_request( resource, vals )
+        qry = make_URL_request( resource, vals, pool=pool )
         qry = qry.decode("ascii")
 
         import json as json
@@ -1057,7 +1329,7 @@ def discover_filename_via_archive(myfile, obsid, obi, region, band, instrume, ca
     return filename[0]
 
 
-def discover_filenames_per_type( mysrc, myfile, mybands, catalog ):
+def discover_filenames_per_type( mysrc, myfile, mybands, catalog, pool=None ):
     """
     To discover the filename we need to make a wide query to the
     archive for data products associated with the obisid
@@ -1087,13 +1359,13 @@ def discover_filenames_per_type( mysrc, myfile, mybands, catalog ):
             if 'csc1' == catalog:
                 ff = discover_filename_by_force( myfile, mysrc["obsid"], mysrc["obi"], rr, abbrv, myinst )
             else:
-                ff = discover_filename_via_archive( myfileType["filetype"], mysrc["obsid"], mysrc["obi"], rr, abbrv, myinst, catalog )
+                ff = discover_filename_via_archive( myfileType["filetype"], mysrc["obsid"], mysrc["obi"], rr, abbrv, myinst, catalog, pool=pool )
             filenames.append( ff )
     else:
         if 'csc1' == catalog:
             ff = discover_filename_by_force( myfile , mysrc["obsid"], mysrc["obi"], rr, "", myinst )
         else:
-            ff = discover_filename_via_archive( myfileType["filetype"], mysrc["obsid"], mysrc["obi"], rr, "", myinst, catalog )
+            ff = discover_filename_via_archive( myfileType["filetype"], mysrc["obsid"], mysrc["obi"], rr, "", myinst, catalog, pool=pool )
         filenames = [ ff ]
 
     return filenames
@@ -1114,59 +1386,118 @@ def check_existing( ff, off ):
         return True
 
     if ff in __all_retieved_files__:
-        verb2("File {0} already retrieved, will make a copy".format(ff))
-        import shutil as shutil
-        shutil.copyfile( __all_retieved_files__[ff]+"/{0}.gz".format(ff) , off+".gz")
+        link_existing( __all_retieved_files__[ff], off )
         return True
 
     return False
 
 
-def retrieve_files_per_type( filenames, filetype, root, catalog ):
+def link_existing( infile, off ):
+    """
+    Make off (with the same .gz suffix as infile, if any) a hard link
+    to the already-retrieved file infile, falling back to a copy if
+    the file system does not support hard links.
     """
-    Retrieve the files using the retrieveFile interface.
+    if infile.endswith(".gz"):
+        off += ".gz"
+
+    verb2("File {0} already retrieved, will link to {1}".format(infile, off))
+    try:
+        os.link( infile, off )
+    except OSError:
+        import shutil as shutil
+        shutil.copyfile( infile, off )
 
-    This requires the file name and the file type.
 
-    Added extra logic to skip if the file already exists on
-    disk. Also if already retrieve, then skip.  File may
-    already have been retrieved if the source is an
-    ambigious match -- that is the per-obi source belongs to
-    2 or more master sources.
+def stream_to_file( response, off, gunzip=False, chunksize=DOWNLOAD_CHUNKSIZE ):
     """
+    Write the response to off+".gz", or to off if gunzip is set, and
+    return the name of the file. The data is written in chunks - and
+    decompressed as it is read if gunzip is set - so the file is
+    never held in memory. The file is written to a temporary name
+    and renamed at the end, so an interrupted download does not
+    leave a partial file.
+    """
+    import zlib
 
-    for ff in filenames:
-        if ff is None:
-            continue
+    head = response.read(2)
+    if gunzip and head != b"\x1f\x8b":
+        verb2("Data for {0} is not compressed".format(off))
+        decomp = None
+    elif gunzip:
+        decomp = zlib.decompressobj( 16 + zlib.MAX_WBITS )
+    else:
+        decomp = None
+        off += ".gz"
 
-        off = root + os.sep + ff # path + filename
+    tmpfile = off + ".tmp"
+    try:
+        with open( tmpfile, 'wb' ) as fp:
+            chunk = head
+            while chunk:
+                fp.write( chunk if decomp is None else decomp.decompress(chunk) )
+                chunk = response.read( chunksize )
+
+            if decomp is not None:
+                fp.write( decomp.flush() )
+                if not decomp.eof:
+                    raise IOError("Truncated data for {0}".format(off))
+
+        os.replace( tmpfile, off )
+
+    except BaseException:
+        if os.path.exists( tmpfile ):
+            os.unlink( tmpfile )
+        raise
 
-        if check_existing( ff, off ):
-            continue
+    return off
 
-        resource = "https://cda.cfa.harvard.edu/csccli/retrieveFile"
-        vals = {
-            "filetype" : fileTypes[catalog][filetype]["filetype"],
-            "filename" : ff,
-            }
 
-        if __csc_version[catalog] is not None:
-            vals["version"] = __csc_version[catalog]
+def retrieve_file( ff, filetype, root, catalog, pool=None, gunzip=False ):
+    """
+    Retrieve a single file using the retrieveFile interface,
+    returning the name of the file that was created.
 
-        try:
-            page = make_URL_request( resource, vals )
-        except Exception:
-            verb0("Problem retrieveing file {0}".format(ff))
-            raise
+    The response is streamed to disk when pool (a
+    ciao_contrib.downloadutils.ConnectionPool) is set; otherwise
+    the whole file is read in (as the curl fallback does).
+    """
+    from io import BytesIO
+    from urllib.parse import urlencode
+
+    off = root + os.sep + ff # path + filename
+
+    resource = "https://cda.cfa.harvard.edu/csccli/retrieveFile"
+    vals = {
+        "filetype" : fileTypes[catalog][filetype]["filetype"],
+        "filename" : ff,
+        }
+
+    if __csc_version[catalog] is not None:
+        vals["version"] = __csc_version[catalog]
 
-        # Possible RFE would be to unzip in memory ala chandra_repro
-        with open( off+".gz", 'wb' ) as fp:
-            fp.write(page)
+    try:
+        if pool is None:
+            return stream_to_file( BytesIO(make_URL_request( resource, vals )), off, gunzip=gunzip )
+
+        headers = {'User-Agent': 'ciao_contrib.cda.csccli/1.1',
+                   'Content-Type': 'application/x-www-form-urlencoded'}
+        with pool.open( "POST", resource, headers=headers,
+                        body=urlencode(vals).encode("ascii") ) as response:
+            if response.status == 200:
+                return stream_to_file( response, off, gunzip=gunzip )
+
+            verb5( "URL Code: {0}".format( response.status ))
 
-        verb1("Retrieved file {}".format(off))
+        page = make_CURL_request( resource, vals )
+        if len(page) == 0:
+            raise IOError("Problem accessing resource {0}".format(resource))
 
-        # Save file name and directory where 1st saved
-        __all_retieved_files__[ff] = root
+        return stream_to_file( BytesIO(page), off, gunzip=gunzip )
+
+    except Exception:
+        verb0("Problem retrieveing file {0}".format(ff))
+        raise
 
 
 def create_output_dir( inroot, mysrc, myfiletype, byObi, catalog ):
@@ -1205,7 +1536,8 @@ def create_output_dir( inroot, mysrc, myfiletype, byObi, catalog ):
     root=root.replace(" ","")
 
     if not os.path.exists( root ):
-        os.makedirs( root )
+        # exist_ok since the directory may be created by another thread
+        os.makedirs( root, exist_ok=True )
 
     if not os.path.isdir( root ):
         raise IOError("{0} exists but is not a directory".format(root))
@@ -1239,10 +1571,22 @@ def process_ask( ask, pp ):
             verb0("Unrecognized option '{}'".format( resp ))
 
 
-def retrieve_files( mysrcs, root, myfiles, mybands, ask, catalog, byObi=False ):
+def retrieve_files( mysrcs, root, myfiles, mybands, ask, catalog, byObi=False, workers=4, gunzip=False ):
     """
-    Loop over sources and retrieve files
+    Loop over sources and retrieve files.
+
+    The files are discovered and retrieved using up to workers
+    concurrent requests, which share a pool of connections. A file
+    that is needed by more than one source is only retrieved once,
+    and the other copies are hard links to it. If gunzip is set
+    the files are decompressed as they are retrieved.
     """
+    from ciao_contrib.downloadutils import ConnectionPool
+
+    if workers < 1:
+        raise ValueError("workers must be >= 1, not {0}".format(workers))
+
+    selected = []
     for mysrc in mysrcs:
 
         pp = process_ask( ask, mysrc["name"]+" in "+mysrc["tag"] )
@@ -1250,7 +1594,7 @@ def retrieve_files( mysrcs, root, myfiles, mybands, ask, catalog, byObi=False ):
             continue
         elif 'q' == pp:
             verb0( "Skipping remaining sources")
-            return
+            break
         elif 'a' == pp:
             ask = "all"
         elif 'y' == pp:
@@ -1258,30 +1602,106 @@ def retrieve_files( mysrcs, root, myfiles, mybands, ask, catalog, byObi=False ):
         else:
             raise NotImplementedError("Internal Error: invalid ask value")
 
-        try:
-            retrieve_files_per_src( mysrc, root, myfiles, mybands, catalog, byObi )
-        except ValueError as e:
-            verb0( str(e) )
-            verb0("  Continuing")
+        selected.append( mysrc )
+
+    if len(selected) == 0:
+        return
+
+    pool = ConnectionPool()
+    try:
+        products = run_concurrently( lambda mysrc:
+                                     find_files_per_src( mysrc, root, myfiles, mybands, catalog, byObi, pool=pool ),
+                                     selected, workers )
 
+        retrieve_products( [ prod for prods in products for prod in prods ],
+                           catalog, workers=workers, pool=pool, gunzip=gunzip )
+    finally:
+        pool.close()
 
-def retrieve_files_per_src( mysrc, inroot, myfiles, mybands, catalog, byObi=False ):
+
+def run_concurrently( func, items, workers ):
     """
-    For a single source, loop over file types and retrieve each
+    Call func on each item, using up to workers threads, and return
+    the results in the same order as items.
     """
-    verb1("Retrieving files for obsid_obi {}".format(mysrc["tag"]))
+    from concurrent.futures import ThreadPoolExecutor
 
-    #
-    # Loop overy file types
-    #
-    for ft in fileTypes[catalog]:
-        # compare full list to those requested
-        if ft not in myfiles.split(","):
-            continue
-        root = create_output_dir( inroot, mysrc, ft, byObi, catalog )
-        fnames = discover_filenames_per_type( mysrc, ft, mybands, catalog )
-        if fnames:
-            retrieve_files_per_type( fnames, ft, root, catalog )
+    if workers == 1 or len(items) < 2:
+        return [ func(item) for item in items ]
+
+    with ThreadPoolExecutor( max_workers=workers ) as executor:
+        return list( executor.map( func, items ))
+
+
+def find_files_per_src( mysrc, inroot, myfiles, mybands, catalog, byObi=False, pool=None ):
+    """
+    For a single source, loop over file types and return the
+    (filename, filetype, root) values of the files to retrieve. An
+    empty list is returned, after reporting the error, if a
+    ValueError is raised.
+    """
+    verb1("Finding files for obsid_obi {}".format(mysrc["tag"]))
+
+    retval = []
+    try:
+        #
+        # Loop overy file types
+        #
+        for ft in fileTypes[catalog]:
+            # compare full list to those requested
+            if ft not in myfiles.split(","):
+                continue
+            root = create_output_dir( inroot, mysrc, ft, byObi, catalog )
+            fnames = discover_filenames_per_type( mysrc, ft, mybands, catalog, pool=pool )
+            retval.extend( [ (ff, ft, root) for ff in fnames if ff is not None ] )
+
+    except ValueError as e:
+        verb0( str(e) )
+        verb0("  Continuing")
+        return []
+
+    return retval
+
+
+def retrieve_products( products, catalog, workers=4, pool=None, gunzip=False ):
+    """
+    Retrieve the (filename, filetype, root) products. Each filename
+    is retrieved once - concurrently, using up to workers requests -
+    and any other roots for the same filename are hard links to the
+    retrieved file.
+    """
+
+    # Group the products by file name, retaining the order.
+    byname = {}
+    for (ff, ft, root) in products:
+        byname.setdefault( ff, [] ).append( (ft, root) )
+
+    def retrieve( ff ):
+        outfile = None
+        for (ft, root) in byname[ff]:
+            off = root + os.sep + ff
+            if outfile is not None:
+                if not (os.path.exists( off ) or os.path.exists( off+".gz" )):
+                    link_existing( outfile, off )
+                continue
+
+            # Any remaining roots are linked to the existing file.
+            if check_existing( ff, off ):
+                outfile = off if os.path.exists( off ) else off+".gz"
+                continue
+
+            outfile = retrieve_file( ff, ft, root, catalog, pool=pool, gunzip=gunzip )
+            verb1("Retrieved file {}".format(outfile))
+
+        return outfile
+
+    names = list( byname.keys() )
+    outfiles = run_concurrently( retrieve, names, workers )
+
+    # Save file name where 1st saved
+    for (ff, outfile) in zip( names, outfiles ):
+        if outfile is not None:
+            __all_retieved_files__[ff] = outfile
 
 
 def check_filetypes( alist, catalog ):
@@ -1549,7 +1969,7 @@ def parse_limsens( page ):
     so the CURL path doesn't work.  That's OK since different
     server shouldn't go down that path anyways.
     """
-    import re as re
+    import re
     me_re = re.compile("<table.*table>", flags=re.DOTALL|re.MULTILINE)
     mytab = re.search( me_re, page )
     if mytab is None:
@@ -1,5 +1,5 @@
 #
-#  Copyright (C) 2010, 2011, 2013, 2014, 2015, 2016, 2017, 2019, 2020, 2021, 2022
+#  Copyright (C) 2010, 2011, 2013, 2014, 2015, 2016, 2017, 2019, 2020, 2021, 2022, 2026
 #  Smithsonian Astrophysical Observatory
 #
 #  This program is free software; you can redistribute it and/or modify
@@ -39,16 +39,38 @@ Example with screen output:
   out = download_chandra_obsids([1843, 1844],
              ["vv", "evt1", "asol", "bpix", "mtl"])
 
+Example downloading four files at a time:
+
+  out = download_chandra_obsids([1843, 1844], workers=4)
+
+Each ObsId directory contains a manifest of the downloaded files -
+recording the URL, size, ETag and Last-Modified values, and checksum
+of each file - which is used to avoid querying the archive for files
+that have already been downloaded. The local files can be checked
+against the manifest with
+
+  out = download_chandra_obsids([1843, 1844], verify=True)
+
+The list of files in the archive is also taken from the manifest, so
+files added to the archive after the first download (e.g. by
+reprocessing) are only found when the archive is queried again:
+
+  out = download_chandra_obsids([1843, 1844], relist=True)
+
 """
 
 import sys
 import os
 import os.path
+import json
+import threading
+import time
 
-import ssl
+import http.client
+import urllib.error
 import urllib.parse
-import urllib.request
 
+from concurrent.futures import ThreadPoolExecutor
 from operator import itemgetter
 
 import ciao_contrib.logger_wrapper as lw
@@ -168,15 +190,185 @@ def create_directory(dname):
         return
 
     V3(f"Creating directory: '{dname}'")
-    if dname[-1] == "/":
-        parent = os.path.dirname(dname[:-1])
-    else:
-        parent = os.path.dirname(dname)
 
-    if not os.path.exists(parent):
-        create_directory(parent)
+    # Allow for the directory being created by another thread.
+    os.makedirs(dname, 0o777, exist_ok=True)
+
+
+MANIFEST_NAME = ".download_manifest.json"
+MANIFEST_VERSION = 1
+
+
+class Manifest:
+    """The files that have been downloaded for an ObsId.
+
+    The manifest is stored as a JSON file in the ObsId directory, and
+    records the directory listing of the ObsId and, for each file,
+    the URL, size, ETag and Last-Modified values returned by the
+    server, and - once the file has been fully downloaded - the
+    SHA-256 checksum and modification time of the local file. It is
+    written out each time a file is added, so that it is valid even
+    if the download is interrupted.
+
+    A missing, invalid, or out-of-date manifest is treated as empty.
+    The methods can be called from multiple threads.
+    """
+
+    def __init__(self, obsid):
+        self.obsid = str(obsid)
+        self.filename = os.path.join(self.obsid, MANIFEST_NAME)
+        self.listing = None
+        self.urls = None
+        self.files = {}
+        self.lock = threading.Lock()
+        self.read()
+
+    def read(self):
+        """Read in the manifest, if it exists."""
+
+        try:
+            with open(self.filename, 'r') as fh:
+                contents = json.load(fh)
+
+        except FileNotFoundError:
+            return
+
+        except (OSError, ValueError) as exc:
+            V3(f"Ignoring manifest {self.filename}: {exc}")
+            return
+
+        if not isinstance(contents, dict) or \
+           contents.get('version') != MANIFEST_VERSION:
+            V3(f"Ignoring manifest {self.filename} as the version is not {MANIFEST_VERSION}")
+            return
+
+        V3(f"Read manifest {self.filename}")
+        self.listing = contents.get('listing')
+        self.urls = contents.get('urls')
+        self.files = contents.get('files', {})
+
+    def _write(self):
+        """Write out the manifest; the lock must be held."""
+
+        create_directory(self.obsid)
+        contents = {'version': MANIFEST_VERSION,
+                    'obsid': self.obsid,
+                    'listing': self.listing,
+                    'urls': self.urls,
+                    'files': self.files}
+
+        tmpname = f"{self.filename}.tmp"
+        with open(tmpname, 'w') as fh:
+            json.dump(contents, fh, indent=1, sort_keys=True)
+
+        os.replace(tmpname, self.filename)
+
+    def get_urls(self, listing):
+        """Return the files in the directory, or None if not known.
+
+        The listing argument is the URL of the directory, so that a
+        different mirror site is not assumed to have the same files.
+        """
+
+        if self.listing != listing:
+            return None
+
+        return self.urls
+
+    def set_urls(self, listing, urls):
+        """Record the files in the directory.
+
+        The manifest is not written out by this call.
+        """
+
+        with self.lock:
+            self.listing = listing
+            self.urls = list(urls)
+
+    def get(self, path):
+        """Return the record for the file, or None."""
+
+        return self.files.get(path)
+
+    def is_verified(self, path):
+        """Does the file match the manifest?
+
+        A file matches if it has been fully downloaded and has the
+        same size and modification time as when the checksum was
+        calculated. The file contents are not checked.
+        """
+
+        entry = self.files.get(path)
+        if entry is None or entry.get('sha256') is None:
+            return False
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+
+        return stat.st_size == entry['size'] and \
+            stat.st_mtime_ns == entry['mtime_ns']
+
+    def is_current(self, path, info):
+        """Is the file the same version as the archive?
+
+        The info argument is the downloadutils.DownloadInfo value
+        from the archive. Files which are not in the manifest are
+        assumed to be current.
+        """
+
+        entry = self.files.get(path)
+        if entry is None:
+            return True
+
+        if info.size != entry['size']:
+            return False
+
+        for key, value in [('etag', info.etag),
+                           ('last_modified', info.last_modified)]:
+            if value is not None and entry.get(key) is not None and \
+               value != entry[key]:
+                return False
+
+        return True
 
-    os.mkdir(dname, 0o777)
+    def add(self, path, url, info, checksum=None):
+        """Record the file and write out the manifest.
+
+        The checksum is only given once the file has been fully
+        downloaded.
+        """
+
+        entry = {'url': url,
+                 'size': info.size,
+                 'etag': info.etag,
+                 'last_modified': info.last_modified,
+                 'sha256': checksum}
+        if checksum is not None:
+            entry['mtime_ns'] = os.stat(path).st_mtime_ns
+
+        with self.lock:
+            self.files[path] = entry
+            self._write()
+
+    def touch(self, path):
+        """Update the modification time of the file in the manifest.
+
+        This is used when the file has been found to match the
+        checksum.
+        """
+
+        with self.lock:
+            self.files[path]['mtime_ns'] = os.stat(path).st_mtime_ns
+            self._write()
+
+    def remove(self, path):
+        """Remove the file from the manifest."""
+
+        with self.lock:
+            if self.files.pop(path, None) is not None:
+                self._write()
 
 
 class ObsIdFile:
@@ -224,8 +416,16 @@ class ObsIdFile:
         # can now combine the rest to get the path (dropping the actual
         # file name)
         self.localpath = '/'.join(toks[:-1])
+        self.outfile = os.path.join(self.localpath, self.filename)
 
         self.filesize = None
+        self.etag = None
+        self.last_modified = None
+
+        # Has the local file been checked against the manifest, and
+        # is the archive information taken from the manifest?
+        self.checked = False
+        self.from_manifest = False
 
     def is_type(self, types):
         """Given a list of file types, returns True if
@@ -237,11 +437,12 @@ class ObsIdFile:
         the file is one of these formats."""
         return self.fileformat in formats
 
-    def get_filesize(self, headers):
+    def get_filesize(self, headers, pool=None):
         """Returns the file size in bytes.
 
         The hdr value is added to the request header to enable the
-        user-agent to be changed (or any other header).
+        user-agent to be changed (or any other header). The pool
+        argument is the downloadutils.ConnectionPool to use.
 
         This approach is left-over from the previous FTP code,
         where we could get the size easily. This should now
@@ -252,22 +453,73 @@ class ObsIdFile:
             return self.filesize
 
         V3(f"Finding size of: {self.url}")
+        info = downloadutils.get_download_info(self.url,
+                                               headers=headers,
+                                               pool=pool)
+        self.filesize = info.size
+        self.etag = info.etag
+        self.last_modified = info.last_modified
+        return self.filesize
 
-        req = urllib.request.Request(self.url, headers=headers)
-        try:
-            no_context = ssl._create_unverified_context()
-            with urllib.request.urlopen(req, context=no_context) as rsp:
-                try:
-                    size = int(rsp.info().get('content-length', 0))
-                except ValueError:
-                    size = 0
+    def get_info(self):
+        """Return the archive information for the file.
 
-        except urllib.error.URLError as uerr:
-            V3(f"Unable to get size of {self.url} - {uerr}")
-            size = 0
+        This must be called after get_filesize.
+        """
 
-        self.filesize = size
-        return self.filesize
+        return downloadutils.DownloadInfo(self.filesize, self.etag,
+                                          self.last_modified)
+
+    def use_manifest(self, entry):
+        """Use the manifest rather than query the archive.
+
+        The entry is the manifest record for the file, which
+        has been checked against the local file.
+        """
+
+        self.filesize = entry['size']
+        self.etag = entry['etag']
+        self.last_modified = entry['last_modified']
+        self.checked = True
+        self.from_manifest = True
+
+    def _check_manifest(self, manifest):
+        """Remove the local file if the archive version has changed.
+
+        The file is then recorded in the manifest, so that the
+        version of a partially-downloaded file is known.
+        """
+
+        if self.from_manifest or self.filesize == 0:
+            return
+
+        info = self.get_info()
+        if os.path.exists(self.outfile) and \
+           not manifest.is_current(self.outfile, info):
+            V1(f"The archive version of {self.outfile} has changed, so it will be downloaded again.")
+            os.remove(self.outfile)
+            self.checked = False
+
+        if manifest.get(self.outfile) is None or \
+           not manifest.is_current(self.outfile, info):
+            manifest.add(self.outfile, self.url, info)
+
+    def _update_manifest(self, manifest):
+        """Add the checksum of a fully-downloaded file."""
+
+        if self.checked or self.filesize == 0:
+            return
+
+        try:
+            if os.path.getsize(self.outfile) != self.filesize:
+                return
+        except OSError:
+            return
+
+        checksum = downloadutils.file_checksum(self.outfile)
+        manifest.add(self.outfile, self.url, self.get_info(),
+                     checksum=checksum)
+        self.checked = True
 
     def get_download_line_header(self, slabel):
         """Return the start of the download information
@@ -281,7 +533,9 @@ class ObsIdFile:
 
         return f"  {ftype:8s} {self.fileformat:6s} {slabel:>9s}  "
 
-    def download(self, headers):
+    def download(self, headers, pool=None,
+                 chunksize=downloadutils.DEFAULT_CHUNKSIZE,
+                 progress=None, manifest=None):
         """Download the file.
 
         The file is written to the location obsid/filename and screen
@@ -293,6 +547,18 @@ class ObsIdFile:
         resume the download. If the size is larger then we skip, but
         with a warning message.
 
+        The pool argument is the downloadutils.ConnectionPool to use
+        and chunksize is the size of each read, in bytes. When the
+        file is one of several being downloaded at once, progress is
+        the downloadutils.MultiProgress instance used to display the
+        progress (and a single line is displayed once the file has
+        been downloaded).
+
+        If manifest is set then it is used to check whether the
+        archive version of the file has changed (in which case the
+        local copy is replaced), and the file - and its checksum,
+        once fully downloaded - is added to it.
+
         The return value is a tuple of number of bytes and download
         time in seconds (if nothing is downloaded then the values are
         set to 0).
@@ -301,24 +567,73 @@ class ObsIdFile:
         verbose = LOGGER.getEffectiveVerbose() > 0
 
         V3(f"Starting download of {self.filename}")
-        size = self.get_filesize(headers)
+        size = self.get_filesize(headers, pool=pool)
 
         if self.localpath != '':
             create_directory(self.localpath)
 
-        outfile = os.path.join(self.localpath, self.filename)
+        if manifest is not None:
+            self._check_manifest(manifest)
 
-        # Can not use V1 here since do not want to add an end-of-line
-        # character
-        if verbose:
-            slabel = downloadutils.stringify_size(size)
-            sys.stdout.write(self.get_download_line_header(slabel))
+        if progress is not None:
+            out = self._download_multi(headers, pool, chunksize,
+                                       progress, verbose)
 
-        return downloadutils.download_progress(self.url,
-                                               size,
-                                               outfile,
-                                               headers=headers,
-                                               verbose=verbose)
+        else:
+            # Can not use V1 here since do not want to add an
+            # end-of-line character
+            if verbose:
+                slabel = downloadutils.stringify_size(size)
+                sys.stdout.write(self.get_download_line_header(slabel))
+
+            out = downloadutils.download_progress(self.url,
+                                                  size,
+                                                  self.outfile,
+                                                  headers=headers,
+                                                  chunksize=chunksize,
+                                                  verbose=verbose,
+                                                  pool=pool)
+
+        if manifest is not None:
+            self._update_manifest(manifest)
+
+        return out
+
+    def _download_multi(self, headers, pool, chunksize, progress,
+                        verbose):
+        """Download the file as one of several downloads."""
+
+        fprogress = progress.file(self.filesize) if verbose else None
+        try:
+            (nbytes, dtime) = \
+                downloadutils.download_progress(self.url,
+                                                self.filesize,
+                                                self.outfile,
+                                                headers=headers,
+                                                progress=fprogress,
+                                                chunksize=chunksize,
+                                                verbose=False,
+                                                pool=pool)
+
+        except BaseException:
+            if fprogress is not None:
+                fprogress.finish()
+
+            raise
+
+        if fprogress is not None:
+            slabel = downloadutils.stringify_size(self.filesize)
+            msg = f"  {self.obsid:>6s}" + self.get_download_line_header(slabel)
+            if nbytes == 0:
+                msg += f"{'already downloaded':>20s}"
+            else:
+                tlabel = downloadutils.stringify_dt(dtime)
+                rate = nbytes / (1024 * dtime) if dtime > 0 else 0.0
+                msg += f"{tlabel:>13s}  {rate:.1f} kb/s"
+
+            fprogress.finish(msg)
+
+        return (nbytes, dtime)
 
 
 class ObsId:
@@ -328,20 +643,39 @@ class ObsId:
     so useful now we've switched to HTTP.
     """
 
-    def __init__(self, obsid, base_url, hdr):
+    def __init__(self, obsid, base_url, hdr, pool=None, relist=False):
         """Store the available files for the given obsid.
 
         Note that base_url is a string and not parsed URL.
         hdr is the dictionary containing the header keywords
-        to add to any request.
+        to add to any request. The pool argument is the
+        downloadutils.ConnectionPool used to query and download
+        the files; if None then one is created.
+
+        The list of files is taken from the manifest of the ObsId,
+        if it exists, unless relist is set, in which case the
+        archive is always queried.
         """
 
         self.obsid = obsid
         self.base_url = base_url
         self.header = hdr
+        if pool is None:
+            pool = downloadutils.ConnectionPool()
+
+        self.pool = pool
+        self.manifest = Manifest(obsid)
 
         ostr = str(obsid)
         urlname = f"{base_url}/{ostr[-1]}/{ostr}"
+
+        urls = None if relist else self.manifest.get_urls(urlname)
+        if urls is not None:
+            V3(f"Using the manifest for directory: {urlname}")
+            self.files = [ObsIdFile(obsid, url) for url in urls]
+            V3(f"Found {len(self.files)} files")
+            return
+
         V3(f"Looking for directory: {urlname}")
 
         try:
@@ -363,6 +697,7 @@ class ObsId:
             emsg = f"Unable to reach {urlname}\n{uerr.reason}"
             raise IOError(emsg)
 
+        self.manifest.set_urls(urlname, urls)
         self.files = [ObsIdFile(obsid, url) for url in urls]
         V3(f"Found {len(self.files)} files")
 
@@ -407,9 +742,10 @@ class ObsId:
         to the HTTP server (at least the first time).
         """
 
-        return sum([f.get_filesize(self.header) for f in self.files])
+        return sum([f.get_filesize(self.header, pool=self.pool)
+                    for f in self.files])
 
-    def download(self):
+    def download(self, chunksize=downloadutils.DEFAULT_CHUNKSIZE):
         """Download the files for the ObsId to the current
         working directory.
 
@@ -447,7 +783,9 @@ class ObsId:
             fileobj = itemgetter(1)(oelem)
 
             try:
-                (a, b) = fileobj.download(self.header)
+                (a, b) = fileobj.download(self.header, pool=self.pool,
+                                          chunksize=chunksize,
+                                          manifest=self.manifest)
             except urllib.error.URLError as uerr:
                 V1(f"SKIPPING {fileobj.filename} as {uerr}")
                 continue
@@ -470,9 +808,202 @@ def get_http_header():
     return {'User-Agent': 'cxc/download-chandra-obsid'}
 
 
+def find_obsids(obsids, base_url, hdr, pool, workers=1, relist=False):
+    """Return the ObsId objects for the obsids.
+
+    The directory listings are read using workers threads. The
+    return value matches the order of obsids, with None used
+    for those ObsIds that could not be found. The relist argument
+    is sent to ObsId.
+    """
+
+    def find(obsid):
+        V3(f"Setting up for ObsId {obsid}")
+        try:
+            return ObsId(obsid, base_url, hdr, pool=pool, relist=relist)
+        except IOError as ierr:
+            V3(f"Unable to cd to ObsId {obsid}: msg={ierr}")
+            return None
+
+    if workers == 1:
+        return [find(obsid) for obsid in obsids]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(find, obsids))
+
+
+def check_files(oids, verify=False, workers=1):
+    """Compare the local files to the manifest of each ObsId.
+
+    Files which match the manifest are not queried or downloaded.
+    A file matches if it has not been changed since the checksum
+    was calculated (the size and modification time are the same),
+    or, if it has been changed, the checksum still matches.
+    When verify is set the checksum of every file is re-calculated,
+    and the archive is still queried for these files (so that
+    any change to the archive version will be found).
+
+    Local files which do not match the checksum are deleted, so
+    that they will be downloaded again. The checksums are
+    calculated using workers threads.
+    """
+
+    todo = []
+    for oid in oids:
+        for fileobj in oid.files:
+            entry = oid.manifest.get(fileobj.outfile)
+            if entry is None or entry.get('sha256') is None:
+                continue
+
+            if not verify and oid.manifest.is_verified(fileobj.outfile):
+                fileobj.use_manifest(entry)
+                continue
+
+            try:
+                size = os.path.getsize(fileobj.outfile)
+            except OSError:
+                continue
+
+            # Leave partial downloads to be completed.
+            if size == entry['size']:
+                todo.append((oid, fileobj, entry))
+
+    if len(todo) == 0:
+        return
+
+    V3(f"Calculating the checksum of {len(todo)} files")
+
+    def check(elem):
+        try:
+            checksum = downloadutils.file_checksum(elem[1].outfile)
+        except OSError as exc:
+            V3(f"Unable to read {elem[1].outfile}: {exc}")
+            return False
+
+        return checksum == elem[2]['sha256']
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        matches = list(executor.map(check, todo))
+
+    nbad = 0
+    for (oid, fileobj, entry), match in zip(todo, matches):
+        if match:
+            oid.manifest.touch(fileobj.outfile)
+            if verify:
+                fileobj.checked = True
+            else:
+                fileobj.use_manifest(entry)
+
+            continue
+
+        V1(f"{fileobj.outfile} does not match the manifest, so it will be downloaded again.")
+        nbad += 1
+        try:
+            os.remove(fileobj.outfile)
+        except OSError:
+            pass
+
+        oid.manifest.remove(fileobj.outfile)
+
+    if verify:
+        V1(f"Verified {len(todo) - nbad} of {len(todo)} files.\n")
+
+
+def download_files(oids, workers,
+                   chunksize=downloadutils.DEFAULT_CHUNKSIZE):
+    """Download the files from multiple ObsIds at the same time.
+
+    The files are downloaded by workers threads, using the
+    connection pool of each ObsId, with the largest files started
+    first. The progress is displayed with a single status line
+    rather than a progress bar per file. Files that can not be
+    downloaded are skipped.
+
+    Parameters
+    ----------
+    oids : sequence of ObsId
+        The ObsIds to download, after any filtering.
+    workers : int
+        The number of files to download at once.
+    chunksize : int, optional
+        The size of each read, in bytes.
+
+    Returns
+    -------
+    nbytes, dtime : int, float
+        The number of bytes downloaded and the time taken, in seconds.
+    """
+
+    todo = [(oid, fileobj) for oid in oids for fileobj in oid.files]
+    V3(f"Downloading {len(todo)} files from {len(oids)} ObsIds")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = executor.map(lambda t: t[1].get_filesize(t[0].header,
+                                                         pool=t[0].pool),
+                             todo)
+        sizes = list(sizes)
+
+    for oid in oids:
+        if sum([f.filesize for f in oid.files]) == 0:
+            V1(f"No files found for ObsId {oid.obsid}!")
+
+    todo = [t for t, size in zip(todo, sizes) if size > 0]
+    if len(todo) == 0:
+        return (0, 0)
+
+    total = sum([t[1].filesize for t in todo])
+    nobs = len(set([oid.obsid for (oid, _) in todo]))
+    size_label = downloadutils.stringify_size(total)
+    V1(f"Downloading {len(todo)} files for {nobs} ObsIds, total size is {size_label}.\n")
+    V1("   ObsId  Type     Format      Size  Download Time Average Rate")
+    V1("  -------------------------------------------------------------")
+
+    if LOGGER.getEffectiveVerbose() > 0:
+        progress = downloadutils.MultiProgress(len(todo), total)
+    else:
+        progress = None
+
+    def download(elem):
+        (oid, fileobj) = elem
+        try:
+            return fileobj.download(oid.header, pool=oid.pool,
+                                    chunksize=chunksize,
+                                    progress=progress,
+                                    manifest=oid.manifest)
+        except (OSError, http.client.HTTPException) as exc:
+            V1(f"SKIPPING {fileobj.filename} as {exc}")
+            return (0, 0)
+
+    # Start the largest files first.
+    #
+    todo.sort(key=lambda t: t[1].filesize, reverse=True)
+
+    time0 = time.time()
+    nbytes = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for (a, _) in executor.map(download, todo):
+            nbytes += a
+
+    dtime = time.time() - time0
+    if progress is not None:
+        progress.end()
+
+    if nbytes > 0:
+        V1("")
+        V1(f"      Total download size = {downloadutils.stringify_size(nbytes)}")
+        V1(f"      Total download time = {downloadutils.stringify_dt(dtime)}")
+
+    V1("")
+    return (nbytes, dtime)
+
+
 def download_chandra_obsids(obsids,
                             filetypes=None, excludes=None,
-                            mirror=None
+                            mirror=None,
+                            workers=1,
+                            chunksize=downloadutils.DEFAULT_CHUNKSIZE,
+                            verify=False,
+                            relist=False
                             ):
     """Download the obsids from the Chandra Data Archive -
     https://cxc.harvard.edu/cda/ - or a mirror site.
@@ -502,6 +1033,26 @@ def download_chandra_obsids(obsids,
         value is equivalent to setting mirror to
         https://cxc.cfa.harvard.edu/cdaftp/. Note that this is not
         tested.
+    workers : int, optional
+        The number of files to download at once. When greater than
+        one the files from all the ObsIds are downloaded together,
+        rather than one ObsId at a time, and the progress of the
+        downloads is displayed as a single status line rather than
+        a progress bar per file.
+    chunksize : int, optional
+        The size, in bytes, of each read from the server.
+    verify : bool, optional
+        If set then the checksum of every local file in the manifest
+        is re-calculated, files which do not match are downloaded
+        again, and the archive is queried for the list of files and
+        their versions rather than using the manifest.
+    relist : bool, optional
+        If set then the archive is queried for the list of files,
+        rather than using the list stored in the manifest, so that
+        any files added to the archive since the last call are
+        downloaded. Unlike verify, the checksums of the local files
+        are not re-calculated. The list is always queried when verify
+        is set.
 
     Returns
     -------
@@ -520,6 +1071,21 @@ def download_chandra_obsids(obsids,
     variable if mirror=None (this is assumed to have been resolved by
     the time the routine has been called).
 
+    Connections to the server are re-used (keep-alive) for all the
+    requests, and a partially-downloaded file is completed rather
+    than being downloaded again, whatever the workers setting.
+
+    Each ObsId directory contains a manifest (the MANIFEST_NAME
+    file) recording the files in the archive and, for each
+    downloaded file, the size, ETag and Last-Modified values from
+    the archive and the checksum of the file. When the routine is
+    re-run the archive is not queried for the list of files or for
+    those files which have not changed since they were downloaded,
+    so files that are added to the archive later - such as when
+    the observation is reprocessed - are not found unless relist or
+    verify is set. A file is downloaded again if the archive version
+    changes.
+
     The mirror site must have the same directory stucture as the CDA
     starting at the byobsid directory, but it need not contain all the
     data; the routine will just not be able to download the missing
@@ -544,8 +1110,18 @@ def download_chandra_obsids(obsids,
 
     >>> download_chandra_obsid([1843, 1557], filetypes=['evt2', 'asol'])
 
+    >>> download_chandra_obsid([1843, 1557], workers=4)
+
     """
 
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, not {workers}")
+
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, not {chunksize}")
+
+    relist = relist or verify
+
     if filetypes is not None and excludes is not None:
         filetypes = list(set(filetypes).difference(set(excludes)))
         excludes = None
@@ -571,21 +1147,49 @@ def download_chandra_obsids(obsids,
     base_url += "byobsid"
 
     hdr = get_http_header()
+    pool = downloadutils.ConnectionPool()
 
-    for obsid in obsids:
-        V3(f"Setting up for ObsId {obsid}")
-        try:
-            oid = ObsId(obsid, base_url, hdr)
-        except IOError as ierr:
-            V3(f"Unable to cd to ObsId {obsid}: msg={ierr}")
-            V1(f"Skipping ObsId {obsid} as it was not found on the {sitename} site.")
-            out.append(False)
-            continue
+    # The checksums are calculated in parallel even when the files
+    # are downloaded one at a time.
+    #
+    nhash = max(workers, os.cpu_count() or 1)
+
+    try:
+        if workers == 1:
+            for obsid in obsids:
+                oid = find_obsids([obsid], base_url, hdr, pool,
+                                  relist=relist)[0]
+                if oid is None:
+                    V1(f"Skipping ObsId {obsid} as it was not found on the {sitename} site.")
+                    out.append(False)
+                    continue
+
+                oid.filter_files(types=filetypes, excludes=excludes,
+                                 formats=None)
+                check_files([oid], verify=verify, workers=nhash)
+                oid.download(chunksize=chunksize)
+                out.append(True)
+
+            return out
+
+        oids = find_obsids(obsids, base_url, hdr, pool, workers=workers,
+                           relist=relist)
+        for obsid, oid in zip(obsids, oids):
+            if oid is None:
+                V1(f"Skipping ObsId {obsid} as it was not found on the {sitename} site.")
+                out.append(False)
+                continue
+
+            oid.filter_files(types=filetypes, excludes=excludes,
+                             formats=None)
+            out.append(True)
 
-        oid.filter_files(types=filetypes, excludes=excludes, formats=None)
-        oid.download()
-        out.append(True)
+        oids = [oid for oid in oids if oid is not None]
+        check_files(oids, verify=verify, workers=nhash)
+        download_files(oids, workers=workers, chunksize=chunksize)
+        return out
 
-    return out
+    finally:
+        pool.close()
 
 # End
@@ -49,6 +49,13 @@ Example
 >>> print(obsinfo['obsid'])
 >>> write_columns('search.dat', obsinfo, kernel='simple')
 
+Searches can also use a local index of the archive, created by
+ciao_contrib.cda.archive_index.build_index, rather than the
+footprint service:
+
+>>> sr = search_chandra_archive(8.815, -43.566, size=0.3,
+...                             index='chandra.npz')
+
 """
 
 import numpy as np
@@ -60,6 +67,7 @@ import coords.format as coords
 import coords.utils as cutils
 
 from ciao_contrib.downloadutils import retrieve_url
+from ciao_contrib.cda.archive_index import ArchiveIndex
 
 import ciao_contrib.logger_wrapper as lw
 
@@ -72,6 +80,7 @@ v5 = logger.verbose5
 __all__ = (
     "search_chandra_archive",
     "get_chandra_obs",
+    "get_archive_index",
 )
 
 
@@ -397,9 +406,41 @@ def _make_query(url):
     return ans
 
 
+_indexes = {}
+
+
+def get_archive_index(index):
+    """Return the ArchiveIndex for the index argument.
+
+    Parameters
+    ----------
+    index : str or ArchiveIndex
+        The file name of the index, or the index itself. The file
+        is only read in the first time it is used.
+
+    Returns
+    -------
+    index : ArchiveIndex
+
+    """
+
+    if isinstance(index, ArchiveIndex):
+        return index
+
+    try:
+        return _indexes[index]
+    except KeyError:
+        pass
+
+    out = ArchiveIndex(index)
+    _indexes[index] = out
+    return out
+
+
 def search_chandra_archive(ra, dec, size=0.1,
                            instrument=None,
-                           grating=None):
+                           grating=None,
+                           index=None):
     """Find Chandra observations which cover the location.
 
     This only search publically-available observations, and can
@@ -422,6 +463,11 @@ def search_chandra_archive(ra, dec, size=0.1,
         If not None, then restrict the search to observations which
         contain the given grating. Supported values are
         "none", "letg", and "hetg".
+    index : None, str, or ArchiveIndex, optional
+        If set, search this local index of the archive (see
+        ciao_contrib.cda.archive_index) rather than the footprint
+        service. The footprints in the index are approximate, so
+        extra observations may be returned.
 
     Returns
     -------
@@ -443,6 +489,8 @@ def search_chandra_archive(ra, dec, size=0.1,
                                      instrument=["acis-s", "hrc-s"],
                                      grating=["letg"])
 
+    >>> ans = search_chandra_archive(47.23, -12.34, index='chandra.npz')
+
     Notes
     -----
     This routine tries to use Python's inbuilt https support, but
@@ -450,9 +498,6 @@ def search_chandra_archive(ra, dec, size=0.1,
 
     """
 
-    url = construct_query(ra, dec, size,
-                          instrument=instrument)
-
     if grating is not None:
         # we don't use grating in the query but want to validate
         # the value before making a query
@@ -460,17 +505,32 @@ def search_chandra_archive(ra, dec, size=0.1,
     else:
         gfilters = None
 
-    out = _make_query(url)
+    if index is None:
+        url = construct_query(ra, dec, size,
+                              instrument=instrument)
+        out = _make_query(url)
+
+    else:
+        if instrument is None:
+            insts = None
+        else:
+            insts = set()
+            for i in instrument:
+                insts.update(_fconv("instrument", i).split(","))
+
+        out = get_archive_index(index).search(ra, dec, size,
+                                              instruments=insts)
 
     # It appears you can not filter on grating using the SIA
     # interface, so do it manually (if there is any filtering
     # needed).
     #
-    nsearch = len(out)
-    if out is None or nsearch == 0:
+    if out is None or len(out) == 0:
         v3("Search returned no matches")
         return None
 
+    nsearch = len(out)
+
     if grating is None:
         v3(f"Search returned {nsearch} rows")
         return out
@@ -1,5 +1,5 @@
 #
-#  Copyright (C) 2018, 2020
+#  Copyright (C) 2018, 2020, 2026
 #            Smithsonian Astrophysical Observatory
 #
 #  This program is free software; you can redistribute it and/or modify
@@ -43,12 +43,30 @@ find_all_downloadable_files
 
 Similar to find_downloadble_files but recurses through all sub-directories.
 
+ConnectionPool
+--------------
+
+Re-use HTTP and HTTPS connections (keep-alive) for multiple requests
+to the same server. The pool can be shared between threads.
+
 ProgressBar
 -----------
 
 Display a "progress" bar, indicating the progress of a download.
 This has very-limited functionality.
 
+MultiProgress
+-------------
+
+Display the combined progress of several downloads that are running
+at the same time.
+
+get_download_info, file_checksum
+--------------------------------
+
+Find the size and version (ETag and Last-Modified) of a URL, and
+the checksum of a local file, so that downloads can be verified.
+
 download_progress
 -----------------
 
@@ -56,6 +74,7 @@ Download a URL to a file, supporting
 
   - continuation of a previous partial download
   - a rudimentary progress bar to display progress
+  - re-use of connections from a ConnectionPool
 
 Stability
 ---------
@@ -66,15 +85,20 @@ at your own risk.
 
 """
 
+import hashlib
 import os
 import sys
 import ssl
+import threading
 import time
 
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
 from io import BytesIO
 from subprocess import check_output
 
 import urllib.error
+import urllib.parse
 import urllib.request
 import http.client
 
@@ -94,10 +118,21 @@ v4 = logger.verbose4
 __all__ = ('retrieve_url',
            'find_downloadable_files',
            'find_all_downloadable_files',
+           'ConnectionPool',
            'ProgressBar',
+           'MultiProgress',
+           'DownloadInfo',
+           'get_download_info',
+           'get_download_size',
+           'file_checksum',
            'download_progress')
 
 
+# The default size, in bytes, of the reads used by download_progress.
+#
+DEFAULT_CHUNKSIZE = 256 * 1024
+
+
 def manual_download(url):
     """Try curl then wget to query the URL.
 
@@ -408,6 +443,160 @@ def find_all_downloadable_files(urlname, headers):
     return out
 
 
+class ConnectionPool:
+    """Re-use connections to HTTP and HTTPS servers.
+
+    Connections are kept open (keep-alive) once a response has been
+    read, so that the next request to the same server does not need
+    to create a new connection (and, for HTTPS, repeat the TLS
+    handshake). The pool can be used by multiple threads, but each
+    connection is only used by one thread at a time.
+
+    Parameters
+    ----------
+    timeout : number or None, optional
+        The timeout, in seconds, for the connections. If None then
+        the default socket timeout is used.
+
+    Notes
+    -----
+    As with download_progress, HTTPS connections are made *without*
+    SSL validation.
+
+    Examples
+    --------
+
+    >>> pool = ConnectionPool()
+    >>> with pool.open('HEAD', 'https://cxc.cfa.harvard.edu/cdaftp/') as rsp:
+    ...     print(rsp.status)
+    ...
+    >>> pool.close()
+
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle = defaultdict(list)
+
+    def _new_connection(self, key):
+        (scheme, netloc) = key
+        kwargs = {}
+        if self.timeout is not None:
+            kwargs['timeout'] = self.timeout
+
+        if scheme == 'https':
+            no_context = ssl._create_unverified_context()
+            return http.client.HTTPSConnection(netloc, context=no_context,
+                                               **kwargs)
+
+        if scheme == 'http':
+            return http.client.HTTPConnection(netloc, **kwargs)
+
+        raise ValueError("Unsupported URL scheme: {}".format(scheme))
+
+    def _get_connection(self, key):
+        """Return (connection, reused)."""
+
+        with self._lock:
+            try:
+                return (self._idle[key].pop(), True)
+            except IndexError:
+                pass
+
+        v4("Creating connection to {}://{}".format(*key))
+        return (self._new_connection(key), False)
+
+    def _request(self, key, method, path, headers, body):
+        """Make the request, returning (connection, response)."""
+
+        (conn, reused) = self._get_connection(key)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return (conn, conn.getresponse())
+
+        except (ConnectionError, http.client.BadStatusLine) as exc:
+            conn.close()
+
+            # The server may have closed an idle connection, so try
+            # again with a new connection.
+            #
+            if not reused:
+                raise
+
+            v4("Retrying request for {} after {}".format(path, exc))
+
+        except BaseException:
+            conn.close()
+            raise
+
+        conn = self._new_connection(key)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return (conn, conn.getresponse())
+
+        except BaseException:
+            conn.close()
+            raise
+
+    @contextmanager
+    def open(self, method, url, headers=None, body=None):
+        """Make a request, returning the response.
+
+        This is a context manager. The connection is returned to
+        the pool on exit if the response has been read in full and
+        the server allows the connection to be re-used, otherwise it
+        is closed.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method, e.g. 'GET' or 'HEAD'.
+        url : str
+            The URL, which must use the http or https scheme.
+        headers : dict or None, optional
+            The headers to add to the request.
+        body : bytes or None, optional
+            The data to send (e.g. for a POST request).
+
+        """
+
+        purl = urllib.parse.urlparse(url)
+        key = (purl.scheme, purl.netloc)
+        if purl.scheme not in ['http', 'https']:
+            raise ValueError("Unsupported URL scheme: {}".format(url))
+
+        path = purl.path
+        if purl.query:
+            path += '?' + purl.query
+
+        (conn, rsp) = self._request(key, method, path,
+                                    {} if headers is None else headers,
+                                    body)
+        try:
+            yield rsp
+
+        finally:
+            if rsp.isclosed() and not rsp.will_close:
+                with self._lock:
+                    self._idle[key].append(conn)
+
+            else:
+                rsp.close()
+                conn.close()
+
+    def close(self):
+        """Close all the idle connections."""
+
+        with self._lock:
+            idle = self._idle
+            self._idle = defaultdict(list)
+
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
 class ProgressBar:
     """A very-simple progress "bar".
 
@@ -534,6 +723,183 @@ class ProgressBar:
         self.hdl.flush()
 
 
+class MultiProgress:
+    """Display the combined progress of several downloads.
+
+    This is used when files are downloaded at the same time (e.g. by
+    multiple threads), where a ProgressBar per file can not be
+    used. A line is written to stdout as each file is finished and,
+    when stdout is a terminal, a status line (the number of files and
+    bytes downloaded and the average rate) is displayed below it and
+    updated as data is downloaded. As with ProgressBar, there is no
+    logic to conditionally display the output.
+
+    Parameters
+    ----------
+    nfiles : int
+        The number of files to download.
+    size : int
+        The number of bytes to download.
+    interval : number, optional
+        The minimum time, in seconds, between updates of the status
+        line.
+
+    Examples
+    --------
+
+    Each file is represented by the object returned by the file
+    method, which is sent to download_progress as the progress
+    argument, and then the finish method of this object is called
+    with the line to display once the download has finished.
+
+    >>> progress = MultiProgress(2, 213948 + 12345)
+    >>> fprogress = progress.file(213948)
+    >>> download_progress(url, 213948, outfile, progress=fprogress,
+    ...                   verbose=False)
+    >>> fprogress.finish('  evt2 downloaded')
+    ...
+    >>> progress.end()
+
+    """
+
+    def __init__(self, nfiles, size, interval=0.5):
+        if size < 0:
+            raise ValueError("size can not be negative")
+
+        self.nfiles = nfiles
+        self.size = size
+        self.interval = interval
+
+        self.hdl = sys.stdout
+        try:
+            self.interactive = self.hdl.isatty()
+        except AttributeError:
+            self.interactive = False
+
+        self.lock = threading.Lock()
+        self.ndone = 0
+        self.added = 0
+        self.downloaded = 0
+        self.time0 = time.time()
+        self.lastupdate = None
+        self.lastlen = 0
+
+    def file(self, size):
+        """Return the progress object for a file.
+
+        Parameters
+        ----------
+        size : int
+            The number of bytes in the file.
+        """
+
+        return _FileProgress(self, size)
+
+    def _status(self):
+        dtime = time.time() - self.time0
+        if dtime > 0:
+            rate = self.downloaded / (1024 * dtime)
+        else:
+            rate = 0.0
+
+        return "  {}/{} files  {} of {}  {:.1f} kb/s".format(
+            self.ndone, self.nfiles,
+            stringify_size(self.added), stringify_size(self.size),
+            rate)
+
+    def _clear(self):
+        if self.lastlen > 0:
+            self.hdl.write("\r" + " " * self.lastlen + "\r")
+            self.lastlen = 0
+
+    def _show_status(self, force=False):
+        """Update the status line; the lock must be held."""
+
+        if not self.interactive:
+            return
+
+        now = time.time()
+        if not force and self.lastupdate is not None and \
+           now - self.lastupdate < self.interval:
+            return
+
+        status = self._status()
+        self._clear()
+        self.hdl.write(status)
+        self.hdl.flush()
+        self.lastlen = len(status)
+        self.lastupdate = now
+
+    def _add(self, nbytes, downloaded):
+        with self.lock:
+            self.added += nbytes
+            if downloaded:
+                self.downloaded += nbytes
+
+            self._show_status()
+
+    def _finish(self, nbytes, msg):
+        with self.lock:
+            self.added += nbytes
+            self.ndone += 1
+            self._clear()
+            if msg is not None:
+                self.hdl.write(msg + "\n")
+
+            self._show_status(force=True)
+            self.hdl.flush()
+
+    def end(self):
+        """Finished all the downloads, so remove the status line."""
+
+        with self.lock:
+            self._clear()
+            self.hdl.flush()
+
+
+class _FileProgress:
+    """The progress of a single file for MultiProgress.
+
+    This has the start, add, and end methods of ProgressBar so that
+    it can be used by download_progress.
+    """
+
+    def __init__(self, parent, size):
+        self.parent = parent
+        self.size = size
+        self.added = 0
+
+    def start(self, nbytes=0):
+        self.added = nbytes
+        self.parent._add(nbytes, False)
+
+    def add(self, nbytes):
+        if nbytes < 0:
+            raise ValueError("nbytes must be positive")
+
+        self.added += nbytes
+        self.parent._add(nbytes, True)
+
+    def end(self):
+        pass
+
+    def finish(self, msg=None):
+        """The file has been processed.
+
+        The total is adjusted so that the file counts as fully
+        downloaded (e.g. if it was skipped because it already
+        exists).
+
+        Parameters
+        ----------
+        msg : str or None, optional
+            The line to display.
+        """
+
+        self.parent._finish(max(self.size - self.added, 0), msg)
+        self.added = max(self.size, self.added)
+
+
 def myint(x):
     """Convert to an integer, my way."""
     return int(x + 0.5)
@@ -647,11 +1013,132 @@ def stringify_size(s):
     return lbl
 
 
+DownloadInfo = namedtuple('DownloadInfo', ['size', 'etag', 'last_modified'])
+DownloadInfo.__doc__ = """The size and version information of a URL.
+
+The etag and last_modified fields are the ETag and Last-Modified
+headers returned by the server, and are None if not set.
+"""
+
+
+def get_download_info(url, headers=None, pool=None):
+    """Return the size and version information of the URL.
+
+    Parameters
+    ----------
+    url : str
+        The URL to query; this must be http or https based.
+    headers : dict, optional
+        Any additions to the HTTP header in the request.
+    pool : ConnectionPool instance, optional
+        The connections to use. If not set then a new connection is
+        made.
+
+    Returns
+    -------
+    info : DownloadInfo
+        The size is the Content-Length value of a HEAD request, or 0
+        if it is not known or the URL can not be accessed.
+
+    See Also
+    --------
+    get_download_size
+
+    """
+
+    if pool is None:
+        conns = ConnectionPool()
+    else:
+        conns = pool
+
+    try:
+        with conns.open('HEAD', url, headers=headers) as rsp:
+            rsp.read()
+            if rsp.status != 200:
+                v3("Unable to get size of {} - status={}".format(url,
+                                                                 rsp.status))
+                return DownloadInfo(0, None, None)
+
+            try:
+                size = int(rsp.getheader('content-length', 0))
+            except ValueError:
+                size = 0
+
+            return DownloadInfo(size, rsp.getheader('etag'),
+                                rsp.getheader('last-modified'))
+
+    except (OSError, http.client.HTTPException) as exc:
+        v3("Unable to get size of {} - {}".format(url, exc))
+        return DownloadInfo(0, None, None)
+
+    finally:
+        if pool is None:
+            conns.close()
+
+
+def get_download_size(url, headers=None, pool=None):
+    """Return the size of the URL, in bytes.
+
+    Parameters
+    ----------
+    url : str
+        The URL to query; this must be http or https based.
+    headers : dict, optional
+        Any additions to the HTTP header in the request.
+    pool : ConnectionPool instance, optional
+        The connections to use. If not set then a new connection is
+        made.
+
+    Returns
+    -------
+    size : int
+        The size (the Content-Length value of a HEAD request), or 0
+        if it is not known or the URL can not be accessed.
+
+    See Also
+    --------
+    get_download_info
+
+    """
+
+    return get_download_info(url, headers=headers, pool=pool).size
+
+
+def file_checksum(filename, blocksize=1024 * 1024):
+    """Return the SHA-256 checksum of the file.
+
+    Parameters
+    ----------
+    filename : str
+        The file.
+    blocksize : int, optional
+        The number of bytes to read at a time.
+
+    Returns
+    -------
+    checksum : str
+        The checksum, as a hex string.
+
+    """
+
+    hashval = hashlib.sha256()
+    with open(filename, 'rb') as fh:
+        while True:
+            chunk = fh.read(blocksize)
+            if not chunk:
+                break
+
+            hashval.update(chunk)
+
+    return hashval.hexdigest()
+
+
 def download_progress(url, size, outfile,
                       headers=None,
                       progress=None,
-                      chunksize=8192,
-                      verbose=True):
+                      chunksize=DEFAULT_CHUNKSIZE,
+                      verbose=True,
+                      pool=None):
     """Download url and store in outfile, reporting progress.
 
     The download will use chunks, logging the output to the
@@ -676,12 +1163,18 @@ def download_progress(url, size, outfile,
         "ciao_contrib.downloadutils.download_progress" is
         used).
     progress : ProgressBar instance, optional
-        If not specified a default instance (20 '#' marks) is used.
+        If not specified a default instance (20 '#' marks) is used
+        when verbose is set. If given it is used even when verbose
+        is False (e.g. for the objects returned by
+        MultiProgress.file).
     chunksize : int, optional
         The chunk size to use, in bytes.
     verbose : bool, optional
         Should progress information on the download be written to
         stdout?
+    pool : ConnectionPool instance, optional
+        The connections to use. If not set then a new connection
+        is made for the download.
 
     Notes
     -----
@@ -694,6 +1187,9 @@ def download_progress(url, size, outfile,
     has increased in length since the last time it was fully
     downloaded, or changed and there was a partial download.
 
+    This routine can be called from multiple threads, as long as
+    each thread writes to a different file.
+
     References
     ----------
 
@@ -708,17 +1204,13 @@ def download_progress(url, size, outfile,
     #
     # From https://stackoverflow.com/a/24900110 - is it still true?
     #
-    purl = urllib.request.urlparse(url)
-    if purl.scheme == 'https':
-        no_context = ssl._create_unverified_context()
-        conn = http.client.HTTPSConnection(purl.netloc, context=no_context)
-
-    elif purl.scheme == 'http':
-        conn = http.client.HTTPConnection(purl.netloc)
-
-    else:
+    purl = urllib.parse.urlparse(url)
+    if purl.scheme not in ['http', 'https']:
         raise ValueError("Unsupported URL scheme: {}".format(url))
 
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive, not {}".format(chunksize))
+
     startfrom = 0
     try:
         fsize = os.path.getsize(outfile)
@@ -761,7 +1253,7 @@ def download_progress(url, size, outfile,
     if startfrom > 0 and outfp.tell() == 0:
         outfp.seek(0, 2)
 
-    if progress is None:
+    if progress is None and verbose:
         progress = ProgressBar(size)
 
     if headers is None:
@@ -779,31 +1271,42 @@ def download_progress(url, size, outfile,
     #
     headers['Range'] = 'bytes={}-{}'.format(startfrom, size - 1)
 
-    time0 = time.time()
-    conn.request('GET', purl.path, headers=headers)
-    with conn.getresponse() as rsp:
-
-        # Assume that rsp.status != 206 would cause some form
-        # of an error so we don't need to check for this here.
-        #
-        if verbose:
-            progress.start(startfrom)
-
-        # Note that the progress bar reflects the expected size, not
-        # the actual size; this may not be ideal (but don't expect the
-        # sizes to change so it doesn't really matter).
-        #
-        while True:
-            chunk = rsp.read(chunksize)
-            if not chunk:
-                break
-
-            outfp.write(chunk)
-            if verbose:
-                progress.add(len(chunk))
+    # Only close the connection if it is not from the caller's pool.
+    #
+    if pool is None:
+        conns = ConnectionPool()
+    else:
+        conns = pool
 
-        if verbose:
-            progress.end()
+    time0 = time.time()
+    try:
+        with conns.open('GET', url, headers=headers) as rsp:
+
+            # Assume that rsp.status != 206 would cause some form
+            # of an error so we don't need to check for this here.
+            #
+            if progress is not None:
+                progress.start(startfrom)
+
+            # Note that the progress bar reflects the expected size,
+            # not the actual size; this may not be ideal (but don't
+            # expect the sizes to change so it doesn't really matter).
+            #
+            while True:
+                chunk = rsp.read(chunksize)
+                if not chunk:
+                    break
+
+                outfp.write(chunk)
+                if progress is not None:
+                    progress.add(len(chunk))
+
+            if progress is not None:
+                progress.end()
+
+    finally:
+        if pool is None:
+            conns.close()
 
     time1 = time.time()
     nbytes = outfp.tell()
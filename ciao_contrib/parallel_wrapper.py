@@ -1,5 +1,5 @@
 #
-#  Copyright (C) 2011, 2015, 2016, 2019-2024
+#  Copyright (C) 2011, 2015, 2016, 2019-2024, 2026
 #                Smithsonian Astrophysical Observatory
 #
 #
@@ -57,22 +57,24 @@ v5 = logger.verbose4
 def task(func, arg_queue, result_queue):
     """Remove a task from the arg_queue (ie the next argument to use)
     and call func. Store the result in result_queue.
-    Repeat until arg_queue is empty.
+    Repeat until None is read from arg_queue.
+
+    The queue is not checked with empty(), since the arguments may
+    not yet have been sent to the queue when the worker starts.
     """
 
     # note we block control-c handling here
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-    while not arg_queue.empty():
-
-        try:
-            (i, arg) = arg_queue.get(block=False)
-            v5("# Parallel worker starting task #{0}".format(i + 1))
-            ans = func(arg)
-            result_queue.put((i, ans))
+    while True:
+        job = arg_queue.get()
+        if job is None:
+            break
 
-        except Empty:
-            pass
+        (i, arg) = job
+        v5("# Parallel worker starting task #{0}".format(i + 1))
+        ans = func(arg)
+        result_queue.put((i, ans))
 
 
 def parallel_pool(func, args, ncores=None, context='fork'):
@@ -94,7 +96,8 @@ def parallel_pool(func, args, ncores=None, context='fork'):
     the multiprocessing is run.
 
     The return value is an array of the return values of func,
-    in the order of the args array.
+    in the order of the args array. The value is None for any
+    argument where func failed.
 
     """
 
@@ -117,6 +120,10 @@ def parallel_pool(func, args, ncores=None, context='fork'):
     for i, arg in enumerate(args):
         job_queue.put((i, arg))
 
+    # One end-of-jobs marker per worker.
+    for i in range(nc):
+        job_queue.put(None)
+
     stime = time.localtime()
     v4("# Parallel start time: {0}".format(time.asctime(stime)))
 
@@ -128,7 +135,30 @@ def parallel_pool(func, args, ncores=None, context='fork'):
         w.start()
         workers.append(w)
 
+    # The results must be read before the workers are joined, since
+    # a worker does not exit until the data it has added to the
+    # queue has been read. A worker which fails does not return a
+    # result, so stop once all the workers have exited and the
+    # queue is empty.
+    #
+    out = [None] * narg
+    nresults = 0
     try:
+        while nresults < narg:
+            try:
+                (n, v) = result_queue.get(timeout=0.5)
+            except Empty:
+                if any(w.is_alive() for w in workers):
+                    continue
+
+                try:
+                    (n, v) = result_queue.get(timeout=0.5)
+                except Empty:
+                    break
+
+            out[n] = v
+            nresults += 1
+
         for w in workers:
             v5("# Joining worker to parallel queue")
             w.join()
@@ -145,11 +175,6 @@ def parallel_pool(func, args, ncores=None, context='fork'):
     dtime = time.mktime(etime) - time.mktime(stime)
     v3("# Parallel run took: {0} seconds".format(dtime))
 
-    out = [None] * narg
-    while not result_queue.empty():
-        (n, v) = result_queue.get(block=False)
-        out[n] = v
-
     return out
 
 # End
@@ -428,6 +428,86 @@ and then run them on files
 The new_tmpdir() and new_pfiles_environment() context managers can
 also be useful when running multiple tools.
 
+Running tools with a pool of worker processes
+=============================================
+
+Scripts which run a large number of tools can use the worker_pool()
+context manager, which sends each tool call to one of a set of
+persistent worker processes. Each worker has its own PFILES directory,
+and re-uses the tool objects and parameter files it has already
+set up. The return value and parameter handling are the same as when
+the tool is run directly:
+
+  with worker_pool(nproc=4) as pool:
+      for infile in infiles:
+          dmhedit(infile, filelist="", operation="add",
+                  key="OBJECT", value="M31")
+
+      print(pool.stats())
+
+The ToolWorkerPool class can also be used directly; see
+'help(ToolWorkerPool)' for more information.
+
+The map method of a tool runs it once for each of a list of
+parameter settings, in parallel, returning the results in the same
+order as the input:
+
+  res = dmstat.map([{"infile": f, "centroid": False} for f in infiles],
+                   nproc=4)
+  for r in res:
+      print(r.params["out_mean"], r.details["delta"])
+
+See 'help(CIAOTool.map)' for more information.
+
+Running tools with asyncio
+==========================
+
+The run_async method of a tool is a coroutine which runs the tool
+without blocking the event loop, so that a single process can run
+several tools at the same time:
+
+  async def run_chips(chips):
+      tasks = [mkinstmap.run_async(outfile=f"imap{c}.fits",
+                                   pixelgrid="1:1024:#1024,1:1024:#1024",
+                                   obsfile="asp.fits[asphist]",
+                                   detsubsys=f"ACIS-{c}",
+                                   monoenergy=1.5,
+                                   timeout=3600)
+               for c in chips]
+      return await asyncio.gather(*tasks)
+
+  asyncio.run(run_chips([0, 1, 2, 3]))
+
+The number of tools that are run at the same time is limited by
+set_async_limit(). The screen output can be processed as it is
+created with the output argument. See 'help(CIAOTool.run_async)'
+for more information.
+
+Re-using the results of tool runs
+=================================
+
+The result_cache() context manager stores the results of each tool
+run in a cache directory, and restores them - rather than running the
+tool - when the tool is called again with the same parameter values
+and unchanged input files:
+
+  with result_cache("cache/") as cache:
+      asphist(infile="asol1.fits", outfile="asphist7.fits",
+              evtfile="evt2.fits[ccd_id=7]", clobber=True)
+      mkinstmap(outfile="imap7.fits", ...)
+
+      print(cache.stats())
+
+Setting the CIAO_RUNTOOL_CACHE environment variable to a directory
+name uses a cache for all tool runs, including those made by scripts
+such as fluximage, merge_obs, and flux_obs - for example the asphist,
+mkinstmap, mkexpmap, and mkpsfmap runs - which use get_result_cache
+and ToolResultCache.run_command (CIAO_RUNTOOL_CACHE_SIZE sets the
+maximum size, in bytes, and setting CIAO_RUNTOOL_CACHE_CHECKSUM to yes
+identifies the input files by their checksum rather than their
+modification time). See 'help(ToolResultCache)' for details of how
+the cache key is created and which runs are cached.
+
 Setting the HISTORY record of a file
 ====================================
 
@@ -470,9 +550,20 @@ import tempfile
 import errno
 import shutil
 import glob
+import hashlib
+import json
 import re
-
-from collections import namedtuple
+import queue
+import signal
+import threading
+import multiprocessing
+import multiprocessing.util
+import concurrent.futures
+import asyncio
+import weakref
+
+from collections import deque, namedtuple
+from collections.abc import MutableMapping
 from contextlib import contextmanager
 
 # only used to check for floating-point equality
@@ -483,6 +574,7 @@ import stk
 import cxcdm
 
 from ciao_contrib.logger_wrapper import initialize_module_logger
+from ciao_contrib import _parinfo_index
 
 # This is to throw out any date-encoded parameter files which end in
 # _YYYYMMDD.HH:MM:SS.par.  I could be clever and specialize this
@@ -722,6 +814,46 @@ def _log_par_file_contents(parfile):
     v4("***** End of parameter file")
 
 
+# The pool used to run tools, set by the worker_pool context manager,
+# and - only within a worker process of a ToolWorkerPool - the state
+# of that worker.
+#
+_worker_pool = None
+_worker_state = None
+
+# The cache of tool results, set by the result_cache context manager
+# or the CIAO_RUNTOOL_CACHE environment variable.
+#
+_result_cache = None
+
+
+def _read_parfile_template(toolname):
+    """Return the contents of the parameter file for toolname.
+
+    The file is found using the PFILES environment variable. Within
+    a worker process of a ToolWorkerPool the contents are cached,
+    since the PFILES setting of the worker does not change.
+    """
+
+    if _worker_state is not None:
+        try:
+            cts = _worker_state["templates"][toolname]
+            _worker_state["template_reuse"] += 1
+            return cts
+        except KeyError:
+            pass
+
+    ofile = pio.paramgetpath(toolname)
+    v5(f"Reading par file {ofile}")
+    with open(ofile, "r") as ifh:
+        cts = ifh.read()
+
+    if _worker_state is not None:
+        _worker_state["templates"][toolname] = cts
+
+    return cts
+
+
 class CIAOPrintableString(str):
     """Wraps strings for "nice" formatting.
 
@@ -1168,13 +1300,8 @@ class CIAOParameter(object):
             pfh = open(parfile, "w")
 
         try:
-            ofile = pio.paramgetpath(toolname)
-
-            v5(f"Copying par file {ofile} to {parfile}")
-            with open(ofile, "r") as ifh:
-                for line in ifh.readlines():
-                    pfh.write(line)
-
+            v5(f"Copying par file for {toolname} to {parfile}")
+            pfh.write(_read_parfile_template(toolname))
             pfh.close()
 
         except Exception:
@@ -1764,16 +1891,208 @@ class CIAOTool(CIAOParameter):
 
         return rval
 
+    def _get_map_settings(self, params):
+        """Return the parameter settings for each element of params.
+
+        Each element of params is a dictionary of parameter values,
+        which are applied to the current settings of the tool (the
+        names can be abbreviated, as when calling the tool). The values
+        are validated, but the settings of the tool are not changed.
+        """
+
+        orig = self._settings
+        out = []
+        try:
+            for kwargs in params:
+                self._settings = orig.copy()
+                self._process_argument_list((), kwargs)
+                out.append(self._settings)
+
+        finally:
+            self._settings = orig
+
+        return out
+
+    def map(self, params, nproc=None, fail_fast=True, ardlib=True,
+            tmpdir=None):
+        """Run the tool once for each set of parameters in params.
+
+        The runs are made in parallel, using a ToolWorkerPool with
+        nproc workers (if nproc is None then the smaller of the number
+        of runs and multiprocessing.cpu_count() is used), unless the
+        call is made within a worker_pool block, in which case that
+        pool is used. Each worker has its own PFILES directory, so
+        runs do not share any parameter files.
+
+        Each element of params is a dictionary of parameter values,
+        which are applied to the current settings of the tool. All
+        the values are validated before any tool is run. The settings
+        of the tool are not changed by this call.
+
+        The return value is a list, in the same order as params, of
+        ToolMapResult values, containing the screen output of the run
+        (as returned when calling the tool), the runtime details (as
+        returned by get_runtime_details), the parameter values after
+        the run, and the error raised by the run (or None).
+
+        If fail_fast is True then no new runs are started once a run
+        has failed, and the error is raised once the runs in progress
+        have finished. When False, all runs are made and the errors
+        are stored in the return value.
+
+        An example, which calculates the mean of a set of files:
+
+          res = dmstat.map([{"infile": f, "centroid": False}
+                            for f in infiles], nproc=4)
+          means = [r.params["out_mean"] for r in res]
+
+        """
+
+        if _worker_pool is not None:
+            return _worker_pool.map(self, params, fail_fast=fail_fast)
+
+        params = list(params)
+        if len(params) == 0:
+            return []
+
+        if nproc is None:
+            nproc = min(len(params), multiprocessing.cpu_count())
+
+        with ToolWorkerPool(nproc=nproc, ardlib=ardlib,
+                            tmpdir=tmpdir) as pool:
+            return pool.map(self, params, fail_fast=fail_fast)
+
     def __call__(self, *args, **kwargs):
         """Run the tool. Returns the stdout and stderr of the tool as a single
         string on success (or None if the contents are empty/only contain
         spaces), otherwise throws an IOError. The parameter settings
         of the object are updated to reflect any changes made by the tool.
 
+        The tool is run using the result cache, if result_cache() is
+        in use, and the worker pool, if worker_pool() is in use.
+
+        """
+
+        if _result_cache is not None:
+            return _result_cache.run(self, *args, **kwargs)
+
+        if _worker_pool is not None:
+            return _worker_pool.run(self, *args, **kwargs)
+
+        return self._call(*args, **kwargs)
+
+    def _call(self, *args, **kwargs):
+        """Run the tool in this process."""
+
+        raise NotImplementedError
+
+    async def run_async(self, *args, timeout=None, output=None, **kwargs):
+        """Run the tool without blocking the asyncio event loop.
+
+        This coroutine accepts the same arguments, and returns the
+        same value, as calling the tool directly; that is, the screen
+        output of the tool (or None) on success, otherwise an IOError
+        is raised.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            The parameter values for the tool.
+        timeout : number or None, optional
+            The maximum time, in seconds, to wait for the tool to
+            finish. If the tool has not finished then it is killed
+            and asyncio.TimeoutError is raised.
+        output : callable or None, optional
+            If set, it is called with each line of the screen output
+            of the tool (without the trailing new line) as it is
+            created. Only the last 1000 lines are then kept for the
+            return value, the error message, and get_runtime_details().
+
+        Notes
+        -----
+        The number of tools that are run at the same time is limited
+        by set_async_limit(); the call waits until it can start.
+
+        The tool process is killed if the call is cancelled.
+
+        The parameter values are processed when the call is made, so
+        the same tool object can be used for multiple calls, but the
+        parameter values and runtime details of the object will
+        reflect the last call to finish. Tools which do not support
+        the @@ syntax for parameter files - such as axbary - use the
+        same parameter file for each run and so should not be run
+        at the same time.
+
+        The worker_pool() context manager is not used by run_async.
+
+        Examples
+        --------
+
+        >>> async def stats(infiles):
+        ...     tasks = [dmstat.run_async(f, centroid=False, timeout=60)
+        ...              for f in infiles]
+        ...     return await asyncio.gather(*tasks)
+        >>> outs = asyncio.run(stats(["a.fits", "b.fits"]))
+
         """
 
         raise NotImplementedError
 
+    async def _run_async(self, args, pargs, timeout=None, output=None):
+        """Run the tool using asyncio.
+
+        The args argument is the list of (name, value) parameter
+        pairs, used for the runtime details, and pargs is the
+        command to run. Returns the return code and the screen
+        output of the tool.
+
+        """
+
+        async with _get_async_limiter():
+            stime = time.localtime()
+            v4(f"Starting {self._toolname} at {time.asctime(stime)}")
+            runtimes = {"start": stime, "args": args}
+
+            # As stderr is merged into stdout, only need to read from
+            # stdout.
+            proc = await asyncio.create_subprocess_exec(
+                *pargs,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=_ASYNC_LINE_LIMIT)
+
+            try:
+                sout = await asyncio.wait_for(_read_async_output(proc, output),
+                                              timeout)
+
+            except BaseException as exc:
+                # Do not leave the tool running on a timeout or if the
+                # task was cancelled.
+                if proc.returncode is None:
+                    v3(f"Stopping {self._toolname} (process {proc.pid}): {type(exc).__name__}")
+                    try:
+                        proc.kill()
+                    except ProcessLookupError:
+                        pass
+
+                    await proc.wait()
+
+                raise
+
+        etime = time.localtime()
+        rval = proc.returncode
+        runtimes["code"] = rval
+
+        v4(f"{self._toolname} finished at {time.asctime(etime)}")
+        runtimes["end"] = etime
+        runtimes["delta"] = _time_delta(stime, etime)
+        runtimes["output"] = sout
+        v4(f"Run time = {runtimes['delta']}")
+        v4(f"Return code = {rval}")
+
+        self._runtimes = runtimes
+        return (rval, sout)
+
 
 class CIAOToolParFile(CIAOTool):
     """Run a CIAO tool using a separate parameter file (@@ syntax).
@@ -1825,7 +2144,7 @@ class CIAOToolParFile(CIAOTool):
         v4(f"Return code = {rval}")
         return (rval, sout)
 
-    def __call__(self, *args, **kwargs):
+    def _call(self, *args, **kwargs):
 
         # processing the argument list also validates them
         self._process_argument_list(args, kwargs)
@@ -1838,40 +2157,74 @@ class CIAOToolParFile(CIAOTool):
             _log_par_file_contents(parfile)
             (rval, sout) = self._run(parfile)
             _log_par_file_contents(parfile)
+            retval = self._process_results(parfile, stackfiles, rval, sout)
 
-            if rval == 0:
-                self.read_params(parfile)
-                for pname in stackfiles:
-                    oval = self._get_param_value(pname)
-                    v5(f"Replacing {self._toolname}.{pname} = {oval}")
-                    nval = stk.build(oval)
-                    if len(nval) == 1:
-                        nval = nval[0]
-
-                    v5(f"  by {nval}")
-                    self._set_param_value(pname, nval)
-
-                txt = sout.rstrip()
-                if txt == "":
-                    retval = None
-                else:
-                    retval = CIAOPrintableString(txt)
+        finally:
+            self._delete_run_files(parfile, stackfiles)
 
-            else:
-                sep = "\n  "
-                smsg = sep.join(sout.rstrip().split("\n"))
-                raise IOError(f"An error occurred while running '{self._toolname}':{sep}{smsg}")
+        return retval
 
-        finally:
-            for v in stackfiles.values():
-                v5(f"Deleting stack file: {v}")
-                os.unlink(v)
+    async def run_async(self, *args, timeout=None, output=None, **kwargs):
 
-            v5(f"Deleting par file: {parfile}")
-            os.unlink(parfile)
+        # The parameter file is written before waiting to run the
+        # tool, so that later changes to the tool settings do not
+        # affect this call.
+        #
+        self._process_argument_list(args, kwargs)
+
+        parfile = self._create_parfile_copy()
+        stackfiles = {}
+        try:
+            stackfiles = self._update_parfile(parfile)
+            self._display_command_line()
+            _log_par_file_contents(parfile)
+            args = self._get_command_line_args(simplify=False, nameall=True)
+            pargs = [self._toolname, f"@@{parfile}", "mode=hl"]
+            (rval, sout) = await self._run_async(args, pargs,
+                                                 timeout=timeout,
+                                                 output=output)
+            _log_par_file_contents(parfile)
+            retval = self._process_results(parfile, stackfiles, rval, sout)
+
+        finally:
+            self._delete_run_files(parfile, stackfiles)
 
         return retval
 
+    def _process_results(self, parfile, stackfiles, rval, sout):
+        """Update the parameter values after the tool has been run.
+
+        Returns the screen output, or None, if the tool succeeded,
+        otherwise an IOError is raised.
+
+        """
+
+        if rval != 0:
+            _raise_tool_error(self._toolname, sout)
+
+        self.read_params(parfile)
+        for pname in stackfiles:
+            oval = self._get_param_value(pname)
+            v5(f"Replacing {self._toolname}.{pname} = {oval}")
+            nval = stk.build(oval)
+            if len(nval) == 1:
+                nval = nval[0]
+
+            v5(f"  by {nval}")
+            self._set_param_value(pname, nval)
+
+        return _screen_output(sout)
+
+    def _delete_run_files(self, parfile, stackfiles):
+        """Remove the parameter and stack files used to run the tool."""
+
+        for v in stackfiles.values():
+            v5(f"Deleting stack file: {v}")
+            os.unlink(v)
+
+        v5(f"Deleting par file: {parfile}")
+        os.unlink(parfile)
+
 
 # TODO: look at wrapping calls to these tools in a
 # new_pfiles_envionment context. The issue is whether we want to
@@ -1904,10 +2257,7 @@ class CIAOToolDirect(CIAOTool):
 
         self._runtimes = None
 
-        args = self._get_command_line_args(simplify=False, nameall=True)
-        v5(f"Argument list for {self._toolname} = \n{args}")
-        pargs = [self._toolname, "mode=hl"]
-        pargs.extend([f"{name}={val}" for (name, val) in args])
+        (args, pargs) = self._get_run_command()
         stime = time.localtime()
         v4(f"Starting {self._toolname} at {time.asctime(stime)}")
         self._runtimes = {"start": stime, "args": args}
@@ -1932,7 +2282,16 @@ class CIAOToolDirect(CIAOTool):
         v4(f"Return code = {rval}")
         return (rval, sout)
 
-    def __call__(self, *args, **kwargs):
+    def _get_run_command(self):
+        """Returns the parameter values and the command to run."""
+
+        args = self._get_command_line_args(simplify=False, nameall=True)
+        v5(f"Argument list for {self._toolname} = \n{args}")
+        pargs = [self._toolname, "mode=hl"]
+        pargs.extend([f"{name}={val}" for (name, val) in args])
+        return (args, pargs)
+
+    def _call(self, *args, **kwargs):
 
         # processing the argument list now validates them too
         self._process_argument_list(args, kwargs)
@@ -1940,26 +2299,157 @@ class CIAOToolDirect(CIAOTool):
 
         self._display_command_line()
         (rval, sout) = self._run()
+        return self._process_results(rval, sout)
 
-        if rval == 0:
-            # Assume there is a par file we can read from
-            # NOTE: this means that settings don't persist in quite
-            # the same way as they do for CIAOToolParFile instances
-            # (e.g. hidden params will be reset).
-            #
-            self.read_params()
-            txt = sout.rstrip()
-            if txt == "":
-                retval = None
-            else:
-                retval = CIAOPrintableString(txt)
+    async def run_async(self, *args, timeout=None, output=None, **kwargs):
 
-        else:
-            sep = "\n  "
-            smsg = sep.join(sout.rstrip().split("\n"))
-            raise IOError(f"An error occurred while running '{self._toolname}':{sep}{smsg}")
+        self._process_argument_list(args, kwargs)
+        self._display_command_line()
+        (args, pargs) = self._get_run_command()
+        (rval, sout) = await self._run_async(args, pargs,
+                                             timeout=timeout,
+                                             output=output)
+        return self._process_results(rval, sout)
 
-        return retval
+    def _process_results(self, rval, sout):
+        """Update the parameter values after the tool has been run.
+
+        Returns the screen output, or None, if the tool succeeded,
+        otherwise an IOError is raised.
+
+        """
+
+        if rval != 0:
+            _raise_tool_error(self._toolname, sout)
+
+        # Assume there is a par file we can read from
+        # NOTE: this means that settings don't persist in quite
+        # the same way as they do for CIAOToolParFile instances
+        # (e.g. hidden params will be reset).
+        #
+        self.read_params()
+        return _screen_output(sout)
+
+
+# Limit the number of tools run at the same time by run_async. There
+# is a separate semaphore for each event loop, since they can not be
+# shared between loops.
+#
+_async_limit = None
+_async_limiters = weakref.WeakKeyDictionary()
+
+# The maximum length of a line of screen output, and the number of
+# lines kept when the output is sent to a callback, for run_async.
+#
+_ASYNC_LINE_LIMIT = 1024 * 1024
+_ASYNC_OUTPUT_LINES = 1000
+
+
+def set_async_limit(nproc=None):
+    """Set the number of tools that run_async can run at the same time.
+
+    Parameters
+    ----------
+    nproc : int or None, optional
+        The maximum number of tools to run at once. If None then
+        the number of CPUs is used.
+
+    Notes
+    -----
+    The limit applies separately to each event loop. Calls to
+    run_async that are already running, or waiting to run, use the
+    previous limit.
+
+    See Also
+    --------
+    get_async_limit
+
+    """
+
+    global _async_limit
+
+    if nproc is not None:
+        nproc = int(nproc)
+        if nproc < 1:
+            raise ValueError(f"nproc must be 1 or greater, not {nproc}")
+
+    _async_limit = nproc
+    _async_limiters.clear()
+
+
+def get_async_limit():
+    """Return the number of tools that run_async can run at the same time.
+
+    See Also
+    --------
+    set_async_limit
+
+    """
+
+    if _async_limit is None:
+        return multiprocessing.cpu_count()
+
+    return _async_limit
+
+
+def _get_async_limiter():
+    """Return the semaphore for the running event loop."""
+
+    loop = asyncio.get_running_loop()
+    try:
+        return _async_limiters[loop]
+    except KeyError:
+        pass
+
+    limiter = asyncio.Semaphore(get_async_limit())
+    _async_limiters[loop] = limiter
+    return limiter
+
+
+async def _read_async_output(proc, output=None):
+    """Read the screen output of the process and wait for it to end.
+
+    If output is not None it is called with each line, without the
+    trailing new line, and only the last _ASYNC_OUTPUT_LINES lines
+    are returned.
+
+    """
+
+    if output is None:
+        lines = []
+    else:
+        lines = deque(maxlen=_ASYNC_OUTPUT_LINES)
+
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            break
+
+        line = line.decode()
+        lines.append(line)
+        if output is not None:
+            output(line.rstrip("\n"))
+
+    await proc.wait()
+    return "".join(lines)
+
+
+def _screen_output(sout):
+    """Returns the value returned by a tool when it succeeds."""
+
+    txt = sout.rstrip()
+    if txt == "":
+        return None
+
+    return CIAOPrintableString(txt)
+
+
+def _raise_tool_error(toolname, sout):
+    """Raise the IOError for a tool which failed."""
+
+    sep = "\n  "
+    smsg = sep.join(sout.rstrip().split("\n"))
+    raise IOError(f"An error occurred while running '{toolname}':{sep}{smsg}")
 
 
 def get_pfiles(userdir=True):
@@ -2338,102 +2828,1322 @@ def new_pfiles_environment(ardlib=True,
             os.environ['PFILES'] = origpfiles
 
 
-def add_comment_lines(infile, comments):
-    """Add the text in comments to infile as a COMMENT (adding to the
-    most-interesting block). comments can either be a string or
-    an array of strings.
+# Support for running tools using a pool of persistent worker
+# processes. Each worker has its own user PFILES directory, which
+# is deleted when the worker exits, and caches the tool objects and
+# parameter-file contents it has used. The tools themselves are
+# still run with subprocess.Popen by the worker.
+#
 
-    infile is a string. If comments is the empty array then nothing
-    is done, but empty comments are added (so comments=[] does nothing
-    but comments=[""] will add a blank comment line)
+def _pool_worker_init(ardlibpath, tmpdir):
+    """Set up a worker process of a ToolWorkerPool.
+
+    This creates the user PFILES directory for the worker in tmpdir,
+    copying over the ardlib parameter file if ardlibpath is not None,
+    and ensures the directory is removed when the worker exits.
+
+    Any error is stored, and raised when the worker is asked to run
+    a tool, rather than being raised here.
     """
 
-    if isinstance(comments, str):
-        cs = [comments]
-    else:
-        cs = comments
+    global _worker_pool, _worker_state, _result_cache
 
-    if cs == []:
-        return
+    # control-c is handled by the parent process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-    v4(f"Adding comments to {infile}")
-    bl = cxcdm.dmBlockOpen(infile, update=True)
-    try:
-        for comment in cs:
-            v4(f"COMMENT: {comment}")
-            cxcdm.dmBlockWriteComment(bl, 'COMMENT', comment)
+    # Tools run by the worker must not be sent back to the pool, and
+    # the cache is checked by the parent process.
+    _worker_pool = None
+    _result_cache = None
 
-    finally:
-        cxcdm.dmBlockClose(bl)
+    try:
+        dname = tempfile.mkdtemp(dir=tmpdir, prefix="pfiles")
+        multiprocessing.util.Finalize(None, shutil.rmtree,
+                                      args=(dname, True),
+                                      exitpriority=10)
 
+        set_pfiles(dname)
+        if ardlibpath is not None:
+            _copy_par_file(ardlibpath, dname)
 
-def add_tool_history(infiles, toolname, params,
-                     toolversion=None, tmpdir=None):
-    """Add a CIAO history block to each of the files in infiles saying
-    that toolname was run with the given set of parameters (a
-    key/value dictionary). If infiles is a single string then it is
-    assumed to be the name of a single file.
+    except Exception as exc:
+        _worker_state = {"error": exc}
+        return
 
-    A comment line is also added saying
+    _worker_state = {"pfiles": dname,
+                     "tools": {},
+                     "templates": {},
+                     "calls": 0,
+                     "tool_reuse": 0,
+                     "template_reuse": 0}
 
-        <toolname> version <toolversion>
 
-    when toolversion is not None.
+def _pool_worker_run(toolname, settings):
+    """Run the tool, with the given parameter settings, in a worker.
 
-    The process is done with a temporary PFILES environment (using the
-    new_pfiles_environment context manager, passing through the tmpdir
-    argument) to avoid problems with clobbering an existing parameter
-    file.
+    The return value is (retval, error, settings, runtimes, stats)
+    where error is None or the exception raised when running the
+    tool, settings and runtimes are the tool settings after the
+    run, and stats contains the worker statistics.
     """
 
-    msg = f"Adding HISTORY record for {toolname} "
-    if toolversion is not None:
-        msg += f"({toolversion}) "
-
-    v2(msg)
-    v3(f"Params: {params}")
+    state = _worker_state
+    if "error" in state:
+        raise IOError(f"Unable to set up the worker process: {state['error']}")
 
-    # special case a single file
-    if isinstance(infiles, str):
-        infiles = [infiles]
+    try:
+        tool = state["tools"][toolname]
+        state["tool_reuse"] += 1
+    except KeyError:
+        tool = make_tool(toolname)
+        state["tools"][toolname] = tool
 
-    tool = make_tool('dmhistory')
-    with new_pfiles_environment(ardlib=False, copyuser=False, tmpdir=tmpdir):
-        # would like to just say
-        # pio.pset(toolname, params)
-        # but for now do it manually
-        #
-        pio.punlearn(toolname)
-        fp = pio.paramopen(toolname, "wL")
-        for (k, v) in params.items():
-            v3(f"Checking parameter <{k}> value <{v}> type={type(v)}")
-            if isinstance(v, bool):
-                if v:
-                    val = "yes"
-                else:
-                    val = "no"
-            else:
-                val = str(v)
+    state["calls"] += 1
+    tool._settings = settings
 
-            v3(f" -> {k}={v}")
-            pio.pset(fp, k, val)
+    retval = None
+    error = None
+    try:
+        retval = tool()
+    except Exception as exc:
+        error = exc
+
+    stats = {"pid": os.getpid(),
+             "pfiles": state["pfiles"],
+             "calls": state["calls"],
+             "tool_reuse": state["tool_reuse"],
+             "template_reuse": state["template_reuse"]}
+    return (retval, error, tool._settings, tool._runtimes, stats)
+
+
+class ToolWorkerPool:
+    """Run CIAO tools using a pool of persistent worker processes.
+
+    Each worker process has its own user PFILES directory (which
+    contains a copy of the ardlib parameter file if ardlib is True),
+    so that tools - including those which do not support the @@
+    syntax, such as wavdetect - can be run at the same time without
+    clobbering each others parameter files. The workers keep the
+    tool objects and parameter-file contents they have used, which
+    avoids repeated look ups of the parameter file.
+
+    The pool is normally used via the worker_pool context manager,
+    which sends all tool calls through the pool, but it can also be
+    used directly:
+
+      with ToolWorkerPool(nproc=4) as pool:
+          out = pool.run(dmstat, "img.fits", centroid=False)
+
+    The tool parameters are validated and set in the calling process
+    and the settings are updated after the tool has run, so the
+    return value and parameter values match the behavior when the
+    tool is called directly. The submit method can be used to run
+    tools without waiting for them to finish (e.g. when called from
+    multiple threads), but note that the parameter values of a tool
+    are only updated when the result is retrieved.
+
+    If nproc is None then multiprocessing.cpu_count() workers are
+    created. The directories are created in tmpdir, if not None,
+    or $ASCDS_WORK_PATH, or the default value -
+    tempfile.gettempdir() - if this environment variable does not
+    exist. The directory is created if it does not exist, and the
+    ardlib parameter file is found, when the pool is created, so
+    that any problem is reported then.
+
+    If a worker process dies while running a tool then a
+    concurrent.futures.process.BrokenProcessPool error is raised,
+    and the pool can not be used to run any more tools.
+    """
 
-        pio.paramclose(fp)
+    def __init__(self, nproc=None, ardlib=True, tmpdir=None,
+                 context='fork'):
 
-        if toolversion is not None:
-            comments = [f"{toolname} version {toolversion}"]
-        else:
-            comments = None
+        if nproc is None:
+            nproc = multiprocessing.cpu_count()
 
-        for infile in infiles:
-            v2(f"Adding history to {infile}")
-            if comments is not None:
-                add_comment_lines(infile, comments)
+        if nproc < 1:
+            raise ValueError(f"nproc must be 1 or greater, not {nproc}")
+
+        if tmpdir is None:
+            try:
+                tmpdir = os.environ["ASCDS_WORK_PATH"]
+            except KeyError:
+                tmpdir = tempfile.gettempdir()
+
+        os.makedirs(tmpdir, exist_ok=True)
+        if not os.access(tmpdir, os.W_OK | os.X_OK):
+            raise IOError(f"Unable to create files in tmpdir={tmpdir}")
+
+        ardlibpath = pio.paramgetpath('ardlib') if ardlib else None
+
+        v3(f"Creating a pool of {nproc} workers for running tools")
+        ctx = multiprocessing.get_context(context)
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=nproc, mp_context=ctx,
+            initializer=_pool_worker_init, initargs=(ardlibpath, tmpdir))
+        self._nproc = nproc
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __repr__(self):
+        return f"<CIAO tool worker pool: {self._nproc} workers>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _update_stats(self, toolname, stats):
+        """Record the worker statistics returned by a tool run."""
+
+        with self._lock:
+            pid = stats["pid"]
+            try:
+                store = self._stats[pid]
+            except KeyError:
+                store = {"tools": {}}
+                self._stats[pid] = store
+
+            for key in ["pfiles", "calls", "tool_reuse", "template_reuse"]:
+                store[key] = stats[key]
+
+            store["tools"][toolname] = store["tools"].get(toolname, 0) + 1
+
+    def submit(self, tool, *args, **kwargs):
+        """Start running the tool with the given arguments.
+
+        The arguments are processed as if the tool were called
+        directly, and an error is raised if they are not valid.
+        The return value is a ToolWorkerResult object, whose get
+        method returns the screen output of the tool.
+        """
+
+        if not isinstance(tool, CIAOTool):
+            raise TypeError(f"Expected a CIAO tool, not {tool}")
+
+        tool._process_argument_list(args, kwargs)
+
+        v5(f"Sending {tool._toolname} to the worker pool")
+        settings = tool._settings.copy()
+        res = self._executor.submit(_pool_worker_run, tool._toolname,
+                                    settings)
+        return ToolWorkerResult(self, tool, res)
+
+    def run(self, tool, *args, **kwargs):
+        """Run the tool with the given arguments using the pool.
+
+        The return value and error handling match calling the tool
+        directly: the screen output is returned (or None if it is
+        empty), the tool parameter values are updated, and an
+        IOError is raised if the tool fails.
+        """
+
+        return self.submit(tool, *args, **kwargs).get()
+
+    def map(self, tool, params, fail_fast=True):
+        """Run the tool once for each set of parameters in params.
+
+        See the map method of CIAOTool for details; the only difference
+        is that the runs use this pool.
+        """
+
+        if not isinstance(tool, CIAOTool):
+            raise TypeError(f"Expected a CIAO tool, not {tool}")
+
+        toolname = tool._toolname
+        settings = tool._get_map_settings(params)
+        nruns = len(settings)
+        v3(f"Running {toolname} {nruns} times with {self._nproc} workers")
+
+        # Only nproc runs are sent to the pool at a time, so that no
+        # new runs are started after an error when fail_fast is set.
+        #
+        done = queue.Queue()
+        todo = iter(enumerate(settings))
+
+        def submit():
+            try:
+                (i, s) = next(todo)
+            except StopIteration:
+                return False
+
+            fut = self._executor.submit(_pool_worker_run, toolname, s)
+            fut.add_done_callback(lambda f: done.put((i, f)))
+            return True
+
+        nrunning = 0
+        for _ in range(self._nproc):
+            if not submit():
+                break
+
+            nrunning += 1
+
+        results = [None] * nruns
+        failed = None
+        while nrunning > 0:
+            (i, fut) = done.get()
+            nrunning -= 1
+
+            try:
+                ans = fut.result()
+            except Exception as exc:
+                ans = exc
+
+            if isinstance(ans, BaseException):
+                # The run could not be made
+                res = ToolMapResult(None, {}, settings[i], ans)
+            else:
+                (retval, error, pars, runtimes, stats) = ans
+                self._update_stats(toolname, stats)
+                res = ToolMapResult(retval, dict(runtimes or {}), pars,
+                                    error)
+
+            results[i] = res
+            if res.error is not None:
+                v3(f"Run {i + 1} of {toolname} failed")
+                if failed is None:
+                    failed = res.error
+
+            if (failed is None or not fail_fast) and submit():
+                nrunning += 1
+
+        if fail_fast and failed is not None:
+            raise failed
+
+        return results
+
+    def stats(self):
+        """Return the reuse statistics of the workers.
+
+        The return value is a dictionary, with keys being the process
+        id of each worker that has run a tool, and the value is a
+        dictionary with keys:
+
+          pfiles         - the user PFILES directory of the worker
+          calls          - the number of tools run by the worker
+          tool_reuse     - the number of times a cached tool object
+                           was reused
+          template_reuse - the number of times a cached parameter
+                           file was reused
+          tools          - a dictionary of the number of times each
+                           tool was run by the worker
+        """
+
+        with self._lock:
+            return {pid: dict(store, tools=dict(store["tools"]))
+                    for pid, store in self._stats.items()}
+
+    def close(self):
+        """Wait for any running tools and stop the worker processes."""
+
+        v5("Closing the tool worker pool")
+        self._executor.shutdown(wait=True)
+
+
+ToolMapResult = namedtuple("ToolMapResult",
+                           ["output", "details", "params", "error"])
+
+
+class ToolWorkerResult:
+    """The result of ToolWorkerPool.submit."""
+
+    def __init__(self, pool, tool, result):
+        self._pool = pool
+        self._tool = tool
+        self._result = result
+
+    def ready(self):
+        """Has the tool finished?"""
+        return self._result.done()
+
+    def get(self, timeout=None):
+        """Return the screen output of the tool.
+
+        The tool parameter values are updated to match the run, and
+        an IOError is raised if the tool failed.
+        """
+
+        (retval, error, settings, runtimes, stats) = \
+            self._result.result(timeout)
+
+        tool = self._tool
+        tool._settings = settings
+        tool._runtimes = runtimes
+        self._pool._update_stats(tool._toolname, stats)
+
+        if error is not None:
+            raise error
+
+        return retval
+
+
+@contextmanager
+def worker_pool(nproc=None, ardlib=True, tmpdir=None):
+    """A context manager which runs all tools using a ToolWorkerPool.
+
+    Within the block, calling a tool (e.g. dmstat(...)) sends it to
+    one of the nproc worker processes of the pool, rather than running
+    it directly. The pool is returned so that the statistics can be
+    accessed, or tools submitted without waiting for them to finish:
+
+      with worker_pool(nproc=4) as pool:
+          for infile in infiles:
+              dmhedit(infile, filelist="", operation="add",
+                      key="OBJECT", value="M31")
+
+          print(pool.stats())
+
+    The nproc, ardlib, and tmpdir arguments are passed to
+    ToolWorkerPool. Only one such pool can be in use at a time.
+    """
+
+    global _worker_pool
+
+    if _worker_pool is not None:
+        raise ValueError("A worker pool is already in use")
+
+    pool = ToolWorkerPool(nproc=nproc, ardlib=ardlib, tmpdir=tmpdir)
+    _worker_pool = pool
+    try:
+        yield pool
+
+    finally:
+        _worker_pool = None
+        pool.close()
+
+
+# Support for re-using the results of tool runs. Each entry of the
+# cache is a directory, named by the hash of the tool name, parameter
+# values, and input files, which contains the entry.json file and a
+# copy of each output file. The modification time of entry.json is
+# used to find the least-recently used entries. The .outputs directory
+# records the checksum, size, and modification time of each file
+# created or restored by the cache, so that a restored file - which
+# has a new modification time - can be matched when it is used as the
+# input of a later tool.
+#
+
+_CACHE_ENTRY = "entry.json"
+_CACHE_OUTPUTS = ".outputs"
+
+# The tools which can be cached, and the parameters which give their
+# output files. All other filename parameters are taken to be input
+# files. Tools which change their input files - such as dmhedit - or
+# which create files that are not named by a parameter - such as
+# wavdetect - must not be added.
+#
+_CACHED_TOOLS = {
+    "arfcorr": ("outfile", ),
+    "asphist": ("outfile", ),
+    "dmcoords": (),
+    "dmcopy": ("outfile", ),
+    "dmextract": ("outfile", ),
+    "dmgti": ("outfile", ),
+    "dmimgcalc": ("outfile", ),
+    "dmimgfilt": ("outfile", ),
+    "dmimgthresh": ("outfile", ),
+    "dmkeypar": (),
+    "dmmerge": ("outfile", ),
+    "dmpaste": ("outfile", ),
+    "dmregrid2": ("outfile", ),
+    "dmstat": (),
+    "dmtcalc": ("outfile", ),
+    "get_sky_limits": (),
+    "mkarf": ("outfile", ),
+    "mkexpmap": ("outfile", ),
+    "mkinstmap": ("outfile", ),
+    "mkpsfmap": ("outfile", ),
+    "mkrmf": ("outfile", "logfile"),
+    "reproject_events": ("outfile", ),
+    "reproject_image": ("outfile", ),
+    "skyfov": ("outfile", "logfile"),
+    "src_psffrac": ("outfile", )
+}
+
+# The cached tools which read the ardlib parameter file, so the key
+# includes its contents and the bad-pixel files it names.
+#
+_ARDLIB_TOOLS = ("mkarf", "mkinstmap")
+
+
+def _param_files(pval):
+    """Return the file names referred to by a parameter value.
+
+    Stacks are expanded and any DM filter is removed.
+    """
+
+    if pval is None:
+        return []
+
+    pval = str(pval).strip()
+    if pval == "" or pval.lower() == "none":
+        return []
+
+    try:
+        names = stk.build(pval)
+    except (OSError, ValueError):
+        names = [pval]
+
+    out = []
+    for name in names:
+        name = name.split("[")[0].strip()
+        if name != "" and name.lower() != "none":
+            out.append(name)
+
+    return out
+
+
+def _file_signature(filename, checksum=False):
+    """Return the information used to identify the contents of a file.
+
+    This is the size and modification time of the file, or the SHA-256
+    checksum of the contents if checksum is True, or None if the file
+    does not exist.
+    """
+
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    if not checksum:
+        return [st.st_size, st.st_mtime_ns]
+
+    hasher = hashlib.sha256()
+    with open(filename, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def _is_output_param(tool, pname):
+    """Is the parameter an output file of a cached tool?"""
+
+    return pname in _CACHED_TOOLS.get(tool._toolname, ())
+
+
+class ToolResultCache:
+    """Re-use the results of tool runs which have already been made.
+
+    Each successful run of a tool is recorded in the cache directory,
+    using a key created from the tool name, the parameter values,
+    and the size and modification time - or, if checksum is True,
+    the SHA-256 checksum - of each input file. Input files which were
+    created, or restored, by the cache, and have not changed since,
+    are identified by their checksum, so that a chain of tools can
+    be restored even though the restored files are newer than the
+    originals. When the tool is
+    called again with the same key, the output files, screen output,
+    and parameter values are restored from the cache rather than the
+    tool being run.
+
+    The cache is normally used via the result_cache context manager,
+    or by setting the CIAO_RUNTOOL_CACHE environment variable to the
+    cache directory, but it can also be used directly:
+
+      cache = ToolResultCache("cache/")
+      cache.run(mkinstmap, outfile="imap7.fits", ...)
+      print(cache.stats())
+
+    Only the tools listed in _CACHED_TOOLS, which also lists the
+    parameters that name their output files, are cached; all other
+    filename parameters are taken to be inputs. Other tools - such
+    as those which change their input files, like dmhedit, or which
+    create files using a root name, like fluximage - are always run
+    (but the tools they call may be cached). A run is also not cached
+    if an output file is also an input, or if any output file does
+    not exist once the tool has finished. Output files are only
+    restored if they do not exist or the clobber parameter is set,
+    and the restored files have the current time as their
+    modification time.
+
+    Parameter values set by the tool - such as the out_mean value of
+    dmstat - are part of the key, so the tool should be reset with
+    punlearn() to re-use such runs.
+
+    For the tools which read the ardlib parameter file (mkarf and
+    mkinstmap) the key includes the contents of the ardlib file in
+    use and the bad-pixel files it names, and the run is not cached
+    if the ardlib file can not be read. The key does not include the
+    contents of other parameter files or the CALDB files, other than
+    the CALDB location, so the cache should be cleared if these are
+    changed.
+
+    If maxsize is not None then the least-recently used entries are
+    removed when the size of the cache exceeds maxsize bytes. The
+    default is 10 GB. If cachedir is None then $XDG_CACHE_HOME, or
+    ~/.cache, is used to create the directory ciao/runtool.
+    """
+
+    def __init__(self, cachedir=None, maxsize=10 * 1024**3, checksum=False):
+
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be None or 0 or greater, not {maxsize}")
+
+        if cachedir is None:
+            cachedir = os.environ.get("XDG_CACHE_HOME",
+                                      os.path.expanduser("~/.cache"))
+            cachedir = os.path.join(cachedir, "ciao", "runtool")
+
+        cachedir = os.path.abspath(cachedir)
+        os.makedirs(cachedir, exist_ok=True)
+
+        self._cachedir = cachedir
+        self._maxsize = maxsize
+        self._checksum = checksum
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0,
+                       "misses": 0,
+                       "stores": 0,
+                       "uncacheable": 0,
+                       "evictions": 0}
+
+    def __repr__(self):
+        return f"<CIAO tool result cache: {self._cachedir}>"
+
+    @property
+    def cachedir(self):
+        """The directory containing the cache."""
+        return self._cachedir
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._stats[name] += n
+
+    def _get_inputs(self, tool):
+        """Return the (parameter name, path) of the input files."""
+
+        out = []
+        for pname in tool._parnames:
+            if tool._store[pname].type != "f" or \
+               _is_output_param(tool, pname):
+                continue
+
+            for name in _param_files(tool._get_param_value(pname)):
+                out.append((pname, os.path.abspath(name)))
+
+        return out
+
+    def _output_record(self, path):
+        """The name of the file recording the checksum of an output."""
+
+        name = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        return os.path.join(self._cachedir, _CACHE_OUTPUTS, f"{name}.json")
+
+    def _record_output(self, path, checksum):
+        """Record the checksum of a file created or restored by the cache."""
+
+        sig = _file_signature(path)
+        if sig is None:
+            return
+
+        dname = os.path.join(self._cachedir, _CACHE_OUTPUTS)
+        try:
+            os.makedirs(dname, exist_ok=True)
+            fd, tmpname = tempfile.mkstemp(dir=dname, prefix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                json.dump({"path": path, "signature": sig,
+                           "checksum": checksum}, fh)
+
+            os.replace(tmpname, self._output_record(path))
+
+        except OSError as exc:
+            v3(f"Unable to record the checksum of {path}: {exc}")
+
+    def _input_signature(self, path):
+        """Return the signature of an input file.
+
+        The checksum is used if the file was created, or restored, by
+        the cache and has not changed since.
+        """
+
+        if self._checksum:
+            return _file_signature(path, checksum=True)
+
+        sig = _file_signature(path)
+        if sig is None:
+            return None
+
+        try:
+            with open(self._output_record(path), "r") as fh:
+                record = json.load(fh)
+
+        except (OSError, ValueError):
+            return sig
+
+        if record.get("path") == path and record.get("signature") == sig:
+            return record["checksum"]
+
+        return sig
+
+    def _ardlib_signature(self):
+        """Return the information used to identify the ardlib settings.
+
+        This is the checksum of the ardlib parameter file used by the
+        tools, and the signature of each bad-pixel file it names, or
+        None if the file can not be read.
+        """
+
+        try:
+            parfile = pio.paramgetpath("ardlib")
+            with open(parfile, "r") as fh:
+                cts = fh.read()
+
+            pnames = re.findall(r"^([^,#\s]+_BADPIX_FILE)\s*,", cts,
+                                re.MULTILINE)
+
+            fp = pio.paramopen(parfile, "rH")
+            try:
+                vals = [(pname, pio.pget(fp, pname)) for pname in pnames]
+            finally:
+                pio.paramclose(fp)
+
+        except Exception as exc:
+            # The paramio module throws Exceptions
+            v3(f"Unable to read the ardlib parameter file: {exc}")
+            return None
+
+        badpix = []
+        for (pname, pval) in vals:
+            for name in _param_files(pval):
+                path = os.path.abspath(name)
+                badpix.append([pname, path, self._input_signature(path)])
+
+        return [hashlib.sha256(cts.encode("utf-8")).hexdigest(), badpix]
+
+    def _get_key(self, tool):
+        """Return the cache key for the current settings of the tool.
+
+        None is returned if the key can not be created, which is when
+        the tool reads the ardlib parameter file and it can not be
+        read.
+        """
+
+        args = tool._get_command_line_args(simplify=False, nameall=True)
+        inputs = [[pname, path, self._input_signature(path)]
+                  for (pname, path) in self._get_inputs(tool)]
+
+        env = [os.environ.get(name) for name in ["ASCDS_INSTALL", "CALDB"]]
+        data = [tool._toolname, args, inputs, env]
+        if tool._toolname in _ARDLIB_TOOLS:
+            ardlib = self._ardlib_signature()
+            if ardlib is None:
+                return None
+
+            data.append(ardlib)
+
+        data = json.dumps(data)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _get_outputs(self, tool):
+        """Return the output files of the tool."""
+
+        out = []
+        for pname in tool._parnames:
+            if _is_output_param(tool, pname):
+                names = _param_files(tool._get_param_value(pname))
+                out.extend([os.path.abspath(name) for name in names])
+
+        return out
+
+    def can_run_command(self, toolname, args):
+        """Can run_command be used for the tool and arguments?
+
+        The tool must be cached and have output files, since the
+        parameter values set by the tool are not written to its
+        parameter file, and each argument must be name=value.
+        """
+
+        if not _CACHED_TOOLS.get(toolname):
+            return False
+
+        return all("=" in arg for arg in args)
+
+    def run_command(self, toolname, args):
+        """Run the tool, or restore the results of a previous run,
+        using command-line arguments.
+
+        This is for scripts which run the tool directly, rather than
+        with this module. The args argument is a list of name=value
+        strings, and the other parameters are taken from the
+        parameter file of the tool, as they would be if the tool were
+        run from the command line (the mode parameter is ignored).
+        The screen output is returned, rather than displayed, or None
+        if it is empty, and an IOError is raised if the tool fails.
+        Use can_run_command to check the tool and arguments first.
+        """
+
+        tool = make_tool(toolname)
+        tool.read_params()
+
+        kwargs = {}
+        for arg in args:
+            (pname, pval) = arg.split("=", 1)
+            pname = pname.strip()
+            if pname != "mode":
+                kwargs[pname] = pval
+
+        return self.run(tool, **kwargs)
+
+    def run(self, tool, *args, **kwargs):
+        """Run the tool, or restore the results of a previous run.
+
+        The arguments are processed as if the tool were called
+        directly, and the return value and error handling match
+        calling the tool directly. Failed runs are not cached.
+        """
+
+        if not isinstance(tool, CIAOTool):
+            raise TypeError(f"Expected a CIAO tool, not {tool}")
+
+        tool._process_argument_list(args, kwargs)
+
+        toolname = tool._toolname
+        if toolname not in _CACHED_TOOLS:
+            v3(f"Not using the cache for {toolname}")
+            self._count("uncacheable")
+            return self._run(tool)
+
+        inputs = set(path for (_, path) in self._get_inputs(tool))
+        if any(path in inputs for path in self._get_outputs(tool)):
+            v3(f"Not using the cache for {toolname} as it changes an input file")
+            self._count("uncacheable")
+            return self._run(tool)
+
+        key = self._get_key(tool)
+        if key is None:
+            v3(f"Not using the cache for {toolname} as the ardlib settings are unknown")
+            self._count("uncacheable")
+            return self._run(tool)
+
+        try:
+            retval = self._restore(tool, key)
+            v3(f"Restored {toolname} from the cache: {key}")
+            self._count("hits")
+            return retval
+
+        except KeyError:
+            v3(f"No cached result for {toolname}: {key}")
+            self._count("misses")
+
+        retval = self._run(tool)
+        self._store(tool, key, retval)
+        return retval
+
+    def _run(self, tool):
+        """Run the tool, using the worker pool if set."""
+
+        if _worker_pool is not None:
+            return _worker_pool.run(tool)
+
+        return tool._call()
+
+    def _restore(self, tool, key):
+        """Restore the results of the run from the cache.
+
+        A KeyError is raised if the results can not be used.
+        """
+
+        dname = os.path.join(self._cachedir, key)
+        efile = os.path.join(dname, _CACHE_ENTRY)
+        try:
+            with open(efile, "r") as fh:
+                entry = json.load(fh)
+
+        except (OSError, ValueError):
+            raise KeyError(key) from None
+
+        if "clobber" in tool._parnames:
+            clobber = tool._get_param_value("clobber")
+        else:
+            clobber = False
+
+        outputs = entry["outputs"]
+        if not clobber and \
+           any(os.path.exists(path) for (path, _, _) in outputs):
+            v3(f"Unable to restore {tool._toolname} outputs as clobber is not set")
+            raise KeyError(key)
+
+        stime = time.localtime()
+        try:
+            for (path, name, checksum) in outputs:
+                v5(f"Restoring {path} from the cache")
+                shutil.copy(os.path.join(dname, name), path)
+                self._record_output(path, checksum)
+
+            os.utime(efile)
+
+        except OSError:
+            # e.g. the entry has been removed by another process
+            raise KeyError(key) from None
+
+        etime = time.localtime()
+
+        # The parameter values are only changed once the entry has
+        # been restored.
+        tool._settings = dict(entry["settings"])
+
+        runtimes = entry["runtimes"]
+        tool._runtimes = {"start": stime,
+                          "end": etime,
+                          "delta": _time_delta(stime, etime),
+                          "args": [tuple(arg) for arg in runtimes["args"]],
+                          "code": runtimes["code"],
+                          "output": runtimes["output"]}
+
+        retval = entry["retval"]
+        if retval is None:
+            return None
+
+        return CIAOPrintableString(retval)
+
+    def _store(self, tool, key, retval):
+        """Add the results of the run to the cache."""
+
+        toolname = tool._toolname
+        outputs = self._get_outputs(tool)
+        missing = [path for path in outputs if not os.path.isfile(path)]
+        if missing:
+            v3(f"Not caching {toolname} as the output is missing: {missing[0]}")
+            self._count("uncacheable")
+            return
+
+        size = sum(os.path.getsize(path) for path in outputs)
+        if self._maxsize is not None and size > self._maxsize:
+            v3(f"Not caching {toolname} as the output is too large")
+            self._count("uncacheable")
+            return
+
+        runtimes = tool._runtimes or {}
+        entry = {"toolname": toolname,
+                 "retval": None if retval is None else str(retval),
+                 "settings": tool._settings,
+                 "runtimes": {"args": runtimes.get("args", []),
+                              "code": runtimes.get("code", 0),
+                              "output": runtimes.get("output")},
+                 "outputs": [[path, f"out{i}",
+                              _file_signature(path, checksum=True)]
+                             for (i, path) in enumerate(outputs)],
+                 "size": size}
+
+        # The entry is created in a temporary directory and then
+        # renamed, so other processes never see a partial entry.
+        #
+        tmpdir = tempfile.mkdtemp(dir=self._cachedir, prefix=".tmp")
+        try:
+            with open(os.path.join(tmpdir, _CACHE_ENTRY), "w") as fh:
+                json.dump(entry, fh)
+
+            for (path, name, _) in entry["outputs"]:
+                shutil.copy2(path, os.path.join(tmpdir, name))
+
+            os.rename(tmpdir, os.path.join(self._cachedir, key))
+
+        except (OSError, TypeError, ValueError) as exc:
+            # e.g. the entry already exists or a parameter value can
+            # not be converted to JSON
+            v3(f"Unable to cache {toolname}: {exc}")
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            self._count("uncacheable")
+            return
+
+        for (path, _, checksum) in entry["outputs"]:
+            self._record_output(path, checksum)
+
+        v3(f"Added {toolname} to the cache: {key}")
+        self._count("stores")
+        self._evict()
+
+    def _entries(self):
+        """Return the (last access, size, directory) of each entry."""
+
+        out = []
+        for name in os.listdir(self._cachedir):
+            if name.startswith("."):
+                continue
+
+            dname = os.path.join(self._cachedir, name)
+            efile = os.path.join(dname, _CACHE_ENTRY)
+            try:
+                atime = os.stat(efile).st_mtime
+                with open(efile, "r") as fh:
+                    size = json.load(fh)["size"]
+
+            except (OSError, ValueError, KeyError):
+                continue
+
+            out.append((atime, size, dname))
+
+        return out
+
+    def _evict(self):
+        """Remove the least-recently used entries to meet maxsize."""
+
+        if self._maxsize is None:
+            return
+
+        entries = sorted(self._entries())
+        total = sum(size for (_, size, _) in entries)
+        for (_, size, dname) in entries:
+            if total <= self._maxsize:
+                break
+
+            v3(f"Removing {dname} from the cache")
+            shutil.rmtree(dname, ignore_errors=True)
+            total -= size
+            self._count("evictions")
+
+    def stats(self):
+        """Return the cache statistics.
+
+        The return value is a dictionary with keys:
+
+          hits        - the number of runs restored from the cache
+          misses      - the number of runs not found in the cache
+          stores      - the number of runs added to the cache
+          uncacheable - the number of runs which could not be added
+                        to the cache, either because the tool can not
+                        be cached or the run could not be stored
+          evictions   - the number of entries removed to keep the
+                        cache within maxsize
+          entries     - the number of entries in the cache
+          size        - the size of the output files in the cache,
+                        in bytes
+
+        The counts are for this object only, and not other processes
+        which use the same cache directory.
+        """
+
+        entries = self._entries()
+        with self._lock:
+            out = dict(self._stats)
+
+        out["entries"] = len(entries)
+        out["size"] = sum(size for (_, size, _) in entries)
+        return out
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        for (_, _, dname) in self._entries():
+            shutil.rmtree(dname, ignore_errors=True)
+
+        shutil.rmtree(os.path.join(self._cachedir, _CACHE_OUTPUTS),
+                      ignore_errors=True)
+
+
+@contextmanager
+def result_cache(cachedir=None, maxsize=10 * 1024**3, checksum=False):
+    """A context manager which re-uses the results of tool runs.
+
+    Within the block, calling a tool restores its results from a
+    ToolResultCache if it has already been run with the same
+    parameter values and input files, and otherwise the tool is
+    run and the results are added to the cache. The cache is
+    returned so that the statistics can be accessed:
+
+      with result_cache("cache/") as cache:
+          for ccd in ccds:
+              mkinstmap(outfile=f"imap{ccd}.fits", ...)
+
+          print(cache.stats())
+
+    The cachedir, maxsize, and checksum arguments are passed to
+    ToolResultCache. The cache replaces any cache that is already
+    in use - such as that set by the CIAO_RUNTOOL_CACHE environment
+    variable - until the end of the block.
+    """
+
+    global _result_cache
+
+    orig = _result_cache
+    cache = ToolResultCache(cachedir=cachedir, maxsize=maxsize,
+                            checksum=checksum)
+    _result_cache = cache
+    try:
+        yield cache
+
+    finally:
+        _result_cache = orig
+
+
+def get_result_cache():
+    """Return the ToolResultCache used when running tools, or None.
+
+    This is the cache set by result_cache or the CIAO_RUNTOOL_CACHE
+    environment variable.
+    """
+
+    return _result_cache
+
+
+def _result_cache_from_environment():
+    """Create the cache set by the CIAO_RUNTOOL_CACHE environment variable.
+
+    The maximum size, in bytes, can be set with CIAO_RUNTOOL_CACHE_SIZE,
+    and the checksum of the input files used by setting
+    CIAO_RUNTOOL_CACHE_CHECKSUM to yes.
+    """
+
+    cachedir = os.environ.get("CIAO_RUNTOOL_CACHE", "").strip()
+    if cachedir == "":
+        return None
+
+    kwargs = {}
+    maxsize = os.environ.get("CIAO_RUNTOOL_CACHE_SIZE", "").strip()
+    if maxsize != "":
+        kwargs["maxsize"] = int(maxsize)
+
+    checksum = os.environ.get("CIAO_RUNTOOL_CACHE_CHECKSUM", "").strip()
+    if checksum.lower() in ["yes", "true", "1"]:
+        kwargs["checksum"] = True
+
+    try:
+        return ToolResultCache(cachedir, **kwargs)
+    except (OSError, ValueError) as exc:
+        logger.verbose1(f"Unable to use the cache {cachedir}: {exc}")
+        return None
+
+
+_result_cache = _result_cache_from_environment()
+
+
+def add_comment_lines(infile, comments):
+    """Add the text in comments to infile as a COMMENT (adding to the
+    most-interesting block). comments can either be a string or
+    an array of strings.
+
+    infile is a string. If comments is the empty array then nothing
+    is done, but empty comments are added (so comments=[] does nothing
+    but comments=[""] will add a blank comment line)
+    """
+
+    if isinstance(comments, str):
+        cs = [comments]
+    else:
+        cs = comments
+
+    if cs == []:
+        return
+
+    v4(f"Adding comments to {infile}")
+    bl = cxcdm.dmBlockOpen(infile, update=True)
+    try:
+        for comment in cs:
+            v4(f"COMMENT: {comment}")
+            cxcdm.dmBlockWriteComment(bl, 'COMMENT', comment)
+
+    finally:
+        cxcdm.dmBlockClose(bl)
+
+
+def add_tool_history(infiles, toolname, params,
+                     toolversion=None, tmpdir=None):
+    """Add a CIAO history block to each of the files in infiles saying
+    that toolname was run with the given set of parameters (a
+    key/value dictionary). If infiles is a single string then it is
+    assumed to be the name of a single file.
+
+    A comment line is also added saying
+
+        <toolname> version <toolversion>
+
+    when toolversion is not None.
+
+    The process is done with a temporary PFILES environment (using the
+    new_pfiles_environment context manager, passing through the tmpdir
+    argument) to avoid problems with clobbering an existing parameter
+    file.
+    """
+
+    msg = f"Adding HISTORY record for {toolname} "
+    if toolversion is not None:
+        msg += f"({toolversion}) "
+
+    v2(msg)
+    v3(f"Params: {params}")
+
+    # special case a single file
+    if isinstance(infiles, str):
+        infiles = [infiles]
+
+    tool = make_tool('dmhistory')
+    with new_pfiles_environment(ardlib=False, copyuser=False, tmpdir=tmpdir):
+        # would like to just say
+        # pio.pset(toolname, params)
+        # but for now do it manually
+        #
+        pio.punlearn(toolname)
+        fp = pio.paramopen(toolname, "wL")
+        for (k, v) in params.items():
+            v3(f"Checking parameter <{k}> value <{v}> type={type(v)}")
+            if isinstance(v, bool):
+                if v:
+                    val = "yes"
+                else:
+                    val = "no"
+            else:
+                val = str(v)
+
+            v3(f" -> {k}={v}")
+            pio.pset(fp, k, val)
+
+        pio.paramclose(fp)
+
+        if toolversion is not None:
+            comments = [f"{toolname} version {toolversion}"]
+        else:
+            comments = None
+
+        for infile in infiles:
+            v2(f"Adding history to {infile}")
+            if comments is not None:
+                add_comment_lines(infile, comments)
 
             tool(infile=infile, tool=toolname, action="put")
 
 
-parinfo = {}
+# The parameter lists for each tool are stored as text - e.g.
+# '[ParValue("infile","f","Input file",None)]' - by the auto-generated
+# code below, and only converted into ParValue, ParSet, and ParRange
+# objects when the tool is first used, since most scripts only use a
+# handful of the tools. Normally the auto-generated code is not run,
+# as the information is read from the binary index installed with
+# this module instead (see _load_parinfo).
+#
+_partypes = {"ParValue": ParValue, "ParSet": ParSet, "ParRange": ParRange}
+
+_PARINFO_INDEX = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "runtool.parinfo")
+
+
+def _parse_param_list(pars):
+    """Convert the text version of a parameter list.
+
+    The input is returned unchanged if it is not a string.
+    """
+
+    if not isinstance(pars, str):
+        return pars
+
+    return eval(pars, {"__builtins__": {}}, _partypes)
+
+
+def _from_records(records):
+    """Convert the records from the parameter index."""
+
+    return [_partypes[rec[0]](*rec[1:]) for rec in records]
+
+
+class ParInfo(MutableMapping):
+    """Store the parameter information for each tool.
+
+    The keys are the tool names and the values are dictionaries with
+    the keys 'istool', 'req', and 'opt'. The parameter lists (the
+    'req' and 'opt' values) may be set as text, in which case they
+    are converted the first time the tool information is accessed.
+    The information can also be read from a parameter index (see
+    ciao_contrib._parinfo_index), in which case it is only decoded
+    when first accessed.
+    """
+
+    def __init__(self):
+        self._raw = {}
+        self._parsed = {}
+        self._index = None
+
+    def __getitem__(self, toolname):
+        try:
+            return self._parsed[toolname]
+        except KeyError:
+            pass
+
+        raw = self._raw[toolname]
+        v5(f"Converting the parameter information for {toolname}")
+        if raw is None:
+            (req, opt) = self._index.records(toolname)
+            pi = {"istool": self._index.istool(toolname),
+                  "req": _from_records(req),
+                  "opt": _from_records(opt)}
+        else:
+            pi = {"istool": raw["istool"],
+                  "req": _parse_param_list(raw["req"]),
+                  "opt": _parse_param_list(raw["opt"])}
+
+        self._parsed[toolname] = pi
+        return pi
+
+    def __setitem__(self, toolname, pi):
+        self._raw[toolname] = pi
+        self._parsed.pop(toolname, None)
+
+    def __delitem__(self, toolname):
+        del self._raw[toolname]
+        self._parsed.pop(toolname, None)
+
+    def __contains__(self, toolname):
+        return toolname in self._raw
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def istool(self, toolname):
+        """Does the parameter file have an associated executable?
+
+        Unlike parinfo[toolname]['istool'] this does not convert
+        the parameter information.
+        """
+
+        raw = self._raw[toolname]
+        if raw is None:
+            return self._index.istool(toolname)
+
+        return raw["istool"]
+
+    def use_index(self, index):
+        """Use the parameter index (a ParIndex object) for the tools.
+
+        Any existing entries are removed.
+        """
+
+        self._raw = dict.fromkeys(index)
+        self._parsed = {}
+        self._index = index
+
+
+parinfo = ParInfo()
+
+
+def _load_parinfo():
+    """Set up the parameter information for the tools.
+
+    The information is read from the binary index created by
+    mk_runtool.py, which is installed with this module, when it
+    exists and matches the auto-generated code in this module (as
+    determined by _PARINFO_HASH), otherwise the auto-generated code
+    is run. The index is not re-created here, since the module may
+    be installed in a read-only location; use
+
+      python mk_runtool.py --index
+
+    to re-create it.
+    """
+
+    index = _parinfo_index.read_index(_PARINFO_INDEX, _PARINFO_HASH)
+    if index is not None:
+        parinfo.use_index(index)
+        return
+
+    v3(f"Unable to use the parameter index: {_PARINFO_INDEX}")
+    _add_parinfo_from_source()
 
 
 # We use list_tools rather than the more semantically-correct name
@@ -2457,8 +4167,8 @@ def list_tools(tools=True, params=True):
     if params:
         allowed.append(False)
 
-    out = [pname for (pname, pi) in parinfo.items()
-           if pi["istool"] in allowed]
+    out = [pname for pname in parinfo
+           if parinfo.istool(pname) in allowed]
     out.sort()
     return out
 
@@ -2490,1447 +4200,1494 @@ def make_tool(toolname):
 
     raise ValueError(f"The tool '{toolname}' is not available.")
 
+
+# The tool objects are created when first accessed - e.g.
+# ciao_contrib.runtool.dmstat or "from ciao_contrib.runtool import
+# dmstat" - rather than when the module is imported, and then stored
+# in the module so that the same object is returned each time.
+#
+_tool_lock = threading.Lock()
+
+
+def __getattr__(name):
+    """Create the tool object for name (PEP 562)."""
+
+    if name.startswith("__") or name not in parinfo:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module = sys.modules[__name__]
+    with _tool_lock:
+        # Another thread may have created the tool.
+        try:
+            return module.__dict__[name]
+        except KeyError:
+            pass
+
+        v5(f"Creating the {name} tool")
+        tool = make_tool(name)
+        setattr(module, name, tool)
+        return tool
+
+
+def __dir__():
+    """Include the tools that have not been created yet."""
+
+    return sorted(set(globals()) | set(parinfo))
+
 # Auto-generated code follows
 #
-parinfo['acis_bkgrnd_lookup'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Event file for which you want background files",None)],
-    'opt': [ParValue("outfile","f","ACIS background file(s) to use",None),ParSet("blname","s","What block identifier should be added to the filename?",'none',["none","name","number","cfitsio"]),ParRange("verbose","i","Debug level (0=no debug information)",0,0,5)],
-    }
+_PARINFO_HASH = '2010b19805dfc1ca7b92d3a5a14a52f30648ef9f56ecbbc480e9fa5803dab9a8'
 
 
-parinfo['acis_build_badpix'] = {
-    'istool': True,
-    'req': [ParValue("pbkfile","f","Parameter block file",None),ParValue("berrfile","f","Bias error files",None),ParValue("calibfile","f","Calibration bad pixel file",None),ParValue("biasfile","f","Bias images",None),ParValue("evt0file","f","L0 Event lists",'none'),ParValue("obsfile","f","Observation parameter file or acis event-datafile",None),ParValue("outfile","f","Output filename",None)],
-    'opt': [ParRange("maxerr","i","Maximum no. of bias parity errors to record per exposure",10,1,100),ParValue("usrfile","f","User-specified supplemental bad-pixel file (NONE -- none -- <filename>)",'none'),ParValue("bitflag","s","A 32-character string where 0=exclude pixel, 1=include pixel, but not its neighbors, and 2=include pixel and its neighbors",'00000000000000122221100020022222'),ParValue("procbias","b","Process bias image data",True),ParRange("biasthresh","i","Minimum bias offset for invalid pixels in adu",6,3,4000),ParValue("writebias","b","Output faint+bias bias images",False),ParValue("outbias","f","Prefix for faint+bias bias images",None),ParValue("clobber","b","Overwrite if file exists",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
+def _add_parinfo_from_source():
+    """Add the auto-generated parameter information to parinfo."""
 
+    parinfo['acis_bkgrnd_lookup'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Event file for which you want background files",None)]',
+        'opt': '[ParValue("outfile","f","ACIS background file(s) to use",None),ParSet("blname","s","What block identifier should be added to the filename?",\'none\',["none","name","number","cfitsio"]),ParRange("verbose","i","Debug level (0=no debug information)",0,0,5)]',
+        }
 
-parinfo['acis_check_pha_range'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input ACIS event file",None)],
-    'opt': [ParValue("mskfile","f","ACIS mask file, *_msk1.fits",None),ParSet("binsize","i","Block size used to estimate gain",128,[1,2,4,8,16,32,64,128,256]),ParRange("verbose","i","Tool chatter",1,0,5)],
-    }
 
+    parinfo['acis_build_badpix'] = {
+        'istool': True,
+        'req': '[ParValue("pbkfile","f","Parameter block file",None),ParValue("berrfile","f","Bias error files",None),ParValue("calibfile","f","Calibration bad pixel file",None),ParValue("biasfile","f","Bias images",None),ParValue("evt0file","f","L0 Event lists",\'none\'),ParValue("obsfile","f","Observation parameter file or acis event-datafile",None),ParValue("outfile","f","Output filename",None)]',
+        'opt': '[ParRange("maxerr","i","Maximum no. of bias parity errors to record per exposure",10,1,100),ParValue("usrfile","f","User-specified supplemental bad-pixel file (NONE -- none -- <filename>)",\'none\'),ParValue("bitflag","s","A 32-character string where 0=exclude pixel, 1=include pixel, but not its neighbors, and 2=include pixel and its neighbors",\'00000000000000122221100020022222\'),ParValue("procbias","b","Process bias image data",True),ParRange("biasthresh","i","Minimum bias offset for invalid pixels in adu",6,3,4000),ParValue("writebias","b","Output faint+bias bias images",False),ParValue("outbias","f","Prefix for faint+bias bias images",None),ParValue("clobber","b","Overwrite if file exists",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['acis_detect_afterglow'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file or stack",None),ParValue("outfile","f","Output event file",None)],
-    'opt': [ParValue("logfile","f","Log filename",'stdout'),ParSet("pha_rules","s","Pha criteria for subsequent events",'LTEQ',["LT","LTEQ","EQ","NONE"]),ParSet("fltgrade_rules","s","Fltgrade criteria for subsequent events",'NONE',["LT","LTEQ","EQ","NONE"]),ParRange("maxchain","i","Maximum number of exposures for a single flaring event",16,2,1024),ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Overwrite output file if it exists",False)],
-    }
 
+    parinfo['acis_check_pha_range'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input ACIS event file",None)]',
+        'opt': '[ParValue("mskfile","f","ACIS mask file, *_msk1.fits",None),ParSet("binsize","i","Block size used to estimate gain",128,[1,2,4,8,16,32,64,128,256]),ParRange("verbose","i","Tool chatter",1,0,5)]',
+        }
 
-parinfo['acis_fef_lookup'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Source file (event or spectrum)",None),ParSet("chipid","s","ACIS chip number",'none',["none","NONE","0","1","2","3","4","5","6","7","8","9"]),ParRange("chipx","i","ACIS chip x coordinate",1,1,1024),ParRange("chipy","i","ACIS chip y coordinate",1,1,1024)],
-    'opt': [ParValue("outfile","s","FEF file to use",None),ParValue("quality","b","Should you use the FEF file (if no use mkacisrmf)?",False),ParRange("verbose","i","Verbose level",0,0,5)],
-    }
 
+    parinfo['acis_detect_afterglow'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file or stack",None),ParValue("outfile","f","Output event file",None)]',
+        'opt': '[ParValue("logfile","f","Log filename",\'stdout\'),ParSet("pha_rules","s","Pha criteria for subsequent events",\'LTEQ\',["LT","LTEQ","EQ","NONE"]),ParSet("fltgrade_rules","s","Fltgrade criteria for subsequent events",\'NONE\',["LT","LTEQ","EQ","NONE"]),ParRange("maxchain","i","Maximum number of exposures for a single flaring event",16,2,1024),ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Overwrite output file if it exists",False)]',
+        }
 
-parinfo['acis_find_afterglow'] = {
-    'istool': True,
-    'req': [ParValue("infile","s","Name of input event-data file(s)",None),ParValue("outfile","s","Name of output bad-pixel file",None),ParValue("badpixfile","s","Name of input bad-pixel file",None),ParValue("maskfile","s","Name of input mask file",None),ParValue("statfile","s","Name of input exposure-statistics file",None)],
-    'opt': [ParRange("expnowindow","i","Number of frames in the sliding time window",10,1,100),ParRange("probthresh","r","Minimum post-trials significance of potential afterglows (1 sigma = 0.159, 2 sigma = 0.0228, and 3 sigma = 0.00135)",0.001,1.0e-10,0.1),ParRange("cntthresh","i","Minimum number of events in an afterglow",4,2,10),ParRange("regwidth","i","Size of reference region (e.g., 7 pixels x 7 pixels)",7,3,255),ParRange("nfpixreg","i","Size of the pixel region for calculation of the Nominal Fluence",32,16,256),ParRange("nfrepeat","i","Number of iterations during calculation of Nominal Fluence",10,1,30),ParRange("tolerance","r","Tolerance for series calculations",1.0e-15,1.0e-16,1.0e-6),ParValue("runhotpix","b","Run the hot pixel portion of the algorithm?",True),ParValue("clobber","b","Overwrite output file if it exists?",False),ParRange("verbose","i","Amount of messages produced (0=none, 5=all)",0,0,5)],
-    }
 
+    parinfo['acis_fef_lookup'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Source file (event or spectrum)",None),ParSet("chipid","s","ACIS chip number",\'none\',["none","NONE","0","1","2","3","4","5","6","7","8","9"]),ParRange("chipx","i","ACIS chip x coordinate",1,1,1024),ParRange("chipy","i","ACIS chip y coordinate",1,1,1024)]',
+        'opt': '[ParValue("outfile","s","FEF file to use",None),ParValue("quality","b","Should you use the FEF file (if no use mkacisrmf)?",False),ParRange("verbose","i","Verbose level",0,0,5)]',
+        }
 
-parinfo['acis_process_events'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file or stack",None),ParValue("outfile","f","Output event file name",None),ParValue("acaofffile","f","aspect offset file ( NONE | none | <filename>)",'NONE')],
-    'opt': [ParValue("apply_cti","b","Apply CTI adjustment?",True),ParValue("apply_tgain","b","Apply time-dependent gain adjustment?",True),ParValue("obsfile","f","obs.par file for output file keywords ( NONE | none | <filename>)",'NONE'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",'stdout'),ParValue("gradefile","f","grade mapping file ( NONE | none | CALDB | <filename>)",'CALDB'),ParValue("grade_image_file","f","grade image file for cti correcting graded mode ( NONE | none | CALDB | <filename>)",'CALDB'),ParValue("gainfile","f","acis gain file ( NONE | none | CALDB | <filename>)",'CALDB'),ParValue("badpixfile","f","acis bad pixel file ( NONE | none | <filename>)",'NONE'),ParValue("threshfile","f","split threshold file ( NONE | none | CALDB | <filename>)",'CALDB'),ParValue("ctifile","f","acis CTI file ( NONE | none | CALDB | <filename>)",'CALDB'),ParValue("tgainfile","f","gain adjustment file ( NONE | none | CALDB | <filename>)",'CALDB'),ParValue("mtlfile","s","Mission time line file with FP_TEMP data",'NONE'),ParValue("eventdef","s","output format definition",')stdlev1'),ParValue("doevtgrade","b","Determine event flight grade?",True),ParValue("check_vf_pha","b","Check very faint pixels?",False),ParRange("trail","r","Trail fraction",0.027,0,1),ParValue("calculate_pi","b","perform pha->pi conversion? (requires gain file)",True),ParRange("pi_bin_width","r","Width of Pi bin in eV",14.6,1.0,100.0),ParRange("pi_num_bins","i","Number of values to bin energy into",1024,256,32767),ParRange("max_cti_iter","i","Maximum iterations for the CTI adjustment of each event",15,1,20),ParRange("cti_converge","r","The convergence criterion for each CTI-adjusted pixel in adu",0.1,0.1,1),ParValue("clobber","b","Overwrite output event file if it already exists?",False),ParRange("verbose","i","level of debug detail (0=none, 5=most)",0,0,5),ParSet("stop","s","where to end transformations",'sky',["chip","tdet","det","tan","sky","none"]),ParRange("rand_seed","i","random seed (for pixlib), 0 = use time dependent seed",1,0,None),ParValue("rand_pha","b","Randomize the pha value used in gain calculations",True),ParSet("pix_adj","s","Sub-pixel adjustment algorithm",'EDSER',["EDSER","CENTROID","RANDOMIZE","NONE"]),ParValue("subpixfile","f","Name of input sub-pixel calibration file",'CALDB'),ParValue("stdlev1","s","TE faint modes event definition string",'{d:time,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,x:status}'),ParValue("grdlev1","s","TE graded event format definition string",'{d:time,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,x:status}'),ParValue("cclev1","s","CC faint event format definition string",'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,f:sky_1d,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,x:status}'),ParValue("ccgrdlev1","s","cc graded event format definition string",'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,f:sky_1d,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,x:status}'),ParValue("cclev1a","s","Lev1.5 CC faint event format definition string",'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}'),ParValue("ccgrdlev1a","s","lev1.5 cc graded event format definition string",'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}')],
-    }
 
+    parinfo['acis_find_afterglow'] = {
+        'istool': True,
+        'req': '[ParValue("infile","s","Name of input event-data file(s)",None),ParValue("outfile","s","Name of output bad-pixel file",None),ParValue("badpixfile","s","Name of input bad-pixel file",None),ParValue("maskfile","s","Name of input mask file",None),ParValue("statfile","s","Name of input exposure-statistics file",None)]',
+        'opt': '[ParRange("expnowindow","i","Number of frames in the sliding time window",10,1,100),ParRange("probthresh","r","Minimum post-trials significance of potential afterglows (1 sigma = 0.159, 2 sigma = 0.0228, and 3 sigma = 0.00135)",0.001,1.0e-10,0.1),ParRange("cntthresh","i","Minimum number of events in an afterglow",4,2,10),ParRange("regwidth","i","Size of reference region (e.g., 7 pixels x 7 pixels)",7,3,255),ParRange("nfpixreg","i","Size of the pixel region for calculation of the Nominal Fluence",32,16,256),ParRange("nfrepeat","i","Number of iterations during calculation of Nominal Fluence",10,1,30),ParRange("tolerance","r","Tolerance for series calculations",1.0e-15,1.0e-16,1.0e-6),ParValue("runhotpix","b","Run the hot pixel portion of the algorithm?",True),ParValue("clobber","b","Overwrite output file if it exists?",False),ParRange("verbose","i","Amount of messages produced (0=none, 5=all)",0,0,5)]',
+        }
 
-parinfo['acis_set_ardlib'] = {
-    'istool': True,
-    'req': [ParValue("badpixfile","f","Bad pixel file for the observation",None)],
-    'opt': [ParValue("absolutepath","b","Use an absolute path in the parameter file",True),ParValue("ardlibfile","f","Parameter file to change",'ardlib'),ParRange("verbose","i","Verbosity (0 for no screen output)",1,0,5)],
-    }
 
+    parinfo['acis_process_events'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file or stack",None),ParValue("outfile","f","Output event file name",None),ParValue("acaofffile","f","aspect offset file ( NONE | none | <filename>)",\'NONE\')]',
+        'opt': '[ParValue("apply_cti","b","Apply CTI adjustment?",True),ParValue("apply_tgain","b","Apply time-dependent gain adjustment?",True),ParValue("obsfile","f","obs.par file for output file keywords ( NONE | none | <filename>)",\'NONE\'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",\'stdout\'),ParValue("gradefile","f","grade mapping file ( NONE | none | CALDB | <filename>)",\'CALDB\'),ParValue("grade_image_file","f","grade image file for cti correcting graded mode ( NONE | none | CALDB | <filename>)",\'CALDB\'),ParValue("gainfile","f","acis gain file ( NONE | none | CALDB | <filename>)",\'CALDB\'),ParValue("badpixfile","f","acis bad pixel file ( NONE | none | <filename>)",\'NONE\'),ParValue("threshfile","f","split threshold file ( NONE | none | CALDB | <filename>)",\'CALDB\'),ParValue("ctifile","f","acis CTI file ( NONE | none | CALDB | <filename>)",\'CALDB\'),ParValue("tgainfile","f","gain adjustment file ( NONE | none | CALDB | <filename>)",\'CALDB\'),ParValue("mtlfile","s","Mission time line file with FP_TEMP data",\'NONE\'),ParValue("eventdef","s","output format definition",\')stdlev1\'),ParValue("doevtgrade","b","Determine event flight grade?",True),ParValue("check_vf_pha","b","Check very faint pixels?",False),ParRange("trail","r","Trail fraction",0.027,0,1),ParValue("calculate_pi","b","perform pha->pi conversion? (requires gain file)",True),ParRange("pi_bin_width","r","Width of Pi bin in eV",14.6,1.0,100.0),ParRange("pi_num_bins","i","Number of values to bin energy into",1024,256,32767),ParRange("max_cti_iter","i","Maximum iterations for the CTI adjustment of each event",15,1,20),ParRange("cti_converge","r","The convergence criterion for each CTI-adjusted pixel in adu",0.1,0.1,1),ParValue("clobber","b","Overwrite output event file if it already exists?",False),ParRange("verbose","i","level of debug detail (0=none, 5=most)",0,0,5),ParSet("stop","s","where to end transformations",\'sky\',["chip","tdet","det","tan","sky","none"]),ParRange("rand_seed","i","random seed (for pixlib), 0 = use time dependent seed",1,0,None),ParValue("rand_pha","b","Randomize the pha value used in gain calculations",True),ParSet("pix_adj","s","Sub-pixel adjustment algorithm",\'EDSER\',["EDSER","CENTROID","RANDOMIZE","NONE"]),ParValue("subpixfile","f","Name of input sub-pixel calibration file",\'CALDB\'),ParValue("stdlev1","s","TE faint modes event definition string",\'{d:time,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,x:status}\'),ParValue("grdlev1","s","TE graded event format definition string",\'{d:time,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,x:status}\'),ParValue("cclev1","s","CC faint event format definition string",\'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,f:sky_1d,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,x:status}\'),ParValue("ccgrdlev1","s","cc graded event format definition string",\'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,s:tdet,f:det,f:sky,f:sky_1d,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,x:status}\'),ParValue("cclev1a","s","Lev1.5 CC faint event format definition string",\'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}\'),ParValue("ccgrdlev1a","s","lev1.5 cc graded event format definition string",\'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}\')]',
+        }
 
-parinfo['acis_split_evt_by_fptemp'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outroot","f","Output root file name",None)],
-    'opt': [ParValue("mtlfile","f","Mission time line file",'INDEF'),ParValue("clobber","b","Delete existing output files",False),ParRange("verbose","i","Tool chatter",1,0,5)],
-    }
 
+    parinfo['acis_set_ardlib'] = {
+        'istool': True,
+        'req': '[ParValue("badpixfile","f","Bad pixel file for the observation",None)]',
+        'opt': '[ParValue("absolutepath","b","Use an absolute path in the parameter file",True),ParValue("ardlibfile","f","Parameter file to change",\'ardlib\'),ParRange("verbose","i","Verbosity (0 for no screen output)",1,0,5)]',
+        }
 
-parinfo['acis_streak_map'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Evt file",None),ParValue("fovfile","f","FOV file",None),ParValue("bkgroot","f","Output background file root",None),ParValue("regfile","f","Output streak region file",None)],
-    'opt': [ParRange("nsigma","r","Std. dev. multiple used in identifying rows with sources",6,1,None),ParRange("msigma","r","Std. dev. multiple used in identifying non-streak cols",6,1,None),ParRange("ssigma","r","Std. dev. multiple used to identify real src on streak (-1 = no srcs)",-1,-1,None),ParValue("dither","i","Number of dither pixels",35),ParValue("binsize","i","Size of source-free row bins (counts)",1),ParRange("k1","r","Source free row calculation factor k1",1.0,0,None),ParRange("k2","r","Source free row calculation factor k2",2.0,0,None),ParValue("tmppath","s","Temporary file path",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['acis_split_evt_by_fptemp'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outroot","f","Output root file name",None)]',
+        'opt': '[ParValue("mtlfile","f","Mission time line file",\'INDEF\'),ParValue("clobber","b","Delete existing output files",False),ParRange("verbose","i","Tool chatter",1,0,5)]',
+        }
 
-parinfo['acisreadcorr'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None),ParValue("aspect","f","Aspect file",None),ParValue("x","r","Sky X position (pixels)",None),ParValue("y","r","Sky Y position (pixels)",None)],
-    'opt': [ParValue("dx","r","Chip X tolerance diameter (pixels)",None),ParValue("dy","r","Chip Y tolerance diameter (pixels)",None),ParValue("bkg","f","Background PI spectrum file",None),ParValue("bgroup","r","Min counts for PI group",10),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("random","i","random seed (0 use time)",0),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['acis_streak_map'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Evt file",None),ParValue("fovfile","f","FOV file",None),ParValue("bkgroot","f","Output background file root",None),ParValue("regfile","f","Output streak region file",None)]',
+        'opt': '[ParRange("nsigma","r","Std. dev. multiple used in identifying rows with sources",6,1,None),ParRange("msigma","r","Std. dev. multiple used in identifying non-streak cols",6,1,None),ParRange("ssigma","r","Std. dev. multiple used to identify real src on streak (-1 = no srcs)",-1,-1,None),ParValue("dither","i","Number of dither pixels",35),ParValue("binsize","i","Size of source-free row bins (counts)",1),ParRange("k1","r","Source free row calculation factor k1",1.0,0,None),ParRange("k2","r","Source free row calculation factor k2",2.0,0,None),ParValue("tmppath","s","Temporary file path",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['aconvolve'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("outfile","f","Output file name",None),ParValue("kernelspec","s","Kernel specification",None)],
-    'opt': [ParValue("writekernel","b","Output kernel",False),ParValue("kernelfile","f","Output kernel file name",'./.'),ParValue("writefft","b","Write fft outputs",False),ParValue("fftroot","f","Root name for FFT files",'./.'),ParSet("method","s","Convolution method",'slide',["slide","fft"]),ParSet("edges","s","Edge treatment",'wrap',["nearest","constant","mirror","wrap","renorm"]),ParValue("const","r","Constant value to use at edges with edges=constant",0),ParValue("pad","b","Pad data axes to next power of 2^n",False),ParValue("center","b","Center FFT output",False),ParSet("normkernel","s","Normalize the kernel",'area',["none","area","max"]),ParValue("clobber","b","Clobber existing output",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['acisreadcorr'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None),ParValue("aspect","f","Aspect file",None),ParValue("x","r","Sky X position (pixels)",None),ParValue("y","r","Sky Y position (pixels)",None)]',
+        'opt': '[ParValue("dx","r","Chip X tolerance diameter (pixels)",None),ParValue("dy","r","Chip Y tolerance diameter (pixels)",None),ParValue("bkg","f","Background PI spectrum file",None),ParValue("bgroup","r","Min counts for PI group",10),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("random","i","random seed (0 use time)",0),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['acrosscorr'] = {
-    'istool': True,
-    'req': [ParValue("infile1","f","Input file name #1",None),ParValue("infile2","f","Input file name #2 (none=autocorrelate)",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParValue("crop","b","Crop output to size of infile1",False),ParValue("pad","b","Pad data to size of infile1 + infile2",False),ParValue("center","b","Center output",False),ParValue("clobber","b","Clobber existing output file",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['aconvolve'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("outfile","f","Output file name",None),ParValue("kernelspec","s","Kernel specification",None)]',
+        'opt': '[ParValue("writekernel","b","Output kernel",False),ParValue("kernelfile","f","Output kernel file name",\'./.\'),ParValue("writefft","b","Write fft outputs",False),ParValue("fftroot","f","Root name for FFT files",\'./.\'),ParSet("method","s","Convolution method",\'slide\',["slide","fft"]),ParSet("edges","s","Edge treatment",\'wrap\',["nearest","constant","mirror","wrap","renorm"]),ParValue("const","r","Constant value to use at edges with edges=constant",0),ParValue("pad","b","Pad data axes to next power of 2^n",False),ParValue("center","b","Center FFT output",False),ParSet("normkernel","s","Normalize the kernel",\'area\',["none","area","max"]),ParValue("clobber","b","Clobber existing output",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['addresp'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","RMF files",None),ParValue("arffile","f","ARF files",None),ParValue("phafile","f","PHA files",None),ParValue("outfile","f","merged RMF or RSP file",None),ParValue("outarf","f","merged ARF file",None)],
-    'opt': [ParSet("type","s","output type",'rmf',["rmf","rsp"]),ParSet("method","s","ARF merge method",'avg',["sum","avg"]),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/addresp_header_lookup.txt'),ParRange("thresh","r","low threshold of energy cut-off probability",1e-06,0,None),ParValue("clobber","b","overwrite existing output file (yes|no)?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['acrosscorr'] = {
+        'istool': True,
+        'req': '[ParValue("infile1","f","Input file name #1",None),ParValue("infile2","f","Input file name #2 (none=autocorrelate)",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParValue("crop","b","Crop output to size of infile1",False),ParValue("pad","b","Pad data to size of infile1 + infile2",False),ParValue("center","b","Center output",False),ParValue("clobber","b","Clobber existing output file",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['aplimits'] = {
-    'istool': True,
-    'req': [ParRange("prob_false_detection","r","Upper limit on the probability of a type I error",.1,0., 1.),ParRange("prob_missed_detection","r","Upper limit on the probability of a type II error",.5,0., 1.),ParValue("outfile","f","Filename of output file",None),ParRange("T_s","r","Exposure time in source aperture",1,0,None),ParRange("A_s","r","Geometric area of source aperture",1,0,None),ParRange("bkg_rate","r","Background count rate",None,0,None),ParRange("m","i","Number of counts in background aperture",None,0,None),ParRange("T_b","r","Exposure time in background aperture",1,0,None),ParRange("A_b","r","Geometric area of background aperture",1,0,None)],
-    'opt': [ParRange("max_counts","i","Background count number above which the uncertainty on the background is ignored",50,0,None),ParRange("maxfev","i","Maximal number of function evaluations in numerical root finding",500,0,None),ParRange("verbose","i","Debug Level(0-5)",1,0,5),ParValue("clobber","b","OK to overwrite existing output file?",False)],
-    }
 
+    parinfo['addresp'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","RMF files",None),ParValue("arffile","f","ARF files",None),ParValue("phafile","f","PHA files",None),ParValue("outfile","f","merged RMF or RSP file",None),ParValue("outarf","f","merged ARF file",None)]',
+        'opt': '[ParSet("type","s","output type",\'rmf\',["rmf","rsp"]),ParSet("method","s","ARF merge method",\'avg\',["sum","avg"]),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/addresp_header_lookup.txt\'),ParRange("thresh","r","low threshold of energy cut-off probability",1e-06,0,None),ParValue("clobber","b","overwrite existing output file (yes|no)?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['apowerspectrum'] = {
-    'istool': True,
-    'req': [ParValue("infilereal","f","Input file name for real part",None),ParValue("infileimag","f","Input file name for imaginary part",None),ParValue("outfile","f","File name for output",None)],
-    'opt': [ParValue("pad","b","Pad data array to next power of 2",False),ParValue("center","b","Center 0 frequency at center of array",False),ParSet("scale","s","Output scale",'linear',["linear","log","db"]),ParValue("crop","b","Crop output at Nyquist frequency",False),ParValue("clobber","b","Delete existing output",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['aplimits'] = {
+        'istool': True,
+        'req': '[ParRange("prob_false_detection","r","Upper limit on the probability of a type I error",.1,0., 1.),ParRange("prob_missed_detection","r","Upper limit on the probability of a type II error",.5,0., 1.),ParValue("outfile","f","Filename of output file",None),ParRange("T_s","r","Exposure time in source aperture",1,0,None),ParRange("A_s","r","Geometric area of source aperture",1,0,None),ParRange("bkg_rate","r","Background count rate",None,0,None),ParRange("m","i","Number of counts in background aperture",None,0,None),ParRange("T_b","r","Exposure time in background aperture",1,0,None),ParRange("A_b","r","Geometric area of background aperture",1,0,None)]',
+        'opt': '[ParRange("max_counts","i","Background count number above which the uncertainty on the background is ignored",50,0,None),ParRange("maxfev","i","Maximal number of function evaluations in numerical root finding",500,0,None),ParRange("verbose","i","Debug Level(0-5)",1,0,5),ParValue("clobber","b","OK to overwrite existing output file?",False)]',
+        }
 
-parinfo['apply_fov_limits'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output image",None)],
-    'opt': [ParRange("binsize","r","Image binning factor",None,0,None),ParValue("fovfile","f","Input FOV file",None),ParSet("datatype","s","Data type for outfile",'i4',["i2","i4"]),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level (0-5)",1,0,5)],
-    }
 
+    parinfo['apowerspectrum'] = {
+        'istool': True,
+        'req': '[ParValue("infilereal","f","Input file name for real part",None),ParValue("infileimag","f","Input file name for imaginary part",None),ParValue("outfile","f","File name for output",None)]',
+        'opt': '[ParValue("pad","b","Pad data array to next power of 2",False),ParValue("center","b","Center 0 frequency at center of array",False),ParSet("scale","s","Output scale",\'linear\',["linear","log","db"]),ParValue("crop","b","Crop output at Nyquist frequency",False),ParValue("clobber","b","Delete existing output",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['aprates'] = {
-    'istool': True,
-    'req': [ParRange("n","i","Source counts",None,0,None),ParRange("A_s","r","Source area [arcsec]",None,0,None),ParRange("alpha","r","Source PSF fraction",1,0,1),ParRange("T_s","r","Source exposure time [sec]",None,0,None),ParRange("E_s","r","Source average exposure [cm^2 sec]",None,0,None),ParRange("eng_s","r","Average energy in src region [ergs]",None,0,None),ParRange("flux_s","r","Average flux in src region [ergs/cm^2/s]",None,0,None),ParRange("m","i","Background counts",None,0,None),ParRange("A_b","r","Background area [arcsec]",None,0,None),ParRange("beta","r","Background PSF fraction",0,0,1),ParRange("T_b","r","Background exposure time [sec]",None,0,None),ParRange("E_b","r","Background average exposure [cm^2 sec]",None,0,None),ParRange("eng_b","r","Average energy in bkg region [ergs]",None,0,None),ParRange("flux_b","r","Average flux in bkg region [ergs/cm^2/s]",None,0,None),ParRange("conf","r","Confidence region",0.68,0,1),ParValue("outfile","f","Output parameter file name",None)],
-    'opt': [ParRange("resolution","r","Resolution of errors",0.01,0,1),ParSet("pdf","s","Method to estimate errors",'alternate',["gaussian","alternate"]),ParValue("max_counts","i","Maximum (rn-m)/(rf-g) before switching to Gaussian",50),ParValue("itermax","i","Maximum number of iterations to determine PDF grid",100),ParValue("nsigma","r","Number of sigma from S_mle to evaluate PDF",5.0),ParValue("pmin","r","Ratio of PDF peak to extreme",1.0e-5),ParValue("clobber","b","Overwrite output file if it already exists?",False),ParRange("verbose","i","Tool verbosity",0,0,5)],
-    }
 
+    parinfo['apply_fov_limits'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output image",None)]',
+        'opt': '[ParRange("binsize","r","Image binning factor",None,0,None),ParValue("fovfile","f","Input FOV file",None),ParSet("datatype","s","Data type for outfile",\'i4\',["i2","i4"]),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level (0-5)",1,0,5)]',
+        }
 
-parinfo['ardlib'] = {
-    'istool': False,
-    'req': [ParValue("ArdlibDataPath","s","Directory containing data files",'$ASCDS_CALIB'),ParValue("GENERIC_EFFAREA_FILE","f","Enter effective area file",'xrt_ea_v2_0.fits'),ParValue("GENERIC_VIGNET_FILE","f","Enter vignetting file",'/dev/null'),ParValue("AXAF_EFFAREA_FILE_0001","f","Enter AXAF eff-area file 0001",'CALDB'),ParValue("AXAF_EFFAREA_FILE_0010","f","Enter AXAF eff-area file 0010",'CALDB'),ParValue("AXAF_EFFAREA_FILE_0100","f","Enter AXAF eff-area file 0100",'CALDB'),ParValue("AXAF_EFFAREA_FILE_1000","f","Enter AXAF eff-area file 1000",'CALDB'),ParValue("AXAF_EFFAREA_FILE_1111","f","Enter AXAF eff-area file 1111",'CALDB'),ParValue("AXAF_VIGNET_FILE_0001","f","Enter AXAF vignet file 0001",'CALDB'),ParValue("AXAF_VIGNET_FILE_0010","f","Enter AXAF vignet file 0010",'CALDB'),ParValue("AXAF_VIGNET_FILE_0100","f","Enter AXAF vignet file 0100",'CALDB'),ParValue("AXAF_VIGNET_FILE_1000","f","Enter AXAF vignet file 1000",'CALDB'),ParValue("AXAF_VIGNET_FILE_1111","f","Enter AXAF vignet file 1111",'CALDB'),ParValue("AXAF_ACIS0_QE_FILE","f","Enter ACIS-0 Mean QE File",'CALDB'),ParValue("AXAF_ACIS1_QE_FILE","f","Enter ACIS-1 Mean QE File",'CALDB'),ParValue("AXAF_ACIS2_QE_FILE","f","Enter ACIS-2 Mean QE File",'CALDB'),ParValue("AXAF_ACIS3_QE_FILE","f","Enter ACIS-3 Mean QE File",'CALDB'),ParValue("AXAF_ACIS4_QE_FILE","f","Enter ACIS-4 Mean QE File",'CALDB'),ParValue("AXAF_ACIS5_QE_FILE","f","Enter ACIS-5 Mean QE File",'CALDB'),ParValue("AXAF_ACIS6_QE_FILE","f","Enter ACIS-6 Mean QE File",'CALDB'),ParValue("AXAF_ACIS7_QE_FILE","f","Enter ACIS-7 Mean QE File",'CALDB'),ParValue("AXAF_ACIS8_QE_FILE","f","Enter ACIS-8 Mean QE File",'CALDB'),ParValue("AXAF_ACIS9_QE_FILE","f","Enter ACIS-9 Mean QE File",'CALDB'),ParValue("AXAF_ACIS0_QEU_FILE","f","Enter ACIS-0 Uniformity file",'CALDB'),ParValue("AXAF_ACIS1_QEU_FILE","f","Enter ACIS-1 Uniformity file",'CALDB'),ParValue("AXAF_ACIS2_QEU_FILE","f","Enter ACIS-2 Uniformity file",'CALDB'),ParValue("AXAF_ACIS3_QEU_FILE","f","Enter ACIS-3 Uniformity file",'CALDB'),ParValue("AXAF_ACIS4_QEU_FILE","f","Enter ACIS-4 Uniformity file",'CALDB'),ParValue("AXAF_ACIS5_QEU_FILE","f","Enter ACIS-5 Uniformity file",'CALDB'),ParValue("AXAF_ACIS6_QEU_FILE","f","Enter ACIS-6 Uniformity file",'CALDB'),ParValue("AXAF_ACIS7_QEU_FILE","f","Enter ACIS-7 Uniformity file",'CALDB'),ParValue("AXAF_ACIS8_QEU_FILE","f","Enter ACIS-8 Uniformity file",'CALDB'),ParValue("AXAF_ACIS9_QEU_FILE","f","Enter ACIS-9 Uniformity file",'CALDB'),ParValue("AXAF_ACIS0_BADPIX_FILE","f","Enter ACIS-0 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS1_BADPIX_FILE","f","Enter ACIS-1 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS2_BADPIX_FILE","f","Enter ACIS-2 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS3_BADPIX_FILE","f","Enter ACIS-3 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS4_BADPIX_FILE","f","Enter ACIS-4 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS5_BADPIX_FILE","f","Enter ACIS-5 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS6_BADPIX_FILE","f","Enter ACIS-6 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS7_BADPIX_FILE","f","Enter ACIS-7 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS8_BADPIX_FILE","f","Enter ACIS-8 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS9_BADPIX_FILE","f","Enter ACIS-9 Bad Pixel File",'CALDB'),ParValue("AXAF_ACIS0_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS1_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS2_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS3_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS4_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS5_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS6_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS7_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS8_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_ACIS9_CONTAM_FILE","f","Enter ACIS Contamination File",'CALDB'),ParValue("AXAF_HRC-I_QE_FILE","f","Enter HRC-I Mean QE file",'CALDB'),ParValue("AXAF_HRC-I_QEU_FILE","f","Enter HRC-I Mean QE file",'CALDB'),ParValue("AXAF_HRC-I_BADPIX_FILE","f","Enter HRC-I Badpix file",'NONE'),ParValue("AXAF_HRC-S1_QE_FILE","f","Enter HRC-S1 Mean QE file",'CALDB'),ParValue("AXAF_HRC-S2_QE_FILE","f","Enter HRC-S2 Mean QE file",'CALDB'),ParValue("AXAF_HRC-S3_QE_FILE","f","Enter HRC-S3 Mean QE file",'CALDB'),ParValue("AXAF_HRC-S1_QEU_FILE","f","Enter HRC-S1 QE Uniformity file",'CALDB'),ParValue("AXAF_HRC-S2_QEU_FILE","f","Enter HRC-S2 QE Uniformity file",'CALDB'),ParValue("AXAF_HRC-S3_QEU_FILE","f","Enter HRC-S3 QE Uniformity file",'CALDB'),ParValue("AXAF_HRC-S_BADPIX_FILE","f","Enter HRC-S Badpix file",'NONE'),ParValue("AXAF_HETG_1000_FILE","f","Enter HETG 1000 efficiency file",'CALDB'),ParValue("AXAF_HETG_0100_FILE","f","Enter HETG 0100 efficiency file",'CALDB'),ParValue("AXAF_HETG_0010_FILE","f","Enter HETG 0010 efficiency file",'CALDB'),ParValue("AXAF_HETG_0001_FILE","f","Enter HETG 0001 efficiency file",'CALDB'),ParValue("AXAF_LETG_1000_FILE","f","Enter LETG 1000 efficiency file",'CALDB'),ParValue("AXAF_LETG_0100_FILE","f","Enter LETG 0100 efficiency file",'CALDB'),ParValue("AXAF_LETG_0010_FILE","f","Enter LETG 0010 efficiency file",'CALDB'),ParValue("AXAF_LETG_0001_FILE","f","Enter LETG 0001 efficiency file",'CALDB'),ParValue("AXAF_HETG_1100_LSF_FILE","f","Enter MEG LSF parameter file",'CALDB'),ParValue("AXAF_HETG_0011_LSF_FILE","f","Enter HEG LSF parameter file",'CALDB'),ParValue("AXAF_LETG_1111_LSF_FILE","f","Enter LEG LSF parameter file",'CALDB'),ParValue("AXAF_RMF_FILE","f","Enter CCD RMF p3resp file",'CALDB'),ParValue("AXAF_GAIN_FILE","f","Gain File",'CALDB')],
-    'opt': [],
-    }
 
+    parinfo['aprates'] = {
+        'istool': True,
+        'req': '[ParRange("n","i","Source counts",None,0,None),ParRange("A_s","r","Source area [arcsec]",None,0,None),ParRange("alpha","r","Source PSF fraction",1,0,1),ParRange("T_s","r","Source exposure time [sec]",None,0,None),ParRange("E_s","r","Source average exposure [cm^2 sec]",None,0,None),ParRange("eng_s","r","Average energy in src region [ergs]",None,0,None),ParRange("flux_s","r","Average flux in src region [ergs/cm^2/s]",None,0,None),ParRange("m","i","Background counts",None,0,None),ParRange("A_b","r","Background area [arcsec]",None,0,None),ParRange("beta","r","Background PSF fraction",0,0,1),ParRange("T_b","r","Background exposure time [sec]",None,0,None),ParRange("E_b","r","Background average exposure [cm^2 sec]",None,0,None),ParRange("eng_b","r","Average energy in bkg region [ergs]",None,0,None),ParRange("flux_b","r","Average flux in bkg region [ergs/cm^2/s]",None,0,None),ParRange("conf","r","Confidence region",0.68,0,1),ParValue("outfile","f","Output parameter file name",None)]',
+        'opt': '[ParRange("resolution","r","Resolution of errors",0.01,0,1),ParSet("pdf","s","Method to estimate errors",\'alternate\',["gaussian","alternate"]),ParValue("max_counts","i","Maximum (rn-m)/(rf-g) before switching to Gaussian",50),ParValue("itermax","i","Maximum number of iterations to determine PDF grid",100),ParValue("nsigma","r","Number of sigma from S_mle to evaluate PDF",5.0),ParValue("pmin","r","Ratio of PDF peak to extreme",1.0e-5),ParValue("clobber","b","Overwrite output file if it already exists?",False),ParRange("verbose","i","Tool verbosity",0,0,5)]',
+        }
 
-parinfo['arestore'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("psffile","f","File with PSf information",None),ParValue("outfile","f","Output file name",None),ParValue("numiter","i","Number of iterations to perform",None)],
-    'opt': [ParValue("psf_x_center","i","X coordinate of PSF center in logical coordinates",None),ParValue("psf_y_center","i","Y coordinate of PSF center in logical coordinates",None),ParValue("clobber","b","Remove existing output file if it exists?",False),ParRange("verbose","i","Amount of tool chatter",0,0,5)],
-    }
 
+    parinfo['ardlib'] = {
+        'istool': False,
+        'req': '[ParValue("ArdlibDataPath","s","Directory containing data files",\'$ASCDS_CALIB\'),ParValue("GENERIC_EFFAREA_FILE","f","Enter effective area file",\'xrt_ea_v2_0.fits\'),ParValue("GENERIC_VIGNET_FILE","f","Enter vignetting file",\'/dev/null\'),ParValue("AXAF_EFFAREA_FILE_0001","f","Enter AXAF eff-area file 0001",\'CALDB\'),ParValue("AXAF_EFFAREA_FILE_0010","f","Enter AXAF eff-area file 0010",\'CALDB\'),ParValue("AXAF_EFFAREA_FILE_0100","f","Enter AXAF eff-area file 0100",\'CALDB\'),ParValue("AXAF_EFFAREA_FILE_1000","f","Enter AXAF eff-area file 1000",\'CALDB\'),ParValue("AXAF_EFFAREA_FILE_1111","f","Enter AXAF eff-area file 1111",\'CALDB\'),ParValue("AXAF_VIGNET_FILE_0001","f","Enter AXAF vignet file 0001",\'CALDB\'),ParValue("AXAF_VIGNET_FILE_0010","f","Enter AXAF vignet file 0010",\'CALDB\'),ParValue("AXAF_VIGNET_FILE_0100","f","Enter AXAF vignet file 0100",\'CALDB\'),ParValue("AXAF_VIGNET_FILE_1000","f","Enter AXAF vignet file 1000",\'CALDB\'),ParValue("AXAF_VIGNET_FILE_1111","f","Enter AXAF vignet file 1111",\'CALDB\'),ParValue("AXAF_ACIS0_QE_FILE","f","Enter ACIS-0 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS1_QE_FILE","f","Enter ACIS-1 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS2_QE_FILE","f","Enter ACIS-2 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS3_QE_FILE","f","Enter ACIS-3 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS4_QE_FILE","f","Enter ACIS-4 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS5_QE_FILE","f","Enter ACIS-5 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS6_QE_FILE","f","Enter ACIS-6 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS7_QE_FILE","f","Enter ACIS-7 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS8_QE_FILE","f","Enter ACIS-8 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS9_QE_FILE","f","Enter ACIS-9 Mean QE File",\'CALDB\'),ParValue("AXAF_ACIS0_QEU_FILE","f","Enter ACIS-0 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS1_QEU_FILE","f","Enter ACIS-1 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS2_QEU_FILE","f","Enter ACIS-2 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS3_QEU_FILE","f","Enter ACIS-3 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS4_QEU_FILE","f","Enter ACIS-4 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS5_QEU_FILE","f","Enter ACIS-5 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS6_QEU_FILE","f","Enter ACIS-6 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS7_QEU_FILE","f","Enter ACIS-7 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS8_QEU_FILE","f","Enter ACIS-8 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS9_QEU_FILE","f","Enter ACIS-9 Uniformity file",\'CALDB\'),ParValue("AXAF_ACIS0_BADPIX_FILE","f","Enter ACIS-0 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS1_BADPIX_FILE","f","Enter ACIS-1 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS2_BADPIX_FILE","f","Enter ACIS-2 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS3_BADPIX_FILE","f","Enter ACIS-3 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS4_BADPIX_FILE","f","Enter ACIS-4 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS5_BADPIX_FILE","f","Enter ACIS-5 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS6_BADPIX_FILE","f","Enter ACIS-6 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS7_BADPIX_FILE","f","Enter ACIS-7 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS8_BADPIX_FILE","f","Enter ACIS-8 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS9_BADPIX_FILE","f","Enter ACIS-9 Bad Pixel File",\'CALDB\'),ParValue("AXAF_ACIS0_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS1_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS2_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS3_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS4_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS5_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS6_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS7_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS8_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_ACIS9_CONTAM_FILE","f","Enter ACIS Contamination File",\'CALDB\'),ParValue("AXAF_HRC-I_QE_FILE","f","Enter HRC-I Mean QE file",\'CALDB\'),ParValue("AXAF_HRC-I_QEU_FILE","f","Enter HRC-I Mean QE file",\'CALDB\'),ParValue("AXAF_HRC-I_BADPIX_FILE","f","Enter HRC-I Badpix file",\'NONE\'),ParValue("AXAF_HRC-S1_QE_FILE","f","Enter HRC-S1 Mean QE file",\'CALDB\'),ParValue("AXAF_HRC-S2_QE_FILE","f","Enter HRC-S2 Mean QE file",\'CALDB\'),ParValue("AXAF_HRC-S3_QE_FILE","f","Enter HRC-S3 Mean QE file",\'CALDB\'),ParValue("AXAF_HRC-S1_QEU_FILE","f","Enter HRC-S1 QE Uniformity file",\'CALDB\'),ParValue("AXAF_HRC-S2_QEU_FILE","f","Enter HRC-S2 QE Uniformity file",\'CALDB\'),ParValue("AXAF_HRC-S3_QEU_FILE","f","Enter HRC-S3 QE Uniformity file",\'CALDB\'),ParValue("AXAF_HRC-S_BADPIX_FILE","f","Enter HRC-S Badpix file",\'NONE\'),ParValue("AXAF_HETG_1000_FILE","f","Enter HETG 1000 efficiency file",\'CALDB\'),ParValue("AXAF_HETG_0100_FILE","f","Enter HETG 0100 efficiency file",\'CALDB\'),ParValue("AXAF_HETG_0010_FILE","f","Enter HETG 0010 efficiency file",\'CALDB\'),ParValue("AXAF_HETG_0001_FILE","f","Enter HETG 0001 efficiency file",\'CALDB\'),ParValue("AXAF_LETG_1000_FILE","f","Enter LETG 1000 efficiency file",\'CALDB\'),ParValue("AXAF_LETG_0100_FILE","f","Enter LETG 0100 efficiency file",\'CALDB\'),ParValue("AXAF_LETG_0010_FILE","f","Enter LETG 0010 efficiency file",\'CALDB\'),ParValue("AXAF_LETG_0001_FILE","f","Enter LETG 0001 efficiency file",\'CALDB\'),ParValue("AXAF_HETG_1100_LSF_FILE","f","Enter MEG LSF parameter file",\'CALDB\'),ParValue("AXAF_HETG_0011_LSF_FILE","f","Enter HEG LSF parameter file",\'CALDB\'),ParValue("AXAF_LETG_1111_LSF_FILE","f","Enter LEG LSF parameter file",\'CALDB\'),ParValue("AXAF_RMF_FILE","f","Enter CCD RMF p3resp file",\'CALDB\'),ParValue("AXAF_GAIN_FILE","f","Gain File",\'CALDB\')]',
+        'opt': '[]',
+        }
 
-parinfo['arfcorr'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input image file",None),ParValue("arf","f","input ARF",None),ParValue("outfile","f","output PSF image or PSF_FRAC table",None),ParValue("region","f","source region",None),ParValue("x","r","image centroid, sky x coordinate",None),ParValue("y","r","image centroid, sky y coordinate",None)],
-    'opt': [ParValue("energy","r","energy in keV (0 = read from ARF)",None),ParRange("e_step","i","energy stepsize (read every 'e_step' row from ARF)",50,1,None),ParRange("radlim","r","radius at which PSF artificially drops to 0 (multiplies last radius)",2.0,1,None),ParRange("nsubpix","i","subpixelation (1d) of ecf model pixels to choose image pix value",5,1,None),ParRange("nfracpix","i","subpixelation (1d) of ecf pixels when calculating psffrac",1,1,None),ParValue("ecffile","f","ecf file",'${CALDB}/data/chandra/default/reef/hrmaD1996-12-20reefN0001.fits'),ParValue("tmpdir","s","Directory for temp. files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['arestore'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("psffile","f","File with PSf information",None),ParValue("outfile","f","Output file name",None),ParValue("numiter","i","Number of iterations to perform",None)]',
+        'opt': '[ParValue("psf_x_center","i","X coordinate of PSF center in logical coordinates",None),ParValue("psf_y_center","i","Y coordinate of PSF center in logical coordinates",None),ParValue("clobber","b","Remove existing output file if it exists?",False),ParRange("verbose","i","Amount of tool chatter",0,0,5)]',
+        }
 
-parinfo['asp_offaxis_corr'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input ASPSOL file - updated in place",None),ParValue("instrume","s","Instrument",None)],
-    'opt': [ParValue("geompar","s","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Debug Level(0-5)",0,0,5)],
-    }
 
+    parinfo['arfcorr'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input image file",None),ParValue("arf","f","input ARF",None),ParValue("outfile","f","output PSF image or PSF_FRAC table",None),ParValue("region","f","source region",None),ParValue("x","r","image centroid, sky x coordinate",None),ParValue("y","r","image centroid, sky y coordinate",None)]',
+        'opt': '[ParValue("energy","r","energy in keV (0 = read from ARF)",None),ParRange("e_step","i","energy stepsize (read every \'e_step\' row from ARF)",50,1,None),ParRange("radlim","r","radius at which PSF artificially drops to 0 (multiplies last radius)",2.0,1,None),ParRange("nsubpix","i","subpixelation (1d) of ecf model pixels to choose image pix value",5,1,None),ParRange("nfracpix","i","subpixelation (1d) of ecf pixels when calculating psffrac",1,1,None),ParValue("ecffile","f","ecf file",\'${CALDB}/data/chandra/default/reef/hrmaD1996-12-20reefN0001.fits\'),ParValue("tmpdir","s","Directory for temp. files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['asphist'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Aspect Solution List Files",None),ParValue("outfile","f","Aspect Histogram Output File",None),ParValue("evtfile","f","Event List Files",None),ParValue("dtffile","f","Live Time Correction List Files for HRC",None)],
-    'opt': [ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("res_xy","r","Aspect Resolution x and y in arcsec",0.5),ParValue("res_roll","r","Aspect Resolution roll in arcsec",600.),ParValue("max_bin","r","Maximal number of bins",10000.),ParValue("clobber","b","Clobber output",False),ParRange("verbose","i","Verbose",0,0,5)],
-    }
 
+    parinfo['asp_offaxis_corr'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input ASPSOL file - updated in place",None),ParValue("instrume","s","Instrument",None)]',
+        'opt': '[ParValue("geompar","s","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Debug Level(0-5)",0,0,5)]',
+        }
 
-parinfo['axbary'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input event file",None),ParValue("orbitfile","f","input orbit ephemeris file",None),ParValue("outfile","f","output file",None)],
-    'opt': [ParValue("ra","r","RA to be used for barycenter corrections",None),ParValue("dec","r","Dec to be used for barycenter corrections",None),ParValue("refframe","s","Reference frame to be used",'INDEF'),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['asphist'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Aspect Solution List Files",None),ParValue("outfile","f","Aspect Histogram Output File",None),ParValue("evtfile","f","Event List Files",None),ParValue("dtffile","f","Live Time Correction List Files for HRC",None)]',
+        'opt': '[ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("res_xy","r","Aspect Resolution x and y in arcsec",0.5),ParValue("res_roll","r","Aspect Resolution roll in arcsec",600.),ParValue("max_bin","r","Maximal number of bins",10000.),ParValue("clobber","b","Clobber output",False),ParRange("verbose","i","Verbose",0,0,5)]',
+        }
 
-parinfo['bkg_fixed_counts'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outroot","f","Output filename root",None),ParValue("pos","f","Input position or file with RA and Dec columns",None),ParRange("min_counts","i","Minimum number of counts in background region",10,0,None)],
-    'opt': [ParValue("src_region","f","Input stack of source region files",None),ParValue("fovfile","f","Input field-of-view file",None),ParValue("max_radius","r","Maximum background radius, None=unrestricted",None),ParRange("inner_ecf","r","PSF ECF for inner annulus radius (pixels)",0.95,0.9,0.99),ParRange("energy","r","Energy to simulate the PSF (kev)",1.0,0.3,10),ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Overwrite output files if they already exist?",False)],
-    }
 
+    parinfo['axbary'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input event file",None),ParValue("orbitfile","f","input orbit ephemeris file",None),ParValue("outfile","f","output file",None)]',
+        'opt': '[ParValue("ra","r","RA to be used for barycenter corrections",None),ParValue("dec","r","Dec to be used for barycenter corrections",None),ParValue("refframe","s","Reference frame to be used",\'INDEF\'),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['blanksky'] = {
-    'istool': True,
-    'req': [ParValue("evtfile","f","Source event file",None),ParValue("outfile","f","Output directory path + file name for output files",None)],
-    'opt': [ParValue("asolfile","f","Source aspect solution file(s)",None),ParValue("stowedbg","b","Use ACIS stowed background files?",False),ParSet("weight_method","s","Method to calculate background scale factor",'particle',["particle","time","particle-rate"]),ParValue("bkgparams","s","Optional argument for background scaling, default is [pi=300:500] for HRC and [energy=9000:12000] for ACIS",'default'),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParRange("random","i","Random seed, 0=clock time",0,0,None),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['bkg_fixed_counts'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outroot","f","Output filename root",None),ParValue("pos","f","Input position or file with RA and Dec columns",None),ParRange("min_counts","i","Minimum number of counts in background region",10,0,None)]',
+        'opt': '[ParValue("src_region","f","Input stack of source region files",None),ParValue("fovfile","f","Input field-of-view file",None),ParValue("max_radius","r","Maximum background radius, None=unrestricted",None),ParRange("inner_ecf","r","PSF ECF for inner annulus radius (pixels)",0.95,0.9,0.99),ParRange("energy","r","Energy to simulate the PSF (kev)",1.0,0.3,10),ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Overwrite output files if they already exist?",False)]',
+        }
 
-parinfo['blanksky_image'] = {
-    'istool': True,
-    'req': [ParValue("bkgfile","f","blanksky background event file",None),ParValue("outroot","f","root of output files",None),ParValue("imgfile","f","reference image file",None)],
-    'opt': [ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['blanksky'] = {
+        'istool': True,
+        'req': '[ParValue("evtfile","f","Source event file",None),ParValue("outfile","f","Output directory path + file name for output files",None)]',
+        'opt': '[ParValue("asolfile","f","Source aspect solution file(s)",None),ParValue("stowedbg","b","Use ACIS stowed background files?",False),ParSet("weight_method","s","Method to calculate background scale factor",\'particle\',["particle","time","particle-rate"]),ParValue("bkgparams","s","Optional argument for background scaling, default is [pi=300:500] for HRC and [energy=9000:12000] for ACIS",\'default\'),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParRange("random","i","Random seed, 0=clock time",0,0,None),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['blanksky_sample'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","source event file (observation or PSF)",None),ParValue("bkgfile","f","blanksky background file",None),ParValue("bkgout","f","Output directory path + file name for output file",None)],
-    'opt': [ParValue("psf_bkg_out","f","Output directory path + file name for merged PSF+bkg file",None),ParValue("regionfile","f","region file to replace infile events with background events",None),ParValue("fill_out","f","Output directory path + file name for substituting events with background events",None),ParValue("reproject","b","Reproject background events to match PSF coordinates",False),ParValue("asolfile","f","PSF aspect solution file(s)",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParRange("random","i","Random seed, 0=clock time",0,0,None),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['blanksky_image'] = {
+        'istool': True,
+        'req': '[ParValue("bkgfile","f","blanksky background event file",None),ParValue("outroot","f","root of output files",None),ParValue("imgfile","f","reference image file",None)]',
+        'opt': '[ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['calquiz'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","File to get meta data from",None),ParValue("telescope","s","telescope",None),ParValue("instrument","s","instrument",None),ParValue("product","s","data product",None)],
-    'opt': [ParValue("calfile","s","caldb specifier",'CALDB'),ParValue("outfile","s","File(s) found",None),ParValue("echo","b","Print returned cal-files to screen?",False),ParValue("echo_qual","b","return quality value",False),ParValue("echo_fidel","b","return fidelity value?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['blanksky_sample'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","source event file (observation or PSF)",None),ParValue("bkgfile","f","blanksky background file",None),ParValue("bkgout","f","Output directory path + file name for output file",None)]',
+        'opt': '[ParValue("psf_bkg_out","f","Output directory path + file name for merged PSF+bkg file",None),ParValue("regionfile","f","region file to replace infile events with background events",None),ParValue("fill_out","f","Output directory path + file name for substituting events with background events",None),ParValue("reproject","b","Reproject background events to match PSF coordinates",False),ParValue("asolfile","f","PSF aspect solution file(s)",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParRange("random","i","Random seed, 0=clock time",0,0,None),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['celldetect'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file",None),ParValue("outfile","f","Output source list",None)],
-    'opt': [ParValue("psffile","f","single psf file or list of psf files",None),ParValue("expstk","f","list of exposure map files",None),ParValue("regfile","f","ASCII regions file",'none'),ParValue("clobber","b","Overwrite exiting outputs?",False),ParValue("thresh","r","Source threshold",3),ParRange("snr_diminution","r","Diminution on SNR threshold - range (< 0 to 1) - Allows fine grained cell sliding",1.0,0,1),ParValue("findpeaks","b","Find local peaks?",True),ParValue("centroid","b","Compute source centroids?",True),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3),ParValue("expratio","r","cutoff ratio for source cell exposure variation",0),ParValue("fixedcell","i","Fixed cell size to use (0 for variable cell)",0),ParValue("xoffset","i","Offset of x axis from data center",None),ParValue("yoffset","i","Offset of y axis from data center",None),ParValue("cellfile","f","Output cell size image stack name",None),ParValue("maxlogicalwindow","i","Max logical window",8192),ParValue("bkgfile","f","Background file name",None),ParValue("bkgvalue","r","Background count/pixel",0),ParValue("bkgerrvalue","r","Background error",0),ParValue("convolve","b","Use convolution?",False),ParValue("snrfile","f","SNR output file name (for convolution only)",None),ParRange("verbose","i","Log verbosity level",0,0,5),ParValue("log","b","Make a celldetect.log file?",False)],
-    }
 
+    parinfo['calquiz'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","File to get meta data from",None),ParValue("telescope","s","telescope",None),ParValue("instrument","s","instrument",None),ParValue("product","s","data product",None)]',
+        'opt': '[ParValue("calfile","s","caldb specifier",\'CALDB\'),ParValue("outfile","s","File(s) found",None),ParValue("echo","b","Print returned cal-files to screen?",False),ParValue("echo_qual","b","return quality value",False),ParValue("echo_fidel","b","return fidelity value?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['centroid_map'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input counts image",None),ParValue("outfile","f","Output map file",None)],
-    'opt': [ParRange("numiter","i","Number of centroid iterations",1,1,None),ParValue("sitefile","f","Input initial site locations",None),ParSet("scale","s","Scaling applied to pixel values when computing centroid",'linear',["linear","sqrt","squared","asinh"]),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove outfile if it already exists?",True)],
-    }
 
+    parinfo['celldetect'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file",None),ParValue("outfile","f","Output source list",None)]',
+        'opt': '[ParValue("psffile","f","single psf file or list of psf files",None),ParValue("expstk","f","list of exposure map files",None),ParValue("regfile","f","ASCII regions file",\'none\'),ParValue("clobber","b","Overwrite exiting outputs?",False),ParValue("thresh","r","Source threshold",3),ParRange("snr_diminution","r","Diminution on SNR threshold - range (< 0 to 1) - Allows fine grained cell sliding",1.0,0,1),ParValue("findpeaks","b","Find local peaks?",True),ParValue("centroid","b","Compute source centroids?",True),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3),ParValue("expratio","r","cutoff ratio for source cell exposure variation",0),ParValue("fixedcell","i","Fixed cell size to use (0 for variable cell)",0),ParValue("xoffset","i","Offset of x axis from data center",None),ParValue("yoffset","i","Offset of y axis from data center",None),ParValue("cellfile","f","Output cell size image stack name",None),ParValue("maxlogicalwindow","i","Max logical window",8192),ParValue("bkgfile","f","Background file name",None),ParValue("bkgvalue","r","Background count/pixel",0),ParValue("bkgerrvalue","r","Background error",0),ParValue("convolve","b","Use convolution?",False),ParValue("snrfile","f","SNR output file name (for convolution only)",None),ParRange("verbose","i","Log verbosity level",0,0,5),ParValue("log","b","Make a celldetect.log file?",False)]',
+        }
 
-parinfo['chandra_repro'] = {
-    'istool': True,
-    'req': [ParValue("indir","f","Input directory",'./'),ParValue("outdir","f","Output directory (default = $indir/repro)",None)],
-    'opt': [ParValue("root","s","Root for output filenames",None),ParValue("badpixel","b","Create a new bad pixel file?",True),ParValue("process_events","b","Create a new level=2 event file?",True),ParValue("destreak","b","Destreak the ACIS-8 chip?",True),ParValue("set_ardlib","b","Set ardlib.par with the bad pixel file?",True),ParValue("check_vf_pha","b","Clean ACIS background in VFAINT data?",False),ParSet("pix_adj","s","Pixel randomization: default|edser|none|randomize",'default',["default","edser","none","randomize","centroid"]),ParValue("tg_zo_position","s","Method to determine gratings 0th order location: evt2|detect|R.A. & Dec.",'evt2'),ParValue("tg_orders","s","List of orders to extract: none, default, or comma separated list",'default'),ParValue("asol_update","b","If necessary, apply boresight correction to aspect solution file?",True),ParValue("pi_filter","b","Apply PI background filter to HRC-S+LETG data?",True),ParValue("patch_hrc_ssc","b","Patch HRC Secondary Science Corruption?",False),ParValue("cleanup","b","Cleanup intermediate files on exit",True),ParValue("clobber","b","Clobber existing file",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['centroid_map'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input counts image",None),ParValue("outfile","f","Output map file",None)]',
+        'opt': '[ParRange("numiter","i","Number of centroid iterations",1,1,None),ParValue("sitefile","f","Input initial site locations",None),ParSet("scale","s","Scaling applied to pixel values when computing centroid",\'linear\',["linear","sqrt","squared","asinh"]),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove outfile if it already exists?",True)]',
+        }
 
-parinfo['clean_spec'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","HETG PHA1 or PHA2 fits file for cleaning",None),ParValue("conf_file","f","Confusion fits table produced by CrissCross",None),ParValue("spec_root","f","Root for naming output files.",None),ParValue("arf_file","f","HETG ARF response fits file associated with pha_file. Can be pha2 matching stack. Leave empty for autdetection.",None),ParValue("resp_dir","f","Directory holding PHA-associated ARFs for auto-lookup. Leave empty for autodetection.",None)],
-    'opt': [ParRange("verbose","i","Verbosity level",1,0,5),ParValue("clobber","b","OK to overwrite existing output file?",False)],
-    }
 
+    parinfo['chandra_repro'] = {
+        'istool': True,
+        'req': '[ParValue("indir","f","Input directory",\'./\'),ParValue("outdir","f","Output directory (default = $indir/repro)",None)]',
+        'opt': '[ParValue("root","s","Root for output filenames",None),ParValue("badpixel","b","Create a new bad pixel file?",True),ParValue("process_events","b","Create a new level=2 event file?",True),ParValue("destreak","b","Destreak the ACIS-8 chip?",True),ParValue("set_ardlib","b","Set ardlib.par with the bad pixel file?",True),ParValue("check_vf_pha","b","Clean ACIS background in VFAINT data?",False),ParSet("pix_adj","s","Pixel randomization: default|edser|none|randomize",\'default\',["default","edser","none","randomize","centroid"]),ParValue("tg_zo_position","s","Method to determine gratings 0th order location: evt2|detect|R.A. & Dec.",\'evt2\'),ParValue("tg_orders","s","List of orders to extract: none, default, or comma separated list",\'default\'),ParValue("asol_update","b","If necessary, apply boresight correction to aspect solution file?",True),ParValue("pi_filter","b","Apply PI background filter to HRC-S+LETG data?",True),ParValue("patch_hrc_ssc","b","Patch HRC Secondary Science Corruption?",False),ParValue("cleanup","b","Cleanup intermediate files on exit",True),ParValue("clobber","b","Clobber existing file",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['color_color'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input ARF file",None),ParValue("outfile","f","Output file name",None),ParValue("model","s","Sherpa model expression",'xsphabs.abs1*xspowerlaw.pwrlaw'),ParValue("param1","s","Model parameter for 1st axis",'pwrlaw.PhoIndex'),ParValue("grid1","s","Model parameter grid for 1st axis",'1,2,3,4'),ParValue("param2","s","Model parameter for 2nd axis",'abs1.nH'),ParValue("grid2","s","Model grid for 2nd axis",'0.01,0.1,0.2,0.5,1,10'),ParValue("soft","s","Soft energy band LO:HI or csc (0.5:1.2)",'csc'),ParValue("medium","s","Medium energy band LO:HI or csc (1.2:2.0)",'csc'),ParValue("hard","s","Hard energy band LO:HI or csc (2.0:7.0)",'csc')],
-    'opt': [ParValue("rmffile","f","Input RMF file (use diagnonal if blank or none)",None),ParRange("plot_oversample","i","Over sample grid when plotting",20,0,None),ParValue("outplot","f","Output file name for plot",'clr.png'),ParValue("showplot","b","Display plot? (close to continue)",True),ParRange("random_seed","i","Random seed (-1 = randomly select)",-1,-1,None),ParValue("clobber","b","Remove outfile and outplot files if they already exist?",True),ParRange("verbose","i","Tool chatter level",1,0,5)],
-    }
 
+    parinfo['clean_spec'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","HETG PHA1 or PHA2 fits file for cleaning",None),ParValue("conf_file","f","Confusion fits table produced by CrissCross",None),ParValue("spec_root","f","Root for naming output files.",None),ParValue("arf_file","f","HETG ARF response fits file associated with pha_file. Can be pha2 matching stack. Leave empty for autdetection.",None),ParValue("resp_dir","f","Directory holding PHA-associated ARFs for auto-lookup. Leave empty for autodetection.",None)]',
+        'opt': '[ParRange("verbose","i","Verbosity level",1,0,5),ParValue("clobber","b","OK to overwrite existing output file?",False)]',
+        }
 
-parinfo['colors'] = {
-    'istool': False,
-    'req': [],
-    'opt': [ParValue("aliceblue","s","Color triple",'0.941176 0.972549 1'),ParValue("antiquewhite","s","Color triple",'0.980392 0.921569 0.843137'),ParValue("antiquewhite1","s","Color triple",'1 0.937255 0.858824'),ParValue("antiquewhite2","s","Color triple",'0.933333 0.874510 0.800000'),ParValue("antiquewhite3","s","Color triple",'0.803922 0.752941 0.690196'),ParValue("antiquewhite4","s","Color triple",'0.545098 0.513725 0.470588'),ParValue("aquamarine","s","Color triple",'0.498039 1 0.831373'),ParValue("aquamarine1","s","Color triple",'0.498039 1 0.831373'),ParValue("aquamarine2","s","Color triple",'0.462745 0.933333 0.776471'),ParValue("aquamarine3","s","Color triple",'0.400000 0.803922 0.666667'),ParValue("aquamarine4","s","Color triple",'0.270588 0.545098 0.454902'),ParValue("azure","s","Color triple",'0.941176 1 1'),ParValue("azure1","s","Color triple",'0.941176 1 1'),ParValue("azure2","s","Color triple",'0.878431 0.933333 0.933333'),ParValue("azure3","s","Color triple",'0.756863 0.803922 0.803922'),ParValue("azure4","s","Color triple",'0.513725 0.545098 0.545098'),ParValue("beige","s","Color triple",'0.960784 0.960784 0.862745'),ParValue("bisque","s","Color triple",'1 0.894118 0.768627'),ParValue("bisque1","s","Color triple",'1 0.894118 0.768627'),ParValue("bisque2","s","Color triple",'0.933333 0.835294 0.717647'),ParValue("bisque3","s","Color triple",'0.803922 0.717647 0.619608'),ParValue("bisque4","s","Color triple",'0.545098 0.490196 0.419608'),ParValue("black","s","Color triple",'0 0 0'),ParValue("blanchedalmond","s","Color triple",'1 0.921569 0.803922'),ParValue("blue","s","Color triple",'0 0 1'),ParValue("blue1","s","Color triple",'0 0 1'),ParValue("blue2","s","Color triple",'0 0 0.933333'),ParValue("blue3","s","Color triple",'0 0 0.803922'),ParValue("blue4","s","Color triple",'0 0 0.545098'),ParValue("blueviolet","s","Color triple",'0.541176 0.168627 0.886275'),ParValue("brightaquamarine","s","Color triple",'0.207843 0.870588 0.768627'),ParValue("brightcyan","s","Color triple",'0 1 1'),ParValue("brightyellow","s","Color triple",'1 1 0'),ParValue("brown","s","Color triple",'0.647059 0.164706 0.164706'),ParValue("brown1","s","Color triple",'1 0.250980 0.250980'),ParValue("brown2","s","Color triple",'0.933333 0.231373 0.231373'),ParValue("brown3","s","Color triple",'0.803922 0.200000 0.200000'),ParValue("brown4","s","Color triple",'0.545098 0.137255 0.137255'),ParValue("burlywood","s","Color triple",'0.870588 0.721569 0.529412'),ParValue("burlywood1","s","Color triple",'1 0.827451 0.607843'),ParValue("burlywood2","s","Color triple",'0.933333 0.772549 0.568627'),ParValue("burlywood3","s","Color triple",'0.803922 0.666667 0.490196'),ParValue("burlywood4","s","Color triple",'0.545098 0.450980 0.333333'),ParValue("cadetblue","s","Color triple",'0.372549 0.619608 0.627451'),ParValue("cadetblue1","s","Color triple",'0.596078 0.960784 1'),ParValue("cadetblue2","s","Color triple",'0.556863 0.898039 0.933333'),ParValue("cadetblue3","s","Color triple",'0.478431 0.772549 0.803922'),ParValue("cadetblue4","s","Color triple",'0.325490 0.525490 0.545098'),ParValue("chartreuse","s","Color triple",'0.498039 1 0'),ParValue("chartreuse1","s","Color triple",'0.498039 1 0'),ParValue("chartreuse2","s","Color triple",'0.462745 0.933333 0'),ParValue("chartreuse3","s","Color triple",'0.400000 0.803922 0'),ParValue("chartreuse4","s","Color triple",'0.270588 0.545098 0'),ParValue("chocolate","s","Color triple",'0.823529 0.411765 0.117647'),ParValue("chocolate1","s","Color triple",'1 0.498039 0.141176'),ParValue("chocolate2","s","Color triple",'0.933333 0.462745 0.129412'),ParValue("chocolate3","s","Color triple",'0.803922 0.400000 0.113725'),ParValue("chocolate4","s","Color triple",'0.545098 0.270588 0.074510'),ParValue("coral","s","Color triple",'1 0.498039 0.313725'),ParValue("coral1","s","Color triple",'1 0.447059 0.337255'),ParValue("coral2","s","Color triple",'0.933333 0.415686 0.313725'),ParValue("coral3","s","Color triple",'0.803922 0.356863 0.270588'),ParValue("coral4","s","Color triple",'0.545098 0.243137 0.184314'),ParValue("cornflowerblue","s","Color triple",'0.392157 0.584314 0.929412'),ParValue("cornsilk","s","Color triple",'1 0.972549 0.862745'),ParValue("cornsilk1","s","Color triple",'1 0.972549 0.862745'),ParValue("cornsilk2","s","Color triple",'0.933333 0.909804 0.803922'),ParValue("cornsilk3","s","Color triple",'0.803922 0.784314 0.694118'),ParValue("cornsilk4","s","Color triple",'0.545098 0.533333 0.470588'),ParValue("cyan","s","Color triple",'0 1 1'),ParValue("cyan1","s","Color triple",'0 1 1'),ParValue("cyan2","s","Color triple",'0 0.933333 0.933333'),ParValue("cyan3","s","Color triple",'0 0.803922 0.803922'),ParValue("cyan4","s","Color triple",'0 0.545098 0.545098'),ParValue("darkgoldenrod","s","Color triple",'0.721569 0.525490 0.043137'),ParValue("darkgoldenrod1","s","Color triple",'1 0.725490 0.058824'),ParValue("darkgoldenrod2","s","Color triple",'0.933333 0.678431 0.054902'),ParValue("darkgoldenrod3","s","Color triple",'0.803922 0.584314 0.047059'),ParValue("darkgoldenrod4","s","Color triple",'0.545098 0.396078 0.031373'),ParValue("darkgreen","s","Color triple",'0 0.392157 0'),ParValue("darkkhaki","s","Color triple",'0.741176 0.717647 0.419608'),ParValue("darkolivegreen","s","Color triple",'0.333333 0.419608 0.184314'),ParValue("darkolivegreen1","s","Color triple",'0.792157 1 0.439216'),ParValue("darkolivegreen2","s","Color triple",'0.737255 0.933333 0.407843'),ParValue("darkolivegreen3","s","Color triple",'0.635294 0.803922 0.352941'),ParValue("darkolivegreen4","s","Color triple",'0.431373 0.545098 0.239216'),ParValue("darkorange","s","Color triple",'1 0.549020 0'),ParValue("darkorange1","s","Color triple",'1 0.498039 0'),ParValue("darkorange2","s","Color triple",'0.933333 0.462745 0'),ParValue("darkorange3","s","Color triple",'0.803922 0.400000 0'),ParValue("darkorange4","s","Color triple",'0.545098 0.270588 0'),ParValue("darkorchid","s","Color triple",'0.600000 0.196078 0.800000'),ParValue("darkorchid1","s","Color triple",'0.749020 0.243137 1'),ParValue("darkorchid2","s","Color triple",'0.698039 0.227451 0.933333'),ParValue("darkorchid3","s","Color triple",'0.603922 0.196078 0.803922'),ParValue("darkorchid4","s","Color triple",'0.407843 0.133333 0.545098'),ParValue("darksalmon","s","Color triple",'0.913725 0.588235 0.478431'),ParValue("darkseagreen","s","Color triple",'0.560784 0.737255 0.560784'),ParValue("darkseagreen1","s","Color triple",'0.756863 1 0.756863'),ParValue("darkseagreen2","s","Color triple",'0.705882 0.933333 0.705882'),ParValue("darkseagreen3","s","Color triple",'0.607843 0.803922 0.607843'),ParValue("darkseagreen4","s","Color triple",'0.411765 0.545098 0.411765'),ParValue("darkslateblue","s","Color triple",'0.282353 0.239216 0.545098'),ParValue("darkslategray","s","Color triple",'0.184314 0.309804 0.309804'),ParValue("darkslategray1","s","Color triple",'0.592157 1 1'),ParValue("darkslategray2","s","Color triple",'0.552941 0.933333 0.933333'),ParValue("darkslategray3","s","Color triple",'0.474510 0.803922 0.803922'),ParValue("darkslategray4","s","Color triple",'0.321569 0.545098 0.545098'),ParValue("darkslategrey","s","Color triple",'0.184314 0.309804 0.309804'),ParValue("darkturquoise","s","Color triple",'0 0.807843 0.819608'),ParValue("darkviolet","s","Color triple",'0.580392 0 0.827451'),ParValue("deeppink","s","Color triple",'1 0.078431 0.576471'),ParValue("deeppink1","s","Color triple",'1 0.078431 0.576471'),ParValue("deeppink2","s","Color triple",'0.933333 0.070588 0.537255'),ParValue("deeppink3","s","Color triple",'0.803922 0.062745 0.462745'),ParValue("deeppink4","s","Color triple",'0.545098 0.039216 0.313725'),ParValue("deepskyblue","s","Color triple",'0 0.749020 1'),ParValue("deepskyblue1","s","Color triple",'0 0.749020 1'),ParValue("deepskyblue2","s","Color triple",'0 0.698039 0.933333'),ParValue("deepskyblue3","s","Color triple",'0 0.603922 0.803922'),ParValue("deepskyblue4","s","Color triple",'0 0.407843 0.545098'),ParValue("dimgray","s","Color triple",'0.411765 0.411765 0.411765'),ParValue("dimgrey","s","Color triple",'0.411765 0.411765 0.411765'),ParValue("dodgerblue","s","Color triple",'0.117647 0.564706 1'),ParValue("dodgerblue1","s","Color triple",'0.117647 0.564706 1'),ParValue("dodgerblue2","s","Color triple",'0.109804 0.525490 0.933333'),ParValue("dodgerblue3","s","Color triple",'0.094118 0.454902 0.803922'),ParValue("dodgerblue4","s","Color triple",'0.062745 0.305882 0.545098'),ParValue("firebrick","s","Color triple",'0.698039 0.133333 0.133333'),ParValue("firebrick1","s","Color triple",'1 0.188235 0.188235'),ParValue("firebrick2","s","Color triple",'0.933333 0.172549 0.172549'),ParValue("firebrick3","s","Color triple",'0.803922 0.149020 0.149020'),ParValue("firebrick4","s","Color triple",'0.545098 0.101961 0.101961'),ParValue("floralwhite","s","Color triple",'1 0.980392 0.941176'),ParValue("forestgreen","s","Color triple",'0.133333 0.545098 0.133333'),ParValue("gainsboro","s","Color triple",'0.862745 0.862745 0.862745'),ParValue("ghostwhite","s","Color triple",'0.972549 0.972549 1'),ParValue("gold","s","Color triple",'1 0.843137 0'),ParValue("gold1","s","Color triple",'1 0.843137 0'),ParValue("gold2","s","Color triple",'0.933333 0.788235 0'),ParValue("gold3","s","Color triple",'0.803922 0.678431 0'),ParValue("gold4","s","Color triple",'0.545098 0.458824 0'),ParValue("goldenrod","s","Color triple",'0.854902 0.647059 0.125490'),ParValue("goldenrod1","s","Color triple",'1 0.756863 0.145098'),ParValue("goldenrod2","s","Color triple",'0.933333 0.705882 0.133333'),ParValue("goldenrod3","s","Color triple",'0.803922 0.607843 0.113725'),ParValue("goldenrod4","s","Color triple",'0.545098 0.411765 0.078431'),ParValue("gray","s","Color triple",'0.745098 0.745098 0.745098'),ParValue("gray0","s","Color triple",'0 0 0'),ParValue("gray1","s","Color triple",'0.011765 0.011765 0.011765'),ParValue("gray10","s","Color triple",'0.101961 0.101961 0.101961'),ParValue("gray100","s","Color triple",'1 1 1'),ParValue("gray11","s","Color triple",'0.109804 0.109804 0.109804'),ParValue("gray12","s","Color triple",'0.121569 0.121569 0.121569'),ParValue("gray13","s","Color triple",'0.129412 0.129412 0.129412'),ParValue("gray14","s","Color triple",'0.141176 0.141176 0.141176'),ParValue("gray15","s","Color triple",'0.149020 0.149020 0.149020'),ParValue("gray16","s","Color triple",'0.160784 0.160784 0.160784'),ParValue("gray17","s","Color triple",'0.168627 0.168627 0.168627'),ParValue("gray18","s","Color triple",'0.180392 0.180392 0.180392'),ParValue("gray19","s","Color triple",'0.188235 0.188235 0.188235'),ParValue("gray2","s","Color triple",'0.019608 0.019608 0.019608'),ParValue("gray20","s","Color triple",'0.200000 0.200000 0.200000'),ParValue("gray21","s","Color triple",'0.211765 0.211765 0.211765'),ParValue("gray22","s","Color triple",'0.219608 0.219608 0.219608'),ParValue("gray23","s","Color triple",'0.231373 0.231373 0.231373'),ParValue("gray24","s","Color triple",'0.239216 0.239216 0.239216'),ParValue("gray25","s","Color triple",'0.250980 0.250980 0.250980'),ParValue("gray26","s","Color triple",'0.258824 0.258824 0.258824'),ParValue("gray27","s","Color triple",'0.270588 0.270588 0.270588'),ParValue("gray28","s","Color triple",'0.278431 0.278431 0.278431'),ParValue("gray29","s","Color triple",'0.290196 0.290196 0.290196'),ParValue("gray3","s","Color triple",'0.031373 0.031373 0.031373'),ParValue("gray30","s","Color triple",'0.301961 0.301961 0.301961'),ParValue("gray31","s","Color triple",'0.309804 0.309804 0.309804'),ParValue("gray32","s","Color triple",'0.321569 0.321569 0.321569'),ParValue("gray33","s","Color triple",'0.329412 0.329412 0.329412'),ParValue("gray34","s","Color triple",'0.341176 0.341176 0.341176'),ParValue("gray35","s","Color triple",'0.349020 0.349020 0.349020'),ParValue("gray36","s","Color triple",'0.360784 0.360784 0.360784'),ParValue("gray37","s","Color triple",'0.368627 0.368627 0.368627'),ParValue("gray38","s","Color triple",'0.380392 0.380392 0.380392'),ParValue("gray39","s","Color triple",'0.388235 0.388235 0.388235'),ParValue("gray4","s","Color triple",'0.039216 0.039216 0.039216'),ParValue("gray40","s","Color triple",'0.400000 0.400000 0.400000'),ParValue("gray41","s","Color triple",'0.411765 0.411765 0.411765'),ParValue("gray42","s","Color triple",'0.419608 0.419608 0.419608'),ParValue("gray43","s","Color triple",'0.431373 0.431373 0.431373'),ParValue("gray44","s","Color triple",'0.439216 0.439216 0.439216'),ParValue("gray45","s","Color triple",'0.450980 0.450980 0.450980'),ParValue("gray46","s","Color triple",'0.458824 0.458824 0.458824'),ParValue("gray47","s","Color triple",'0.470588 0.470588 0.470588'),ParValue("gray48","s","Color triple",'0.478431 0.478431 0.478431'),ParValue("gray49","s","Color triple",'0.490196 0.490196 0.490196'),ParValue("gray5","s","Color triple",'0.050980 0.050980 0.050980'),ParValue("gray50","s","Color triple",'0.498039 0.498039 0.498039'),ParValue("gray51","s","Color triple",'0.509804 0.509804 0.509804'),ParValue("gray52","s","Color triple",'0.521569 0.521569 0.521569'),ParValue("gray53","s","Color triple",'0.529412 0.529412 0.529412'),ParValue("gray54","s","Color triple",'0.541176 0.541176 0.541176'),ParValue("gray55","s","Color triple",'0.549020 0.549020 0.549020'),ParValue("gray56","s","Color triple",'0.560784 0.560784 0.560784'),ParValue("gray57","s","Color triple",'0.568627 0.568627 0.568627'),ParValue("gray58","s","Color triple",'0.580392 0.580392 0.580392'),ParValue("gray59","s","Color triple",'0.588235 0.588235 0.588235'),ParValue("gray6","s","Color triple",'0.058824 0.058824 0.058824'),ParValue("gray60","s","Color triple",'0.600000 0.600000 0.600000'),ParValue("gray61","s","Color triple",'0.611765 0.611765 0.611765'),ParValue("gray62","s","Color triple",'0.619608 0.619608 0.619608'),ParValue("gray63","s","Color triple",'0.631373 0.631373 0.631373'),ParValue("gray64","s","Color triple",'0.639216 0.639216 0.639216'),ParValue("gray65","s","Color triple",'0.650980 0.650980 0.650980'),ParValue("gray66","s","Color triple",'0.658824 0.658824 0.658824'),ParValue("gray67","s","Color triple",'0.670588 0.670588 0.670588'),ParValue("gray68","s","Color triple",'0.678431 0.678431 0.678431'),ParValue("gray69","s","Color triple",'0.690196 0.690196 0.690196'),ParValue("gray7","s","Color triple",'0.070588 0.070588 0.070588'),ParValue("gray70","s","Color triple",'0.701961 0.701961 0.701961'),ParValue("gray71","s","Color triple",'0.709804 0.709804 0.709804'),ParValue("gray72","s","Color triple",'0.721569 0.721569 0.721569'),ParValue("gray73","s","Color triple",'0.729412 0.729412 0.729412'),ParValue("gray74","s","Color triple",'0.741176 0.741176 0.741176'),ParValue("gray75","s","Color triple",'0.749020 0.749020 0.749020'),ParValue("gray76","s","Color triple",'0.760784 0.760784 0.760784'),ParValue("gray77","s","Color triple",'0.768627 0.768627 0.768627'),ParValue("gray78","s","Color triple",'0.780392 0.780392 0.780392'),ParValue("gray79","s","Color triple",'0.788235 0.788235 0.788235'),ParValue("gray8","s","Color triple",'0.078431 0.078431 0.078431'),ParValue("gray80","s","Color triple",'0.800000 0.800000 0.800000'),ParValue("gray81","s","Color triple",'0.811765 0.811765 0.811765'),ParValue("gray82","s","Color triple",'0.819608 0.819608 0.819608'),ParValue("gray83","s","Color triple",'0.831373 0.831373 0.831373'),ParValue("gray84","s","Color triple",'0.839216 0.839216 0.839216'),ParValue("gray85","s","Color triple",'0.850980 0.850980 0.850980'),ParValue("gray86","s","Color triple",'0.858824 0.858824 0.858824'),ParValue("gray87","s","Color triple",'0.870588 0.870588 0.870588'),ParValue("gray88","s","Color triple",'0.878431 0.878431 0.878431'),ParValue("gray89","s","Color triple",'0.890196 0.890196 0.890196'),ParValue("gray9","s","Color triple",'0.090196 0.090196 0.090196'),ParValue("gray90","s","Color triple",'0.898039 0.898039 0.898039'),ParValue("gray91","s","Color triple",'0.909804 0.909804 0.909804'),ParValue("gray92","s","Color triple",'0.921569 0.921569 0.921569'),ParValue("gray93","s","Color triple",'0.929412 0.929412 0.929412'),ParValue("gray94","s","Color triple",'0.941176 0.941176 0.941176'),ParValue("gray95","s","Color triple",'0.949020 0.949020 0.949020'),ParValue("gray96","s","Color triple",'0.960784 0.960784 0.960784'),ParValue("gray97","s","Color triple",'0.968627 0.968627 0.968627'),ParValue("gray98","s","Color triple",'0.980392 0.980392 0.980392'),ParValue("gray99","s","Color triple",'0.988235 0.988235 0.988235'),ParValue("green","s","Color triple",'0 1 0'),ParValue("green1","s","Color triple",'0 1 0'),ParValue("green2","s","Color triple",'0 0.933333 0'),ParValue("green3","s","Color triple",'0 0.803922 0'),ParValue("green4","s","Color triple",'0 0.545098 0'),ParValue("greenyellow","s","Color triple",'0.678431 1 0.184314'),ParValue("grey","s","Color triple",'0.745098 0.745098 0.745098'),ParValue("grey0","s","Color triple",'0 0 0'),ParValue("grey1","s","Color triple",'0.011765 0.011765 0.011765'),ParValue("grey10","s","Color triple",'0.101961 0.101961 0.101961'),ParValue("grey100","s","Color triple",'1 1 1'),ParValue("grey11","s","Color triple",'0.109804 0.109804 0.109804'),ParValue("grey12","s","Color triple",'0.121569 0.121569 0.121569'),ParValue("grey13","s","Color triple",'0.129412 0.129412 0.129412'),ParValue("grey14","s","Color triple",'0.141176 0.141176 0.141176'),ParValue("grey15","s","Color triple",'0.149020 0.149020 0.149020'),ParValue("grey16","s","Color triple",'0.160784 0.160784 0.160784'),ParValue("grey17","s","Color triple",'0.168627 0.168627 0.168627'),ParValue("grey18","s","Color triple",'0.180392 0.180392 0.180392'),ParValue("grey19","s","Color triple",'0.188235 0.188235 0.188235'),ParValue("grey2","s","Color triple",'0.019608 0.019608 0.019608'),ParValue("grey20","s","Color triple",'0.200000 0.200000 0.200000'),ParValue("grey21","s","Color triple",'0.211765 0.211765 0.211765'),ParValue("grey22","s","Color triple",'0.219608 0.219608 0.219608'),ParValue("grey23","s","Color triple",'0.231373 0.231373 0.231373'),ParValue("grey24","s","Color triple",'0.239216 0.239216 0.239216'),ParValue("grey25","s","Color triple",'0.250980 0.250980 0.250980'),ParValue("grey26","s","Color triple",'0.258824 0.258824 0.258824'),ParValue("grey27","s","Color triple",'0.270588 0.270588 0.270588'),ParValue("grey28","s","Color triple",'0.278431 0.278431 0.278431'),ParValue("grey29","s","Color triple",'0.290196 0.290196 0.290196'),ParValue("grey3","s","Color triple",'0.031373 0.031373 0.031373'),ParValue("grey30","s","Color triple",'0.301961 0.301961 0.301961'),ParValue("grey31","s","Color triple",'0.309804 0.309804 0.309804'),ParValue("grey32","s","Color triple",'0.321569 0.321569 0.321569'),ParValue("grey33","s","Color triple",'0.329412 0.329412 0.329412'),ParValue("grey34","s","Color triple",'0.341176 0.341176 0.341176'),ParValue("grey35","s","Color triple",'0.349020 0.349020 0.349020'),ParValue("grey36","s","Color triple",'0.360784 0.360784 0.360784'),ParValue("grey37","s","Color triple",'0.368627 0.368627 0.368627'),ParValue("grey38","s","Color triple",'0.380392 0.380392 0.380392'),ParValue("grey39","s","Color triple",'0.388235 0.388235 0.388235'),ParValue("grey4","s","Color triple",'0.039216 0.039216 0.039216'),ParValue("grey40","s","Color triple",'0.400000 0.400000 0.400000'),ParValue("grey41","s","Color triple",'0.411765 0.411765 0.411765'),ParValue("grey42","s","Color triple",'0.419608 0.419608 0.419608'),ParValue("grey43","s","Color triple",'0.431373 0.431373 0.431373'),ParValue("grey44","s","Color triple",'0.439216 0.439216 0.439216'),ParValue("grey45","s","Color triple",'0.450980 0.450980 0.450980'),ParValue("grey46","s","Color triple",'0.458824 0.458824 0.458824'),ParValue("grey47","s","Color triple",'0.470588 0.470588 0.470588'),ParValue("grey48","s","Color triple",'0.478431 0.478431 0.478431'),ParValue("grey49","s","Color triple",'0.490196 0.490196 0.490196'),ParValue("grey5","s","Color triple",'0.050980 0.050980 0.050980'),ParValue("grey50","s","Color triple",'0.498039 0.498039 0.498039'),ParValue("grey51","s","Color triple",'0.509804 0.509804 0.509804'),ParValue("grey52","s","Color triple",'0.521569 0.521569 0.521569'),ParValue("grey53","s","Color triple",'0.529412 0.529412 0.529412'),ParValue("grey54","s","Color triple",'0.541176 0.541176 0.541176'),ParValue("grey55","s","Color triple",'0.549020 0.549020 0.549020'),ParValue("grey56","s","Color triple",'0.560784 0.560784 0.560784'),ParValue("grey57","s","Color triple",'0.568627 0.568627 0.568627'),ParValue("grey58","s","Color triple",'0.580392 0.580392 0.580392'),ParValue("grey59","s","Color triple",'0.588235 0.588235 0.588235'),ParValue("grey6","s","Color triple",'0.058824 0.058824 0.058824'),ParValue("grey60","s","Color triple",'0.600000 0.600000 0.600000'),ParValue("grey61","s","Color triple",'0.611765 0.611765 0.611765'),ParValue("grey62","s","Color triple",'0.619608 0.619608 0.619608'),ParValue("grey63","s","Color triple",'0.631373 0.631373 0.631373'),ParValue("grey64","s","Color triple",'0.639216 0.639216 0.639216'),ParValue("grey65","s","Color triple",'0.650980 0.650980 0.650980'),ParValue("grey66","s","Color triple",'0.658824 0.658824 0.658824'),ParValue("grey67","s","Color triple",'0.670588 0.670588 0.670588'),ParValue("grey68","s","Color triple",'0.678431 0.678431 0.678431'),ParValue("grey69","s","Color triple",'0.690196 0.690196 0.690196'),ParValue("grey7","s","Color triple",'0.070588 0.070588 0.070588'),ParValue("grey70","s","Color triple",'0.701961 0.701961 0.701961'),ParValue("grey71","s","Color triple",'0.709804 0.709804 0.709804'),ParValue("grey72","s","Color triple",'0.721569 0.721569 0.721569'),ParValue("grey73","s","Color triple",'0.729412 0.729412 0.729412'),ParValue("grey74","s","Color triple",'0.741176 0.741176 0.741176'),ParValue("grey75","s","Color triple",'0.749020 0.749020 0.749020'),ParValue("grey76","s","Color triple",'0.760784 0.760784 0.760784'),ParValue("grey77","s","Color triple",'0.768627 0.768627 0.768627'),ParValue("grey78","s","Color triple",'0.780392 0.780392 0.780392'),ParValue("grey79","s","Color triple",'0.788235 0.788235 0.788235'),ParValue("grey8","s","Color triple",'0.078431 0.078431 0.078431'),ParValue("grey80","s","Color triple",'0.800000 0.800000 0.800000'),ParValue("grey81","s","Color triple",'0.811765 0.811765 0.811765'),ParValue("grey82","s","Color triple",'0.819608 0.819608 0.819608'),ParValue("grey83","s","Color triple",'0.831373 0.831373 0.831373'),ParValue("grey84","s","Color triple",'0.839216 0.839216 0.839216'),ParValue("grey85","s","Color triple",'0.850980 0.850980 0.850980'),ParValue("grey86","s","Color triple",'0.858824 0.858824 0.858824'),ParValue("grey87","s","Color triple",'0.870588 0.870588 0.870588'),ParValue("grey88","s","Color triple",'0.878431 0.878431 0.878431'),ParValue("grey89","s","Color triple",'0.890196 0.890196 0.890196'),ParValue("grey9","s","Color triple",'0.090196 0.090196 0.090196'),ParValue("grey90","s","Color triple",'0.898039 0.898039 0.898039'),ParValue("grey91","s","Color triple",'0.909804 0.909804 0.909804'),ParValue("grey92","s","Color triple",'0.921569 0.921569 0.921569'),ParValue("grey93","s","Color triple",'0.929412 0.929412 0.929412'),ParValue("grey94","s","Color triple",'0.941176 0.941176 0.941176'),ParValue("grey95","s","Color triple",'0.949020 0.949020 0.949020'),ParValue("grey96","s","Color triple",'0.960784 0.960784 0.960784'),ParValue("grey97","s","Color triple",'0.968627 0.968627 0.968627'),ParValue("grey98","s","Color triple",'0.980392 0.980392 0.980392'),ParValue("grey99","s","Color triple",'0.988235 0.988235 0.988235'),ParValue("honeydew","s","Color triple",'0.941176 1 0.941176'),ParValue("honeydew1","s","Color triple",'0.941176 1 0.941176'),ParValue("honeydew2","s","Color triple",'0.878431 0.933333 0.878431'),ParValue("honeydew3","s","Color triple",'0.756863 0.803922 0.756863'),ParValue("honeydew4","s","Color triple",'0.513725 0.545098 0.513725'),ParValue("hotpink","s","Color triple",'1 0.411765 0.705882'),ParValue("hotpink1","s","Color triple",'1 0.431373 0.705882'),ParValue("hotpink2","s","Color triple",'0.933333 0.415686 0.654902'),ParValue("hotpink3","s","Color triple",'0.803922 0.376471 0.564706'),ParValue("hotpink4","s","Color triple",'0.545098 0.227451 0.384314'),ParValue("indianred","s","Color triple",'0.803922 0.360784 0.360784'),ParValue("indianred1","s","Color triple",'1 0.415686 0.415686'),ParValue("indianred2","s","Color triple",'0.933333 0.388235 0.388235'),ParValue("indianred3","s","Color triple",'0.803922 0.333333 0.333333'),ParValue("indianred4","s","Color triple",'0.545098 0.227451 0.227451'),ParValue("ivory","s","Color triple",'1 1 0.941176'),ParValue("ivory1","s","Color triple",'1 1 0.941176'),ParValue("ivory2","s","Color triple",'0.933333 0.933333 0.878431'),ParValue("ivory3","s","Color triple",'0.803922 0.803922 0.756863'),ParValue("ivory4","s","Color triple",'0.545098 0.545098 0.513725'),ParValue("khaki","s","Color triple",'0.941176 0.901961 0.549020'),ParValue("khaki1","s","Color triple",'1 0.964706 0.560784'),ParValue("khaki2","s","Color triple",'0.933333 0.901961 0.521569'),ParValue("khaki3","s","Color triple",'0.803922 0.776471 0.450980'),ParValue("khaki4","s","Color triple",'0.545098 0.525490 0.305882'),ParValue("lavender","s","Color triple",'0.901961 0.901961 0.980392'),ParValue("lavenderblush","s","Color triple",'1 0.941176 0.960784'),ParValue("lavenderblush1","s","Color triple",'1 0.941176 0.960784'),ParValue("lavenderblush2","s","Color triple",'0.933333 0.878431 0.898039'),ParValue("lavenderblush3","s","Color triple",'0.803922 0.756863 0.772549'),ParValue("lavenderblush4","s","Color triple",'0.545098 0.513725 0.525490'),ParValue("lawngreen","s","Color triple",'0.486275 0.988235 0'),ParValue("lemonchiffon","s","Color triple",'1 0.980392 0.803922'),ParValue("lemonchiffon1","s","Color triple",'1 0.980392 0.803922'),ParValue("lemonchiffon2","s","Color triple",'0.933333 0.913725 0.749020'),ParValue("lemonchiffon3","s","Color triple",'0.803922 0.788235 0.647059'),ParValue("lemonchiffon4","s","Color triple",'0.545098 0.537255 0.439216'),ParValue("lightblue","s","Color triple",'0.678431 0.847059 0.901961'),ParValue("lightblue1","s","Color triple",'0.749020 0.937255 1'),ParValue("lightblue2","s","Color triple",'0.698039 0.874510 0.933333'),ParValue("lightblue3","s","Color triple",'0.603922 0.752941 0.803922'),ParValue("lightblue4","s","Color triple",'0.407843 0.513725 0.545098'),ParValue("lightcoral","s","Color triple",'0.941176 0.501961 0.501961'),ParValue("lightcyan","s","Color triple",'0.878431 1 1'),ParValue("lightcyan1","s","Color triple",'0.878431 1 1'),ParValue("lightcyan2","s","Color triple",'0.819608 0.933333 0.933333'),ParValue("lightcyan3","s","Color triple",'0.705882 0.803922 0.803922'),ParValue("lightcyan4","s","Color triple",'0.478431 0.545098 0.545098'),ParValue("lightgoldenrod","s","Color triple",'0.933333 0.866667 0.509804'),ParValue("lightgoldenrod1","s","Color triple",'1 0.925490 0.545098'),ParValue("lightgoldenrod2","s","Color triple",'0.933333 0.862745 0.509804'),ParValue("lightgoldenrod3","s","Color triple",'0.803922 0.745098 0.439216'),ParValue("lightgoldenrod4","s","Color triple",'0.545098 0.505882 0.298039'),ParValue("lightgoldenrodyellow","s","Color triple",'0.980392 0.980392 0.823529'),ParValue("lightgray","s","Color triple",'0.827451 0.827451 0.827451'),ParValue("lightgrey","s","Color triple",'0.827451 0.827451 0.827451'),ParValue("lightpink","s","Color triple",'1 0.713725 0.756863'),ParValue("lightpink1","s","Color triple",'1 0.682353 0.725490'),ParValue("lightpink2","s","Color triple",'0.933333 0.635294 0.678431'),ParValue("lightpink3","s","Color triple",'0.803922 0.549020 0.584314'),ParValue("lightpink4","s","Color triple",'0.545098 0.372549 0.396078'),ParValue("lightsalmon","s","Color triple",'1 0.627451 0.478431'),ParValue("lightsalmon1","s","Color triple",'1 0.627451 0.478431'),ParValue("lightsalmon2","s","Color triple",'0.933333 0.584314 0.447059'),ParValue("lightsalmon3","s","Color triple",'0.803922 0.505882 0.384314'),ParValue("lightsalmon4","s","Color triple",'0.545098 0.341176 0.258824'),ParValue("lightseagreen","s","Color triple",'0.125490 0.698039 0.666667'),ParValue("lightskyblue","s","Color triple",'0.529412 0.807843 0.980392'),ParValue("lightskyblue1","s","Color triple",'0.690196 0.886275 1'),ParValue("lightskyblue2","s","Color triple",'0.643137 0.827451 0.933333'),ParValue("lightskyblue3","s","Color triple",'0.552941 0.713725 0.803922'),ParValue("lightskyblue4","s","Color triple",'0.376471 0.482353 0.545098'),ParValue("lightslateblue","s","Color triple",'0.517647 0.439216 1'),ParValue("lightslategray","s","Color triple",'0.466667 0.533333 0.600000'),ParValue("lightslategrey","s","Color triple",'0.466667 0.533333 0.600000'),ParValue("lightsteelblue","s","Color triple",'0.690196 0.768627 0.870588'),ParValue("lightsteelblue1","s","Color triple",'0.792157 0.882353 1'),ParValue("lightsteelblue2","s","Color triple",'0.737255 0.823529 0.933333'),ParValue("lightsteelblue3","s","Color triple",'0.635294 0.709804 0.803922'),ParValue("lightsteelblue4","s","Color triple",'0.431373 0.482353 0.545098'),ParValue("lightyellow","s","Color triple",'1 1 0.878431'),ParValue("lightyellow1","s","Color triple",'1 1 0.878431'),ParValue("lightyellow2","s","Color triple",'0.933333 0.933333 0.819608'),ParValue("lightyellow3","s","Color triple",'0.803922 0.803922 0.705882'),ParValue("lightyellow4","s","Color triple",'0.545098 0.545098 0.478431'),ParValue("limegreen","s","Color triple",'0.196078 0.803922 0.196078'),ParValue("linen","s","Color triple",'0.980392 0.941176 0.901961'),ParValue("magenta","s","Color triple",'1 0 1'),ParValue("magenta1","s","Color triple",'1 0 1'),ParValue("magenta2","s","Color triple",'0.933333 0 0.933333'),ParValue("magenta3","s","Color triple",'0.803922 0 0.803922'),ParValue("magenta4","s","Color triple",'0.545098 0 0.545098'),ParValue("maroon","s","Color triple",'0.690196 0.188235 0.376471'),ParValue("maroon1","s","Color triple",'1 0.203922 0.701961'),ParValue("maroon2","s","Color triple",'0.933333 0.188235 0.654902'),ParValue("maroon3","s","Color triple",'0.803922 0.160784 0.564706'),ParValue("maroon4","s","Color triple",'0.545098 0.109804 0.384314'),ParValue("mediumaquamarine","s","Color triple",'0.400000 0.803922 0.666667'),ParValue("mediumblue","s","Color triple",'0 0 0.803922'),ParValue("mediumforestgreen","s","Color triple",'0.419608 0.556863 0.137255'),ParValue("mediumgoldenrod","s","Color triple",'0.721569 0.486275 0.043137'),ParValue("mediumorchid","s","Color triple",'0.729412 0.333333 0.827451'),ParValue("mediumorchid1","s","Color triple",'0.878431 0.400000 1'),ParValue("mediumorchid2","s","Color triple",'0.819608 0.372549 0.933333'),ParValue("mediumorchid3","s","Color triple",'0.705882 0.321569 0.803922'),ParValue("mediumorchid4","s","Color triple",'0.478431 0.215686 0.545098'),ParValue("mediumpurple","s","Color triple",'0.576471 0.439216 0.858824'),ParValue("mediumpurple1","s","Color triple",'0.670588 0.509804 1'),ParValue("mediumpurple2","s","Color triple",'0.623529 0.474510 0.933333'),ParValue("mediumpurple3","s","Color triple",'0.537255 0.407843 0.803922'),ParValue("mediumpurple4","s","Color triple",'0.364706 0.278431 0.545098'),ParValue("mediumseagreen","s","Color triple",'0.235294 0.701961 0.443137'),ParValue("mediumslateblue","s","Color triple",'0.482353 0.407843 0.933333'),ParValue("mediumspringgreen","s","Color triple",'0 0.980392 0.603922'),ParValue("mediumturquoise","s","Color triple",'0.282353 0.819608 0.800000'),ParValue("mediumvioletred","s","Color triple",'0.780392 0.082353 0.521569'),ParValue("midnightblue","s","Color triple",'0.098039 0.098039 0.439216'),ParValue("mintcream","s","Color triple",'0.960784 1 0.980392'),ParValue("mistyrose","s","Color triple",'1 0.894118 0.882353'),ParValue("mistyrose1","s","Color triple",'1 0.894118 0.882353'),ParValue("mistyrose2","s","Color triple",'0.933333 0.835294 0.823529'),ParValue("mistyrose3","s","Color triple",'0.803922 0.717647 0.709804'),ParValue("mistyrose4","s","Color triple",'0.545098 0.490196 0.482353'),ParValue("moccasin","s","Color triple",'1 0.894118 0.709804'),ParValue("navajowhite","s","Color triple",'1 0.870588 0.678431'),ParValue("navajowhite1","s","Color triple",'1 0.870588 0.678431'),ParValue("navajowhite2","s","Color triple",'0.933333 0.811765 0.631373'),ParValue("navajowhite3","s","Color triple",'0.803922 0.701961 0.545098'),ParValue("navajowhite4","s","Color triple",'0.545098 0.474510 0.368627'),ParValue("navy","s","Color triple",'0 0 0.501961'),ParValue("navyblue","s","Color triple",'0 0 0.501961'),ParValue("oldlace","s","Color triple",'0.992157 0.960784 0.901961'),ParValue("olivedrab","s","Color triple",'0.419608 0.556863 0.137255'),ParValue("olivedrab1","s","Color triple",'0.752941 1 0.243137'),ParValue("olivedrab2","s","Color triple",'0.701961 0.933333 0.227451'),ParValue("olivedrab3","s","Color triple",'0.603922 0.803922 0.196078'),ParValue("olivedrab4","s","Color triple",'0.411765 0.545098 0.133333'),ParValue("orange","s","Color triple",'1 0.647059 0'),ParValue("orange1","s","Color triple",'1 0.647059 0'),ParValue("orange2","s","Color triple",'0.933333 0.603922 0'),ParValue("orange3","s","Color triple",'0.803922 0.521569 0'),ParValue("orange4","s","Color triple",'0.545098 0.352941 0'),ParValue("orangered","s","Color triple",'1 0.270588 0'),ParValue("orangered1","s","Color triple",'1 0.270588 0'),ParValue("orangered2","s","Color triple",'0.933333 0.250980 0'),ParValue("orangered3","s","Color triple",'0.803922 0.215686 0'),ParValue("orangered4","s","Color triple",'0.545098 0.145098 0'),ParValue("orchid","s","Color triple",'0.854902 0.439216 0.839216'),ParValue("orchid1","s","Color triple",'1 0.513725 0.980392'),ParValue("orchid2","s","Color triple",'0.933333 0.478431 0.913725'),ParValue("orchid3","s","Color triple",'0.803922 0.411765 0.788235'),ParValue("orchid4","s","Color triple",'0.545098 0.278431 0.537255'),ParValue("palegoldenrod","s","Color triple",'0.933333 0.909804 0.666667'),ParValue("palegreen","s","Color triple",'0.596078 0.984314 0.596078'),ParValue("palegreen1","s","Color triple",'0.603922 1 0.603922'),ParValue("palegreen2","s","Color triple",'0.564706 0.933333 0.564706'),ParValue("palegreen3","s","Color triple",'0.486275 0.803922 0.486275'),ParValue("palegreen4","s","Color triple",'0.329412 0.545098 0.329412'),ParValue("paleturquoise","s","Color triple",'0.686275 0.933333 0.933333'),ParValue("paleturquoise1","s","Color triple",'0.733333 1 1'),ParValue("paleturquoise2","s","Color triple",'0.682353 0.933333 0.933333'),ParValue("paleturquoise3","s","Color triple",'0.588235 0.803922 0.803922'),ParValue("paleturquoise4","s","Color triple",'0.400000 0.545098 0.545098'),ParValue("palevioletred","s","Color triple",'0.858824 0.439216 0.576471'),ParValue("palevioletred1","s","Color triple",'1 0.509804 0.670588'),ParValue("palevioletred2","s","Color triple",'0.933333 0.474510 0.623529'),ParValue("palevioletred3","s","Color triple",'0.803922 0.407843 0.537255'),ParValue("palevioletred4","s","Color triple",'0.545098 0.278431 0.364706'),ParValue("papayawhip","s","Color triple",'1 0.937255 0.835294'),ParValue("peachpuff","s","Color triple",'1 0.854902 0.725490'),ParValue("peachpuff1","s","Color triple",'1 0.854902 0.725490'),ParValue("peachpuff2","s","Color triple",'0.933333 0.796078 0.678431'),ParValue("peachpuff3","s","Color triple",'0.803922 0.686275 0.584314'),ParValue("peachpuff4","s","Color triple",'0.545098 0.466667 0.396078'),ParValue("peru","s","Color triple",'0.803922 0.521569 0.247059'),ParValue("pink","s","Color triple",'1 0.752941 0.796078'),ParValue("pink1","s","Color triple",'1 0.709804 0.772549'),ParValue("pink2","s","Color triple",'0.933333 0.662745 0.721569'),ParValue("pink3","s","Color triple",'0.803922 0.568627 0.619608'),ParValue("pink4","s","Color triple",'0.545098 0.388235 0.423529'),ParValue("plum","s","Color triple",'0.866667 0.627451 0.866667'),ParValue("plum1","s","Color triple",'1 0.733333 1'),ParValue("plum2","s","Color triple",'0.933333 0.682353 0.933333'),ParValue("plum3","s","Color triple",'0.803922 0.588235 0.803922'),ParValue("plum4","s","Color triple",'0.545098 0.400000 0.545098'),ParValue("powderblue","s","Color triple",'0.690196 0.878431 0.901961'),ParValue("purple","s","Color triple",'0.627451 0.125490 0.941176'),ParValue("purple1","s","Color triple",'0.607843 0.188235 1'),ParValue("purple2","s","Color triple",'0.568627 0.172549 0.933333'),ParValue("purple3","s","Color triple",'0.490196 0.149020 0.803922'),ParValue("purple4","s","Color triple",'0.333333 0.101961 0.545098'),ParValue("red","s","Color triple",'1 0 0'),ParValue("red1","s","Color triple",'1 0 0'),ParValue("red2","s","Color triple",'0.933333 0 0'),ParValue("red3","s","Color triple",'0.803922 0 0'),ParValue("red4","s","Color triple",'0.545098 0 0'),ParValue("rosybrown","s","Color triple",'0.737255 0.560784 0.560784'),ParValue("rosybrown1","s","Color triple",'1 0.756863 0.756863'),ParValue("rosybrown2","s","Color triple",'0.933333 0.705882 0.705882'),ParValue("rosybrown3","s","Color triple",'0.803922 0.607843 0.607843'),ParValue("rosybrown4","s","Color triple",'0.545098 0.411765 0.411765'),ParValue("royalblue","s","Color triple",'0.254902 0.411765 0.882353'),ParValue("royalblue1","s","Color triple",'0.282353 0.462745 1'),ParValue("royalblue2","s","Color triple",'0.262745 0.431373 0.933333'),ParValue("royalblue3","s","Color triple",'0.227451 0.372549 0.803922'),ParValue("royalblue4","s","Color triple",'0.152941 0.250980 0.545098'),ParValue("saddlebrown","s","Color triple",'0.545098 0.270588 0.074510'),ParValue("salmon","s","Color triple",'0.980392 0.501961 0.447059'),ParValue("salmon1","s","Color triple",'1 0.549020 0.411765'),ParValue("salmon2","s","Color triple",'0.933333 0.509804 0.384314'),ParValue("salmon3","s","Color triple",'0.803922 0.439216 0.329412'),ParValue("salmon4","s","Color triple",'0.545098 0.298039 0.223529'),ParValue("sandybrown","s","Color triple",'0.956863 0.643137 0.376471'),ParValue("seagreen","s","Color triple",'0.180392 0.545098 0.341176'),ParValue("seagreen1","s","Color triple",'0.329412 1 0.623529'),ParValue("seagreen2","s","Color triple",'0.305882 0.933333 0.580392'),ParValue("seagreen3","s","Color triple",'0.262745 0.803922 0.501961'),ParValue("seagreen4","s","Color triple",'0.180392 0.545098 0.341176'),ParValue("seashell","s","Color triple",'1 0.960784 0.933333'),ParValue("seashell1","s","Color triple",'1 0.960784 0.933333'),ParValue("seashell2","s","Color triple",'0.933333 0.898039 0.870588'),ParValue("seashell3","s","Color triple",'0.803922 0.772549 0.749020'),ParValue("seashell4","s","Color triple",'0.545098 0.525490 0.509804'),ParValue("sienna","s","Color triple",'0.627451 0.321569 0.176471'),ParValue("sienna1","s","Color triple",'1 0.509804 0.278431'),ParValue("sienna2","s","Color triple",'0.933333 0.474510 0.258824'),ParValue("sienna3","s","Color triple",'0.803922 0.407843 0.223529'),ParValue("sienna4","s","Color triple",'0.545098 0.278431 0.149020'),ParValue("skyblue","s","Color triple",'0.529412 0.807843 0.921569'),ParValue("skyblue1","s","Color triple",'0.529412 0.807843 1'),ParValue("skyblue2","s","Color triple",'0.494118 0.752941 0.933333'),ParValue("skyblue3","s","Color triple",'0.423529 0.650980 0.803922'),ParValue("skyblue4","s","Color triple",'0.290196 0.439216 0.545098'),ParValue("slateblue","s","Color triple",'0.415686 0.352941 0.803922'),ParValue("slateblue1","s","Color triple",'0.513725 0.435294 1'),ParValue("slateblue2","s","Color triple",'0.478431 0.403922 0.933333'),ParValue("slateblue3","s","Color triple",'0.411765 0.349020 0.803922'),ParValue("slateblue4","s","Color triple",'0.278431 0.235294 0.545098'),ParValue("slategray","s","Color triple",'0.439216 0.501961 0.564706'),ParValue("slategray1","s","Color triple",'0.776471 0.886275 1'),ParValue("slategray2","s","Color triple",'0.725490 0.827451 0.933333'),ParValue("slategray3","s","Color triple",'0.623529 0.713725 0.803922'),ParValue("slategray4","s","Color triple",'0.423529 0.482353 0.545098'),ParValue("slategrey","s","Color triple",'0.439216 0.501961 0.564706'),ParValue("snow","s","Color triple",'1 0.980392 0.980392'),ParValue("snow1","s","Color triple",'1 0.980392 0.980392'),ParValue("snow2","s","Color triple",'0.933333 0.913725 0.913725'),ParValue("snow3","s","Color triple",'0.803922 0.788235 0.788235'),ParValue("snow4","s","Color triple",'0.545098 0.537255 0.537255'),ParValue("springgreen","s","Color triple",'0 1 0.498039'),ParValue("springgreen1","s","Color triple",'0 1 0.498039'),ParValue("springgreen2","s","Color triple",'0 0.933333 0.462745'),ParValue("springgreen3","s","Color triple",'0 0.803922 0.400000'),ParValue("springgreen4","s","Color triple",'0 0.545098 0.270588'),ParValue("steelblue","s","Color triple",'0.274510 0.509804 0.705882'),ParValue("steelblue1","s","Color triple",'0.388235 0.721569 1'),ParValue("steelblue2","s","Color triple",'0.360784 0.674510 0.933333'),ParValue("steelblue3","s","Color triple",'0.309804 0.580392 0.803922'),ParValue("steelblue4","s","Color triple",'0.211765 0.392157 0.545098'),ParValue("tan","s","Color triple",'0.823529 0.705882 0.549020'),ParValue("tan1","s","Color triple",'1 0.647059 0.309804'),ParValue("tan2","s","Color triple",'0.933333 0.603922 0.286275'),ParValue("tan3","s","Color triple",'0.803922 0.521569 0.247059'),ParValue("tan4","s","Color triple",'0.545098 0.352941 0.168627'),ParValue("thistle","s","Color triple",'0.847059 0.749020 0.847059'),ParValue("thistle1","s","Color triple",'1 0.882353 1'),ParValue("thistle2","s","Color triple",'0.933333 0.823529 0.933333'),ParValue("thistle3","s","Color triple",'0.803922 0.709804 0.803922'),ParValue("thistle4","s","Color triple",'0.545098 0.482353 0.545098'),ParValue("tomato","s","Color triple",'1 0.388235 0.278431'),ParValue("tomato1","s","Color triple",'1 0.388235 0.278431'),ParValue("tomato2","s","Color triple",'0.933333 0.360784 0.258824'),ParValue("tomato3","s","Color triple",'0.803922 0.309804 0.223529'),ParValue("tomato4","s","Color triple",'0.545098 0.211765 0.149020'),ParValue("turquoise","s","Color triple",'0.250980 0.878431 0.815686'),ParValue("turquoise1","s","Color triple",'0 0.960784 1'),ParValue("turquoise2","s","Color triple",'0 0.898039 0.933333'),ParValue("turquoise3","s","Color triple",'0 0.772549 0.803922'),ParValue("turquoise4","s","Color triple",'0 0.525490 0.545098'),ParValue("violet","s","Color triple",'0.933333 0.509804 0.933333'),ParValue("violetred","s","Color triple",'0.815686 0.125490 0.564706'),ParValue("violetred1","s","Color triple",'1 0.243137 0.588235'),ParValue("violetred2","s","Color triple",'0.933333 0.227451 0.549020'),ParValue("violetred3","s","Color triple",'0.803922 0.196078 0.470588'),ParValue("violetred4","s","Color triple",'0.545098 0.133333 0.321569'),ParValue("wheat","s","Color triple",'0.960784 0.870588 0.701961'),ParValue("wheat1","s","Color triple",'1 0.905882 0.729412'),ParValue("wheat2","s","Color triple",'0.933333 0.847059 0.682353'),ParValue("wheat3","s","Color triple",'0.803922 0.729412 0.588235'),ParValue("wheat4","s","Color triple",'0.545098 0.494118 0.400000'),ParValue("white","s","Color triple",'1 1 1'),ParValue("whitesmoke","s","Color triple",'0.960784 0.960784 0.960784'),ParValue("yellow","s","Color triple",'1 1 0'),ParValue("yellow1","s","Color triple",'1 1 0'),ParValue("yellow2","s","Color triple",'0.933333 0.933333 0'),ParValue("yellow3","s","Color triple",'0.803922 0.803922 0'),ParValue("yellow4","s","Color triple",'0.545098 0.545098 0'),ParValue("yellowgreen","s","Color triple",'0.603922 0.803922 0.196078')],
-    }
 
+    parinfo['color_color'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input ARF file",None),ParValue("outfile","f","Output file name",None),ParValue("model","s","Sherpa model expression",\'xsphabs.abs1*xspowerlaw.pwrlaw\'),ParValue("param1","s","Model parameter for 1st axis",\'pwrlaw.PhoIndex\'),ParValue("grid1","s","Model parameter grid for 1st axis",\'1,2,3,4\'),ParValue("param2","s","Model parameter for 2nd axis",\'abs1.nH\'),ParValue("grid2","s","Model grid for 2nd axis",\'0.01,0.1,0.2,0.5,1,10\'),ParValue("soft","s","Soft energy band LO:HI or csc (0.5:1.2)",\'csc\'),ParValue("medium","s","Medium energy band LO:HI or csc (1.2:2.0)",\'csc\'),ParValue("hard","s","Hard energy band LO:HI or csc (2.0:7.0)",\'csc\')]',
+        'opt': '[ParValue("rmffile","f","Input RMF file (use diagnonal if blank or none)",None),ParRange("plot_oversample","i","Over sample grid when plotting",20,0,None),ParValue("outplot","f","Output file name for plot",\'clr.png\'),ParValue("showplot","b","Display plot? (close to continue)",True),ParRange("random_seed","i","Random seed (-1 = randomly select)",-1,-1,None),ParValue("clobber","b","Remove outfile and outplot files if they already exist?",True),ParRange("verbose","i","Tool chatter level",1,0,5)]',
+        }
 
-parinfo['combine_grating_spectra'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Source PHA1/PHA2 grating spectra to combine; enter list or '@stack'",None),ParValue("outroot","f","Root name for output file(s)",None)],
-    'opt': [ParValue("add_plusminus","b","Combine +/- orders (yes) after summing signed-order and part?",False),ParSet("garm","s","Grating arm (HEG, MEG, LEG, or 'all')",'all',["HEG","MEG","LEG","all"]),ParSet("order","s","Grating diffraction order (1,2,3,-1,-2,-3, or 'all')",'all',["1","2","3","-1","-2","-3","all"]),ParValue("arf","f","Source ARF files to combine; enter list or '@stack'",None),ParValue("rmf","f","Source RMF files to combine; enter list or '@stack'",None),ParValue("bkg_pha","f","Background PHA files to combine; enter list or '@stack'",None),ParSet("bscale_method","s","How are BACKSCAL and background counts computed?",'counts',["asca","time","counts"]),ParSet("exposure_mode","s","Sum or average exposure times?",'sum',["avg","sum"]),ParValue("object","s","Specify the OBJECT keyword in the combined output",None),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['colors'] = {
+        'istool': False,
+        'req': '[]',
+        'opt': '[ParValue("aliceblue","s","Color triple",\'0.941176 0.972549 1\'),ParValue("antiquewhite","s","Color triple",\'0.980392 0.921569 0.843137\'),ParValue("antiquewhite1","s","Color triple",\'1 0.937255 0.858824\'),ParValue("antiquewhite2","s","Color triple",\'0.933333 0.874510 0.800000\'),ParValue("antiquewhite3","s","Color triple",\'0.803922 0.752941 0.690196\'),ParValue("antiquewhite4","s","Color triple",\'0.545098 0.513725 0.470588\'),ParValue("aquamarine","s","Color triple",\'0.498039 1 0.831373\'),ParValue("aquamarine1","s","Color triple",\'0.498039 1 0.831373\'),ParValue("aquamarine2","s","Color triple",\'0.462745 0.933333 0.776471\'),ParValue("aquamarine3","s","Color triple",\'0.400000 0.803922 0.666667\'),ParValue("aquamarine4","s","Color triple",\'0.270588 0.545098 0.454902\'),ParValue("azure","s","Color triple",\'0.941176 1 1\'),ParValue("azure1","s","Color triple",\'0.941176 1 1\'),ParValue("azure2","s","Color triple",\'0.878431 0.933333 0.933333\'),ParValue("azure3","s","Color triple",\'0.756863 0.803922 0.803922\'),ParValue("azure4","s","Color triple",\'0.513725 0.545098 0.545098\'),ParValue("beige","s","Color triple",\'0.960784 0.960784 0.862745\'),ParValue("bisque","s","Color triple",\'1 0.894118 0.768627\'),ParValue("bisque1","s","Color triple",\'1 0.894118 0.768627\'),ParValue("bisque2","s","Color triple",\'0.933333 0.835294 0.717647\'),ParValue("bisque3","s","Color triple",\'0.803922 0.717647 0.619608\'),ParValue("bisque4","s","Color triple",\'0.545098 0.490196 0.419608\'),ParValue("black","s","Color triple",\'0 0 0\'),ParValue("blanchedalmond","s","Color triple",\'1 0.921569 0.803922\'),ParValue("blue","s","Color triple",\'0 0 1\'),ParValue("blue1","s","Color triple",\'0 0 1\'),ParValue("blue2","s","Color triple",\'0 0 0.933333\'),ParValue("blue3","s","Color triple",\'0 0 0.803922\'),ParValue("blue4","s","Color triple",\'0 0 0.545098\'),ParValue("blueviolet","s","Color triple",\'0.541176 0.168627 0.886275\'),ParValue("brightaquamarine","s","Color triple",\'0.207843 0.870588 0.768627\'),ParValue("brightcyan","s","Color triple",\'0 1 1\'),ParValue("brightyellow","s","Color triple",\'1 1 0\'),ParValue("brown","s","Color triple",\'0.647059 0.164706 0.164706\'),ParValue("brown1","s","Color triple",\'1 0.250980 0.250980\'),ParValue("brown2","s","Color triple",\'0.933333 0.231373 0.231373\'),ParValue("brown3","s","Color triple",\'0.803922 0.200000 0.200000\'),ParValue("brown4","s","Color triple",\'0.545098 0.137255 0.137255\'),ParValue("burlywood","s","Color triple",\'0.870588 0.721569 0.529412\'),ParValue("burlywood1","s","Color triple",\'1 0.827451 0.607843\'),ParValue("burlywood2","s","Color triple",\'0.933333 0.772549 0.568627\'),ParValue("burlywood3","s","Color triple",\'0.803922 0.666667 0.490196\'),ParValue("burlywood4","s","Color triple",\'0.545098 0.450980 0.333333\'),ParValue("cadetblue","s","Color triple",\'0.372549 0.619608 0.627451\'),ParValue("cadetblue1","s","Color triple",\'0.596078 0.960784 1\'),ParValue("cadetblue2","s","Color triple",\'0.556863 0.898039 0.933333\'),ParValue("cadetblue3","s","Color triple",\'0.478431 0.772549 0.803922\'),ParValue("cadetblue4","s","Color triple",\'0.325490 0.525490 0.545098\'),ParValue("chartreuse","s","Color triple",\'0.498039 1 0\'),ParValue("chartreuse1","s","Color triple",\'0.498039 1 0\'),ParValue("chartreuse2","s","Color triple",\'0.462745 0.933333 0\'),ParValue("chartreuse3","s","Color triple",\'0.400000 0.803922 0\'),ParValue("chartreuse4","s","Color triple",\'0.270588 0.545098 0\'),ParValue("chocolate","s","Color triple",\'0.823529 0.411765 0.117647\'),ParValue("chocolate1","s","Color triple",\'1 0.498039 0.141176\'),ParValue("chocolate2","s","Color triple",\'0.933333 0.462745 0.129412\'),ParValue("chocolate3","s","Color triple",\'0.803922 0.400000 0.113725\'),ParValue("chocolate4","s","Color triple",\'0.545098 0.270588 0.074510\'),ParValue("coral","s","Color triple",\'1 0.498039 0.313725\'),ParValue("coral1","s","Color triple",\'1 0.447059 0.337255\'),ParValue("coral2","s","Color triple",\'0.933333 0.415686 0.313725\'),ParValue("coral3","s","Color triple",\'0.803922 0.356863 0.270588\'),ParValue("coral4","s","Color triple",\'0.545098 0.243137 0.184314\'),ParValue("cornflowerblue","s","Color triple",\'0.392157 0.584314 0.929412\'),ParValue("cornsilk","s","Color triple",\'1 0.972549 0.862745\'),ParValue("cornsilk1","s","Color triple",\'1 0.972549 0.862745\'),ParValue("cornsilk2","s","Color triple",\'0.933333 0.909804 0.803922\'),ParValue("cornsilk3","s","Color triple",\'0.803922 0.784314 0.694118\'),ParValue("cornsilk4","s","Color triple",\'0.545098 0.533333 0.470588\'),ParValue("cyan","s","Color triple",\'0 1 1\'),ParValue("cyan1","s","Color triple",\'0 1 1\'),ParValue("cyan2","s","Color triple",\'0 0.933333 0.933333\'),ParValue("cyan3","s","Color triple",\'0 0.803922 0.803922\'),ParValue("cyan4","s","Color triple",\'0 0.545098 0.545098\'),ParValue("darkgoldenrod","s","Color triple",\'0.721569 0.525490 0.043137\'),ParValue("darkgoldenrod1","s","Color triple",\'1 0.725490 0.058824\'),ParValue("darkgoldenrod2","s","Color triple",\'0.933333 0.678431 0.054902\'),ParValue("darkgoldenrod3","s","Color triple",\'0.803922 0.584314 0.047059\'),ParValue("darkgoldenrod4","s","Color triple",\'0.545098 0.396078 0.031373\'),ParValue("darkgreen","s","Color triple",\'0 0.392157 0\'),ParValue("darkkhaki","s","Color triple",\'0.741176 0.717647 0.419608\'),ParValue("darkolivegreen","s","Color triple",\'0.333333 0.419608 0.184314\'),ParValue("darkolivegreen1","s","Color triple",\'0.792157 1 0.439216\'),ParValue("darkolivegreen2","s","Color triple",\'0.737255 0.933333 0.407843\'),ParValue("darkolivegreen3","s","Color triple",\'0.635294 0.803922 0.352941\'),ParValue("darkolivegreen4","s","Color triple",\'0.431373 0.545098 0.239216\'),ParValue("darkorange","s","Color triple",\'1 0.549020 0\'),ParValue("darkorange1","s","Color triple",\'1 0.498039 0\'),ParValue("darkorange2","s","Color triple",\'0.933333 0.462745 0\'),ParValue("darkorange3","s","Color triple",\'0.803922 0.400000 0\'),ParValue("darkorange4","s","Color triple",\'0.545098 0.270588 0\'),ParValue("darkorchid","s","Color triple",\'0.600000 0.196078 0.800000\'),ParValue("darkorchid1","s","Color triple",\'0.749020 0.243137 1\'),ParValue("darkorchid2","s","Color triple",\'0.698039 0.227451 0.933333\'),ParValue("darkorchid3","s","Color triple",\'0.603922 0.196078 0.803922\'),ParValue("darkorchid4","s","Color triple",\'0.407843 0.133333 0.545098\'),ParValue("darksalmon","s","Color triple",\'0.913725 0.588235 0.478431\'),ParValue("darkseagreen","s","Color triple",\'0.560784 0.737255 0.560784\'),ParValue("darkseagreen1","s","Color triple",\'0.756863 1 0.756863\'),ParValue("darkseagreen2","s","Color triple",\'0.705882 0.933333 0.705882\'),ParValue("darkseagreen3","s","Color triple",\'0.607843 0.803922 0.607843\'),ParValue("darkseagreen4","s","Color triple",\'0.411765 0.545098 0.411765\'),ParValue("darkslateblue","s","Color triple",\'0.282353 0.239216 0.545098\'),ParValue("darkslategray","s","Color triple",\'0.184314 0.309804 0.309804\'),ParValue("darkslategray1","s","Color triple",\'0.592157 1 1\'),ParValue("darkslategray2","s","Color triple",\'0.552941 0.933333 0.933333\'),ParValue("darkslategray3","s","Color triple",\'0.474510 0.803922 0.803922\'),ParValue("darkslategray4","s","Color triple",\'0.321569 0.545098 0.545098\'),ParValue("darkslategrey","s","Color triple",\'0.184314 0.309804 0.309804\'),ParValue("darkturquoise","s","Color triple",\'0 0.807843 0.819608\'),ParValue("darkviolet","s","Color triple",\'0.580392 0 0.827451\'),ParValue("deeppink","s","Color triple",\'1 0.078431 0.576471\'),ParValue("deeppink1","s","Color triple",\'1 0.078431 0.576471\'),ParValue("deeppink2","s","Color triple",\'0.933333 0.070588 0.537255\'),ParValue("deeppink3","s","Color triple",\'0.803922 0.062745 0.462745\'),ParValue("deeppink4","s","Color triple",\'0.545098 0.039216 0.313725\'),ParValue("deepskyblue","s","Color triple",\'0 0.749020 1\'),ParValue("deepskyblue1","s","Color triple",\'0 0.749020 1\'),ParValue("deepskyblue2","s","Color triple",\'0 0.698039 0.933333\'),ParValue("deepskyblue3","s","Color triple",\'0 0.603922 0.803922\'),ParValue("deepskyblue4","s","Color triple",\'0 0.407843 0.545098\'),ParValue("dimgray","s","Color triple",\'0.411765 0.411765 0.411765\'),ParValue("dimgrey","s","Color triple",\'0.411765 0.411765 0.411765\'),ParValue("dodgerblue","s","Color triple",\'0.117647 0.564706 1\'),ParValue("dodgerblue1","s","Color triple",\'0.117647 0.564706 1\'),ParValue("dodgerblue2","s","Color triple",\'0.109804 0.525490 0.933333\'),ParValue("dodgerblue3","s","Color triple",\'0.094118 0.454902 0.803922\'),ParValue("dodgerblue4","s","Color triple",\'0.062745 0.305882 0.545098\'),ParValue("firebrick","s","Color triple",\'0.698039 0.133333 0.133333\'),ParValue("firebrick1","s","Color triple",\'1 0.188235 0.188235\'),ParValue("firebrick2","s","Color triple",\'0.933333 0.172549 0.172549\'),ParValue("firebrick3","s","Color triple",\'0.803922 0.149020 0.149020\'),ParValue("firebrick4","s","Color triple",\'0.545098 0.101961 0.101961\'),ParValue("floralwhite","s","Color triple",\'1 0.980392 0.941176\'),ParValue("forestgreen","s","Color triple",\'0.133333 0.545098 0.133333\'),ParValue("gainsboro","s","Color triple",\'0.862745 0.862745 0.862745\'),ParValue("ghostwhite","s","Color triple",\'0.972549 0.972549 1\'),ParValue("gold","s","Color triple",\'1 0.843137 0\'),ParValue("gold1","s","Color triple",\'1 0.843137 0\'),ParValue("gold2","s","Color triple",\'0.933333 0.788235 0\'),ParValue("gold3","s","Color triple",\'0.803922 0.678431 0\'),ParValue("gold4","s","Color triple",\'0.545098 0.458824 0\'),ParValue("goldenrod","s","Color triple",\'0.854902 0.647059 0.125490\'),ParValue("goldenrod1","s","Color triple",\'1 0.756863 0.145098\'),ParValue("goldenrod2","s","Color triple",\'0.933333 0.705882 0.133333\'),ParValue("goldenrod3","s","Color triple",\'0.803922 0.607843 0.113725\'),ParValue("goldenrod4","s","Color triple",\'0.545098 0.411765 0.078431\'),ParValue("gray","s","Color triple",\'0.745098 0.745098 0.745098\'),ParValue("gray0","s","Color triple",\'0 0 0\'),ParValue("gray1","s","Color triple",\'0.011765 0.011765 0.011765\'),ParValue("gray10","s","Color triple",\'0.101961 0.101961 0.101961\'),ParValue("gray100","s","Color triple",\'1 1 1\'),ParValue("gray11","s","Color triple",\'0.109804 0.109804 0.109804\'),ParValue("gray12","s","Color triple",\'0.121569 0.121569 0.121569\'),ParValue("gray13","s","Color triple",\'0.129412 0.129412 0.129412\'),ParValue("gray14","s","Color triple",\'0.141176 0.141176 0.141176\'),ParValue("gray15","s","Color triple",\'0.149020 0.149020 0.149020\'),ParValue("gray16","s","Color triple",\'0.160784 0.160784 0.160784\'),ParValue("gray17","s","Color triple",\'0.168627 0.168627 0.168627\'),ParValue("gray18","s","Color triple",\'0.180392 0.180392 0.180392\'),ParValue("gray19","s","Color triple",\'0.188235 0.188235 0.188235\'),ParValue("gray2","s","Color triple",\'0.019608 0.019608 0.019608\'),ParValue("gray20","s","Color triple",\'0.200000 0.200000 0.200000\'),ParValue("gray21","s","Color triple",\'0.211765 0.211765 0.211765\'),ParValue("gray22","s","Color triple",\'0.219608 0.219608 0.219608\'),ParValue("gray23","s","Color triple",\'0.231373 0.231373 0.231373\'),ParValue("gray24","s","Color triple",\'0.239216 0.239216 0.239216\'),ParValue("gray25","s","Color triple",\'0.250980 0.250980 0.250980\'),ParValue("gray26","s","Color triple",\'0.258824 0.258824 0.258824\'),ParValue("gray27","s","Color triple",\'0.270588 0.270588 0.270588\'),ParValue("gray28","s","Color triple",\'0.278431 0.278431 0.278431\'),ParValue("gray29","s","Color triple",\'0.290196 0.290196 0.290196\'),ParValue("gray3","s","Color triple",\'0.031373 0.031373 0.031373\'),ParValue("gray30","s","Color triple",\'0.301961 0.301961 0.301961\'),ParValue("gray31","s","Color triple",\'0.309804 0.309804 0.309804\'),ParValue("gray32","s","Color triple",\'0.321569 0.321569 0.321569\'),ParValue("gray33","s","Color triple",\'0.329412 0.329412 0.329412\'),ParValue("gray34","s","Color triple",\'0.341176 0.341176 0.341176\'),ParValue("gray35","s","Color triple",\'0.349020 0.349020 0.349020\'),ParValue("gray36","s","Color triple",\'0.360784 0.360784 0.360784\'),ParValue("gray37","s","Color triple",\'0.368627 0.368627 0.368627\'),ParValue("gray38","s","Color triple",\'0.380392 0.380392 0.380392\'),ParValue("gray39","s","Color triple",\'0.388235 0.388235 0.388235\'),ParValue("gray4","s","Color triple",\'0.039216 0.039216 0.039216\'),ParValue("gray40","s","Color triple",\'0.400000 0.400000 0.400000\'),ParValue("gray41","s","Color triple",\'0.411765 0.411765 0.411765\'),ParValue("gray42","s","Color triple",\'0.419608 0.419608 0.419608\'),ParValue("gray43","s","Color triple",\'0.431373 0.431373 0.431373\'),ParValue("gray44","s","Color triple",\'0.439216 0.439216 0.439216\'),ParValue("gray45","s","Color triple",\'0.450980 0.450980 0.450980\'),ParValue("gray46","s","Color triple",\'0.458824 0.458824 0.458824\'),ParValue("gray47","s","Color triple",\'0.470588 0.470588 0.470588\'),ParValue("gray48","s","Color triple",\'0.478431 0.478431 0.478431\'),ParValue("gray49","s","Color triple",\'0.490196 0.490196 0.490196\'),ParValue("gray5","s","Color triple",\'0.050980 0.050980 0.050980\'),ParValue("gray50","s","Color triple",\'0.498039 0.498039 0.498039\'),ParValue("gray51","s","Color triple",\'0.509804 0.509804 0.509804\'),ParValue("gray52","s","Color triple",\'0.521569 0.521569 0.521569\'),ParValue("gray53","s","Color triple",\'0.529412 0.529412 0.529412\'),ParValue("gray54","s","Color triple",\'0.541176 0.541176 0.541176\'),ParValue("gray55","s","Color triple",\'0.549020 0.549020 0.549020\'),ParValue("gray56","s","Color triple",\'0.560784 0.560784 0.560784\'),ParValue("gray57","s","Color triple",\'0.568627 0.568627 0.568627\'),ParValue("gray58","s","Color triple",\'0.580392 0.580392 0.580392\'),ParValue("gray59","s","Color triple",\'0.588235 0.588235 0.588235\'),ParValue("gray6","s","Color triple",\'0.058824 0.058824 0.058824\'),ParValue("gray60","s","Color triple",\'0.600000 0.600000 0.600000\'),ParValue("gray61","s","Color triple",\'0.611765 0.611765 0.611765\'),ParValue("gray62","s","Color triple",\'0.619608 0.619608 0.619608\'),ParValue("gray63","s","Color triple",\'0.631373 0.631373 0.631373\'),ParValue("gray64","s","Color triple",\'0.639216 0.639216 0.639216\'),ParValue("gray65","s","Color triple",\'0.650980 0.650980 0.650980\'),ParValue("gray66","s","Color triple",\'0.658824 0.658824 0.658824\'),ParValue("gray67","s","Color triple",\'0.670588 0.670588 0.670588\'),ParValue("gray68","s","Color triple",\'0.678431 0.678431 0.678431\'),ParValue("gray69","s","Color triple",\'0.690196 0.690196 0.690196\'),ParValue("gray7","s","Color triple",\'0.070588 0.070588 0.070588\'),ParValue("gray70","s","Color triple",\'0.701961 0.701961 0.701961\'),ParValue("gray71","s","Color triple",\'0.709804 0.709804 0.709804\'),ParValue("gray72","s","Color triple",\'0.721569 0.721569 0.721569\'),ParValue("gray73","s","Color triple",\'0.729412 0.729412 0.729412\'),ParValue("gray74","s","Color triple",\'0.741176 0.741176 0.741176\'),ParValue("gray75","s","Color triple",\'0.749020 0.749020 0.749020\'),ParValue("gray76","s","Color triple",\'0.760784 0.760784 0.760784\'),ParValue("gray77","s","Color triple",\'0.768627 0.768627 0.768627\'),ParValue("gray78","s","Color triple",\'0.780392 0.780392 0.780392\'),ParValue("gray79","s","Color triple",\'0.788235 0.788235 0.788235\'),ParValue("gray8","s","Color triple",\'0.078431 0.078431 0.078431\'),ParValue("gray80","s","Color triple",\'0.800000 0.800000 0.800000\'),ParValue("gray81","s","Color triple",\'0.811765 0.811765 0.811765\'),ParValue("gray82","s","Color triple",\'0.819608 0.819608 0.819608\'),ParValue("gray83","s","Color triple",\'0.831373 0.831373 0.831373\'),ParValue("gray84","s","Color triple",\'0.839216 0.839216 0.839216\'),ParValue("gray85","s","Color triple",\'0.850980 0.850980 0.850980\'),ParValue("gray86","s","Color triple",\'0.858824 0.858824 0.858824\'),ParValue("gray87","s","Color triple",\'0.870588 0.870588 0.870588\'),ParValue("gray88","s","Color triple",\'0.878431 0.878431 0.878431\'),ParValue("gray89","s","Color triple",\'0.890196 0.890196 0.890196\'),ParValue("gray9","s","Color triple",\'0.090196 0.090196 0.090196\'),ParValue("gray90","s","Color triple",\'0.898039 0.898039 0.898039\'),ParValue("gray91","s","Color triple",\'0.909804 0.909804 0.909804\'),ParValue("gray92","s","Color triple",\'0.921569 0.921569 0.921569\'),ParValue("gray93","s","Color triple",\'0.929412 0.929412 0.929412\'),ParValue("gray94","s","Color triple",\'0.941176 0.941176 0.941176\'),ParValue("gray95","s","Color triple",\'0.949020 0.949020 0.949020\'),ParValue("gray96","s","Color triple",\'0.960784 0.960784 0.960784\'),ParValue("gray97","s","Color triple",\'0.968627 0.968627 0.968627\'),ParValue("gray98","s","Color triple",\'0.980392 0.980392 0.980392\'),ParValue("gray99","s","Color triple",\'0.988235 0.988235 0.988235\'),ParValue("green","s","Color triple",\'0 1 0\'),ParValue("green1","s","Color triple",\'0 1 0\'),ParValue("green2","s","Color triple",\'0 0.933333 0\'),ParValue("green3","s","Color triple",\'0 0.803922 0\'),ParValue("green4","s","Color triple",\'0 0.545098 0\'),ParValue("greenyellow","s","Color triple",\'0.678431 1 0.184314\'),ParValue("grey","s","Color triple",\'0.745098 0.745098 0.745098\'),ParValue("grey0","s","Color triple",\'0 0 0\'),ParValue("grey1","s","Color triple",\'0.011765 0.011765 0.011765\'),ParValue("grey10","s","Color triple",\'0.101961 0.101961 0.101961\'),ParValue("grey100","s","Color triple",\'1 1 1\'),ParValue("grey11","s","Color triple",\'0.109804 0.109804 0.109804\'),ParValue("grey12","s","Color triple",\'0.121569 0.121569 0.121569\'),ParValue("grey13","s","Color triple",\'0.129412 0.129412 0.129412\'),ParValue("grey14","s","Color triple",\'0.141176 0.141176 0.141176\'),ParValue("grey15","s","Color triple",\'0.149020 0.149020 0.149020\'),ParValue("grey16","s","Color triple",\'0.160784 0.160784 0.160784\'),ParValue("grey17","s","Color triple",\'0.168627 0.168627 0.168627\'),ParValue("grey18","s","Color triple",\'0.180392 0.180392 0.180392\'),ParValue("grey19","s","Color triple",\'0.188235 0.188235 0.188235\'),ParValue("grey2","s","Color triple",\'0.019608 0.019608 0.019608\'),ParValue("grey20","s","Color triple",\'0.200000 0.200000 0.200000\'),ParValue("grey21","s","Color triple",\'0.211765 0.211765 0.211765\'),ParValue("grey22","s","Color triple",\'0.219608 0.219608 0.219608\'),ParValue("grey23","s","Color triple",\'0.231373 0.231373 0.231373\'),ParValue("grey24","s","Color triple",\'0.239216 0.239216 0.239216\'),ParValue("grey25","s","Color triple",\'0.250980 0.250980 0.250980\'),ParValue("grey26","s","Color triple",\'0.258824 0.258824 0.258824\'),ParValue("grey27","s","Color triple",\'0.270588 0.270588 0.270588\'),ParValue("grey28","s","Color triple",\'0.278431 0.278431 0.278431\'),ParValue("grey29","s","Color triple",\'0.290196 0.290196 0.290196\'),ParValue("grey3","s","Color triple",\'0.031373 0.031373 0.031373\'),ParValue("grey30","s","Color triple",\'0.301961 0.301961 0.301961\'),ParValue("grey31","s","Color triple",\'0.309804 0.309804 0.309804\'),ParValue("grey32","s","Color triple",\'0.321569 0.321569 0.321569\'),ParValue("grey33","s","Color triple",\'0.329412 0.329412 0.329412\'),ParValue("grey34","s","Color triple",\'0.341176 0.341176 0.341176\'),ParValue("grey35","s","Color triple",\'0.349020 0.349020 0.349020\'),ParValue("grey36","s","Color triple",\'0.360784 0.360784 0.360784\'),ParValue("grey37","s","Color triple",\'0.368627 0.368627 0.368627\'),ParValue("grey38","s","Color triple",\'0.380392 0.380392 0.380392\'),ParValue("grey39","s","Color triple",\'0.388235 0.388235 0.388235\'),ParValue("grey4","s","Color triple",\'0.039216 0.039216 0.039216\'),ParValue("grey40","s","Color triple",\'0.400000 0.400000 0.400000\'),ParValue("grey41","s","Color triple",\'0.411765 0.411765 0.411765\'),ParValue("grey42","s","Color triple",\'0.419608 0.419608 0.419608\'),ParValue("grey43","s","Color triple",\'0.431373 0.431373 0.431373\'),ParValue("grey44","s","Color triple",\'0.439216 0.439216 0.439216\'),ParValue("grey45","s","Color triple",\'0.450980 0.450980 0.450980\'),ParValue("grey46","s","Color triple",\'0.458824 0.458824 0.458824\'),ParValue("grey47","s","Color triple",\'0.470588 0.470588 0.470588\'),ParValue("grey48","s","Color triple",\'0.478431 0.478431 0.478431\'),ParValue("grey49","s","Color triple",\'0.490196 0.490196 0.490196\'),ParValue("grey5","s","Color triple",\'0.050980 0.050980 0.050980\'),ParValue("grey50","s","Color triple",\'0.498039 0.498039 0.498039\'),ParValue("grey51","s","Color triple",\'0.509804 0.509804 0.509804\'),ParValue("grey52","s","Color triple",\'0.521569 0.521569 0.521569\'),ParValue("grey53","s","Color triple",\'0.529412 0.529412 0.529412\'),ParValue("grey54","s","Color triple",\'0.541176 0.541176 0.541176\'),ParValue("grey55","s","Color triple",\'0.549020 0.549020 0.549020\'),ParValue("grey56","s","Color triple",\'0.560784 0.560784 0.560784\'),ParValue("grey57","s","Color triple",\'0.568627 0.568627 0.568627\'),ParValue("grey58","s","Color triple",\'0.580392 0.580392 0.580392\'),ParValue("grey59","s","Color triple",\'0.588235 0.588235 0.588235\'),ParValue("grey6","s","Color triple",\'0.058824 0.058824 0.058824\'),ParValue("grey60","s","Color triple",\'0.600000 0.600000 0.600000\'),ParValue("grey61","s","Color triple",\'0.611765 0.611765 0.611765\'),ParValue("grey62","s","Color triple",\'0.619608 0.619608 0.619608\'),ParValue("grey63","s","Color triple",\'0.631373 0.631373 0.631373\'),ParValue("grey64","s","Color triple",\'0.639216 0.639216 0.639216\'),ParValue("grey65","s","Color triple",\'0.650980 0.650980 0.650980\'),ParValue("grey66","s","Color triple",\'0.658824 0.658824 0.658824\'),ParValue("grey67","s","Color triple",\'0.670588 0.670588 0.670588\'),ParValue("grey68","s","Color triple",\'0.678431 0.678431 0.678431\'),ParValue("grey69","s","Color triple",\'0.690196 0.690196 0.690196\'),ParValue("grey7","s","Color triple",\'0.070588 0.070588 0.070588\'),ParValue("grey70","s","Color triple",\'0.701961 0.701961 0.701961\'),ParValue("grey71","s","Color triple",\'0.709804 0.709804 0.709804\'),ParValue("grey72","s","Color triple",\'0.721569 0.721569 0.721569\'),ParValue("grey73","s","Color triple",\'0.729412 0.729412 0.729412\'),ParValue("grey74","s","Color triple",\'0.741176 0.741176 0.741176\'),ParValue("grey75","s","Color triple",\'0.749020 0.749020 0.749020\'),ParValue("grey76","s","Color triple",\'0.760784 0.760784 0.760784\'),ParValue("grey77","s","Color triple",\'0.768627 0.768627 0.768627\'),ParValue("grey78","s","Color triple",\'0.780392 0.780392 0.780392\'),ParValue("grey79","s","Color triple",\'0.788235 0.788235 0.788235\'),ParValue("grey8","s","Color triple",\'0.078431 0.078431 0.078431\'),ParValue("grey80","s","Color triple",\'0.800000 0.800000 0.800000\'),ParValue("grey81","s","Color triple",\'0.811765 0.811765 0.811765\'),ParValue("grey82","s","Color triple",\'0.819608 0.819608 0.819608\'),ParValue("grey83","s","Color triple",\'0.831373 0.831373 0.831373\'),ParValue("grey84","s","Color triple",\'0.839216 0.839216 0.839216\'),ParValue("grey85","s","Color triple",\'0.850980 0.850980 0.850980\'),ParValue("grey86","s","Color triple",\'0.858824 0.858824 0.858824\'),ParValue("grey87","s","Color triple",\'0.870588 0.870588 0.870588\'),ParValue("grey88","s","Color triple",\'0.878431 0.878431 0.878431\'),ParValue("grey89","s","Color triple",\'0.890196 0.890196 0.890196\'),ParValue("grey9","s","Color triple",\'0.090196 0.090196 0.090196\'),ParValue("grey90","s","Color triple",\'0.898039 0.898039 0.898039\'),ParValue("grey91","s","Color triple",\'0.909804 0.909804 0.909804\'),ParValue("grey92","s","Color triple",\'0.921569 0.921569 0.921569\'),ParValue("grey93","s","Color triple",\'0.929412 0.929412 0.929412\'),ParValue("grey94","s","Color triple",\'0.941176 0.941176 0.941176\'),ParValue("grey95","s","Color triple",\'0.949020 0.949020 0.949020\'),ParValue("grey96","s","Color triple",\'0.960784 0.960784 0.960784\'),ParValue("grey97","s","Color triple",\'0.968627 0.968627 0.968627\'),ParValue("grey98","s","Color triple",\'0.980392 0.980392 0.980392\'),ParValue("grey99","s","Color triple",\'0.988235 0.988235 0.988235\'),ParValue("honeydew","s","Color triple",\'0.941176 1 0.941176\'),ParValue("honeydew1","s","Color triple",\'0.941176 1 0.941176\'),ParValue("honeydew2","s","Color triple",\'0.878431 0.933333 0.878431\'),ParValue("honeydew3","s","Color triple",\'0.756863 0.803922 0.756863\'),ParValue("honeydew4","s","Color triple",\'0.513725 0.545098 0.513725\'),ParValue("hotpink","s","Color triple",\'1 0.411765 0.705882\'),ParValue("hotpink1","s","Color triple",\'1 0.431373 0.705882\'),ParValue("hotpink2","s","Color triple",\'0.933333 0.415686 0.654902\'),ParValue("hotpink3","s","Color triple",\'0.803922 0.376471 0.564706\'),ParValue("hotpink4","s","Color triple",\'0.545098 0.227451 0.384314\'),ParValue("indianred","s","Color triple",\'0.803922 0.360784 0.360784\'),ParValue("indianred1","s","Color triple",\'1 0.415686 0.415686\'),ParValue("indianred2","s","Color triple",\'0.933333 0.388235 0.388235\'),ParValue("indianred3","s","Color triple",\'0.803922 0.333333 0.333333\'),ParValue("indianred4","s","Color triple",\'0.545098 0.227451 0.227451\'),ParValue("ivory","s","Color triple",\'1 1 0.941176\'),ParValue("ivory1","s","Color triple",\'1 1 0.941176\'),ParValue("ivory2","s","Color triple",\'0.933333 0.933333 0.878431\'),ParValue("ivory3","s","Color triple",\'0.803922 0.803922 0.756863\'),ParValue("ivory4","s","Color triple",\'0.545098 0.545098 0.513725\'),ParValue("khaki","s","Color triple",\'0.941176 0.901961 0.549020\'),ParValue("khaki1","s","Color triple",\'1 0.964706 0.560784\'),ParValue("khaki2","s","Color triple",\'0.933333 0.901961 0.521569\'),ParValue("khaki3","s","Color triple",\'0.803922 0.776471 0.450980\'),ParValue("khaki4","s","Color triple",\'0.545098 0.525490 0.305882\'),ParValue("lavender","s","Color triple",\'0.901961 0.901961 0.980392\'),ParValue("lavenderblush","s","Color triple",\'1 0.941176 0.960784\'),ParValue("lavenderblush1","s","Color triple",\'1 0.941176 0.960784\'),ParValue("lavenderblush2","s","Color triple",\'0.933333 0.878431 0.898039\'),ParValue("lavenderblush3","s","Color triple",\'0.803922 0.756863 0.772549\'),ParValue("lavenderblush4","s","Color triple",\'0.545098 0.513725 0.525490\'),ParValue("lawngreen","s","Color triple",\'0.486275 0.988235 0\'),ParValue("lemonchiffon","s","Color triple",\'1 0.980392 0.803922\'),ParValue("lemonchiffon1","s","Color triple",\'1 0.980392 0.803922\'),ParValue("lemonchiffon2","s","Color triple",\'0.933333 0.913725 0.749020\'),ParValue("lemonchiffon3","s","Color triple",\'0.803922 0.788235 0.647059\'),ParValue("lemonchiffon4","s","Color triple",\'0.545098 0.537255 0.439216\'),ParValue("lightblue","s","Color triple",\'0.678431 0.847059 0.901961\'),ParValue("lightblue1","s","Color triple",\'0.749020 0.937255 1\'),ParValue("lightblue2","s","Color triple",\'0.698039 0.874510 0.933333\'),ParValue("lightblue3","s","Color triple",\'0.603922 0.752941 0.803922\'),ParValue("lightblue4","s","Color triple",\'0.407843 0.513725 0.545098\'),ParValue("lightcoral","s","Color triple",\'0.941176 0.501961 0.501961\'),ParValue("lightcyan","s","Color triple",\'0.878431 1 1\'),ParValue("lightcyan1","s","Color triple",\'0.878431 1 1\'),ParValue("lightcyan2","s","Color triple",\'0.819608 0.933333 0.933333\'),ParValue("lightcyan3","s","Color triple",\'0.705882 0.803922 0.803922\'),ParValue("lightcyan4","s","Color triple",\'0.478431 0.545098 0.545098\'),ParValue("lightgoldenrod","s","Color triple",\'0.933333 0.866667 0.509804\'),ParValue("lightgoldenrod1","s","Color triple",\'1 0.925490 0.545098\'),ParValue("lightgoldenrod2","s","Color triple",\'0.933333 0.862745 0.509804\'),ParValue("lightgoldenrod3","s","Color triple",\'0.803922 0.745098 0.439216\'),ParValue("lightgoldenrod4","s","Color triple",\'0.545098 0.505882 0.298039\'),ParValue("lightgoldenrodyellow","s","Color triple",\'0.980392 0.980392 0.823529\'),ParValue("lightgray","s","Color triple",\'0.827451 0.827451 0.827451\'),ParValue("lightgrey","s","Color triple",\'0.827451 0.827451 0.827451\'),ParValue("lightpink","s","Color triple",\'1 0.713725 0.756863\'),ParValue("lightpink1","s","Color triple",\'1 0.682353 0.725490\'),ParValue("lightpink2","s","Color triple",\'0.933333 0.635294 0.678431\'),ParValue("lightpink3","s","Color triple",\'0.803922 0.549020 0.584314\'),ParValue("lightpink4","s","Color triple",\'0.545098 0.372549 0.396078\'),ParValue("lightsalmon","s","Color triple",\'1 0.627451 0.478431\'),ParValue("lightsalmon1","s","Color triple",\'1 0.627451 0.478431\'),ParValue("lightsalmon2","s","Color triple",\'0.933333 0.584314 0.447059\'),ParValue("lightsalmon3","s","Color triple",\'0.803922 0.505882 0.384314\'),ParValue("lightsalmon4","s","Color triple",\'0.545098 0.341176 0.258824\'),ParValue("lightseagreen","s","Color triple",\'0.125490 0.698039 0.666667\'),ParValue("lightskyblue","s","Color triple",\'0.529412 0.807843 0.980392\'),ParValue("lightskyblue1","s","Color triple",\'0.690196 0.886275 1\'),ParValue("lightskyblue2","s","Color triple",\'0.643137 0.827451 0.933333\'),ParValue("lightskyblue3","s","Color triple",\'0.552941 0.713725 0.803922\'),ParValue("lightskyblue4","s","Color triple",\'0.376471 0.482353 0.545098\'),ParValue("lightslateblue","s","Color triple",\'0.517647 0.439216 1\'),ParValue("lightslategray","s","Color triple",\'0.466667 0.533333 0.600000\'),ParValue("lightslategrey","s","Color triple",\'0.466667 0.533333 0.600000\'),ParValue("lightsteelblue","s","Color triple",\'0.690196 0.768627 0.870588\'),ParValue("lightsteelblue1","s","Color triple",\'0.792157 0.882353 1\'),ParValue("lightsteelblue2","s","Color triple",\'0.737255 0.823529 0.933333\'),ParValue("lightsteelblue3","s","Color triple",\'0.635294 0.709804 0.803922\'),ParValue("lightsteelblue4","s","Color triple",\'0.431373 0.482353 0.545098\'),ParValue("lightyellow","s","Color triple",\'1 1 0.878431\'),ParValue("lightyellow1","s","Color triple",\'1 1 0.878431\'),ParValue("lightyellow2","s","Color triple",\'0.933333 0.933333 0.819608\'),ParValue("lightyellow3","s","Color triple",\'0.803922 0.803922 0.705882\'),ParValue("lightyellow4","s","Color triple",\'0.545098 0.545098 0.478431\'),ParValue("limegreen","s","Color triple",\'0.196078 0.803922 0.196078\'),ParValue("linen","s","Color triple",\'0.980392 0.941176 0.901961\'),ParValue("magenta","s","Color triple",\'1 0 1\'),ParValue("magenta1","s","Color triple",\'1 0 1\'),ParValue("magenta2","s","Color triple",\'0.933333 0 0.933333\'),ParValue("magenta3","s","Color triple",\'0.803922 0 0.803922\'),ParValue("magenta4","s","Color triple",\'0.545098 0 0.545098\'),ParValue("maroon","s","Color triple",\'0.690196 0.188235 0.376471\'),ParValue("maroon1","s","Color triple",\'1 0.203922 0.701961\'),ParValue("maroon2","s","Color triple",\'0.933333 0.188235 0.654902\'),ParValue("maroon3","s","Color triple",\'0.803922 0.160784 0.564706\'),ParValue("maroon4","s","Color triple",\'0.545098 0.109804 0.384314\'),ParValue("mediumaquamarine","s","Color triple",\'0.400000 0.803922 0.666667\'),ParValue("mediumblue","s","Color triple",\'0 0 0.803922\'),ParValue("mediumforestgreen","s","Color triple",\'0.419608 0.556863 0.137255\'),ParValue("mediumgoldenrod","s","Color triple",\'0.721569 0.486275 0.043137\'),ParValue("mediumorchid","s","Color triple",\'0.729412 0.333333 0.827451\'),ParValue("mediumorchid1","s","Color triple",\'0.878431 0.400000 1\'),ParValue("mediumorchid2","s","Color triple",\'0.819608 0.372549 0.933333\'),ParValue("mediumorchid3","s","Color triple",\'0.705882 0.321569 0.803922\'),ParValue("mediumorchid4","s","Color triple",\'0.478431 0.215686 0.545098\'),ParValue("mediumpurple","s","Color triple",\'0.576471 0.439216 0.858824\'),ParValue("mediumpurple1","s","Color triple",\'0.670588 0.509804 1\'),ParValue("mediumpurple2","s","Color triple",\'0.623529 0.474510 0.933333\'),ParValue("mediumpurple3","s","Color triple",\'0.537255 0.407843 0.803922\'),ParValue("mediumpurple4","s","Color triple",\'0.364706 0.278431 0.545098\'),ParValue("mediumseagreen","s","Color triple",\'0.235294 0.701961 0.443137\'),ParValue("mediumslateblue","s","Color triple",\'0.482353 0.407843 0.933333\'),ParValue("mediumspringgreen","s","Color triple",\'0 0.980392 0.603922\'),ParValue("mediumturquoise","s","Color triple",\'0.282353 0.819608 0.800000\'),ParValue("mediumvioletred","s","Color triple",\'0.780392 0.082353 0.521569\'),ParValue("midnightblue","s","Color triple",\'0.098039 0.098039 0.439216\'),ParValue("mintcream","s","Color triple",\'0.960784 1 0.980392\'),ParValue("mistyrose","s","Color triple",\'1 0.894118 0.882353\'),ParValue("mistyrose1","s","Color triple",\'1 0.894118 0.882353\'),ParValue("mistyrose2","s","Color triple",\'0.933333 0.835294 0.823529\'),ParValue("mistyrose3","s","Color triple",\'0.803922 0.717647 0.709804\'),ParValue("mistyrose4","s","Color triple",\'0.545098 0.490196 0.482353\'),ParValue("moccasin","s","Color triple",\'1 0.894118 0.709804\'),ParValue("navajowhite","s","Color triple",\'1 0.870588 0.678431\'),ParValue("navajowhite1","s","Color triple",\'1 0.870588 0.678431\'),ParValue("navajowhite2","s","Color triple",\'0.933333 0.811765 0.631373\'),ParValue("navajowhite3","s","Color triple",\'0.803922 0.701961 0.545098\'),ParValue("navajowhite4","s","Color triple",\'0.545098 0.474510 0.368627\'),ParValue("navy","s","Color triple",\'0 0 0.501961\'),ParValue("navyblue","s","Color triple",\'0 0 0.501961\'),ParValue("oldlace","s","Color triple",\'0.992157 0.960784 0.901961\'),ParValue("olivedrab","s","Color triple",\'0.419608 0.556863 0.137255\'),ParValue("olivedrab1","s","Color triple",\'0.752941 1 0.243137\'),ParValue("olivedrab2","s","Color triple",\'0.701961 0.933333 0.227451\'),ParValue("olivedrab3","s","Color triple",\'0.603922 0.803922 0.196078\'),ParValue("olivedrab4","s","Color triple",\'0.411765 0.545098 0.133333\'),ParValue("orange","s","Color triple",\'1 0.647059 0\'),ParValue("orange1","s","Color triple",\'1 0.647059 0\'),ParValue("orange2","s","Color triple",\'0.933333 0.603922 0\'),ParValue("orange3","s","Color triple",\'0.803922 0.521569 0\'),ParValue("orange4","s","Color triple",\'0.545098 0.352941 0\'),ParValue("orangered","s","Color triple",\'1 0.270588 0\'),ParValue("orangered1","s","Color triple",\'1 0.270588 0\'),ParValue("orangered2","s","Color triple",\'0.933333 0.250980 0\'),ParValue("orangered3","s","Color triple",\'0.803922 0.215686 0\'),ParValue("orangered4","s","Color triple",\'0.545098 0.145098 0\'),ParValue("orchid","s","Color triple",\'0.854902 0.439216 0.839216\'),ParValue("orchid1","s","Color triple",\'1 0.513725 0.980392\'),ParValue("orchid2","s","Color triple",\'0.933333 0.478431 0.913725\'),ParValue("orchid3","s","Color triple",\'0.803922 0.411765 0.788235\'),ParValue("orchid4","s","Color triple",\'0.545098 0.278431 0.537255\'),ParValue("palegoldenrod","s","Color triple",\'0.933333 0.909804 0.666667\'),ParValue("palegreen","s","Color triple",\'0.596078 0.984314 0.596078\'),ParValue("palegreen1","s","Color triple",\'0.603922 1 0.603922\'),ParValue("palegreen2","s","Color triple",\'0.564706 0.933333 0.564706\'),ParValue("palegreen3","s","Color triple",\'0.486275 0.803922 0.486275\'),ParValue("palegreen4","s","Color triple",\'0.329412 0.545098 0.329412\'),ParValue("paleturquoise","s","Color triple",\'0.686275 0.933333 0.933333\'),ParValue("paleturquoise1","s","Color triple",\'0.733333 1 1\'),ParValue("paleturquoise2","s","Color triple",\'0.682353 0.933333 0.933333\'),ParValue("paleturquoise3","s","Color triple",\'0.588235 0.803922 0.803922\'),ParValue("paleturquoise4","s","Color triple",\'0.400000 0.545098 0.545098\'),ParValue("palevioletred","s","Color triple",\'0.858824 0.439216 0.576471\'),ParValue("palevioletred1","s","Color triple",\'1 0.509804 0.670588\'),ParValue("palevioletred2","s","Color triple",\'0.933333 0.474510 0.623529\'),ParValue("palevioletred3","s","Color triple",\'0.803922 0.407843 0.537255\'),ParValue("palevioletred4","s","Color triple",\'0.545098 0.278431 0.364706\'),ParValue("papayawhip","s","Color triple",\'1 0.937255 0.835294\'),ParValue("peachpuff","s","Color triple",\'1 0.854902 0.725490\'),ParValue("peachpuff1","s","Color triple",\'1 0.854902 0.725490\'),ParValue("peachpuff2","s","Color triple",\'0.933333 0.796078 0.678431\'),ParValue("peachpuff3","s","Color triple",\'0.803922 0.686275 0.584314\'),ParValue("peachpuff4","s","Color triple",\'0.545098 0.466667 0.396078\'),ParValue("peru","s","Color triple",\'0.803922 0.521569 0.247059\'),ParValue("pink","s","Color triple",\'1 0.752941 0.796078\'),ParValue("pink1","s","Color triple",\'1 0.709804 0.772549\'),ParValue("pink2","s","Color triple",\'0.933333 0.662745 0.721569\'),ParValue("pink3","s","Color triple",\'0.803922 0.568627 0.619608\'),ParValue("pink4","s","Color triple",\'0.545098 0.388235 0.423529\'),ParValue("plum","s","Color triple",\'0.866667 0.627451 0.866667\'),ParValue("plum1","s","Color triple",\'1 0.733333 1\'),ParValue("plum2","s","Color triple",\'0.933333 0.682353 0.933333\'),ParValue("plum3","s","Color triple",\'0.803922 0.588235 0.803922\'),ParValue("plum4","s","Color triple",\'0.545098 0.400000 0.545098\'),ParValue("powderblue","s","Color triple",\'0.690196 0.878431 0.901961\'),ParValue("purple","s","Color triple",\'0.627451 0.125490 0.941176\'),ParValue("purple1","s","Color triple",\'0.607843 0.188235 1\'),ParValue("purple2","s","Color triple",\'0.568627 0.172549 0.933333\'),ParValue("purple3","s","Color triple",\'0.490196 0.149020 0.803922\'),ParValue("purple4","s","Color triple",\'0.333333 0.101961 0.545098\'),ParValue("red","s","Color triple",\'1 0 0\'),ParValue("red1","s","Color triple",\'1 0 0\'),ParValue("red2","s","Color triple",\'0.933333 0 0\'),ParValue("red3","s","Color triple",\'0.803922 0 0\'),ParValue("red4","s","Color triple",\'0.545098 0 0\'),ParValue("rosybrown","s","Color triple",\'0.737255 0.560784 0.560784\'),ParValue("rosybrown1","s","Color triple",\'1 0.756863 0.756863\'),ParValue("rosybrown2","s","Color triple",\'0.933333 0.705882 0.705882\'),ParValue("rosybrown3","s","Color triple",\'0.803922 0.607843 0.607843\'),ParValue("rosybrown4","s","Color triple",\'0.545098 0.411765 0.411765\'),ParValue("royalblue","s","Color triple",\'0.254902 0.411765 0.882353\'),ParValue("royalblue1","s","Color triple",\'0.282353 0.462745 1\'),ParValue("royalblue2","s","Color triple",\'0.262745 0.431373 0.933333\'),ParValue("royalblue3","s","Color triple",\'0.227451 0.372549 0.803922\'),ParValue("royalblue4","s","Color triple",\'0.152941 0.250980 0.545098\'),ParValue("saddlebrown","s","Color triple",\'0.545098 0.270588 0.074510\'),ParValue("salmon","s","Color triple",\'0.980392 0.501961 0.447059\'),ParValue("salmon1","s","Color triple",\'1 0.549020 0.411765\'),ParValue("salmon2","s","Color triple",\'0.933333 0.509804 0.384314\'),ParValue("salmon3","s","Color triple",\'0.803922 0.439216 0.329412\'),ParValue("salmon4","s","Color triple",\'0.545098 0.298039 0.223529\'),ParValue("sandybrown","s","Color triple",\'0.956863 0.643137 0.376471\'),ParValue("seagreen","s","Color triple",\'0.180392 0.545098 0.341176\'),ParValue("seagreen1","s","Color triple",\'0.329412 1 0.623529\'),ParValue("seagreen2","s","Color triple",\'0.305882 0.933333 0.580392\'),ParValue("seagreen3","s","Color triple",\'0.262745 0.803922 0.501961\'),ParValue("seagreen4","s","Color triple",\'0.180392 0.545098 0.341176\'),ParValue("seashell","s","Color triple",\'1 0.960784 0.933333\'),ParValue("seashell1","s","Color triple",\'1 0.960784 0.933333\'),ParValue("seashell2","s","Color triple",\'0.933333 0.898039 0.870588\'),ParValue("seashell3","s","Color triple",\'0.803922 0.772549 0.749020\'),ParValue("seashell4","s","Color triple",\'0.545098 0.525490 0.509804\'),ParValue("sienna","s","Color triple",\'0.627451 0.321569 0.176471\'),ParValue("sienna1","s","Color triple",\'1 0.509804 0.278431\'),ParValue("sienna2","s","Color triple",\'0.933333 0.474510 0.258824\'),ParValue("sienna3","s","Color triple",\'0.803922 0.407843 0.223529\'),ParValue("sienna4","s","Color triple",\'0.545098 0.278431 0.149020\'),ParValue("skyblue","s","Color triple",\'0.529412 0.807843 0.921569\'),ParValue("skyblue1","s","Color triple",\'0.529412 0.807843 1\'),ParValue("skyblue2","s","Color triple",\'0.494118 0.752941 0.933333\'),ParValue("skyblue3","s","Color triple",\'0.423529 0.650980 0.803922\'),ParValue("skyblue4","s","Color triple",\'0.290196 0.439216 0.545098\'),ParValue("slateblue","s","Color triple",\'0.415686 0.352941 0.803922\'),ParValue("slateblue1","s","Color triple",\'0.513725 0.435294 1\'),ParValue("slateblue2","s","Color triple",\'0.478431 0.403922 0.933333\'),ParValue("slateblue3","s","Color triple",\'0.411765 0.349020 0.803922\'),ParValue("slateblue4","s","Color triple",\'0.278431 0.235294 0.545098\'),ParValue("slategray","s","Color triple",\'0.439216 0.501961 0.564706\'),ParValue("slategray1","s","Color triple",\'0.776471 0.886275 1\'),ParValue("slategray2","s","Color triple",\'0.725490 0.827451 0.933333\'),ParValue("slategray3","s","Color triple",\'0.623529 0.713725 0.803922\'),ParValue("slategray4","s","Color triple",\'0.423529 0.482353 0.545098\'),ParValue("slategrey","s","Color triple",\'0.439216 0.501961 0.564706\'),ParValue("snow","s","Color triple",\'1 0.980392 0.980392\'),ParValue("snow1","s","Color triple",\'1 0.980392 0.980392\'),ParValue("snow2","s","Color triple",\'0.933333 0.913725 0.913725\'),ParValue("snow3","s","Color triple",\'0.803922 0.788235 0.788235\'),ParValue("snow4","s","Color triple",\'0.545098 0.537255 0.537255\'),ParValue("springgreen","s","Color triple",\'0 1 0.498039\'),ParValue("springgreen1","s","Color triple",\'0 1 0.498039\'),ParValue("springgreen2","s","Color triple",\'0 0.933333 0.462745\'),ParValue("springgreen3","s","Color triple",\'0 0.803922 0.400000\'),ParValue("springgreen4","s","Color triple",\'0 0.545098 0.270588\'),ParValue("steelblue","s","Color triple",\'0.274510 0.509804 0.705882\'),ParValue("steelblue1","s","Color triple",\'0.388235 0.721569 1\'),ParValue("steelblue2","s","Color triple",\'0.360784 0.674510 0.933333\'),ParValue("steelblue3","s","Color triple",\'0.309804 0.580392 0.803922\'),ParValue("steelblue4","s","Color triple",\'0.211765 0.392157 0.545098\'),ParValue("tan","s","Color triple",\'0.823529 0.705882 0.549020\'),ParValue("tan1","s","Color triple",\'1 0.647059 0.309804\'),ParValue("tan2","s","Color triple",\'0.933333 0.603922 0.286275\'),ParValue("tan3","s","Color triple",\'0.803922 0.521569 0.247059\'),ParValue("tan4","s","Color triple",\'0.545098 0.352941 0.168627\'),ParValue("thistle","s","Color triple",\'0.847059 0.749020 0.847059\'),ParValue("thistle1","s","Color triple",\'1 0.882353 1\'),ParValue("thistle2","s","Color triple",\'0.933333 0.823529 0.933333\'),ParValue("thistle3","s","Color triple",\'0.803922 0.709804 0.803922\'),ParValue("thistle4","s","Color triple",\'0.545098 0.482353 0.545098\'),ParValue("tomato","s","Color triple",\'1 0.388235 0.278431\'),ParValue("tomato1","s","Color triple",\'1 0.388235 0.278431\'),ParValue("tomato2","s","Color triple",\'0.933333 0.360784 0.258824\'),ParValue("tomato3","s","Color triple",\'0.803922 0.309804 0.223529\'),ParValue("tomato4","s","Color triple",\'0.545098 0.211765 0.149020\'),ParValue("turquoise","s","Color triple",\'0.250980 0.878431 0.815686\'),ParValue("turquoise1","s","Color triple",\'0 0.960784 1\'),ParValue("turquoise2","s","Color triple",\'0 0.898039 0.933333\'),ParValue("turquoise3","s","Color triple",\'0 0.772549 0.803922\'),ParValue("turquoise4","s","Color triple",\'0 0.525490 0.545098\'),ParValue("violet","s","Color triple",\'0.933333 0.509804 0.933333\'),ParValue("violetred","s","Color triple",\'0.815686 0.125490 0.564706\'),ParValue("violetred1","s","Color triple",\'1 0.243137 0.588235\'),ParValue("violetred2","s","Color triple",\'0.933333 0.227451 0.549020\'),ParValue("violetred3","s","Color triple",\'0.803922 0.196078 0.470588\'),ParValue("violetred4","s","Color triple",\'0.545098 0.133333 0.321569\'),ParValue("wheat","s","Color triple",\'0.960784 0.870588 0.701961\'),ParValue("wheat1","s","Color triple",\'1 0.905882 0.729412\'),ParValue("wheat2","s","Color triple",\'0.933333 0.847059 0.682353\'),ParValue("wheat3","s","Color triple",\'0.803922 0.729412 0.588235\'),ParValue("wheat4","s","Color triple",\'0.545098 0.494118 0.400000\'),ParValue("white","s","Color triple",\'1 1 1\'),ParValue("whitesmoke","s","Color triple",\'0.960784 0.960784 0.960784\'),ParValue("yellow","s","Color triple",\'1 1 0\'),ParValue("yellow1","s","Color triple",\'1 1 0\'),ParValue("yellow2","s","Color triple",\'0.933333 0.933333 0\'),ParValue("yellow3","s","Color triple",\'0.803922 0.803922 0\'),ParValue("yellow4","s","Color triple",\'0.545098 0.545098 0\'),ParValue("yellowgreen","s","Color triple",\'0.603922 0.803922 0.196078\')]',
+        }
 
-parinfo['combine_spectra'] = {
-    'istool': True,
-    'req': [ParValue("src_spectra","f","Source PHA files to combine; enter list or '@stack'",None),ParValue("outroot","f","Root name for output files",None)],
-    'opt': [ParValue("src_arfs","f","Source ARF files to combine; enter list or '@stack'",None),ParValue("src_rmfs","f","Source RMF files to combine; enter list or '@stack'",None),ParValue("bkg_spectra","f","Background PHA files to combine; enter list or '@stack'",None),ParValue("bkg_arfs","f","Background ARF files to combine; enter list or '@stack'",None),ParValue("bkg_rmfs","f","Background RMF files to combine; enter list or '@stack'",None),ParSet("method","s","Sum or average PHA exposures?",'sum',["sum","avg"]),ParSet("bscale_method","s","How are BACKSCAL and background counts computed?",'asca',["asca","time","counts"]),ParSet("exp_origin","s","Write combined PHA or ARF exposure time to header(s) (pha, arf)",'pha',["pha","arf"]),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['combine_grating_spectra'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Source PHA1/PHA2 grating spectra to combine; enter list or \'@stack\'",None),ParValue("outroot","f","Root name for output file(s)",None)]',
+        'opt': '[ParValue("add_plusminus","b","Combine +/- orders (yes) after summing signed-order and part?",False),ParSet("garm","s","Grating arm (HEG, MEG, LEG, or \'all\')",\'all\',["HEG","MEG","LEG","all"]),ParSet("order","s","Grating diffraction order (1,2,3,-1,-2,-3, or \'all\')",\'all\',["1","2","3","-1","-2","-3","all"]),ParValue("arf","f","Source ARF files to combine; enter list or \'@stack\'",None),ParValue("rmf","f","Source RMF files to combine; enter list or \'@stack\'",None),ParValue("bkg_pha","f","Background PHA files to combine; enter list or \'@stack\'",None),ParSet("bscale_method","s","How are BACKSCAL and background counts computed?",\'counts\',["asca","time","counts"]),ParSet("exposure_mode","s","Sum or average exposure times?",\'sum\',["avg","sum"]),ParValue("object","s","Specify the OBJECT keyword in the combined output",None),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['convert_ds9_region_to_ciao_stack'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input ds9 region file in physical coordinates",None),ParValue("outfile","f","Output CIAO stack of regions",None)],
-    'opt': [ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)],
-    }
 
+    parinfo['combine_spectra'] = {
+        'istool': True,
+        'req': '[ParValue("src_spectra","f","Source PHA files to combine; enter list or \'@stack\'",None),ParValue("outroot","f","Root name for output files",None)]',
+        'opt': '[ParValue("src_arfs","f","Source ARF files to combine; enter list or \'@stack\'",None),ParValue("src_rmfs","f","Source RMF files to combine; enter list or \'@stack\'",None),ParValue("bkg_spectra","f","Background PHA files to combine; enter list or \'@stack\'",None),ParValue("bkg_arfs","f","Background ARF files to combine; enter list or \'@stack\'",None),ParValue("bkg_rmfs","f","Background RMF files to combine; enter list or \'@stack\'",None),ParSet("method","s","Sum or average PHA exposures?",\'sum\',["sum","avg"]),ParSet("bscale_method","s","How are BACKSCAL and background counts computed?",\'asca\',["asca","time","counts"]),ParSet("exp_origin","s","Write combined PHA or ARF exposure time to header(s) (pha, arf)",\'pha\',["pha","arf"]),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['correct_periscope_drift'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input aspect solution file",None),ParValue("evtfile","f","event file",None),ParValue("outfile","f","corrected/output aspect solution file",None),ParRange("x","r","src sky x",None,1,None),ParRange("y","r","src sky y",None,1,None),ParRange("radius","r","src circle radius in pixels",None,0,None)],
-    'opt': [ParValue("corr_plot_root","f","prefix for correction evaluation plots",'corr'),ParRange("src_min_counts","r","minimum src counts",250,0,None),ParRange("corr_poly_degree","i","Degree of sherpa fit polynomial",2,1,8),ParValue("clobber","b","Overwrite the output file if it exists?",False),ParRange("verbose","i","Debug level (0=no debug information)",2,0,5)],
-    }
 
+    parinfo['convert_ds9_region_to_ciao_stack'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input ds9 region file in physical coordinates",None),ParValue("outfile","f","Output CIAO stack of regions",None)]',
+        'opt': '[ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)]',
+        }
 
-parinfo['create_bkg_map'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("fovfile","f","Input fov file",None),ParValue("expmap","f","Input exposure map",None),ParValue("outfile","f","Output background image",None),ParValue("xygrid","s","Exposure map grid syntax x0:x1:#nx,x0:x1:ny",None)],
-    'opt': [ParValue("outimgfile","f","Output image file",None),ParValue("outstreakmap","f","Output streak map file",None),ParValue("outlowfreqmap","f","Output low frequency map file",None),ParValue("tmpdir","s","Directory for temp. files",'${ASCDS_WORK_PATH}'),ParValue("expcorr","b","Is final background exposure corrected?",True),ParRange("scale","i","scale in pixels for dmimgpm",64,0,None),ParValue("smoothing_kernel","s","Smoothing kernel for HRC data",'lib:tophat(2,1,3,3)'),ParValue("clobber","b","Clobber existing output?",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['correct_periscope_drift'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input aspect solution file",None),ParValue("evtfile","f","event file",None),ParValue("outfile","f","corrected/output aspect solution file",None),ParRange("x","r","src sky x",None,1,None),ParRange("y","r","src sky y",None,1,None),ParRange("radius","r","src circle radius in pixels",None,0,None)]',
+        'opt': '[ParValue("corr_plot_root","f","prefix for correction evaluation plots",\'corr\'),ParRange("src_min_counts","r","minimum src counts",250,0,None),ParRange("corr_poly_degree","i","Degree of sherpa fit polynomial",2,1,8),ParValue("clobber","b","Overwrite the output file if it exists?",False),ParRange("verbose","i","Debug level (0=no debug information)",2,0,5)]',
+        }
 
-parinfo['crisscross'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","An evt2 file (or stack) which includes the sources in main_list and subset_src_list.",None),ParValue("outdir","f","Output directory that will be created to hold confusion table output.",None),ParValue("main_list","f","A fits/ascii/tsv file which includes columns RA, DEC, and ID of all X-ray sources in evt2 file.",None),ParValue("subset_src_list","f","A fits/ascii/tsv file with columns RA, DEC for sources to calculate confusion. Leave empty when calculating single source with single_src_pos",None),ParValue("wavdetect_file","f","wavdetect output source list. If None, CrissCross will create one.",'None'),ParRange("verbose","i","Verbosity level",1,0,5),ParValue("clobber","b","OK to overwrite existing output file?",False)],
-    'opt': [ParValue("single_src_pos","s","To calc confusion for only a single source include RA,DEC in deg, e.g. (83.818,-5.389).",'None'),ParValue("single_src_root","s","Root name for output confusion table of single_src_pos",'None'),ParValue("conf_table_level","s","Output to be saved to confusion table. Can be 'confused', 'warn', or 'clean'.",'confused'),ParValue("arf_ratios_dir","s","Path to ARF ratio fits tables.",'$ASCDS_CALIB'),ParRange("max_pntsrc_dist","r","Max distance in pixels perpendicular to confused spectra to be considered potential confuser",8,0,1024),ParRange("min_pntsrc_counts","r","0th order counts limit for field source to be considered as point source confuser.",5,0,None),ParRange("min_spec_counts","r","Min 0th order counts required to calculate confusion for subset/single src.",3,0,None),ParRange("min_spec_confuser_counts","r","0th order counts limit for field source to be considered as spectral confuser.",50,0,None),ParRange("osip_frac","r","Fraction of the OSIP window to use in spectral intersection calculation.",1.0,0.001,1.0),ParRange("spec_confuse_limit","r","Fraction of dispersed counts allowed in a spectral confusion region before flagging as confused.", 0.1,0,None),ParRange("max_arm_dist","r","Max distance in pixels perpendicular to confused spectra to be considered potential arm confuser.",8,0,1024),ParRange("min_arm_counts","r","Min number of 0th order counts before a field source is considered a potential arm confuser.",50,0,None),ParRange("arm_nsig","r","Approx for OSIP range for arm confusion. Higher values will ignore more of spectrum for arm confusion.",6.0,0,None),ParRange("arm_confuse_limit","r","Fraction of events allowed in arm confusion regions before flagging as confusion.",0.1,0,None),ParRange("meg_cutoff_low","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",1.0,0,40),ParRange("meg_cutoff_high","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",32.0,0,40),ParRange("heg_cutoff_low","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",1.0,0,40),ParRange("heg_cutoff_high","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",16.0,0,40),ParRange("highest_order","i","Determines which orders are included in the confusion calculations. '3' includes all orders.",3,1,3),ParValue("min_tg_d","r","Lower bound of spectral extraction in cross-dispersion direction in degrees.",-6.6e-04),ParValue("max_tg_d","r","Upper bound of spectral extraction in cross-dispersion direction in degrees.",6.6e-04)],
-    }
 
+    parinfo['create_bkg_map'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("fovfile","f","Input fov file",None),ParValue("expmap","f","Input exposure map",None),ParValue("outfile","f","Output background image",None),ParValue("xygrid","s","Exposure map grid syntax x0:x1:#nx,x0:x1:ny",None)]',
+        'opt': '[ParValue("outimgfile","f","Output image file",None),ParValue("outstreakmap","f","Output streak map file",None),ParValue("outlowfreqmap","f","Output low frequency map file",None),ParValue("tmpdir","s","Directory for temp. files",\'${ASCDS_WORK_PATH}\'),ParValue("expcorr","b","Is final background exposure corrected?",True),ParRange("scale","i","scale in pixels for dmimgpm",64,0,None),ParValue("smoothing_kernel","s","Smoothing kernel for HRC data",\'lib:tophat(2,1,3,3)\'),ParValue("clobber","b","Clobber existing output?",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['csmooth'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input file name",None),ParValue("sclmap","f","image of user-supplied map of smoothing scales",None),ParValue("outfile","f","output file name",None),ParValue("outsigfile","f","output significance image",'.'),ParValue("outsclfile","f","output scales [kernel sizes] image",'.'),ParSet("conmeth","s","Convolution method.",'fft',["slide","fft"]),ParSet("conkerneltype","s","Convolution kernel type.",'gauss',["gauss","tophat"]),ParValue("sigmin","r","minimal significance, S/N ratio",4),ParRange("sigmax","r","maximal significance, S/N ratio",5,")sigmin",None),ParValue("sclmin","r","initial (minimal) smoothing scale [pixel]",None),ParRange("sclmax","r","maximal smoothing scale [pixel]",None,")sclmin",None),ParSet("sclmode","s","compute smoothing scales or user user-supplied map",'compute',["compute","user"])],
-    'opt': [ParValue("stepzero","r","initial stepsize",0.01),ParSet("bkgmode","s","background treatment",'local',["local","user"]),ParValue("bkgmap","f","user-supplied input background image",None),ParValue("bkgerr","f","user-supplied input background error image",None),ParValue("clobber","b","clobber existing output",False),ParRange("verbose","i","verbosity of processing comments",0,0,5)],
-    }
 
+    parinfo['crisscross'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","An evt2 file (or stack) which includes the sources in main_list and subset_src_list.",None),ParValue("outdir","f","Output directory that will be created to hold confusion table output.",None),ParValue("main_list","f","A fits/ascii/tsv file which includes columns RA, DEC, and ID of all X-ray sources in evt2 file.",None),ParValue("subset_src_list","f","A fits/ascii/tsv file with columns RA, DEC for sources to calculate confusion. Leave empty when calculating single source with single_src_pos",None),ParValue("wavdetect_file","f","wavdetect output source list. If None, CrissCross will create one.",\'None\'),ParRange("verbose","i","Verbosity level",1,0,5),ParValue("clobber","b","OK to overwrite existing output file?",False)]',
+        'opt': '[ParValue("single_src_pos","s","To calc confusion for only a single source include RA,DEC in deg, e.g. (83.818,-5.389).",\'None\'),ParValue("single_src_root","s","Root name for output confusion table of single_src_pos",\'None\'),ParValue("conf_table_level","s","Output to be saved to confusion table. Can be \'confused\', \'warn\', or \'clean\'.",\'confused\'),ParValue("arf_ratios_dir","s","Path to ARF ratio fits tables.",\'$ASCDS_CALIB\'),ParRange("max_pntsrc_dist","r","Max distance in pixels perpendicular to confused spectra to be considered potential confuser",8,0,1024),ParRange("min_pntsrc_counts","r","0th order counts limit for field source to be considered as point source confuser.",5,0,None),ParRange("min_spec_counts","r","Min 0th order counts required to calculate confusion for subset/single src.",3,0,None),ParRange("min_spec_confuser_counts","r","0th order counts limit for field source to be considered as spectral confuser.",50,0,None),ParRange("osip_frac","r","Fraction of the OSIP window to use in spectral intersection calculation.",1.0,0.001,1.0),ParRange("spec_confuse_limit","r","Fraction of dispersed counts allowed in a spectral confusion region before flagging as confused.", 0.1,0,None),ParRange("max_arm_dist","r","Max distance in pixels perpendicular to confused spectra to be considered potential arm confuser.",8,0,1024),ParRange("min_arm_counts","r","Min number of 0th order counts before a field source is considered a potential arm confuser.",50,0,None),ParRange("arm_nsig","r","Approx for OSIP range for arm confusion. Higher values will ignore more of spectrum for arm confusion.",6.0,0,None),ParRange("arm_confuse_limit","r","Fraction of events allowed in arm confusion regions before flagging as confusion.",0.1,0,None),ParRange("meg_cutoff_low","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",1.0,0,40),ParRange("meg_cutoff_high","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",32.0,0,40),ParRange("heg_cutoff_low","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",1.0,0,40),ParRange("heg_cutoff_high","r","MEG wavelength boundaries for all confusion calculations in Ang. Confusion not calc outside bounds.",16.0,0,40),ParRange("highest_order","i","Determines which orders are included in the confusion calculations. \'3\' includes all orders.",3,1,3),ParValue("min_tg_d","r","Lower bound of spectral extraction in cross-dispersion direction in degrees.",-6.6e-04),ParValue("max_tg_d","r","Upper bound of spectral extraction in cross-dispersion direction in degrees.",6.6e-04)]',
+        }
 
-parinfo['dax'] = {
-    'istool': False,
-    'req': [],
-    'opt': [ParValue("outdir","f","Location of the output files for dax",'${ASCDS_WORK_PATH}/ds9_dax.${USER}'),ParValue("tile","b","Change ds9 into tile mode when adding new images?",False),ParValue("progress_bar","b","Show progress bar when tasks are running?",True),ParValue("random_seed","i","Random seed for any tasks the require one",-1),ParValue("prism","b","Launch prism to view output tables?",False),ParValue("lc_binsize","r","Interative lightcurve bin size (sec)",1000),ParSet("grptype","s","Grouping type",'NUM_CTS',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE","ADAPTIVE_SNR","BIN_WIDTH","MIN_SLOPE","MAX_SLOPE","BIN_FILE"]),ParValue("grpval","r","Grouping type value",1),ParValue("grpbin","s","Binning specification",None)],
-    }
 
+    parinfo['csmooth'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input file name",None),ParValue("sclmap","f","image of user-supplied map of smoothing scales",None),ParValue("outfile","f","output file name",None),ParValue("outsigfile","f","output significance image",\'.\'),ParValue("outsclfile","f","output scales [kernel sizes] image",\'.\'),ParSet("conmeth","s","Convolution method.",\'fft\',["slide","fft"]),ParSet("conkerneltype","s","Convolution kernel type.",\'gauss\',["gauss","tophat"]),ParValue("sigmin","r","minimal significance, S/N ratio",4),ParRange("sigmax","r","maximal significance, S/N ratio",5,")sigmin",None),ParValue("sclmin","r","initial (minimal) smoothing scale [pixel]",None),ParRange("sclmax","r","maximal smoothing scale [pixel]",None,")sclmin",None),ParSet("sclmode","s","compute smoothing scales or user user-supplied map",\'compute\',["compute","user"])]',
+        'opt': '[ParValue("stepzero","r","initial stepsize",0.01),ParSet("bkgmode","s","background treatment",\'local\',["local","user"]),ParValue("bkgmap","f","user-supplied input background image",None),ParValue("bkgerr","f","user-supplied input background error image",None),ParValue("clobber","b","clobber existing output",False),ParRange("verbose","i","verbosity of processing comments",0,0,5)]',
+        }
 
-parinfo['deflare'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input light curve file",None),ParValue("outfile","f","Output GTI file",None),ParSet("method","s","Choose flare-cleaning method",'clean',["clean","sigma"])],
-    'opt': [ParValue("nsigma","r","method=clean 'clip', method=sigma: no. of sigma about the mean to use to clip data",3),ParValue("plot","b","Plot light curve and histograms of values?",False),ParValue("save","f","PostScript file to save plot as?",None),ParSet("rateaxis","s","Should count-rate be on 'y' or 'x' axis of top plot?",'y',["x","y"]),ParSet("pattern","s","Pattern to use in plot for filled regions representing excluded time intervals",'solid',["nofill","solid","updiagonal","downdiagonal","horizontal","vertical","crisscross","grid","polkadot"]),ParValue("good_color","s","Color to use in plot to draw 'good' data points",'lime'),ParValue("exclude_color","s","Color to use in plot for excluded time intervals",'red'),ParValue("minlength","r","lc_sigma_clip: min. no. of consecutive time bins which must pass rate filter",3),ParValue("mean","r","lc_clean: mean count rate (ct/s)",0),ParValue("stddev","r","lc_clean 'sigma': standard deviation of signal",0),ParValue("scale","r","lc_clean: scale factor about the mean rate",1.2),ParValue("minfrac","r","lc_clean: minimum fraction of good bins",0.1),ParRange("verbose","i","Debug level",1,0,5)],
-    }
 
+    parinfo['dax'] = {
+        'istool': False,
+        'req': '[]',
+        'opt': '[ParValue("outdir","f","Location of the output files for dax",\'${ASCDS_WORK_PATH}/ds9_dax.${USER}\'),ParValue("tile","b","Change ds9 into tile mode when adding new images?",False),ParValue("progress_bar","b","Show progress bar when tasks are running?",True),ParValue("random_seed","i","Random seed for any tasks the require one",-1),ParValue("prism","b","Launch prism to view output tables?",False),ParValue("lc_binsize","r","Interative lightcurve bin size (sec)",1000),ParSet("grptype","s","Grouping type",\'NUM_CTS\',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE","ADAPTIVE_SNR","BIN_WIDTH","MIN_SLOPE","MAX_SLOPE","BIN_FILE"]),ParValue("grpval","r","Grouping type value",1),ParValue("grpbin","s","Binning specification",None)]',
+        }
 
-parinfo['destreak'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None)],
-    'opt': [ParValue("max","s","streak threshold  syntax:  m  OR  m:m:m:m",None),ParRange("max_rowloss_fraction","r","Maximum fraction of avg streaks/node/frame",5.0e-5,0.3e-4,1),ParValue("num_sigma","r","Sigma value for determining streak threshold",1.0),ParValue("filter","b","Discard tagged events",True),ParValue("mask","s","Filter to select candidate streak events",'[status=0,grade=0,2:4,6]'),ParValue("ccd_id","s","CCD ID to filter",'8'),ParValue("ccd_col","s","CCD ID column name",'ccd_id'),ParValue("node_col","s","Node ID column name ('none' for single node)",'node_id'),ParValue("exptime","r","frame time (s) (reads EXPTIME if no pos. value given)",-1),ParValue("countfile","f","filename for event row-count distribution",None),ParValue("fracfile","f","filename for cumulative streak contam function",None),ParValue("timefile","f","filename for exposure time lost per row",None),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['deflare'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input light curve file",None),ParValue("outfile","f","Output GTI file",None),ParSet("method","s","Choose flare-cleaning method",\'clean\',["clean","sigma"])]',
+        'opt': '[ParValue("nsigma","r","method=clean \'clip\', method=sigma: no. of sigma about the mean to use to clip data",3),ParValue("plot","b","Plot light curve and histograms of values?",False),ParValue("save","f","PostScript file to save plot as?",None),ParSet("rateaxis","s","Should count-rate be on \'y\' or \'x\' axis of top plot?",\'y\',["x","y"]),ParSet("pattern","s","Pattern to use in plot for filled regions representing excluded time intervals",\'solid\',["nofill","solid","updiagonal","downdiagonal","horizontal","vertical","crisscross","grid","polkadot"]),ParValue("good_color","s","Color to use in plot to draw \'good\' data points",\'lime\'),ParValue("exclude_color","s","Color to use in plot for excluded time intervals",\'red\'),ParValue("minlength","r","lc_sigma_clip: min. no. of consecutive time bins which must pass rate filter",3),ParValue("mean","r","lc_clean: mean count rate (ct/s)",0),ParValue("stddev","r","lc_clean \'sigma\': standard deviation of signal",0),ParValue("scale","r","lc_clean: scale factor about the mean rate",1.2),ParValue("minfrac","r","lc_clean: minimum fraction of good bins",0.1),ParRange("verbose","i","Debug level",1,0,5)]',
+        }
 
-parinfo['detilt'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input L2 HRC-S/LETG event list file",None),ParValue("outfile","f","Output file",None),ParValue("tilt","r","residual dispersion angle (deg/Ang)",0)],
-    'opt': [ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)],
-    }
 
+    parinfo['destreak'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None)]',
+        'opt': '[ParValue("max","s","streak threshold  syntax:  m  OR  m:m:m:m",None),ParRange("max_rowloss_fraction","r","Maximum fraction of avg streaks/node/frame",5.0e-5,0.3e-4,1),ParValue("num_sigma","r","Sigma value for determining streak threshold",1.0),ParValue("filter","b","Discard tagged events",True),ParValue("mask","s","Filter to select candidate streak events",\'[status=0,grade=0,2:4,6]\'),ParValue("ccd_id","s","CCD ID to filter",\'8\'),ParValue("ccd_col","s","CCD ID column name",\'ccd_id\'),ParValue("node_col","s","Node ID column name (\'none\' for single node)",\'node_id\'),ParValue("exptime","r","frame time (s) (reads EXPTIME if no pos. value given)",-1),ParValue("countfile","f","filename for event row-count distribution",None),ParValue("fracfile","f","filename for cumulative streak contam function",None),ParValue("timefile","f","filename for exposure time lost per row",None),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['dewiggle'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input L2 HRC-S/LETG event list file",None),ParValue("outfile","f","Output file",None)],
-    'opt': [ParValue("wfile","f","Wiggle correction file",'${ASCDS_CONTRIB}/data/wigglecorrection.dat'),ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)],
-    }
 
+    parinfo['detilt'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input L2 HRC-S/LETG event list file",None),ParValue("outfile","f","Output file",None),ParValue("tilt","r","residual dispersion angle (deg/Ang)",0)]',
+        'opt': '[ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)]',
+        }
 
-parinfo['dither_region'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input aspect solution or histogram file(s)",None),ParValue("region","s","Region specification",None),ParValue("outfile","f","Output file name",None),ParValue("wcsfile","f","WCS File",None)],
-    'opt': [ParValue("maskfile","f","Mask file",None),ParValue("psffile","f","PSF Image file",None),ParValue("gtifile","f","GTI File",None),ParValue("dtffile","f","DTF File",None),ParValue("imapfile","f","Stack of Instrument files",None),ParValue("tolerance","r","Tolerance of aspect solution [arcsec]",None),ParRange("resolution","r","Binning resolution of region [pixels]",1,0,None),ParRange("maxpix","i","Maximum number of pixels regardless of resolution",1000,1,None),ParValue("convex","b","Use convex hull around aspect histogram?",False),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("ardlibpar","f","Parameter file for ARDLIB files",'ardlib'),ParValue("detsubsysmod","s","Detector sybsystem modifier",None),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Remove outfile if it already exists",False)],
-    }
 
+    parinfo['dewiggle'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input L2 HRC-S/LETG event list file",None),ParValue("outfile","f","Output file",None)]',
+        'opt': '[ParValue("wfile","f","Wiggle correction file",\'${ASCDS_CONTRIB}/data/wigglecorrection.dat\'),ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)]',
+        }
 
-parinfo['dmappend'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset name",None)],
-    'opt': [ParRange("verbose","i","Debug Level",0,0,5)],
-    }
 
+    parinfo['dither_region'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input aspect solution or histogram file(s)",None),ParValue("region","s","Region specification",None),ParValue("outfile","f","Output file name",None),ParValue("wcsfile","f","WCS File",None)]',
+        'opt': '[ParValue("maskfile","f","Mask file",None),ParValue("psffile","f","PSF Image file",None),ParValue("gtifile","f","GTI File",None),ParValue("dtffile","f","DTF File",None),ParValue("imapfile","f","Stack of Instrument files",None),ParValue("tolerance","r","Tolerance of aspect solution [arcsec]",None),ParRange("resolution","r","Binning resolution of region [pixels]",1,0,None),ParRange("maxpix","i","Maximum number of pixels regardless of resolution",1000,1,None),ParValue("convex","b","Use convex hull around aspect histogram?",False),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("ardlibpar","f","Parameter file for ARDLIB files",\'ardlib\'),ParValue("detsubsysmod","s","Detector sybsystem modifier",None),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Remove outfile if it already exists",False)]',
+        }
 
-parinfo['dmarfadd'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input list of files",None),ParValue("outfile","f","Output dataset name",None)],
-    'opt': [ParValue("clobber","b","Clobber existing output?",False),ParRange("verbose","i","Debug Level",0,0,5)],
-    }
 
+    parinfo['dmappend'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset name",None)]',
+        'opt': '[ParRange("verbose","i","Debug Level",0,0,5)]',
+        }
 
-parinfo['dmcontour'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("levels","s","Contour levels",None),ParValue("outfile","f","Output contour region file name",None)],
-    'opt': [ParRange("verbose","i","Amount of verbose output sent to the screen",0,0,5),ParValue("clobber","b","Remove output file if already exists",False)],
-    }
 
+    parinfo['dmarfadd'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input list of files",None),ParValue("outfile","f","Output dataset name",None)]',
+        'opt': '[ParValue("clobber","b","Clobber existing output?",False),ParRange("verbose","i","Debug Level",0,0,5)]',
+        }
 
-parinfo['dmcoords'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None)],
-    'opt': [ParValue("asolfile","f","Input aspect solution file",'none'),ParValue("option","s","Conversion option",None),ParRange("chip_id","i","Chip ID number",None,0,9),ParValue("chipx","r","Chip X [pixel]",None),ParValue("chipy","r","Chip Y [pixel]",None),ParValue("tdetx","r","TDETX [pixel]",None),ParValue("tdety","r","TDETY [pixel]",None),ParValue("detx","r","FPC X [pixel]",None),ParValue("dety","r","FPC Y [pixel]",None),ParValue("x","r","Sky X [pixel]",None),ParValue("y","r","Sky Y [pixel]",None),ParValue("logicalx","r","X coordinate in binned image [pixel]",None),ParValue("logicaly","r","Y coordinate in binned image [pixel]",None),ParValue("ra","s","RA [deg or hh:mm:ss]",None),ParValue("dec","s","Dec [deg or dd:mm:ss]",None),ParRange("theta","r","Off axis angle [arcmin]",None,0,10800),ParRange("phi","r","Azimuthal angle [deg]",None,0,360),ParValue("order","i","Grating order",0),ParValue("energy","r","Energy [keV]",1.0),ParValue("wavelength","r","Wavelength [A]",0),ParValue("ra_zo","s","RA of zero order",None),ParValue("dec_zo","s","Dec of zero order",None),ParValue("celfmt","s","RA and Dec format [deg or hms] (xx.xx or xx:xx:xx.x)",'hms'),ParValue("detector","s","Detector (ACIS or HRC-I or HRC-S)",None),ParValue("grating","s","Grating",None),ParValue("fpsys","s","FP convention",None),ParValue("sim","s","SIM position (eg 0.0 0.0 -190.6)",None),ParValue("displace","s","STF displacement (X,Y,Z,AX,AY,AZ)",None),ParValue("ra_nom","s","Nominal pointing RA [deg or hh:mm:ss]",None),ParValue("dec_nom","s","Nominal dec [deg or dd:mm:ss]",None),ParValue("roll_nom","s","Nominal roll [deg]",None),ParValue("ra_asp","s","Instantaneous pointing RA [deg]",None),ParValue("dec_asp","s","Instantaneous pointing Dec [deg]",None),ParValue("roll_asp","s","Instantaneous Aspect roll [deg]",None),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Debug Level",0,0,5)],
-    }
 
+    parinfo['dmcontour'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("levels","s","Contour levels",None),ParValue("outfile","f","Output contour region file name",None)]',
+        'opt': '[ParRange("verbose","i","Amount of verbose output sent to the screen",0,0,5),ParValue("clobber","b","Remove output file if already exists",False)]',
+        }
 
-parinfo['dmcopy'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset name",None)],
-    'opt': [ParValue("kernel","s","Output file format type",'default'),ParValue("option","s","Option - force output type",None),ParRange("verbose","i","Debug Level",0,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['dmcoords'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None)]',
+        'opt': '[ParValue("asolfile","f","Input aspect solution file",\'none\'),ParValue("option","s","Conversion option",None),ParRange("chip_id","i","Chip ID number",None,0,9),ParValue("chipx","r","Chip X [pixel]",None),ParValue("chipy","r","Chip Y [pixel]",None),ParValue("tdetx","r","TDETX [pixel]",None),ParValue("tdety","r","TDETY [pixel]",None),ParValue("detx","r","FPC X [pixel]",None),ParValue("dety","r","FPC Y [pixel]",None),ParValue("x","r","Sky X [pixel]",None),ParValue("y","r","Sky Y [pixel]",None),ParValue("logicalx","r","X coordinate in binned image [pixel]",None),ParValue("logicaly","r","Y coordinate in binned image [pixel]",None),ParValue("ra","s","RA [deg or hh:mm:ss]",None),ParValue("dec","s","Dec [deg or dd:mm:ss]",None),ParRange("theta","r","Off axis angle [arcmin]",None,0,10800),ParRange("phi","r","Azimuthal angle [deg]",None,0,360),ParValue("order","i","Grating order",0),ParValue("energy","r","Energy [keV]",1.0),ParValue("wavelength","r","Wavelength [A]",0),ParValue("ra_zo","s","RA of zero order",None),ParValue("dec_zo","s","Dec of zero order",None),ParValue("celfmt","s","RA and Dec format [deg or hms] (xx.xx or xx:xx:xx.x)",\'hms\'),ParValue("detector","s","Detector (ACIS or HRC-I or HRC-S)",None),ParValue("grating","s","Grating",None),ParValue("fpsys","s","FP convention",None),ParValue("sim","s","SIM position (eg 0.0 0.0 -190.6)",None),ParValue("displace","s","STF displacement (X,Y,Z,AX,AY,AZ)",None),ParValue("ra_nom","s","Nominal pointing RA [deg or hh:mm:ss]",None),ParValue("dec_nom","s","Nominal dec [deg or dd:mm:ss]",None),ParValue("roll_nom","s","Nominal roll [deg]",None),ParValue("ra_asp","s","Instantaneous pointing RA [deg]",None),ParValue("dec_asp","s","Instantaneous pointing Dec [deg]",None),ParValue("roll_asp","s","Instantaneous Aspect roll [deg]",None),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Debug Level",0,0,5)]',
+        }
 
-parinfo['dmdiff'] = {
-    'istool': True,
-    'req': [ParValue("infile1","f","1st input file name",None),ParValue("infile2","f","2nd input file name",None)],
-    'opt': [ParValue("outfile","f","Output file name (NONE|none|stdout|stderr|<filename>)",None),ParValue("tolfile","f","Tolerance file name",None),ParValue("keys","b","Check header keywords?",True),ParValue("data","b","Check table or image data?",True),ParValue("subspaces","b","Check subspaces?",True),ParValue("units","b","Check units?",True),ParValue("comments","b","Check comments?",True),ParValue("wcs","b","Check wcs?",True),ParValue("missing","b","Check for missing header keys?",True),ParValue("error_on_value","b","Return error when values are different?",True),ParValue("error_on_comment","b","Return error when comments are different?",True),ParValue("error_on_unit","b","Return error when units are different?",True),ParValue("error_on_range","b","Return error when out of tolfile range?",True),ParValue("error_on_datatype","b","Return error when datatypes are different?",True),ParValue("error_on_wcs","b","Return error when wcs's are different?",True),ParValue("error_on_subspace","b","Return error when subspaces are different?",True),ParValue("error_on_missing","b","Return error when header key is missing?",True),ParRange("verbose","i","Debug Level(0-5)",1,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['dmcopy'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset name",None)]',
+        'opt': '[ParValue("kernel","s","Output file format type",\'default\'),ParValue("option","s","Option - force output type",None),ParRange("verbose","i","Debug Level",0,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['dmellipse'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file",None),ParValue("outfile","f","Output region file",None),ParValue("fraction","s","Ellipse at what fraction(s)",None)],
-    'opt': [ParSet("shape","s","Shape of region",'ellipse',["ellipse","rotbox"]),ParValue("x_centroid","r","Default X-centroid to use (physical coords)",None),ParValue("y_centroid","r","Default Y-centroid to use (physical coords)",None),ParValue("angle","r","Default angle [deg]",None),ParValue("ellipticity","r","Default ellipticity",None),ParValue("xcol","s","X column name from input table",None),ParValue("ycol","s","Y column name from input table",None),ParValue("zcol","s","Optional Z column name from input table",None),ParValue("fix_centroid","b","Fix centroid?",False),ParValue("fix_angle","b","Fix angle?",False),ParValue("fix_ellipticity","b","Fix ellipticity?",False),ParRange("tolerance","r","Tolerance on fraction",0.001,0,1),ParRange("minstep","r","Minimum step size [pixels]",0.001,0,1),ParRange("maxwalk","i","Maximum number of equal-fraction walks",10,1,None),ParRange("step","r","Initial step size [pixels]",1,0,None),ParValue("normalize","b","Normalize by sum of pixels",True),ParValue("clobber","b","Remove outfile if it exists",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['dmdiff'] = {
+        'istool': True,
+        'req': '[ParValue("infile1","f","1st input file name",None),ParValue("infile2","f","2nd input file name",None)]',
+        'opt': '[ParValue("outfile","f","Output file name (NONE|none|stdout|stderr|<filename>)",None),ParValue("tolfile","f","Tolerance file name",None),ParValue("keys","b","Check header keywords?",True),ParValue("data","b","Check table or image data?",True),ParValue("subspaces","b","Check subspaces?",True),ParValue("units","b","Check units?",True),ParValue("comments","b","Check comments?",True),ParValue("wcs","b","Check wcs?",True),ParValue("missing","b","Check for missing header keys?",True),ParValue("error_on_value","b","Return error when values are different?",True),ParValue("error_on_comment","b","Return error when comments are different?",True),ParValue("error_on_unit","b","Return error when units are different?",True),ParValue("error_on_range","b","Return error when out of tolfile range?",True),ParValue("error_on_datatype","b","Return error when datatypes are different?",True),ParValue("error_on_wcs","b","Return error when wcs\'s are different?",True),ParValue("error_on_subspace","b","Return error when subspaces are different?",True),ParValue("error_on_missing","b","Return error when header key is missing?",True),ParRange("verbose","i","Debug Level(0-5)",1,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['dmextract'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outfile","f","Enter output file name",None)],
-    'opt': [ParValue("bkg","f","Background region file or fixed background (counts/pixel/s) subtraction",None),ParValue("error","s","Method for error determination(gaussian|gehrels|<variance file>)",'gaussian'),ParValue("bkgerror","s","Method for background error determination(gaussian|gehrels|<variance file>)",'gaussian'),ParValue("bkgnorm","r","Background normalization",1.0),ParValue("exp","f","Exposure map image file",None),ParValue("bkgexp","f","Background exposure map image file",None),ParValue("sys_err","r","Fixed systematic error value for SYS_ERR keyword",0),ParSet("opt","s","Output file type",'pha1',["pha1","pha2","ltc1","ltc2","generic","generic2"]),ParValue("defaults","f","Instrument defaults file",'${ASCDS_CALIB}/cxo.mdb'),ParValue("wmap","s","WMAP filter/binning (e.g. det=8 or default)",None),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['dmellipse'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file",None),ParValue("outfile","f","Output region file",None),ParValue("fraction","s","Ellipse at what fraction(s)",None)]',
+        'opt': '[ParSet("shape","s","Shape of region",\'ellipse\',["ellipse","rotbox"]),ParValue("x_centroid","r","Default X-centroid to use (physical coords)",None),ParValue("y_centroid","r","Default Y-centroid to use (physical coords)",None),ParValue("angle","r","Default angle [deg]",None),ParValue("ellipticity","r","Default ellipticity",None),ParValue("xcol","s","X column name from input table",None),ParValue("ycol","s","Y column name from input table",None),ParValue("zcol","s","Optional Z column name from input table",None),ParValue("fix_centroid","b","Fix centroid?",False),ParValue("fix_angle","b","Fix angle?",False),ParValue("fix_ellipticity","b","Fix ellipticity?",False),ParRange("tolerance","r","Tolerance on fraction",0.001,0,1),ParRange("minstep","r","Minimum step size [pixels]",0.001,0,1),ParRange("maxwalk","i","Maximum number of equal-fraction walks",10,1,None),ParRange("step","r","Initial step size [pixels]",1,0,None),ParValue("normalize","b","Normalize by sum of pixels",True),ParValue("clobber","b","Remove outfile if it exists",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['dmfilth'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file",None),ParValue("outfile","f","Enter output file name",None),ParSet("method","s","Interpolation method",'GLOBAL',["POLY","DIST","GLOBAL","POISSON","BILINT"]),ParValue("srclist","s","List of sources to fill in",None),ParValue("bkglist","s","List of background regions",None)],
-    'opt': [ParRange("randseed","i","Seed for random number generator",1,0,65536),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['dmextract'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outfile","f","Enter output file name",None)]',
+        'opt': '[ParValue("bkg","f","Background region file or fixed background (counts/pixel/s) subtraction",None),ParValue("error","s","Method for error determination(gaussian|gehrels|<variance file>)",\'gaussian\'),ParValue("bkgerror","s","Method for background error determination(gaussian|gehrels|<variance file>)",\'gaussian\'),ParValue("bkgnorm","r","Background normalization",1.0),ParValue("exp","f","Exposure map image file",None),ParValue("bkgexp","f","Background exposure map image file",None),ParValue("sys_err","r","Fixed systematic error value for SYS_ERR keyword",0),ParSet("opt","s","Output file type",\'pha1\',["pha1","pha2","ltc1","ltc2","generic","generic2"]),ParValue("defaults","f","Instrument defaults file",\'${ASCDS_CALIB}/cxo.mdb\'),ParValue("wmap","s","WMAP filter/binning (e.g. det=8 or default)",None),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['dmgroup'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset name",None),ParValue("outfile","f","Output dataset name",None),ParSet("grouptype","s","Grouping type",'NONE',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE","ADAPTIVE_SNR","BIN_WIDTH","MIN_SLOPE","MAX_SLOPE","BIN_FILE"]),ParValue("grouptypeval","r","Grouping type value",0),ParValue("binspec","s","Binning specification",None),ParValue("xcolumn","s","Name of x-axis",None),ParValue("ycolumn","s","Name of y-axis",None)],
-    'opt': [ParValue("tabspec","s","Tab specification",None),ParValue("tabcolumn","s","Name of tab column",None),ParValue("stopspec","s","Stop specification",None),ParValue("stopcolumn","s","Name of stop column",None),ParValue("errcolumn","s","Name of error column",None),ParValue("clobber","b","Clobber existing output file?",False),ParRange("verbose","i","Verbosity level",0,0,5),ParRange("maxlength","r","Maximum size of groups (in channels)",0,0,None)],
-    }
 
+    parinfo['dmfilth'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file",None),ParValue("outfile","f","Enter output file name",None),ParSet("method","s","Interpolation method",\'GLOBAL\',["POLY","DIST","GLOBAL","POISSON","BILINT"]),ParValue("srclist","s","List of sources to fill in",None),ParValue("bkglist","s","List of background regions",None)]',
+        'opt': '[ParRange("randseed","i","Seed for random number generator",1,0,65536),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['dmgroupreg'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","DS9 region input file",None),ParValue("srcoutfile","f","Output file for CIAO source regions",None),ParValue("bkgoutfile","f","Output file for CIAO background regions",None)],
-    'opt': [ParValue("exclude","b","Explicitly exclude source regions from background regions?",True),ParRange("verbose","i","Debug Level (0-5)",0,0,5),ParValue("clobber","b","Clobber existing files?",False)],
-    }
 
+    parinfo['dmgroup'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset name",None),ParValue("outfile","f","Output dataset name",None),ParSet("grouptype","s","Grouping type",\'NONE\',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE","ADAPTIVE_SNR","BIN_WIDTH","MIN_SLOPE","MAX_SLOPE","BIN_FILE"]),ParValue("grouptypeval","r","Grouping type value",0),ParValue("binspec","s","Binning specification",None),ParValue("xcolumn","s","Name of x-axis",None),ParValue("ycolumn","s","Name of y-axis",None)]',
+        'opt': '[ParValue("tabspec","s","Tab specification",None),ParValue("tabcolumn","s","Name of tab column",None),ParValue("stopspec","s","Stop specification",None),ParValue("stopcolumn","s","Name of stop column",None),ParValue("errcolumn","s","Name of error column",None),ParValue("clobber","b","Clobber existing output file?",False),ParRange("verbose","i","Verbosity level",0,0,5),ParRange("maxlength","r","Maximum size of groups (in channels)",0,0,None)]',
+        }
 
-parinfo['dmgti'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input MTL file",None),ParValue("outfile","f","Output GTI file",None),ParValue("userlimit","s","User defined limit string",None)],
-    'opt': [ParValue("mtlfile","f","Optional output smoothed/filtered MTL file",'none'),ParValue("lkupfile","f","Lookup table defining which MTL columns to check against (NONE|none|<filename>)",'none'),ParValue("smooth","b","Smooth the input MTL data?",True),ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['dmgroupreg'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","DS9 region input file",None),ParValue("srcoutfile","f","Output file for CIAO source regions",None),ParValue("bkgoutfile","f","Output file for CIAO background regions",None)]',
+        'opt': '[ParValue("exclude","b","Explicitly exclude source regions from background regions?",True),ParRange("verbose","i","Debug Level (0-5)",0,0,5),ParValue("clobber","b","Clobber existing files?",False)]',
+        }
 
-parinfo['dmhedit'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("filelist","f","Edit list file name",None),ParValue("operation","s","Operation",None),ParValue("key","s","Keyword",None),ParValue("value","s","Value for keyword",None)],
-    'opt': [ParSet("datatype","s","Keyword data type",'indef',["string","double","float","long","short","ulong","ushort","boolean","indef"]),ParValue("unit","s","Unit for keyword",None),ParValue("comment","s","Comment for keyword",None),ParRange("verbose","i","Verbosity Level(0-5)",0,0,5)],
-    }
 
+    parinfo['dmgti'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input MTL file",None),ParValue("outfile","f","Output GTI file",None),ParValue("userlimit","s","User defined limit string",None)]',
+        'opt': '[ParValue("mtlfile","f","Optional output smoothed/filtered MTL file",\'none\'),ParValue("lkupfile","f","Lookup table defining which MTL columns to check against (NONE|none|<filename>)",\'none\'),ParValue("smooth","b","Smooth the input MTL data?",True),ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['dmhistory'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file to get history from",None),ParValue("tool","s","Tool name to extract history",None)],
-    'opt': [ParValue("outfile","f","Output file [stdout|stderr|FILENAME]",'stdout'),ParValue("expand","b","Replace stacks in output string?",True),ParSet("action","s","What to do with history",'get',["get","put","pset"]),ParValue("clobber","b","Remove output file if it exists?",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['dmhedit'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("filelist","f","Edit list file name",None),ParValue("operation","s","Operation",None),ParValue("key","s","Keyword",None),ParValue("value","s","Value for keyword",None)]',
+        'opt': '[ParSet("datatype","s","Keyword data type",\'indef\',["string","double","float","long","short","ulong","ushort","boolean","indef"]),ParValue("unit","s","Unit for keyword",None),ParValue("comment","s","Comment for keyword",None),ParRange("verbose","i","Verbosity Level(0-5)",0,0,5)]',
+        }
 
-parinfo['dmimg2jpg'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name (red image if true color)",None),ParValue("greenfile","f","Green color channel file name",'none'),ParValue("bluefile","f","Blue color channel file name",'none'),ParValue("outfile","f","Output jpg file name",None)],
-    'opt': [ParValue("lutfile","f","Colormap file",')lut.grey'),ParValue("colorstretch","r","Color lookup strech factor",1),ParValue("colorshift","i","Color lookup table shift",0),ParValue("invert","b","Invert colors",False),ParSet("scalefunction","s","Scaling function",'log',["log","linear","power","asinh"]),ParValue("scaleparam","r","Scaling parameter (for non-linear scalefunction)",3),ParValue("minred","r","Minimum value for the red color channel",None),ParValue("mingreen","r","Minimum value for the green color channel",None),ParValue("minblue","r","Minimum value for the blue color channel",None),ParValue("maxred","r","Maximum value for the red color channel",None),ParValue("maxgreen","r","Maximum value for the green color channel",None),ParValue("maxblue","r","Maximum value for the blue color channel",None),ParValue("regionfile","f","Region overlay file",None),ParValue("regioncolor","s","Region color triple",')colors.green'),ParSet("regionopt","s","Option of region shape drawing method (individal|combine)",'individual',["individual","combine"]),ParValue("showaimpoint","b","Put crosshair at aimpoint",False),ParValue("showlabel","b","Label the contours?",False),ParValue("showgrid","b","Show grid on image",False),ParValue("gridcolor","s","Grid color triple",')colors.white'),ParValue("gridsize","r","Gridsize [arcsec]",120),ParRange("fontsize","i","Font label size",2,1,3),ParValue("psfile","f","Optional post script file name",None),ParRange("verbose","i","Level of verbose output",0,0,5),ParValue("clobber","b","Clobber existing outputs?",False)],
-    }
 
+    parinfo['dmhistory'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file to get history from",None),ParValue("tool","s","Tool name to extract history",None)]',
+        'opt': '[ParValue("outfile","f","Output file [stdout|stderr|FILENAME]",\'stdout\'),ParValue("expand","b","Replace stacks in output string?",True),ParSet("action","s","What to do with history",\'get\',["get","put","pset"]),ParValue("clobber","b","Remove output file if it exists?",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['dmimgadapt'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParSet("function","s","Filter function",'tophat',["tophat","box","gaussian","cone","pyramid","walrewop","exp","lor","mex","hemisphere","quad"]),ParRange("minrad","r","Min. radius/scale",0.5,0,None),ParRange("maxrad","r","Max. radius/scale",10,0,None),ParValue("numrad","r","Number of radii/scales",20),ParSet("radscale","s","Radii/scale spacing",'log',["linear","log"]),ParRange("counts","r","Number of counts in filter",None,0,None)],
-    'opt': [ParValue("inradfile","f","Input file w/ predetermined radii",None),ParValue("innormfile","f","Input file w/ predetermined normalizations",None),ParValue("sumfile","f","Image with total counts in filter",None),ParValue("normfile","f","Image with kernel normalization",None),ParValue("radfile","f","Image with smoothing radii/scales",None),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber existing output?",False)],
-    }
 
+    parinfo['dmimg2jpg'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name (red image if true color)",None),ParValue("greenfile","f","Green color channel file name",\'none\'),ParValue("bluefile","f","Blue color channel file name",\'none\'),ParValue("outfile","f","Output jpg file name",None)]',
+        'opt': '[ParValue("lutfile","f","Colormap file",\')lut.grey\'),ParValue("colorstretch","r","Color lookup strech factor",1),ParValue("colorshift","i","Color lookup table shift",0),ParValue("invert","b","Invert colors",False),ParSet("scalefunction","s","Scaling function",\'log\',["log","linear","power","asinh"]),ParValue("scaleparam","r","Scaling parameter (for non-linear scalefunction)",3),ParValue("minred","r","Minimum value for the red color channel",None),ParValue("mingreen","r","Minimum value for the green color channel",None),ParValue("minblue","r","Minimum value for the blue color channel",None),ParValue("maxred","r","Maximum value for the red color channel",None),ParValue("maxgreen","r","Maximum value for the green color channel",None),ParValue("maxblue","r","Maximum value for the blue color channel",None),ParValue("regionfile","f","Region overlay file",None),ParValue("regioncolor","s","Region color triple",\')colors.green\'),ParSet("regionopt","s","Option of region shape drawing method (individal|combine)",\'individual\',["individual","combine"]),ParValue("showaimpoint","b","Put crosshair at aimpoint",False),ParValue("showlabel","b","Label the contours?",False),ParValue("showgrid","b","Show grid on image",False),ParValue("gridcolor","s","Grid color triple",\')colors.white\'),ParValue("gridsize","r","Gridsize [arcsec]",120),ParRange("fontsize","i","Font label size",2,1,3),ParValue("psfile","f","Optional post script file name",None),ParRange("verbose","i","Level of verbose output",0,0,5),ParValue("clobber","b","Clobber existing outputs?",False)]',
+        }
 
-parinfo['dmimgblob'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParValue("threshold","r","Image blob threshold",None)],
-    'opt': [ParValue("srconly","b","Deal only w/ values >= threshold?",False),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,0)],
-    }
 
+    parinfo['dmimgadapt'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParSet("function","s","Filter function",\'tophat\',["tophat","box","gaussian","cone","pyramid","walrewop","exp","lor","mex","hemisphere","quad"]),ParRange("minrad","r","Min. radius/scale",0.5,0,None),ParRange("maxrad","r","Max. radius/scale",10,0,None),ParValue("numrad","r","Number of radii/scales",20),ParSet("radscale","s","Radii/scale spacing",\'log\',["linear","log"]),ParRange("counts","r","Number of counts in filter",None,0,None)]',
+        'opt': '[ParValue("inradfile","f","Input file w/ predetermined radii",None),ParValue("innormfile","f","Input file w/ predetermined normalizations",None),ParValue("sumfile","f","Image with total counts in filter",None),ParValue("normfile","f","Image with kernel normalization",None),ParValue("radfile","f","Image with smoothing radii/scales",None),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber existing output?",False)]',
+        }
 
-parinfo['dmimgcalc'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file #1",None),ParValue("infile2","f","Input file #2",None),ParValue("outfile","f","output file",None),ParValue("operation","s","arithmetic operation",None)],
-    'opt': [ParValue("weight","r","weight for first image",1),ParValue("weight2","r","weight for second image",1),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("clobber","b","delete old output",False),ParRange("verbose","i","output verbosity",0,0,5)],
-    }
 
+    parinfo['dmimgblob'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParValue("threshold","r","Image blob threshold",None)]',
+        'opt': '[ParValue("srconly","b","Deal only w/ values >= threshold?",False),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,0)]',
+        }
 
-parinfo['dmimgdist'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file",None),ParValue("outfile","f","Output ASCII region file",None)],
-    'opt': [ParValue("tolerance","r","Tolerance on fraction",0),ParValue("clobber","b","Remove outfile if it exists",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['dmimgcalc'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file #1",None),ParValue("infile2","f","Input file #2",None),ParValue("outfile","f","output file",None),ParValue("operation","s","arithmetic operation",None)]',
+        'opt': '[ParValue("weight","r","weight for first image",1),ParValue("weight2","r","weight for second image",1),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("clobber","b","delete old output",False),ParRange("verbose","i","output verbosity",0,0,5)]',
+        }
 
-parinfo['dmimgfilt'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParSet("function","s","Filter function",'mean',["min","max","mean","median","mode","mid","sigma","extreme","locheq","kuwahara","unsharp","range","variance","nmode","q10","q25","q33","q67","q75","q90","qxx","mcv","sum","rclip","peak","ridge","valley","plain","count","olympic","pmean","mu3","mu4","jitter","rms","nslope","3sigmean","3sigmedian"]),ParValue("mask","s","masking filter",None)],
-    'opt': [ParRange("numiter","i","Number of iterations to loop over",1,1,None),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParRange("randseed","i","Seed for random seed generator",0,0,65535),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber existing output?",False),ParValue("box3","s","Box: 3x3",'box(0,0,3,3)'),ParValue("box5","s","Box: 5x5",'box(0,0,5,5)'),ParValue("box7","s","Box: 7x7",'box(0,0,7,7)'),ParValue("circle3","s","Circle: r=3",'circle(0,0,3)'),ParValue("circle5","s","Circle: r=5",'circle(0,0,5)'),ParValue("circle7","s","Circle: r=7",'circle(0,0,7)'),ParValue("annulus5_3","s","Annulus: o=5,i=3",'annulus(0,0,3,5)'),ParValue("annulus7_5","s","Annulus: o=7,i=5",'annulus(0,0,5,7)'),ParValue("annulus7_3","s","Annulus: o=7,i=3",'annulus(0,0,3,7)'),ParValue("bann5_3","s","Box Annulus: o=5,i=3",'box(0,0,5,5)-box(0,0,3,3)'),ParValue("bann7_3","s","Box Annulus: o=7,i=3",'box(0,0,7,7)-box(0,0,3,3)'),ParValue("bann7_5","s","Box Annulus: o=7,i=5",'box(0,0,7,7)-box(0,0,5,5)')],
-    }
 
+    parinfo['dmimgdist'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file",None),ParValue("outfile","f","Output ASCII region file",None)]',
+        'opt': '[ParValue("tolerance","r","Tolerance on fraction",0),ParValue("clobber","b","Remove outfile if it exists",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['dmimghist'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input file or stack",None),ParValue("outfile","f","output file or stack",None),ParValue("hist","s","binning specification or stack [a]:[b][:c]|c|<filename>",None)],
-    'opt': [ParValue("strict","b","ignore counts outside of binning range",False),ParValue("clobber","b","delete old output",False),ParRange("verbose","i","output verbosity",0,0,5)],
-    }
 
+    parinfo['dmimgfilt'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParSet("function","s","Filter function",\'mean\',["min","max","mean","median","mode","mid","sigma","extreme","locheq","kuwahara","unsharp","range","variance","nmode","q10","q25","q33","q67","q75","q90","qxx","mcv","sum","rclip","peak","ridge","valley","plain","count","olympic","pmean","mu3","mu4","jitter","rms","nslope","3sigmean","3sigmedian"]),ParValue("mask","s","masking filter",None)]',
+        'opt': '[ParRange("numiter","i","Number of iterations to loop over",1,1,None),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParRange("randseed","i","Seed for random seed generator",0,0,65535),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber existing output?",False),ParValue("box3","s","Box: 3x3",\'box(0,0,3,3)\'),ParValue("box5","s","Box: 5x5",\'box(0,0,5,5)\'),ParValue("box7","s","Box: 7x7",\'box(0,0,7,7)\'),ParValue("circle3","s","Circle: r=3",\'circle(0,0,3)\'),ParValue("circle5","s","Circle: r=5",\'circle(0,0,5)\'),ParValue("circle7","s","Circle: r=7",\'circle(0,0,7)\'),ParValue("annulus5_3","s","Annulus: o=5,i=3",\'annulus(0,0,3,5)\'),ParValue("annulus7_5","s","Annulus: o=7,i=5",\'annulus(0,0,5,7)\'),ParValue("annulus7_3","s","Annulus: o=7,i=3",\'annulus(0,0,3,7)\'),ParValue("bann5_3","s","Box Annulus: o=5,i=3",\'box(0,0,5,5)-box(0,0,3,3)\'),ParValue("bann7_3","s","Box Annulus: o=7,i=3",\'box(0,0,7,7)-box(0,0,3,3)\'),ParValue("bann7_5","s","Box Annulus: o=7,i=5",\'box(0,0,7,7)-box(0,0,5,5)\')]',
+        }
 
-parinfo['dmimghull'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file",None),ParValue("outfile","f","Output FITS region file",None)],
-    'opt': [ParValue("tolerance","r","Exclude values equal to and below this value",0),ParValue("clobber","b","Overwrite outfile if it exists",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['dmimghist'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input file or stack",None),ParValue("outfile","f","output file or stack",None),ParValue("hist","s","binning specification or stack [a]:[b][:c]|c|<filename>",None)]',
+        'opt': '[ParValue("strict","b","ignore counts outside of binning range",False),ParValue("clobber","b","delete old output",False),ParRange("verbose","i","output verbosity",0,0,5)]',
+        }
 
-parinfo['dmimglasso'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParValue("xpos","r","Starting X-location",None),ParValue("ypos","r","Starting Y-location",None),ParValue("low_value","r","Minimum threshold",None),ParValue("high_value","r","Maximum threshold",None)],
-    'opt': [ParSet("coord","s","Coordinate system of xpos,ypos",'physical',["physical","logical"]),ParSet("value","s","Hi/low values",'absolute',["absolute","percent","delta"]),ParRange("maxdepth","i","Maximum recursion depth",10000,1,None),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,0)],
-    }
 
+    parinfo['dmimghull'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file",None),ParValue("outfile","f","Output FITS region file",None)]',
+        'opt': '[ParValue("tolerance","r","Exclude values equal to and below this value",0),ParValue("clobber","b","Overwrite outfile if it exists",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['dmimgpick'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input table file",None),ParValue("imgfile","f","Input image file",None),ParValue("outfile","f","Output file name",None),ParSet("method","s","Interpolation method",'weight',["average","weight","minimum","maximum","closest","furthest"])],
-    'opt': [ParValue("clobber","b","Remove outfile if it already exists",False),ParRange("verbose","i","Tool verbosity",0,0,5)],
-    }
 
+    parinfo['dmimglasso'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParValue("xpos","r","Starting X-location",None),ParValue("ypos","r","Starting Y-location",None),ParValue("low_value","r","Minimum threshold",None),ParValue("high_value","r","Maximum threshold",None)]',
+        'opt': '[ParSet("coord","s","Coordinate system of xpos,ypos",\'physical\',["physical","logical"]),ParSet("value","s","Hi/low values",\'absolute\',["absolute","percent","delta"]),ParRange("maxdepth","i","Maximum recursion depth",10000,1,None),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,0)]',
+        }
 
-parinfo['dmimgpm'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output Poisson mean",None)],
-    'opt': [ParValue("expfile","f","Exposure file",None),ParValue("outexpfile","f","Output Exposure file",None),ParValue("maxbin","i","Maximum bin in histogram",49),ParValue("xhalf","i","X axis half-width",64),ParValue("yhalf","i","Y axis half-width",64),ParValue("clobber","b","clobber old outputs",False),ParRange("verbose","i","tool verbosity",0,0,5)],
-    }
 
+    parinfo['dmimgpick'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input table file",None),ParValue("imgfile","f","Input image file",None),ParValue("outfile","f","Output file name",None),ParSet("method","s","Interpolation method",\'weight\',["average","weight","minimum","maximum","closest","furthest"])]',
+        'opt': '[ParValue("clobber","b","Remove outfile if it already exists",False),ParRange("verbose","i","Tool verbosity",0,0,5)]',
+        }
 
-parinfo['dmimgproject'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParSet("axis","s","Axis to project along",'y',["x","y"])],
-    'opt': [ParRange("verbose","i","Tool verbosity",0,0,0),ParValue("clobber","b","Clobber existing output?",False)],
-    }
 
+    parinfo['dmimgpm'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output Poisson mean",None)]',
+        'opt': '[ParValue("expfile","f","Exposure file",None),ParValue("outexpfile","f","Output Exposure file",None),ParValue("maxbin","i","Maximum bin in histogram",49),ParValue("xhalf","i","X axis half-width",64),ParValue("yhalf","i","Y axis half-width",64),ParValue("clobber","b","clobber old outputs",False),ParRange("verbose","i","tool verbosity",0,0,5)]',
+        }
 
-parinfo['dmimgreproject'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input table file name",None),ParValue("imgfile","f","Input image to match",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParSet("method","s","Interpolation method",'weight',["weight","closest","furthest","min","max","first","last"]),ParRange("verbose","i","Tool verbosity",0,0,0),ParValue("clobber","b","Clobber existing output?",False)],
-    }
 
+    parinfo['dmimgproject'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParSet("axis","s","Axis to project along",\'y\',["x","y"])]',
+        'opt': '[ParRange("verbose","i","Tool verbosity",0,0,0),ParValue("clobber","b","Clobber existing output?",False)]',
+        }
 
-parinfo['dmimgthresh'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None)],
-    'opt': [ParValue("expfile","f","Exposure map file",None),ParValue("cut","s","Threshold value",None),ParValue("value","r","Replacement value",0.0),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['dmimgreproject'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input table file name",None),ParValue("imgfile","f","Input image to match",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParSet("method","s","Interpolation method",\'weight\',["weight","closest","furthest","min","max","first","last"]),ParRange("verbose","i","Tool verbosity",0,0,0),ParValue("clobber","b","Clobber existing output?",False)]',
+        }
 
-parinfo['dmjoin'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file",None),ParValue("joinfile","f","Input join file",None),ParValue("outfile","f","Output file",None),ParValue("join","s","Join col",None)],
-    'opt': [ParSet("interpolate","s","Interpolate mode",'linear',["linear","first","last","closest","furthest","minimum","maximum"]),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber",False)],
-    }
 
+    parinfo['dmimgthresh'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None)]',
+        'opt': '[ParValue("expfile","f","Exposure map file",None),ParValue("cut","s","Threshold value",None),ParValue("value","r","Replacement value",0.0),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['dmkeypar'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("keyword","s","Keyword to retrieve",None)],
-    'opt': [ParValue("echo","b","Print keyword value to screen?",False),ParValue("exist","b","Keyword existence",False),ParValue("value","s","Keyword value",None),ParValue("rval","r","Keyword value -- real",None),ParValue("ival","i","Keyword value -- integer",None),ParValue("sval","s","Keyword value -- string",None),ParValue("bval","b","Keyword value -- boolean",False),ParSet("datatype","s","Keyword data type",'null',["string","real","integer","boolean","null"]),ParValue("unit","s","Keyword unit",None),ParValue("comment","s","Keyword comment",None)],
-    }
 
+    parinfo['dmjoin'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file",None),ParValue("joinfile","f","Input join file",None),ParValue("outfile","f","Output file",None),ParValue("join","s","Join col",None)]',
+        'opt': '[ParSet("interpolate","s","Interpolate mode",\'linear\',["linear","first","last","closest","furthest","minimum","maximum"]),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber",False)]',
+        }
 
-parinfo['dmlist'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("opt","s","Option",'data')],
-    'opt': [ParValue("outfile","f","Output file (optional)",None),ParValue("rows","s","Range of table rows to print (min:max)",None),ParValue("cells","s","Range of array indices to print (min:max)",None),ParRange("verbose","i","Debug Level(0-5)",0,0,5)],
-    }
 
+    parinfo['dmkeypar'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("keyword","s","Keyword to retrieve",None)]',
+        'opt': '[ParValue("echo","b","Print keyword value to screen?",False),ParValue("exist","b","Keyword existence",False),ParValue("value","s","Keyword value",None),ParValue("rval","r","Keyword value -- real",None),ParValue("ival","i","Keyword value -- integer",None),ParValue("sval","s","Keyword value -- string",None),ParValue("bval","b","Keyword value -- boolean",False),ParSet("datatype","s","Keyword data type",\'null\',["string","real","integer","boolean","null"]),ParValue("unit","s","Keyword unit",None),ParValue("comment","s","Keyword comment",None)]',
+        }
 
-parinfo['dmmakepar'] = {
-    'istool': True,
-    'req': [ParValue("input","f","input file",None),ParValue("output","f","output parameter file or STDOUT",None)],
-    'opt': [ParValue("template","f","template file",None),ParSet("case","s","output keyword case",'lower',["upper","lower","same"]),ParRange("verbose","i","verbose mode",0,0,5),ParValue("clobber","b","overwrite existing output file",False)],
-    }
 
+    parinfo['dmlist'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("opt","s","Option",\'data\')]',
+        'opt': '[ParValue("outfile","f","Output file (optional)",None),ParValue("rows","s","Range of table rows to print (min:max)",None),ParValue("cells","s","Range of array indices to print (min:max)",None),ParRange("verbose","i","Debug Level(0-5)",0,0,5)]',
+        }
 
-parinfo['dmmakereg'] = {
-    'istool': True,
-    'req': [ParValue("region","s","Input region string",None),ParValue("outfile","f","Output virtual filename",None)],
-    'opt': [ParValue("append","b","Create or Append",False),ParSet("kernel","s","Output file format type",'fits',["FITS","fits","ASCII","ascii"]),ParValue("wcsfile","f","File with coordinate mapping",'none'),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file (in create mode)",False)],
-    }
 
+    parinfo['dmmakepar'] = {
+        'istool': True,
+        'req': '[ParValue("input","f","input file",None),ParValue("output","f","output parameter file or STDOUT",None)]',
+        'opt': '[ParValue("template","f","template file",None),ParSet("case","s","output keyword case",\'lower\',["upper","lower","same"]),ParRange("verbose","i","verbose mode",0,0,5),ParValue("clobber","b","overwrite existing output file",False)]',
+        }
 
-parinfo['dmmaskbin'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image to be binned",None),ParValue("maskfile","f","Binning mask",None),ParValue("outfile","f","Output file",None)],
-    'opt': [ParValue("errfile","f","Input error file to compute SNR",None),ParValue("snrfile","f","Output SNR file",None),ParRange("verbose","i","Tool chatter level",0,0,0),ParValue("clobber","b","Remove files if they exist?",False)],
-    }
 
+    parinfo['dmmakereg'] = {
+        'istool': True,
+        'req': '[ParValue("region","s","Input region string",None),ParValue("outfile","f","Output virtual filename",None)]',
+        'opt': '[ParValue("append","b","Create or Append",False),ParSet("kernel","s","Output file format type",\'fits\',["FITS","fits","ASCII","ascii"]),ParValue("wcsfile","f","File with coordinate mapping",\'none\'),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file (in create mode)",False)]',
+        }
 
-parinfo['dmmaskfill'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input table with data to be filled from",None),ParValue("maskfile","f","Masked image to be filled",None),ParValue("outfile","f","Output file",None)],
-    'opt': [ParRange("verbose","i","Tool chatter level",0,0,0),ParValue("clobber","b","Remove files if they exist?",False)],
-    }
 
+    parinfo['dmmaskbin'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image to be binned",None),ParValue("maskfile","f","Binning mask",None),ParValue("outfile","f","Output file",None)]',
+        'opt': '[ParValue("errfile","f","Input error file to compute SNR",None),ParValue("snrfile","f","Output SNR file",None),ParRange("verbose","i","Tool chatter level",0,0,0),ParValue("clobber","b","Remove files if they exist?",False)]',
+        }
 
-parinfo['dmmerge'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset name",None)],
-    'opt': [ParValue("outBlock","s","Output block name(1st blkname to be duplicated)",None),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("columnList","s","Column list",None),ParValue("clobber","b","Clobber existing file[y/n]",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['dmmaskfill'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input table with data to be filled from",None),ParValue("maskfile","f","Masked image to be filled",None),ParValue("outfile","f","Output file",None)]',
+        'opt': '[ParRange("verbose","i","Tool chatter level",0,0,0),ParValue("clobber","b","Remove files if they exist?",False)]',
+        }
 
-parinfo['dmnautilus'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output file name",None),ParRange("snr","r","SNR limit",0,0,None)],
-    'opt': [ParRange("method","i","Number of subimages required to be above SNR threshold",0,0,4),ParValue("inerrfile","f","Input error on image",None),ParValue("outmaskfile","f","Output mask image",None),ParValue("outsnrfile","f","Output SNR image",None),ParValue("outareafile","f","Output area image",None),ParRange("verbose","i","Tool verbosity",0,0,0),ParValue("clobber","b","Clobber outputs",False)],
-    }
 
+    parinfo['dmmerge'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset name",None)]',
+        'opt': '[ParValue("outBlock","s","Output block name(1st blkname to be duplicated)",None),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("columnList","s","Column list",None),ParValue("clobber","b","Clobber existing file[y/n]",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['dmpaste'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("pastefile","f","Input paste file lists",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParValue("clobber","b","clobber existing output",False),ParRange("verbose","i","verbosity of processing comments",0,0,5)],
-    }
 
+    parinfo['dmnautilus'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output file name",None),ParRange("snr","r","SNR limit",0,0,None)]',
+        'opt': '[ParRange("method","i","Number of subimages required to be above SNR threshold",0,0,4),ParValue("inerrfile","f","Input error on image",None),ParValue("outmaskfile","f","Output mask image",None),ParValue("outsnrfile","f","Output SNR image",None),ParValue("outareafile","f","Output area image",None),ParRange("verbose","i","Tool verbosity",0,0,0),ParValue("clobber","b","Clobber outputs",False)]',
+        }
 
-parinfo['dmradar'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output file name",None),ParRange("snr","r","SNR limit",0,0,None),ParValue("xcenter","r","X coordinate of center of grid (physical pixels)",0),ParValue("ycenter","r","Y coordinate of center of grid (physical pixels)",0)],
-    'opt': [ParRange("method","i","Number of subimages required to be above SNR threshold",4,0,4),ParSet("shape","s","Shape of region to use",'pie',["pie","epanda","bpanda","box"]),ParRange("rinner","r","Minimum inner radius (physical pixels)",5,0,None),ParRange("router","r","Outer radius range, (physical pixels)",1000,0,None),ParRange("astart","r","Starting angle, degrees CCW +X axis",0,0,360),ParRange("arange","r","Range of angles, degrees CCW from astart",360,0,360),ParRange("ellipticity","r","Ellipticity of shape (1=circle,0=line)",1,0,1),ParRange("rotang","r","Rotation angle of shape",0,0,360),ParRange("minradius","r","Minimum allowed radius (phys pixels)",0.5,0,None),ParRange("minangle","r","Minimum allowed angle (degrees)",1,0,None),ParValue("inerrfile","f","Input error on image",None),ParValue("outmaskfile","f","Output mask image",None),ParValue("outsnrfile","f","Output SNR image",None),ParValue("outareafile","f","Output area image",None),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber outputs",False)],
-    }
 
+    parinfo['dmpaste'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("pastefile","f","Input paste file lists",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParValue("clobber","b","clobber existing output",False),ParRange("verbose","i","verbosity of processing comments",0,0,5)]',
+        }
 
-parinfo['dmreadpar'] = {
-    'istool': True,
-    'req': [ParValue("input","f","input parameter file",None),ParValue("output","f","output file",None)],
-    'opt': [ParValue("template","f","template file",None),ParSet("case","s","output keyword case",'upper',["upper","lower","same"]),ParRange("verbose","i","verbose mode",0,0,5),ParValue("clobber","b","overwrite existing keywords in output file",False)],
-    }
 
+    parinfo['dmradar'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output file name",None),ParRange("snr","r","SNR limit",0,0,None),ParValue("xcenter","r","X coordinate of center of grid (physical pixels)",0),ParValue("ycenter","r","Y coordinate of center of grid (physical pixels)",0)]',
+        'opt': '[ParRange("method","i","Number of subimages required to be above SNR threshold",4,0,4),ParSet("shape","s","Shape of region to use",\'pie\',["pie","epanda","bpanda","box"]),ParRange("rinner","r","Minimum inner radius (physical pixels)",5,0,None),ParRange("router","r","Outer radius range, (physical pixels)",1000,0,None),ParRange("astart","r","Starting angle, degrees CCW +X axis",0,0,360),ParRange("arange","r","Range of angles, degrees CCW from astart",360,0,360),ParRange("ellipticity","r","Ellipticity of shape (1=circle,0=line)",1,0,1),ParRange("rotang","r","Rotation angle of shape",0,0,360),ParRange("minradius","r","Minimum allowed radius (phys pixels)",0.5,0,None),ParRange("minangle","r","Minimum allowed angle (degrees)",1,0,None),ParValue("inerrfile","f","Input error on image",None),ParValue("outmaskfile","f","Output mask image",None),ParValue("outsnrfile","f","Output SNR image",None),ParValue("outareafile","f","Output area image",None),ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber outputs",False)]',
+        }
 
-parinfo['dmregrid'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Enter output file name",None),ParValue("bin","s","Binning specification",None),ParValue("rotangle","s","CCW rotation angle in degrees about rotation center",'0'),ParValue("rotxcenter","s","x coordinate of rotation center",'0'),ParValue("rotycenter","s","y coordinate of rotation center",'0'),ParValue("xoffset","s","x offset",'0'),ParValue("yoffset","s","y offset",'0'),ParRange("npts","i","Number of points in pixel (0='exact' algorithm)",0,0,999)],
-    'opt': [ParSet("coord_sys","s","Coordinate system of bin parameter",'logical',["logical","physical"]),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['dmreadpar'] = {
+        'istool': True,
+        'req': '[ParValue("input","f","input parameter file",None),ParValue("output","f","output file",None)]',
+        'opt': '[ParValue("template","f","template file",None),ParSet("case","s","output keyword case",\'upper\',["upper","lower","same"]),ParRange("verbose","i","verbose mode",0,0,5),ParValue("clobber","b","overwrite existing keywords in output file",False)]',
+        }
 
-parinfo['dmregrid2'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParRange("resolution","i","Number of point per side to evaluate",1,0,None),ParSet("method","s","Average value",'sum',["sum","average"]),ParValue("theta","r","Rotation angle (CCW from +X axis)",None),ParValue("rotxcenter","r","Center of rotation in X",None),ParValue("rotycenter","r","Center of rotation in Y",None),ParValue("xoffset","r","Shift in X direction",0),ParValue("yoffset","r","Shift in Y direction",0),ParValue("xscale","r","Scaling in X-direction",1),ParValue("yscale","r","Scaling in Y-direction",1),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,5)],
-    }
 
+    parinfo['dmregrid'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Enter output file name",None),ParValue("bin","s","Binning specification",None),ParValue("rotangle","s","CCW rotation angle in degrees about rotation center",\'0\'),ParValue("rotxcenter","s","x coordinate of rotation center",\'0\'),ParValue("rotycenter","s","y coordinate of rotation center",\'0\'),ParValue("xoffset","s","x offset",\'0\'),ParValue("yoffset","s","y offset",\'0\'),ParRange("npts","i","Number of points in pixel (0=\'exact\' algorithm)",0,0,999)]',
+        'opt': '[ParSet("coord_sys","s","Coordinate system of bin parameter",\'logical\',["logical","physical"]),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['dmsort'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset name",None),ParValue("outfile","f","Output dataset name",None),ParValue("keys","s","Sorted column name",None)],
-    'opt': [ParValue("copyall","b","Copy all the blocks?",True),ParValue("clobber","b","Clobber existing file?",False),ParRange("verbose","i","Verbose mode?",0,0,5)],
-    }
 
+    parinfo['dmregrid2'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParRange("resolution","i","Number of point per side to evaluate",1,0,None),ParSet("method","s","Average value",\'sum\',["sum","average"]),ParValue("theta","r","Rotation angle (CCW from +X axis)",None),ParValue("rotxcenter","r","Center of rotation in X",None),ParValue("rotycenter","r","Center of rotation in Y",None),ParValue("xoffset","r","Shift in X direction",0),ParValue("yoffset","r","Shift in Y direction",0),ParValue("xscale","r","Scaling in X-direction",1),ParValue("yscale","r","Scaling in Y-direction",1),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,5)]',
+        }
 
-parinfo['dmstat'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file specification",None)],
-    'opt': [ParValue("centroid","b","Calculate centroid if image?",True),ParValue("median","b","Calculate median value?",False),ParValue("sigma","b","Calculate the population standard deviation?",True),ParValue("clip","b","Calculate stats using sigma clipping?",False),ParValue("nsigma","r","Number of sigma to clip",3),ParRange("maxiter","i","Maximum number of iterations",20,1,None),ParRange("verbose","i","Verbosity level",1,0,5),ParValue("out_columns","s","Output Column Label",None),ParValue("out_min","s","Output Minimum Value",None),ParValue("out_min_loc","s","Output Minimum Location Value",None),ParValue("out_max","s","Output Maximum Value",None),ParValue("out_max_loc","s","Output Maximum Location Value",None),ParValue("out_mean","s","Output Mean Value",None),ParValue("out_median","s","Output Median Value",None),ParValue("out_sigma","s","Output Sigma Value",None),ParValue("out_sum","s","Output Sum of Values",None),ParValue("out_good","s","Output Number Good Values",None),ParValue("out_null","s","Output Number Null Values",None),ParValue("out_cnvrgd","s","Converged?",None),ParValue("out_cntrd_log","s","Output Centroid Log Value",None),ParValue("out_cntrd_phys","s","Output Centroid Phys Value",None),ParValue("out_sigma_cntrd","s","Output Sigma Centroid Value",None)],
-    }
 
+    parinfo['dmsort'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset name",None),ParValue("outfile","f","Output dataset name",None),ParValue("keys","s","Sorted column name",None)]',
+        'opt': '[ParValue("copyall","b","Copy all the blocks?",True),ParValue("clobber","b","Clobber existing file?",False),ParRange("verbose","i","Verbose mode?",0,0,5)]',
+        }
 
-parinfo['dmtabfilt'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input table file name",None),ParValue("colname","s","Column to smooth",None),ParValue("outfile","f","Output file name",None),ParSet("function","s","Filter function",'peak',["min","max","mean","median","mode","mid","sigma","extreme","unsharp","range","variance","nmode","q25","q33","q67","q75","sum","rclip","peak","valley","count","olympic","pmean","mu3","mu4","jitter","rms","nslope"]),ParValue("mask","s","masking filter",None)],
-    'opt': [ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber existing output?",True)],
-    }
 
+    parinfo['dmstat'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file specification",None)]',
+        'opt': '[ParValue("centroid","b","Calculate centroid if image?",True),ParValue("median","b","Calculate median value?",False),ParValue("sigma","b","Calculate the population standard deviation?",True),ParValue("clip","b","Calculate stats using sigma clipping?",False),ParValue("nsigma","r","Number of sigma to clip",3),ParRange("maxiter","i","Maximum number of iterations",20,1,None),ParRange("verbose","i","Verbosity level",1,0,5),ParValue("out_columns","s","Output Column Label",None),ParValue("out_min","s","Output Minimum Value",None),ParValue("out_min_loc","s","Output Minimum Location Value",None),ParValue("out_max","s","Output Maximum Value",None),ParValue("out_max_loc","s","Output Maximum Location Value",None),ParValue("out_mean","s","Output Mean Value",None),ParValue("out_median","s","Output Median Value",None),ParValue("out_sigma","s","Output Sigma Value",None),ParValue("out_sum","s","Output Sum of Values",None),ParValue("out_good","s","Output Number Good Values",None),ParValue("out_null","s","Output Number Null Values",None),ParValue("out_cnvrgd","s","Converged?",None),ParValue("out_cntrd_log","s","Output Centroid Log Value",None),ParValue("out_cntrd_phys","s","Output Centroid Phys Value",None),ParValue("out_sigma_cntrd","s","Output Sigma Centroid Value",None)]',
+        }
 
-parinfo['dmtcalc'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file",None),ParValue("outfile","f","Output file",None),ParValue("expression","s","expression(s) to evaluate",None)],
-    'opt': [ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['dmtabfilt'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input table file name",None),ParValue("colname","s","Column to smooth",None),ParValue("outfile","f","Output file name",None),ParSet("function","s","Filter function",\'peak\',["min","max","mean","median","mode","mid","sigma","extreme","unsharp","range","variance","nmode","q25","q33","q67","q75","sum","rclip","peak","valley","count","olympic","pmean","mu3","mu4","jitter","rms","nslope"]),ParValue("mask","s","masking filter",None)]',
+        'opt': '[ParRange("verbose","i","Tool verbosity",0,0,5),ParValue("clobber","b","Clobber existing output?",True)]',
+        }
 
-parinfo['dmtype2split'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input type II file",None),ParValue("outfile","f","Enter output file name(s)",None)],
-    'opt': [ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['dmtcalc'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file",None),ParValue("outfile","f","Output file",None),ParValue("expression","s","expression(s) to evaluate",None)]',
+        'opt': '[ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['download_obsid_caldb'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outdir","f","Output CALDB directory",'${ASCDS_INSTALL}/CALDB')],
-    'opt': [ParValue("background","b","Should the ACIS|HRC background files be downloaded?",False),ParValue("missing","b","Only check for missing CALDB files in outdir/ directory?",False),ParValue("clobber","b","Should existing CALDB data files be downloaded again?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['dmtype2split'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input type II file",None),ParValue("outfile","f","Enter output file name(s)",None)]',
+        'opt': '[ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['ecf_calc'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input source file",None),ParValue("outfile","f","output FITS table with ECF information",None),ParRange("radius","r","radius of ECF region",20,0,None),ParRange("xpos","r","x-position of extraction center",4096.5,0,None),ParRange("ypos","r","y-position of extraction center",4096.5,0,None),ParRange("binsize","r","pixel binning factor",1.0,0,None),ParValue("fraction","s","ECF to determine radii",'0.01,0.025,0.05,0.075,0.1,0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.85,0.9,0.95,0.99')],
-    'opt': [ParValue("plot","b","show plot of ECF vs. Radius?",False),ParValue("clobber","b","OK to overwrite existing output file?",False)],
-    }
 
+    parinfo['download_obsid_caldb'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outdir","f","Output CALDB directory",\'${ASCDS_INSTALL}/CALDB\')]',
+        'opt': '[ParValue("background","b","Should the ACIS|HRC background files be downloaded?",False),ParValue("missing","b","Only check for missing CALDB files in outdir/ directory?",False),ParValue("clobber","b","Should existing CALDB data files be downloaded again?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['eff2evt'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output event file",None)],
-    'opt': [ParValue("energy","r","Energy, None = use column in file [eV]",None),ParValue("pbkfile","f","Parameter block file for ACIS dead area",None),ParValue("dafile","f","Dead area file",'CALDB'),ParValue("rmfimg","f","RMF, Must be an image (ie rmfimg output)",None),ParRange("rmfcut","r","RMF probability cutoff",0.01,0,1),ParValue("mirror","s","ARDLIB mirror",'HRMA'),ParValue("detsubsysmod","s","ARDLIB modifier for detector",None),ParValue("ardlibpar","s","ARDLIB parameter name",'ardlib'),ParValue("geompar","s","PIXLIB parameter name",'geom'),ParValue("clobber","b","Remove outfile if it already exists?",False),ParRange("verbose","i","Chatter level",0,0,5)],
-    }
 
+    parinfo['ecf_calc'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input source file",None),ParValue("outfile","f","output FITS table with ECF information",None),ParRange("radius","r","radius of ECF region",20,0,None),ParRange("xpos","r","x-position of extraction center",4096.5,0,None),ParRange("ypos","r","y-position of extraction center",4096.5,0,None),ParRange("binsize","r","pixel binning factor",1.0,0,None),ParValue("fraction","s","ECF to determine radii",\'0.01,0.025,0.05,0.075,0.1,0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.85,0.9,0.95,0.99\')]',
+        'opt': '[ParValue("plot","b","show plot of ECF vs. Radius?",False),ParValue("clobber","b","OK to overwrite existing output file?",False)]',
+        }
 
-parinfo['energy_hue_map'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input counts image",None),ParValue("energymap","f","Input energy map image",None),ParValue("outroot","f","Output directory+root name",None)],
-    'opt': [ParSet("colorsys","s","Color system",'hsv',["hsv","hls","hisv"]),ParValue("min_energy","r","Minimum energy value",None),ParValue("max_energy","r","Maximum energy value",None),ParValue("min_counts","r","Minimum counts value",None),ParValue("max_counts","r","Maximum counts value",None),ParSet("energy_scale","s","Energy scaling function",'linear',["linear","log","asinh","sqrt","square"]),ParSet("counts_scale","s","Counts scaling function",'asinh',["linear","log","asinh","sqrt","square"]),ParRange("min_hue","r","Minimum hue",0,0,1),ParRange("max_hue","r","Maximum hue, 0.833=purple",0.833,0,1),ParRange("min_sat","r","Minimum saturation",0,0,1),ParRange("max_sat","r","Maximum saturation",1,0,1),ParRange("contrast","r","Contrast in intensity",1,0,10),ParRange("bias","r","Bias in intensity",0.5,0,1),ParValue("show_plot","b","Display plot with image?",False),ParValue("clobber","b","Remove output files if they already exist?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['eff2evt'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output event file",None)]',
+        'opt': '[ParValue("energy","r","Energy, None = use column in file [eV]",None),ParValue("pbkfile","f","Parameter block file for ACIS dead area",None),ParValue("dafile","f","Dead area file",\'CALDB\'),ParValue("rmfimg","f","RMF, Must be an image (ie rmfimg output)",None),ParRange("rmfcut","r","RMF probability cutoff",0.01,0,1),ParValue("mirror","s","ARDLIB mirror",\'HRMA\'),ParValue("detsubsysmod","s","ARDLIB modifier for detector",None),ParValue("ardlibpar","s","ARDLIB parameter name",\'ardlib\'),ParValue("geompar","s","PIXLIB parameter name",\'geom\'),ParValue("clobber","b","Remove outfile if it already exists?",False),ParRange("verbose","i","Chatter level",0,0,5)]',
+        }
 
-parinfo['evalpos'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image files",None),ParValue("ra","s","Input right ascension",None),ParValue("dec","s","Input declination",None)],
-    'opt': [ParValue("output","r","Output value (last in stack)",None),ParValue("tmpdir","f","Directory for temp. files",'${ASCDS_WORK_PATH}'),ParRange("verbose","i","Chatter level",0,0,5)],
-    }
 
+    parinfo['energy_hue_map'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input counts image",None),ParValue("energymap","f","Input energy map image",None),ParValue("outroot","f","Output directory+root name",None)]',
+        'opt': '[ParSet("colorsys","s","Color system",\'hsv\',["hsv","hls","hisv"]),ParValue("min_energy","r","Minimum energy value",None),ParValue("max_energy","r","Maximum energy value",None),ParValue("min_counts","r","Minimum counts value",None),ParValue("max_counts","r","Maximum counts value",None),ParSet("energy_scale","s","Energy scaling function",\'linear\',["linear","log","asinh","sqrt","square"]),ParSet("counts_scale","s","Counts scaling function",\'asinh\',["linear","log","asinh","sqrt","square"]),ParRange("min_hue","r","Minimum hue",0,0,1),ParRange("max_hue","r","Maximum hue, 0.833=purple",0.833,0,1),ParRange("min_sat","r","Minimum saturation",0,0,1),ParRange("max_sat","r","Maximum saturation",1,0,1),ParRange("contrast","r","Contrast in intensity",1,0,10),ParRange("bias","r","Bias in intensity",0.5,0,1),ParValue("show_plot","b","Display plot with image?",False),ParValue("clobber","b","Remove output files if they already exist?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['find_chandra_obsid'] = {
-    'istool': True,
-    'req': [ParValue("arg","s","RA, ObsId, or name of source",None),ParValue("dec","s","Dec of source if arg is not the ObsId/name",None)],
-    'opt': [ParRange("radius","r","Radius for search overlap in arcmin",1.0,0,None),ParSet("download","s","What ObsIDs should be downloaded?",'none',["none","ask","all"]),ParSet("instrument","s","Choice of instrument",'all',["all","acis","hrc","acisi","aciss","hrci","hrcs"]),ParSet("grating","s","Choice of grating",'all',["all","none","letg","hetg","any"]),ParSet("detail","s","Columns to display",'basic',["basic","obsid","all"]),ParValue("mirror","s","Use this instead of the CDA FTP site",None),ParRange("verbose","i","Verbose level",1,0,5)],
-    }
 
+    parinfo['evalpos'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image files",None),ParValue("ra","s","Input right ascension",None),ParValue("dec","s","Input declination",None)]',
+        'opt': '[ParValue("output","r","Output value (last in stack)",None),ParValue("tmpdir","f","Directory for temp. files",\'${ASCDS_WORK_PATH}\'),ParRange("verbose","i","Chatter level",0,0,5)]',
+        }
 
-parinfo['find_mono_energy'] = {
-    'istool': True,
-    'req': [ParValue("arffile","f","Input ARF file",None),ParValue("rmffile","f","Input RMF file",None),ParValue("model","s","Sherpa model expression",'xsphabs.abs1*xspowerlaw.pwrlaw'),ParValue("paramvals","s","Model parameter values",'pwrlaw.PhoIndex=2.0;abs1.nH=0.1'),ParValue("band","s","Energy band (CSC name, eg soft, or colon separated elo:ehi)",None)],
-    'opt': [ParSet("metric","s","Metric used to compute characteristic energy",'mean',["mean","max"]),ParValue("energy","f","Output energy",None),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['find_chandra_obsid'] = {
+        'istool': True,
+        'req': '[ParValue("arg","s","RA, ObsId, or name of source",None),ParValue("dec","s","Dec of source if arg is not the ObsId/name",None)]',
+        'opt': '[ParRange("radius","r","Radius for search overlap in arcmin",1.0,0,None),ParSet("download","s","What ObsIDs should be downloaded?",\'none\',["none","ask","all"]),ParSet("instrument","s","Choice of instrument",\'all\',["all","acis","hrc","acisi","aciss","hrci","hrcs"]),ParSet("grating","s","Choice of grating",\'all\',["all","none","letg","hetg","any"]),ParSet("detail","s","Columns to display",\'basic\',["basic","obsid","all"]),ParValue("mirror","s","Use this instead of the CDA FTP site",None),ParValue("index","f","Local archive index to search instead of the CDA",None),ParRange("verbose","i","Verbose level",1,0,5)]',
+        }
 
-parinfo['fine_astro'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event files",None),ParValue("outroot","f","Root of output files",None)],
-    'opt': [ParValue("src_lists","f","Input source list (leave blank to run wavdetect)",None),ParValue("ref_src_list","f","Reference source list (blank to use longest observation)",None),ParValue("det_filter","s","Filter to apply to source detect input files",None),ParValue("det_scales","s","Wavdetect scales",'1.4 2 4'),ParValue("src_filter","s","Filter to apply to output source lists from detect",None),ParSet("stop","s","Where to stop processing",'fineastro',["fineastro","mergeobs"]),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","Remove output file if it already exists?",False),ParValue("cleanup","b","Delete intermediary files?",True),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['find_mono_energy'] = {
+        'istool': True,
+        'req': '[ParValue("arffile","f","Input ARF file",None),ParValue("rmffile","f","Input RMF file",None),ParValue("model","s","Sherpa model expression",\'xsphabs.abs1*xspowerlaw.pwrlaw\'),ParValue("paramvals","s","Model parameter values",\'pwrlaw.PhoIndex=2.0;abs1.nH=0.1\'),ParValue("band","s","Energy band (CSC name, eg soft, or colon separated elo:ehi)",None)]',
+        'opt': '[ParSet("metric","s","Metric used to compute characteristic energy",\'mean\',["mean","max"]),ParValue("energy","f","Output energy",None),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['flux_obs'] = {
-    'istool': True,
-    'req': [ParValue("infiles","s","Input events files",None),ParValue("outroot","f","Root of output files",None)],
-    'opt': [ParValue("bands","s","Energy bands, comma-separated list, min:max:center in keV or ultrasoft, soft, medium, hard, broad, wide, CSC",'default'),ParValue("xygrid","s","xygrid for output or filename",None),ParRange("maxsize","i","Maximum image width or height in pixels",None,1,None),ParRange("binsize","r","Image binning factor",None,0,None),ParValue("asolfiles","s","Input aspect solutions",None),ParValue("badpixfiles","s","Input bad pixel files",None),ParValue("maskfiles","s","Input mask files",None),ParValue("dtffiles","s","Input dtf files for HRC observations",None),ParSet("units","s","Units for the exposure map",'default',["default","area","time"]),ParValue("expmapthresh","s","Remove low-exposure regions? '2%' excludes pixels where exposure is < 2% of the maximum",'1.5%'),ParSet("background","s","Method for background removal (HRC-I)",'default',["default","time","particle","none"]),ParValue("bkgparams","s","Optional argument for background subtraction",'[pi=300:500]'),ParRange("psfecf","r","If set, create PSF map with this ECF",None,0,1),ParSet("psfmerge","s","How are the PSF maps combined?",'min',["exptime","expmap","min","max","mean","median","mid"]),ParRange("random","i","random seed (0 = use time dependent seed)",0,0,None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("cleanup","b","Delete intermediary files?",True),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)],
-    }
 
+    parinfo['fine_astro'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event files",None),ParValue("outroot","f","Root of output files",None)]',
+        'opt': '[ParValue("src_lists","f","Input source list (leave blank to run wavdetect)",None),ParValue("ref_src_list","f","Reference source list (blank to use longest observation)",None),ParValue("det_filter","s","Filter to apply to source detect input files",None),ParValue("det_scales","s","Wavdetect scales",\'1.4 2 4\'),ParValue("src_filter","s","Filter to apply to output source lists from detect",None),ParSet("stop","s","Where to stop processing",\'fineastro\',["fineastro","mergeobs"]),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","Remove output file if it already exists?",False),ParValue("cleanup","b","Delete intermediary files?",True),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['fluximage'] = {
-    'istool': True,
-    'req': [ParValue("infile","s","Input events file",None),ParValue("outroot","f","Root of output files",None)],
-    'opt': [ParValue("bands","s","Energy bands, comma-separated list, min:max:center in keV or ultrasoft, soft, medium, hard, broad, wide, CSC",'default'),ParValue("xygrid","s","xygrid for output or filename",None),ParRange("binsize","r","Image binning factor",None,0,None),ParValue("asolfile","f","Input aspect solutions",None),ParValue("badpixfile","f","Input bad pixel file",None),ParValue("maskfile","f","Input mask file",None),ParValue("dtffile","f","Input dtf file for HRC observations",None),ParSet("units","s","Units for the exposure map",'default',["default","area","time"]),ParValue("expmapthresh","s","Remove low-exposure regions? '2%' excludes pixels where exposure is < 2% of the maximum",'1.5%'),ParSet("background","s","Method for background removal (HRC-I)",'default',["default","time","particle","none"]),ParValue("bkgparams","s","Optional argument for background subtraction",'[pi=300:500]'),ParRange("psfecf","r","If set, create PSF map with this ECF",None,0,1),ParRange("random","i","random seed (0 = use time dependent seed)",0,0,None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("cleanup","b","Delete intermediary files?",True),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)],
-    }
 
+    parinfo['flux_obs'] = {
+        'istool': True,
+        'req': '[ParValue("infiles","s","Input events files",None),ParValue("outroot","f","Root of output files",None)]',
+        'opt': '[ParValue("bands","s","Energy bands, comma-separated list, min:max:center in keV or ultrasoft, soft, medium, hard, broad, wide, CSC",\'default\'),ParValue("xygrid","s","xygrid for output or filename",None),ParRange("maxsize","i","Maximum image width or height in pixels",None,1,None),ParRange("binsize","r","Image binning factor",None,0,None),ParValue("asolfiles","s","Input aspect solutions",None),ParValue("badpixfiles","s","Input bad pixel files",None),ParValue("maskfiles","s","Input mask files",None),ParValue("dtffiles","s","Input dtf files for HRC observations",None),ParSet("units","s","Units for the exposure map",\'default\',["default","area","time"]),ParValue("expmapthresh","s","Remove low-exposure regions? \'2%\' excludes pixels where exposure is < 2% of the maximum",\'1.5%\'),ParSet("background","s","Method for background removal (HRC-I)",\'default\',["default","time","particle","none"]),ParValue("bkgparams","s","Optional argument for background subtraction",\'[pi=300:500]\'),ParRange("psfecf","r","If set, create PSF map with this ECF",None,0,1),ParSet("psfmerge","s","How are the PSF maps combined?",\'min\',["exptime","expmap","min","max","mean","median","mid"]),ParRange("psfmemory","i","Memory, in MB, used to weight the PSF maps by exposure",256,1,None),ParRange("random","i","random seed (0 = use time dependent seed)",0,0,None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("cleanup","b","Delete intermediary files?",True),ParValue("dryrun","b","Only report the memory estimates?",False),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)]',
+        }
 
-parinfo['fullgarf'] = {
-    'istool': True,
-    'req': [ParValue("phafile","f","Input PHA file (Type I or II)",None),ParRange("pharow","i","Row in Type II PHA file (ignored if Type I)",1,0,99),ParValue("evtfile","f","Event file",None),ParValue("asol","f","Aspect offsets file",None),ParValue("engrid","f","Energy grid spec",None),ParValue("dtffile","s","Dead time correction factor; ACIS->evt file; HRC -> dtf file",')evtfile'),ParValue("badpix","f","Bad pixel file; (filename|NONE|CALDB)",None),ParValue("rootname","s","Output rootname",None),ParValue("maskfile","s","NONE, or name of ACIS window mask file",None)],
-    'opt': [ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",'CALDB'),ParValue("osipfile","s","NONE or Name of fits file with order sorting info",'CALDB'),ParValue("ardlibqual","s","Additional ardlib qualifiers",None),ParValue("clobber","b","Clobber existing output files? This is passed to ALL child processes.",False),ParRange("verbose","i","Control the level of diagnostic output. 0=>least.",0,0,5)],
-    }
 
+    parinfo['fluximage'] = {
+        'istool': True,
+        'req': '[ParValue("infile","s","Input events file",None),ParValue("outroot","f","Root of output files",None)]',
+        'opt': '[ParValue("bands","s","Energy bands, comma-separated list, min:max:center in keV or ultrasoft, soft, medium, hard, broad, wide, CSC",\'default\'),ParValue("xygrid","s","xygrid for output or filename",None),ParRange("binsize","r","Image binning factor",None,0,None),ParValue("asolfile","f","Input aspect solutions",None),ParValue("badpixfile","f","Input bad pixel file",None),ParValue("maskfile","f","Input mask file",None),ParValue("dtffile","f","Input dtf file for HRC observations",None),ParSet("units","s","Units for the exposure map",\'default\',["default","area","time"]),ParValue("expmapthresh","s","Remove low-exposure regions? \'2%\' excludes pixels where exposure is < 2% of the maximum",\'1.5%\'),ParSet("background","s","Method for background removal (HRC-I)",\'default\',["default","time","particle","none"]),ParValue("bkgparams","s","Optional argument for background subtraction",\'[pi=300:500]\'),ParRange("psfecf","r","If set, create PSF map with this ECF",None,0,1),ParRange("random","i","random seed (0 = use time dependent seed)",0,0,None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("cleanup","b","Delete intermediary files?",True),ParValue("dryrun","b","Only report the memory estimates?",False),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)]',
+        }
 
-parinfo['geom'] = {
-    'istool': False,
-    'req': [],
-    'opt': [ParValue("instruments","s","Instrument geometry ARD",'CALDB'),ParValue("aimpoints","s","Aimpoints ARD",'CALDB'),ParValue("tdet","s","TDET systems ARD",'CALDB'),ParValue("sky","s","SKY systems ARD",'CALDB'),ParValue("shell","s","Grating Shell systems ARD",'CALDB'),ParValue("obsfile","s","file containing start time/date for the CALDB above",None)],
-    }
 
+    parinfo['fullgarf'] = {
+        'istool': True,
+        'req': '[ParValue("phafile","f","Input PHA file (Type I or II)",None),ParRange("pharow","i","Row in Type II PHA file (ignored if Type I)",1,0,99),ParValue("evtfile","f","Event file",None),ParValue("asol","f","Aspect offsets file",None),ParValue("engrid","f","Energy grid spec",None),ParValue("dtffile","s","Dead time correction factor; ACIS->evt file; HRC -> dtf file",\')evtfile\'),ParValue("badpix","f","Bad pixel file; (filename|NONE|CALDB)",None),ParValue("rootname","s","Output rootname",None),ParValue("maskfile","s","NONE, or name of ACIS window mask file",None)]',
+        'opt': '[ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",\'CALDB\'),ParValue("osipfile","s","NONE or Name of fits file with order sorting info",\'CALDB\'),ParValue("ardlibqual","s","Additional ardlib qualifiers",None),ParValue("clobber","b","Clobber existing output files? This is passed to ALL child processes.",False),ParRange("verbose","i","Control the level of diagnostic output. 0=>least.",0,0,5)]',
+        }
 
-parinfo['get_dither_parameters'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input aspect solution file",None)],
-    'opt': [ParSet("method","s","Method to estimate dither parameters",'fold',["fold","fit","fft"]),ParValue("dety_amplitude","r","Amplitude in DETY direction [arcsec]",None),ParValue("detz_amplitude","r","Amplitude in the DETZ direction [arcsec]",None),ParValue("dety_period","r","Period in DETY direction [sec]",None),ParValue("detz_period","r","Period in DETZ direction [sec]",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['geom'] = {
+        'istool': False,
+        'req': '[]',
+        'opt': '[ParValue("instruments","s","Instrument geometry ARD",\'CALDB\'),ParValue("aimpoints","s","Aimpoints ARD",\'CALDB\'),ParValue("tdet","s","TDET systems ARD",\'CALDB\'),ParValue("sky","s","SKY systems ARD",\'CALDB\'),ParValue("shell","s","Grating Shell systems ARD",\'CALDB\'),ParValue("obsfile","s","file containing start time/date for the CALDB above",None)]',
+        }
 
-parinfo['get_fov_limits'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","The FOV file to use",None)],
-    'opt': [ParRange("pixsize","r","Pixel size",1,0,None),ParValue("dmfilter","s","DM filter syntax to match FOV file",None),ParValue("xygrid","s","xygrid parameter for mkexpmap to match FOV file",None),ParRange("verbose","i","Debug Level (0-5)",1,0,5)],
-    }
 
+    parinfo['get_dither_parameters'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input aspect solution file",None)]',
+        'opt': '[ParSet("method","s","Method to estimate dither parameters",\'fold\',["fold","fit","fft"]),ParValue("dety_amplitude","r","Amplitude in DETY direction [arcsec]",None),ParValue("detz_amplitude","r","Amplitude in the DETZ direction [arcsec]",None),ParValue("dety_period","r","Period in DETY direction [sec]",None),ParValue("detz_period","r","Period in DETZ direction [sec]",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['get_sky_limits'] = {
-    'istool': True,
-    'req': [ParValue("image","f","Image for which you want to know the binning",None)],
-    'opt': [ParRange("precision","i","Precision [# decimal points] for output numbers",1,0,None),ParValue("dmfilter","s","DM filter syntax to match image",None),ParValue("xygrid","s","xygrid parameter for mkexpmap to match image",None),ParRange("verbose","i","Debug Level (0-5)",1,0,5)],
-    }
 
+    parinfo['get_fov_limits'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","The FOV file to use",None)]',
+        'opt': '[ParRange("pixsize","r","Pixel size",1,0,None),ParValue("dmfilter","s","DM filter syntax to match FOV file",None),ParValue("xygrid","s","xygrid parameter for mkexpmap to match FOV file",None),ParRange("verbose","i","Debug Level (0-5)",1,0,5)]',
+        }
 
-parinfo['get_src_region'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output source region file",None)],
-    'opt': [ParValue("binning","s","binning specification [a]:[b][:c] | c",'1'),ParValue("sigma_factor","r","sigma factor",5),ParValue("niter","i","number of iterations",5),ParValue("invert","b","invert region logic",False),ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Verbosity level (0=none, 5=most)",0,0,5)],
-    }
 
+    parinfo['get_sky_limits'] = {
+        'istool': True,
+        'req': '[ParValue("image","f","Image for which you want to know the binning",None)]',
+        'opt': '[ParRange("precision","i","Precision [# decimal points] for output numbers",1,0,None),ParValue("dmfilter","s","DM filter syntax to match image",None),ParValue("xygrid","s","xygrid parameter for mkexpmap to match image",None),ParRange("verbose","i","Debug Level (0-5)",1,0,5)]',
+        }
 
-parinfo['glvary'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file specification",None),ParValue("outfile","f","Output: probabilities as a function of m",None),ParValue("lcfile","f","Output: resulting light curve",None),ParValue("effile","f","Input file efficiency factors",None)],
-    'opt': [ParValue("probfile","f","Input probability file for background",'NONE'),ParRange("frac","r","Fraction of events to be included in subsample",1.0,0,1),ParRange("seed","i","Seed for random subsample selection",1,None,1),ParRange("mmax","i","Maximum number of model bins",None,None,3600),ParValue("mmin","i","Minimum number of model bins",None),ParRange("nbin","i","Number of bins to use in light curve",0,None,10800),ParValue("mintime","i","Range of binnings, maximum resolution in seconds",50),ParValue("clobber","b","Overwrite output files if they exist?",False),ParRange("verbose","i","Tool chatter level",0,0,0)],
-    }
 
+    parinfo['get_src_region'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output source region file",None)]',
+        'opt': '[ParValue("binning","s","binning specification [a]:[b][:c] | c",\'1\'),ParValue("sigma_factor","r","sigma factor",5),ParValue("niter","i","number of iterations",5),ParValue("invert","b","invert region logic",False),ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Verbosity level (0=none, 5=most)",0,0,5)]',
+        }
 
-parinfo['gti_align'] = {
-    'istool': True,
-    'req': [ParValue("times","f","Input GTI file or time filter string",None),ParValue("statfile","f","Input exposure statistics, stat1.fits, file",None),ParValue("outfile","f","Output GTI file",None)],
-    'opt': [ParValue("evtfile","f","Event file used to correctly order the per chip GTIs",None),ParValue("clobber","b","Overwrite existing output file if it exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['glvary'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file specification",None),ParValue("outfile","f","Output: probabilities as a function of m",None),ParValue("lcfile","f","Output: resulting light curve",None),ParValue("effile","f","Input file efficiency factors",None)]',
+        'opt': '[ParValue("probfile","f","Input probability file for background",\'NONE\'),ParRange("frac","r","Fraction of events to be included in subsample",1.0,0,1),ParRange("seed","i","Seed for random subsample selection",1,None,1),ParRange("mmax","i","Maximum number of model bins",None,None,3600),ParValue("mmin","i","Minimum number of model bins",None),ParRange("nbin","i","Number of bins to use in light curve",0,None,10800),ParValue("mintime","i","Range of binnings, maximum resolution in seconds",50),ParValue("clobber","b","Overwrite output files if they exist?",False),ParRange("verbose","i","Tool chatter level",0,0,0)]',
+        }
 
-parinfo['hexgrid'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output hexagon grid image",None),ParRange("sidelen","r","Side length of hexagons",10,3,None)],
-    'opt': [ParValue("binimg","f","Output image file",None),ParValue("xref","r","X coordinate of reference point (image coordinates)",0),ParValue("yref","r","Y coordinate of reference point (image coordinates)",0),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)],
-    }
 
+    parinfo['gti_align'] = {
+        'istool': True,
+        'req': '[ParValue("times","f","Input GTI file or time filter string",None),ParValue("statfile","f","Input exposure statistics, stat1.fits, file",None),ParValue("outfile","f","Output GTI file",None)]',
+        'opt': '[ParValue("evtfile","f","Event file used to correctly order the per chip GTIs",None),ParValue("clobber","b","Overwrite existing output file if it exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['hrc_bkgrnd_lookup'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","The file for which you want a background file",None),ParSet("caltype","s","What type of background file?",'event',["event","spectrum"])],
-    'opt': [ParValue("outfile","f","HRC background file to use",None),ParSet("blname","s","What block identifier should be added to the filename?",'none',["none","name","number","cfitsio"]),ParRange("verbose","i","Debug level (0=no debug information)",0,0,5)],
-    }
 
+    parinfo['hexgrid'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output hexagon grid image",None),ParRange("sidelen","r","Side length of hexagons",10,3,None)]',
+        'opt': '[ParValue("binimg","f","Output image file",None),ParValue("xref","r","X coordinate of reference point (image coordinates)",0),ParValue("yref","r","Y coordinate of reference point (image coordinates)",0),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)]',
+        }
 
-parinfo['hrc_build_badpix'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input (ARD) bad pixel file",'CALDB'),ParValue("outfile","f","Output (Level 1) bad pixel file",None),ParValue("obsfile","f","Input observation parameter file",None),ParValue("degapfile","f","Input degap file (NONE | none | COEFF | <filename>)",'CALDB')],
-    'opt': [ParValue("cfu1","r","u axis 1st order cor. factor",1.0),ParValue("cfu2","r","u axis 2nd order cor. factor",0.0),ParValue("cfv1","r","v axis 1st order cor. factor",1.0),ParValue("cfv2","r","v axis 2nd order cor. factor",0.0),ParValue("logfile","f","Output debug log file (<filename>, NONE, STDOUT)",'STDOUT'),ParValue("clobber","b","Overwrite output file(s) if already exists?",False),ParRange("verbose","i","Debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['hrc_bkgrnd_lookup'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","The file for which you want a background file",None),ParSet("caltype","s","What type of background file?",\'event\',["event","spectrum"])]',
+        'opt': '[ParValue("outfile","f","HRC background file to use",None),ParSet("blname","s","What block identifier should be added to the filename?",\'none\',["none","name","number","cfitsio"]),ParRange("verbose","i","Debug level (0=no debug information)",0,0,5)]',
+        }
 
-parinfo['hrc_dtfstats'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file",None),ParValue("outfile","f","Output file",None),ParValue("gtifile","f","File containing GTI to filter on (<filename>|NONE)",'NONE')],
-    'opt': [ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("maincol","s","Name of the deadtime factor column",'DTF'),ParValue("errcol","s","Name of the deadtime factor error column",'DTF_ERR'),ParValue("chisqlim","r","Limit for the variability test",5),ParValue("clobber","b","Clobber the output file if it exists",False),ParRange("verbose","i","Verbose level.",0,0,5)],
-    }
 
+    parinfo['hrc_build_badpix'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input (ARD) bad pixel file",\'CALDB\'),ParValue("outfile","f","Output (Level 1) bad pixel file",None),ParValue("obsfile","f","Input observation parameter file",None),ParValue("degapfile","f","Input degap file (NONE | none | COEFF | <filename>)",\'CALDB\')]',
+        'opt': '[ParValue("cfu1","r","u axis 1st order cor. factor",1.0),ParValue("cfu2","r","u axis 2nd order cor. factor",0.0),ParValue("cfv1","r","v axis 1st order cor. factor",1.0),ParValue("cfv2","r","v axis 2nd order cor. factor",0.0),ParValue("logfile","f","Output debug log file (<filename>, NONE, STDOUT)",\'STDOUT\'),ParValue("clobber","b","Overwrite output file(s) if already exists?",False),ParRange("verbose","i","Debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['hrc_process_events'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input level 0 event file/stack",None),ParValue("outfile","f","output level 1 file",None),ParValue("badpixfile","f","bad pixel file ( NONE | none | <filename>)",'NONE'),ParValue("acaofffile","f","aspect offset file ( NONE | none | <filename>)",'NONE')],
-    'opt': [ParValue("obsfile","f","obs.par file for output file keywords ( NONE | none | <filename>)",'NONE'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("do_ratio","b","perform ratio validity checks",True),ParValue("do_amp_sf_cor","b","perform amp_sf correction (y/n) ?",True),ParValue("gainfile","f","gain correction image file ( NONE | none | <filename>)",'CALDB'),ParValue("ADCfile","f","ADC correction table file ( NONE | none | <filename>)",'NONE'),ParValue("degapfile","f","degap factors (NONE | none | COEFF | <filename>)",'CALDB'),ParValue("hypfile","f","Hyperbolic test coefficients file ( NONE | none | <filename>)",'CALDB'),ParValue("ampsfcorfile","f","caldb file for amp_sf_correction( NONE | none | <filename>)",'CALDB'),ParValue("tapfile","f","tap ring test coefficients file ( NONE | none | <filename>)",'CALDB'),ParValue("ampsatfile","f","ADC saturation test file ( NONE | none | <filename>)",'CALDB'),ParValue("evtflatfile","f","Event flatness test file ( NONE | none | <filename>)",'CALDB'),ParValue("badfile","f","output level 1 bad event file",'lev1_bad_evts.fits'),ParValue("logfile","f","debug log file (STDOUT | stdout | <filename>)",'stdout'),ParValue("eventdef","s","output format definition",')stdlev1'),ParValue("badeventdef","s","output format definition",')badlev1'),ParRange("grid_ratio","r","charge ratio",0.5,0.0,1.0),ParRange("pha_ratio","r","pha ratio",0.5,0.0,1.0),ParValue("wire_charge","i","turn on center wire test (-1=off,0=on)",0),ParValue("cfu1","r","u axis 1st order cor. factor",1.0),ParValue("cfu2","r","u axis 2nd order cor. factor",0.0),ParValue("cfv1","r","v axis 1st order cor. factor",1.0),ParValue("cfv2","r","v axis 2nd order cor. factor",0.0),ParValue("amp_gain","r","amp gain",75.0),ParRange("rand_seed","i","random seed (for pixlib), 0 = use time dependent seed",1,0,32767),ParSet("rand_pix_size","r","pixel randomization width (-size..+size), 0.0=no randomization",0.0,[0.0,0.5]),ParSet("start","s","start transformations at",'coarse',["coarse","chip","tdet"]),ParSet("stop","s","end transformations at",'sky',["none","chip","tdet","det","sky"]),ParValue("stdlev1","s","event format definition string",'{d:time,s:crsv,s:crsu,s:amp_sf,s:av1,s:av2,s:av3,s:au1,s:au2,s:au3,l:raw,s:chip,l:tdet,f:det,f:sky,f:samp,s:pha,s:pi,s:sumamps,s:chip_id,x:status}'),ParValue("badlev1","s","event format definition string",'{d:time,s:crsu,s:crsv,s:au1,s:au2,s:au3,s:av1,s:av2,s:av3,f:samp,s:pha}'),ParValue("hsilev1","s","event format definition string",'{d:time,s:crsu,s:crsv,s:au1,s:au2,s:au3,s:av1,s:av2,s:av3,s:chipx,s:chipy,s:tdetx,s:tdety,s:x,s:y,l:fpz,f:samp,s:pha,s:vstat,s:estat}'),ParValue("simlev1","s","sim event definition string",'{l:tick,i:scifr,i:mjf,s:mnf,s:evtctr,s:crsu,s:crsv,s:au1,s:au2,s:au3,s:av1,s:av2,s:av3,s:tdetx,s:tdety,f:samp,s:pha,s:vstat,s:estat}'),ParValue("fltlev1","s","event format definition string",'{d:time,s:crsv,s:crsu,s:amp_sf,s:av1,s:av2,s:av3,s:au1,s:au2,s:au3,s:chipx,s:chipy,l:tdetx,l:tdety,s:detx,s:dety,s:x,s:y,f:samp,s:pha,s:sumamps,s:chip_id,l:status}'),ParValue("clobber","b","Overwrite output event file if it already exists?",False),ParRange("verbose","i","level of debug detail (0=none, 5=most)",0,0,5)],
-    }
 
+    parinfo['hrc_dtfstats'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file",None),ParValue("outfile","f","Output file",None),ParValue("gtifile","f","File containing GTI to filter on (<filename>|NONE)",\'NONE\')]',
+        'opt': '[ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("maincol","s","Name of the deadtime factor column",\'DTF\'),ParValue("errcol","s","Name of the deadtime factor error column",\'DTF_ERR\'),ParValue("chisqlim","r","Limit for the variability test",5),ParValue("clobber","b","Clobber the output file if it exists",False),ParRange("verbose","i","Verbose level.",0,0,5)]',
+        }
 
-parinfo['imagej_lut'] = {
-    'istool': False,
-    'req': [],
-    'opt': [ParValue("amber","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/amber.lut'),ParValue("auxctq","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/auxctq.lut'),ParValue("blue_orange","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/blue_orange.lut'),ParValue("blue_orange_icb","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/blue_orange_icb.lut'),ParValue("brain","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/brain.lut'),ParValue("brgbcmyw","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/brgbcmyw.lut'),ParValue("cells","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cells.lut'),ParValue("cequal","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cequal.lut'),ParValue("cmy-cyan","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cmy-cyan.lut'),ParValue("cmy-magneta","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cmy-magneta.lut'),ParValue("cmy-yellow","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cmy-yellow.lut'),ParValue("cmy","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cmy.lut'),ParValue("cold","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cold.lut'),ParValue("cti_ras","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/cti_ras.lut'),ParValue("edges","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/edges.lut'),ParValue("gem-16","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/gem-16.lut'),ParValue("gem-256","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/gem-256.lut'),ParValue("gold","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/gold.lut'),ParValue("gyr_centre","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/gyr_centre.lut'),ParValue("heart","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/heart.lut'),ParValue("hue","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/hue.lut'),ParValue("hue_ramps_08","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/hue_ramps_08.lut'),ParValue("hue_ramps_16","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/hue_ramps_16.lut'),ParValue("icool","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/icool.lut'),ParValue("iman","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/iman.lut'),ParValue("invert_gray","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/invert_gray.lut'),ParValue("isocontour","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/isocontour.lut'),ParValue("log_down","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/log_down.lut'),ParValue("log_up","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/log_up.lut'),ParValue("mixed","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/mixed.lut'),ParValue("neon-blue","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/neon-blue.lut'),ParValue("neon-green","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/neon-green.lut'),ParValue("neon-magenta","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/neon-magenta.lut'),ParValue("neon-red","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/neon-red.lut'),ParValue("pastel","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pastel.lut'),ParValue("rgb-blue","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/rgb-blue.lut'),ParValue("rgb-green","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/rgb-green.lut'),ParValue("rgb-red","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/rgb-red.lut'),ParValue("royal","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/royal.lut'),ParValue("sepia","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/sepia.lut'),ParValue("siemens","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/siemens.lut'),ParValue("smart","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/smart.lut'),ParValue("split_blackblue_redwhite","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/split_blackblue_redwhite.lut'),ParValue("split_blackwhite_ge","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/split_blackwhite_ge.lut'),ParValue("split_blackwhite_warmmetal","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/split_blackwhite_warmmetal.lut'),ParValue("split_bluered_warmmetal","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/split_bluered_warmmetal.lut'),ParValue("system_lut","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/system_lut.lut'),ParValue("thal_16","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/thal_16.lut'),ParValue("thal_256","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/thal_256.lut'),ParValue("thallium","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/thallium.lut'),ParValue("topography","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/topography.lut'),ParValue("unionjack","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/unionjack.lut'),ParValue("vivid","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vivid.lut'),ParValue("warhol","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/warhol.lut')],
-    }
 
+    parinfo['hrc_process_events'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input level 0 event file/stack",None),ParValue("outfile","f","output level 1 file",None),ParValue("badpixfile","f","bad pixel file ( NONE | none | <filename>)",\'NONE\'),ParValue("acaofffile","f","aspect offset file ( NONE | none | <filename>)",\'NONE\')]',
+        'opt': '[ParValue("obsfile","f","obs.par file for output file keywords ( NONE | none | <filename>)",\'NONE\'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("do_ratio","b","perform ratio validity checks",True),ParValue("do_amp_sf_cor","b","perform amp_sf correction (y/n) ?",True),ParValue("gainfile","f","gain correction image file ( NONE | none | <filename>)",\'CALDB\'),ParValue("ADCfile","f","ADC correction table file ( NONE | none | <filename>)",\'NONE\'),ParValue("degapfile","f","degap factors (NONE | none | COEFF | <filename>)",\'CALDB\'),ParValue("hypfile","f","Hyperbolic test coefficients file ( NONE | none | <filename>)",\'CALDB\'),ParValue("ampsfcorfile","f","caldb file for amp_sf_correction( NONE | none | <filename>)",\'CALDB\'),ParValue("tapfile","f","tap ring test coefficients file ( NONE | none | <filename>)",\'CALDB\'),ParValue("ampsatfile","f","ADC saturation test file ( NONE | none | <filename>)",\'CALDB\'),ParValue("evtflatfile","f","Event flatness test file ( NONE | none | <filename>)",\'CALDB\'),ParValue("badfile","f","output level 1 bad event file",\'lev1_bad_evts.fits\'),ParValue("logfile","f","debug log file (STDOUT | stdout | <filename>)",\'stdout\'),ParValue("eventdef","s","output format definition",\')stdlev1\'),ParValue("badeventdef","s","output format definition",\')badlev1\'),ParRange("grid_ratio","r","charge ratio",0.5,0.0,1.0),ParRange("pha_ratio","r","pha ratio",0.5,0.0,1.0),ParValue("wire_charge","i","turn on center wire test (-1=off,0=on)",0),ParValue("cfu1","r","u axis 1st order cor. factor",1.0),ParValue("cfu2","r","u axis 2nd order cor. factor",0.0),ParValue("cfv1","r","v axis 1st order cor. factor",1.0),ParValue("cfv2","r","v axis 2nd order cor. factor",0.0),ParValue("amp_gain","r","amp gain",75.0),ParRange("rand_seed","i","random seed (for pixlib), 0 = use time dependent seed",1,0,32767),ParSet("rand_pix_size","r","pixel randomization width (-size..+size), 0.0=no randomization",0.0,[0.0,0.5]),ParSet("start","s","start transformations at",\'coarse\',["coarse","chip","tdet"]),ParSet("stop","s","end transformations at",\'sky\',["none","chip","tdet","det","sky"]),ParValue("stdlev1","s","event format definition string",\'{d:time,s:crsv,s:crsu,s:amp_sf,s:av1,s:av2,s:av3,s:au1,s:au2,s:au3,l:raw,s:chip,l:tdet,f:det,f:sky,f:samp,s:pha,s:pi,s:sumamps,s:chip_id,x:status}\'),ParValue("badlev1","s","event format definition string",\'{d:time,s:crsu,s:crsv,s:au1,s:au2,s:au3,s:av1,s:av2,s:av3,f:samp,s:pha}\'),ParValue("hsilev1","s","event format definition string",\'{d:time,s:crsu,s:crsv,s:au1,s:au2,s:au3,s:av1,s:av2,s:av3,s:chipx,s:chipy,s:tdetx,s:tdety,s:x,s:y,l:fpz,f:samp,s:pha,s:vstat,s:estat}\'),ParValue("simlev1","s","sim event definition string",\'{l:tick,i:scifr,i:mjf,s:mnf,s:evtctr,s:crsu,s:crsv,s:au1,s:au2,s:au3,s:av1,s:av2,s:av3,s:tdetx,s:tdety,f:samp,s:pha,s:vstat,s:estat}\'),ParValue("fltlev1","s","event format definition string",\'{d:time,s:crsv,s:crsu,s:amp_sf,s:av1,s:av2,s:av3,s:au1,s:au2,s:au3,s:chipx,s:chipy,l:tdetx,l:tdety,s:detx,s:dety,s:x,s:y,f:samp,s:pha,s:sumamps,s:chip_id,l:status}\'),ParValue("clobber","b","Overwrite output event file if it already exists?",False),ParRange("verbose","i","level of debug detail (0=none, 5=most)",0,0,5)]',
+        }
 
-parinfo['imgmoment'] = {
-    'istool': True,
-    'req': [ParValue("infile","s","Input image",None)],
-    'opt': [ParValue("x_mu","r","X-centroid",None),ParValue("y_mu","r","Y-centroid",None),ParValue("m_0_0","r","0th moment",None),ParValue("m_0_1","r","M_0_1 moment",None),ParValue("m_1_0","r","M_1_0 moment",None),ParValue("m_1_1","r","M_1_1 moment",None),ParValue("m_0_2","r","M_0_2 moment",None),ParValue("m_2_0","r","M_2_0 moment",None),ParValue("m_1_2","r","M_1_2 moment",None),ParValue("m_2_1","r","M_2_1 moment",None),ParValue("m_2_2","r","M_2_2 moment",None),ParValue("phi","r","Angle from moment",None),ParValue("eccen","r","Eccentricity from moment",None),ParValue("xsig","r","1 sigma in X axis after rotation by phi",None),ParValue("ysig","r","1 sigma in Y axis after rotation by phi",None)],
-    }
 
+    parinfo['imagej_lut'] = {
+        'istool': False,
+        'req': '[]',
+        'opt': '[ParValue("amber","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/amber.lut\'),ParValue("auxctq","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/auxctq.lut\'),ParValue("blue_orange","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/blue_orange.lut\'),ParValue("blue_orange_icb","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/blue_orange_icb.lut\'),ParValue("brain","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/brain.lut\'),ParValue("brgbcmyw","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/brgbcmyw.lut\'),ParValue("cells","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cells.lut\'),ParValue("cequal","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cequal.lut\'),ParValue("cmy-cyan","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cmy-cyan.lut\'),ParValue("cmy-magneta","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cmy-magneta.lut\'),ParValue("cmy-yellow","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cmy-yellow.lut\'),ParValue("cmy","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cmy.lut\'),ParValue("cold","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cold.lut\'),ParValue("cti_ras","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/cti_ras.lut\'),ParValue("edges","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/edges.lut\'),ParValue("gem-16","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/gem-16.lut\'),ParValue("gem-256","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/gem-256.lut\'),ParValue("gold","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/gold.lut\'),ParValue("gyr_centre","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/gyr_centre.lut\'),ParValue("heart","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/heart.lut\'),ParValue("hue","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/hue.lut\'),ParValue("hue_ramps_08","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/hue_ramps_08.lut\'),ParValue("hue_ramps_16","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/hue_ramps_16.lut\'),ParValue("icool","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/icool.lut\'),ParValue("iman","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/iman.lut\'),ParValue("invert_gray","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/invert_gray.lut\'),ParValue("isocontour","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/isocontour.lut\'),ParValue("log_down","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/log_down.lut\'),ParValue("log_up","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/log_up.lut\'),ParValue("mixed","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/mixed.lut\'),ParValue("neon-blue","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/neon-blue.lut\'),ParValue("neon-green","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/neon-green.lut\'),ParValue("neon-magenta","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/neon-magenta.lut\'),ParValue("neon-red","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/neon-red.lut\'),ParValue("pastel","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pastel.lut\'),ParValue("rgb-blue","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/rgb-blue.lut\'),ParValue("rgb-green","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/rgb-green.lut\'),ParValue("rgb-red","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/rgb-red.lut\'),ParValue("royal","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/royal.lut\'),ParValue("sepia","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/sepia.lut\'),ParValue("siemens","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/siemens.lut\'),ParValue("smart","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/smart.lut\'),ParValue("split_blackblue_redwhite","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/split_blackblue_redwhite.lut\'),ParValue("split_blackwhite_ge","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/split_blackwhite_ge.lut\'),ParValue("split_blackwhite_warmmetal","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/split_blackwhite_warmmetal.lut\'),ParValue("split_bluered_warmmetal","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/split_bluered_warmmetal.lut\'),ParValue("system_lut","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/system_lut.lut\'),ParValue("thal_16","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/thal_16.lut\'),ParValue("thal_256","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/thal_256.lut\'),ParValue("thallium","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/thallium.lut\'),ParValue("topography","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/topography.lut\'),ParValue("unionjack","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/unionjack.lut\'),ParValue("vivid","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vivid.lut\'),ParValue("warhol","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/warhol.lut\')]',
+        }
 
-parinfo['lim_sens'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Enter background file name",None),ParValue("psffile","f","Enter PSF file name",None),ParValue("outfile","f","Enter output file name",None)],
-    'opt': [ParValue("expfile","f","Exposure file",None),ParValue("rbkfile","f","Random background map name",None),ParValue("bscale","i","alpha * Es value",5),ParValue("snr_limit","r","Signal to Noise ratio",3),ParValue("const_r","b","Use a constant background ratio (bscale^2 - 1)?",False),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['imgmoment'] = {
+        'istool': True,
+        'req': '[ParValue("infile","s","Input image",None)]',
+        'opt': '[ParValue("x_mu","r","X-centroid",None),ParValue("y_mu","r","Y-centroid",None),ParValue("m_0_0","r","0th moment",None),ParValue("m_0_1","r","M_0_1 moment",None),ParValue("m_1_0","r","M_1_0 moment",None),ParValue("m_1_1","r","M_1_1 moment",None),ParValue("m_0_2","r","M_0_2 moment",None),ParValue("m_2_0","r","M_2_0 moment",None),ParValue("m_1_2","r","M_1_2 moment",None),ParValue("m_2_1","r","M_2_1 moment",None),ParValue("m_2_2","r","M_2_2 moment",None),ParValue("phi","r","Angle from moment",None),ParValue("eccen","r","Eccentricity from moment",None),ParValue("xsig","r","1 sigma in X axis after rotation by phi",None),ParValue("ysig","r","1 sigma in Y axis after rotation by phi",None)]',
+        }
 
-parinfo['lut'] = {
-    'istool': False,
-    'req': [],
-    'opt': [ParValue("a","s","Color lookup table",'${ASCDS_CALIB}/a.lut'),ParValue("aips","s","Color lookup table",'${ASCDS_CALIB}/aips.lut'),ParValue("b","s","Color lookup table",'${ASCDS_CALIB}/b.lut'),ParValue("bb","s","Color lookup table",'${ASCDS_CALIB}/bb.lut'),ParValue("blue","s","Color lookup table",'${ASCDS_CALIB}/blue.lut'),ParValue("color","s","Color lookup table",'${ASCDS_CALIB}/color.lut'),ParValue("cool","s","Color lookup table",'${ASCDS_CALIB}/cool.lut'),ParValue("green","s","Color lookup table",'${ASCDS_CALIB}/green.lut'),ParValue("grey","s","Color lookup table",'${ASCDS_CALIB}/grey.lut'),ParValue("halley","s","Color lookup table",'${ASCDS_CALIB}/halley.lut'),ParValue("heaob","s","Color lookup table",'${ASCDS_CALIB}/heaob.lut'),ParValue("heat","s","Color lookup table",'${ASCDS_CALIB}/heat.lut'),ParValue("hsv","s","Color lookup table",'${ASCDS_CALIB}/hsv.lut'),ParValue("i8","s","Color lookup table",'${ASCDS_CALIB}/i8.lut'),ParValue("rainbow1","s","Color lookup table",'${ASCDS_CALIB}/rainbow1.lut'),ParValue("rainbow2","s","Color lookup table",'${ASCDS_CALIB}/rainbow2.lut'),ParValue("ramp","s","Color lookup table",'${ASCDS_CALIB}/ramp.lut'),ParValue("red","s","Color lookup table",'${ASCDS_CALIB}/red.lut'),ParValue("sls","s","Color lookup table",'${ASCDS_CALIB}/sls.lut'),ParValue("staircase","s","Color lookup table",'${ASCDS_CALIB}/staircase.lut'),ParValue("standard","s","Color lookup table",'${ASCDS_CALIB}/standard.lut')],
-    }
 
+    parinfo['lim_sens'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Enter background file name",None),ParValue("psffile","f","Enter PSF file name",None),ParValue("outfile","f","Enter output file name",None)]',
+        'opt': '[ParValue("expfile","f","Exposure file",None),ParValue("rbkfile","f","Random background map name",None),ParValue("bscale","i","alpha * Es value",5),ParValue("snr_limit","r","Signal to Noise ratio",3),ParValue("const_r","b","Use a constant background ratio (bscale^2 - 1)?",False),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['make_instmap_weights'] = {
-    'istool': True,
-    'req': [ParValue("outfile","f","Instrument map weighting file",None),ParValue("model","s","Sherpa model definition string",None),ParValue("paramvals","s","';' delimited string of (parameter=value) pairs",None),ParRange("emin","r","Energy range lower bound for flux (keV)",None,0,None),ParValue("emax","r","Energy range upper bound for flux (keV)",None),ParValue("ewidth","r","Energy bin-size for flux (keV)",None)],
-    'opt': [ParSet("abund","s","set XSpec solar abundance",'angr',["angr","feld","aneb","grsa","wilm","lodd"]),ParSet("xsect","s","set XSpec photoelectric cross-section",'vern',["bcmc","obcm","vern"]),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level?",3,0,5)],
-    }
 
+    parinfo['lut'] = {
+        'istool': False,
+        'req': '[]',
+        'opt': '[ParValue("a","s","Color lookup table",\'${ASCDS_CALIB}/a.lut\'),ParValue("aips","s","Color lookup table",\'${ASCDS_CALIB}/aips.lut\'),ParValue("b","s","Color lookup table",\'${ASCDS_CALIB}/b.lut\'),ParValue("bb","s","Color lookup table",\'${ASCDS_CALIB}/bb.lut\'),ParValue("blue","s","Color lookup table",\'${ASCDS_CALIB}/blue.lut\'),ParValue("color","s","Color lookup table",\'${ASCDS_CALIB}/color.lut\'),ParValue("cool","s","Color lookup table",\'${ASCDS_CALIB}/cool.lut\'),ParValue("green","s","Color lookup table",\'${ASCDS_CALIB}/green.lut\'),ParValue("grey","s","Color lookup table",\'${ASCDS_CALIB}/grey.lut\'),ParValue("halley","s","Color lookup table",\'${ASCDS_CALIB}/halley.lut\'),ParValue("heaob","s","Color lookup table",\'${ASCDS_CALIB}/heaob.lut\'),ParValue("heat","s","Color lookup table",\'${ASCDS_CALIB}/heat.lut\'),ParValue("hsv","s","Color lookup table",\'${ASCDS_CALIB}/hsv.lut\'),ParValue("i8","s","Color lookup table",\'${ASCDS_CALIB}/i8.lut\'),ParValue("rainbow1","s","Color lookup table",\'${ASCDS_CALIB}/rainbow1.lut\'),ParValue("rainbow2","s","Color lookup table",\'${ASCDS_CALIB}/rainbow2.lut\'),ParValue("ramp","s","Color lookup table",\'${ASCDS_CALIB}/ramp.lut\'),ParValue("red","s","Color lookup table",\'${ASCDS_CALIB}/red.lut\'),ParValue("sls","s","Color lookup table",\'${ASCDS_CALIB}/sls.lut\'),ParValue("staircase","s","Color lookup table",\'${ASCDS_CALIB}/staircase.lut\'),ParValue("standard","s","Color lookup table",\'${ASCDS_CALIB}/standard.lut\')]',
+        }
 
-parinfo['make_psf_asymmetry_region'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset",None),ParValue("outfile","f","Output region file name",None),ParRange("x","r","X coordinate of source (SKY)",None,0.5,65536.5),ParRange("y","r","Y coordinate of source (SKY)",None,0.5,65535.5)],
-    'opt': [ParSet("format","s","Format for output region file",'ciao',["ciao","ds9"]),ParValue("display","b","Display infile with region in ds9?",False),ParRange("verbose","i","Screen verbosity",1,0,5),ParValue("clobber","b","Clobber existing file?",False)],
-    }
 
+    parinfo['make_instmap_weights'] = {
+        'istool': True,
+        'req': '[ParValue("outfile","f","Instrument map weighting file",None),ParValue("model","s","Sherpa model definition string",None),ParValue("paramvals","s","\';\' delimited string of (parameter=value) pairs",None),ParRange("emin","r","Energy range lower bound for flux (keV)",None,0,None),ParValue("emax","r","Energy range upper bound for flux (keV)",None),ParValue("ewidth","r","Energy bin-size for flux (keV)",None)]',
+        'opt': '[ParSet("abund","s","set XSpec solar abundance",\'angr\',["angr","feld","aneb","grsa","wilm","lodd"]),ParSet("xsect","s","set XSpec photoelectric cross-section",\'vern\',["bcmc","obcm","vern"]),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level?",3,0,5)]',
+        }
 
-parinfo['map2reg'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input map image",None),ParValue("outfile","f","Output region file",None)],
-    'opt': [ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove output file if it already exists?",False)],
-    }
 
+    parinfo['make_psf_asymmetry_region'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset",None),ParValue("outfile","f","Output region file name",None),ParRange("x","r","X coordinate of source (SKY)",None,0.5,65536.5),ParRange("y","r","Y coordinate of source (SKY)",None,0.5,65535.5)]',
+        'opt': '[ParSet("format","s","Format for output region file",\'ciao\',["ciao","ds9"]),ParValue("display","b","Display infile with region in ds9?",False),ParRange("verbose","i","Screen verbosity",1,0,5),ParValue("clobber","b","Clobber existing file?",False)]',
+        }
 
-parinfo['mean_energy_map'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input ACIS event file",None),ParValue("outfile","f","Output image file name",None),ParRange("binsize","r","Image binning size",None,0,None)],
-    'opt': [ParValue("pbkfile","f","Parameter block filename for dead area calibration",None),ParValue("tmpdir","f","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParRange("verbose","i","Tool chatter",0,0,5),ParValue("clobber","b","Removing existing files?",False)],
-    }
 
+    parinfo['map2reg'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input map image",None),ParValue("outfile","f","Output region file",None)]',
+        'opt': '[ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove output file if it already exists?",False)]',
+        }
 
-parinfo['merge_obs'] = {
-    'istool': True,
-    'req': [ParValue("infiles","s","Input events files",None),ParValue("outroot","f","Root of output files",None)],
-    'opt': [ParValue("bands","s","Energy bands, comma-separated list, min:max:center in keV or ultrasoft, soft, medium, hard, broad, wide, CSC",'default'),ParValue("xygrid","s","xygrid for output or filename",None),ParRange("maxsize","i","Maximum image width or height in pixels",None,1,None),ParRange("binsize","r","Image binning factor",None,0,None),ParValue("asolfiles","s","Input aspect solutions",None),ParValue("badpixfiles","s","Input bad pixel files",None),ParValue("maskfiles","s","Input mask files",None),ParValue("dtffiles","s","Input dtf files for HRC observations",None),ParValue("refcoord","s","Reference coordinates or evt2 file",None),ParSet("units","s","Units for the exposure map",'default',["default","area","time"]),ParValue("expmapthresh","s","Remove low-exposure regions? '2%' excludes pixels where exposure is < 2% of the maximum",'1.5%'),ParSet("background","s","Method for background removal (HRC-I)",'default',["default","time","particle","none"]),ParValue("bkgparams","s","Optional argument for background subtraction",'[pi=300:500]'),ParRange("psfecf","r","If set, create PSF map with this ECF",None,0,1),ParSet("psfmerge","s","How are the PSF maps combined?",'min',["exptime","expmap","min","max","mean","median","mid"]),ParRange("random","i","random seed (0 = use time dependent seed)",0,0,None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("cleanup","b","Delete intermediary files?",True),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)],
-    }
 
+    parinfo['mean_energy_map'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input ACIS event file",None),ParValue("outfile","f","Output image file name",None),ParRange("binsize","r","Image binning size",None,0,None)]',
+        'opt': '[ParValue("pbkfile","f","Parameter block filename for dead area calibration",None),ParValue("tmpdir","f","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParRange("verbose","i","Tool chatter",0,0,5),ParValue("clobber","b","Removing existing files?",False)]',
+        }
 
-parinfo['merge_too_small'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input map",None),ParValue("outfile","f","Output map",None)],
-    'opt': [ParSet("method","s","Apply minval threshold to area of region or counts in region?",'counts',["counts","area"]),ParValue("imgfile","f","Input counts image file, required for method=counts",None),ParValue("binimg","f","Optional output image file",None),ParRange("minvalue","i","Minimum counts or area (logical pixels)",0,0,None),ParSet("join","s","Join deficient region with which neighbor?",'min',["min","max"]),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)],
-    }
 
+    parinfo['merge_obs'] = {
+        'istool': True,
+        'req': '[ParValue("infiles","s","Input events files",None),ParValue("outroot","f","Root of output files",None)]',
+        'opt': '[ParValue("bands","s","Energy bands, comma-separated list, min:max:center in keV or ultrasoft, soft, medium, hard, broad, wide, CSC",\'default\'),ParValue("xygrid","s","xygrid for output or filename",None),ParRange("maxsize","i","Maximum image width or height in pixels",None,1,None),ParRange("binsize","r","Image binning factor",None,0,None),ParValue("asolfiles","s","Input aspect solutions",None),ParValue("badpixfiles","s","Input bad pixel files",None),ParValue("maskfiles","s","Input mask files",None),ParValue("dtffiles","s","Input dtf files for HRC observations",None),ParValue("refcoord","s","Reference coordinates or evt2 file",None),ParSet("units","s","Units for the exposure map",\'default\',["default","area","time"]),ParValue("expmapthresh","s","Remove low-exposure regions? \'2%\' excludes pixels where exposure is < 2% of the maximum",\'1.5%\'),ParSet("background","s","Method for background removal (HRC-I)",\'default\',["default","time","particle","none"]),ParValue("bkgparams","s","Optional argument for background subtraction",\'[pi=300:500]\'),ParRange("psfecf","r","If set, create PSF map with this ECF",None,0,1),ParSet("psfmerge","s","How are the PSF maps combined?",\'min\',["exptime","expmap","min","max","mean","median","mid"]),ParRange("psfmemory","i","Memory, in MB, used to weight the PSF maps by exposure",256,1,None),ParRange("random","i","random seed (0 = use time dependent seed)",0,0,None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("cleanup","b","Delete intermediary files?",True),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)]',
+        }
 
-parinfo['mkacisrmf'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","scatter/rsp matrix file",' '),ParValue("outfile","f","RMF output file",' '),ParValue("wmap","f","WMAP file",' '),ParValue("energy","s","energy grid in keV (lo:hi:bin)",' '),ParValue("channel","s","channel grids in pixel (min:max:bin)",' '),ParSet("chantype","s","channel type",'PI',["PI","PHA"]),ParRange("ccd_id","i","filter CCD-ID",None,0,9),ParValue("chipx","i","filter chipx in pixel",None),ParValue("chipy","i","filter chipy in pixel",None),ParValue("gain","f","gain file",'CALDB')],
-    'opt': [ParValue("asolfile","f","aspect solution file or a stack of asol files",None),ParValue("obsfile","f","obs file",')wmap'),ParValue("logfile","f","log file",None),ParValue("contlvl","i","# contour level",100),ParValue("geompar","f","pixlib geometry parameter file",'geom'),ParRange("thresh","r","low threshold of energy cut-off probability",1e-06,0,None),ParValue("clobber","b","overwrite existing output file (yes|no)?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['merge_too_small'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input map",None),ParValue("outfile","f","Output map",None)]',
+        'opt': '[ParSet("method","s","Apply minval threshold to area of region or counts in region?",\'counts\',["counts","area"]),ParValue("imgfile","f","Input counts image file, required for method=counts",None),ParValue("binimg","f","Optional output image file",None),ParRange("minvalue","i","Minimum counts or area (logical pixels)",0,0,None),ParSet("join","s","Join deficient region with which neighbor?",\'min\',["min","max"]),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)]',
+        }
 
-parinfo['mkarf'] = {
-    'istool': True,
-    'req': [ParValue("asphistfile","f","Aspect Histogram File",None),ParValue("outfile","f","Output File Name",None),ParValue("sourcepixelx","r","Source X Pixel",None),ParValue("sourcepixely","r","Source Y Pixel",None),ParValue("engrid","f","Energy grid spec",None),ParValue("obsfile","s","Name of fits file with obs info (evt file -- include extension)",None),ParValue("pbkfile","s","NONE, or the name of the parameter block file",None),ParValue("detsubsys","s","Detector Name",None),ParSet("grating","s","Grating for zeroth order ARF",'NONE',["NONE","LETG","HETG"]),ParValue("maskfile","s","NONE, or name of ACIS window mask file",'NONE'),ParRange("verbose","i","Verbosity",0,0,5)],
-    'opt': [ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",'CALDB'),ParValue("mirror","s","Mirror Name",'HRMA'),ParValue("ardlibparfile","s","name of ardlib parameter file",'ardlib.par'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",'geom'),ParValue("clobber","b","Overwrite existing files?",False)],
-    }
 
+    parinfo['mkacisrmf'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","scatter/rsp matrix file",\' \'),ParValue("outfile","f","RMF output file",\' \'),ParValue("wmap","f","WMAP file",\' \'),ParValue("energy","s","energy grid in keV (lo:hi:bin)",\' \'),ParValue("channel","s","channel grids in pixel (min:max:bin)",\' \'),ParSet("chantype","s","channel type",\'PI\',["PI","PHA"]),ParRange("ccd_id","i","filter CCD-ID",None,0,9),ParValue("chipx","i","filter chipx in pixel",None),ParValue("chipy","i","filter chipy in pixel",None),ParValue("gain","f","gain file",\'CALDB\')]',
+        'opt': '[ParValue("asolfile","f","aspect solution file or a stack of asol files",None),ParValue("obsfile","f","obs file",\')wmap\'),ParValue("logfile","f","log file",None),ParValue("contlvl","i","# contour level",100),ParValue("geompar","f","pixlib geometry parameter file",\'geom\'),ParRange("thresh","r","low threshold of energy cut-off probability",1e-06,0,None),ParValue("clobber","b","overwrite existing output file (yes|no)?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['mkexpmap'] = {
-    'istool': True,
-    'req': [ParValue("asphistfile","f","Aspect Histogram File",None),ParValue("outfile","f","Output File Name",None),ParValue("instmapfile","f","Name of Instrument Map",None),ParValue("xygrid","s","grid specification syntax x0:x1:#nx,x0:x1:ny",None),ParValue("useavgaspect","b","Use Average Aspect Pointing",False)],
-    'opt': [ParValue("normalize","b","Normalize exposure map by exposure time",True),ParValue("geompar","s","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",False)],
-    }
 
+    parinfo['mkarf'] = {
+        'istool': True,
+        'req': '[ParValue("asphistfile","f","Aspect Histogram File",None),ParValue("outfile","f","Output File Name",None),ParValue("sourcepixelx","r","Source X Pixel",None),ParValue("sourcepixely","r","Source Y Pixel",None),ParValue("engrid","f","Energy grid spec",None),ParValue("obsfile","s","Name of fits file with obs info (evt file -- include extension)",None),ParValue("pbkfile","s","NONE, or the name of the parameter block file",None),ParValue("detsubsys","s","Detector Name",None),ParSet("grating","s","Grating for zeroth order ARF",\'NONE\',["NONE","LETG","HETG"]),ParValue("maskfile","s","NONE, or name of ACIS window mask file",\'NONE\'),ParRange("verbose","i","Verbosity",0,0,5)]',
+        'opt': '[ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",\'CALDB\'),ParValue("mirror","s","Mirror Name",\'HRMA\'),ParValue("ardlibparfile","s","name of ardlib parameter file",\'ardlib.par\'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("clobber","b","Overwrite existing files?",False)]',
+        }
 
-parinfo['mkgarf'] = {
-    'istool': True,
-    'req': [ParValue("asphistfile","f","Aspect Histogram File (include extension)",None),ParValue("outfile","f","Output File Name",None),ParValue("order","i","Enter Grating order",1),ParValue("sourcepixelx","r","Source X Pixel",None),ParValue("sourcepixely","r","Source Y Pixel",None),ParValue("engrid","f","Energy grid spec",None),ParValue("obsfile","s","Name of fits file with obs info (include extension)",None),ParValue("osipfile","s","NONE or Name of fits file with order sorting info",'CALDB'),ParValue("maskfile","s","NONE, or name of ACIS window mask file",'NONE'),ParValue("detsubsys","s","Detector Name",None),ParSet("grating_arm","s","Enter Grating Arm",None,["HEG","MEG","LEG"]),ParValue("pbkfile","s","NONE, or the name of the parameter block file",None)],
-    'opt': [ParValue("mirror","s","Mirror Name",'hrma'),ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",'CALDB'),ParValue("ardlibparfile","s","name of ardlib parameter file",'ardlib.par'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",False)],
-    }
 
+    parinfo['mkexpmap'] = {
+        'istool': True,
+        'req': '[ParValue("asphistfile","f","Aspect Histogram File",None),ParValue("outfile","f","Output File Name",None),ParValue("instmapfile","f","Name of Instrument Map",None),ParValue("xygrid","s","grid specification syntax x0:x1:#nx,x0:x1:ny",None),ParValue("useavgaspect","b","Use Average Aspect Pointing",False)]',
+        'opt': '[ParValue("normalize","b","Normalize exposure map by exposure time",True),ParValue("geompar","s","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",False)]',
+        }
 
-parinfo['mkgrmf'] = {
-    'istool': True,
-    'req': [ParValue("outfile","f","Output File Name",None),ParValue("wvgrid_arf","s","Enter ARF side wavelength grid [angstroms]",'compute'),ParValue("wvgrid_chan","s","Enter channel-side wavelength grid [angstroms]",'compute'),ParValue("order","i","Enter Grating order",1),ParValue("obsfile","s","Name of fits file with obs info",None),ParValue("regionfile","s","File containing extraction region",None),ParValue("srcid","i","SrcID",1),ParValue("detsubsys","s","Detector Name (e.g., ACIS-S3)",None),ParSet("grating_arm","s","Enter Grating Arm",None,["HEG","MEG","LEG","NONE"])],
-    'opt': [ParValue("threshold","r","Enter RMF threshold",1e-06),ParValue("diagonalrmf","b","Compute diagonal RMF?",False),ParValue("ardlibparfile","s","name of ardlib parameter file",'ardlib.par'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",'geom'),ParValue("mirror","s","Mirror Name",'HRMA'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",True)],
-    }
 
+    parinfo['mkgarf'] = {
+        'istool': True,
+        'req': '[ParValue("asphistfile","f","Aspect Histogram File (include extension)",None),ParValue("outfile","f","Output File Name",None),ParValue("order","i","Enter Grating order",1),ParValue("sourcepixelx","r","Source X Pixel",None),ParValue("sourcepixely","r","Source Y Pixel",None),ParValue("engrid","f","Energy grid spec",None),ParValue("obsfile","s","Name of fits file with obs info (include extension)",None),ParValue("osipfile","s","NONE or Name of fits file with order sorting info",\'CALDB\'),ParValue("maskfile","s","NONE, or name of ACIS window mask file",\'NONE\'),ParValue("detsubsys","s","Detector Name",None),ParSet("grating_arm","s","Enter Grating Arm",None,["HEG","MEG","LEG"]),ParValue("pbkfile","s","NONE, or the name of the parameter block file",None)]',
+        'opt': '[ParValue("mirror","s","Mirror Name",\'hrma\'),ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",\'CALDB\'),ParValue("ardlibparfile","s","name of ardlib parameter file",\'ardlib.par\'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",False)]',
+        }
 
-parinfo['mkinstmap'] = {
-    'istool': True,
-    'req': [ParValue("outfile","f","Output File Name",None),ParValue("spectrumfile","s","Energy Spectrum File (see docs)",'NONE'),ParRange("monoenergy","r","Energy for mono-chromatic map [keV]",1,0.1,10),ParValue("pixelgrid","s","Pixel grid specification x0:x1:#nx,y0:y1:#ny",None),ParValue("obsfile","s","Name of fits file + extension with obs info",None),ParValue("detsubsys","s","Detector Name",None),ParSet("grating","s","Grating for zeroth order ARF",'NONE',["NONE","LETG","HETG"]),ParValue("maskfile","s","NONE, or name of ACIS window mask file",'NONE'),ParValue("pbkfile","s","NONE, or the name of the parameter block file",None)],
-    'opt': [ParValue("mirror","s","Mirror Name",'HRMA'),ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",'CALDB'),ParValue("ardlibparfile","s","name of ardlib parameter file",'ardlib.par'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",False)],
-    }
 
+    parinfo['mkgrmf'] = {
+        'istool': True,
+        'req': '[ParValue("outfile","f","Output File Name",None),ParValue("wvgrid_arf","s","Enter ARF side wavelength grid [angstroms]",\'compute\'),ParValue("wvgrid_chan","s","Enter channel-side wavelength grid [angstroms]",\'compute\'),ParValue("order","i","Enter Grating order",1),ParValue("obsfile","s","Name of fits file with obs info",None),ParValue("regionfile","s","File containing extraction region",None),ParValue("srcid","i","SrcID",1),ParValue("detsubsys","s","Detector Name (e.g., ACIS-S3)",None),ParSet("grating_arm","s","Enter Grating Arm",None,["HEG","MEG","LEG","NONE"])]',
+        'opt': '[ParValue("threshold","r","Enter RMF threshold",1e-06),ParValue("diagonalrmf","b","Compute diagonal RMF?",False),ParValue("ardlibparfile","s","name of ardlib parameter file",\'ardlib.par\'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("mirror","s","Mirror Name",\'HRMA\'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",True)]',
+        }
 
-parinfo['mkosip'] = {
-    'istool': True,
-    'req': [],
-    'opt': [ParValue("osip_mode","s","",'compute_limits'),ParValue("obspar","f","",None),ParValue("p2resp_file","f","",None),ParValue("gain_file","f","",None),ParValue("order_bounds_table","f","",None),ParValue("fracresp_goal","r","",0.985),ParValue("energy_grid","s","",'253:1740:20;1750:1890:10;1900:4990:20;5000:12000:10'),ParValue("ccdids","s","",'ACIS-456789'),ParValue("high_limit_clip","r","",1.3),ParValue("low_limit_clip","r","",0.8),ParValue("fracresp_high","r","",0.985),ParValue("resample_factor","i","",8),ParValue("moments_full_distribution","b","",False),ParValue("verbose","i","",0),ParValue("n_threads","i","",1)],
-    }
 
+    parinfo['mkinstmap'] = {
+        'istool': True,
+        'req': '[ParValue("outfile","f","Output File Name",None),ParValue("spectrumfile","s","Energy Spectrum File (see docs)",\'NONE\'),ParRange("monoenergy","r","Energy for mono-chromatic map [keV]",1,0.1,10),ParValue("pixelgrid","s","Pixel grid specification x0:x1:#nx,y0:y1:#ny",None),ParValue("obsfile","s","Name of fits file + extension with obs info",None),ParValue("detsubsys","s","Detector Name",None),ParSet("grating","s","Grating for zeroth order ARF",\'NONE\',["NONE","LETG","HETG"]),ParValue("maskfile","s","NONE, or name of ACIS window mask file",\'NONE\'),ParValue("pbkfile","s","NONE, or the name of the parameter block file",None)]',
+        'opt': '[ParValue("mirror","s","Mirror Name",\'HRMA\'),ParValue("dafile","s","NONE, CALDB, or name of ACIS dead-area calibration file",\'CALDB\'),ParValue("ardlibparfile","s","name of ardlib parameter file",\'ardlib.par\'),ParValue("geompar","s","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Overwrite existing files?",False)]',
+        }
 
-parinfo['mkpsfmap'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output image file name",None),ParValue("energy","r","Energy of PSF to lookup [keV]",None),ParValue("spectrum","f","Spectrum file [keV vs weight] if energy=None",None),ParRange("ecf","r","ECF of PSF to lookup",None,0,1)],
-    'opt': [ParValue("psffile","f","PSF Calibration file",'CALDB'),ParSet("units","s","Units of output image",'arcsec',["arcsec","logical","physical"]),ParValue("geompar","f","Pixlib geometry file",'geom.par'),ParValue("clobber","b","Clobber files?",False)],
-    }
 
+    parinfo['mkosip'] = {
+        'istool': True,
+        'req': '[]',
+        'opt': '[ParValue("osip_mode","s","",\'compute_limits\'),ParValue("obspar","f","",None),ParValue("p2resp_file","f","",None),ParValue("gain_file","f","",None),ParValue("order_bounds_table","f","",None),ParValue("fracresp_goal","r","",0.985),ParValue("energy_grid","s","",\'253:1740:20;1750:1890:10;1900:4990:20;5000:12000:10\'),ParValue("ccdids","s","",\'ACIS-456789\'),ParValue("high_limit_clip","r","",1.3),ParValue("low_limit_clip","r","",0.8),ParValue("fracresp_high","r","",0.985),ParValue("resample_factor","i","",8),ParValue("moments_full_distribution","b","",False),ParValue("verbose","i","",0),ParValue("n_threads","i","",1)]',
+        }
 
-parinfo['mkregmap'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file",None),ParValue("regions","f","Input stack of regions",None),ParValue("outfile","f","Output map file",None)],
-    'opt': [ParValue("binimg","f","Output binned image",None),ParValue("coord","s","Image coodinate name",'sky'),ParValue("clobber","b","Remove outfile if it already exists?",False),ParRange("verbose","i","Tool chatter level",1,0,5)],
-    }
 
+    parinfo['mkpsfmap'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output image file name",None),ParValue("energy","r","Energy of PSF to lookup [keV]",None),ParValue("spectrum","f","Spectrum file [keV vs weight] if energy=None",None),ParRange("ecf","r","ECF of PSF to lookup",None,0,1)]',
+        'opt': '[ParValue("psffile","f","PSF Calibration file",\'CALDB\'),ParSet("units","s","Units of output image",\'arcsec\',["arcsec","logical","physical"]),ParValue("geompar","f","Pixlib geometry file",\'geom.par\'),ParValue("clobber","b","Clobber files?",False)]',
+        }
 
-parinfo['mkrmf'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","name of FEF input file",None),ParValue("outfile","f","name of RMF output file",None),ParValue("axis1","s","axis-1(name=lo:hi:btype)",None),ParValue("axis2","s","axis-2(name=lo:hi:btype)",None)],
-    'opt': [ParValue("logfile","f","name of log file",'STDOUT'),ParValue("weights","f","name of weight file",None),ParRange("thresh","r","low threshold of energy cut-off probability",1e-5,0.0,None),ParValue("outfmt","s","RMF output format (legacy|cxc)",'legacy'),ParValue("clobber","b","overwrite existing output file (yes|no)?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5),ParValue("axis3","s","axis-3(name=lo:hi:btype)",'none'),ParValue("axis4","s","axis-4(name=lo:hi:btype)",'none'),ParValue("axis5","s","axis-5(name=lo:hi:btype)",'none')],
-    }
 
+    parinfo['mkregmap'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file",None),ParValue("regions","f","Input stack of regions",None),ParValue("outfile","f","Output map file",None)]',
+        'opt': '[ParValue("binimg","f","Output binned image",None),ParValue("coord","s","Image coodinate name",\'sky\'),ParValue("parallel","b","Map the regions in parallel?",False),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParValue("clobber","b","Remove outfile if it already exists?",False),ParRange("verbose","i","Tool chatter level",1,0,5)]',
+        }
 
-parinfo['mkrprm'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("regions","f","Input stack of regions",None),ParValue("outfile","f","Output radial profile redistribution matrix",None)],
-    'opt': [ParSet("psfmethod","s","Method to apply PSF smoothing",'map',["map","marx"]),ParRange("ecf","r","PSF Map Fraction",0.393,0,1),ParSet("function","s","PSF Map smoothing function",'gaus',["gaus","tophat","lor","hemisphere","cone"]),ParRange("energy","r","PSF Energy",1.4,0.3,10),ParRange("flux","r","Flux for marx simulations",1.0e-2,0,None),ParRange("random_seed","i","MARX random seed, -1: current time",-1,-1,1073741824),ParValue("marx_root","f","Directory where MARX is installed",'${MARX_ROOT}'),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","Remove output file if it already exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['mkrmf'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","name of FEF input file",None),ParValue("outfile","f","name of RMF output file",None),ParValue("axis1","s","axis-1(name=lo:hi:btype)",None),ParValue("axis2","s","axis-2(name=lo:hi:btype)",None)]',
+        'opt': '[ParValue("logfile","f","name of log file",\'STDOUT\'),ParValue("weights","f","name of weight file",None),ParRange("thresh","r","low threshold of energy cut-off probability",1e-5,0.0,None),ParValue("outfmt","s","RMF output format (legacy|cxc)",\'legacy\'),ParValue("clobber","b","overwrite existing output file (yes|no)?",False),ParRange("verbose","i","verbosity level (0 = no display)",0,0,5),ParValue("axis3","s","axis-3(name=lo:hi:btype)",\'none\'),ParValue("axis4","s","axis-4(name=lo:hi:btype)",\'none\'),ParValue("axis5","s","axis-5(name=lo:hi:btype)",\'none\')]',
+        }
 
-parinfo['mktgresp'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input type-II PHA file",None),ParValue("evtfile","f","Input event file",None),ParValue("outroot","f","Output root name for RMF and ARF files",None)],
-    'opt': [ParValue("orders","s","Input list of grating orders (None uses values in infile",'INDEF'),ParValue("wvgrid_arf","s","Enter ARF side wavelength grid [angstroms]",'compute'),ParValue("wvgrid_chan","s","Enter channel-side wavelength grid [angstroms]",'compute'),ParValue("asolfile","f","Input aspect solution file(s)",None),ParValue("bpixfile","f","Input bad pixel list",None),ParValue("mskfile","f","Input detector mask file",None),ParValue("dtffile","f","Input dead time factors file (HRC only)",None),ParValue("dafile","f","Input dead area calibration file",'CALDB'),ParValue("osipfile","f","Input order sorting calibration file",'CALDB'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParRange("verbose","i","Tool chatter",1,0,5),ParValue("clobber","b","Clobber existing files?",False)],
-    }
 
+    parinfo['mkrprm'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("regions","f","Input stack of regions",None),ParValue("outfile","f","Output radial profile redistribution matrix",None)]',
+        'opt': '[ParSet("psfmethod","s","Method to apply PSF smoothing",\'map\',["map","marx"]),ParRange("ecf","r","PSF Map Fraction",0.393,0,1),ParSet("function","s","PSF Map smoothing function",\'gaus\',["gaus","tophat","lor","hemisphere","cone"]),ParRange("energy","r","PSF Energy",1.4,0.3,10),ParRange("flux","r","Flux for marx simulations",1.0e-2,0,None),ParRange("random_seed","i","MARX random seed, -1: current time",-1,-1,1073741824),ParValue("marx_root","f","Directory where MARX is installed",\'${MARX_ROOT}\'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","Remove output file if it already exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['mkwarf'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input detector WMAP",None),ParValue("outfile","f","Output weighted ARF file",None),ParValue("weightfile","f","Output FEF weights",None),ParValue("spectrumfile","f","Input Spectral weighting file (<filename>|NONE)",None),ParValue("egridspec","s","Output energy grid [kev]",None),ParValue("pbkfile","f","Parameter block file",None)],
-    'opt': [ParRange("threshold","r","Percent threshold cut for FEF regions",0,0,1),ParValue("feffile","f","FEF file",'CALDB'),ParValue("mskfile","f","Mask file",None),ParValue("asolfile","f","Stack of aspect solution files",None),ParValue("mirror","s","ARDLIB Mirror specification",'HRMA'),ParValue("detsubsysmod","s","Detector sybsystem modifier",None),ParValue("dafile","f","Dead area file",'CALDB'),ParValue("ardlibpar","f","Parameter file for ARDLIB files",'ardlib'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("clobber","b","Clobber existing outputs",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['mktgresp'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input type-II PHA file",None),ParValue("evtfile","f","Input event file",None),ParValue("outroot","f","Output root name for RMF and ARF files",None)]',
+        'opt': '[ParValue("orders","s","Input list of grating orders (None uses values in infile",\'INDEF\'),ParValue("wvgrid_arf","s","Enter ARF side wavelength grid [angstroms]",\'compute\'),ParValue("wvgrid_chan","s","Enter channel-side wavelength grid [angstroms]",\'compute\'),ParValue("asolfile","f","Input aspect solution file(s)",None),ParValue("bpixfile","f","Input bad pixel list",None),ParValue("mskfile","f","Input detector mask file",None),ParValue("dtffile","f","Input dead time factors file (HRC only)",None),ParValue("dafile","f","Input dead area calibration file",\'CALDB\'),ParValue("osipfile","f","Input order sorting calibration file",\'CALDB\'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParRange("verbose","i","Tool chatter",1,0,5),ParValue("clobber","b","Clobber existing files?",False)]',
+        }
 
-parinfo['modelflux'] = {
-    'istool': True,
-    'req': [ParValue("arf","f","Ancillary Response File (ARF)",None),ParValue("rmf","f","Response File (RMF)",None),ParValue("model","s","Sherpa model definition string",None),ParValue("paramvals","s","';' delimited string of (parameter=value) pairs",None),ParValue("emin","r","Energy range lower bound for flux (keV)",None),ParValue("emax","r","Energy range upper bound for flux (keV)",None)],
-    'opt': [ParValue("absmodel","s","Absorption model for calculating unabsorbed flux",None),ParValue("absparams","s","';' delimited string of (parameter=value) pairs for absorption model used to calculate unabsorbed flux",None),ParValue("abund","s","XSPEC abundance table (if relevant to absorption model)",'angr'),ParValue("oemin","r","Energy range lower bound for rate (keV), default=emin",None),ParValue("oemax","r","Energy range upper bound for rate (keV), default=emax",None),ParValue("rate","r","count rate in counts s^-1, default=1.0",1.0),ParValue("pflux","r","photon flux in energy range in photon cm^-2 s^-1",None),ParValue("flux","r","energy flux in energy range in erg cm^-2 s^-1",None),ParValue("urate","r","Unabsorbed count rate in counts s^-1 (if absmodel defined)",None),ParValue("upflux","r","Unabsorbed photon flux in energy range in photon cm^-2 s^-1 (if absmodel defined)",None),ParValue("uflux","r","Unabsorbed energy flux in energy range in erg cm^-2 s^-1 (if absmodel defined)",None),ParSet("opt","s","input type: (use this to determine the others)",'rate',["rate","flux","pflux"]),ParRange("verbose","i","verbosity setting",1,0,5)],
-    }
 
+    parinfo['mkwarf'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input detector WMAP",None),ParValue("outfile","f","Output weighted ARF file",None),ParValue("weightfile","f","Output FEF weights",None),ParValue("spectrumfile","f","Input Spectral weighting file (<filename>|NONE)",None),ParValue("egridspec","s","Output energy grid [kev]",None),ParValue("pbkfile","f","Parameter block file",None)]',
+        'opt': '[ParRange("threshold","r","Percent threshold cut for FEF regions",0,0,1),ParValue("feffile","f","FEF file",\'CALDB\'),ParValue("mskfile","f","Mask file",None),ParValue("asolfile","f","Stack of aspect solution files",None),ParValue("mirror","s","ARDLIB Mirror specification",\'HRMA\'),ParValue("detsubsysmod","s","Detector sybsystem modifier",None),ParValue("dafile","f","Dead area file",\'CALDB\'),ParValue("ardlibpar","f","Parameter file for ARDLIB files",\'ardlib\'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("clobber","b","Clobber existing outputs",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['monitor_photom'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","ACA image data file",None),ParValue("outfile","f","Output light curve",None)],
-    'opt': [ParValue("dark_ratio","r","Dark ratio",0.005),ParValue("min_dark_limit","r","Minimum warm pixel dark current",80.0),ParValue("min_dark_meas","i","Minimum warm pixel measurements",10),ParValue("max_dither_motion","i","Maximum possible dither motion (pixels)",10),ParRange("verbose","i","Amount of tool chatter",0,0,5),ParValue("clobber","b","Remove output file if it already exists?",False)],
-    }
 
+    parinfo['modelflux'] = {
+        'istool': True,
+        'req': '[ParValue("arf","f","Ancillary Response File (ARF)",None),ParValue("rmf","f","Response File (RMF)",None),ParValue("model","s","Sherpa model definition string",None),ParValue("paramvals","s","\';\' delimited string of (parameter=value) pairs",None),ParValue("emin","r","Energy range lower bound for flux (keV)",None),ParValue("emax","r","Energy range upper bound for flux (keV)",None)]',
+        'opt': '[ParValue("absmodel","s","Absorption model for calculating unabsorbed flux",None),ParValue("absparams","s","\';\' delimited string of (parameter=value) pairs for absorption model used to calculate unabsorbed flux",None),ParValue("abund","s","XSPEC abundance table (if relevant to absorption model)",\'angr\'),ParValue("oemin","r","Energy range lower bound for rate (keV), default=emin",None),ParValue("oemax","r","Energy range upper bound for rate (keV), default=emax",None),ParValue("rate","r","count rate in counts s^-1, default=1.0",1.0),ParValue("pflux","r","photon flux in energy range in photon cm^-2 s^-1",None),ParValue("flux","r","energy flux in energy range in erg cm^-2 s^-1",None),ParValue("urate","r","Unabsorbed count rate in counts s^-1 (if absmodel defined)",None),ParValue("upflux","r","Unabsorbed photon flux in energy range in photon cm^-2 s^-1 (if absmodel defined)",None),ParValue("uflux","r","Unabsorbed energy flux in energy range in erg cm^-2 s^-1 (if absmodel defined)",None),ParSet("opt","s","input type: (use this to determine the others)",\'rate\',["rate","flux","pflux"]),ParRange("verbose","i","verbosity setting",1,0,5)]',
+        }
 
-parinfo['mtl_build_gti'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input MTL file",None),ParValue("outfile","f","Output GTI file",None),ParValue("mtlfile","f","Output smoothed/filtered MTL file",None)],
-    'opt': [ParValue("userlimit","s","Optional user defined limit string",None),ParValue("lkupfile","f","Lookup table defining which MTL columns to check against (NONE|none|<filename>)",'${ASCDS_CALIB}/gti_test.fits'),ParValue("smooth","b","Smooth the input MTL data?",True),ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Debug level",0,0,5)],
-    }
 
+    parinfo['monitor_photom'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","ACA image data file",None),ParValue("outfile","f","Output light curve",None)]',
+        'opt': '[ParValue("dark_ratio","r","Dark ratio",0.005),ParValue("min_dark_limit","r","Minimum warm pixel dark current",80.0),ParValue("min_dark_meas","i","Minimum warm pixel measurements",10),ParValue("max_dither_motion","i","Maximum possible dither motion (pixels)",10),ParRange("verbose","i","Amount of tool chatter",0,0,5),ParValue("clobber","b","Remove output file if it already exists?",False)]',
+        }
 
-parinfo['multi_chip_gti'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file to match GTI order",None),ParValue("i0_gti","f","GTI file for ACIS-I0 (CCD_ID=0)",None),ParValue("i1_gti","f","GTI file for ACIS-I1 (CCD_ID=1)",None),ParValue("i2_gti","f","GTI file for ACIS-I2 (CCD_ID=2)",None),ParValue("i3_gti","f","GTI file for ACIS-I3 (CCD_ID=3)",None),ParValue("s0_gti","f","GTI file for ACIS-S0 (CCD_ID=4)",None),ParValue("s1_gti","f","GTI file for ACIS-S1 (CCD_ID=5)",None),ParValue("s2_gti","f","GTI file for ACIS-S2 (CCD_ID=6)",None),ParValue("s3_gti","f","GTI file for ACIS-S3 (CCD_ID=7)",None),ParValue("s4_gti","f","GTI file for ACIS-S4 (CCD_ID=8)",None),ParValue("s5_gti","f","GTI file for ACIS-S5 (CCD_ID=9)",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParValue("tmpdir","f","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParRange("verbose","i","Tool chatter",1,0,5),ParValue("clobber","b","Overwrite existing output file?",False)],
-    }
 
+    parinfo['mtl_build_gti'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input MTL file",None),ParValue("outfile","f","Output GTI file",None),ParValue("mtlfile","f","Output smoothed/filtered MTL file",None)]',
+        'opt': '[ParValue("userlimit","s","Optional user defined limit string",None),ParValue("lkupfile","f","Lookup table defining which MTL columns to check against (NONE|none|<filename>)",\'${ASCDS_CALIB}/gti_test.fits\'),ParValue("smooth","b","Smooth the input MTL data?",True),ParValue("clobber","b","Clobber output file if it exists?",False),ParRange("verbose","i","Debug level",0,0,5)]',
+        }
 
-parinfo['obsid_search_csc'] = {
-    'istool': True,
-    'req': [ParValue("obsid","s","Chandra Observation ID",None),ParValue("outfile","f","Name of output table (TSV format)",None)],
-    'opt': [ParValue("columns","s","List of columns to include",'INDEF'),ParSet("download","s","Download data products for which sources?",'none',["none","ask","all"]),ParValue("root","f","Output root for data products",'./'),ParValue("bands","s","Comma separated list of CSC band names taken from broad, soft, medium, hard, ultrasoft, wide. Blank retrieves all",'broad,wide'),ParValue("filetypes","s","Comma separated list of CSC filetypes.  Blank retrieves all",'regevt,pha,arf,rmf,lc,psf,regexp'),ParSet("catalog","s","Version of catalog",'csc2.1',["csc2.1","csc2","csc1","current","latest"]),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove existing outfile if it exists?",False)],
-    }
 
+    parinfo['multi_chip_gti'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file to match GTI order",None),ParValue("i0_gti","f","GTI file for ACIS-I0 (CCD_ID=0)",None),ParValue("i1_gti","f","GTI file for ACIS-I1 (CCD_ID=1)",None),ParValue("i2_gti","f","GTI file for ACIS-I2 (CCD_ID=2)",None),ParValue("i3_gti","f","GTI file for ACIS-I3 (CCD_ID=3)",None),ParValue("s0_gti","f","GTI file for ACIS-S0 (CCD_ID=4)",None),ParValue("s1_gti","f","GTI file for ACIS-S1 (CCD_ID=5)",None),ParValue("s2_gti","f","GTI file for ACIS-S2 (CCD_ID=6)",None),ParValue("s3_gti","f","GTI file for ACIS-S3 (CCD_ID=7)",None),ParValue("s4_gti","f","GTI file for ACIS-S4 (CCD_ID=8)",None),ParValue("s5_gti","f","GTI file for ACIS-S5 (CCD_ID=9)",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParValue("tmpdir","f","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParRange("verbose","i","Tool chatter",1,0,5),ParValue("clobber","b","Overwrite existing output file?",False)]',
+        }
 
-parinfo['parse_wcs_match_log'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file with duplicate srcs",None),ParValue("refsrcfile","f","Input file with reference srcs",None),ParValue("logfile","f","wcs_match debug log file",None),ParValue("outfile","f","Output cross match table file name",None)],
-    'opt': [ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","Tool verbosity",1,0,5)],
-    }
 
+    parinfo['obsid_search_csc'] = {
+        'istool': True,
+        'req': '[ParValue("obsid","s","Chandra Observation ID",None),ParValue("outfile","f","Name of output table (TSV format)",None)]',
+        'opt': '[ParValue("columns","s","List of columns to include",\'INDEF\'),ParSet("download","s","Download data products for which sources?",\'none\',["none","ask","all"]),ParValue("root","f","Output root for data products",\'./\'),ParValue("bands","s","Comma separated list of CSC band names taken from broad, soft, medium, hard, ultrasoft, wide. Blank retrieves all",\'broad,wide\'),ParValue("filetypes","s","Comma separated list of CSC filetypes.  Blank retrieves all",\'regevt,pha,arf,rmf,lc,psf,regexp\'),ParSet("catalog","s","Version of catalog",\'csc2.1\',["csc2.1","csc2","csc1","current","latest"]),ParRange("nquery","i","Maximum number of concurrent downloads",4,1,16),ParValue("gunzip","b","Decompress the data products as they are retrieved?",False),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove existing outfile if it exists?",False)]',
+        }
 
-parinfo['patch_hrc_ssc'] = {
-    'istool': True,
-    'req': [ParValue("dtf_infile","f","Input dead time factors file",None),ParValue("mtl_infile","f","Input mission time line file",None),ParValue("evt_infile","f","Input Level 1 event file",None),ParValue("evt_outfile","f","Output Level 1 event file",None),ParValue("gti_outfile","f","Output GTI (filter: flt) file",None),ParValue("dtf_outfile","f","Output dead time factors file",None),ParRange("threshold","i","Threshold about which total_evt_count is due to SCC",4000,0,None)],
-    'opt': [ParRange("smooth_count","i","Smoothing applied to total_evt_count to determine bad range",3,1,None),ParValue("tmpdir","f","Temporary directory for intermediate files",'${ASCDS_WORK_PATH}'),ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Overwrite existing files",False)],
-    }
 
+    parinfo['parse_wcs_match_log'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file with duplicate srcs",None),ParValue("refsrcfile","f","Input file with reference srcs",None),ParValue("logfile","f","wcs_match debug log file",None),ParValue("outfile","f","Output cross match table file name",None)]',
+        'opt': '[ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","Tool verbosity",1,0,5)]',
+        }
 
-parinfo['pathfinder'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output map image",None)],
-    'opt': [ParValue("minval","r","Minimum pixel value to consider in input image.",0),ParSet("direction","s","Directions to follow gradient",'diagonal',["diagonal","perpendicular"]),ParValue("debugreg","f","Diagnostic region file",None),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove output file if it already exists?",False)],
-    }
 
+    parinfo['patch_hrc_ssc'] = {
+        'istool': True,
+        'req': '[ParValue("dtf_infile","f","Input dead time factors file",None),ParValue("mtl_infile","f","Input mission time line file",None),ParValue("evt_infile","f","Input Level 1 event file",None),ParValue("evt_outfile","f","Output Level 1 event file",None),ParValue("gti_outfile","f","Output GTI (filter: flt) file",None),ParValue("dtf_outfile","f","Output dead time factors file",None),ParRange("threshold","i","Threshold about which total_evt_count is due to SCC",4000,0,None)]',
+        'opt': '[ParRange("smooth_count","i","Smoothing applied to total_evt_count to determine bad range",3,1,None),ParValue("tmpdir","f","Temporary directory for intermediate files",\'${ASCDS_WORK_PATH}\'),ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Overwrite existing files",False)]',
+        }
 
-parinfo['pfold'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file",None),ParValue("outfile","f","Output file",None),ParValue("periodgrid","s","Grid to search for periods",None)],
-    'opt': [ParValue("dtffile","f","Dead-time factor/efficiency",None),ParValue("pdot","r","Periods derivative",None),ParValue("nphase","i","Number of phase bins",10),ParValue("tzero","r","Time of zero-phase",None),ParValue("clobber","b","Remove existing output files",False)],
-    }
 
+    parinfo['pathfinder'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output map image",None)]',
+        'opt': '[ParValue("minval","r","Minimum pixel value to consider in input image.",0),ParSet("direction","s","Directions to follow gradient",\'diagonal\',["diagonal","perpendicular"]),ParValue("debugreg","f","Diagnostic region file",None),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove output file if it already exists?",False)]',
+        }
 
-parinfo['pileup_map'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input counts image",None),ParValue("outfile","f","Output pileup image",None)],
-    'opt': [ParValue("clobber","b","Remove existing output?",False),ParRange("verbose","i","Tool chatter",0,0,5)],
-    }
 
+    parinfo['pfold'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file",None),ParValue("outfile","f","Output file",None),ParValue("periodgrid","s","Grid to search for periods",None)]',
+        'opt': '[ParValue("dtffile","f","Dead-time factor/efficiency",None),ParValue("pdot","r","Periods derivative",None),ParValue("nphase","i","Number of phase bins",10),ParValue("tzero","r","Time of zero-phase",None),ParValue("clobber","b","Remove existing output files",False)]',
+        }
 
-parinfo['psf_contour'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file or image",None),ParValue("outroot","f","Output directory and root filename",None),ParValue("pos","s","Position: coordinate or input file with columns RA and DEC",None)],
-    'opt': [ParSet("method","s","Region creating algorithm",'contour',["contour","lasso","fitted_ellipse","ecf_ellipse","convex_hull"]),ParRange("energy","r","Monochromatic energy to simulate PSF",1.0,0.3,10.0),ParRange("fraction","r","Target fraction of the PSF to include",0.9,0.6,0.95),ParRange("tolerance","r","Tolerance on fraction",0.01,0.0001,0.1),ParRange("flux","r","Photon flux to simulate",0.01,0.0000001,0.01),ParValue("fovfile","f","Input field of view file",None),ParValue("marx_root","f","Directory where MARX is installed",'${MARX_ROOT}'),ParValue("random_seed","i","PSF random seed, -1: current time",-1),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Delete output file if it already exists?",False)],
-    }
 
+    parinfo['pileup_map'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input counts image",None),ParValue("outfile","f","Output pileup image",None)]',
+        'opt': '[ParValue("clobber","b","Remove existing output?",False),ParRange("verbose","i","Tool chatter",0,0,5)]',
+        }
 
-parinfo['psf_project_ray'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("outfile","f","Output pseudo-event file",None),ParValue("evtfile","f","Reference Event List",None)],
-    'opt': [ParSet("detector","s","Detect configuration",'ACIS-I',["ACIS-I","ACIS-S","HRC-I","HRC-S"]),ParValue("asolfile","f","Aspect solution file, needed if simulated dither",None),ParValue("simx","r","Over-ride SIM X location",None),ParValue("simy","r","Over-ride SIM Y location",None),ParValue("simz","r","Over-ride SIM Z location",None),ParValue("defocus","r","Amount of defocus",0),ParRange("xblur","r","Amount to Gaussian blur x-positions [arcsec]",0,0,None),ParRange("yblur","r","Amount to Gaussian blur y-positions [arcsec]",')xblur',0,None),ParRange("ablur","r","Rotation angle for Gaussian blur [deg]",0,-90,90),ParSet("blur_coord","s","Coordinate system to apply blur",'sky',["sky","det"]),ParValue("lcfile","f","Light-curve file used to generate times",None),ParValue("randseed","r","Random seed",0),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("ardlibpar","f","Parameter file for ARDLIB files",'ardlib.par'),ParValue("detsubsysmod","s","Detector sybsystem modifier",'BPMASK=0'),ParValue("clobber","b","Clobber existing file",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['psf_contour'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file or image",None),ParValue("outroot","f","Output directory and root filename",None),ParValue("pos","s","Position: coordinate or input file with columns RA and DEC",None)]',
+        'opt': '[ParSet("method","s","Region creating algorithm",\'contour\',["contour","lasso","fitted_ellipse","ecf_ellipse","convex_hull"]),ParRange("energy","r","Monochromatic energy to simulate PSF",1.0,0.3,10.0),ParRange("fraction","r","Target fraction of the PSF to include",0.9,0.6,0.95),ParRange("tolerance","r","Tolerance on fraction",0.01,0.0001,0.1),ParRange("flux","r","Photon flux to simulate",0.01,0.0000001,0.01),ParValue("fovfile","f","Input field of view file",None),ParValue("marx_root","f","Directory where MARX is installed",\'${MARX_ROOT}\'),ParValue("random_seed","i","PSF random seed, -1: current time",-1),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use (None:use all available)",None),ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Delete output file if it already exists?",False)]',
+        }
 
-parinfo['psfsize_srcs'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image or event file",None),ParValue("pos","s","Input position:  either filename or ra,dec",None),ParValue("outfile","f","Output table",None)],
-    'opt': [ParValue("energy","s","Monochromatic energy to use in PSF lookup [keV]",'broad'),ParRange("ecf","r","Encircled counts fraction (psf fraction)",0.9,0,1.0),ParValue("psffile","f","REEF Caldb filename",'CALDB'),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Removing existing files?",False)],
-    }
 
+    parinfo['psf_project_ray'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("outfile","f","Output pseudo-event file",None),ParValue("evtfile","f","Reference Event List",None)]',
+        'opt': '[ParSet("detector","s","Detect configuration",\'ACIS-I\',["ACIS-I","ACIS-S","HRC-I","HRC-S"]),ParValue("asolfile","f","Aspect solution file, needed if simulated dither",None),ParValue("simx","r","Over-ride SIM X location",None),ParValue("simy","r","Over-ride SIM Y location",None),ParValue("simz","r","Over-ride SIM Z location",None),ParValue("defocus","r","Amount of defocus",0),ParRange("xblur","r","Amount to Gaussian blur x-positions [arcsec]",0,0,None),ParRange("yblur","r","Amount to Gaussian blur y-positions [arcsec]",\')xblur\',0,None),ParRange("ablur","r","Rotation angle for Gaussian blur [deg]",0,-90,90),ParSet("blur_coord","s","Coordinate system to apply blur",\'sky\',["sky","det"]),ParValue("lcfile","f","Light-curve file used to generate times",None),ParValue("randseed","r","Random seed",0),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("ardlibpar","f","Parameter file for ARDLIB files",\'ardlib.par\'),ParValue("detsubsysmod","s","Detector sybsystem modifier",\'BPMASK=0\'),ParValue("clobber","b","Clobber existing file",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['r4_header_update'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file.  File is modified in place",None)],
-    'opt': [ParValue("pbkfile","f","Parameter block filename.  If blank will try to locate from infile",None),ParValue("asolfile","f","Aspect solution file(s).  If blank will try to locate from infile",None),ParRange("verbose","i","Amount of tool chatter",0,0,5)],
-    }
 
+    parinfo['psfsize_srcs'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image or event file",None),ParValue("pos","s","Input position:  either filename or ra,dec",None),ParValue("outfile","f","Output table",None)]',
+        'opt': '[ParValue("energy","s","Monochromatic energy to use in PSF lookup [keV]",\'broad\'),ParRange("ecf","r","Encircled counts fraction (psf fraction)",0.9,0,1.0),ParValue("psffile","f","REEF Caldb filename",\'CALDB\'),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Removing existing files?",False)]',
+        }
 
-parinfo['rank_roi'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file",None),ParValue("roifiles","f","Stack of ROI files",None),ParValue("outfile","f","Output file name temple, must include {:04d}",None)],
-    'opt': [ParSet("method","s","Metric to use to assign overlap area",'max',["max","min","big","small","bright","faint"]),ParValue("clobber","b","OK to overwrite existing output files?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['r4_header_update'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file.  File is modified in place",None)]',
+        'opt': '[ParValue("pbkfile","f","Parameter block filename.  If blank will try to locate from infile",None),ParValue("asolfile","f","Aspect solution file(s).  If blank will try to locate from infile",None),ParRange("verbose","i","Amount of tool chatter",0,0,5)]',
+        }
 
-parinfo['readout_bkg'] = {
-    'istool': True,
-    'req': [ParValue("indir","f","Input directory; should contain primary/ and secondary/ subdirs",None),ParValue("outfile","f","Output background file",None)],
-    'opt': [ParValue("tmpdir","f","Temporary directory",'${ASCDS_WORK_PATH}'),ParRange("random","i","Random seed, 0=clock time",0,0,None),ParValue("check_vf_pha","b","Clean ACIS background in VFAINT data?",False),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove existing output file?",False)],
-    }
 
+    parinfo['rank_roi'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file",None),ParValue("roifiles","f","Stack of ROI files",None),ParValue("outfile","f","Output file name temple, must include {:04d}",None)]',
+        'opt': '[ParSet("method","s","Metric to use to assign overlap area",\'max\',["max","min","big","small","bright","faint"]),ParValue("clobber","b","OK to overwrite existing output files?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['reg2tgmask'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input ds9 region file",None),ParValue("srcfile","f","Input original FITS region file",'CALDB'),ParValue("outfile","f","Output FITS region file",None)],
-    'opt': [ParValue("clobber","b","Clobber existing output if it exists?",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['readout_bkg'] = {
+        'istool': True,
+        'req': '[ParValue("indir","f","Input directory; should contain primary/ and secondary/ subdirs",None),ParValue("outfile","f","Output background file",None)]',
+        'opt': '[ParValue("tmpdir","f","Temporary directory",\'${ASCDS_WORK_PATH}\'),ParRange("random","i","Random seed, 0=clock time",0,0,None),ParValue("check_vf_pha","b","Clean ACIS background in VFAINT data?",False),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove existing output file?",False)]',
+        }
 
-parinfo['regphystocel'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input region file in physical coordinates",None),ParValue("outfile","f","Output ds9 format region file in celestial coordinates",None)],
-    'opt': [ParValue("wcsfile","f","Image or event file with WCS if not in infile",None),ParValue("text","s","Column or keyword to use for region title",None),ParValue("tag","s","Columns or keywords to use for region tags",None),ParValue("clobber","b","Remove outfile if it already exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['reg2tgmask'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input ds9 region file",None),ParValue("srcfile","f","Input original FITS region file",\'CALDB\'),ParValue("outfile","f","Output FITS region file",None)]',
+        'opt': '[ParValue("clobber","b","Clobber existing output if it exists?",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['reproject_aspect'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file with duplicate srcs",None),ParValue("refsrcfile","f","Input file with reference srcs",None),ParValue("updfile","f","Either input asol file, or file with WCS to be updated",None),ParValue("outfile","f","Output asol file",None)],
-    'opt': [ParValue("wcsfile","f","Input file with WCS used in transform",None),ParRange("radius","r","radius used to match sources (arcsec)",12,0,None),ParRange("residlim","r","src pairs with residuals > residlim are dropped (arcsec)",2,0,None),ParRange("residfac","r","src pairs with residuals > residfac * position error are dropped",0,0,None),ParRange("residtype","i","residfac applies to: (0) each residual, (1) avg residuals",0,0,1),ParSet("method","s","reproject method: rot/scale/trans (rst) or translate (trans)",'rst',["rst","trans"]),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",'STDOUT'),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['regphystocel'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input region file in physical coordinates",None),ParValue("outfile","f","Output ds9 format region file in celestial coordinates",None)]',
+        'opt': '[ParValue("wcsfile","f","Image or event file with WCS if not in infile",None),ParValue("text","s","Column or keyword to use for region title",None),ParValue("tag","s","Columns or keywords to use for region tags",None),ParValue("clobber","b","Remove outfile if it already exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['reproject_events'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None),ParValue("match","f","Match file",'none')],
-    'opt': [ParValue("aspect","f","Aspect file",None),ParValue("random","i","random seed (0 use time, -1 no randomize)",-1),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['reproject_aspect'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file with duplicate srcs",None),ParValue("refsrcfile","f","Input file with reference srcs",None),ParValue("updfile","f","Either input asol file, or file with WCS to be updated",None),ParValue("outfile","f","Output asol file",None)]',
+        'opt': '[ParValue("wcsfile","f","Input file with WCS used in transform",None),ParRange("radius","r","radius used to match sources (arcsec)",12,0,None),ParRange("residlim","r","src pairs with residuals > residlim are dropped (arcsec)",2,0,None),ParRange("residfac","r","src pairs with residuals > residfac * position error are dropped",0,0,None),ParRange("residtype","i","residfac applies to: (0) each residual, (1) avg residuals",0,0,1),ParSet("method","s","reproject method: rot/scale/trans (rst) or translate (trans)",\'rst\',["rst","trans"]),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",\'STDOUT\'),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['reproject_image'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("matchfile","f","Reference image",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParRange("resolution","i","Number of point per side to evaluate",1,0,None),ParSet("method","s","Average value",'sum',["sum","average"]),ParSet("coord_sys","s","Coordinate system to match images in",'world',["world","logical","physical"]),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,5)],
-    }
 
+    parinfo['reproject_events'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None),ParValue("match","f","Match file",\'none\')]',
+        'opt': '[ParValue("aspect","f","Aspect file",None),ParValue("random","i","random seed (0 use time, -1 no randomize)",-1),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['reproject_image_grid'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParRange("xsize","i","X-Size of output image in image pixels",1,1,None),ParRange("ysize","i","Y-Size of output image in image pixels",1,1,None),ParValue("xcenter","s","X-Center of image in coord_sys",None),ParValue("ycenter","s","Y-Center of image in coord_sys",None),ParRange("theta","r","Angle between world coord north and output y axis",0,0,360),ParValue("pixelsize","s","Pixel size",None)],
-    'opt': [ParRange("resolution","i","Number of point per side to evaluate",1,0,None),ParSet("method","s","Average value",'sum',["sum","average"]),ParSet("coord_sys","s","Coordinate system to match images in",'world',["world","logical","physical"]),ParValue("lookupTab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,5)],
-    }
 
+    parinfo['reproject_image'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("matchfile","f","Reference image",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParRange("resolution","i","Number of point per side to evaluate",1,0,None),ParSet("method","s","Average value",\'sum\',["sum","average"]),ParSet("coord_sys","s","Coordinate system to match images in",\'world\',["world","logical","physical"]),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,5)]',
+        }
 
-parinfo['reproject_obs'] = {
-    'istool': True,
-    'req': [ParValue("infiles","f","Input events files",None),ParValue("outroot","f","Root of output files",None)],
-    'opt': [ParValue("asolfiles","f","Input aspect solutions",None),ParValue("merge","b","Merge event files?",True),ParValue("refcoord","s","Reference coordinates or evt2 file",None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("linkfiles","b","Link (rather than copy) files?",True),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)],
-    }
 
+    parinfo['reproject_image_grid'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image file name",None),ParValue("outfile","f","Output file name",None),ParRange("xsize","i","X-Size of output image in image pixels",1,1,None),ParRange("ysize","i","Y-Size of output image in image pixels",1,1,None),ParValue("xcenter","s","X-Center of image in coord_sys",None),ParValue("ycenter","s","Y-Center of image in coord_sys",None),ParRange("theta","r","Angle between world coord north and output y axis",0,0,360),ParValue("pixelsize","s","Pixel size",None)]',
+        'opt': '[ParRange("resolution","i","Number of point per side to evaluate",1,0,None),ParSet("method","s","Average value",\'sum\',["sum","average"]),ParSet("coord_sys","s","Coordinate system to match images in",\'world\',["world","logical","physical"]),ParValue("lookupTab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("clobber","b","Clobber existing files",False),ParRange("verbose","i","Tool verbosity",0,0,5)]',
+        }
 
-parinfo['rmfimg'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None)],
-    'opt': [ParValue("arf","f","ARF file (optional)",None),ParValue("arfout","f","ARF output image (may be blank)",None),ParValue("product","b","Multiply RMF and ARF in output",False),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)],
-    }
 
+    parinfo['reproject_obs'] = {
+        'istool': True,
+        'req': '[ParValue("infiles","f","Input events files",None),ParValue("outroot","f","Root of output files",None)]',
+        'opt': '[ParValue("asolfiles","f","Input aspect solutions",None),ParValue("merge","b","Merge event files?",True),ParValue("refcoord","s","Reference coordinates or evt2 file",None),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("linkfiles","b","Link (rather than copy) files?",True),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)]',
+        }
 
-parinfo['roi'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input src list",None),ParValue("fovregion","s","Input field of view region",None),ParValue("streakregion","s","Input streak region",None),ParValue("outsrcfile","f","Output source list",None),ParSet("radiusmode","s","Background radius computation method",'mul',["add","mul","area"]),ParRange("bkgradius","r","Background radius",3,0,None)],
-    'opt': [ParRange("regres","r","Pixelation resolution for region overlap, or background region",.2,.0,None),ParSet("group","s","Make one srcregion per group or per individual source",'group',["group","individual","exclude"]),ParSet("targetbkg","s","Make background around all sources or just target?",'all',["all","target"]),ParValue("srcfactor","r","Amount added or multiplied by to expand excluded overlapping source region",0),ParSet("srcfunction","s","Add or multiply srcfactor?",'add',["add","mul"]),ParValue("bkgfactor","r","Amount added or multiplied by to expand src region excluded from bkg region",0),ParSet("bkgfunction","s","Add or multiply bkgfactor?",'add',["add","mul"]),ParSet("bkgfactarg","s","Apply bkgfactor to all srcs in bkg or just to target?",'target',["all","target"]),ParRange("maxpix","i","Maximum number of pixels when intersecting",None,1,None),ParRange("fovres","r","Pixelation resolution for fov check",1,0,1),ParRange("streakres","r","Pixelation resolution for streak check",0.25,0,1),ParValue("ignore_streaksrc","b","Ignore streak region for source list ?",True),ParValue("compute_conf","b","Compute the various confused states between the sources and backgrounds",True),ParValue("evtfile","f","Event File (# counts per region)",None),ParValue("num_srcs","i","Number of sources output",None),ParValue("clobber","b","Remove existing output files?",False),ParRange("verbose","i","tool verbosity",0,0,0)],
-    }
 
+    parinfo['rmfimg'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input dataset/block specification",None),ParValue("outfile","f","Output dataset/block specification",None)]',
+        'opt': '[ParValue("arf","f","ARF file (optional)",None),ParValue("arfout","f","ARF output image (may be blank)",None),ParValue("product","b","Multiply RMF and ARF in output",False),ParRange("verbose","i","Debug Level(0-5)",0,0,5),ParValue("clobber","b","Clobber existing file",False)]',
+        }
 
-parinfo['search_csc'] = {
-    'istool': True,
-    'req': [ParValue("pos","s","Input position.  RA, Dec, eg: 246.59955,-24.415158 or name, M81",None),ParRange("radius","r","Search radius [default: arcmin]",0,0,60),ParValue("outfile","f","Name of output table (TSV format)",None)],
-    'opt': [ParSet("radunit","s","Units of search radius",'arcmin',["arcmin","arcsec","deg"]),ParValue("columns","s","List of columns to return",'INDEF'),ParValue("sensitivity","b","Retrieve Limiting sensitivity for each energy band?",False),ParSet("download","s","Download data products for which sources?",'none',["none","ask","all"]),ParValue("root","f","Output root for data products",'./'),ParValue("bands","s","Comma separated list of CSC band names taken from broad, soft, medium, hard, ultrasoft, wide. Blank retrieves all",'broad,wide'),ParValue("filetypes","s","Comma separated list of CSC filetypes.  Blank retrieves all",'regevt,pha,arf,rmf,lc,psf,regexp'),ParSet("catalog","s","Version of catalog",'csc2.1',["csc2.1","csc2","csc1","current","latest"]),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove existing outfile if it exists?",False)],
-    }
 
+    parinfo['roi'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input src list",None),ParValue("fovregion","s","Input field of view region",None),ParValue("streakregion","s","Input streak region",None),ParValue("outsrcfile","f","Output source list",None),ParSet("radiusmode","s","Background radius computation method",\'mul\',["add","mul","area"]),ParRange("bkgradius","r","Background radius",3,0,None)]',
+        'opt': '[ParRange("regres","r","Pixelation resolution for region overlap, or background region",.2,.0,None),ParSet("group","s","Make one srcregion per group or per individual source",\'group\',["group","individual","exclude"]),ParSet("targetbkg","s","Make background around all sources or just target?",\'all\',["all","target"]),ParValue("srcfactor","r","Amount added or multiplied by to expand excluded overlapping source region",0),ParSet("srcfunction","s","Add or multiply srcfactor?",\'add\',["add","mul"]),ParValue("bkgfactor","r","Amount added or multiplied by to expand src region excluded from bkg region",0),ParSet("bkgfunction","s","Add or multiply bkgfactor?",\'add\',["add","mul"]),ParSet("bkgfactarg","s","Apply bkgfactor to all srcs in bkg or just to target?",\'target\',["all","target"]),ParRange("maxpix","i","Maximum number of pixels when intersecting",None,1,None),ParRange("fovres","r","Pixelation resolution for fov check",1,0,1),ParRange("streakres","r","Pixelation resolution for streak check",0.25,0,1),ParValue("ignore_streaksrc","b","Ignore streak region for source list ?",True),ParValue("compute_conf","b","Compute the various confused states between the sources and backgrounds",True),ParValue("evtfile","f","Event File (# counts per region)",None),ParValue("num_srcs","i","Number of sources output",None),ParValue("clobber","b","Remove existing output files?",False),ParRange("verbose","i","tool verbosity",0,0,0)]',
+        }
 
-parinfo['simulate_psf'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Event or Image file",None),ParValue("outroot","f","Output root name",None),ParRange("ra","r","Right Asscension of source [deg]",0,0,360),ParRange("dec","r","Declination of source [deg]",0,-90,90),ParValue("spectrumfile","f","3 column spectrum file [kev vs. photon/cm^2/sec]",None)],
-    'opt': [ParRange("monoenergy","r","Monochromatic energy [keV]",None,0,10),ParValue("flux","r","Flux value for spectrum or monochromatic energy",None),ParSet("simulator","s","Which tool to simulate HRMA?",'marx',["marx","saotrace","file"]),ParValue("rayfile","f","Use existing rays file",None),ParSet("projector","s","Which tool to project",'marx',["marx","psf_project_ray","none"]),ParRange("random_seed","i","PSF random seed, -1: current time",-1,-1,1073741824),ParRange("blur","r","Blur (marx.AspectBlur or psf_project_ray.xblur) [arcsec]",0.07,0,None),ParValue("readout_streak","b","MARX Simulate readout streak (ACIS)",False),ParValue("pileup","b","MARX Run pileup module (ACIS)",False),ParValue("ideal","b","Should MARX use idealized detectors (QE=1) be used?",True),ParValue("extended","b","Should MARX detectors be extended beyond their physical edges?",True),ParRange("binsize","r","Image bin size [pix]",1,0,None),ParRange("numsig","r","Number of sigma to make image",7,1,None),ParRange("minsize","i","Minimum image size [pix]",None,0,None),ParRange("maxsize","i","Maximum image size [pix]",None,0,None),ParRange("numiter","i","Number of simulations to combine together",1,1,None),ParRange("numrays","i","Number of rays to simulate",None,0,None),ParValue("keepiter","b","Keep files from each iteration?",False),ParValue("asolfile","f","Aspect solution file: blank=autofind, none=omit",None),ParValue("saotrace_install","f","Directory where SAOTrace was intalled",'${INSTALLDIR}'),ParValue("saotrace_db","f","Direcotry where SAOTrace database was intalled",'${SAOTRACE_DB}'),ParValue("saotrace_mirror","s","SAOTrace mirror configuration",'orbit-200809-01f-a'),ParValue("marx_root","f","Directory where MARX is installed",'${MARX_ROOT}'),ParRange("verbose","i","Chatter level of tool",1,0,5)],
-    }
 
+    parinfo['search_csc'] = {
+        'istool': True,
+        'req': '[ParValue("pos","s","Input position.  RA, Dec, eg: 246.59955,-24.415158, name, M81, or table of ra,dec",None),ParRange("radius","r","Search radius [default: arcmin]",0,0,60),ParValue("outfile","f","Name of output table (TSV format)",None)]',
+        'opt': '[ParSet("radunit","s","Units of search radius",\'arcmin\',["arcmin","arcsec","deg"]),ParValue("columns","s","List of columns to return",\'INDEF\'),ParValue("sensitivity","b","Retrieve Limiting sensitivity for each energy band?",False),ParSet("download","s","Download data products for which sources?",\'none\',["none","ask","all"]),ParValue("root","f","Output root for data products",\'./\'),ParValue("bands","s","Comma separated list of CSC band names taken from broad, soft, medium, hard, ultrasoft, wide. Blank retrieves all",\'broad,wide\'),ParValue("filetypes","s","Comma separated list of CSC filetypes.  Blank retrieves all",\'regevt,pha,arf,rmf,lc,psf,regexp\'),ParSet("catalog","s","Version of catalog",\'csc2.1\',["csc2.1","csc2","csc1","current","latest"]),ParRange("nquery","i","Maximum number of concurrent queries and downloads",4,1,16),ParValue("gunzip","b","Decompress the data products as they are retrieved?",False),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove existing outfile if it exists?",False)]',
+        }
 
-parinfo['sky2tdet'] = {
-    'istool': True,
-    'req': [ParValue("infile","s","Input image in sky (x,y) coordinates",None),ParValue("asphistfile","s","Input aspect histogram file",None),ParValue("outfile","s","Output TDET  WMAP file",None)],
-    'opt': [ParRange("bin","i","Binning factor",1,1,None),ParValue("geompar","s","Pixlib geometry file",'geom'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Remove existing files?",False)],
-    }
 
+    parinfo['simulate_psf'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Event or Image file",None),ParValue("outroot","f","Output root name",None),ParRange("ra","r","Right Asscension of source [deg]",0,0,360),ParRange("dec","r","Declination of source [deg]",0,-90,90),ParValue("spectrumfile","f","3 column spectrum file [kev vs. photon/cm^2/sec]",None)]',
+        'opt': '[ParRange("monoenergy","r","Monochromatic energy [keV]",None,0,10),ParValue("flux","r","Flux value for spectrum or monochromatic energy",None),ParSet("simulator","s","Which tool to simulate HRMA?",\'marx\',["marx","saotrace","file"]),ParValue("rayfile","f","Use existing rays file",None),ParSet("projector","s","Which tool to project",\'marx\',["marx","psf_project_ray","none"]),ParRange("random_seed","i","PSF random seed, -1: current time",-1,-1,1073741824),ParRange("blur","r","Blur (marx.AspectBlur or psf_project_ray.xblur) [arcsec]",0.07,0,None),ParValue("readout_streak","b","MARX Simulate readout streak (ACIS)",False),ParValue("pileup","b","MARX Run pileup module (ACIS)",False),ParValue("ideal","b","Should MARX use idealized detectors (QE=1) be used?",True),ParValue("extended","b","Should MARX detectors be extended beyond their physical edges?",True),ParRange("binsize","r","Image bin size [pix]",1,0,None),ParRange("numsig","r","Number of sigma to make image",7,1,None),ParRange("minsize","i","Minimum image size [pix]",None,0,None),ParRange("maxsize","i","Maximum image size [pix]",None,0,None),ParRange("numiter","i","Number of simulations to combine together",1,1,None),ParRange("numrays","i","Number of rays to simulate",None,0,None),ParValue("keepiter","b","Keep files from each iteration?",False),ParValue("asolfile","f","Aspect solution file: blank=autofind, none=omit",None),ParValue("saotrace_install","f","Directory where SAOTrace was intalled",\'${INSTALLDIR}\'),ParValue("saotrace_db","f","Direcotry where SAOTrace database was intalled",\'${SAOTRACE_DB}\'),ParValue("saotrace_mirror","s","SAOTrace mirror configuration",\'orbit-200809-01f-a\'),ParValue("marx_root","f","Directory where MARX is installed",\'${MARX_ROOT}\'),ParRange("verbose","i","Chatter level of tool",1,0,5)]',
+        }
 
-parinfo['skyfov'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Name of input file, event list, image fits, or obi par file",None),ParValue("outfile","f","Name of output file",None)],
-    'opt': [ParValue("logfile","f","Name of log file",'STDOUT'),ParSet("kernel","s","Output file format, ASCII or FITS",'FITS',["ascii","ASCII","fits","FITS"]),ParValue("mskfile","f","Mask file to retain active windows of chips",None),ParValue("aspect","f","Aspect file or a stack of aspect file list",None),ParValue("geompar","f","Pixlib geometry parameter file",'geom'),ParSet("method","s","Two methods that estimate the dither range.",'minmax',["minmax","convexhull"]),ParValue("clobber","b","Overwrite existing outfile (yes|no)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['sky2tdet'] = {
+        'istool': True,
+        'req': '[ParValue("infile","s","Input image in sky (x,y) coordinates",None),ParValue("asphistfile","s","Input aspect histogram file",None),ParValue("outfile","s","Output TDET  WMAP file",None)]',
+        'opt': '[ParRange("bin","i","Binning factor",1,1,None),ParValue("geompar","s","Pixlib geometry file",\'geom\'),ParRange("verbose","i","Verbosity",0,0,5),ParValue("clobber","b","Remove existing files?",False)]',
+        }
 
-parinfo['specextract'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Source event file(s)",None),ParValue("outroot","f","Output directory path + root name for output files",None)],
-    'opt': [ParValue("bkgfile","f","Background event file(s)",None),ParValue("asp","f","Source aspect solution or histogram file(s)",None),ParValue("dtffile","s","Input DTF files for HRC observations",None),ParValue("mskfile","f","Maskfile (input to mkwarf)",None),ParValue("rmffile","f","rmffile input for CALDB",'CALDB'),ParValue("badpixfile","f","Bad pixel file for the observation",None),ParValue("dafile","f","Dead area file (input to mkwarf)",'CALDB'),ParValue("bkgresp","b","Create background ARF and RMF?",True),ParValue("weight","b","Should response files be weighted?",True),ParValue("weight_rmf","b","Should RMF also be weighted?",False),ParSet("resp_pos","s","Unweighted response position determination method",'REGION',["MAX","CENTROID","REGEXTENT","REGION"]),ParValue("refcoord","s","RA and Dec of responses?",None),ParValue("correctpsf","b","Apply point source aperture correction to ARF?",False),ParValue("combine","b","Combine ungrouped output spectra and responses?",False),ParValue("readout_streakspec","b","Is the source extraction region for the ACIS readout streak?",False),ParSet("grouptype","s","Spectrum grouping type (same as grouptype in dmgroup)",'NUM_CTS',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE","ADAPTIVE_SNR","BIN_WIDTH","MIN_SLOPE","MAX_SLOPE","BIN_FILE"]),ParValue("binspec","s","Spectrum grouping specification (NONE,1:1024:10,etc)",'15'),ParSet("bkg_grouptype","s","Background spectrum grouping type (NONE, BIN, SNR, NUM_BINS, NUM_CTS, or ADAPTIVE)",'NONE',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE"]),ParValue("bkg_binspec","s","Background spectrum grouping specification (NONE,10,etc)",None),ParValue("energy","s","Energy grid",'0.3:11.0:0.01'),ParValue("channel","s","RMF binning attributes",'1:1024:1'),ParValue("energy_wmap","s","Energy range for (dmextract) WMAP input to mkacisrmf",'300:2000'),ParValue("binarfcorr","s","Detector pixel binnning factor for (arfcorr) to determine size and scale of PSF to derive aperture corrections at each energy step.",'1'),ParValue("binwmap","s","Binning factor for (dmextract) WMAP input to mkacisrmf",'tdet=8'),ParValue("binarfwmap","s","Binning factor for (sky2tdet) WMAP input to mkwarf",'1'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)],
-    }
 
+    parinfo['skyfov'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Name of input file, event list, image fits, or obi par file",None),ParValue("outfile","f","Name of output file",None)]',
+        'opt': '[ParValue("logfile","f","Name of log file",\'STDOUT\'),ParSet("kernel","s","Output file format, ASCII or FITS",\'FITS\',["ascii","ASCII","fits","FITS"]),ParValue("mskfile","f","Mask file to retain active windows of chips",None),ParValue("aspect","f","Aspect file or a stack of aspect file list",None),ParValue("geompar","f","Pixlib geometry parameter file",\'geom\'),ParSet("method","s","Two methods that estimate the dither range.",\'minmax\',["minmax","convexhull"]),ParValue("clobber","b","Overwrite existing outfile (yes|no)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['splitobs'] = {
-    'istool': True,
-    'req': [ParValue("indir","f","Input obsid level directory",None),ParValue("outroot","f","Output directory root name",')indir')],
-    'opt': [ParRange("verbose","i","Tool Chatter",1,0,5),ParValue("clobber","b","Remove and overwrite files if they already exist?",False)],
-    }
 
+    parinfo['specextract'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Source event file(s)",None),ParValue("outroot","f","Output directory path + root name for output files",None)]',
+        'opt': '[ParValue("bkgfile","f","Background event file(s)",None),ParValue("asp","f","Source aspect solution or histogram file(s)",None),ParValue("dtffile","s","Input DTF files for HRC observations",None),ParValue("mskfile","f","Maskfile (input to mkwarf)",None),ParValue("rmffile","f","rmffile input for CALDB",\'CALDB\'),ParValue("badpixfile","f","Bad pixel file for the observation",None),ParValue("dafile","f","Dead area file (input to mkwarf)",\'CALDB\'),ParValue("bkgresp","b","Create background ARF and RMF?",True),ParValue("weight","b","Should response files be weighted?",True),ParValue("weight_rmf","b","Should RMF also be weighted?",False),ParSet("resp_pos","s","Unweighted response position determination method",\'REGION\',["MAX","CENTROID","REGEXTENT","REGION"]),ParValue("refcoord","s","RA and Dec of responses?",None),ParValue("correctpsf","b","Apply point source aperture correction to ARF?",False),ParValue("combine","b","Combine ungrouped output spectra and responses?",False),ParValue("readout_streakspec","b","Is the source extraction region for the ACIS readout streak?",False),ParSet("grouptype","s","Spectrum grouping type (same as grouptype in dmgroup)",\'NUM_CTS\',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE","ADAPTIVE_SNR","BIN_WIDTH","MIN_SLOPE","MAX_SLOPE","BIN_FILE"]),ParValue("binspec","s","Spectrum grouping specification (NONE,1:1024:10,etc)",\'15\'),ParSet("bkg_grouptype","s","Background spectrum grouping type (NONE, BIN, SNR, NUM_BINS, NUM_CTS, or ADAPTIVE)",\'NONE\',["NONE","BIN","SNR","NUM_BINS","NUM_CTS","ADAPTIVE"]),ParValue("bkg_binspec","s","Background spectrum grouping specification (NONE,10,etc)",None),ParValue("energy","s","Energy grid",\'0.3:11.0:0.01\'),ParValue("channel","s","RMF binning attributes",\'1:1024:1\'),ParValue("energy_wmap","s","Energy range for (dmextract) WMAP input to mkacisrmf",\'300:2000\'),ParValue("binarfcorr","s","Detector pixel binnning factor for (arfcorr) to determine size and scale of PSF to derive aperture corrections at each energy step.",\'1\'),ParValue("binwmap","s","Binning factor for (dmextract) WMAP input to mkacisrmf",\'tdet=8\'),ParValue("binarfwmap","s","Binning factor for (sky2tdet) WMAP input to mkwarf",\'1\'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Debug Level(0-5)",1,0,5)]',
+        }
 
-parinfo['src_psffrac'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image or event file",None),ParValue("region","s","Input circular region",None),ParValue("outfile","f","Output table",None)],
-    'opt': [ParValue("energy","s","Monochromatic energy to use in PSF lookup [keV]",'broad'),ParValue("psffile","f","REEF Caldb filename",'CALDB'),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Removing existing files?",False)],
-    }
 
+    parinfo['splitobs'] = {
+        'istool': True,
+        'req': '[ParValue("indir","f","Input obsid level directory",None),ParValue("outroot","f","Output directory root name",\')indir\')]',
+        'opt': '[ParRange("verbose","i","Tool Chatter",1,0,5),ParValue("clobber","b","Remove and overwrite files if they already exist?",False)]',
+        }
 
-parinfo['srcextent'] = {
-    'istool': True,
-    'req': [ParValue("srcfile","f","Source file, FITS image or FITS events list",None),ParValue("outfile","f","Output file, FITS table",None),ParValue("psffile","f","PSF file, FITS image or FITS events list (optional)",None),ParValue("regfile","f","Region File, ellipse or circle, in FITS or ASCII (required for events list)",None)],
-    'opt': [ParSet("shape","s","source shape [gaussian,disk]",'gaussian',["gaussian","disk"]),ParValue("x0","r","estimate of x-position [sky]",None),ParValue("y0","r","estimate of y-position [sky]",None),ParValue("srcsize","r","crude estimate of source size [arcseconds]. -1 => use theta approximation.",-1),ParRange("theta","r","off-axis angle to get approx psf size as estimate of source size [arcminutes]",0,0,55),ParValue("imgsize","r","size of image [arcseconds]",0),ParValue("binfactor","i","image binning factor",0),ParValue("mincounts","i","minimum counts threshold inside ellipse",15),ParValue("minthresh","i","minimum counts threshold for source file",6),ParValue("sigmafactor","r","ratio of desired sigma to wavdetect guess e.g. 1.6/3.0",0.533),ParValue("psfblur","r","Additional aspect blur to add in quadrature to PSF ellipse axes size (ACIS-only)",0.1873),ParValue("clobber","b","clobber output file",False),ParRange("verbose","i","verbosity setting",3,0,5)],
-    }
 
+    parinfo['src_psffrac'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image or event file",None),ParValue("region","s","Input circular region",None),ParValue("outfile","f","Output table",None)]',
+        'opt': '[ParValue("energy","s","Monochromatic energy to use in PSF lookup [keV]",\'broad\'),ParValue("psffile","f","REEF Caldb filename",\'CALDB\'),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("clobber","b","Removing existing files?",False)]',
+        }
 
-parinfo['srcflux'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("pos","s","Input source position: filename or RA,Dec",None),ParValue("outroot","f","Output root name",None)],
-    'opt': [ParValue("bands","s","Energy bands",'default'),ParSet("regions","s","Method to determine regions",'simple',["simple","optimized","user"]),ParValue("srcreg","f","Stack of source regions",None),ParValue("bkgreg","f","Stack of background regions",None),ParValue("bkgresp","b","Create background ARF and RMF?",True),ParSet("psfmethod","s","PSF calibration method",'ideal',["ideal","psffile","arfcorr","quick","marx"]),ParValue("psffile","f","Input psf image",None),ParRange("conf","r","Confidence interval",0.9,0,1),ParRange("binsize","r","Image bin sizes",1,0,None),ParValue("rmffile","f","RMF file, if blank or none will be created with specextract",None),ParValue("arffile","f","ARF file, if blank or none will be created with specextract",None),ParValue("model","s","Sherpa model definition string",'xspowerlaw.pow1'),ParValue("paramvals","s","';' delimited string of (parameter=value) pairs",'pow1.PhoIndex=2.0'),ParValue("absmodel","s","Absorption model for calculating unabsorbed flux",'xsphabs.abs1'),ParValue("absparams","s","';' delimited string of (parameter=value) pairs for absorption model used to calculate unabsorbed flux",'abs1.nH=%GAL%'),ParSet("abund","s","set XSpec solar abundance",'angr',["angr","feld","aneb","grsa","wilm","lodd"]),ParValue("pluginfile","f","User plugin file name",None),ParValue("fovfile","f","Field of view file",None),ParValue("asolfile","f","Aspect solution file(s)",None),ParValue("mskfile","f","Mask file",None),ParValue("bpixfile","f","Bad pixel file",None),ParValue("dtffile","f","Live Time Correction List Files for HRC",None),ParValue("ecffile","f","REEF calibration file",'CALDB'),ParValue("marx_root","f","Directory where MARX is installed",'${MARX_ROOT}'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",'${ASCDS_WORK_PATH}'),ParValue("random_seed","i","PSF random seed, -1: current time",-1),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)],
-    }
 
+    parinfo['srcextent'] = {
+        'istool': True,
+        'req': '[ParValue("srcfile","f","Source file, FITS image or FITS events list",None),ParValue("outfile","f","Output file, FITS table",None),ParValue("psffile","f","PSF file, FITS image or FITS events list (optional)",None),ParValue("regfile","f","Region File, ellipse or circle, in FITS or ASCII (required for events list)",None)]',
+        'opt': '[ParSet("shape","s","source shape [gaussian,disk]",\'gaussian\',["gaussian","disk"]),ParValue("x0","r","estimate of x-position [sky]",None),ParValue("y0","r","estimate of y-position [sky]",None),ParValue("srcsize","r","crude estimate of source size [arcseconds]. -1 => use theta approximation.",-1),ParRange("theta","r","off-axis angle to get approx psf size as estimate of source size [arcminutes]",0,0,55),ParValue("imgsize","r","size of image [arcseconds]",0),ParValue("binfactor","i","image binning factor",0),ParValue("mincounts","i","minimum counts threshold inside ellipse",15),ParValue("minthresh","i","minimum counts threshold for source file",6),ParValue("sigmafactor","r","ratio of desired sigma to wavdetect guess e.g. 1.6/3.0",0.533),ParValue("psfblur","r","Additional aspect blur to add in quadrature to PSF ellipse axes size (ACIS-only)",0.1873),ParValue("clobber","b","clobber output file",False),ParRange("verbose","i","verbosity setting",3,0,5)]',
+        }
 
-parinfo['sso_freeze'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file or stack",None),ParValue("scephemfile","f","Input spacecraft ephemeris file",None),ParValue("ssoephemfile","f","Input solar system object file",None),ParValue("outfile","f","Output event file name",None)],
-    'opt': [ParValue("asolfile","f","Input aspect solution file",None),ParValue("ocsolfile","f","Output asol in OC coordinates",None),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",'STDOUT'),ParValue("scale","r","Image pixel scale (km/pixel, 0=angular coords)",0),ParValue("lookuptab","f","lookup table",'${ASCDS_CALIB}/dmmerge_header_lookup.txt'),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['srcflux'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("pos","s","Input source position: filename or RA,Dec",None),ParValue("outroot","f","Output root name",None)]',
+        'opt': '[ParValue("bands","s","Energy bands",\'default\'),ParSet("regions","s","Method to determine regions",\'simple\',["simple","optimized","user"]),ParValue("srcreg","f","Stack of source regions",None),ParValue("bkgreg","f","Stack of background regions",None),ParValue("bkgresp","b","Create background ARF and RMF?",True),ParSet("psfmethod","s","PSF calibration method",\'ideal\',["ideal","psffile","arfcorr","quick","marx"]),ParValue("psffile","f","Input psf image",None),ParRange("conf","r","Confidence interval",0.9,0,1),ParRange("binsize","r","Image bin sizes",1,0,None),ParValue("rmffile","f","RMF file, if blank or none will be created with specextract",None),ParValue("arffile","f","ARF file, if blank or none will be created with specextract",None),ParValue("model","s","Sherpa model definition string",\'xspowerlaw.pow1\'),ParValue("paramvals","s","\';\' delimited string of (parameter=value) pairs",\'pow1.PhoIndex=2.0\'),ParValue("absmodel","s","Absorption model for calculating unabsorbed flux",\'xsphabs.abs1\'),ParValue("absparams","s","\';\' delimited string of (parameter=value) pairs for absorption model used to calculate unabsorbed flux",\'abs1.nH=%GAL%\'),ParSet("abund","s","set XSpec solar abundance",\'angr\',["angr","feld","aneb","grsa","wilm","lodd"]),ParValue("pluginfile","f","User plugin file name",None),ParValue("fovfile","f","Field of view file",None),ParValue("asolfile","f","Aspect solution file(s)",None),ParValue("mskfile","f","Mask file",None),ParValue("bpixfile","f","Bad pixel file",None),ParValue("dtffile","f","Live Time Correction List Files for HRC",None),ParValue("ecffile","f","REEF calibration file",\'CALDB\'),ParValue("marx_root","f","Directory where MARX is installed",\'${MARX_ROOT}\'),ParValue("parallel","b","Run processes in parallel?",True),ParValue("nproc","i","Number of processors to use",None),ParValue("tmpdir","s","Directory for temporary files",\'${ASCDS_WORK_PATH}\'),ParValue("random_seed","i","PSF random seed, -1: current time",-1),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",1,0,5)]',
+        }
 
-parinfo['statmap'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("mapfile","f","Input map file",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParValue("column","s","Column name to compute statistics",'energy'),ParSet("statistic","s","Which statistic to compute?",'median',["median","mean","min","max","sum","count","wmedian","wmean","wmin","wmax","wsum"]),ParValue("xcolumn","s","Column to use for the X-coordinate",'x'),ParValue("ycolumn","s","Column to use for the Y-coordinate",'y'),ParValue("wcolumn","s","Column to use for weighted statistics",None),ParValue("clobber","b","Remove output file if it already exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)],
-    }
 
+    parinfo['sso_freeze'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file or stack",None),ParValue("scephemfile","f","Input spacecraft ephemeris file",None),ParValue("ssoephemfile","f","Input solar system object file",None),ParValue("outfile","f","Output event file name",None)]',
+        'opt': '[ParValue("asolfile","f","Input aspect solution file",None),ParValue("ocsolfile","f","Output asol in OC coordinates",None),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",\'STDOUT\'),ParValue("scale","r","Image pixel scale (km/pixel, 0=angular coords)",0),ParValue("lookuptab","f","lookup table",\'${ASCDS_CALIB}/dmmerge_header_lookup.txt\'),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['stk_build'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Stack to expand",None),ParValue("outfile","f","Output file name",None)],
-    'opt': [ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['statmap'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("mapfile","f","Input map file",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParValue("column","s","Column name to compute statistics",\'energy\'),ParSet("statistic","s","Which statistic to compute?",\'median\',["median","mean","min","max","sum","count","wmedian","wmean","wmin","wmax","wsum"]),ParValue("xcolumn","s","Column to use for the X-coordinate",\'x\'),ParValue("ycolumn","s","Column to use for the Y-coordinate",\'y\'),ParValue("wcolumn","s","Column to use for weighted statistics",None),ParValue("clobber","b","Remove output file if it already exists?",False),ParRange("verbose","i","Amount of tool chatter",1,0,5)]',
+        }
 
-parinfo['stk_count'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Stack to expand",None)],
-    'opt': [ParValue("count","s","Number of elements in stack",None),ParValue("echo","b","Print stack count value to screen?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['stk_build'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Stack to expand",None),ParValue("outfile","f","Output file name",None)]',
+        'opt': '[ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['stk_read_num'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Stack to expand",None),ParValue("num","i","Number of stack element to read",1)],
-    'opt': [ParValue("outelement","s","Name of num'th element in stack",None),ParValue("echo","b","Print name of element to screen?",False),ParRange("verbose","i","Verbosity level",0,0,5)],
-    }
 
+    parinfo['stk_count'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Stack to expand",None)]',
+        'opt': '[ParValue("count","s","Number of elements in stack",None),ParValue("echo","b","Print stack count value to screen?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['stk_where'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("match","s","Match this value",None)],
-    'opt': [ParValue("simple","b","Simple exact string match, no=regular-expressions",True),ParValue("case","b","Case-insenstive search?",False),ParValue("echo","b","Print output result to screen",False),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("outnum","i","Output position matched in stack",None),ParValue("outcount","i","Output number of matches in stack",0)],
-    }
 
+    parinfo['stk_read_num'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Stack to expand",None),ParValue("num","i","Number of stack element to read",1)]',
+        'opt': '[ParValue("outelement","s","Name of num\'th element in stack",None),ParValue("echo","b","Print name of element to screen?",False),ParRange("verbose","i","Verbosity level",0,0,5)]',
+        }
 
-parinfo['symmetrize'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input L2 HRC-S/LETG event list file",None),ParValue("outfile","f","Output file",None)],
-    'opt': [ParValue("sfile","f","Symmetry correction file",'${ASCDS_CONTRIB}/data/eefracIDEAL09.symm78corr'),ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)],
-    }
 
+    parinfo['stk_where'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("match","s","Match this value",None)]',
+        'opt': '[ParValue("simple","b","Simple exact string match, no=regular-expressions",True),ParValue("case","b","Case-insenstive search?",False),ParValue("echo","b","Print output result to screen",False),ParRange("verbose","i","Tool chatter level",0,0,5),ParValue("outnum","i","Output position matched in stack",None),ParValue("outcount","i","Output number of matches in stack",0)]',
+        }
 
-parinfo['tg_choose_method'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Required input 'src1a' file name, as produced by tg_findzo",None)],
-    'opt': [ParSet("method","s","Output of selected program's name: tgdetect or tg_findzo",'unknown',["tgdetect","tg_findzo","unknown","none"]),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['symmetrize'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input L2 HRC-S/LETG event list file",None),ParValue("outfile","f","Output file",None)]',
+        'opt': '[ParValue("sfile","f","Symmetry correction file",\'${ASCDS_CONTRIB}/data/eefracIDEAL09.symm78corr\'),ParRange("verbose","i","Debug level",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)]',
+        }
 
-parinfo['tg_create_mask'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file or stack",None),ParValue("outfile","f","Output region file or stack",None),ParValue("input_pos_tab","f","Input table with zero order positions or stack",None),ParSet("grating_obs","s","Observed grating type (header_value|HETG|HEG|MEG|LETG)",'header_value',["HETG","HEG","MEG","LETG","header_value","HEADER_VALUE"]),ParRange("sA_zero_x","r","Source A - x position of zero order",1,1,65536),ParRange("sA_zero_y","r","Source A - y position of zero order",1,1,65536),ParRange("sB_zero_x","r","Source B - x position of zero order",1,1,65536),ParRange("sB_zero_y","r","Source B - y position of zero order",1,1,65536),ParRange("sC_zero_x","r","Source C - x position of zero order",1,1,65536),ParRange("sC_zero_y","r","Source C - y position of zero order",1,1,65536),ParRange("sD_zero_x","r","Source D - x position of zero order",1,1,65536),ParRange("sD_zero_y","r","Source D - y position of zero order",1,1,65536),ParRange("sE_zero_x","r","Source E - x position of zero order",1,1,65536),ParRange("sE_zero_y","r","Source E - y position of zero order",1,1,65536),ParRange("sF_zero_x","r","Source F - x position of zero order",1,1,65536),ParRange("sF_zero_y","r","Source F - y position of zero order",1,1,65536),ParRange("sG_zero_x","r","Source G - x position of zero order",1,1,65536),ParRange("sG_zero_y","r","Source G - y position of zero order",1,1,65536),ParRange("sH_zero_x","r","Source H - x position of zero order",1,1,65536),ParRange("sH_zero_y","r","Source H - y position of zero order",1,1,65536),ParRange("sI_zero_x","r","Source I - x position of zero order",1,1,65536),ParRange("sI_zero_y","r","Source I - y position of zero order",1,1,65536),ParRange("sJ_zero_x","r","Source J - x position of zero order",1,1,65536),ParRange("sJ_zero_y","r","Source J - y position of zero order",1,1,65536)],
-    'opt': [ParValue("input_psf_tab","f","Calibration file with mirror psf vs off-axis angle",'CALDB'),ParSet("detector","s","Detector type: ACIS | HRC-I | HRC-S | header_value",'header_value',["header_value","ACIS","HRC-I","HRC-S"]),ParRange("radius_factor_zero","r","A scale factor which multiplies the app. calculation of the one-sigma zero order radius",50,1,400),ParRange("width_factor_hetg","r","A scale factor which multiplies the one-sigma width of the heg/meg mask in the cross-dispersion direction",35,1,200),ParRange("width_factor_letg","r","A scale factor which multiplies the one-sigma width of the letg mask in the cross-dispersion direction",300,1,300),ParRange("r_astig_max_hetg","r","Max grating r coord (deg, along the dispersion) for HETG astigmatism calc",0.5600000000000001,0,2),ParRange("r_astig_max_letg","r","Max grating r coord (deg, along the dispersion) for LETG astigmatism calc",1.1,0,4),ParRange("r_mask_max_hetg","r","Max grating r coord (deg) for HETG mask (to support offset pointing)",0.992,0,2),ParRange("r_mask_max_letg","r","Max grating r coordinate (deg) for LETG mask (to support offset pointing)",2.1,0,4),ParValue("use_user_pars","b","Use the user defined mask parameters below: yes or no?",False),ParSet("last_source_toread","s","Last source name to be read; character A->J.",'A',["A","B","C","D","E","F","G","H","I","J"]),ParRange("sA_id","i","Source A - source id number",1,1,32767),ParRange("sA_zero_rad","r","Source A - radius of zero order mask",None,0,16384),ParRange("sA_width_heg","r","Source A - width of heg mask in sky pixels",None,0,16384),ParRange("sA_width_meg","r","Source A - width of meg mask in sky pixels",None,0,16384),ParRange("sA_width_leg","r","Source A - width of leg mask in sky pixels",None,0,16384),ParRange("sB_id","i","Source B - source id number",2,1,32767),ParRange("sB_zero_rad","r","Source B - radius of zero order mask",None,0,16384),ParRange("sB_width_heg","r","Source B - width of heg mask in sky pixels",None,0,16384),ParRange("sB_width_meg","r","Source B - width of meg mask in sky pixels",None,0,16384),ParRange("sB_width_leg","r","Source B - width of leg mask in sky pixels",None,0,16384),ParRange("sC_id","i","Source C - source id number",3,1,32767),ParRange("sC_zero_rad","r","Source C - radius of zero order mask",None,0,16384),ParRange("sC_width_heg","r","Source C - width of heg mask in sky pixels",None,0,16384),ParRange("sC_width_meg","r","Source C - width of meg mask in sky pixels",None,0,16384),ParRange("sC_width_leg","r","Source C - width of leg mask in sky pixels",None,0,16384),ParRange("sD_id","i","Source D - source id number",4,1,32767),ParRange("sD_zero_rad","r","Source D - radius of zero order mask",None,0,16384),ParRange("sD_width_heg","r","Source D - width of heg mask in sky pixels",None,0,16384),ParRange("sD_width_meg","r","Source D - width of meg mask in sky pixels",None,0,16384),ParRange("sD_width_leg","r","Source D - width of leg mask in sky pixels",None,0,16384),ParRange("sE_id","i","Source E - source id number",5,1,32767),ParRange("sE_zero_rad","r","Source E - radius of zero order mask",None,0,16384),ParRange("sE_width_heg","r","Source E - width of heg mask in sky pixels",None,0,16384),ParRange("sE_width_meg","r","Source E - width of meg mask in sky pixels",None,0,16384),ParRange("sE_width_leg","r","Source E - width of leg mask in sky pixels",None,0,16384),ParRange("sF_id","i","Source F - source id number",6,1,32767),ParRange("sF_zero_rad","r","Source F - radius of zero order mask",None,0,16384),ParRange("sF_width_heg","r","Source F - width of heg mask in sky pixels",None,0,16384),ParRange("sF_width_meg","r","Source F - width of meg mask in sky pixels",None,0,16384),ParRange("sF_width_leg","r","Source F - width of leg mask in sky pixels",None,0,16384),ParRange("sG_id","i","Source G - source id number",7,1,32767),ParRange("sG_zero_rad","r","Source G - radius of zero order mask",None,0,16384),ParRange("sG_width_heg","r","Source G - width of heg mask in sky pixels",None,0,16384),ParRange("sG_width_meg","r","Source G - width of meg mask in sky pixels",None,0,16384),ParRange("sG_width_leg","r","Source G - width of leg mask in sky pixels",None,0,16384),ParRange("sH_id","i","Source H - source id number",8,1,32767),ParRange("sH_zero_rad","r","Source H - radius of zero order mask",None,0,16384),ParRange("sH_width_heg","r","Source H - width of heg mask in sky pixels",None,0,16384),ParRange("sH_width_meg","r","Source H - width of meg mask in sky pixels",None,0,16384),ParRange("sH_width_leg","r","Source H - width of leg mask in sky pixels",None,0,16384),ParRange("sI_id","i","Source I - source id number",9,1,32767),ParRange("sI_zero_rad","r","Source I - radius of zero order mask",None,0,16384),ParRange("sI_width_heg","r","Source I - width of heg mask in sky pixels",None,0,16384),ParRange("sI_width_meg","r","Source I - width of meg mask in sky pixels",None,0,16384),ParRange("sI_width_leg","r","Source I - width of leg mask in sky pixels",None,0,16384),ParRange("sJ_id","i","Source J - source id number",10,1,32767),ParRange("sJ_zero_rad","r","Source J - radius of zero order mask",None,0,16384),ParRange("sJ_width_heg","r","Source J - width of heg mask in sky pixels",None,0,16384),ParRange("sJ_width_meg","r","Source J - width of meg mask in sky pixels",None,0,16384),ParRange("sJ_width_leg","r","Source J - width of leg mask in sky pixels",None,0,16384),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Verbose level: 0 - no output, 5 - max verbosity",0,0,5),ParValue("clobber","b","Clobber existing outfile?",False)],
-    }
 
+    parinfo['tg_choose_method'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Required input \'src1a\' file name, as produced by tg_findzo",None)]',
+        'opt': '[ParSet("method","s","Output of selected program\'s name: tgdetect or tg_findzo",\'unknown\',["tgdetect","tg_findzo","unknown","none"]),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['tg_findzo'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output source table file",None)],
-    'opt': [ParValue("zo_pos_x","s","Initial guess for sky-x position (default=pixel(ra_targ))",'default'),ParValue("zo_pos_y","s","Initial guess for sky-y position (default=pixel(dec_targ))",'default'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['tg_create_mask'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file or stack",None),ParValue("outfile","f","Output region file or stack",None),ParValue("input_pos_tab","f","Input table with zero order positions or stack",None),ParSet("grating_obs","s","Observed grating type (header_value|HETG|HEG|MEG|LETG)",\'header_value\',["HETG","HEG","MEG","LETG","header_value","HEADER_VALUE"]),ParRange("sA_zero_x","r","Source A - x position of zero order",1,1,65536),ParRange("sA_zero_y","r","Source A - y position of zero order",1,1,65536),ParRange("sB_zero_x","r","Source B - x position of zero order",1,1,65536),ParRange("sB_zero_y","r","Source B - y position of zero order",1,1,65536),ParRange("sC_zero_x","r","Source C - x position of zero order",1,1,65536),ParRange("sC_zero_y","r","Source C - y position of zero order",1,1,65536),ParRange("sD_zero_x","r","Source D - x position of zero order",1,1,65536),ParRange("sD_zero_y","r","Source D - y position of zero order",1,1,65536),ParRange("sE_zero_x","r","Source E - x position of zero order",1,1,65536),ParRange("sE_zero_y","r","Source E - y position of zero order",1,1,65536),ParRange("sF_zero_x","r","Source F - x position of zero order",1,1,65536),ParRange("sF_zero_y","r","Source F - y position of zero order",1,1,65536),ParRange("sG_zero_x","r","Source G - x position of zero order",1,1,65536),ParRange("sG_zero_y","r","Source G - y position of zero order",1,1,65536),ParRange("sH_zero_x","r","Source H - x position of zero order",1,1,65536),ParRange("sH_zero_y","r","Source H - y position of zero order",1,1,65536),ParRange("sI_zero_x","r","Source I - x position of zero order",1,1,65536),ParRange("sI_zero_y","r","Source I - y position of zero order",1,1,65536),ParRange("sJ_zero_x","r","Source J - x position of zero order",1,1,65536),ParRange("sJ_zero_y","r","Source J - y position of zero order",1,1,65536)]',
+        'opt': '[ParValue("input_psf_tab","f","Calibration file with mirror psf vs off-axis angle",\'CALDB\'),ParSet("detector","s","Detector type: ACIS | HRC-I | HRC-S | header_value",\'header_value\',["header_value","ACIS","HRC-I","HRC-S"]),ParRange("radius_factor_zero","r","A scale factor which multiplies the app. calculation of the one-sigma zero order radius",50,1,400),ParRange("width_factor_hetg","r","A scale factor which multiplies the one-sigma width of the heg/meg mask in the cross-dispersion direction",35,1,200),ParRange("width_factor_letg","r","A scale factor which multiplies the one-sigma width of the letg mask in the cross-dispersion direction",300,1,300),ParRange("r_astig_max_hetg","r","Max grating r coord (deg, along the dispersion) for HETG astigmatism calc",0.5600000000000001,0,2),ParRange("r_astig_max_letg","r","Max grating r coord (deg, along the dispersion) for LETG astigmatism calc",1.1,0,4),ParRange("r_mask_max_hetg","r","Max grating r coord (deg) for HETG mask (to support offset pointing)",0.992,0,2),ParRange("r_mask_max_letg","r","Max grating r coordinate (deg) for LETG mask (to support offset pointing)",2.1,0,4),ParValue("use_user_pars","b","Use the user defined mask parameters below: yes or no?",False),ParSet("last_source_toread","s","Last source name to be read; character A->J.",\'A\',["A","B","C","D","E","F","G","H","I","J"]),ParRange("sA_id","i","Source A - source id number",1,1,32767),ParRange("sA_zero_rad","r","Source A - radius of zero order mask",None,0,16384),ParRange("sA_width_heg","r","Source A - width of heg mask in sky pixels",None,0,16384),ParRange("sA_width_meg","r","Source A - width of meg mask in sky pixels",None,0,16384),ParRange("sA_width_leg","r","Source A - width of leg mask in sky pixels",None,0,16384),ParRange("sB_id","i","Source B - source id number",2,1,32767),ParRange("sB_zero_rad","r","Source B - radius of zero order mask",None,0,16384),ParRange("sB_width_heg","r","Source B - width of heg mask in sky pixels",None,0,16384),ParRange("sB_width_meg","r","Source B - width of meg mask in sky pixels",None,0,16384),ParRange("sB_width_leg","r","Source B - width of leg mask in sky pixels",None,0,16384),ParRange("sC_id","i","Source C - source id number",3,1,32767),ParRange("sC_zero_rad","r","Source C - radius of zero order mask",None,0,16384),ParRange("sC_width_heg","r","Source C - width of heg mask in sky pixels",None,0,16384),ParRange("sC_width_meg","r","Source C - width of meg mask in sky pixels",None,0,16384),ParRange("sC_width_leg","r","Source C - width of leg mask in sky pixels",None,0,16384),ParRange("sD_id","i","Source D - source id number",4,1,32767),ParRange("sD_zero_rad","r","Source D - radius of zero order mask",None,0,16384),ParRange("sD_width_heg","r","Source D - width of heg mask in sky pixels",None,0,16384),ParRange("sD_width_meg","r","Source D - width of meg mask in sky pixels",None,0,16384),ParRange("sD_width_leg","r","Source D - width of leg mask in sky pixels",None,0,16384),ParRange("sE_id","i","Source E - source id number",5,1,32767),ParRange("sE_zero_rad","r","Source E - radius of zero order mask",None,0,16384),ParRange("sE_width_heg","r","Source E - width of heg mask in sky pixels",None,0,16384),ParRange("sE_width_meg","r","Source E - width of meg mask in sky pixels",None,0,16384),ParRange("sE_width_leg","r","Source E - width of leg mask in sky pixels",None,0,16384),ParRange("sF_id","i","Source F - source id number",6,1,32767),ParRange("sF_zero_rad","r","Source F - radius of zero order mask",None,0,16384),ParRange("sF_width_heg","r","Source F - width of heg mask in sky pixels",None,0,16384),ParRange("sF_width_meg","r","Source F - width of meg mask in sky pixels",None,0,16384),ParRange("sF_width_leg","r","Source F - width of leg mask in sky pixels",None,0,16384),ParRange("sG_id","i","Source G - source id number",7,1,32767),ParRange("sG_zero_rad","r","Source G - radius of zero order mask",None,0,16384),ParRange("sG_width_heg","r","Source G - width of heg mask in sky pixels",None,0,16384),ParRange("sG_width_meg","r","Source G - width of meg mask in sky pixels",None,0,16384),ParRange("sG_width_leg","r","Source G - width of leg mask in sky pixels",None,0,16384),ParRange("sH_id","i","Source H - source id number",8,1,32767),ParRange("sH_zero_rad","r","Source H - radius of zero order mask",None,0,16384),ParRange("sH_width_heg","r","Source H - width of heg mask in sky pixels",None,0,16384),ParRange("sH_width_meg","r","Source H - width of meg mask in sky pixels",None,0,16384),ParRange("sH_width_leg","r","Source H - width of leg mask in sky pixels",None,0,16384),ParRange("sI_id","i","Source I - source id number",9,1,32767),ParRange("sI_zero_rad","r","Source I - radius of zero order mask",None,0,16384),ParRange("sI_width_heg","r","Source I - width of heg mask in sky pixels",None,0,16384),ParRange("sI_width_meg","r","Source I - width of meg mask in sky pixels",None,0,16384),ParRange("sI_width_leg","r","Source I - width of leg mask in sky pixels",None,0,16384),ParRange("sJ_id","i","Source J - source id number",10,1,32767),ParRange("sJ_zero_rad","r","Source J - radius of zero order mask",None,0,16384),ParRange("sJ_width_heg","r","Source J - width of heg mask in sky pixels",None,0,16384),ParRange("sJ_width_meg","r","Source J - width of meg mask in sky pixels",None,0,16384),ParRange("sJ_width_leg","r","Source J - width of leg mask in sky pixels",None,0,16384),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Verbose level: 0 - no output, 5 - max verbosity",0,0,5),ParValue("clobber","b","Clobber existing outfile?",False)]',
+        }
 
-parinfo['tg_resolve_events'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output event file",None),ParValue("regionfile","f","Input region file",None),ParValue("acaofffile","f","Input aspect offset file",None)],
-    'opt': [ParValue("logfile","f","Output log (NONE|<filename>|stdout)",'stdout'),ParValue("osipfile","f","Lookup table for order resolving (for acis data only)",'CALDB'),ParRange("osort_lo","r","Order-sorting lower bound fraction; order > m - osort_lo",0.3,0,0.5),ParRange("osort_hi","r","Order-sorting high bound fraction; order <= m + osort_hi",0.3,0,0.5),ParSet("grating_obs","s","Observed grating type (header_value|HETG|HEG|MEG|LETG)",'header_value',["HETG","HEG","MEG","LETG","header_value","HEADER_VALUE"]),ParSet("detector","s","Detector type: ACIS | HRC-I | HRC-S | header_value",'header_value',["ACIS","HRC-I","HRC-S","header_value","HEADER_VALUE"]),ParRange("energy_lo_adj","r","Lower Energy limit factor",1.0,0,10),ParRange("energy_hi_adj","r","Upper Energy limit factor",1.0,0,10),ParRange("rand_seed","i","Random seed (for pixlib), 0 = use time dependent seed",1,0,32767),ParSet("rand_pix_size","r","pixel randomization width (-size..+size), 0.0 = no randomization",0,[0,0.5]),ParValue("eventdef","s","Output format definition",')stdlev1_ACIS'),ParValue("stdlev1","s","",')eventdef'),ParValue("stdlev1_ACIS","s","ACIS event format definition string",'{d:time,i:expno,f:rd,s:chip,s:tdet,f:det,f:sky,s:ccd_id,l:pha,s:pi,f:energy,s:grade,s:fltgrade,s:node_id,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}'),ParValue("stdlev1_HRC","s","HRC event format definition string",'{d:time,s:crsu,s:crsv,s:amp_sf,l:raw,f:samp,s:av1,s:av2,s:av3,s:au1,s:au2,s:au3,s:sumamps,f:rd,s:chip,l:tdet,f:det,f:sky,s:chip_id,s:pha,s:pi,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}'),ParValue("cclev1a","s","Lev1.5 CC faint event format definition string",'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}'),ParValue("ccgrdlev1a","s","lev1.5 cc graded event format definition string",'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParRange("verbose","i","Verbosity level of detail (0=none, 5=most)",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)],
-    }
 
+    parinfo['tg_findzo'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output source table file",None)]',
+        'opt': '[ParValue("zo_pos_x","s","Initial guess for sky-x position (default=pixel(ra_targ))",\'default\'),ParValue("zo_pos_y","s","Initial guess for sky-y position (default=pixel(dec_targ))",\'default\'),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['tgdetect'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input L1 event file",None),ParValue("OBI_srclist_file","f","Input source position(s) file from previous OBI or NONE",'NONE'),ParValue("outfile","f","Output source position(s) file name",None)],
-    'opt': [ParValue("temproot","s","Path and root file name to be given to temporary files",None),ParValue("keeptemp","b","Keep temporary files?",False),ParValue("keepexit","b","Keep exit status file?",False),ParValue("zo_pos_x","s","Center GZO filter sky X position (default=pixel(ra_nom))",'default'),ParValue("zo_pos_y","s","Center GZO filter sky Y position (default=pixel(dec_nom))",'default'),ParValue("zo_sz_filt_x","s","Size of GZO filter in X pixels (ACIS=400; HRC=1800)",'default'),ParValue("zo_sz_filt_y","s","Size of GZO filter in Y pixels (ACIS=400; HRC=1800)",'default'),ParRange("snr_thresh","r","SNR threshold to select the detected sources",40,3,10000),ParValue("spectrum","f","Spectrum file [keV vs weight] if energy=None",None),ParValue("psffile","f","PSF Calibration file",'CALDB'),ParSet("units","s","Units of output image",'arcsec',["arcsec","logical","physical"]),ParValue("geompar","f","Pixlib geometry file",'geom.par'),ParValue("expstk","f","list of exposure map files",'none'),ParRange("thresh","r","celldetect source threshold",3,3,10000),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3.0),ParValue("expratio","r","cutoff ratio for source cell exposure variation",0),ParValue("findpeaks","b","find local peaks for celldetect",True),ParRange("eband","r","energy band, for celldetect",1.4967,0,None),ParRange("eenergy","r","encircled energy of PSF, for celldetect",0.8,0,None),ParValue("celldetect_log","b","make a celldetect log file?",False),ParRange("fixedcell","i","celldetect fixed cell size to use",15,0,999),ParRange("fixedcell_cc_mode","i","celldetect fixed cell size to use for CC mode ACIS data",15,0,999),ParValue("snr_diminution","r","Diminution on SNR threshold - range (< 0 to 1) - Allows fine grained cell sliding",1.0),ParValue("bkgfile","f","background file, for celldetect",'none'),ParRange("bkgvalue","r","background count/pixel, for celldetect",0,0,None),ParRange("bkgerrvalue","r","background error, for celldetect",0,0,None),ParValue("snrfile","f","celldetect snr output file (for convolution only)",'none'),ParValue("convolve","b","use convolutions for celldetect",False),ParRange("xoffset","i","celldetect offset of x axis from optical axis",None,"INDEF","INDEF"),ParRange("yoffset","i","celldetect offset of y axis from optical axis",None,"INDEF","INDEF"),ParValue("cellfile","f","output cell size image file",'none'),ParValue("centroid","b","compute source centroids in celldetection?",True),ParRange("snr_ratio_limit","r","Value of SNR ratio to use as lower limit, for tgidselectsrc",1.0,0.0,1.0),ParValue("setsrcid","b","Set src ids in output file?, for tgidselectsrc",True),ParRange("max_separation","r","Maximum allowed separation (arcsec) for sources to match, for tgmatchsrc",3,0,20),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['tg_resolve_events'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output event file",None),ParValue("regionfile","f","Input region file",None),ParValue("acaofffile","f","Input aspect offset file",None)]',
+        'opt': '[ParValue("logfile","f","Output log (NONE|<filename>|stdout)",\'stdout\'),ParValue("osipfile","f","Lookup table for order resolving (for acis data only)",\'CALDB\'),ParRange("osort_lo","r","Order-sorting lower bound fraction; order > m - osort_lo",0.3,0,0.5),ParRange("osort_hi","r","Order-sorting high bound fraction; order <= m + osort_hi",0.3,0,0.5),ParSet("grating_obs","s","Observed grating type (header_value|HETG|HEG|MEG|LETG)",\'header_value\',["HETG","HEG","MEG","LETG","header_value","HEADER_VALUE"]),ParSet("detector","s","Detector type: ACIS | HRC-I | HRC-S | header_value",\'header_value\',["ACIS","HRC-I","HRC-S","header_value","HEADER_VALUE"]),ParRange("energy_lo_adj","r","Lower Energy limit factor",1.0,0,10),ParRange("energy_hi_adj","r","Upper Energy limit factor",1.0,0,10),ParRange("rand_seed","i","Random seed (for pixlib), 0 = use time dependent seed",1,0,32767),ParSet("rand_pix_size","r","pixel randomization width (-size..+size), 0.0 = no randomization",0,[0,0.5]),ParValue("eventdef","s","Output format definition",\')stdlev1_ACIS\'),ParValue("stdlev1","s","",\')eventdef\'),ParValue("stdlev1_ACIS","s","ACIS event format definition string",\'{d:time,i:expno,f:rd,s:chip,s:tdet,f:det,f:sky,s:ccd_id,l:pha,s:pi,f:energy,s:grade,s:fltgrade,s:node_id,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}\'),ParValue("stdlev1_HRC","s","HRC event format definition string",\'{d:time,s:crsu,s:crsv,s:amp_sf,l:raw,f:samp,s:av1,s:av2,s:av3,s:au1,s:au2,s:au3,s:sumamps,f:rd,s:chip,l:tdet,f:det,f:sky,s:chip_id,s:pha,s:pi,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}\'),ParValue("cclev1a","s","Lev1.5 CC faint event format definition string",\'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,s:phas,l:pha,l:pha_ro,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}\'),ParValue("ccgrdlev1a","s","lev1.5 cc graded event format definition string",\'{d:time,d:time_ro,l:expno,s:ccd_id,s:node_id,s:chip,f:chipy_tg,f:chipy_zo,s:tdet,f:det,f:sky,f:sky_1d,l:pha,l:pha_ro,s:corn_pha,f:energy,l:pi,s:fltgrade,s:grade,f:rd,s:tg_m,f:tg_lam,f:tg_mlam,s:tg_srcid,s:tg_part,s:tg_smap,x:status}\'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParRange("verbose","i","Verbosity level of detail (0=none, 5=most)",0,0,5),ParValue("clobber","b","Clobber outfile if it already exists?",False)]',
+        }
 
-parinfo['tgdetect2'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output source table file",None)],
-    'opt': [ParValue("zo_pos_x","s","Initial guess for sky-x position (default=pixel(ra_targ))",'default'),ParValue("zo_pos_y","s","Initial guess for sky-y position (default=pixel(dec_targ))",'default'),ParValue("unlearn_tgdetect","b","yes = punlearn tgdetect to set all its parameters to defaults",True),ParValue("unlearn_tg_findzo","b","yes = punlearn tg_findzo to set all its parameters to defaults",True),ParValue("temproot","s","Path and root file name to be given to temporary files",None),ParValue("keepexit","b","Keep exit status file?",False),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['tgdetect'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input L1 event file",None),ParValue("OBI_srclist_file","f","Input source position(s) file from previous OBI or NONE",\'NONE\'),ParValue("outfile","f","Output source position(s) file name",None)]',
+        'opt': '[ParValue("temproot","s","Path and root file name to be given to temporary files",None),ParValue("keeptemp","b","Keep temporary files?",False),ParValue("keepexit","b","Keep exit status file?",False),ParValue("zo_pos_x","s","Center GZO filter sky X position (default=pixel(ra_nom))",\'default\'),ParValue("zo_pos_y","s","Center GZO filter sky Y position (default=pixel(dec_nom))",\'default\'),ParValue("zo_sz_filt_x","s","Size of GZO filter in X pixels (ACIS=400; HRC=1800)",\'default\'),ParValue("zo_sz_filt_y","s","Size of GZO filter in Y pixels (ACIS=400; HRC=1800)",\'default\'),ParRange("snr_thresh","r","SNR threshold to select the detected sources",40,3,10000),ParValue("spectrum","f","Spectrum file [keV vs weight] if energy=None",None),ParValue("psffile","f","PSF Calibration file",\'CALDB\'),ParSet("units","s","Units of output image",\'arcsec\',["arcsec","logical","physical"]),ParValue("geompar","f","Pixlib geometry file",\'geom.par\'),ParValue("expstk","f","list of exposure map files",\'none\'),ParRange("thresh","r","celldetect source threshold",3,3,10000),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3.0),ParValue("expratio","r","cutoff ratio for source cell exposure variation",0),ParValue("findpeaks","b","find local peaks for celldetect",True),ParRange("eband","r","energy band, for celldetect",1.4967,0,None),ParRange("eenergy","r","encircled energy of PSF, for celldetect",0.8,0,None),ParValue("celldetect_log","b","make a celldetect log file?",False),ParRange("fixedcell","i","celldetect fixed cell size to use",15,0,999),ParRange("fixedcell_cc_mode","i","celldetect fixed cell size to use for CC mode ACIS data",15,0,999),ParValue("snr_diminution","r","Diminution on SNR threshold - range (< 0 to 1) - Allows fine grained cell sliding",1.0),ParValue("bkgfile","f","background file, for celldetect",\'none\'),ParRange("bkgvalue","r","background count/pixel, for celldetect",0,0,None),ParRange("bkgerrvalue","r","background error, for celldetect",0,0,None),ParValue("snrfile","f","celldetect snr output file (for convolution only)",\'none\'),ParValue("convolve","b","use convolutions for celldetect",False),ParRange("xoffset","i","celldetect offset of x axis from optical axis",None,"INDEF","INDEF"),ParRange("yoffset","i","celldetect offset of y axis from optical axis",None,"INDEF","INDEF"),ParValue("cellfile","f","output cell size image file",\'none\'),ParValue("centroid","b","compute source centroids in celldetection?",True),ParRange("snr_ratio_limit","r","Value of SNR ratio to use as lower limit, for tgidselectsrc",1.0,0.0,1.0),ParValue("setsrcid","b","Set src ids in output file?, for tgidselectsrc",True),ParRange("max_separation","r","Maximum allowed separation (arcsec) for sources to match, for tgmatchsrc",3,0,20),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['tgextract'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file (output event file from L1.5 processing)",None),ParValue("outfile","f","If typeII, enter full output file name or '.'; if typeI, enter output rootname",None),ParValue("tg_srcid_list","s","Source ID's to process: 'all', comma list, @file",'all'),ParSet("tg_part_list","s","Grating parts to process: HETG, HEG, MEG, LETG, header_value",'header_value',["HETG","HEG","MEG","LETG","header_value"]),ParValue("tg_order_list","s","Grating diffraction orders to process: 'default', comma list, range list, @file",'default'),ParValue("ancrfile","f","Input ancillary response file name",'none'),ParValue("respfile","f","Input redistribution file name",'none'),ParSet("outfile_type","s","Output file type: typeI (single spectrum) or typeII (multiple spectra)",'pha_typeII',["pha_typeI","pha_typeII"])],
-    'opt': [ParValue("inregion_file","f","Input region file.",'none'),ParValue("backfile","f","Input background file name",'none'),ParValue("rowid","s","If rowid column is to be filled in, enter name here",None),ParSet("bin_units","s","Bin units (for bin parameters below): angstrom, eV, keV",'angstrom',["angstrom","eV","keV"]),ParValue("min_bin_leg","s","Minimum dispersion coordinate for LEG, or 'compute'",'compute'),ParValue("max_bin_leg","s","Maximum dispersion coordinate for LEG, or 'compute'",'compute'),ParValue("bin_size_leg","s","Bin size for binning LEG spectra, or 'compute'",'compute'),ParValue("num_bins_leg","s","Number of bins for the output LEG spectra, 'compute'",'compute'),ParValue("min_bin_meg","s","Minimum dispersion coordinate for MEG, or 'compute'",'compute'),ParValue("max_bin_meg","s","Maximum dispersion coordinate for MEG, or 'compute'",'compute'),ParValue("bin_size_meg","s","Bin size for binning MEG spectra, or 'compute'",'compute'),ParValue("num_bins_meg","s","Number of bins for the output MEG spectra, or 'compute'",'compute'),ParValue("min_bin_heg","s","Minimum dispersion coordinate for HEG, or 'compute'",'compute'),ParValue("max_bin_heg","s","Maximum dispersion coordinate for HEG, or 'compute'",'compute'),ParValue("bin_size_heg","s","Bin size for binning HEG spectra, or 'compute'",'compute'),ParValue("num_bins_heg","s","Number of bins for the output HEG spectra, 'compute'",'compute'),ParValue("min_tg_d","s","Minimum tg_d range to include in histogram, or use 'default'",'default'),ParValue("max_tg_d","s","Maximum tg_d range to include in histogram, or use 'default'",'default'),ParValue("extract_background","b","Extract the local background spectrum?",True),ParValue("min_upbkg_tg_d","s","Minimum value of tg_d for the background up spectrum.",'default'),ParValue("max_upbkg_tg_d","s","Maximum value of tg_d for the background up spectrum.",'default'),ParValue("min_downbkg_tg_d","s","Minimum value of tg_d for the background down spectrum.",'default'),ParValue("max_downbkg_tg_d","s","Maximum value of tg_d for the background down spectrum.",'default'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['tgdetect2'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file",None),ParValue("outfile","f","Output source table file",None)]',
+        'opt': '[ParValue("zo_pos_x","s","Initial guess for sky-x position (default=pixel(ra_targ))",\'default\'),ParValue("zo_pos_y","s","Initial guess for sky-y position (default=pixel(dec_targ))",\'default\'),ParValue("unlearn_tgdetect","b","yes = punlearn tgdetect to set all its parameters to defaults",True),ParValue("unlearn_tg_findzo","b","yes = punlearn tg_findzo to set all its parameters to defaults",True),ParValue("temproot","s","Path and root file name to be given to temporary files",None),ParValue("keepexit","b","Keep exit status file?",False),ParValue("clobber","b","OK to overwrite existing output file?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['tgextract2'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input event file (output event file from L1.5 processing)",None),ParValue("outfile","f","Output pha file (for pha2, enter full file name or '.'; for pha1, enter rootname.)",None),ParValue("tg_srcid_list","s","Source ID's to process: 'all', comma list, @file",'1'),ParSet("tg_part_list","s","Grating parts to process: HETG, HEG, MEG, LETG, header_value",'header_value',["HETG","HEG","MEG","LETG","header_value"]),ParValue("tg_order_list","s","Grating diffraction orders to process: 'default', comma list, range list, @file",'default')],
-    'opt': [ParSet("opt","s","Output file type: pha1 (single spectrum) or pha2 (multiple spectra)",'pha2',["pha1","pha2"]),ParValue("wav_grid","s","grid specification (use_header| min:max:step| min:max:#bins|pre-defined standard grid)",'use_header'),ParValue("wav_grid_heg","s","pre-defined standard HEG grid",'1.0:21.48:0.0025'),ParValue("wav_grid_meg","s","pre-defined standard MEG grid",'1.0:41.96:0.0050'),ParValue("wav_grid_leg","s","pre-defined standard LETG grid",'1.0:205.80:0.0125'),ParValue("wav_grid_leg_acis","s","pre-defined standard LETG/ACIS grid",'1.0:103.4:0.0125'),ParValue("evt_filter","s","Filter to apply to events for counts spectra",'none'),ParValue("ignore_source_id","b","match source id between regionFile and evtFile?",True),ParSet("error","s","Method for error determination (gaussian|gehrels)",'gaussian',["gaussian","gehrels"]),ParValue("region_file","f","Input region file ( NONE | none | <filename>)",'CALDB'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",'geom'),ParValue("min_tg_d","s","Minimum tg_d for source spectrum, in degrees",'default'),ParValue("max_tg_d","s","Maximum tg_d for source spectrum, in degrees",'default'),ParValue("extract_background","b","Extract the local background spectrum?",True),ParValue("min_upbkg_tg_d","s","Minimum tg_d for upper background spectrum, in degrees",'default'),ParValue("max_upbkg_tg_d","s","Maximum tg_d for upper background spectrum, in degrees",'default'),ParValue("min_downbkg_tg_d","s","Minimum tg_d for down background spectrum, in degrees",'default'),ParValue("max_downbkg_tg_d","s","Maximum tg_d for down background spectrum, in degrees",'default'),ParSet("backscale_method","s","Use events and region, or region-only for backscale",'region',["events","region"]),ParValue("backscale_resolution","i","Amount in pixels to bin in wavelength to improve statistics in backscale",64),ParValue("clobber","b","overwrite any existing output file?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)],
-    }
 
+    parinfo['tgextract'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file (output event file from L1.5 processing)",None),ParValue("outfile","f","If typeII, enter full output file name or \'.\'; if typeI, enter output rootname",None),ParValue("tg_srcid_list","s","Source ID\'s to process: \'all\', comma list, @file",\'all\'),ParSet("tg_part_list","s","Grating parts to process: HETG, HEG, MEG, LETG, header_value",\'header_value\',["HETG","HEG","MEG","LETG","header_value"]),ParValue("tg_order_list","s","Grating diffraction orders to process: \'default\', comma list, range list, @file",\'default\'),ParValue("ancrfile","f","Input ancillary response file name",\'none\'),ParValue("respfile","f","Input redistribution file name",\'none\'),ParSet("outfile_type","s","Output file type: typeI (single spectrum) or typeII (multiple spectra)",\'pha_typeII\',["pha_typeI","pha_typeII"])]',
+        'opt': '[ParValue("inregion_file","f","Input region file.",\'none\'),ParValue("backfile","f","Input background file name",\'none\'),ParValue("rowid","s","If rowid column is to be filled in, enter name here",None),ParSet("bin_units","s","Bin units (for bin parameters below): angstrom, eV, keV",\'angstrom\',["angstrom","eV","keV"]),ParValue("min_bin_leg","s","Minimum dispersion coordinate for LEG, or \'compute\'",\'compute\'),ParValue("max_bin_leg","s","Maximum dispersion coordinate for LEG, or \'compute\'",\'compute\'),ParValue("bin_size_leg","s","Bin size for binning LEG spectra, or \'compute\'",\'compute\'),ParValue("num_bins_leg","s","Number of bins for the output LEG spectra, \'compute\'",\'compute\'),ParValue("min_bin_meg","s","Minimum dispersion coordinate for MEG, or \'compute\'",\'compute\'),ParValue("max_bin_meg","s","Maximum dispersion coordinate for MEG, or \'compute\'",\'compute\'),ParValue("bin_size_meg","s","Bin size for binning MEG spectra, or \'compute\'",\'compute\'),ParValue("num_bins_meg","s","Number of bins for the output MEG spectra, or \'compute\'",\'compute\'),ParValue("min_bin_heg","s","Minimum dispersion coordinate for HEG, or \'compute\'",\'compute\'),ParValue("max_bin_heg","s","Maximum dispersion coordinate for HEG, or \'compute\'",\'compute\'),ParValue("bin_size_heg","s","Bin size for binning HEG spectra, or \'compute\'",\'compute\'),ParValue("num_bins_heg","s","Number of bins for the output HEG spectra, \'compute\'",\'compute\'),ParValue("min_tg_d","s","Minimum tg_d range to include in histogram, or use \'default\'",\'default\'),ParValue("max_tg_d","s","Maximum tg_d range to include in histogram, or use \'default\'",\'default\'),ParValue("extract_background","b","Extract the local background spectrum?",True),ParValue("min_upbkg_tg_d","s","Minimum value of tg_d for the background up spectrum.",\'default\'),ParValue("max_upbkg_tg_d","s","Maximum value of tg_d for the background up spectrum.",\'default\'),ParValue("min_downbkg_tg_d","s","Minimum value of tg_d for the background down spectrum.",\'default\'),ParValue("max_downbkg_tg_d","s","Maximum value of tg_d for the background down spectrum.",\'default\'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("clobber","b","OK to overwrite existing output file(s)?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['tgidselectsrc'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Name of input src file",None),ParValue("outfile","f","Name of output filtered src file",None),ParRange("snr_ratio_limit","r","Value of SNR ratio to use as lower limit",1.0,0.0,1.0)],
-    'opt': [ParValue("setsrcid","b","Set src ids?",True),ParValue("clobber","b","Clobber output file?",False),ParRange("verbose","i","Verbose level",0,0,5)],
-    }
 
+    parinfo['tgextract2'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input event file (output event file from L1.5 processing)",None),ParValue("outfile","f","Output pha file (for pha2, enter full file name or \'.\'; for pha1, enter rootname.)",None),ParValue("tg_srcid_list","s","Source ID\'s to process: \'all\', comma list, @file",\'1\'),ParSet("tg_part_list","s","Grating parts to process: HETG, HEG, MEG, LETG, header_value",\'header_value\',["HETG","HEG","MEG","LETG","header_value"]),ParValue("tg_order_list","s","Grating diffraction orders to process: \'default\', comma list, range list, @file",\'default\')]',
+        'opt': '[ParSet("opt","s","Output file type: pha1 (single spectrum) or pha2 (multiple spectra)",\'pha2\',["pha1","pha2"]),ParValue("wav_grid","s","grid specification (use_header| min:max:step| min:max:#bins|pre-defined standard grid)",\'use_header\'),ParValue("wav_grid_heg","s","pre-defined standard HEG grid",\'1.0:21.48:0.0025\'),ParValue("wav_grid_meg","s","pre-defined standard MEG grid",\'1.0:41.96:0.0050\'),ParValue("wav_grid_leg","s","pre-defined standard LETG grid",\'1.0:205.80:0.0125\'),ParValue("wav_grid_leg_acis","s","pre-defined standard LETG/ACIS grid",\'1.0:103.4:0.0125\'),ParValue("evt_filter","s","Filter to apply to events for counts spectra",\'none\'),ParValue("ignore_source_id","b","match source id between regionFile and evtFile?",True),ParSet("error","s","Method for error determination (gaussian|gehrels)",\'gaussian\',["gaussian","gehrels"]),ParValue("region_file","f","Input region file ( NONE | none | <filename>)",\'CALDB\'),ParValue("geompar","f","Parameter file for Pixlib Geometry files",\'geom\'),ParValue("min_tg_d","s","Minimum tg_d for source spectrum, in degrees",\'default\'),ParValue("max_tg_d","s","Maximum tg_d for source spectrum, in degrees",\'default\'),ParValue("extract_background","b","Extract the local background spectrum?",True),ParValue("min_upbkg_tg_d","s","Minimum tg_d for upper background spectrum, in degrees",\'default\'),ParValue("max_upbkg_tg_d","s","Maximum tg_d for upper background spectrum, in degrees",\'default\'),ParValue("min_downbkg_tg_d","s","Minimum tg_d for down background spectrum, in degrees",\'default\'),ParValue("max_downbkg_tg_d","s","Maximum tg_d for down background spectrum, in degrees",\'default\'),ParSet("backscale_method","s","Use events and region, or region-only for backscale",\'region\',["events","region"]),ParValue("backscale_resolution","i","Amount in pixels to bin in wavelength to improve statistics in backscale",64),ParValue("clobber","b","overwrite any existing output file?",False),ParRange("verbose","i","Verbosity level (0 = no display)",0,0,5)]',
+        }
 
-parinfo['tgmask2reg'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input FITS region file",'CALDB'),ParValue("outfile","f","Output ds9 region file",None)],
-    'opt': [ParValue("clobber","b","Clobber existing output if it exists?",False),ParRange("verbose","i","Tool chatter level",0,0,5)],
-    }
 
+    parinfo['tgidselectsrc'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Name of input src file",None),ParValue("outfile","f","Name of output filtered src file",None),ParRange("snr_ratio_limit","r","Value of SNR ratio to use as lower limit",1.0,0.0,1.0)]',
+        'opt': '[ParValue("setsrcid","b","Set src ids?",True),ParValue("clobber","b","Clobber output file?",False),ParRange("verbose","i","Verbose level",0,0,5)]',
+        }
 
-parinfo['tgmatchsrc'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","New sources file",None),ParValue("refsrcfile","f","Reference sources file",'NONE'),ParValue("outfile","f","Output file name",'.'),ParRange("max_separation","r","Maximum allowed separation (arcsec) for sources to match",3,0,20)],
-    'opt': [ParValue("clobber","b","Clobber output file?",False),ParRange("verbose","i","Debug statement level",0,0,5)],
-    }
 
+    parinfo['tgmask2reg'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input FITS region file",\'CALDB\'),ParValue("outfile","f","Output ds9 region file",None)]',
+        'opt': '[ParValue("clobber","b","Clobber existing output if it exists?",False),ParRange("verbose","i","Tool chatter level",0,0,5)]',
+        }
 
-parinfo['tgsplit'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input TYPE:II pha file",None),ParValue("arffile","f","Input stack of grating ARF files",None),ParValue("rmffile","f","Input stack of grating RMF files",None),ParValue("outroot","f","Output root name",None)],
-    'opt': [ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Remove files if they already exist?",False)],
-    }
 
+    parinfo['tgmatchsrc'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","New sources file",None),ParValue("refsrcfile","f","Reference sources file",\'NONE\'),ParValue("outfile","f","Output file name",\'.\'),ParRange("max_separation","r","Maximum allowed separation (arcsec) for sources to match",3,0,20)]',
+        'opt': '[ParValue("clobber","b","Clobber output file?",False),ParRange("verbose","i","Debug statement level",0,0,5)]',
+        }
 
-parinfo['update_column_range'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","File to edit",None)],
-    'opt': [ParValue("columns","s","Column names (includes vector columns)",'sky'),ParValue("round","b","Should data ranges be rounded to nearest mid-integer?",True),ParRange("verbose","i","Debug Level (0-5)",1,0,5)],
-    }
 
+    parinfo['tgsplit'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input TYPE:II pha file",None),ParValue("arffile","f","Input stack of grating ARF files",None),ParValue("rmffile","f","Input stack of grating RMF files",None),ParValue("outroot","f","Output root name",None)]',
+        'opt': '[ParRange("verbose","i","Amount of tool chatter",1,0,5),ParValue("clobber","b","Remove files if they already exist?",False)]',
+        }
 
-parinfo['vtbin'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input image",None),ParValue("outfile","f","Output map",None)],
-    'opt': [ParValue("binimg","f","Output image file",None),ParSet("shape","s","Shape of local max mask",'box',["box","circle"]),ParRange("radius","r","Radius of local max mask",2.5,0,None),ParValue("sitefile","f","Input site file",None),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)],
-    }
 
+    parinfo['update_column_range'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","File to edit",None)]',
+        'opt': '[ParValue("columns","s","Column names (includes vector columns)",\'sky\'),ParValue("round","b","Should data ranges be rounded to nearest mid-integer?",True),ParRange("verbose","i","Debug Level (0-5)",1,0,5)]',
+        }
 
-parinfo['vtpdetect'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("expfile","f","Exposure map file name",'none'),ParValue("outfile","f","Source list output file name",None),ParRange("scale","r","Threshold scale factor",1,0,None),ParRange("limit","r","Max. probability of being a false source",1e-06,0,1),ParRange("coarse","i","Minimum number of events per source",10,0,None),ParRange("maxiter","i","Maximum number of iterations to allow",10,0,100)],
-    'opt': [ParValue("regfile","f","name for ASCII output region files",'none'),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3),ParRange("edge","i","How close to edge of field to reject events",2,0,None),ParValue("superdo","b","Perform Super Voronoi Cell procedure",False),ParRange("maxbkgflux","r","Maximum normalized background flux to fit",0.8,0,None),ParRange("mintotflux","r","Minimum total flux fit range",0.8,0,None),ParRange("maxtotflux","r","Maximum total flux fit range",2.6,0,None),ParRange("mincutoff","r","Minimum total flux cutoff value",1.2,0,10),ParRange("maxcutoff","r","Maximum total flux cutoff value",3,0,10),ParRange("fittol","r","Tolerance on Possion fit",1e-06,0,None),ParRange("fitstart","r","Initial background fit starting scale factor",1.5,0.9,2),ParValue("clobber","b","Overwrite if file exists",False),ParRange("verbose","i","Debug level",0,0,5),ParValue("logfile","f","Debug file name",'stderr')],
-    }
 
+    parinfo['vtbin'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input image",None),ParValue("outfile","f","Output map",None)]',
+        'opt': '[ParValue("binimg","f","Output image file",None),ParSet("shape","s","Shape of local max mask",\'box\',["box","circle"]),ParRange("radius","r","Radius of local max mask",2.5,0,None),ParValue("sitefile","f","Input site file",None),ParRange("verbose","i","Tool chatter level",1,0,5),ParValue("clobber","b","Remove outfile if it already exists?",False)]',
+        }
 
-parinfo['wavdetect'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("outfile","f","Output source list file name",None),ParValue("scellfile","f","Output source cell image file name",None),ParValue("imagefile","f","Output reconstructed image file name",None),ParValue("defnbkgfile","f","Output normalized background file name",None),ParValue("scales","s","wavelet scales (pixels)",'2.0 4.0'),ParValue("psffile","f","Image of the size of the PSF",None)],
-    'opt': [ParValue("regfile","f","ASCII regions output file",None),ParValue("clobber","b","Overwrite existing outputs?",False),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3.0),ParValue("interdir","f","Directory for intermediate outputs",'${ASCDS_WORK_PATH}'),ParValue("bkginput","f","Input background file name",None),ParValue("bkgerrinput","b","Use bkginput[2] for background error",False),ParValue("outputinfix","f","Output filename infix",None),ParValue("sigthresh","r","Threshold significance for output source pixel list",1e-06),ParValue("bkgsigthresh","r","Threshold significance when estimating bkgd only",0.001),ParValue("falsesrc","r","Allowed number of false sources per image",-1.0),ParValue("sigcalfile","f","Significance calibration file",'${ASCDS_CALIB}/wtsimresult.fits'),ParValue("exptime","r","Exposure time (if zero, estimate from map itself",0),ParValue("expfile","f","Exposure map file name (blank=none)",None),ParValue("expthresh","r","Minimum relative exposure needed in pixel to analyze it",0.1),ParValue("bkgtime","r","Exposure time for input background file",0),ParValue("maxiter","i","Maximum number of source-cleansing iterations",2),ParValue("iterstop","r","Min frac of pix that must be cleansed to continue",0.0001),ParValue("log","b","Make a log file?",False),ParRange("verbose","i","Log verbosity",0,0,5)],
-    }
 
+    parinfo['vtpdetect'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("expfile","f","Exposure map file name",\'none\'),ParValue("outfile","f","Source list output file name",None),ParRange("scale","r","Threshold scale factor",1,0,None),ParRange("limit","r","Max. probability of being a false source",1e-06,0,1),ParRange("coarse","i","Minimum number of events per source",10,0,None),ParRange("maxiter","i","Maximum number of iterations to allow",10,0,100)]',
+        'opt': '[ParValue("regfile","f","name for ASCII output region files",\'none\'),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3),ParRange("edge","i","How close to edge of field to reject events",2,0,None),ParValue("superdo","b","Perform Super Voronoi Cell procedure",False),ParRange("maxbkgflux","r","Maximum normalized background flux to fit",0.8,0,None),ParRange("mintotflux","r","Minimum total flux fit range",0.8,0,None),ParRange("maxtotflux","r","Maximum total flux fit range",2.6,0,None),ParRange("mincutoff","r","Minimum total flux cutoff value",1.2,0,10),ParRange("maxcutoff","r","Maximum total flux cutoff value",3,0,10),ParRange("fittol","r","Tolerance on Possion fit",1e-06,0,None),ParRange("fitstart","r","Initial background fit starting scale factor",1.5,0.9,2),ParValue("clobber","b","Overwrite if file exists",False),ParRange("verbose","i","Debug level",0,0,5),ParValue("logfile","f","Debug file name",\'stderr\')]',
+        }
 
-parinfo['wcs_match'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file with duplicate srcs",None),ParValue("refsrcfile","f","Input file with reference srcs",None),ParValue("outfile","f","Transform file",None)],
-    'opt': [ParValue("wcsfile","f","Input file with WCS used in transform",None),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",'STDOUT'),ParSet("method","s","reproject method: rot/scale/trans (rst) or translate (trans)",'rst',["rst","trans"]),ParRange("radius","r","radius used to match sources (arcsec)",12,0,None),ParSet("select","s","drop/add srcs from transform calc automatically or manually",'auto',["auto","manual","prefill"]),ParRange("residlim","r","src pairs with residuals > residlim are dropped (arcsec)",2,0,None),ParRange("residfac","r","src pairs with residuals > residfac * position error are dropped",0,0,None),ParRange("residtype","i","residfac applies to: (0) each residual, (1) avg residuals",0,0,1),ParValue("multimatch","b","Allow multiple matches to reference srcs?",False),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['wavdetect'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("outfile","f","Output source list file name",None),ParValue("scellfile","f","Output source cell image file name",None),ParValue("imagefile","f","Output reconstructed image file name",None),ParValue("defnbkgfile","f","Output normalized background file name",None),ParValue("scales","s","wavelet scales (pixels)",\'2.0 4.0\'),ParValue("psffile","f","Image of the size of the PSF",None)]',
+        'opt': '[ParValue("regfile","f","ASCII regions output file",None),ParValue("clobber","b","Overwrite existing outputs?",False),ParValue("ellsigma","r","Size of output source ellipses (in sigmas)",3.0),ParValue("interdir","f","Directory for intermediate outputs",\'${ASCDS_WORK_PATH}\'),ParValue("bkginput","f","Input background file name",None),ParValue("bkgerrinput","b","Use bkginput[2] for background error",False),ParValue("outputinfix","f","Output filename infix",None),ParValue("sigthresh","r","Threshold significance for output source pixel list",1e-06),ParValue("bkgsigthresh","r","Threshold significance when estimating bkgd only",0.001),ParValue("falsesrc","r","Allowed number of false sources per image",-1.0),ParValue("sigcalfile","f","Significance calibration file",\'${ASCDS_CALIB}/wtsimresult.fits\'),ParValue("exptime","r","Exposure time (if zero, estimate from map itself",0),ParValue("expfile","f","Exposure map file name (blank=none)",None),ParValue("expthresh","r","Minimum relative exposure needed in pixel to analyze it",0.1),ParValue("bkgtime","r","Exposure time for input background file",0),ParValue("maxiter","i","Maximum number of source-cleansing iterations",2),ParValue("iterstop","r","Min frac of pix that must be cleansed to continue",0.0001),ParValue("log","b","Make a log file?",False),ParRange("verbose","i","Log verbosity",0,0,5)]',
+        }
 
-parinfo['wcs_update'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Either input asol file, or file with WCS to be updated",None),ParValue("outfile","f","Output asol file",None),ParValue("transformfile","f","Input coordinate transform file",None)],
-    'opt': [ParValue("wcsfile","f","Input reference WCS file",None),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",'STDOUT'),ParValue("deltax","r","transform delta_x value (sky pixels)",0),ParValue("deltay","r","transform delta_y value (sky pixels)",0),ParValue("rotang","r","transform rotation angle (degrees)",0),ParValue("scalefac","r","transform scale factor",1),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)],
-    }
 
+    parinfo['wcs_match'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file with duplicate srcs",None),ParValue("refsrcfile","f","Input file with reference srcs",None),ParValue("outfile","f","Transform file",None)]',
+        'opt': '[ParValue("wcsfile","f","Input file with WCS used in transform",None),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",\'STDOUT\'),ParSet("method","s","reproject method: rot/scale/trans (rst) or translate (trans)",\'rst\',["rst","trans"]),ParRange("radius","r","radius used to match sources (arcsec)",12,0,None),ParSet("select","s","drop/add srcs from transform calc automatically or manually",\'auto\',["auto","manual","prefill"]),ParRange("residlim","r","src pairs with residuals > residlim are dropped (arcsec)",2,0,None),ParRange("residfac","r","src pairs with residuals > residfac * position error are dropped",0,0,None),ParRange("residtype","i","residfac applies to: (0) each residual, (1) avg residuals",0,0,1),ParValue("multimatch","b","Allow multiple matches to reference srcs?",False),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['wrecon'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input file name",None),ParValue("sourcefile","f","Output source list file name",None),ParValue("scellfile","f","Output source cell image file name",None),ParValue("imagefile","f","Output image file name",None)],
-    'opt': [ParValue("regfile","f","ASCII source regions file",None),ParValue("clobber","b","Overwrite exiting outputs?",False),ParValue("ellsigma","r","Size, in sigmas, of output source ellipses",3.0),ParValue("srclist","f","Source input stack file name",None),ParValue("correl","f","Correlation input stack file name",None),ParValue("nbkg","f","Normalized background input stack file name",None),ParValue("bkginput","f","Input background file",None),ParValue("bkgerrinput","b","use input background error from bkginput[2]",False),ParValue("defnbkgfile","f","Default normalized background file name",None),ParValue("fluxfile","f","Flux stack file name",None),ParValue("outputinfix","f","Extra infix for output file names",None),ParValue("xscales","s","X scales",'1.0 1.41 2 2.82 4 5.65 8 11.31 16'),ParValue("yscales","s","Y scales",'1.0 1.41 2 2.82 4 5.65 8 11.31 16'),ParValue("fluxscales","s","Flux scales",'1 3 5 7 9'),ParValue("expfile","f","Exposure map file name",None),ParValue("exptime","r","Exposure time in seconds",0),ParValue("expthresh","r","Exposure threshold",0.1),ParValue("bkgtime","r","Background time in seconds",0),ParValue("psffile","f","PSF image file name",None),ParValue("stall","b","Stall for debugger?",False),ParValue("log","b","Make a log file?",False),ParRange("verbose","i","Log verbosity",0,0,5)],
-    }
 
+    parinfo['wcs_update'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Either input asol file, or file with WCS to be updated",None),ParValue("outfile","f","Output asol file",None),ParValue("transformfile","f","Input coordinate transform file",None)]',
+        'opt': '[ParValue("wcsfile","f","Input reference WCS file",None),ParValue("logfile","f","debug log file ( STDOUT | stdout | <filename>)",\'STDOUT\'),ParValue("deltax","r","transform delta_x value (sky pixels)",0),ParValue("deltay","r","transform delta_y value (sky pixels)",0),ParValue("rotang","r","transform rotation angle (degrees)",0),ParValue("scalefac","r","transform scale factor",1),ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","debug level (0-5)",0,0,5)]',
+        }
 
-parinfo['wtransform'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","input file",None),ParValue("srclist","f","Source list output stack",None),ParValue("correl","s","Correlation image output stack",None),ParValue("nbkg","s","Normalized background image output stack",None)],
-    'opt': [ParValue("bkg","s","Plain background image output stack",None),ParValue("thresh","s","threshold image stack",None),ParValue("outputinfix","f","Output filename infix",None),ParValue("exptime","r","Exposure time",0),ParValue("expfile","s","Exposure file",None),ParSet("expcor","s","Exposure correction",'fast',["none","fast","full"]),ParValue("expthresh","r","Exposure threshold",0.1),ParValue("bkgtime","r","Background exposure time",0),ParValue("bkginput","s","Input background file",None),ParValue("bkgerrinput","b","use input background error from bkginput[2]",False),ParValue("xscales","s","X wavelet scales",'2.0'),ParValue("yscales","s","Y wavelet scales",'2.0'),ParValue("clobber","b","overwrite existing outputs",False),ParValue("correlerr","b","Output correlation error image",True),ParValue("nbkgerr","b","Output normalized background error image",True),ParValue("bkgerr","b","Output plain background error image",False),ParValue("maxiter","i","maximum iteration count",2),ParValue("iterstop","r","iteration stop fraction",0.0001),ParValue("sigthresh","r","significance for source detection",1e-06),ParValue("bkgsigthresh","r","significance for data cleansing",0.001),ParValue("falsesrc","r","allowed number of false sources per image",-1.0),ParValue("sigcalfile","f","Significance calibration file",'${ASCDS_CALIB}/wtsimresult.fits'),ParValue("log","b","Make a log file?",False),ParRange("verbose","i","Verbosity of output (0..5)",0,0,5),ParValue("stall","b","stall for debugger",False)],
-    }
 
+    parinfo['wrecon'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input file name",None),ParValue("sourcefile","f","Output source list file name",None),ParValue("scellfile","f","Output source cell image file name",None),ParValue("imagefile","f","Output image file name",None)]',
+        'opt': '[ParValue("regfile","f","ASCII source regions file",None),ParValue("clobber","b","Overwrite exiting outputs?",False),ParValue("ellsigma","r","Size, in sigmas, of output source ellipses",3.0),ParValue("srclist","f","Source input stack file name",None),ParValue("correl","f","Correlation input stack file name",None),ParValue("nbkg","f","Normalized background input stack file name",None),ParValue("bkginput","f","Input background file",None),ParValue("bkgerrinput","b","use input background error from bkginput[2]",False),ParValue("defnbkgfile","f","Default normalized background file name",None),ParValue("fluxfile","f","Flux stack file name",None),ParValue("outputinfix","f","Extra infix for output file names",None),ParValue("xscales","s","X scales",\'1.0 1.41 2 2.82 4 5.65 8 11.31 16\'),ParValue("yscales","s","Y scales",\'1.0 1.41 2 2.82 4 5.65 8 11.31 16\'),ParValue("fluxscales","s","Flux scales",\'1 3 5 7 9\'),ParValue("expfile","f","Exposure map file name",None),ParValue("exptime","r","Exposure time in seconds",0),ParValue("expthresh","r","Exposure threshold",0.1),ParValue("bkgtime","r","Background time in seconds",0),ParValue("psffile","f","PSF image file name",None),ParValue("stall","b","Stall for debugger?",False),ParValue("log","b","Make a log file?",False),ParRange("verbose","i","Log verbosity",0,0,5)]',
+        }
 
-parinfo['ximage_lut'] = {
-    'istool': False,
-    'req': [],
-    'opt': [ParValue("bb","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/ximage_bb.lut'),ParValue("blue1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/blue1.lut'),ParValue("blue2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/blue2.lut'),ParValue("blue3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/blue3.lut'),ParValue("blue4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/blue4.lut'),ParValue("bluebase1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase1.lut'),ParValue("bluebase2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase2.lut'),ParValue("bluebase3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase3.lut'),ParValue("bluebase4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase4.lut'),ParValue("bluebase5","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase5.lut'),ParValue("bluebase6","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase6.lut'),ParValue("bluebase7","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase7.lut'),ParValue("bluebase8","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase8.lut'),ParValue("bluebase9","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluebase9.lut'),ParValue("bluyel","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/bluyel.lut'),ParValue("brown","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/brown.lut'),ParValue("eyellow1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/eyellow1.lut'),ParValue("gray1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/gray1.lut'),ParValue("gray2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/gray2.lut'),ParValue("green1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green1.lut'),ParValue("green2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green2.lut'),ParValue("green3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green3.lut'),ParValue("green4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green4.lut'),ParValue("green5","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green5.lut'),ParValue("green6","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green6.lut'),ParValue("green7","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green7.lut'),ParValue("green8","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green8.lut'),ParValue("green9","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/green9.lut'),ParValue("invgray","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/invgray.lut'),ParValue("invgray1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/invgray1.lut'),ParValue("invspec","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/invspec.lut'),ParValue("pink1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pink1.lut'),ParValue("pink2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pink2.lut'),ParValue("pink3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pink3.lut'),ParValue("pink4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pink4.lut'),ParValue("pinkbase1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pinkbase1.lut'),ParValue("pinkbase2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pinkbase2.lut'),ParValue("pinkbase3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pinkbase3.lut'),ParValue("pinkbase4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pinkbase4.lut'),ParValue("pinkbase5","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/pinkbase5.lut'),ParValue("purby","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/purby.lut'),ParValue("purple1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/purple1.lut'),ParValue("purple2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/purple2.lut'),ParValue("purple3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/purple3.lut'),ParValue("purple4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/purple4.lut'),ParValue("puryb","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/puryb.lut'),ParValue("red1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/red1.lut'),ParValue("red2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/red2.lut'),ParValue("redbase1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/redbase1.lut'),ParValue("redbase2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/redbase2.lut'),ParValue("redbase3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/redbase3.lut'),ParValue("redbase4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/redbase4.lut'),ParValue("redbase5","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/redbase5.lut'),ParValue("redbase6","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/redbase6.lut'),ParValue("rgb4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/rgb4.lut'),ParValue("rgb6","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/rgb6.lut'),ParValue("spectrum","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/spectrum.lut'),ParValue("vt1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt1.lut'),ParValue("vt2","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt2.lut'),ParValue("vt3","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt3.lut'),ParValue("vt4","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt4.lut'),ParValue("vt5","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt5.lut'),ParValue("vt6","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt6.lut'),ParValue("vt7","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/vt7.lut'),ParValue("yellow1","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/yellow1.lut'),ParValue("yy","f","Color Lookup Table",'${ASCDS_CONTRIB}/data/yy.lut')],
-    }
 
+    parinfo['wtransform'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","input file",None),ParValue("srclist","f","Source list output stack",None),ParValue("correl","s","Correlation image output stack",None),ParValue("nbkg","s","Normalized background image output stack",None)]',
+        'opt': '[ParValue("bkg","s","Plain background image output stack",None),ParValue("thresh","s","threshold image stack",None),ParValue("outputinfix","f","Output filename infix",None),ParValue("exptime","r","Exposure time",0),ParValue("expfile","s","Exposure file",None),ParSet("expcor","s","Exposure correction",\'fast\',["none","fast","full"]),ParValue("expthresh","r","Exposure threshold",0.1),ParValue("bkgtime","r","Background exposure time",0),ParValue("bkginput","s","Input background file",None),ParValue("bkgerrinput","b","use input background error from bkginput[2]",False),ParValue("xscales","s","X wavelet scales",\'2.0\'),ParValue("yscales","s","Y wavelet scales",\'2.0\'),ParValue("clobber","b","overwrite existing outputs",False),ParValue("correlerr","b","Output correlation error image",True),ParValue("nbkgerr","b","Output normalized background error image",True),ParValue("bkgerr","b","Output plain background error image",False),ParValue("maxiter","i","maximum iteration count",2),ParValue("iterstop","r","iteration stop fraction",0.0001),ParValue("sigthresh","r","significance for source detection",1e-06),ParValue("bkgsigthresh","r","significance for data cleansing",0.001),ParValue("falsesrc","r","allowed number of false sources per image",-1.0),ParValue("sigcalfile","f","Significance calibration file",\'${ASCDS_CALIB}/wtsimresult.fits\'),ParValue("log","b","Make a log file?",False),ParRange("verbose","i","Verbosity of output (0..5)",0,0,5),ParValue("stall","b","stall for debugger",False)]',
+        }
 
-parinfo['xmatch_viz'] = {
-    'istool': True,
-    'req': [ParValue("infile","f","Input crossmatch table",None),ParValue("refsrcfile","f","Input reference source list",None),ParValue("outfile","f","Output region file name",None),ParValue("legend","f","Output legend illustration",None)],
-    'opt': [ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","Tool verbosity",1,0,5)],
-    }
 
+    parinfo['ximage_lut'] = {
+        'istool': False,
+        'req': '[]',
+        'opt': '[ParValue("bb","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/ximage_bb.lut\'),ParValue("blue1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/blue1.lut\'),ParValue("blue2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/blue2.lut\'),ParValue("blue3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/blue3.lut\'),ParValue("blue4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/blue4.lut\'),ParValue("bluebase1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase1.lut\'),ParValue("bluebase2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase2.lut\'),ParValue("bluebase3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase3.lut\'),ParValue("bluebase4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase4.lut\'),ParValue("bluebase5","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase5.lut\'),ParValue("bluebase6","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase6.lut\'),ParValue("bluebase7","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase7.lut\'),ParValue("bluebase8","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase8.lut\'),ParValue("bluebase9","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluebase9.lut\'),ParValue("bluyel","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/bluyel.lut\'),ParValue("brown","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/brown.lut\'),ParValue("eyellow1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/eyellow1.lut\'),ParValue("gray1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/gray1.lut\'),ParValue("gray2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/gray2.lut\'),ParValue("green1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green1.lut\'),ParValue("green2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green2.lut\'),ParValue("green3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green3.lut\'),ParValue("green4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green4.lut\'),ParValue("green5","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green5.lut\'),ParValue("green6","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green6.lut\'),ParValue("green7","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green7.lut\'),ParValue("green8","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green8.lut\'),ParValue("green9","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/green9.lut\'),ParValue("invgray","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/invgray.lut\'),ParValue("invgray1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/invgray1.lut\'),ParValue("invspec","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/invspec.lut\'),ParValue("pink1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pink1.lut\'),ParValue("pink2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pink2.lut\'),ParValue("pink3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pink3.lut\'),ParValue("pink4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pink4.lut\'),ParValue("pinkbase1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pinkbase1.lut\'),ParValue("pinkbase2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pinkbase2.lut\'),ParValue("pinkbase3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pinkbase3.lut\'),ParValue("pinkbase4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pinkbase4.lut\'),ParValue("pinkbase5","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/pinkbase5.lut\'),ParValue("purby","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/purby.lut\'),ParValue("purple1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/purple1.lut\'),ParValue("purple2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/purple2.lut\'),ParValue("purple3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/purple3.lut\'),ParValue("purple4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/purple4.lut\'),ParValue("puryb","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/puryb.lut\'),ParValue("red1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/red1.lut\'),ParValue("red2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/red2.lut\'),ParValue("redbase1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/redbase1.lut\'),ParValue("redbase2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/redbase2.lut\'),ParValue("redbase3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/redbase3.lut\'),ParValue("redbase4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/redbase4.lut\'),ParValue("redbase5","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/redbase5.lut\'),ParValue("redbase6","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/redbase6.lut\'),ParValue("rgb4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/rgb4.lut\'),ParValue("rgb6","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/rgb6.lut\'),ParValue("spectrum","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/spectrum.lut\'),ParValue("vt1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt1.lut\'),ParValue("vt2","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt2.lut\'),ParValue("vt3","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt3.lut\'),ParValue("vt4","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt4.lut\'),ParValue("vt5","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt5.lut\'),ParValue("vt6","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt6.lut\'),ParValue("vt7","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/vt7.lut\'),ParValue("yellow1","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/yellow1.lut\'),ParValue("yy","f","Color Lookup Table",\'${ASCDS_CONTRIB}/data/yy.lut\')]',
+        }
 
 
+    parinfo['xmatch_viz'] = {
+        'istool': True,
+        'req': '[ParValue("infile","f","Input crossmatch table",None),ParValue("refsrcfile","f","Input reference source list",None),ParValue("outfile","f","Output region file name",None),ParValue("legend","f","Output legend illustration",None)]',
+        'opt': '[ParValue("clobber","b","Overwrite existing output dataset with same name?",False),ParRange("verbose","i","Tool verbosity",1,0,5)]',
+        }
+
+
+
+# Set up the parameter information, which is needed below.
+#
+_load_parinfo()
+
 # Add the routines to the module symbol table
 #
 __all__ = ["get_pfiles", "set_pfiles",
+           "set_async_limit", "get_async_limit",
            "new_tmpdir", "new_pfiles_environment",
+           "ToolWorkerPool", "ToolMapResult", "worker_pool",
+           "ToolResultCache", "result_cache", "get_result_cache",
            "add_tool_history",
            "list_tools", "make_tool"]
 
-for toolname in list_tools():
-    setattr(sys.modules[__name__], toolname, make_tool(toolname))
-    __all__.append(toolname)
+# The tools themselves are created on first use by __getattr__.
+#
+__all__.extend(list_tools())
 
 # Now, some tools added that don't use par files and are thus not
 # handled by this tool.
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2018, 2020, 2023
+# Copyright (C) 2018, 2020, 2023, 2026
 # Smithsonian Astrophysical Observatory
 #
 # This program is free software; you can redistribute it and/or modify
@@ -148,3 +148,10 @@ class MaskedIMAGECrate(IMAGECrate):
         Is pixel at 0-based indices i, j valid?
         """
         return self._mask[j][i] == 1
+
+    def valid_mask(self):
+        """
+        Boolean array, indexed by [j, i], which is True for the
+        valid pixels.
+        """
+        return self._mask == 1
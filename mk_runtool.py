@@ -20,10 +20,19 @@ Usage:
   Output is to
 
       ciao_contrib/runtool.py
+      ciao_contrib/runtool.parinfo
 
-  Note that this file is *not* checked into the repository to
-  allow you to check for changes (this could be added once the
-  process has been worked through a few times).
+  where the second file is a binary index of the parameter
+  information which is read by the runtool module (if it is
+  missing or out of date then the module falls back to running
+  the auto-generated code, which is slower). Both files are
+  checked into the repository and installed.
+
+  The index can be re-created from ciao_contrib/runtool.py - e.g.
+  after editing the auto-generated code by hand - without CIAO
+  with
+
+      python mk_runtool.py --index
 
 Aim:
 
@@ -50,10 +59,16 @@ import subprocess
 import sys
 import glob
 
+from ciao_contrib._parinfo_index import hash_text, text_to_records, \
+    write_index
+
 
 MODULE_HEADER = "mk_runtool.header"
 MODULE_FOOTER = "mk_runtool.footer"
 
+MODULE_NAME = "ciao_contrib/runtool.py"
+INDEX_NAME = "ciao_contrib/runtool.parinfo"
+
 
 # Identifier information from
 # http://docs.python.org/reference/lexical_analysis.html#identifiers
@@ -309,8 +324,8 @@ def get_param_list(dirname, toolname):
     return (req_params, opt_params)
 
 
-def create_output(dirname, toolname, istool=True):
-    """Return Python code for the given tool.
+def get_param_text(dirname, toolname):
+    """Return the text version of the parameter lists for the tool.
 
     Parameters
     ----------
@@ -318,6 +333,33 @@ def create_output(dirname, toolname, istool=True):
         The name of the directory containing <toolname>.par.
     toolname : str
         The name of the tool/parameter file.
+
+    Returns
+    -------
+    req, opt : str, str
+        The required and optional parameters, in the form
+        '[ParValue(...),ParSet(...)]'.
+
+    """
+
+    (req_params, opt_params) = get_param_list(dirname, toolname)
+
+    rpars = [p.describe("") for p in req_params]
+    opars = [p.describe("") for p in opt_params]
+    return ("[{}]".format(",".join(rpars)),
+            "[{}]".format(",".join(opars)))
+
+
+def create_output(toolname, rtxt, otxt, istool=True):
+    """Return Python code for the given tool.
+
+    Parameters
+    ----------
+    toolname : str
+        The name of the tool/parameter file.
+    rtxt, otxt : str
+        The required and optional parameters, as returned by
+        get_param_text.
     istool : bool
         True if the par file belongs to a tool; False if there
         is no tool for the .par file (e.g. the 'lut' par file).
@@ -329,22 +371,83 @@ def create_output(dirname, toolname, istool=True):
 
     """
 
-    (req_params, opt_params) = get_param_list(dirname, toolname)
-
-    # create the parameter object
+    # create the parameter object; the parameter lists are stored
+    # as text and only converted when the tool is first used.
+    #
     out = f"parinfo['{toolname}'] = {{\n"
     out += f"\t'istool': {istool},\n"
-
-    rpars = [p.describe("") for p in req_params]
-    out += "\t'req': [{}],\n".format(",".join(rpars))
-
-    opars = [p.describe("") for p in opt_params]
-    out += "\t'opt': [{}],\n".format(",".join(opars))
+    out += f"\t'req': {rtxt!r},\n"
+    out += f"\t'opt': {otxt!r},\n"
     out += "\t}\n"
     out += "\n"
     return out.replace("\t", "    ")
 
 
+def write_parinfo_code(ofh, code):
+    """Write out the auto-generated code.
+
+    The code is placed in the _add_parinfo_from_source function, which
+    is only run by the runtool module when the parameter index is
+    missing or out of date, and the hash of the code is written to
+    _PARINFO_HASH. The hash is returned.
+    """
+
+    hashval = hash_text(code)
+    ofh.write(f"_PARINFO_HASH = '{hashval}'\n\n\n")
+    ofh.write("def _add_parinfo_from_source():\n")
+    ofh.write('    """Add the auto-generated parameter information to parinfo."""\n\n')
+    for line in code.splitlines(True):
+        if line.strip() == "":
+            ofh.write(line)
+        else:
+            ofh.write(f"    {line}")
+
+    return hashval
+
+
+def read_parinfo_code(filename):
+    """Return the hash and auto-generated code from the runtool module.
+
+    This reverses write_parinfo_code.
+    """
+
+    with open(filename, "r") as fh:
+        txt = fh.read()
+
+    match = re.search(r"^_PARINFO_HASH = '([0-9a-f]+)'\n\n\n" +
+                      r"def _add_parinfo_from_source\(\):\n" +
+                      r'    """.*"""\n\n', txt, re.MULTILINE)
+    if match is None:
+        raise ValueError(f"Unable to find the parameter information in {filename}")
+
+    code = []
+    for line in txt[match.end():].splitlines(True):
+        if line.strip() == "":
+            code.append(line)
+        elif line.startswith("    "):
+            code.append(line[4:])
+        else:
+            break
+
+    # The function ends with a blank line.
+    return match.group(1), "".join(code[:-1])
+
+
+def write_index_from_module(oname, iname):
+    """Create the parameter index from the runtool module."""
+
+    (hashval, code) = read_parinfo_code(oname)
+    if hash_text(code) != hashval:
+        raise ValueError(f"The parameter information in {oname} does not match _PARINFO_HASH")
+
+    tools = {}
+    exec(code, {"__builtins__": {}}, {"parinfo": tools})
+    index = [(toolname, pi["istool"], text_to_records(pi["req"]),
+              text_to_records(pi["opt"]))
+             for (toolname, pi) in tools.items()]
+    write_index(iname, hashval, index)
+
+
 def add_output(funcinfo, parname):
     """Store information on the tool for later use.
 
@@ -455,6 +558,8 @@ def doit():
 
     print(f"Input directores:\n  {ascds_install}\n  {ascds_contrib}\n")
 
+    iname = os.path.join(odir, "runtool.parinfo")
+
     with open(oname, "w") as ofh:
         print_module_section(ofh, MODULE_HEADER)
         tools = {}
@@ -467,6 +572,8 @@ def doit():
         #
         toolnames = list(tools.keys())
         toolnames.sort()
+        code = []
+        index = []
         for tname in toolnames:
 
             # special case CIAO 4.16 development snafu
@@ -474,19 +581,25 @@ def doit():
                 continue
 
             (dirname, toolname, istool) = tools[tname]
-            ofh.write(create_output(dirname, toolname, istool=istool))
-            ofh.write("\n")
-            ofh.flush()
+            (rtxt, otxt) = get_param_text(dirname, toolname)
+            code.append(create_output(toolname, rtxt, otxt, istool=istool))
+            code.append("\n")
+            index.append((toolname, istool,
+                          text_to_records(rtxt), text_to_records(otxt)))
 
+        hashval = write_parinfo_code(ofh, "".join(code))
         print_module_section(ofh, MODULE_FOOTER)
 
+    write_index(iname, hashval, index)
+
     print("")
     print("Created: {}".format(oname))
+    print("         {}".format(iname))
     print("")
 
     # Has it changed?
     #
-    gitargs = ['git', 'diff', oname]
+    gitargs = ['git', 'diff', oname, iname]
     try:
         rval = subprocess.check_output(gitargs)
     except subprocess.CalledProcessError as se:
@@ -509,8 +622,13 @@ def doit():
 
 if __name__ == "__main__":
 
+    if len(sys.argv) == 2 and sys.argv[1] == "--index":
+        write_index_from_module(MODULE_NAME, INDEX_NAME)
+        print(f"Created: {INDEX_NAME}")
+        sys.exit(0)
+
     if len(sys.argv) != 1:
-        sys.stderr.write(f"Usage: python {sys.argv[0]}\n")
+        sys.stderr.write(f"Usage: python {sys.argv[0]} [--index]\n")
         sys.exit(1)
 
     doit()
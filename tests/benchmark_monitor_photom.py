@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+
+"""
+Usage:
+
+  python tests/benchmark_monitor_photom.py [nimages] [size]
+
+Compare the time taken by the monitor_photom processing steps -
+cosmic-ray removal, stacking the dark-current data, calculating the
+median dark current, and subtracting it - against the original
+implementation, which looped over each pixel of each image. The
+results of the two versions are also compared.
+
+The images are simulated, with nimages readouts (default 2000) of
+a size by size (6 or 8, default 8) monitor window that is dithered
+across the CCD. The original version can be slow for large values
+(its run time scales as nimages times the number of pixels).
+
+The test requires a CIAO environment (as monitor_photom imports
+pycrates).
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import time
+import types
+
+import numpy as np
+
+
+def load_monitor_photom():
+    """Load the monitor_photom script as a module."""
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "..", "bin", "monitor_photom")
+    loader = importlib.machinery.SourceFileLoader("monitor_photom", path)
+    spec = importlib.util.spec_from_loader("monitor_photom", loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def original_cosmic_ray_removal(dat):
+    "The original cosmic_ray_removal routine (without the logging)"
+
+    n = len(dat.img_row0)
+    img_size = dat.img_raw[0].shape[0]
+    img_size_range = list(range(img_size))
+    plus_minus_two = list(range(-2, 3))
+
+    img_corr = dat.img_raw*5.0
+
+    for i in range(n):
+        for r in img_size_range:
+            for c in img_size_range:
+                samp = np.zeros(5, dtype=float)
+                n_samp = 0
+
+                for j in plus_minus_two:
+                    ij = i+j
+                    if ij >= 0 and ij < n:
+                        r0 = r+dat.img_row0[i] - dat.img_row0[ij]
+                        c0 = c+dat.img_col0[i] - dat.img_col0[ij]
+
+                        if r0 >= 0 and r0 < img_size and c0 >= 0 and c0 < img_size:
+                            samp[n_samp] = img_corr[ij, r0, c0]
+                            n_samp = n_samp+1
+
+                if n_samp >= 3:
+                    img_corr[i, r, c] = np.median(samp[0:n_samp])
+
+    return img_corr
+
+
+def original_stack_dark_current_data(dat, img_corr, rc0, edge_pixels):
+    "The original stack_dark_current_data routine (without the logging)"
+
+    n = len(dat.img_row0)
+    img_size = dat.img_raw[0].shape[0]
+    sz = 2*rc0 + img_size
+
+    r, c = edge_pixels(img_size)
+
+    dark = np.zeros([n, sz, sz], dtype=float)
+    i_dark = np.zeros([n, sz, sz], dtype=np.int32)
+    n_dark = np.zeros([sz, sz], dtype=np.int32)
+
+    for i in range(n):
+        rowoff = rc0 + dat.img_row0[i] - dat.img_row0[0]
+        coloff = rc0 + dat.img_col0[i] - dat.img_col0[0]
+
+        for j in range(len(r)):
+            c0 = c[j] + coloff
+            r0 = r[j] + rowoff
+
+            if c0 < sz and c0 >= 0 and r0 < sz and r0 >= 0:
+                nd = n_dark[r0, c0]
+                dark[nd, r0, c0] = img_corr[i, r[j], c[j]]
+                i_dark[nd, r0, c0] = i
+                n_dark[r0, c0] = nd + 1
+
+    return dark, i_dark, n_dark
+
+
+def original_median_dark(n_dark, dark, min_dark_measurements, sz):
+    "The median calculation from the original make_median_dark_current routine"
+
+    median_dark = np.zeros([sz, sz], dtype=float) - 9999.0
+    for c0 in range(sz):
+        for r0 in range(sz):
+            if n_dark[r0, c0] <= min_dark_measurements:
+                continue
+
+            median_dark[r0, c0] = np.median(dark[range(n_dark[r0, c0]), r0, c0])
+
+    return median_dark
+
+
+def original_subtract_dark(dat, img_corr, rc0, median_dark):
+    "The original subtract_dark routine"
+
+    n = len(dat.img_row0)
+    img_size = dat.img_raw[0].shape[0]
+    img_size_range = range(img_size)
+
+    img_sub = np.zeros_like(img_corr)
+
+    for i in range(n):
+        rowoff = rc0 + dat.img_row0[i] - dat.img_row0[0]
+        coloff = rc0 + dat.img_col0[i] - dat.img_col0[0]
+
+        for c in img_size_range:
+            for r in img_size_range:
+                c0 = c+coloff
+                r0 = r+rowoff
+                img_sub[i, r, c] = img_corr[i, r, c]-median_dark[r0, c0]
+
+    return img_sub
+
+
+def simulate(nimages, size, rc0, seed=2391):
+    """Create a dithered monitor window, with cosmic rays and warm pixels."""
+
+    rng = np.random.default_rng(seed)
+
+    dat = types.SimpleNamespace()
+    dat.time = 10000.0 + 2.05 * np.arange(nimages)
+    dat.integ_time = 1.7
+
+    # The window moves by up to rc0 pixels from its start position.
+    t = np.arange(nimages)
+    dat.img_row0 = (200 + np.round(rc0 * np.sin(t / 97.0))).astype(np.int16)
+    dat.img_col0 = (300 + np.round(rc0 * np.sin(t / 71.0))).astype(np.int16)
+
+    sz = 2 * rc0 + size
+    ccd = rng.uniform(10, 30, size=(sz, sz))
+    ccd[3, 4] = 5000.0
+    ccd[sz - 2, 1] = 8000.0
+
+    dat.img_raw = np.zeros((nimages, size, size))
+    for i in range(nimages):
+        r0 = rc0 + dat.img_row0[i] - dat.img_row0[0]
+        c0 = rc0 + dat.img_col0[i] - dat.img_col0[0]
+        dat.img_raw[i] = ccd[r0:r0 + size, c0:c0 + size]
+
+    dat.img_raw += rng.poisson(20, size=dat.img_raw.shape)
+    dat.img_raw[size // 2 - 1:size // 2 + 1, size // 2 - 1:size // 2 + 1] += 2000
+    hits = rng.integers(0, dat.img_raw.size, size=nimages // 10)
+    dat.img_raw.ravel()[hits] += 10000
+
+    dat.aca_comp_bkg_avg = rng.uniform(20, 25, size=nimages)
+    return dat
+
+
+def compare(label, dt_orig, dt_new, orig, new):
+    assert orig.shape == new.shape, label
+    diff = np.abs(orig - new) / np.maximum(np.abs(orig), 1)
+    print(f"  {label:22s} {dt_orig:9.3f}s {dt_new:9.3f}s {dt_orig / dt_new:8.1f}x  {diff.max():.2e}")
+
+
+def doit(nimages, size):
+
+    mp = load_monitor_photom()
+    rc0 = 8
+    min_dark_meas = 10
+    pars = {"min_dark_meas": min_dark_meas, "min_dark_limit": 100.0,
+            "dark_ratio": 0.005, "max_dither_motion": rc0}
+    dat = simulate(nimages, size, rc0)
+    sz = 2 * rc0 + size
+
+    print(f"nimages={nimages} size={size}")
+    print(f"  {'step':22s} {'original':>10s} {'new':>10s} {'speedup':>9s}  max rel. diff")
+
+    stime = time.perf_counter()
+    orig_corr = original_cosmic_ray_removal(dat)
+    dt_orig = time.perf_counter() - stime
+
+    stime = time.perf_counter()
+    img_corr = mp.cosmic_ray_removal(dat)
+    dt_new = time.perf_counter() - stime
+    compare("cosmic_ray_removal", dt_orig, dt_new, orig_corr, img_corr)
+
+    stime = time.perf_counter()
+    orig_stack = original_stack_dark_current_data(dat, img_corr, rc0,
+                                                  mp.get_edge_pixels)
+    dt_orig = time.perf_counter() - stime
+
+    stime = time.perf_counter()
+    stack = mp.stack_dark_current_data(dat, img_corr, rc0)
+    dt_new = time.perf_counter() - stime
+    for label, o, n in zip(["dark", "i_dark", "n_dark"], orig_stack, stack):
+        assert np.array_equal(o, n), label
+
+    compare("stack_dark_current", dt_orig, dt_new, orig_stack[0], stack[0])
+
+    dark, _, n_dark = stack
+    stime = time.perf_counter()
+    orig_median = original_median_dark(n_dark, dark, min_dark_meas, sz)
+    dt_orig = time.perf_counter() - stime
+
+    # The new version also replaces the non-warm pixels, so
+    # compare the warm pixels.
+    stime = time.perf_counter()
+    median_dark = mp.make_median_dark_current(dat, img_corr, n_dark, dark,
+                                              pars)
+    dt_new = time.perf_counter() - stime
+    warm = median_dark != np.median(dat.aca_comp_bkg_avg)
+    compare("median_dark_current", dt_orig, dt_new, orig_median[warm],
+            median_dark[warm])
+
+    stime = time.perf_counter()
+    orig_sub = original_subtract_dark(dat, img_corr, rc0, median_dark)
+    dt_orig = time.perf_counter() - stime
+
+    stime = time.perf_counter()
+    img_sub = mp.subtract_dark(dat, img_corr, rc0, median_dark)
+    dt_new = time.perf_counter() - stime
+    compare("subtract_dark", dt_orig, dt_new, orig_sub, img_sub)
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 3:
+        sys.stderr.write(f"Usage: python {sys.argv[0]} [nimages] [size]\n")
+        sys.exit(1)
+
+    nimages = 2000 if len(sys.argv) < 2 else int(sys.argv[1])
+    size = 8 if len(sys.argv) < 3 else int(sys.argv[2])
+    doit(nimages, size)
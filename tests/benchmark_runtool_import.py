@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+"""
+Usage:
+
+  python tests/benchmark_runtool_import.py [nrepeat]
+
+Report the time taken to import ciao_contrib.runtool, since this is
+on the start-up path of most of the scripts.
+
+The tools are created when first used, so the import time is compared
+to the time taken to import the module and then create every tool,
+which is what happened when the module was imported before the tools
+were created on demand. Each measurement is made in a new Python
+process, and the median of nrepeat runs (default 10) is reported.
+
+The test requires a CIAO environment.
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+IMPORT = "import ciao_contrib.runtool as rt"
+
+CHECKS = [("import only", ""),
+          ("import + one tool", "rt.dmstat"),
+          ("import + all tools",
+           "[getattr(rt, t) for t in rt.list_tools()]")]
+
+
+def time_code(code, nrepeat):
+    """Return the median time, in seconds, to run code in a new process."""
+
+    prog = ["import time",
+            "stime = time.perf_counter()",
+            IMPORT,
+            code,
+            "print(time.perf_counter() - stime)"]
+
+    times = []
+    for _ in range(nrepeat):
+        out = subprocess.check_output([sys.executable, "-c",
+                                       "\n".join(prog)])
+        times.append(float(out.decode().strip()))
+
+    return statistics.median(times)
+
+
+def doit(nrepeat):
+
+    print(f"Median of {nrepeat} runs:")
+    for label, code in CHECKS:
+        dt = time_code(code, nrepeat)
+        print(f"  {label:20s} {dt * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 2:
+        sys.stderr.write(f"Usage: python {sys.argv[0]} [nrepeat]\n")
+        sys.exit(1)
+
+    nrepeat = 10 if len(sys.argv) == 1 else int(sys.argv[1])
+    doit(nrepeat)
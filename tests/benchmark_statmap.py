@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+"""
+Usage:
+
+  python tests/benchmark_statmap.py [nevents] [nids]
+
+Compare the time taken by statmap to calculate the statistics, and
+create the output image, against the original implementation, which
+looped over each map value and searched the whole event list for it.
+The results of the two versions are also compared.
+
+The events are simulated, with nevents events (default 1000000)
+spread over a map with nids (default 10000) different values. The
+original version can be slow for large values (its run time scales
+as nevents times nids).
+
+The statistics are calculated for a floating-point column (energy)
+and an integer column (pha), whose values are often repeated within
+a map value, with weights that include zero.
+
+The test requires a CIAO environment (as statmap imports pycrates).
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+
+
+def load_statmap():
+    """Load the statmap script as a module."""
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "..", "bin", "statmap")
+    loader = importlib.machinery.SourceFileLoader("statmap", path)
+    spec = importlib.util.spec_from_loader("statmap", loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def original_compute_stats(map_vals, col_vals, wgt_vals, func):
+    "The original compute_stats routine"
+
+    stat_vals = {}
+    good_map_vals = map_vals[np.isfinite(map_vals)]
+    for pixel_val in np.unique(good_map_vals):
+        idx = np.where(map_vals == pixel_val)
+        vals = col_vals[idx[0]]
+        if len(vals) == 0:
+            stat_vals[pixel_val] = 0
+        elif wgt_vals is None:
+            stat_vals[pixel_val] = func(vals)
+        else:
+            wvals = wgt_vals[idx[0]]
+            stat_vals[pixel_val] = func(vals, wvals)
+
+    return stat_vals
+
+
+def original_paint(stat_vals, mapimg):
+    "The original replace_mapid_with_stats routine (without the file read)"
+
+    outvals = np.zeros_like(mapimg).astype(float)
+    for pixel_val in np.unique(mapimg):
+        idx = np.where(mapimg == pixel_val)
+        outvals[idx] = stat_vals[pixel_val] if pixel_val in stat_vals else np.nan
+
+    return outvals
+
+
+def simulate(nevents, nids, seed=8723):
+    """Create the map and event values.
+
+    The map is 512 by 512 with nids regions (which must be less than
+    the number of pixels), some of which contain no events.
+    """
+
+    rng = np.random.default_rng(seed)
+    mapimg = rng.integers(1, nids + 1, size=(512, 512)).astype(np.int32)
+    mapimg[:, :4] = 0
+
+    # The event values come from a subset of the regions, with a
+    # few events that fall off the map.
+    map_vals = rng.integers(0, int(0.9 * nids) + 1, size=nevents).astype(np.float64)
+    map_vals[:10] = np.nan
+
+    # energy is stored as a float32 column in event files
+    energy = rng.uniform(500, 8000, size=nevents).astype(np.float32)
+    wgt_vals = rng.integers(1, 5, size=nevents).astype(np.float64)
+
+    # pha is an integer column with a small range, so values repeat,
+    # and the weights include zero.
+    pha = rng.integers(1, 20, size=nevents).astype(np.int32)
+    pha_wgts = rng.integers(0, 4, size=nevents).astype(np.float64)
+
+    cols = {"energy": (energy, wgt_vals),
+            "pha": (pha, pha_wgts)}
+    return mapimg, map_vals, cols
+
+
+def doit(nevents, nids):
+
+    statmap = load_statmap()
+    mapimg, map_vals, cols = simulate(nevents, nids)
+
+    print(f"nevents={nevents} nids={nids}")
+    for colname, (col_vals, wgt_vals) in cols.items():
+        print(f"column={colname}")
+        compare(statmap, mapimg, map_vals, col_vals, wgt_vals)
+
+
+def compare(statmap, mapimg, map_vals, col_vals, wgt_vals):
+    "Compare the original and new versions for one column"
+
+    print(f"  {'statistic':10s} {'original':>10s} {'new':>10s} {'speedup':>8s}  max rel. diff")
+    for stat in ["count", "sum", "mean", "min", "max", "median",
+                 "wsum", "wmean", "wmin", "wmax", "wmedian"]:
+
+        wgts = wgt_vals if stat.startswith("w") else None
+
+        stime = time.perf_counter()
+        func = statmap.map_stat_function(stat)
+        orig = original_paint(original_compute_stats(map_vals, col_vals,
+                                                     wgts, func),
+                              mapimg)
+        dt_orig = time.perf_counter() - stime
+
+        stime = time.perf_counter()
+        map_ids, stat_vals = statmap.compute_stats(map_vals, col_vals,
+                                                   wgts, stat)
+        new = statmap.paint_stats(map_ids, stat_vals, mapimg)
+        dt_new = time.perf_counter() - stime
+
+        assert np.array_equal(np.isnan(orig), np.isnan(new)), stat
+        good = np.isfinite(orig)
+        diff = np.abs(orig[good] - new[good]) / np.maximum(np.abs(orig[good]), 1)
+        print(f"  {stat:10s} {dt_orig:9.3f}s {dt_new:9.3f}s {dt_orig / dt_new:7.1f}x  {diff.max():.2e}")
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 3:
+        sys.stderr.write(f"Usage: python {sys.argv[0]} [nevents] [nids]\n")
+        sys.exit(1)
+
+    nevents = 1000000 if len(sys.argv) < 2 else int(sys.argv[1])
+    nids = 10000 if len(sys.argv) < 3 else int(sys.argv[2])
+    doit(nevents, nids)
@@ -0,0 +1,134 @@
+"""Check the local archive index in ciao_contrib.cda"""
+
+import io
+
+import numpy as np
+
+import pytest
+
+from ciao_contrib.cda import archive_index, search
+
+
+VOTABLE = """<?xml version="1.0" encoding="UTF-8"?>
+<VOTABLE xmlns="http://www.ivoa.net/xml/VOTable/v1.1" version="1.1">
+<RESOURCE type="results">
+<INFO name="QUERY_STATUS" value="OK"/>
+<TABLE name="SIAP_KEYWORDS" nrows="{nrows}">
+<FIELD name="ObsId" datatype="int"/>
+<FIELD name="Instrument" datatype="char" arraysize="*"/>
+<FIELD name="Grating" datatype="char" arraysize="*"/>
+<FIELD name="RA" datatype="double"/>
+<FIELD name="Dec" datatype="double"/>
+<FIELD name="Exposure" datatype="double"/>
+<DATA><TABLEDATA>
+{rows}
+</TABLEDATA></DATA>
+</TABLE>
+</RESOURCE>
+</VOTABLE>
+"""
+
+ROWS = [(1, 'ACIS-I', 'NONE', 10.0, 20.0, 10.0),
+        (1, 'ACIS-I', 'NONE', 10.0, 20.0, 10.0),
+        (2, 'ACIS-S', 'HETG', 359.9, 0.1, 20.0),
+        (3, 'HRC-S', 'LETG', 0.2, -0.1, 30.0),
+        (4, 'HRC-I', 'NONE', 45.0, 89.8, 40.0),
+        (5, 'ACIS-S', 'NONE', 225.0, 89.9, 50.0),
+        (6, 'ACIS-I', 'NONE', 11.0, 20.0, 60.0)]
+
+
+def make_table(rows):
+    trs = ["<TR>" + "".join(f"<TD>{v}</TD>" for v in row) + "</TR>"
+           for row in rows]
+    txt = VOTABLE.format(nrows=len(rows), rows="\n".join(trs))
+    return search.read_chandra_siap_table(io.StringIO(txt))
+
+
+@pytest.fixture
+def index(tmp_path):
+    outfile = str(tmp_path / 'chandra.npz')
+    nrows = archive_index.build_index([make_table(ROWS[:4]),
+                                       make_table(ROWS[3:])], outfile)
+    assert nrows == 6
+    return outfile
+
+
+def test_search_single(index):
+
+    ans = search.search_chandra_archive(10.2, 20.1, size=0, index=index)
+    assert ans['ObsId'].tolist() == [1]
+    assert ans.dtype.names == ('ObsId', 'Instrument', 'Grating', 'RA',
+                               'Dec', 'Exposure')
+
+    ans = search.search_chandra_archive(10.5, 20.0, size=0.1, index=index)
+    assert ans['ObsId'].tolist() == [1, 6]
+
+
+def test_search_ra_wrap(index):
+
+    ans = search.search_chandra_archive(0.0, 0.0, size=0.1, index=index)
+    assert ans['ObsId'].tolist() == [2, 3]
+
+    ans = search.search_chandra_archive(0.0, 0.0, size=0.1,
+                                        instrument=['hrc'], index=index)
+    assert ans['ObsId'].tolist() == [3]
+
+    ans = search.search_chandra_archive(0.0, 0.0, size=0.1,
+                                        grating=['hetg'], index=index)
+    assert ans['ObsId'].tolist() == [2]
+
+
+def test_search_pole(index):
+
+    ans = search.search_chandra_archive(180.0, 89.95, size=0, index=index)
+    assert ans['ObsId'].tolist() == [4, 5]
+
+
+def test_search_no_match(index):
+
+    assert search.search_chandra_archive(100, -40, index=index) is None
+
+
+def test_find_obsid(index):
+
+    idx = search.get_archive_index(index)
+    assert idx.find_obsid(3) == pytest.approx((0.2, -0.1))
+    assert idx.find_obsid(7) is None
+
+
+def test_search_matches_brute_force(tmp_path):
+    """The zone search matches a check of every row."""
+
+    rng = np.random.default_rng(2793)
+    nrows = 2000
+    ra = rng.uniform(0, 360, nrows)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, nrows)))
+    insts = rng.choice(list(archive_index.FOOTPRINT_RADIUS), nrows)
+    rows = [(i + 1, inst, 'NONE', r, d, 1.0)
+            for i, (inst, r, d) in enumerate(zip(insts, ra, dec))]
+
+    outfile = str(tmp_path / 'chandra.npz')
+    archive_index.build_index([make_table(rows)], outfile, zone_height=2)
+    idx = archive_index.ArchiveIndex(outfile)
+    radius = np.asarray([archive_index.FOOTPRINT_RADIUS[i] for i in insts])
+
+    for _ in range(50):
+        pra = rng.uniform(0, 360)
+        pdec = rng.uniform(-90, 90)
+        size = rng.uniform(0, 5)
+        sep = archive_index._separation(pra, pdec, ra, dec)
+        expected = np.where(sep <= size + radius)[0] + 1
+
+        ans = idx.search(pra, pdec, size)
+        got = [] if ans is None else ans['ObsId'].tolist()
+        assert got == expected.tolist()
+
+
+def test_build_index_missing_column(tmp_path):
+
+    tbl = make_table(ROWS)
+    tbl = tbl[['ObsId', 'RA', 'Dec']]
+    with pytest.raises(ValueError) as ve:
+        archive_index.build_index([tbl], str(tmp_path / 'x.npz'))
+
+    assert str(ve.value) == "The tables must contain the Instrument column"
@@ -0,0 +1,117 @@
+"""Check the download manifest in ciao_contrib.cda.data"""
+
+import os
+
+import pytest
+
+from ciao_contrib.cda import data
+from ciao_contrib.downloadutils import DownloadInfo, file_checksum
+
+
+URL = 'https://cxc.cfa.harvard.edu/cdaftp/byobsid/3/1843'
+
+
+@pytest.fixture
+def obsdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir('1843')
+    with open('1843/oif.fits', 'wb') as fh:
+        fh.write(b'x' * 100)
+
+    return tmp_path
+
+
+def test_manifest_roundtrip(obsdir):
+
+    info = DownloadInfo(100, '"abc"', 'Mon, 01 Jan 2024 00:00:00 GMT')
+    manifest = data.Manifest(1843)
+    manifest.set_urls(URL, [f'{URL}/oif.fits'])
+    manifest.add('1843/oif.fits', f'{URL}/oif.fits', info,
+                 checksum=file_checksum('1843/oif.fits'))
+
+    manifest = data.Manifest('1843')
+    assert manifest.get_urls(URL) == [f'{URL}/oif.fits']
+    assert manifest.get_urls('https://example.com/byobsid/3/1843') is None
+    assert manifest.is_verified('1843/oif.fits')
+    assert manifest.is_current('1843/oif.fits', info)
+    assert manifest.is_current('1843/other.fits', info)
+
+    changed = DownloadInfo(100, '"def"', info.last_modified)
+    assert not manifest.is_current('1843/oif.fits', changed)
+
+    # Changing the file means it is no longer verified.
+    with open('1843/oif.fits', 'ab') as fh:
+        fh.write(b'y')
+
+    assert not manifest.is_verified('1843/oif.fits')
+
+
+def test_manifest_partial_file(obsdir):
+    """A file without a checksum is not verified."""
+
+    manifest = data.Manifest(1843)
+    manifest.add('1843/oif.fits', f'{URL}/oif.fits',
+                 DownloadInfo(200, None, None))
+    assert not manifest.is_verified('1843/oif.fits')
+
+    manifest.remove('1843/oif.fits')
+    assert data.Manifest(1843).get('1843/oif.fits') is None
+
+
+def test_manifest_invalid(obsdir):
+
+    with open(os.path.join('1843', data.MANIFEST_NAME), 'w') as fh:
+        fh.write('{"version": 1, "files": {')
+
+    manifest = data.Manifest(1843)
+    assert manifest.files == {}
+    assert manifest.get_urls(URL) is None
+
+
+def test_check_files_corrupt(obsdir):
+    """Files which do not match the checksum are removed."""
+
+    class FakeObsId:
+        pass
+
+    oid = FakeObsId()
+    oid.manifest = data.Manifest(1843)
+    oid.files = [data.ObsIdFile(1843, f'{URL}/oif.fits')]
+    oid.manifest.add('1843/oif.fits', f'{URL}/oif.fits',
+                     DownloadInfo(100, None, None),
+                     checksum=file_checksum('1843/oif.fits'))
+
+    data.check_files([oid], verify=True)
+    assert os.path.exists('1843/oif.fits')
+    assert oid.files[0].checked
+    assert not oid.files[0].from_manifest
+
+    with open('1843/oif.fits', 'wb') as fh:
+        fh.write(b'z' * 100)
+
+    oid.files[0].checked = False
+    data.check_files([oid])
+    assert not os.path.exists('1843/oif.fits')
+    assert not oid.files[0].checked
+    assert oid.manifest.get('1843/oif.fits') is None
+
+
+def test_obsid_relist(obsdir, monkeypatch):
+    """The archive is only queried for the files when relist is set."""
+
+    base_url = URL.rsplit('/', 2)[0]
+    manifest = data.Manifest(1843)
+    manifest.set_urls(URL, [f'{URL}/oif.fits'])
+    manifest.add('1843/oif.fits', f'{URL}/oif.fits',
+                 DownloadInfo(100, None, None),
+                 checksum=file_checksum('1843/oif.fits'))
+
+    listing = [f'{URL}/oif.fits', f'{URL}/new.fits']
+    monkeypatch.setattr(data.downloadutils, 'find_all_downloadable_files',
+                        lambda urlname, hdr: listing)
+
+    oid = data.ObsId(1843, base_url, {})
+    assert [f.url for f in oid.files] == [f'{URL}/oif.fits']
+
+    oid = data.ObsId(1843, base_url, {}, relist=True)
+    assert [f.url for f in oid.files] == listing
@@ -0,0 +1,229 @@
+"""Check ciao_contrib.cda.csccli"""
+
+import os
+
+import pytest
+
+from ciao_contrib.cda import csccli
+
+
+COLUMNS = ["m.name", "m.ra", "m.dec", "o.obsid", "o.obi"]
+
+# The sources returned by the fake service: name, ra, dec (the
+# positions are in sexagesimal format, as returned by the service).
+#
+SOURCES = [("CXO J000000.0+200000", "00 40 00.00", "+20 00 00.0"),
+           ("CXO J000001.0+200100", "00 40 02.40", "+20 00 36.0"),
+           ("CXO J131300.0-300000", "13 20 00.00", "-30 00 00.0")]
+
+
+def fake_search(ra, dec, radius, columns, cat_ver, pool=None):
+    """Return the sources within radius arcmin of ra, dec."""
+
+    from coords.format import sex2deg
+
+    cols = ["sep"] + columns
+    lines = ["#Column\tsepn\t(E9.6)\t(.sepn)\t[\"\"]\t[]",
+             "#Column\tname\t(A20)\t(.name)\t[\"\"]\t[]",
+             "#Column\tra\t(A12)\t(.ra)\t[\"\"]\t[]",
+             "#Column\tdec\t(A12)\t(.dec)\t[\"\"]\t[]",
+             "#Column\tobsid\t(I5)\t(.obsid)\t[\"\"]\t[]",
+             "#Column\tobi\t(I3)\t(.obi)\t[\"\"]\t[]",
+             "sepn\tname\tra\tdec\tobsid\tobi"]
+    for (name, sra, sdec) in SOURCES:
+        sra_deg, sdec_deg = sex2deg(sra, sdec)
+        sep = csccli.__separation_arcsec(ra, dec, sra_deg, sdec_deg)
+        if sep <= radius * 60:
+            lines.append(f"{sep:.6e}\t{name}\t{sra}\t{sdec}\t1843\t0")
+
+    lines.append("")
+    return "\n".join(lines), cols
+
+
+def test_group_positions():
+    """Close positions are combined, distant ones are not."""
+
+    pos = [(10.0, 20.0), (10.01, 20.01), (200.0, -30.0)]
+    groups = csccli.group_positions(pos, 1.0, 10.0)
+    assert len(groups) == 2
+
+    groups = sorted(groups, key=lambda g: g[3])
+    assert groups[0][3] == [0, 1]
+    assert groups[0][0] == pytest.approx(10.005, abs=1e-4)
+    assert groups[0][1] == pytest.approx(20.005, abs=1e-4)
+
+    # The cone must cover each position's search circle.
+    assert groups[0][2] > 1.0
+    for idx in groups[0][3]:
+        sep = csccli.__separation_arcsec(groups[0][0], groups[0][1],
+                                         *pos[idx]) / 60
+        assert sep + 1.0 <= groups[0][2]
+
+    assert groups[1] == (200.0, -30.0, 1.0, [2])
+
+
+def test_group_positions_no_merge():
+
+    pos = [(10.0, 20.0), (10.0, 20.0)]
+    groups = csccli.group_positions(pos, 1.0, 0)
+    assert [g[3] for g in groups] == [[0], [1]]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_search_src_by_positions(workers, monkeypatch):
+    """The combined results are split up per position."""
+
+    monkeypatch.setattr(csccli, "search_src_by_ra_dec", fake_search)
+
+    # The first two positions are searched in the same query, and
+    # the third position has no matches.
+    positions = [("10.0", "20.0"), ("00:40:02.4", "+20:00:36"),
+                 ("100.0", "0.0"), ("200.0", "-30.0")]
+    page, cols = csccli.search_src_by_positions(positions, 1.0, COLUMNS,
+                                                "csc2.1", workers=workers)
+
+    assert cols == ["sep"] + COLUMNS + ["pos_id", "ra_in", "dec_in"]
+
+    rows = csccli.parse_csc_result((page, cols))
+    got = [(r["pos_id"], r["name"]) for r in rows]
+    assert got == [("1", SOURCES[0][0]), ("1", SOURCES[1][0]),
+                   ("2", SOURCES[0][0]), ("2", SOURCES[1][0]),
+                   ("4", SOURCES[2][0])]
+
+    # The separations are from each position, not the query center.
+    seps = [float(r["sepn"]) for r in rows]
+    assert seps[0] == pytest.approx(0, abs=1e-6)
+    assert seps[1] == pytest.approx(seps[2], rel=1e-6)
+    assert seps[3] == pytest.approx(0, abs=1e-6)
+    assert seps[4] == pytest.approx(0, abs=1e-6)
+
+    assert float(rows[2]["ra_in"]) == pytest.approx(10.01)
+    assert float(rows[2]["dec_in"]) == pytest.approx(20.01)
+
+    # Check the column definitions
+    lines = page.split("\n")
+    assert lines[6] == "#Column\tpos_id\t(I8)\t(.pos_id)\t[\"\"]\t[]"
+    assert lines[7] == "#Column\tra_in\t(E9.6)\t(.ra_in)\t[\"\"]\t[]"
+
+
+def test_search_src_by_positions_no_positions():
+
+    with pytest.raises(ValueError) as ve:
+        csccli.search_src_by_positions([], 1.0, COLUMNS, "csc2.1")
+
+    assert str(ve.value) == "No positions to search"
+
+
+class ChunkedResponse:
+    """Return the data in small chunks, as a HTTP response would."""
+
+    def __init__(self, data):
+        self.data = data
+        self.nread = []
+
+    def read(self, n):
+        out = self.data[:n]
+        self.data = self.data[n:]
+        self.nread.append(len(out))
+        return out
+
+
+@pytest.mark.parametrize("gunzip,suffix", [(False, ".gz"), (True, "")])
+def test_stream_to_file(gunzip, suffix, tmp_path):
+
+    import gzip
+
+    data = b"SIMPLE  =                    T" * 1000
+    rsp = ChunkedResponse(gzip.compress(data))
+    off = str(tmp_path / "src.fits")
+    outfile = csccli.stream_to_file(rsp, off, gunzip=gunzip, chunksize=100)
+    assert outfile == off + suffix
+    assert max(rsp.nread) == 100
+
+    with open(outfile, "rb") as fh:
+        got = fh.read()
+
+    if gunzip:
+        assert got == data
+    else:
+        assert gzip.decompress(got) == data
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["src.fits" + suffix]
+
+
+def test_stream_to_file_truncated(tmp_path):
+
+    import gzip
+
+    data = gzip.compress(b"x" * 10000)
+    off = str(tmp_path / "src.fits")
+    with pytest.raises(IOError):
+        csccli.stream_to_file(ChunkedResponse(data[:-20]), off, gunzip=True)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_retrieve_products_links_duplicates(tmp_path, monkeypatch):
+    """A file needed by several sources is retrieved once."""
+
+    calls = []
+
+    def fake_retrieve(ff, filetype, root, catalog, pool=None, gunzip=False):
+        calls.append((ff, root))
+        outfile = os.path.join(root, ff + ".gz")
+        with open(outfile, "wb") as fh:
+            fh.write(b"data")
+        return outfile
+
+    monkeypatch.setattr(csccli, "retrieve_file", fake_retrieve)
+    monkeypatch.setattr(csccli, "__all_retieved_files__", {})
+
+    roots = []
+    for name in ["a", "b", "c"]:
+        root = tmp_path / name
+        root.mkdir()
+        roots.append(str(root))
+
+    products = [("f1.fits", "pha", roots[0]),
+                ("f2.fits", "pha", roots[0]),
+                ("f1.fits", "pha", roots[1]),
+                ("f1.fits", "pha", roots[2])]
+    csccli.retrieve_products(products, "csc2.1", workers=2)
+
+    assert sorted(calls) == [("f1.fits", roots[0]), ("f2.fits", roots[0])]
+
+    orig = os.stat(os.path.join(roots[0], "f1.fits.gz"))
+    assert orig.st_nlink == 3
+    for root in roots[1:]:
+        assert os.path.samefile(os.path.join(root, "f1.fits.gz"),
+                                os.path.join(roots[0], "f1.fits.gz"))
+
+
+def test_retrieve_products_links_to_existing(tmp_path, monkeypatch):
+    """A file which already exists is linked to, not retrieved."""
+
+    calls = []
+
+    def fake_retrieve(ff, filetype, root, catalog, pool=None, gunzip=False):
+        calls.append((ff, root))
+        raise AssertionError("file should not be retrieved")
+
+    monkeypatch.setattr(csccli, "retrieve_file", fake_retrieve)
+    monkeypatch.setattr(csccli, "__all_retieved_files__", {})
+
+    roots = []
+    for name in ["a", "b"]:
+        root = tmp_path / name
+        root.mkdir()
+        roots.append(str(root))
+
+    existing = os.path.join(roots[0], "f1.fits.gz")
+    with open(existing, "wb") as fh:
+        fh.write(b"data")
+
+    products = [("f1.fits", "pha", roots[0]),
+                ("f1.fits", "pha", roots[1])]
+    csccli.retrieve_products(products, "csc2.1", workers=2)
+
+    assert calls == []
+    assert os.path.samefile(os.path.join(roots[1], "f1.fits.gz"), existing)
@@ -0,0 +1,198 @@
+"""Check the download code in ciao_contrib.downloadutils.
+
+These tests use a local web server, so do not need network access.
+"""
+
+import hashlib
+import http.server
+import io
+import threading
+
+import pytest
+
+from ciao_contrib import downloadutils
+
+
+FILES = {'/a.dat': bytes(range(256)) * 40,
+         '/b.dat': b'12345' * 3000}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Serve FILES, supporting ranged requests and keep-alive."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.nconnections += 1
+
+    def send_data(self, body):
+        try:
+            data = FILES[self.path]
+        except KeyError:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        rng = self.headers.get('Range')
+        if rng is None:
+            self.send_response(200)
+        else:
+            (lo, hi) = rng[6:].split('-')
+            data = data[int(lo):int(hi) + 1]
+            self.send_response(206)
+
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if body:
+            self.wfile.write(data)
+
+    def do_HEAD(self):
+        self.send_data(False)
+
+    def do_GET(self):
+        self.send_data(True)
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.nconnections = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url(server, path):
+    return f'http://127.0.0.1:{server.server_address[1]}{path}'
+
+
+def test_get_download_size(server):
+
+    pool = downloadutils.ConnectionPool()
+    assert downloadutils.get_download_size(url(server, '/a.dat'),
+                                           pool=pool) == 10240
+    assert downloadutils.get_download_size(url(server, '/b.dat'),
+                                           pool=pool) == 15000
+    assert downloadutils.get_download_size(url(server, '/c.dat'),
+                                           pool=pool) == 0
+    pool.close()
+
+    assert server.nconnections == 1
+
+
+def test_download_reuses_connection(server, tmp_path):
+
+    pool = downloadutils.ConnectionPool()
+    for path in ['/a.dat', '/b.dat']:
+        outfile = tmp_path / path[1:]
+        size = len(FILES[path])
+        (nbytes, _) = downloadutils.download_progress(url(server, path),
+                                                      size, str(outfile),
+                                                      chunksize=1000,
+                                                      verbose=False,
+                                                      pool=pool)
+        assert nbytes == size
+        assert outfile.read_bytes() == FILES[path]
+
+    pool.close()
+    assert server.nconnections == 1
+
+
+def test_download_resumes(server, tmp_path):
+
+    outfile = tmp_path / 'a.dat'
+    outfile.write_bytes(FILES['/a.dat'][:3000])
+
+    progress = downloadutils.MultiProgress(1, 10240)
+    progress.hdl = io.StringIO()
+    fprogress = progress.file(10240)
+    (nbytes, _) = downloadutils.download_progress(url(server, '/a.dat'),
+                                                  10240, str(outfile),
+                                                  progress=fprogress,
+                                                  verbose=False)
+    assert nbytes == 10240
+    assert outfile.read_bytes() == FILES['/a.dat']
+
+    # The already-downloaded part is included in the total but not
+    # the rate.
+    assert progress.added == 10240
+    assert progress.downloaded == 7240
+
+    fprogress.finish('a.dat done')
+    progress.end()
+    assert progress.ndone == 1
+    assert progress.hdl.getvalue() == 'a.dat done\n'
+
+
+def test_multiprogress_skipped_file():
+    """A file that is not downloaded still counts towards the total."""
+
+    progress = downloadutils.MultiProgress(2, 300)
+    progress.hdl = io.StringIO()
+    progress.file(100).finish()
+    fprogress = progress.file(200)
+    fprogress.start(50)
+    fprogress.add(100)
+    assert progress.added == 250
+    fprogress.finish()
+    assert progress.added == 300
+    assert progress.ndone == 2
+    assert progress.hdl.getvalue() == ''
+
+
+def test_download_parallel(server, tmp_path):
+    """Several threads can share a pool."""
+
+    pool = downloadutils.ConnectionPool()
+    paths = ['/a.dat', '/b.dat'] * 3
+
+    def download(i):
+        path = paths[i]
+        downloadutils.download_progress(url(server, path),
+                                        len(FILES[path]),
+                                        str(tmp_path / f'{i}.dat'),
+                                        verbose=False, pool=pool)
+
+    threads = [threading.Thread(target=download, args=(i, ))
+               for i in range(6)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    pool.close()
+    for i, path in enumerate(paths):
+        assert (tmp_path / f'{i}.dat').read_bytes() == FILES[path]
+
+    assert server.nconnections <= 6
+
+
+def test_download_invalid_scheme(tmp_path):
+
+    with pytest.raises(ValueError) as ve:
+        downloadutils.download_progress('ftp://example.com/a.dat', 10,
+                                        str(tmp_path / 'a.dat'))
+
+    assert str(ve.value) == 'Unsupported URL scheme: ftp://example.com/a.dat'
+
+
+def test_get_download_info(server):
+
+    info = downloadutils.get_download_info(url(server, '/b.dat'))
+    assert info == downloadutils.DownloadInfo(15000, None, None)
+
+
+def test_file_checksum(tmp_path):
+
+    infile = tmp_path / 'a.dat'
+    infile.write_bytes(FILES['/a.dat'])
+    expected = hashlib.sha256(FILES['/a.dat']).hexdigest()
+    assert downloadutils.file_checksum(str(infile), blocksize=1000) == expected
@@ -0,0 +1,47 @@
+"""Check ciao_contrib.parallel_wrapper"""
+
+import numpy as np
+
+import pytest
+
+from ciao_contrib import parallel_wrapper as pw
+
+
+def make_row(i):
+    """A sparse row, like those computed by mkrprm."""
+    cols = np.arange(i, i + 10)
+    return cols, np.full(10, i / 10)
+
+
+def test_parallel_pool_many_results():
+    """The results are larger than the pipe buffer."""
+
+    args = list(range(500))
+    rows = pw.parallel_pool(make_row, args, ncores=4)
+    assert len(rows) == 500
+    for i, (cols, vals) in enumerate(rows):
+        assert cols == pytest.approx(np.arange(i, i + 10))
+        assert vals == pytest.approx(np.full(10, i / 10))
+
+
+def test_parallel_pool_large_result():
+
+    def func(n):
+        return np.ones(n)
+
+    out = pw.parallel_pool(func, [10, 100000, 10000], ncores=2)
+    assert [len(o) for o in out] == [10, 100000, 10000]
+
+
+def test_parallel_pool_failed_task():
+    """A failed task returns None and does not hang"""
+
+    def func(i):
+        if i == 3:
+            raise ValueError("task failed")
+
+        return i * 2
+
+    out = pw.parallel_pool(func, list(range(6)), ncores=2)
+    assert out[3] is None
+    assert [out[i] for i in [0, 1, 2]] == [0, 2, 4]
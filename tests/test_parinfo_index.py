@@ -0,0 +1,98 @@
+"""Tests of the binary parameter index used by runtool"""
+
+import os
+import re
+
+import pytest
+
+from ciao_contrib import _parinfo_index as pi
+
+
+REQ = """[ParValue("infile","f","Input file, with 'quotes'",None)]"""
+OPT = '[ParSet("kernel","s","Output format",\'default\',["default","fits"]),' + \
+    'ParRange("verbose","i","Debug Level",0,0,5),' + \
+    'ParValue("nsigma","r","Number of sigma",3.5)]'
+
+HASH = pi.hash_text(REQ + OPT)
+
+
+def write(tmp_path, hashval=HASH):
+    filename = tmp_path / 'test.parinfo'
+    tools = [('dmfoo', True, pi.text_to_records(REQ),
+              pi.text_to_records(OPT)),
+             ('foolut', False, (), ())]
+    pi.write_index(str(filename), hashval, tools)
+    return str(filename)
+
+
+def test_text_to_records():
+
+    req = pi.text_to_records(REQ)
+    assert req == (('ParValue', 'infile', 'f', "Input file, with 'quotes'", None), )
+
+    opt = pi.text_to_records(OPT)
+    assert len(opt) == 3
+    assert opt[0] == ('ParSet', 'kernel', 's', 'Output format', 'default',
+                      ['default', 'fits'])
+    assert opt[1] == ('ParRange', 'verbose', 'i', 'Debug Level', 0, 0, 5)
+    assert opt[2] == ('ParValue', 'nsigma', 'r', 'Number of sigma', 3.5)
+
+
+def test_round_trip(tmp_path):
+
+    index = pi.read_index(write(tmp_path), HASH)
+    assert index is not None
+    assert len(index) == 2
+    assert list(index) == ['dmfoo', 'foolut']
+    assert 'dmfoo' in index
+    assert 'dmbar' not in index
+
+    assert index.istool('dmfoo')
+    assert not index.istool('foolut')
+
+    (req, opt) = index.records('dmfoo')
+    assert req == pi.text_to_records(REQ)
+    assert opt == pi.text_to_records(OPT)
+
+    assert index.records('foolut') == ((), ())
+
+
+def test_missing_index(tmp_path):
+    assert pi.read_index(str(tmp_path / 'not-a-file'), HASH) is None
+
+
+@pytest.mark.parametrize("contents", [b"", b"CIAOPAR\0", b"not an index file" * 10])
+def test_invalid_index(contents, tmp_path):
+    filename = tmp_path / 'bad.parinfo'
+    filename.write_bytes(contents)
+    assert pi.read_index(str(filename), HASH) is None
+
+
+def test_stale_index(tmp_path):
+    """The index is not used if the hash does not match"""
+
+    filename = write(tmp_path)
+    assert pi.read_index(filename, pi.hash_text(REQ)) is None
+
+
+def test_format_version(tmp_path, monkeypatch):
+    """The index is not used if the format has changed"""
+
+    filename = write(tmp_path)
+    monkeypatch.setattr(pi, 'FORMAT_VERSION', pi.FORMAT_VERSION + 1)
+    assert pi.read_index(filename, HASH) is None
+
+
+def test_installed_index_matches_module():
+    """The index installed with runtool matches the module"""
+
+    dname = os.path.dirname(pi.__file__)
+    with open(os.path.join(dname, 'runtool.py'), 'r') as fh:
+        match = re.search(r"^_PARINFO_HASH = '([0-9a-f]+)'$", fh.read(),
+                          re.MULTILINE)
+
+    index = pi.read_index(os.path.join(dname, 'runtool.parinfo'),
+                          match.group(1))
+    assert index is not None
+    assert 'dmstat' in index
+    assert index.istool('dmstat')
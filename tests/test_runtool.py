@@ -1,5 +1,6 @@
 """Basic tests of the runtool interface"""
 
+import asyncio
 import os
 from pathlib import Path
 
@@ -46,6 +47,23 @@ def test_expected_tools():
     assert len(STANDARD_TOOLS) == 184
 
 
+@pytest.mark.parametrize("expected", ALL_TOOLS)
+def test_tools_are_exported(expected):
+    """The tools are created on first use but are still listed"""
+
+    assert expected in rt.__all__
+    assert expected in dir(rt)
+
+    tool = getattr(rt, expected)
+    assert getattr(rt, expected) is tool
+    assert vars(rt)[expected] is tool
+
+
+def test_unknown_tool_is_an_attribute_error():
+    with pytest.raises(AttributeError):
+        rt.not_a_ciao_tool
+
+
 @pytest.mark.parametrize("expected", STANDARD_TOOLS)
 def test_expected_standard(expected):
     tool1 = getattr(rt, expected)
@@ -751,3 +769,282 @@ def test_verbosity_set_str(verbose5, caplog):
     check(2, f'Validating dmimg2jpg.infile val={infile} as ...')
     check(3, '... something else')
     check(4, f"Setting dmimg2jpg.infile to {infile} (<class 'str'>)")
+
+
+def test_worker_pool_matches_direct_call(tmp_path):
+    """A failing tool reports the same error via the worker pool"""
+
+    infile = str(tmp_path / 'does-not-exist.fits')
+
+    tool = rt.make_tool('dmstat')
+    with pytest.raises(IOError) as ioe1:
+        tool(infile)
+
+    direct = tool.get_runtime_details()
+
+    with rt.worker_pool(nproc=2) as pool:
+        with pytest.raises(IOError) as ioe2:
+            tool(infile)
+
+        pooled = tool.get_runtime_details()
+        stats = pool.stats()
+
+    assert str(ioe2.value) == str(ioe1.value)
+    assert pooled['code'] == direct['code']
+    assert pooled['args'] == direct['args']
+    assert tool.infile == infile
+
+    assert len(stats) == 1
+    wstats = list(stats.values())[0]
+    assert wstats['calls'] == 1
+    assert wstats['tools'] == {'dmstat': 1}
+    assert not Path(wstats['pfiles']).exists()
+
+
+def test_worker_pool_can_not_be_nested():
+
+    with rt.worker_pool(nproc=1):
+        with pytest.raises(ValueError) as ve:
+            with rt.worker_pool(nproc=1):
+                pass
+
+    assert str(ve.value) == "A worker pool is already in use"
+
+
+def test_parinfo_index_matches_source(monkeypatch):
+    """The auto-generated code and the parameter index agree"""
+
+    orig = rt.parinfo
+    new = rt.ParInfo()
+    monkeypatch.setattr(rt, 'parinfo', new)
+    rt._add_parinfo_from_source()
+
+    assert sorted(new) == sorted(orig)
+    for toolname in orig:
+        assert new.istool(toolname) == orig.istool(toolname)
+        assert new[toolname] == orig[toolname]
+
+
+@pytest.mark.parametrize("fail_fast", [True, False])
+def test_map_errors(fail_fast, tmp_path):
+    """Errors are either raised or returned"""
+
+    infiles = [str(tmp_path / f'does-not-exist-{i}.fits') for i in range(3)]
+    params = [{'infile': infile} for infile in infiles]
+
+    tool = rt.make_tool('dmstat')
+    tool.median = True
+
+    if fail_fast:
+        with pytest.raises(IOError):
+            tool.map(params, nproc=2, fail_fast=True)
+
+        return
+
+    res = tool.map(params, nproc=2, fail_fast=False)
+    assert len(res) == 3
+    for infile, r in zip(infiles, res):
+        assert isinstance(r, rt.ToolMapResult)
+        assert r.output is None
+        assert isinstance(r.error, IOError)
+        assert r.params['infile'] == infile
+        assert r.params['median']
+        assert r.details['code'] != 0
+
+    # The tool settings have not been changed
+    assert tool.infile is None
+    assert tool.median
+
+
+def test_map_validates_before_running():
+
+    with pytest.raises(rt.UnknownParamError):
+        rt.make_tool('dmstat').map([{'infile': 'a.fits'}, {'not_a_param': 1}])
+
+
+def test_run_async_matches_direct_call(tmp_path):
+    """A failing tool reports the same error via run_async"""
+
+    infile = str(tmp_path / 'does-not-exist.fits')
+
+    tool = rt.make_tool('dmstat')
+    with pytest.raises(IOError) as ioe1:
+        tool(infile)
+
+    direct = tool.get_runtime_details()
+
+    lines = []
+    with pytest.raises(IOError) as ioe2:
+        asyncio.run(tool.run_async(infile, output=lines.append))
+
+    details = tool.get_runtime_details()
+
+    assert str(ioe2.value) == str(ioe1.value)
+    assert details['code'] == direct['code']
+    assert details['args'] == direct['args']
+    assert details['output'] == direct['output']
+    assert '\n'.join(lines) == direct['output'].rstrip('\n')
+    assert tool.infile == infile
+
+
+@pytest.mark.parametrize("nproc", [0, -1])
+def test_set_async_limit_invalid(nproc):
+
+    with pytest.raises(ValueError):
+        rt.set_async_limit(nproc)
+
+
+def test_set_async_limit():
+
+    try:
+        rt.set_async_limit(2)
+        assert rt.get_async_limit() == 2
+    finally:
+        rt.set_async_limit()
+
+    assert rt.get_async_limit() > 0
+
+
+def test_result_cache_key_uses_input_files(tmp_path):
+    """The cache key changes when the parameters or inputs change"""
+
+    infile = tmp_path / 'in.txt'
+    infile.write_text('1 2 3\n')
+
+    cache = rt.ToolResultCache(tmp_path / 'cache')
+    tool = rt.make_tool('dmstat')
+    tool.infile = str(infile)
+    key1 = cache._get_key(tool)
+    assert cache._get_key(tool) == key1
+
+    tool.median = not tool.median
+    key2 = cache._get_key(tool)
+    assert key2 != key1
+
+    infile.write_text('1 2 3 4\n')
+    assert cache._get_key(tool) != key2
+
+
+def test_result_cache_key_uses_ardlib(tmp_path):
+    """The ardlib settings are only part of the key for tools using it"""
+
+    bpix = tmp_path / 'bpix.fits'
+    bpix.write_text('x')
+
+    cache = rt.ToolResultCache(tmp_path / 'cache')
+    mkinstmap = rt.make_tool('mkinstmap')
+    dmstat = rt.make_tool('dmstat')
+
+    with rt.new_pfiles_environment(ardlib=True, tmpdir=str(tmp_path)):
+        key1 = cache._get_key(mkinstmap)
+        skey = cache._get_key(dmstat)
+
+        rt.ardlib.AXAF_ACIS0_BADPIX_FILE = f"{bpix}[ccd_id=0]"
+        try:
+            rt.ardlib.write_params()
+        finally:
+            rt.ardlib.punlearn()
+
+        key2 = cache._get_key(mkinstmap)
+        assert key2 != key1
+        assert cache._get_key(dmstat) == skey
+
+        # the bad-pixel file has changed
+        bpix.write_text('xy')
+        assert cache._get_key(mkinstmap) != key2
+
+
+def test_result_cache_failed_run_is_not_stored(tmp_path):
+
+    infile = str(tmp_path / 'does-not-exist.fits')
+    tool = rt.make_tool('dmstat')
+
+    with rt.result_cache(tmp_path / 'cache') as cache:
+        for _ in range(2):
+            with pytest.raises(IOError):
+                tool(infile)
+
+        stats = cache.stats()
+
+    assert stats['hits'] == 0
+    assert stats['misses'] == 2
+    assert stats['stores'] == 0
+    assert stats['entries'] == 0
+
+
+def test_result_cache_ignores_unlisted_tools(tmp_path):
+    """Tools which change their inputs are not cached"""
+
+    infile = str(tmp_path / 'does-not-exist.fits')
+    with rt.result_cache(tmp_path / 'cache') as cache:
+        for _ in range(2):
+            with pytest.raises(IOError):
+                rt.dmhedit(infile, filelist='none', operation='add',
+                           key='TESTKEY', value=2)
+
+        # the output file is also the input
+        with pytest.raises(IOError):
+            rt.dmcopy(infile, infile, clobber=True)
+
+        stats = cache.stats()
+
+    assert stats['hits'] == 0
+    assert stats['misses'] == 0
+    assert stats['uncacheable'] == 3
+    assert stats['entries'] == 0
+
+
+@pytest.mark.parametrize("checksum", [False, True])
+def test_result_cache_chained_tools(checksum, tmp_path):
+    """A tool whose input was restored from the cache is also restored"""
+
+    infile = tmp_path / 'in.txt'
+    infile.write_text('# x\n1\n2\n3\n')
+    afile = str(tmp_path / 'a.fits')
+    bfile = str(tmp_path / 'b.fits')
+
+    def run():
+        with rt.result_cache(tmp_path / 'cache', checksum=checksum) as cache:
+            rt.dmcopy(str(infile), afile, clobber=True)
+            rt.dmcopy(afile + '[x>1]', bfile, clobber=True)
+            return cache.stats()
+
+    stats = run()
+    assert stats['misses'] == 2
+    assert stats['stores'] == 2
+
+    stats = run()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 0
+
+
+def test_result_cache_run_command(tmp_path):
+    """Tools run with command-line arguments can be cached"""
+
+    infile = tmp_path / 'in.txt'
+    infile.write_text('# x\n1\n2\n3\n')
+    outfile = tmp_path / 'out.fits'
+    args = [f"infile={infile}", f"outfile={outfile}", "clobber=yes",
+            "mode=h"]
+
+    cache = rt.ToolResultCache(tmp_path / 'cache')
+    assert cache.can_run_command('dmcopy', args)
+    assert not cache.can_run_command('dmcopy', [str(infile), str(outfile)])
+    assert not cache.can_run_command('dmstat', [f"infile={infile}"])
+    assert not cache.can_run_command('dmhedit', [f"infile={infile}"])
+
+    for _ in range(2):
+        outfile.unlink(missing_ok=True)
+        cache.run_command('dmcopy', args)
+        assert outfile.exists()
+
+    stats = cache.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+    assert stats['stores'] == 1
+
+
+def test_result_cache_invalid_maxsize(tmp_path):
+
+    with pytest.raises(ValueError):
+        rt.ToolResultCache(tmp_path, maxsize=-1)